@@ -0,0 +1,121 @@
+'''Throughput of BatchParser over the golden outputs of the unit tests
+
+Collects (os, command, output) records from the golden outputs of the
+tests/ directories: the parser a test class instantiates gives, through
+parsers.json, a command without arguments. The records are repeated, then
+parsed:
+
+    * in the calling process (processes=0)
+    * over pools of 1 to -processes workers, started and warmed up before
+      the timing
+
+and the records parsed per second are reported.
+
+    python benchmarks/bench_batch_parse.py [-os iosxe nxos iosxr]
+        [-copies 5] [-processes 4] [-chunksize 16]
+'''
+
+import os
+import re
+import time
+import argparse
+import importlib
+
+import genie.libs.parser
+from genie.libs.parser.utils.common import get_parser_details
+from genie.libs.parser.utils.batch import BatchParser
+
+# class test_show_version(unittest.TestCase):
+TEST_CLASS = re.compile(r'^class +(\w+)\(', re.M)
+# obj = ShowVersion(device=self.device)
+PARSER = re.compile(r'\b(\w+)\(device *=')
+
+
+def commands(os_name):
+    '''(module_name, class) -> command without arguments'''
+    found = {}
+    for command, entry in get_parser_details().items():
+        if '{' in command or not isinstance(entry, dict) or \
+           os_name not in entry:
+            continue
+        data = entry[os_name]
+        if 'module_name' not in data:
+            # only under platform tokens
+            continue
+        found.setdefault((data['module_name'], data['class']), command)
+    return found
+
+
+def collect_records(os_name):
+    records = []
+    by_class = commands(os_name)
+    tests = os.path.join(genie.libs.parser.__path__[0], os_name, 'tests')
+    for filename in sorted(os.listdir(tests)):
+        if not (filename.startswith('test_show_') and
+                filename.endswith('.py')):
+            continue
+        module_name = filename[len('test_'):-len('.py')]
+        with open(os.path.join(tests, filename)) as f:
+            source = f.read()
+        try:
+            module = importlib.import_module('genie.libs.parser.{}.tests.{}'
+                                             .format(os_name, filename[:-3]))
+        except Exception:
+            continue
+        blocks = TEST_CLASS.split(source)[1:]
+        for test_name, body in zip(blocks[::2], blocks[1::2]):
+            command = None
+            for parser_name in PARSER.findall(body):
+                command = by_class.get((module_name, parser_name))
+                if command:
+                    break
+            test_class = getattr(module, test_name, None)
+            if command is None or test_class is None:
+                continue
+            for name, value in sorted(vars(test_class).items()):
+                if name.startswith('golden_output') and \
+                   isinstance(value, dict) and \
+                   isinstance(value.get('execute.return_value'), str):
+                    records.append((os_name, command,
+                                    value['execute.return_value']))
+    return records
+
+
+def run(records, processes, chunksize):
+    warm = sorted({(os_name, command) for os_name, command, _ in records})
+    with BatchParser(processes=processes, chunksize=chunksize,
+                     warm=warm) as batch:
+        start = time.perf_counter()
+        errors = sum(1 for result in batch.parse(records) if result.error)
+        return time.perf_counter() - start, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-os', nargs='+', default=['iosxe', 'nxos', 'iosxr'])
+    parser.add_argument('-copies', type=int, default=5)
+    parser.add_argument('-processes', type=int, default=os.cpu_count())
+    parser.add_argument('-chunksize', type=int, default=16)
+    args = parser.parse_args()
+
+    records = []
+    for os_name in args.os:
+        records.extend(collect_records(os_name))
+    size = sum(len(output) for _, _, output in records)
+    records = records * args.copies
+
+    print('records             : {} ({} golden outputs, {:.1f} MB)'.format(
+        len(records), len(records) // args.copies, size / 1e6))
+    counts = [0] + sorted({1, 2, args.processes} |
+                          set(range(4, args.processes + 1, 4)))
+    serial = None
+    for processes in counts:
+        elapsed, errors = run(records, processes, args.chunksize)
+        serial = serial or elapsed
+        print('processes={:<10}: {:8.0f} records/s, {:.1f}x, {} errors'
+              .format(processes, len(records) / elapsed, serial / elapsed,
+                      errors))
+
+
+if __name__ == '__main__':
+    main()
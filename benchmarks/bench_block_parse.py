@@ -0,0 +1,131 @@
+'''Benchmark of BlockParser on large outputs
+
+Parses a synthetic iosxe 'show interfaces' of -interfaces subinterfaces and
+a synthetic iosxr 'show isis database detail' of -lsps LSPs:
+
+    * cli: the line by line parse of the whole output, validated against
+      the compiled schema as parse_blocks() validates its output
+    * serial: parse_blocks(executor='serial'), the overhead of cutting and
+      merging the blocks
+    * thread: parse_blocks(executor='thread'), the regexes hold the GIL,
+      little is expected from threads
+    * process: parse_blocks(executor=pool), on a ProcessPoolExecutor of
+      -workers processes started before the timing
+
+The parsed outputs of the executors are checked against cli(). The speedup
+of the process pool is bounded by the number of cores of the machine.
+
+    python benchmarks/bench_block_parse.py [-interfaces 4000] [-lsps 4000]
+        [-workers 4]
+'''
+
+import os
+import time
+import argparse
+import concurrent.futures
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxr.show_isis import ShowIsisDatabaseDetail
+from genie.libs.parser.utils.schema_compiler import compile_schema
+
+INTERFACE = '''\
+GigabitEthernet0/0/0.{n} is up, line protocol is up
+  Hardware is BUILT-IN-2T+6X1GE, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
+  Description: subinterface {n}
+  Internet address is 10.{a}.{b}.1/24
+  MTU 1500 bytes, BW 1000000 Kbit/sec, DLY 10 usec,
+     reliability 255/255, txload 1/255, rxload 1/255
+  Encapsulation 802.1Q Virtual LAN, Vlan ID  {n}.
+  ARP type: ARPA, ARP Timeout 04:00:00
+  Keepalive not supported
+  Last input 00:00:01, output 00:00:02, output hang never
+  Last clearing of "show interface" counters never
+  Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
+  Queueing strategy: fifo
+  Output queue: 0/40 (size/max)
+  5 minute input rate {n}000 bits/sec, {n} packets/sec
+  5 minute output rate {n}000 bits/sec, {n} packets/sec
+     {n}2345 packets input, {n}234567 bytes, 0 no buffer
+     Received 0 broadcasts (0 IP multicasts)
+     0 runts, 0 giants, 0 throttles
+     0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+     0 watchdog, 0 multicast, 0 pause input
+     {n}5432 packets output, {n}765432 bytes, 0 underruns
+     0 output errors, 0 collisions, 0 interface resets
+     0 unknown protocol drops
+     0 babbles, 0 late collision, 0 deferred
+     0 lost carrier, 0 no carrier, 0 pause output
+     0 output buffer failures, 0 output buffers swapped out
+'''
+
+LSP = '''\
+router-{n}.00-00        0x{n:08x}   0x{n:04x}        457             0/0/0
+  Area Address: 49.0001
+  NLPID:        0xcc
+  Hostname:     router-{n}
+  IP Address:   10.{a}.{b}.1
+  Metric: 10         IP-Extended 10.{a}.{b}.0/24
+  Metric: 10         IS-Extended router-{m}.00
+'''
+
+
+def interfaces_output(count):
+    return ''.join(INTERFACE.format(n=n, a=n // 256, b=n % 256)
+                   for n in range(1, count + 1))
+
+
+def isis_output(count):
+    return 'IS-IS 1 (Level-2) Link State Database\n' \
+           'LSPID                 LSP Seq Num  LSP Checksum  ' \
+           'LSP Holdtime  ATT/P/OL\n' + \
+           ''.join(LSP.format(n=n, m=n + 1, a=n // 256, b=n % 256)
+                   for n in range(1, count + 1))
+
+
+def timed(function, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-interfaces', type=int, default=4000)
+    parser.add_argument('-lsps', type=int, default=4000)
+    parser.add_argument('-workers', type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    print('{} cores, {} workers'.format(os.cpu_count(), args.workers))
+    with concurrent.futures.ProcessPoolExecutor(args.workers) as pool:
+        # Start the workers
+        list(pool.map(abs, range(args.workers)))
+        for title, parser_class, output in [
+                ('iosxe ShowInterfaces, {} interfaces'.format(
+                    args.interfaces), ShowInterfaces,
+                 interfaces_output(args.interfaces)),
+                ('iosxr ShowIsisDatabaseDetail, {} LSPs'.format(args.lsps),
+                 ShowIsisDatabaseDetail, isis_output(args.lsps))]:
+            block_parser = parser_class(device=Mock())
+            print(title)
+            print('    blocks   : {}'.format(
+                len(block_parser.split_blocks(output))))
+            compiled = compile_schema(parser_class.schema)
+            cli_time, expected = timed(lambda: compiled.validate(
+                block_parser.cli(output=output)))
+            print('    cli      : {:.3f} s'.format(cli_time))
+            for executor in ['serial', 'thread', pool]:
+                elapsed, parsed = timed(lambda: block_parser.parse_blocks(
+                    output=output, executor=executor, workers=args.workers))
+                assert parsed == expected, executor
+                print('    {:<9}: {:.3f} s ({:.2f}x)'.format(
+                    executor if isinstance(executor, str) else 'process',
+                    elapsed, cli_time / elapsed))
+
+
+if __name__ == '__main__':
+    main()
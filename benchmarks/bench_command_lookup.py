@@ -0,0 +1,112 @@
+'''Benchmark of the command -> parser resolution
+
+Compares the linear regex scan over parsers.json, which was used by
+genie.libs.parser.utils.common._find_command, with the CommandTrie lookup.
+Every templated command of parsers.json is filled with sample arguments and
+resolved for every os it is defined for; both lookups must agree.
+
+    python benchmarks/bench_command_lookup.py [-repeat N]
+'''
+
+import re
+import time
+import argparse
+
+from genie.libs.parser.utils.common import parser_data
+from genie.libs.parser.utils.command_trie import CommandTrie, \
+                                                command_regex, \
+                                                literal_words
+
+# Sample values for the placeholders, everything else is 'arg'
+SAMPLES = {'vrf': 'VRF1',
+           'rd': '100:1',
+           'instance': 'default',
+           'address_family': 'ipv4 unicast',
+           'interface': 'GigabitEthernet0/0/1',
+           'neighbor': '10.1.1.1',
+           'route': '10.4.1.0/24',
+           'prefix': '10.4.1.0/24'}
+
+
+def legacy_find_command(command, data, os, regexes):
+    '''Linear regex scan, as done before the trie was introduced'''
+    max_length = 0
+    matches = None
+    for key in data:
+        if '{' not in key:
+            continue
+        match = regexes[key].match(command)
+        if match and os in data[key]:
+            if literal_words(key) > max_length:
+                max_length = literal_words(key)
+                matches = (key, match.groupdict())
+    return matches
+
+
+def trie_find_command(command, data, os, trie):
+    for key, kwargs in trie.search(command):
+        if os in data[key]:
+            return (key, kwargs)
+
+
+def build_commands(data):
+    commands = []
+    for key, values in data.items():
+        if '{' not in key:
+            continue
+        command = re.sub('{(.*?)}',
+                         lambda m: SAMPLES.get(m.group(1), 'arg'), key)
+        for os in values:
+            commands.append((command, os))
+    return commands
+
+
+def timed(func, commands, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [func(command, os) for command, os in commands]
+    return (time.perf_counter() - start) / repeat, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    data = {k: v for k, v in parser_data.items() if k != 'tokens'}
+    commands = build_commands(data)
+
+    # The legacy scan rebuilt the regexes on every call; precompile them
+    # here so only the scan itself is measured
+    regexes = {key: command_regex(key) for key in data if '{' in key}
+
+    start = time.perf_counter()
+    trie = CommandTrie(data)
+    build = time.perf_counter() - start
+
+    legacy, legacy_results = timed(
+        lambda c, o: legacy_find_command(c, data, o, regexes),
+        commands, args.repeat)
+    fast, trie_results = timed(
+        lambda c, o: trie_find_command(c, data, o, trie),
+        commands, args.repeat)
+
+    mismatches = [(c, l, t) for c, l, t in
+                  zip(commands, legacy_results, trie_results) if l != t]
+
+    print('templated commands  : {}'.format(len(trie)))
+    print('lookups             : {}'.format(len(commands)))
+    print('trie build          : {:.2f} ms'.format(build * 1000))
+    print('regex scan          : {:.2f} us/lookup'.format(
+        legacy / len(commands) * 1e6))
+    print('trie                : {:.2f} us/lookup'.format(
+        fast / len(commands) * 1e6))
+    print('speedup             : {:.1f}x'.format(legacy / fast))
+    print('mismatches          : {}'.format(len(mismatches)))
+    for command, legacy_result, trie_result in mismatches:
+        print('  {} -> regex: {} trie: {}'.format(
+            command, legacy_result, trie_result))
+
+
+if __name__ == '__main__':
+    main()
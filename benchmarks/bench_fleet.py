@@ -0,0 +1,87 @@
+'''Benchmark of FleetCollector against executing the parsers one by one
+
+Builds -devices ReplayDevice, iosxe and nxos, replaying the golden outputs
+of show inventory and show mac address-table with -latency seconds a round
+trip, and measures:
+
+    * serial: device.parse() of each command, one after the other, as a
+      script looping over the testbed does
+    * fleet: FleetCollector with -concurrency commands at a time, the
+      outputs fetched by device.execute in threads
+    * async: FleetCollector with the async_execute of the devices, waiting
+      without threads
+
+The serial time is the sum of the round trips, the fleet ones about
+devices * commands / concurrency round trips.
+
+    python benchmarks/bench_fleet.py [-devices 200] [-latency 0.05]
+'''
+
+import time
+import argparse
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.fleet import FleetCollector, ReplayDevice
+from genie.libs.parser.iosxe.tests import test_show_platform as iosxe_platform
+from genie.libs.parser.nxos.tests import test_show_fdb as nxos_fdb
+
+COMMANDS = {
+    'iosxe': ('show inventory',
+              iosxe_platform.test_show_inventory.golden_output),
+    'nxos': ('show mac address-table',
+             nxos_fdb.test_show_mac_address_table.golden_output),
+}
+
+
+def fleet(count, latency):
+    devices = []
+    for n in range(count):
+        os = 'nxos' if n % 2 else 'iosxe'
+        command, output = COMMANDS[os]
+        devices.append(ReplayDevice('{}-{}'.format(os, n), os,
+                                    {command: output}, latency=latency))
+    return devices
+
+
+def serial(devices):
+    results = []
+    for device in devices:
+        command = COMMANDS[device.os][0]
+        parser_cls, kwargs = common.get_parser(command, device)
+        results.append(parser_cls(device=device).parse(**kwargs))
+    return results
+
+
+async def async_execute(device, command):
+    return await device.async_execute(command)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-devices', type=int, default=200)
+    parser.add_argument('-latency', type=float, default=0.05)
+    parser.add_argument('-concurrency', type=int, default=50)
+    args = parser.parse_args()
+
+    commands = [command for command, _ in COMMANDS.values()]
+    print('{} devices, {} s a round trip'.format(args.devices, args.latency))
+
+    start = time.perf_counter()
+    expected = serial(fleet(args.devices, args.latency))
+    serial_time = time.perf_counter() - start
+    print('    serial: {:6.2f} s'.format(serial_time))
+
+    for name, execute in (('fleet', None), ('async', async_execute)):
+        collector = FleetCollector(concurrency=args.concurrency,
+                                   execute=execute)
+        start = time.perf_counter()
+        results = collector.run(fleet(args.devices, args.latency), commands)
+        elapsed = time.perf_counter() - start
+        parsed = [result.parsed for result in results if not result.error]
+        assert parsed == expected, 'fleet and serial outputs differ'
+        print('    {:6}: {:6.2f} s, {:5.1f}x speedup'.format(
+            name, elapsed, serial_time / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+'''Benchmark of parse() after the download against feed()/close() during it
+
+Simulates a terminal printing a synthetic iosxe 'show ip bgp' full table in
+chunks, at a given rate, and parses it with ShowIpBgp:
+
+    * execute: the chunks are all received, joined and given to parse(),
+      as device.execute() does
+    * feed: every chunk is given to feed() as it arrives, close() returns
+      the parsed output once the last chunk arrived
+
+and reports the time from the first chunk to the parsed output.
+
+    python benchmarks/bench_incremental_parse.py [-prefixes 20000]
+        [-rate 2000000] [-chunk 4096]
+'''
+
+import io
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgp
+from bench_stream_parse import write_table
+
+
+def terminal(output, rate, chunk):
+    '''Yield the output in chunks, at rate bytes per second'''
+    delay = chunk / rate
+    for i in range(0, len(output), chunk):
+        time.sleep(delay)
+        yield output[i:i + chunk]
+
+
+def execute(chunks):
+    output = ''.join(chunks)
+    return ShowIpBgp(device=Mock()).parse(output=output)
+
+
+def feed(chunks):
+    parser = ShowIpBgp(device=Mock())
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-prefixes', type=int, default=20000)
+    parser.add_argument('-rate', type=int, default=2000000,
+                        help='bytes per second printed by the terminal')
+    parser.add_argument('-chunk', type=int, default=4096)
+    args = parser.parse_args()
+
+    f = io.StringIO()
+    write_table(f, args.prefixes)
+    output = f.getvalue()
+
+    start = time.perf_counter()
+    for chunk in terminal(output, args.rate, args.chunk):
+        pass
+    download = time.perf_counter() - start
+
+    results = []
+    for name, function in (('execute', execute), ('feed', feed)):
+        start = time.perf_counter()
+        results.append(function(terminal(output, args.rate, args.chunk)))
+        print('{:<20}: {:.2f} s'.format(name, time.perf_counter() - start))
+    assert results[0] == results[1]
+    print('{:<20}: {:.2f} s'.format('download only', download))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+'''Memory benchmark of interning the strings of full table parsed outputs
+
+Builds full tables in the format of the golden outputs of iosxe
+ShowIpRoute, ShowBgpAllDetail, ShowMacAddressTable and ShowInterfaces,
+-entries routes, paths, MAC addresses and interfaces (a tenth of them for
+interfaces), and parses each without interning, the default:
+
+    * plain: one str object per captured value
+    * per parse: the parsed output interned in a new InternTable, as with
+      intern_table = True, with the time taken
+    * shared: two parsed outputs of the table interned in the same table,
+      as PROCESS_TABLE
+
+The sizes are the sys.getsizeof() of the str objects reachable from the
+parsed outputs, keys included, each counted once. The interned parsed
+outputs are checked equal to the plain ones.
+
+    python benchmarks/bench_interning.py [-entries 100000]
+'''
+
+import sys
+import copy
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.interning import InternTable
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+from bench_records import route_lines, megabytes
+from bench_block_parse import interfaces_output
+
+BGP_ENTRY = '''\
+BGP routing table entry for 10.{a}.{b}.0/24, version {n}
+Paths: (2 available, best #1, table default)
+Advertised to update-groups:
+   3
+Refresh Epoch 1
+65001 650{c:02d}
+  10.1.1.{c} from 10.1.1.{c} (10.1.1.{c})
+    Origin IGP, metric 0, localpref 100, valid, external, best
+    Community: 65001:100 65001:200
+    rx pathid: 0, tx pathid: 0x0
+Refresh Epoch 1
+65002 650{c:02d}
+  10.1.2.{c} from 10.1.2.{c} (10.1.2.{c})
+    Origin IGP, metric 0, localpref 100, valid, external
+    Community: 65002:100
+    rx pathid: 0, tx pathid: 0
+'''
+
+MAC_HEADER = '''\
+          Mac Address Table
+-------------------------------------------
+
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+'''
+
+# 100    3820.5672.fc03    DYNAMIC     Po12
+MAC = ' {:>4}    3820.{:04x}.{:04x}    DYNAMIC     Gi1/0/{}\n'
+
+
+def bgp_output(entries):
+    return 'For address family: IPv4 Unicast\n\n' + ''.join(
+        BGP_ENTRY.format(n=n, a=n >> 8 & 255, b=n & 255, c=n % 50 + 1)
+        for n in range(entries // 2))
+
+
+def mac_output(entries):
+    return MAC_HEADER + ''.join(
+        MAC.format(n % 100 + 1, n >> 16, n & 0xffff, n % 48 + 1)
+        for n in range(entries))
+
+
+def string_size(*parsed):
+    '''bytes of the str objects reachable from parsed, keys included'''
+    seen = set()
+    size = 0
+    stack = list(parsed)
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            stack.extend(value)
+        elif isinstance(value, str) and id(value) not in seen:
+            seen.add(id(value))
+            size += sys.getsizeof(value)
+    return size
+
+
+def parse(parser_class, output):
+    parser = parser_class(device=Mock())
+    start = time.perf_counter()
+    parsed = parser.cli(output=output)
+    return parsed, time.perf_counter() - start
+
+
+def interned(parsed, table):
+    start = time.perf_counter()
+    table.intern(parsed)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-entries', type=int, default=100000)
+    args = parser.parse_args()
+
+    tables = [('ShowIpRoute', ShowIpRoute,
+               '\n'.join(route_lines(args.entries, 2))),
+              ('ShowBgpAllDetail', ShowBgpAllDetail,
+               bgp_output(args.entries)),
+              ('ShowMacAddressTable', ShowMacAddressTable,
+               mac_output(args.entries)),
+              ('ShowInterfaces', ShowInterfaces,
+               interfaces_output(args.entries // 10))]
+
+    for title, parser_class, output in tables:
+        parsed, parse_time = parse(parser_class, output)
+        plain_size = string_size(parsed)
+        print('{}, {} lines, parsed in {:.2f} s'.format(
+            title, output.count('\n') + 1, parse_time))
+        print('    plain     : {:6.1f} MB of str'.format(
+            megabytes(plain_size)))
+
+        expected = copy.deepcopy(parsed)
+        intern_time = interned(parsed, InternTable())
+        assert parsed == expected
+        size = string_size(parsed)
+        print('    per parse : {:6.1f} MB of str, {:.1f}x smaller, interned '
+              'in {:.2f} s'.format(megabytes(size), plain_size / size,
+                                   intern_time))
+
+        table = InternTable()
+        second, _ = parse(parser_class, output)
+        interned(parsed, table)
+        interned(second, table)
+        size = string_size(parsed, second)
+        print('    shared    : {:6.1f} MB of str for 2 outputs, {:.1f}x '
+              'smaller, {}'.format(megabytes(size), 2 * plain_size / size,
+                                   table.stats))
+        del parsed, second, expected
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+'''Micro-benchmark of Common.convert_intf_name
+
+Converts a column of -rows interface names, as a parser of a big table
+(MAC addresses, ARP, routes) does once per line, drawn from -distinct
+names:
+
+    * legacy: convert_intf_name as it was, building its dict and running
+      two re.search per call
+    * memoized: Common.convert_intf_name, one call per row
+    * batch: Common.convert_intf_names on the whole column
+
+A column of names all distinct is converted too, the worst case of the
+memo. The results are checked against legacy.
+
+    python benchmarks/bench_intf_name.py [-rows 100000] [-distinct 500]
+'''
+
+import time
+import random
+import argparse
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import Common
+
+from genie.libs.parser.utils.tests.test_convert_intf_name import \
+    legacy_convert_intf_name
+
+TYPES = ['Gi', 'Te', 'Po', 'Eth', 'Fa', 'Hu', 'Vl', 'Lo', 'Tu', 'BE',
+         'GigabitEthernet', 'TenGigabitEthernet']
+
+
+def names(count, rnd):
+    return ['{}{}/0/{}'.format(rnd.choice(TYPES), n % 8, n)
+            for n in range(count)]
+
+
+def timed(function, column):
+    common._convert_intf_name.cache_clear()
+    start = time.perf_counter()
+    result = function(column)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-rows', type=int, default=100000)
+    parser.add_argument('-distinct', type=int, default=500)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    distinct = names(args.distinct, rnd)
+    columns = [('{} distinct'.format(args.distinct),
+                [rnd.choice(distinct) for _ in range(args.rows)]),
+               ('all distinct', names(args.rows, rnd))]
+
+    methods = [('legacy', lambda column: [legacy_convert_intf_name(name)
+                                          for name in column]),
+               ('memoized', lambda column: [Common.convert_intf_name(name)
+                                            for name in column]),
+               ('batch', Common.convert_intf_names)]
+
+    for title, column in columns:
+        print('{} rows, {}'.format(args.rows, title))
+        legacy_time = None
+        for method, function in methods:
+            elapsed, result = timed(function, column)
+            if legacy_time is None:
+                legacy_time, expected = elapsed, result
+            assert result == expected
+            print('    {:<9}: {:6.3f} s, {:5.2f} us per name, '
+                  '{:5.1f}x'.format(method, elapsed, elapsed / args.rows * 1e6,
+                legacy_time / elapsed))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,238 @@
+'''Time benchmark of the NX-OS "| json" parsing mode against cli()
+
+Builds synthetic NX-OS outputs of the same tables, as text and as the
+"| json" reply, and times the parsers on both:
+
+    * mac: 'show mac address-table' of -macs dynamic entries,
+      ShowMacAddressTable
+    * route: 'show ip route vrf all' of -routes OSPF routes with one next
+      hop, ShowRoutingVrfAll
+    * interface: 'show interface' of -interfaces Ethernet interfaces with
+      their counters, ShowInterface
+
+for each of:
+
+    * cli(): the regexes run on the text output
+    * json(): the JSON reply decoded (orjson when installed, json otherwise)
+      and its rows mapped
+    * parse(), parse_json(): the above with the schema validation
+
+json() is checked to give the parsed output of cli().
+
+    python benchmarks/bench_json_parse.py [-macs 100000] [-routes 100000]
+        [-interfaces 10000]
+'''
+
+import json
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.utils import json_rows
+from genie.libs.parser.nxos.show_fdb import ShowMacAddressTable
+from genie.libs.parser.nxos.show_routing import ShowRoutingVrfAll
+from genie.libs.parser.nxos.show_interface import ShowInterface
+
+from bench_records import megabytes
+
+MAC_HEADER = '''\
+Legend:
+        * - primary entry, G - Gateway MAC, (R) - Routed MAC, O - Overlay MAC
+        age - seconds since last seen,+ - primary entry using vPC Peer-Link,
+        (T) - True, (F) - False, C - ControlPlane MAC, ~ - vsan
+   VLAN     MAC Address      Type      age     Secure NTFY Ports
+---------+-----------------+--------+---------+------+----+------------------
+'''
+
+ROUTE_HEADER = '''\
+IP Route Table for VRF "default"
+'*' denotes best ucast next-hop
+'**' denotes best mcast next-hop
+'[x/y]' denotes [preference/metric]
+'%<string>' in via output denotes VRF <string>
+
+'''
+
+INTERFACE = '''\
+Ethernet{slot}/{port} is up
+admin state is up, Dedicated Interface
+  Hardware: 100/1000/10000 Ethernet, address: 5254.00{a:02x}.{b:02x}56 \
+(bia 5254.00{a:02x}.{b:02x}56)
+  MTU 1500 bytes, BW 10000000 Kbit, DLY 10 usec
+  reliability 255/255, txload 1/255, rxload 2/255
+  Encapsulation ARPA, medium is broadcast
+  Port mode is trunk
+  full-duplex, 10 Gb/s, media type is 10G
+  Beacon is turned off
+  Auto-Negotiation is turned on
+  Input flow-control is off, output flow-control is off
+  Auto-mdix is turned off
+  Switchport monitor is off
+  EtherType is 0x8100
+  Last link flapped 1d02h
+  Last clearing of "show interface" counters never
+  2 interface resets
+  30 seconds input rate {n}0 bits/sec, {n} packets/sec
+  30 seconds output rate {n}0 bits/sec, {n} packets/sec
+  RX
+    {n}00 unicast packets  35 multicast packets  4 broadcast packets
+    {n}39 input packets  {n}4321 bytes
+    0 jumbo packets  0 storm suppression packets
+    0 runts  0 giants  3 CRC/FCS  0 no buffer
+    3 input error  0 short frame  0 overrun   0 underrun  0 ignored
+    0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
+    0 input with dribble  0 input discard
+    0 Rx pause
+  TX
+    {n}00 unicast packets  70 multicast packets  8 broadcast packets
+    {n}78 output packets  {n}8642 bytes
+    0 jumbo packets
+    0 output error  0 collision  0 deferred  0 late collision
+    0 lost carrier  0 no carrier  0 babble  0 output discard
+    0 Tx pause
+'''
+
+# Leaves of the JSON row of INTERFACE, but for those numbered per interface
+INTERFACE_ROW = {
+    'state': 'up', 'admin_state': 'up', 'share_state': 'Dedicated',
+    'eth_hw_desc': '100/1000/10000 Ethernet', 'eth_mtu': '1500',
+    'eth_bw': 10000000, 'eth_dly': 10, 'eth_reliability': '255',
+    'eth_txload': '1', 'eth_rxload': '2', 'eth_encap': 'ARPA',
+    'medium': 'broadcast', 'eth_mode': 'trunk', 'eth_duplex': 'full',
+    'eth_speed': '10 Gb/s', 'eth_media': '10G', 'eth_beacon': 'off',
+    'eth_autoneg': 'on', 'eth_in_flowctrl': 'off', 'eth_out_flowctrl': 'off',
+    'eth_mdix': 'off', 'eth_swt_monitor': 'off', 'eth_ethertype': '0x8100',
+    'eth_link_flapped': '1d02h', 'eth_clear_counters': 'never',
+    'eth_reset_cntr': 2, 'eth_load_interval1_rx': 30,
+    'eth_load_interval1_tx': '30', 'eth_inmcast': 35, 'eth_inbcast': 4,
+    'eth_jumbo_inpkts': '0', 'eth_storm_supp': '0', 'eth_runts': 0,
+    'eth_giants': 0, 'eth_crc': 3, 'eth_nobuf': 0, 'eth_inerr': 3,
+    'eth_frame': 0, 'eth_overrun': 0, 'eth_underrun': 0, 'eth_ignored': 0,
+    'eth_watchdog': 0, 'eth_bad_eth': 0, 'eth_bad_proto': 0,
+    'eth_in_ifdown_drops': 0, 'eth_dribble': 0, 'eth_indiscard': 0,
+    'eth_inpause': 0, 'eth_outmcast': 70, 'eth_outbcast': 8,
+    'eth_jumbo_outpkts': '0', 'eth_outerr': 0, 'eth_coll': 0,
+    'eth_deferred': 0, 'eth_latecoll': 0, 'eth_lostcarrier': 0,
+    'eth_nocarrier': 0, 'eth_babbles': 0, 'eth_outdiscard': 0,
+    'eth_outpause': 0}
+
+
+def mac(n):
+    return '{:04x}.{:04x}.{:04x}'.format(n >> 32 & 0xffff, n >> 16 & 0xffff,
+                                         n & 0xffff)
+
+
+def mac_outputs(macs):
+    lines = [MAC_HEADER]
+    rows = []
+    for n in range(macs):
+        vlan, port, age = str(n % 4000 + 1), 'Eth1/{}'.format(n % 48 + 1), \
+            str(n % 300)
+        lines.append('*{:>8}     {}   dynamic  {:<9} F      F    {}\n'.format(
+            vlan, mac(n), age, port))
+        rows.append({'disp_mac_addr': mac(n), 'disp_type': '* ',
+                     'disp_vlan': vlan, 'disp_is_static': 'disabled',
+                     'disp_age': age, 'disp_is_secure': 'disabled',
+                     'disp_is_ntfy': 'disabled', 'disp_port': port})
+    return ''.join(lines), json.dumps(
+        {'TABLE_mac_address': {'ROW_mac_address': rows}})
+
+
+def route_outputs(routes):
+    lines = [ROUTE_HEADER]
+    rows = []
+    for n in range(routes):
+        prefix = '10.{}.{}.{}/32'.format(n >> 16, n >> 8 & 255, n & 255)
+        nexthop = '10.0.{}.1'.format(n % 250)
+        interface = 'Eth1/{}'.format(n % 48 + 1)
+        metric = str(n % 100)
+        lines.append('{}, ubest/mbest: 1/0\n'
+                     '    *via {}, {}, [110/{}], 1d02h, ospf-1, intra\n'
+                     .format(prefix, nexthop, interface, metric))
+        rows.append({'ipprefix': prefix, 'ucast-nhops': '1',
+                     'mcast-nhops': '0', 'attached': 'false',
+                     'TABLE_path': {'ROW_path': {
+                         'ipnexthop': nexthop, 'ifname': interface,
+                         'uptime': '1d02h', 'pref': '110', 'metric': metric,
+                         'clientname': 'ospf-1', 'type': 'intra',
+                         'ubest': 'true', 'mbest': 'false'}}})
+    return ''.join(lines), json.dumps({'TABLE_vrf': {'ROW_vrf': {
+        'vrf-name-out': 'default', 'TABLE_addrf': {'ROW_addrf': {
+            'addrf': 'ipv4', 'TABLE_prefix': {'ROW_prefix': rows}}}}}})
+
+
+def interface_outputs(interfaces):
+    lines = []
+    rows = []
+    for n in range(interfaces):
+        slot, port = n // 48 + 1, n % 48 + 1
+        address = '5254.00{:02x}.{:02x}56'.format(n >> 8 & 255, n & 255)
+        lines.append(INTERFACE.format(slot=slot, port=port, a=n >> 8 & 255,
+                                      b=n & 255, n=n + 1))
+        row = dict(INTERFACE_ROW)
+        row.update({
+            'interface': 'Ethernet{}/{}'.format(slot, port),
+            'eth_hw_addr': address, 'eth_bia_addr': address,
+            'eth_inrate1_bits': '{}0'.format(n + 1),
+            'eth_inrate1_pkts': str(n + 1),
+            'eth_outrate1_bits': '{}0'.format(n + 1),
+            'eth_outrate1_pkts': str(n + 1),
+            'eth_inucast': int('{}00'.format(n + 1)),
+            'eth_inpkts': int('{}39'.format(n + 1)),
+            'eth_inbytes': int('{}4321'.format(n + 1)),
+            'eth_outucast': int('{}00'.format(n + 1)),
+            'eth_outpkts': int('{}78'.format(n + 1)),
+            'eth_outbytes': int('{}8642'.format(n + 1))})
+        rows.append(row)
+    return ''.join(lines), json.dumps(
+        {'TABLE_interface': {'ROW_interface': rows}})
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def run(title, parser_class, cli_output, json_output, kwargs):
+    print('{}: {:.1f} MB of text, {:.1f} MB of JSON, decoded by {}'.format(
+        title, megabytes(len(cli_output)), megabytes(len(json_output)),
+        'orjson' if json_rows.orjson else 'json'))
+    parser = parser_class(device=Mock())
+    cli_parsed, cli_time = timed(
+        lambda: parser.cli(output=cli_output, **kwargs))
+    json_parsed, json_time = timed(
+        lambda: parser.json(output=json_output, **kwargs))
+    assert json_parsed == cli_parsed, 'json() differs from cli()'
+    _, parse_time = timed(lambda: parser.parse(output=cli_output, **kwargs))
+    _, parse_json_time = timed(
+        lambda: parser.parse_json(output=json_output, **kwargs))
+    for name, elapsed in (('cli()', cli_time), ('json()', json_time),
+                          ('parse()', parse_time),
+                          ('parse_json()', parse_json_time)):
+        print('    {:12}: {:6.2f} s'.format(name, elapsed))
+    print('    speedup: json() {:.1f}x over cli(), parse_json() {:.1f}x over '
+          'parse()'.format(cli_time / json_time,
+                           parse_time / parse_json_time))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-macs', type=int, default=100000)
+    parser.add_argument('-routes', type=int, default=100000)
+    parser.add_argument('-interfaces', type=int, default=10000)
+    args = parser.parse_args()
+
+    cli_output, json_output = mac_outputs(args.macs)
+    run('{} MAC entries'.format(args.macs), ShowMacAddressTable,
+        cli_output, json_output, {})
+    cli_output, json_output = route_outputs(args.routes)
+    run('{} routes'.format(args.routes), ShowRoutingVrfAll,
+        cli_output, json_output, {'vrf': 'all'})
+    cli_output, json_output = interface_outputs(args.interfaces)
+    run('{} interfaces'.format(args.interfaces), ShowInterface,
+        cli_output, json_output, {})
+
+
+if __name__ == '__main__':
+    main()
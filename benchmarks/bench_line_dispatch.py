@@ -0,0 +1,102 @@
+'''Benchmark of the line dispatch of the show interface parsers
+
+Runs the golden outputs of iosxe ShowInterfaces, iosxe ShowIpInterface and
+nxos ShowInterface, and compares for every line:
+
+    * the sequential p1, p2, ... pN chain, matching the regexes of the class
+      in declaration order until one matches
+    * LineDispatcher, matching only the regexes whose leading token matches
+      the line
+
+The golden outputs are repeated to stand for a 48 port switch.
+
+    python benchmarks/bench_line_dispatch.py [-copies 48] [-repeat 5]
+'''
+
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.regex import compile_regexes
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces, \
+                                                   ShowIpInterface
+from genie.libs.parser.nxos.show_interface import ShowInterface
+from genie.libs.parser.iosxe.tests import test_show_interface as iosxe_tests
+from genie.libs.parser.nxos.tests import test_show_interface as nxos_tests
+
+PARSERS = [('iosxe ShowInterfaces', ShowInterfaces,
+            iosxe_tests.TestShowInterfaces),
+           ('iosxe ShowIpInterface', ShowIpInterface,
+            iosxe_tests.TestShowIpInterface),
+           ('nxos ShowInterface', ShowInterface,
+            nxos_tests.TestShowInterface)]
+
+
+def golden_outputs(test_class):
+    for name, value in sorted(vars(test_class).items()):
+        if name.startswith('golden_output') and isinstance(value, dict) and \
+           'execute.return_value' in value:
+            yield value['execute.return_value']
+
+
+def sequential(regexes, lines):
+    '''Match lines as the pN.match chains did, return the number of regexes
+    tried'''
+    tried = 0
+    for line in lines:
+        for name, regex in regexes:
+            tried += 1
+            if regex.match(line):
+                break
+    return tried
+
+
+def dispatched(dispatcher, lines):
+    for line in lines:
+        dispatcher.match(line)
+
+
+def timed(function, repeat, *args):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-copies', type=int, default=48)
+    parser.add_argument('-repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for title, parser_class, test_class in PARSERS:
+        output = '\n'.join(golden_outputs(test_class))
+        lines = [line.strip() for line in output.splitlines()] * args.copies
+        regexes = compile_regexes(parser_class)
+        dispatcher = parser_class.dispatcher
+
+        seq_time, seq_tried = timed(sequential, args.repeat, regexes, lines)
+        dis_time, _ = timed(dispatched, args.repeat, dispatcher, lines)
+        dis_tried = sum(len(dispatcher.candidates(line)) for line in lines)
+        device = Mock(**{'execute.return_value':
+                         '\n'.join([output] * args.copies)})
+        cli_time, _ = timed(parser_class(device=device).cli, args.repeat)
+
+        print(title)
+        print('    lines             : {}'.format(len(lines)))
+        print('    regexes           : {}'.format(len(regexes)))
+        print('    sequential        : {:.1f} regexes/line, {:.2f} us/line'
+              .format(seq_tried / len(lines),
+                      seq_time / len(lines) * 1e6))
+        print('    dispatched        : {:.1f} regexes/line, {:.2f} us/line'
+              .format(dis_tried / len(lines),
+                      dis_time / len(lines) * 1e6))
+        print('    cli()             : {:.2f} us/line'.format(
+            cli_time / len(lines) * 1e6))
+
+
+if __name__ == '__main__':
+    main()
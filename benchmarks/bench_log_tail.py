@@ -0,0 +1,86 @@
+'''Benchmark of polling the log buffer of a device with tail()
+
+Builds the output of an iosxe 'show logging' of -lines log lines, then of
+the same buffer with -new lines logged since, the oldest lines pushed out,
+and measures at each poll:
+
+    * parse: ShowLogging.parse() of the whole buffer, as each poll did
+    * tail: ShowLogging.tail() with the cursor of the previous poll
+
+The new lines given by tail() are checked equal to the last lines of the
+parsed output.
+
+    python benchmarks/bench_log_tail.py [-lines 100000] [-new 100]
+'''
+
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_logging import ShowLogging
+
+HEADER = '''\
+Syslog logging: enabled (0 messages dropped, 149 messages rate-limited, 0 flushes, 0 overruns, xml disabled, filtering disabled)
+
+    Buffer logging:  level debugging, {n} messages logged, xml disabled,
+                    filtering disabled
+
+Log Buffer (8192000 bytes):
+'''
+
+MESSAGES = (
+    '%LINEPROTO-5-UPDOWN: Line protocol on Interface GigabitEthernet{i}, '
+    'changed state to {state}',
+    '%LINK-3-UPDOWN: Interface GigabitEthernet{i}, changed state to {state}',
+    '%BGP-5-ADJCHANGE: neighbor 10.1.{i}.1 {state}',
+    '%SYS-5-CONFIG_I: Configured from console by admin on vty{i}')
+
+
+def log_line(n):
+    seconds = n // 10
+    return 'Jun {:2d} {:02d}:{:02d}:{:02d}.{:03d} EST: {}'.format(
+        seconds // 86400 % 28 + 1, seconds // 3600 % 24, seconds // 60 % 60,
+        seconds % 60, n % 10 * 100,
+        MESSAGES[n % 4].format(i=n % 48, state='up' if n % 2 else 'down'))
+
+
+def buffer_output(first, lines):
+    return HEADER.format(n=first + lines) + '\n'.join(
+        log_line(n) for n in range(first, first + lines)) + '\n'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-lines', type=int, default=100000)
+    parser.add_argument('-new', type=int, default=100)
+    parser.add_argument('-polls', type=int, default=10)
+    args = parser.parse_args()
+
+    cursor = ShowLogging(device=Mock()).tail(
+        output=buffer_output(0, args.lines)).cursor
+    parse_time = tail_time = 0
+    for poll in range(1, args.polls + 1):
+        output = buffer_output(poll * args.new, args.lines)
+
+        start = time.perf_counter()
+        parsed = ShowLogging(device=Mock()).parse(output=output)
+        parse_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = ShowLogging(device=Mock()).tail(cursor=cursor,
+                                                 output=output)
+        tail_time += time.perf_counter() - start
+        cursor = result.cursor
+        assert result.reset is None
+        assert [log['line'] for log in result.logs] == \
+            parsed['logs'][-args.new:]
+
+    print('{} polls of {} lines, {} new at each'.format(
+        args.polls, args.lines, args.new))
+    print('    parse : {:8.2f} ms per poll'.format(
+        parse_time / args.polls * 1000))
+    print('    tail  : {:8.2f} ms per poll, {:.0f}x faster'.format(
+        tail_time / args.polls * 1000, parse_time / tail_time))
+
+if __name__ == '__main__':
+    main()
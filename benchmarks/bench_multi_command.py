@@ -0,0 +1,67 @@
+'''Benchmark of MultiCommand against executing the parsers one by one
+
+Replays the golden outputs of the iosxe show inventory, show interfaces and
+show ip route parsers on a ReplayTerminal with -latency seconds a round
+trip, cycled over -commands commands, and measures:
+
+    * serial: the parser of each command executing it, a round trip each
+    * batch: MultiCommand writing all the commands at once, one round trip,
+      then splitting the output and parsing each slice
+
+The parsing time is the same for both, the batch saves the round trips
+but one. The parsed outputs of both are checked equal.
+
+    python benchmarks/bench_multi_command.py [-commands 30] [-latency 0.05]
+'''
+
+import time
+import argparse
+import itertools
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.multi_command import MultiCommand, \
+    ReplayTerminal
+from genie.libs.parser.iosxe.tests import test_show_platform as platform
+from genie.libs.parser.iosxe.tests import test_show_interface as interface
+from genie.libs.parser.iosxe.tests import test_show_routing as routing
+
+OUTPUTS = {
+    'show inventory': platform.test_show_inventory.golden_output,
+    'show interfaces': interface.TestShowInterfaces.golden_output,
+    'show ip route': routing.TestShowIpRoute.golden_output_1,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-commands', type=int, default=30)
+    parser.add_argument('-latency', type=float, default=0.05)
+    args = parser.parse_args()
+
+    commands = list(itertools.islice(itertools.cycle(OUTPUTS),
+                                     args.commands))
+    print('{} commands, {} s a round trip'.format(len(commands),
+                                                 args.latency))
+
+    device = ReplayTerminal('R1', 'iosxe', OUTPUTS, latency=args.latency)
+    start = time.perf_counter()
+    expected = []
+    for command in commands:
+        parser_cls, kwargs = common.get_parser(command, device)
+        expected.append(parser_cls(device=device).parse(**kwargs))
+    serial_time = time.perf_counter() - start
+    print('    serial: {:6.2f} s, {} round trips'.format(serial_time,
+                                                        device.round_trips))
+
+    device = ReplayTerminal('R1', 'iosxe', OUTPUTS, latency=args.latency)
+    start = time.perf_counter()
+    results = MultiCommand(device).run(commands)
+    batch_time = time.perf_counter() - start
+    assert [result.parsed for result in results] == expected, \
+        'batch and serial outputs differ'
+    print('    batch : {:6.2f} s, {} round trip, {:.1f}x speedup'.format(
+        batch_time, device.round_trips, serial_time / batch_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+'''Benchmark of ParseCache hits against parsing again
+
+Parses the golden outputs of a few parsers, as a poller does when the
+output did not change since the last poll:
+
+    * parse: parser.parse(output=...)
+    * hit: ParseCache.parse(parser, output=...) once the output is cached,
+      hashing the output and copying the cached parsed output
+
+    python benchmarks/bench_parse_cache.py [-repeat 200]
+'''
+
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.parse_cache import ParseCache
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.iosxe.show_vrf import ShowVrfDetail
+from genie.libs.parser.iosxe.tests import test_show_interface, \
+                                          test_show_routing, test_show_vrf
+
+PARSERS = [('iosxe ShowIpRoute', ShowIpRoute,
+            test_show_routing.TestShowIpRoute.golden_output_1),
+           ('iosxe ShowVrfDetail', ShowVrfDetail,
+            test_show_vrf.TestShowVrfDetail.golden_output),
+           ('iosxe ShowInterfaces', ShowInterfaces,
+            test_show_interface.TestShowInterfaces.golden_output)]
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    cache = ParseCache()
+    for title, parser_class, golden in PARSERS:
+        output = golden['execute.return_value']
+        device = Mock()
+        parse = timed(lambda: parser_class(device=device).parse(
+            output=output), args.repeat)
+        cache.parse(parser_class(device=device), output=output)
+        hit = timed(lambda: cache.parse(parser_class(device=device),
+                                        output=output), args.repeat)
+        print(title)
+        print('    output            : {} bytes'.format(len(output)))
+        print('    parse             : {:.1f} us'.format(parse * 1e6))
+        print('    cache hit         : {:.1f} us ({:.0f}x)'.format(
+            hit * 1e6, parse / hit))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+'''Memory benchmark of sharing the path attributes of full BGP tables
+
+Builds full tables in the format of the golden outputs of nxos
+ShowBgpVrfAllAll, -prefixes prefixes of -paths paths each, the next hops,
+metrics, local preferences and AS paths of the paths drawn out of
+-attributes sets as in an Internet table, and of iosxe ShowBgpAllDetail,
+-prefixes paths. Each is parsed twice, by cli() and by parse_shared(), both
+outputs validated against the compiled schema of the parser:
+
+    * plain: the output of cli(), one dict per path
+    * shared: the output of parse_shared(), its paths shared in a PathStore
+      while they are parsed
+    * again: a second output of parse_shared() in the same store
+
+Parse is the time of the parse and validation. Peak is the most memory
+traced by tracemalloc during them, in a parse of its own: tracemalloc slows
+it down. Retained is the memory of the output: the sys.getsizeof() of the
+dicts and of the other objects reachable from them, each counted once. The
+shared outputs are checked equal to the plain ones.
+
+    python benchmarks/bench_path_store.py [-prefixes 500000] [-paths 2]
+'''
+
+import time
+import tracemalloc
+import random
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.path_store import PathStore
+from genie.libs.parser.utils.schema_compiler import compile_schema
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+
+from bench_records import deep_size, megabytes
+from bench_interning import bgp_output
+
+NXOS_HEADER = '''\
+BGP routing table information for VRF default, address family IPv4 Unicast
+BGP table version is 35, local router ID is 10.229.11.11
+Status: s-suppressed, x-deleted, S-stale, d-dampened, h-history, *-valid, >-best
+Path type: i-internal, e-external, c-confed, l-local, a-aggregate, r-redist
+Origin codes: i - IGP, e - EGP, ? - incomplete, | - multipath
+
+   Network            Next Hop            Metric     LocPrf     Weight Path
+'''
+
+
+def attribute_sets(count, rng):
+    # (next hop, metric, local preference, AS path), a few next hops
+    sets = []
+    for n in range(count):
+        path = ' '.join(str(rng.randint(1, 64511))
+                        for _ in range(rng.randint(1, 5)))
+        sets.append(('10.84.{}.{}'.format(n % 8, n % 32 + 1),
+                     rng.choice((0, 0, 0, 100, 2000)),
+                     rng.choice((100, 100, 100, 200)), path))
+    return sets
+
+
+def nxos_output(prefixes, paths, attributes, rng):
+    sets = attribute_sets(attributes, rng)
+    lines = [NXOS_HEADER]
+    for n in range(prefixes):
+        # The prefix on a line of its own, then a line per path
+        lines.append('*>i{}.{}.{}.0/24\n'.format(n >> 16 & 255 or 1,
+                                                  n >> 8 & 255, n & 255))
+        for index in range(paths):
+            next_hop, metric, localpref, path = rng.choice(sets)
+            lines.append('{:<22}{:<20}{:>6}{:>11}{:>11} {} i\n'.format(
+                '*>i' if not index else '* i', next_hop, metric, localpref,
+                0, path))
+    return ''.join(lines)
+
+
+def parse_plain(parser_class, output):
+    parser = parser_class(device=Mock())
+    parsed = parser.cli(output=output)
+    compile_schema(parser.schema).validate(parsed)
+    return parsed
+
+
+def parse_shared(parser_class, output, store):
+    return parser_class(device=Mock()).parse_shared(store=store,
+                                                    output=output)
+
+
+def measure(parse):
+    # (parsed output, parse time, peak traced)
+    start = time.perf_counter()
+    parsed = parse()
+    elapsed = time.perf_counter() - start
+    del parsed
+    tracemalloc.start()
+    parsed = parse()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return parsed, elapsed, peak
+
+
+def retained(*outputs):
+    containers, scalars = deep_size(dict(enumerate(outputs)))
+    return containers + scalars
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-prefixes', type=int, default=500000)
+    parser.add_argument('-paths', type=int, default=2)
+    parser.add_argument('-attributes', type=int, default=20000)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    tables = [('ShowBgpVrfAllAll', ShowBgpVrfAllAll,
+               nxos_output(args.prefixes, args.paths, args.attributes, rng)),
+              ('ShowBgpAllDetail', ShowBgpAllDetail,
+               bgp_output(args.prefixes))]
+
+    for title, parser_class, output in tables:
+        print('{}, {} lines'.format(title, output.count('\n') + 1))
+        plain, plain_time, plain_peak = measure(
+            lambda: parse_plain(parser_class, output))
+        plain_size = retained(plain)
+        print('    plain  : parse {:6.2f} s, peak {:6.1f} MB, retained '
+              '{:6.1f} MB'.format(plain_time, megabytes(plain_peak),
+                                  megabytes(plain_size)))
+
+        # A store for each parse of measure(), the same for again
+        shared, shared_time, shared_peak = measure(
+            lambda: parse_shared(parser_class, output, PathStore()))
+        assert shared == plain
+        shared_size = retained(shared)
+        print('    shared : parse {:6.2f} s, peak {:6.1f} MB, retained '
+              '{:6.1f} MB, {:.1f}x smaller'.format(
+                  shared_time, megabytes(shared_peak),
+                  megabytes(shared_size), plain_size / shared_size))
+
+        store = PathStore()
+        first = parse_shared(parser_class, output, store)
+        again = parse_shared(parser_class, output, store)
+        assert again == plain
+        size = retained(first, again)
+        print('    again  : retained {:6.1f} MB for 2 outputs, {:.1f}x '
+              'smaller, {}'.format(megabytes(size), 2 * plain_size / size,
+                                   store.stats))
+        del plain, shared, first, again
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+'''Memory benchmark of compact() records on a full route table
+
+Parses a synthetic iosxe 'show ip route' of -routes OSPF routes with -paths
+next hops each, streamed to ShowIpRoute.cli() line by line, and measures the
+memory held by:
+
+    * dict: the parsed output as returned by cli()
+    * compact: compact(parsed, ShowIpRoute.schema), routes and next hops as
+      records
+
+The sizes are the sys.getsizeof() of the objects reachable from the parsed
+output, each counted once, split between containers (dicts and records)
+and scalars. The strings (prefixes, next hops, interfaces) are the same
+objects in both forms. compact(parsed) is checked equal to parsed, and
+expand() to give it back.
+
+    python benchmarks/bench_records.py [-routes 1000000] [-paths 1]
+'''
+
+import sys
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.utils.records import Record, compact, expand
+
+
+def route_lines(routes, paths):
+    yield 'Routing Table: VRF1'
+    yield 'Gateway of last resort is not set'
+    yield ''
+    for n in range(routes):
+        yield 'O        10.{}.{}.{}/32 [110/{}] via 10.0.{}.1, 1d02h, ' \
+              'GigabitEthernet0'.format(n >> 16, n >> 8 & 255, n & 255,
+                                        n % 100, n % 250)
+        for path in range(1, paths):
+            yield '                  [110/{}] via 10.0.{}.{}, 1d02h, ' \
+                  'GigabitEthernet{}'.format(n % 100, n % 250, path + 1,
+                                             path)
+
+
+def deep_size(parsed):
+    '''(containers, scalars) bytes of the objects reachable from parsed'''
+    seen = set()
+    containers = scalars = 0
+    stack = [parsed]
+    while stack:
+        value = stack.pop()
+        if id(value) in seen:
+            continue
+        seen.add(id(value))
+        if isinstance(value, dict):
+            containers += sys.getsizeof(value)
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, Record):
+            containers += sys.getsizeof(value)
+            stack.extend(value.values())
+        else:
+            scalars += sys.getsizeof(value)
+    return containers, scalars
+
+
+def megabytes(size):
+    return size / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-routes', type=int, default=1000000)
+    parser.add_argument('-paths', type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    parsed = ShowIpRoute(device=Mock()).cli(
+        output_stream=route_lines(args.routes, args.paths))
+    parse_time = time.perf_counter() - start
+    routes = parsed['vrf']['VRF1']['address_family']['ipv4']['routes']
+    assert len(routes) == args.routes
+
+    start = time.perf_counter()
+    compacted = compact(parsed, ShowIpRoute.schema)
+    compact_time = time.perf_counter() - start
+    assert compacted == parsed
+
+    start = time.perf_counter()
+    assert expand(compacted) == parsed
+    expand_time = time.perf_counter() - start
+
+    print('{} routes, {} next hops each, parsed in {:.1f} s'.format(
+        args.routes, args.paths, parse_time))
+    dict_size = None
+    for title, value in [('dict', parsed), ('compact', compacted)]:
+        containers, scalars = deep_size(value)
+        size = containers + scalars
+        print('    {:<8}: {:6.0f} MB, {:4.0f} bytes per route, containers '
+              '{:4.0f} MB, scalars {:4.0f} MB{}'.format(
+                  title, megabytes(size), size / args.routes,
+                  megabytes(containers), megabytes(scalars),
+                  '' if dict_size is None else ', {:.2f}x smaller'.format(
+                      dict_size / size)))
+        dict_size = dict_size or size
+    print('    compact(): {:.1f} s, expand(): {:.1f} s'.format(
+        compact_time, expand_time))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+'''Benchmark of per-call re.compile against class-level LazyRegex
+
+Collects the constant re.compile patterns of every parser method of
+genie.libs.parser, then calls the parsers round robin, as a process using
+hundreds of parsers would. Each call either:
+
+    * compiles its patterns with re.compile, as cli() used to. The re module
+      cache holds 512 patterns, far less than the patterns of all the
+      parsers, so most calls compile again.
+    * reads them from LazyRegex class attributes, compiled once.
+
+    python benchmarks/bench_regex_table.py [-parsers 300] [-rounds 5]
+'''
+
+import os
+import re
+import ast
+import time
+import argparse
+
+import genie.libs.parser
+from genie.libs.parser.utils.regex import LazyRegex
+
+
+def collect_patterns(root):
+    '''Return the constant patterns of each parser method, as a list of
+    (name, patterns)'''
+    methods = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in ('tests', 'template')]
+        for filename in sorted(filenames):
+            if not filename.endswith('.py'):
+                continue
+            path = os.path.join(dirpath, filename)
+            with open(path) as f:
+                try:
+                    tree = ast.parse(f.read())
+                except SyntaxError:
+                    continue
+            for node in ast.walk(tree):
+                if not isinstance(node, ast.ClassDef):
+                    continue
+                for item in node.body:
+                    if not isinstance(item, ast.FunctionDef):
+                        continue
+                    patterns = _compile_calls(item)
+                    if patterns:
+                        methods.append(('{}.{}'.format(node.name, item.name),
+                                        patterns))
+    return methods
+
+
+def _compile_calls(function):
+    patterns = []
+    for node in ast.walk(function):
+        if isinstance(node, ast.Call) and \
+           isinstance(node.func, ast.Attribute) and \
+           node.func.attr == 'compile' and \
+           isinstance(node.func.value, ast.Name) and \
+           node.func.value.id == 're' and node.args and \
+           isinstance(node.args[0], ast.Str):
+            patterns.append(node.args[0].s)
+    return patterns
+
+
+def per_call_compile(methods, rounds):
+    re.purge()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for name, patterns in methods:
+            for pattern in patterns:
+                re.compile(pattern)
+    return time.perf_counter() - start
+
+
+def class_level(methods, rounds):
+    # One class per parser, as declared in the parser modules
+    classes = []
+    for name, patterns in methods:
+        attrs = {'p{}'.format(i): LazyRegex(pattern)
+                 for i, pattern in enumerate(patterns)}
+        classes.append((type(name, (object,), attrs)(), list(attrs)))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for instance, names in classes:
+            for name in names:
+                getattr(instance, name)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-parsers', type=int, default=300)
+    parser.add_argument('-rounds', type=int, default=5)
+    args = parser.parse_args()
+
+    methods = collect_patterns(genie.libs.parser.__path__[0])
+    methods = methods[:args.parsers]
+    n_patterns = sum(len(patterns) for name, patterns in methods)
+    calls = len(methods) * args.rounds
+
+    compile_time = per_call_compile(methods, args.rounds)
+    lazy_time = class_level(methods, args.rounds)
+
+    print('parsers             : {}'.format(len(methods)))
+    print('distinct patterns   : {}'.format(n_patterns))
+    print('re cache size       : {}'.format(getattr(re, '_MAXCACHE', '?')))
+    print('re.compile per call : {:.1f} us/parser call'.format(
+        compile_time / calls * 1e6))
+    print('LazyRegex           : {:.1f} us/parser call (includes first '
+          'compile)'.format(lazy_time / calls * 1e6))
+    print('speedup             : {:.1f}x'.format(compile_time / lazy_time))
+
+
+if __name__ == '__main__':
+    main()
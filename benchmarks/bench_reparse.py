@@ -0,0 +1,82 @@
+'''Benchmark of DifferentialParser.reparse on polled show interfaces
+
+Polls a synthetic iosxe 'show interfaces' of -interfaces subinterfaces: the
+counters and last input times of a fraction of the interfaces move, the
+others are idle. -polls polls are made with each fraction of busy
+interfaces, the first one re-parses blocks seen for the first time. Each
+poll is parsed:
+
+    * cli: the whole output parsed again
+    * reparse: ShowInterfaces.reparse(output, previous=snapshot), the lines
+      which changed only
+
+The parsed outputs and changed paths of reparse are checked against cli().
+
+    python benchmarks/bench_reparse.py [-interfaces 10000]
+        [-active 0.01 0.1 1] [-polls 2]
+'''
+
+import time
+import random
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.utils.reparse import changed_paths
+
+from bench_block_parse import INTERFACE
+
+
+def poll(counters):
+    '''Output of show interfaces, counters being (n, packets, last) of
+    each interface'''
+    return ''.join(INTERFACE.format(n=n, a=n // 256, b=n % 256)
+                   .replace('{n}2345 packets input'.format(n=n),
+                            '{} packets input'.format(packets))
+                   .replace('Last input 00:00:01',
+                            'Last input 00:00:{:02d}'.format(last))
+                   for n, packets, last in counters)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-interfaces', type=int, default=10000)
+    parser.add_argument('-active', type=float, nargs='+',
+                        default=[0.01, 0.1, 1])
+    parser.add_argument('-polls', type=int, default=2)
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    counters = [(n, n * 10, 1) for n in range(1, args.interfaces + 1)]
+    output = poll(counters)
+    show_interfaces = ShowInterfaces(device=Mock())
+    start = time.perf_counter()
+    parsed = show_interfaces.cli(output=output)
+    cli_time = time.perf_counter() - start
+    snapshot = show_interfaces.reparse(output)
+
+    print('{} interfaces, {} lines'.format(args.interfaces,
+                                           len(output.splitlines())))
+    print('    cli          : {:.3f} s'.format(cli_time))
+    for active in args.active:
+        busy = set(n for n, _, _ in counters if rnd.random() < active)
+        for _ in range(args.polls):
+            counters = [(n, packets + rnd.randint(1, 1000),
+                         rnd.randint(0, 59)) if n in busy
+                        else (n, packets, last)
+                        for n, packets, last in counters]
+            output = poll(counters)
+            start = time.perf_counter()
+            snapshot = show_interfaces.reparse(output, previous=snapshot)
+            elapsed = time.perf_counter() - start
+
+            expected = show_interfaces.cli(output=output)
+            assert snapshot.parsed == expected
+            assert snapshot.changed == changed_paths(parsed, expected)
+            parsed = expected
+            print('    reparse {:>4.0%} : {:.3f} s ({:.1f}x), {} changed, '
+                  '{}'.format(active, elapsed, cli_time / elapsed,
+                              len(snapshot.changed), snapshot.stats))
+
+if __name__ == '__main__':
+    main()
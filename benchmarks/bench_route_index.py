@@ -0,0 +1,131 @@
+'''Benchmark of RouteIndex on a synthetic full route table
+
+Builds the parsed output of an iosxe 'show ip route' of -routes IPv4 routes
+and 'show ipv6 route' of -routes6 IPv6 routes, with prefix lengths spread
+as in an Internet table (mostly /24 and /48), and measures:
+
+    * build: RouteIndex.from_parsed() of both, then the memory allocated
+      by the index (tracemalloc, in a second build), the parsed output not
+      included
+    * lookup: longest prefix match of -lookups random addresses
+    * scan: the same lookups by a scan of the routes dict with netaddr, as
+      the reachability checks do, on -scans addresses only
+
+The results of the lookups and of the scans are checked equal.
+
+    python benchmarks/bench_route_index.py [-routes 1000000] [-routes6 200000]
+'''
+
+import time
+import random
+import argparse
+import tracemalloc
+
+import netaddr
+
+from genie.libs.parser.utils.route_index import RouteIndex
+
+from bench_records import megabytes
+
+# Prefix lengths and their weight, as in a full table
+LENGTHS4 = ((24, 60), (23, 8), (22, 10), (21, 5), (20, 5), (19, 4),
+            (18, 2), (17, 2), (16, 3), (12, 1))
+LENGTHS6 = ((48, 50), (32, 20), (40, 10), (44, 10), (36, 5), (29, 5))
+
+
+def prefixes(count, bits, lengths, rng):
+    # Distinct random networks of the weighted lengths, as text
+    lengths = [length for length, weight in lengths for _ in range(weight)]
+    seen = set()
+    while len(seen) < count:
+        length = rng.choice(lengths)
+        key = rng.getrandbits(length) << (bits - length)
+        if (key, length) in seen:
+            continue
+        seen.add((key, length))
+        yield '{}/{}'.format(netaddr.IPAddress(key, version=4 if bits == 32
+                                               else 6), length)
+
+
+def route_table(count, bits, lengths, rng):
+    af = 'ipv4' if bits == 32 else 'ipv6'
+    routes = {}
+    for n, prefix in enumerate(prefixes(count, bits, lengths, rng)):
+        routes[prefix] = {
+            'route': prefix, 'active': True, 'source_protocol': 'bgp',
+            'source_protocol_codes': 'B', 'route_preference': 20,
+            'metric': 0, 'next_hop': {'next_hop_list': {1: {
+                'index': 1, 'next_hop': '10.0.{}.1'.format(n % 250),
+                'updated': '1w2d'}}}}
+    return {'vrf': {'default': {'address_family': {af: {'routes': routes}}}}}
+
+
+def scan(parsed, address):
+    # Longest prefix match over the routes dict
+    address = netaddr.IPAddress(address)
+    best = None
+    for vrf in parsed['vrf'].values():
+        for af in vrf['address_family'].values():
+            for prefix in af['routes']:
+                network = netaddr.IPNetwork(prefix)
+                if address in network and \
+                        (best is None or network.prefixlen > best.prefixlen):
+                    best = network
+    return str(best) if best is not None else None
+
+
+def build(tables):
+    index = RouteIndex()
+    for parsed in tables:
+        RouteIndex.from_parsed(parsed, index=index)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-routes', type=int, default=1000000)
+    parser.add_argument('-routes6', type=int, default=200000)
+    parser.add_argument('-lookups', type=int, default=100000)
+    parser.add_argument('-scans', type=int, default=2)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    tables = [route_table(args.routes, 32, LENGTHS4, rng),
+              route_table(args.routes6, 128, LENGTHS6, rng)]
+    print('{} IPv4 and {} IPv6 routes'.format(args.routes, args.routes6))
+
+    start = time.perf_counter()
+    index = build(tables)
+    build_time = time.perf_counter() - start
+    assert len(index) == args.routes + args.routes6
+    # Built again, traced
+    tracemalloc.start()
+    try:
+        traced = build(tables)
+        size = tracemalloc.get_traced_memory()[0]
+        del traced
+    finally:
+        tracemalloc.stop()
+    print('    build : {:6.2f} s, {:.1f} MB, {:.0f} bytes per route'.format(
+        build_time, megabytes(size), size / len(index)))
+
+    addresses = [str(netaddr.IPAddress(rng.getrandbits(32), version=4))
+                 for _ in range(args.lookups)]
+    start = time.perf_counter()
+    found = [index.lookup(address) for address in addresses]
+    lookup_time = time.perf_counter() - start
+    print('    lookup: {:6.2f} s, {:5.1f} us per lookup, {} found'.format(
+        lookup_time, lookup_time / args.lookups * 1e6,
+        sum(1 for route in found if route)))
+
+    start = time.perf_counter()
+    for address, route in zip(addresses[:args.scans], found):
+        assert scan(tables[0], address) == (route[0] if route else None), \
+            'index and scan differ'
+    scan_time = (time.perf_counter() - start) / max(args.scans, 1)
+    print('    scan  : {:6.2f} s per lookup, {:.0f}x the index'.format(
+        scan_time, scan_time / (lookup_time / args.lookups)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+'''Benchmark of schema validation, per schema
+
+Validates parsed outputs against the schema of their parser:
+
+    * engine: Schema(schema).validate(parsed), as MetaParser.parse does
+    * compile: compile_schema(schema), done once per schema
+    * compiled: CompiledSchema.validate(parsed)
+    * sampled: SampledValidation(fraction).validate(schema, parsed), mean
+      cost per call
+
+The parsed outputs are golden outputs of the unit tests, and a synthetic
+iosxe 'show ip bgp' full table parsed by ShowIpBgp. The engine column
+needs genie.metaparser, it is skipped otherwise.
+
+    python benchmarks/bench_schema_validate.py [-prefixes 20000]
+        [-fraction 0.01]
+'''
+
+import io
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.metaparser.util.schemaengine import Schema
+from genie.libs.parser.utils.schema_compiler import compile_schema, \
+                                                   SampledValidation
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail, ShowIpBgp
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+from genie.libs.parser.iosxe.tests import test_show_bgp as iosxe_bgp, \
+                                          test_show_interface
+from genie.libs.parser.nxos.tests import test_show_bgp as nxos_bgp
+
+from bench_stream_parse import write_table
+
+PARSERS = [('iosxe ShowBgpAllDetail', ShowBgpAllDetail,
+            iosxe_bgp.test_show_bgp_all_detail.golden_parsed_output1),
+           ('nxos ShowBgpVrfAllAll', ShowBgpVrfAllAll,
+            nxos_bgp.test_show_bgp_vrf_all_all.golden_parsed_output3),
+           ('iosxe ShowInterfaces', ShowInterfaces,
+            test_show_interface.TestShowInterfaces.golden_parsed_output2)]
+
+
+def timed(function, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+def count_keys(parsed):
+    if not isinstance(parsed, dict):
+        return 0
+    return len(parsed) + sum(count_keys(value) for value in parsed.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-prefixes', type=int, default=20000)
+    parser.add_argument('-fraction', type=float, default=0.01)
+    parser.add_argument('-repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    table = io.StringIO()
+    write_table(table, args.prefixes)
+    parsed = ShowIpBgp(device=Mock()).parse(output=table.getvalue())
+    parsers = PARSERS + [('iosxe ShowIpBgp {} prefixes'.format(
+        args.prefixes), ShowIpBgp, parsed)]
+
+    engine = hasattr(Schema, 'validate')
+    for title, parser_class, parsed in parsers:
+        schema = parser_class.schema
+        repeat = max(1, args.repeat * 1000 // count_keys(parsed))
+        start = time.perf_counter()
+        compiled = compile_schema(schema)
+        compile_time = time.perf_counter() - start
+        validation = SampledValidation(fraction=args.fraction)
+        print(title)
+        print('    keys              : {}'.format(count_keys(parsed)))
+        if engine:
+            engine_time = timed(lambda: Schema(schema).validate(parsed),
+                                repeat)
+            print('    engine            : {:.1f} us'.format(
+                engine_time * 1e6))
+        print('    compile           : {:.1f} us'.format(compile_time * 1e6))
+        compiled_time = timed(lambda: compiled.validate(parsed), repeat)
+        print('    compiled          : {:.1f} us{}'.format(
+            compiled_time * 1e6, ' ({:.0f}x)'.format(
+                engine_time / compiled_time) if engine else ''))
+        sampled_time = timed(lambda: validation.validate(schema, parsed),
+                             int(10 / args.fraction))
+        print('    sampled {:<10}: {:.1f} us'.format(
+            args.fraction, sampled_time * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+'''Benchmark of parse(output=...) against parse(output_stream=...)
+
+Writes a synthetic iosxe 'show ip bgp' full table to a temporary file, then
+parses it with ShowIpBgp:
+
+    * output: the file is read into one string, which cli() splits into a
+      list of lines
+    * output_stream: the file object is given to cli(), which reads it line
+      by line
+
+and reports the time and the peak of memory allocated while parsing, the
+parsed structure included. The peak is taken from a second run under
+tracemalloc, which slows parsing down a lot.
+
+    python benchmarks/bench_stream_parse.py [-prefixes 50000]
+'''
+
+import os
+import time
+import argparse
+import tempfile
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe.show_bgp import ShowIpBgp
+
+HEADER = '''\
+BGP table version is 1841, local router ID is 10.169.197.254
+Status codes: s suppressed, d damped, h history, * valid, > best, i - internal,
+              r RIB-failure, S Stale, m multipath, b backup-path, f RT-Filter,
+              x best-external, a additional-path, c RIB-compressed,
+Origin codes: i - IGP, e - EGP, ? - incomplete
+RPKI validation codes: V valid, I invalid, N Not found
+
+     Network          Next Hop            Metric LocPrf Weight Path
+'''
+
+# *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 e
+ROUTE = '*>i {:<16} {:<16}     2219    100      0 200 33299 51178 {} e\n'
+
+
+def write_table(f, prefixes):
+    f.write(HEADER)
+    for i in range(prefixes):
+        prefix = '10.{}.{}.0/24'.format(i >> 8 & 255, i & 255)
+        if i >> 16:
+            prefix = '{}.{}'.format(10 + (i >> 16), prefix[3:])
+        f.write(ROUTE.format(prefix, '10.4.1.{}'.format(i % 250 + 1),
+                             i % 65000))
+
+
+def measure(function):
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-prefixes', type=int, default=50000)
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.txt')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            write_table(f, args.prefixes)
+
+        def from_string():
+            with open(path) as f:
+                output = f.read()
+            return ShowIpBgp(device=Mock()).parse(output=output)
+
+        def from_stream():
+            with open(path) as f:
+                return ShowIpBgp(device=Mock()).parse(output_stream=f)
+
+        str_time, str_peak, str_result = measure(from_string)
+        stream_time, stream_peak, stream_result = measure(from_stream)
+        assert str_result == stream_result
+
+        print('prefixes            : {}'.format(args.prefixes))
+        print('output size         : {:.1f} MB'.format(
+            os.path.getsize(path) / 1e6))
+        print('output=             : {:.2f} s, peak {:.1f} MB'.format(
+            str_time, str_peak / 1e6))
+        print('output_stream=      : {:.2f} s, peak {:.1f} MB'.format(
+            stream_time, stream_peak / 1e6))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
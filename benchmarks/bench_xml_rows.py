@@ -0,0 +1,153 @@
+'''Memory benchmark of streaming an NX-OS "| xml" reply row by row
+
+Builds a synthetic 'show bgp sessions | xml' reply of -neighbors neighbors,
+in the format of the golden outputs of nxos ShowBgpSessions, and measures
+the peak of the memory allocated (tracemalloc, in a second run) and the
+time taken by:
+
+    * tree: ET.fromstring() of the reply, which the xml() of the NX-OS
+      parsers walked before
+    * rows: iter_xml_rows() over the reply
+    * stream: iter_xml_rows() over the reply read line by line, as from
+      the device, the reply never held whole
+    * xml(): ShowBgpSessions.xml() of the reply, parsed output included
+
+The reply itself, a str built before, is not counted.
+
+    python benchmarks/bench_xml_rows.py [-neighbors 100000]
+'''
+
+import time
+import argparse
+import tracemalloc
+import xml.etree.ElementTree as ET
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.xml_rows import iter_xml_rows
+from genie.libs.parser.nxos.show_bgp import ShowBgpSessions
+
+from bench_records import megabytes
+
+HEADER = '''\
+<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns="http://www.cisco.com/nxos:1.0:bgp" \
+xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <nf:data>
+  <show>
+   <bgp>
+    <sessions>
+     <__XML__OPT_Cmd_show_bgp_sessions_cmd_vrf>
+      <__XML__OPT_Cmd_show_bgp_sessions_cmd_vrf>
+       <vrf>
+        <__XML__OPT_Cmd_show_bgp_sessions_cmd_vrf>
+         <__XML__PARAM__vrf-name>
+          <__XML__value>all</__XML__value>
+         </__XML__PARAM__vrf-name>
+        </__XML__OPT_Cmd_show_bgp_sessions_cmd_vrf>
+       </vrf>
+      </__XML__OPT_Cmd_show_bgp_sessions_cmd_vrf>
+      <__XML__OPT_Cmd_show_bgp_sessions_cmd___readonly__>
+       <__readonly__>
+        <totalpeers>{neighbors}</totalpeers>
+        <totalestablishedpeers>{neighbors}</totalestablishedpeers>
+        <localas>100</localas>
+        <TABLE_vrf>
+         <ROW_vrf>
+          <vrf-name-out>default</vrf-name-out>
+          <local-as>100</local-as>
+          <vrfpeers>{neighbors}</vrfpeers>
+          <vrfestablishedpeers>{neighbors}</vrfestablishedpeers>
+          <router-id>10.1.1.1</router-id>
+          <TABLE_neighbor>
+'''
+
+NEIGHBOR = '''\
+           <ROW_neighbor>
+            <neighbor-id>10.{a}.{b}.1</neighbor-id>
+            <connectionsdropped>0</connectionsdropped>
+            <remoteas>{asn}</remoteas>
+            <lastflap>PT1H4M41S</lastflap>
+            <lastread>PT47S</lastread>
+            <lastwrite>PT15S</lastwrite>
+            <state>Established</state>
+            <localport>179</localport>
+            <remoteport>{port}</remoteport>
+            <notificationssent>0</notificationssent>
+            <notificationsreceived>0</notificationsreceived>
+           </ROW_neighbor>
+'''
+
+TRAILER = '''\
+          </TABLE_neighbor>
+         </ROW_vrf>
+        </TABLE_vrf>
+       </__readonly__>
+      </__XML__OPT_Cmd_show_bgp_sessions_cmd___readonly__>
+     </__XML__OPT_Cmd_show_bgp_sessions_cmd_vrf>
+    </sessions>
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>
+'''
+
+
+def sessions_lines(neighbors):
+    yield HEADER.format(neighbors=neighbors)
+    for n in range(neighbors):
+        yield NEIGHBOR.format(a=n >> 8 & 255, b=n & 255, asn=65000 + n % 1000,
+                              port=1024 + n % 60000)
+    yield TRAILER
+
+
+def measure(function):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    try:
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-neighbors', type=int, default=100000)
+    args = parser.parse_args()
+
+    output = ''.join(sessions_lines(args.neighbors))
+    fields = ShowBgpSessions.xml_fields
+    print('{} neighbors, {:.1f} MB of XML'.format(
+        args.neighbors, megabytes(len(output))))
+
+    def tree():
+        root = ET.fromstring(output.replace(']]>]]>', ''))
+        return sum(1 for element in root.iter()
+                   if element.tag.endswith('ROW_neighbor'))
+
+    def rows():
+        return sum(1 for row in iter_xml_rows(fields, output=output)
+                   if row.tag == 'ROW_neighbor')
+
+    def stream():
+        return sum(1 for row in iter_xml_rows(
+            fields, output_stream=sessions_lines(args.neighbors))
+            if row.tag == 'ROW_neighbor')
+
+    def xml():
+        parsed = ShowBgpSessions(device=Mock()).xml(vrf='all', output=output)
+        return len(parsed['vrf']['default']['neighbor'])
+
+    for title, function in (('tree', tree), ('rows', rows),
+                            ('stream', stream), ('xml()', xml)):
+        count, peak, elapsed = measure(function)
+        print('    {:7}: peak {:7.2f} MB, {:6.2f} s, {} neighbors'.format(
+            title, megabytes(peak), elapsed, count))
+
+
+if __name__ == '__main__':
+    main()
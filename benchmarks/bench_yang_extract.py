@@ -0,0 +1,143 @@
+'''Benchmark of the YangExtractor of BgpOpenconfigYang on large replies
+
+Builds synthetic OpenConfig BGP replies of -neighbors neighbors, each with
+two afi-safis, in the format of the golden outputs of BgpOpenconfigYang,
+then doubled in size -steps times, and measures for each:
+
+    * tree: extract() of the reply parsed by ET.fromstring(), as yang()
+      does on the data_ele of the NETCONF reply
+    * stream: extract() of the reply read line by line, never held whole,
+      with the peak of the memory allocated (tracemalloc, in a second run)
+
+The time per neighbor is expected to stay the same as the reply grows,
+the reply being read in one pass. The outputs of both are checked equal.
+
+    python benchmarks/bench_yang_extract.py [-neighbors 5000] [-steps 3]
+'''
+
+import time
+import argparse
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+
+from bench_records import megabytes
+
+HEADER = '''\
+<data>
+ <bgp xmlns="http://openconfig.net/yang/bgp">
+  <global>
+   <state>
+    <as>333</as>
+    <router-id>10.1.1.1</router-id>
+    <total-paths>{paths}</total-paths>
+    <total-prefixes>{paths}</total-prefixes>
+   </state>
+  </global>
+  <neighbors>
+'''
+
+AFI_SAFI = '''\
+     <afi-safi xmlns="http://openconfig.net/yang/bgp-multiprotocol">
+      <afi-safi-name>{name}</afi-safi-name>
+      <config><afi-safi-name>{name}</afi-safi-name></config>
+      <state>
+       <afi-safi-name>{name}</afi-safi-name>
+       <enabled>true</enabled>
+       <active>true</active>
+       <prefixes><received>{n}</received><sent>{n}</sent></prefixes>
+      </state>
+      <graceful-restart><state><enabled>false</enabled></state>
+      </graceful-restart>
+     </afi-safi>
+'''
+
+NEIGHBOR = '''\
+   <neighbor>
+    <config><neighbor-address>10.{a}.{b}.1</neighbor-address></config>
+    <state>
+     <description>peer {n}</description>
+     <peer-as>{asn}</peer-as>
+     <remove-private-as>false</remove-private-as>
+     <send-community>BOTH</send-community>
+     <session-state>ESTABLISHED</session-state>
+     <queues><input>0</input><output>0</output></queues>
+     <messages>
+      <sent><UPDATE>{n}</UPDATE><NOTIFICATION>0</NOTIFICATION></sent>
+      <received><UPDATE>{n}</UPDATE><NOTIFICATION>0</NOTIFICATION></received>
+     </messages>
+    </state>
+    <timers><state><hold-time>180</hold-time>
+     <keepalive-interval>60</keepalive-interval></state></timers>
+    <transport><state><local-address>10.1.1.1</local-address>
+     <passive-mode>false</passive-mode></state></transport>
+    <afi-safis>
+{afi_safis}    </afi-safis>
+    <neighbor-address>10.{a}.{b}.1</neighbor-address>
+   </neighbor>
+'''
+
+TRAILER = '''\
+  </neighbors>
+ </bgp>
+</data>
+'''
+
+
+def bgp_lines(neighbors):
+    yield HEADER.format(paths=neighbors * 2)
+    for n in range(neighbors):
+        afi_safis = ''.join(AFI_SAFI.format(name=name, n=n)
+                            for name in ('IPV4_UNICAST', 'IPV6_UNICAST'))
+        yield NEIGHBOR.format(a=n >> 8 & 255, b=n & 255, n=n,
+                              asn=65000 + n % 1000, afi_safis=afi_safis)
+    yield TRAILER
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('-neighbors', type=int, default=5000)
+    parser.add_argument('-steps', type=int, default=3)
+    args = parser.parse_args()
+
+    extractor = BgpOpenconfigYang.extractor
+    neighbors = args.neighbors
+    for step in range(args.steps):
+        output = ''.join(bgp_lines(neighbors))
+        print('{} neighbors, {:.1f} MB of XML'.format(
+            neighbors, megabytes(len(output))))
+
+        start = time.perf_counter()
+        element = ET.fromstring(output)
+        parse_time = time.perf_counter() - start
+        start = time.perf_counter()
+        tree = extractor.extract(element=element)
+        tree_time = time.perf_counter() - start
+        del element
+
+        start = time.perf_counter()
+        stream = extractor.extract(output_stream=bgp_lines(neighbors))
+        stream_time = time.perf_counter() - start
+        assert stream == tree, 'stream and tree outputs differ'
+        assert len(tree['vrf']['default']['neighbor']) == neighbors
+        tracemalloc.start()
+        try:
+            extractor.extract(output_stream=bgp_lines(neighbors))
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        print('    tree  : {:6.2f} s ({:.2f} s of ET.fromstring), '
+              '{:5.1f} us per neighbor'.format(
+                  parse_time + tree_time, parse_time,
+                  tree_time / neighbors * 1e6))
+        print('    stream: {:6.2f} s, {:5.1f} us per neighbor, '
+              'peak {:.1f} MB'.format(stream_time,
+                                      stream_time / neighbors * 1e6,
+                                      megabytes(peak)))
+        neighbors *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -11,6 +11,7 @@ import itertools
 import importlib
 
 from genie.metaparser import MetaParser
+from genie.libs.parser.utils.parser_index import write_index
 
 IGNORE_DIR = ['.git', '__pycache__', 'template', 'tests']
 IGNORE_FILE = ['__init__.py', 'base.py', 'utils.py']
@@ -178,6 +179,12 @@ if __name__ == '__main__':
                         type=str,
                         default=None,
                         help='Location to save the output file')
+    parser.add_argument('-index_location',
+                        metavar='FILE',
+                        type=str,
+                        default=None,
+                        help='Location to save the compact parser index, '
+                             'defaults to the output file with .idx suffix')
     custom_args = parser.parse_known_args()[0]
 
     apiDoc = CreateApiDoc(custom_args.datafile)
@@ -188,3 +195,8 @@ if __name__ == '__main__':
     os.makedirs(os.path.dirname(custom_args.save_location), exist_ok=True)
     with open(custom_args.save_location, 'w+') as f:
         f.write(output)
+
+    # Compact index used by get_parser, without the doc and schema
+    index_location = custom_args.index_location or \
+        os.path.splitext(custom_args.save_location)[0] + '.idx'
+    write_index(custom_args.save_location, index_location)
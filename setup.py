@@ -106,7 +106,7 @@ setup(
 
     # additional package data files that goes into the package itself
     package_data = {
-            '': ['*.json'],
+            '': ['*.json', '*.idx'],
     },
 
     # console entry point
@@ -114,6 +114,12 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.regex import LazyRegex
+from genie.libs.parser.utils.stream import iter_lines, IncrementalParser
+from genie.libs.parser.utils.records import CompactParser
+from genie.libs.parser.utils.interning import interned
+from genie.libs.parser.utils.path_store import SharedPathParser, \
+    open_path
 
 
 # ============================================
@@ -192,7 +198,7 @@ class ShowBgpSchema(MetaParser):
 #   * 'show ip bgp {address_family} rd {rd}'
 #   * 'show ip bgp {address_family} vrf {vrf}'
 # ============================================
-class ShowBgpSuperParser(ShowBgpSchema):
+class ShowBgpSuperParser(ShowBgpSchema, IncrementalParser):
 
     ''' Super Parser for:
         * 'show bgp all'
@@ -207,7 +213,67 @@ class ShowBgpSuperParser(ShowBgpSchema):
         * 'show ip bgp {address_family} vrf {vrf}'
     '''
 
-    def cli(self, address_family='', vrf='', output=None):
+    # For address family: IPv4 Unicast
+    p1 = LazyRegex(r'^\s*For +address +family:'
+                   r' +(?P<address_family>[\S\s]+)$')
+
+    # BGP table version is 25, Local Router ID is 10.186.101.1
+    p2 = LazyRegex(r'^\s*BGP +table +version +is'
+                   r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+                   r' +ID +is +(?P<local_router_id>(\S+))$')
+
+    #     Network          Next Hop            Metric LocPrf Weight Path
+    # *>   [5][65535:1][0][24][10.1.1.0]/17
+    # *>  100:2051:VEID-2:Blk-1/136
+    p3_1 = LazyRegex(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+                     r'(?P<path_type>(i|e|c|l|a|r|I))?'
+                     r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-]+)'
+                     r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+
+    #     Network          Next Hop            Metric LocPrf Weight Path
+    # * i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
+    #                      0.0.0.0                  0         32768 ?
+    # *>                    0.0.0.0                 0         32768 ?
+    # r>                    0.0.0.0                 0         32768 ?
+    # *m                    0.0.0.0                 0         32768 ?
+    # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
+    p3_2 = LazyRegex(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
+                     r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
+                     r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+                     r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
+                     r'(?P<termination>[\s\S]+)$')
+
+    # Network            Next Hop            Metric     LocPrf     Weight Path
+    # *    10.36.3.0/24       10.36.3.254                0             0 65530 ?
+    # *>   10.1.1.0/24     0.0.0.0                  0         32768 ?
+    # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
+    # *m 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
+    # *>i 615:11:11::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
+    # *>  100:2051:VEID-2:Blk-1/136
+    # *>i10.1.1.0/24   0.0.0.0                   0    100      0 1234 60000 ?
+    p4 = LazyRegex(r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
+                   r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
+                   r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
+                   r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
+                   r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
+                   r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
+                   r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
+
+    # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
+    p5 = LazyRegex(r'^\s*AF-Private +Import +to +Address-Family:'
+                   r' +(?P<af_private_import_to_address_family>[\s\S]+),'
+                   r' +Pfx +Count/Limit:'
+                   r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$')
+
+    # Route Distinguisher: 200:1
+    # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
+    p6 = LazyRegex(r'^\s*Route +Distinguisher *: '
+                   r'+(?P<route_distinguisher>(\S+))'
+                   r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+                   r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+
+    def cli(self, address_family='', vrf='', output=None,
+            output_stream=None):
 
         # Init dictionary
         route_dict = {}
@@ -223,77 +289,18 @@ class ShowBgpSuperParser(ShowBgpSchema):
         prefix = ""
         origin_codes_info = origin_codes_data = ""
 
-        # For address family: IPv4 Unicast
-        p1 = re.compile(r'^\s*For +address +family:'
-                        r' +(?P<address_family>[\S\s]+)$')
-
-        # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                        r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                        r' +ID +is +(?P<local_router_id>(\S+))$')
-
-        #     Network          Next Hop            Metric LocPrf Weight Path
-        # *>   [5][65535:1][0][24][10.1.1.0]/17
-        # *>  100:2051:VEID-2:Blk-1/136
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?'
-                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-]+)'
-                          r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-
-        #     Network          Next Hop            Metric LocPrf Weight Path
-        # * i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
-        #                      0.0.0.0                  0         32768 ?
-        # *>                    0.0.0.0                 0         32768 ?
-        # r>                    0.0.0.0                 0         32768 ?
-        # *m                    0.0.0.0                 0         32768 ?
-        # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
-                          r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                          r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
-                          r'(?P<termination>[\s\S]+)$')
-
-        # Network            Next Hop            Metric     LocPrf     Weight Path
-        # *    10.36.3.0/24       10.36.3.254                0             0 65530 ?
-        # *>   10.1.1.0/24     0.0.0.0                  0         32768 ?
-        # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
-        # *m 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
-        # *>i 615:11:11::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-        # *>  100:2051:VEID-2:Blk-1/136
-        # *>i10.1.1.0/24   0.0.0.0                   0    100      0 1234 60000 ?
-        p4 = re.compile(r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
-                        r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
-                        r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
-                        r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
-                        r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
-                        r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
-                        r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
-
-        # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-        p5 = re.compile(r'^\s*AF-Private +Import +to +Address-Family:'
-                        r' +(?P<af_private_import_to_address_family>[\s\S]+),'
-                        r' +Pfx +Count/Limit:'
-                        r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$')
-
-        # Route Distinguisher: 200:1
-        # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-        p6 = re.compile(r'^\s*Route +Distinguisher *: '
-                        r'+(?P<route_distinguisher>(\S+))'
-                        r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                        r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
-
-        for line in output.splitlines():
+        for line in iter_lines(output, output_stream):
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 address_family = str(m.groupdict()['address_family']).lower()
                 original_address_family = address_family
                 continue
 
             # BGP table version is 25, Local Router ID is 10.186.101.1
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
@@ -302,7 +309,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             #     Network          Next Hop            Metric LocPrf Weight Path
             # *>   [5][65535:1][0][24][10.1.1.0]/17
             # *>  100:2051:VEID-2:Blk-1/136
-            m = p3_1.match(line)
+            m = self.p3_1.match(line)
             if m:
                 # Get keys
                 if m.groupdict()['status_codes']:
@@ -325,7 +332,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             #                      0.0.0.0                  0         32768 ?
             # *>                    0.0.0.0                 0         32768 ?
             # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-            m = p3_2.match(line)
+            m = self.p3_2.match(line)
             if m:
                 # Get keys
                 path_type = ""
@@ -411,7 +418,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
             # *>i 615:11:11::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
             # *>  100:2051:VEID-2:Blk-1/136
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 path_type = ""
                 path_data = ""
@@ -489,7 +496,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
                 continue
 
             # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 af_private_import_to_address_family = m.groupdict()['af_private_import_to_address_family']
                 pfx_count = int(m.groupdict()['pfx_count'])
@@ -518,7 +525,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
             # Route Distinguisher: 200:1
             # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -553,7 +560,6 @@ class ShowBgpSuperParser(ShowBgpSchema):
                     route_dict['vrf'][vrf]['address_family'][new_address_family]['vrf_route_identifier'] = \
                         str(m.groupdict()['vrf_router_id'])
 
-
                 # Reset address_family key and af_dict for use in other regex
                 address_family = new_address_family
                 af_dict = route_dict['vrf'][vrf]['address_family'][address_family]
@@ -584,11 +590,11 @@ class ShowBgpAll(ShowBgpSuperParser, ShowBgpSchema):
                    ]
     exclude = ['bgp_table_version']
 
-    def cli(self, address_family='', output=None):
+    def cli(self, address_family='', output=None, output_stream=None):
         ret_dict = {}
         restricted_list = ['ipv4 unicast', 'ipv6 unicast']
 
-        if output is None:
+        if output is None and output_stream is None:
             # Build command
             if address_family:
                 if address_family not in restricted_list:
@@ -603,7 +609,8 @@ class ShowBgpAll(ShowBgpSuperParser, ShowBgpSchema):
             show_output = output
 
         # Call super
-        return super().cli(output=show_output, address_family=address_family)
+        return super().cli(output=show_output, output_stream=output_stream,
+                           address_family=address_family)
 
 
 # ======================================
@@ -622,9 +629,9 @@ class ShowIpBgpAll(ShowBgpSuperParser, ShowBgpSchema):
                    'show ip bgp all',
                    ]
 
-    def cli(self, address_family='', output=None):
+    def cli(self, address_family='', output=None, output_stream=None):
 
-        if output is None:
+        if output is None and output_stream is None:
             # Build command
             if address_family:
                 cmd = self.cli_command[0].format(address_family=address_family)
@@ -636,7 +643,8 @@ class ShowIpBgpAll(ShowBgpSuperParser, ShowBgpSchema):
             show_output = output
 
         # Call super
-        return super().cli(output=show_output, address_family=address_family)
+        return super().cli(output=show_output, output_stream=output_stream,
+                           address_family=address_family)
 
 
 # =============================================
@@ -655,9 +663,10 @@ class ShowBgp(ShowBgpSuperParser, ShowBgpSchema):
                    'show bgp {address_family} rd {rd}',
                    ]
 
-    def cli(self, address_family='', rd='', vrf='', output=None):
+    def cli(self, address_family='', rd='', vrf='', output=None,
+            output_stream=None):
 
-        if output is None:
+        if output is None and output_stream is None:
             # Build command
             if address_family and vrf:
                 cmd = self.cli_command[0].format(address_family=address_family,
@@ -671,7 +680,8 @@ class ShowBgp(ShowBgpSuperParser, ShowBgpSchema):
             show_output = output
 
         # Call super
-        return super().cli(output=show_output, vrf=vrf,
+        return super().cli(output=show_output,
+                           output_stream=output_stream, vrf=vrf,
                            address_family=address_family)
 
 
@@ -697,9 +707,10 @@ class ShowIpBgp(ShowBgpSuperParser, ShowBgpSchema):
                    'show ip bgp',
                    ]
 
-    def cli(self, address_family='', rd='', vrf='', output=None):
+    def cli(self, address_family='', rd='', vrf='', output=None,
+            output_stream=None):
 
-        if output is None:
+        if output is None and output_stream is None:
             # Build command
             if address_family and vrf:
                 cmd = self.cli_command[0].format(address_family=address_family,
@@ -717,7 +728,8 @@ class ShowIpBgp(ShowBgpSuperParser, ShowBgpSchema):
             show_output = output
 
         # Call super
-        return super().cli(output=show_output, vrf=vrf,
+        return super().cli(output=show_output,
+                           output_stream=output_stream, vrf=vrf,
                            address_family=address_family)
 
 
@@ -835,6 +847,154 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         * 'show ip bgp {address_family} rd {rd} detail'
     '''
 
+    # For address family: IPv4 Unicast
+    # For address family: L2VPN E-VPN
+    p1 = LazyRegex(r'^\s*For +address +family:'
+                    ' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
+
+    # Paths: (1 available, best #1, table default)
+    # Paths: (1 available, best #1, table VRF1)
+    # Paths: (1 available, best #1, no table)
+    # Paths: (1 available, best #1, table default, RIB-failure(17))
+    p2 = LazyRegex(r'^\s*Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
+                   r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
+                   r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)')
+
+    # Route Distinguisher: 100:100 (default for vrf VRF1)
+    # Route Distinguisher: 65535:1 (default for vrf evpn1)
+    # Route Distinguisher: 65109:3051
+    p2_1 = LazyRegex(r'^\s*Route +Distinguisher:'
+                     ' +(?P<route_distinguisher>[0-9\:]+)'
+                     '(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$')
+
+    # BGP routing table entry for 10.4.1.1/32, version 4
+    # BGP routing table entry for [100:100]2001:11:11::11/128, version 2
+    # BGP routing table entry for 100:100:10.229.11.11/32, version 2
+    # BGP routing table entry for 2001:DB8:1:1::/64, version 5
+    # BGP routing table entry for 2001:2:2:2::2/128, version 2
+    # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
+    p3_1 = LazyRegex(r'^\s*BGP +routing +table +entry +for +'
+                     '(\[[0-9]+\])?((?P<route_distinguisher>((\[[0-9]+'
+                     '[\:][0-9]+\])|([0-9]+[\:][0-9]+[\:]))))?(\['
+                     '[0-9]+\])?(\[[0-9]+\])?(?P<router_id>((\[[0-9]+'
+                     '[\.][0-9]+[\.][0-9]+[\.][0-9]+\][\/][0-9]+)|'
+                     '([0-9]+[\.][0-9]+[\.][0-9]+[\.][0-9]+[\/][0-9]+)'
+                     '|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
+                     '[\:][\:][a-zA-Z0-9]+[\/][0-9]+)|([a-zA-Z0-9]+'
+                     '[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]'
+                     '+[\:][\:][\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+                     '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+                     '[\:][0-9]+[\/][0-9]+)))\, +version +'
+                     '(?P<prefix_table_version>[0-9]+)$')
+
+    # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
+    p3_2 = LazyRegex(r'^\s*BGP +routing +table +entry +for'
+                      ' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
+                      ' +version +(?P<version>(\d+))$')
+
+    # 10.1.1.2 from 10.1.1.2 (10.1.1.2)
+    # 10.16.2.2 (metric 11) (via default) from 10.16.2.2 (10.16.2.2)
+    # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
+    # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
+    # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
+    p4 = LazyRegex(r'^\s*((?P<nexthop>[a-zA-Z0-9\.\:]+)'
+                    '(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
+                    '( +\((?P<inaccessible>inaccessible)\)))?'
+                    '( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
+                    'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
+                    ' +\((?P<originator>[0-9\.]+)\))$')
+
+    # Origin incomplete, metric 0, localpref 100, valid, internal
+    # Origin incomplete, metric 0, localpref 100, valid, internal, best
+    # Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
+    p5 = LazyRegex(r'^\s*Origin +(?P<origin>[a-zA-Z]+),'
+                    '(?: +metric +(?P<metric>[0-9]+),?)?'
+                    '(?: +localpref +(?P<locprf>[0-9]+),?)?'
+                    '(?: +weight +(?P<weight>[0-9]+),?)?'
+                    '(?: +(?P<valid>(valid),?))?'
+                    '(?: +(?P<sourced>(sourced),?))?'
+                    '(?: +(?P<state>(internal|external|local),?))?'
+                    '(?: +(?P<best>(best)))?$')
+
+    # Advertised to update-groups:
+    p6_1 = LazyRegex(r'^\s*Advertised +to +update-groups *:$')
+
+    # Not advertised to any peer
+    p6_2 = LazyRegex(r'^\s*Not +advertised +to +any +peer$')
+
+    # 3
+    # 38         44         45
+    p6_3 = LazyRegex(r'^\s*           (?P<group1>(\d+))'
+                      '(?: +(?P<group2>(\d+)) +(?P<group3>(\d+)))?$')
+
+    # Refresh Epoch 1
+    p7 = LazyRegex(r'^\s*Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$')
+
+    # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7A13.E9BF
+    p8 = LazyRegex(r'^\s*Extended +Community\:'
+                    ' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
+                    '(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$')
+
+    # Extended Community: SoO:65109:999 RT:65109:50
+    # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
+    # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
+    p8_2 = LazyRegex(r'^\s*Extended +Community *:'
+                      ' +(?P<ext_community>([a-zA-Z0-9\-\:\s]+))'
+                      '(?: *, +(?P<recursive>(recursive-via-connected)))?$')
+
+    # Community: 62000:1
+    p8_3 = LazyRegex(r'^\s*Community: +(?P<community>(\S+))$')
+
+    # AGI version(0), VE Block Size(10) Label Base(16)
+    p8_4 = LazyRegex(r'^\s*AGI +version\((?P<agi_version>(\d+))\),'
+                      ' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
+                      ' +Label +Base\((?P<label_base>(\d+))\)$')
+
+    # Originator: 192.168.165.220, Cluster list: 0.0.0.61
+    p8_5 = LazyRegex(r'^\s*Originator: +(?P<originator>(\S+)),'
+                      ' +Cluster +list: +(?P<cluster_list>(\S+))$')
+
+    # rx pathid: 0, tx pathid: 0
+    p9 = LazyRegex(r'^\s*rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
+                    ' +tx +pathid\:'
+                    ' +(?P<transfer_pathid>[0-9x]+)$')
+
+    # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
+    p10 = LazyRegex(r'^\s*EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,'
+                     ' +Gateway +Address\: +'
+                     '(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,'
+                     ' +local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)'
+                     '\, +[L|l]abel +(?P<label>[0-9]+)$')
+
+    # Local vxlan vtep:
+    p11 = LazyRegex(r'^\s*Local +vxlan +vtep\:$')
+
+    # bdi:BDI200
+    p12 = LazyRegex(r'^\s*bdi\:(?P<bdi>[A-Z0-9]+)$')
+
+    # vrf:evpn1, vni:30000
+    p13 = LazyRegex(r'^\s*vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
+                     ' +vni\:(?P<vni>[0-9]+)$')
+
+    # local router mac:001E.7A13.E9BF
+    p14 = LazyRegex(r'^\s*local +router +mac\:'
+                     '(?P<local_router_mac>[a-zA-Z0-9\.]+)$')
+
+    # encap:8
+    p15 = LazyRegex(r'^\s*encap\:(?P<encap>[0-9]+)$')
+
+    # vtep-ip:10.21.33.33
+    p16 = LazyRegex(r'^\s*vtep-ip\:(?P<vtep_ip>[0-9\.]+)$')
+
+    # Local
+    # 65530
+    # Local, imported path from base
+    # 200 33299 51178 47751 {27016}
+    # 200 33299 51178 47751 {27016}, imported path from 200:2:10.1.1.0/24 (global)
+    # 400 33299 51178 47751 {27016}, imported path from [400:1]646:22:22:4::/64 (VRF2)
+    # 62000, (Received from a RR-client)
+    p17 = LazyRegex(r'^\s*(?P<route_info>[a-zA-Z0-9\-\.\,\{\}\s\(\)\.\/\:\[\]]+)$')
+
     def cli(self, address_family='', vrf='', rd='', output=None):
 
         # Init dictionary
@@ -848,162 +1008,13 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         route_info = ''
         refresh_epoch = None
         cmd_vrf = vrf if vrf else None
-        # For address family: IPv4 Unicast
-        # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^\s*For +address +family:'
-                         ' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
-
-        # Paths: (1 available, best #1, table default)
-        # Paths: (1 available, best #1, table VRF1)
-        # Paths: (1 available, best #1, no table)
-        # Paths: (1 available, best #1, table default, RIB-failure(17))
-        p2 = re.compile(r'^\s*Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
-                        r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
-                        r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)')
-
-        # Route Distinguisher: 100:100 (default for vrf VRF1)
-        # Route Distinguisher: 65535:1 (default for vrf evpn1)
-        # Route Distinguisher: 65109:3051
-        p2_1 = re.compile(r'^\s*Route +Distinguisher:'
-                          ' +(?P<route_distinguisher>[0-9\:]+)'
-                          '(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$')
-
-        # BGP routing table entry for 10.4.1.1/32, version 4
-        # BGP routing table entry for [100:100]2001:11:11::11/128, version 2
-        # BGP routing table entry for 100:100:10.229.11.11/32, version 2
-        # BGP routing table entry for 2001:DB8:1:1::/64, version 5
-        # BGP routing table entry for 2001:2:2:2::2/128, version 2
-        # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
-        p3_1 = re.compile(r'^\s*BGP +routing +table +entry +for +'
-                         '(\[[0-9]+\])?((?P<route_distinguisher>((\[[0-9]+'
-                         '[\:][0-9]+\])|([0-9]+[\:][0-9]+[\:]))))?(\['
-                         '[0-9]+\])?(\[[0-9]+\])?(?P<router_id>((\[[0-9]+'
-                         '[\.][0-9]+[\.][0-9]+[\.][0-9]+\][\/][0-9]+)|'
-                         '([0-9]+[\.][0-9]+[\.][0-9]+[\.][0-9]+[\/][0-9]+)'
-                         '|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
-                         '[\:][\:][a-zA-Z0-9]+[\/][0-9]+)|([a-zA-Z0-9]+'
-                         '[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]'
-                         '+[\:][\:][\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                         '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                         '[\:][0-9]+[\/][0-9]+)))\, +version +'
-                         '(?P<prefix_table_version>[0-9]+)$')
-
-        # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
-        p3_2 = re.compile(r'^\s*BGP +routing +table +entry +for'
-                           ' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
-                           ' +version +(?P<version>(\d+))$')
-
-        # 10.1.1.2 from 10.1.1.2 (10.1.1.2)
-        # 10.16.2.2 (metric 11) (via default) from 10.16.2.2 (10.16.2.2)
-        # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
-        # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
-        # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
-        p4 = re.compile(r'^\s*((?P<nexthop>[a-zA-Z0-9\.\:]+)'
-                         '(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
-                         '( +\((?P<inaccessible>inaccessible)\)))?'
-                         '( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
-                         'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
-                         ' +\((?P<originator>[0-9\.]+)\))$')
-
-        # Origin incomplete, metric 0, localpref 100, valid, internal
-        # Origin incomplete, metric 0, localpref 100, valid, internal, best
-        # Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
-        p5 = re.compile(r'^\s*Origin +(?P<origin>[a-zA-Z]+),'
-                         '(?: +metric +(?P<metric>[0-9]+),?)?'
-                         '(?: +localpref +(?P<locprf>[0-9]+),?)?'
-                         '(?: +weight +(?P<weight>[0-9]+),?)?'
-                         '(?: +(?P<valid>(valid),?))?'
-                         '(?: +(?P<sourced>(sourced),?))?'
-                         '(?: +(?P<state>(internal|external|local),?))?'
-                         '(?: +(?P<best>(best)))?$')
-
-        # Advertised to update-groups:
-        p6_1 = re.compile(r'^\s*Advertised +to +update-groups *:$')
-
-
-        # Not advertised to any peer
-        p6_2 = re.compile(r'^\s*Not +advertised +to +any +peer$')
-
-        # 3
-        # 38         44         45
-        p6_3 = re.compile(r'^\s*           (?P<group1>(\d+))'
-                           '(?: +(?P<group2>(\d+)) +(?P<group3>(\d+)))?$')
-
-        # Refresh Epoch 1
-        p7 = re.compile(r'^\s*Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$')
-
-        # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7A13.E9BF
-        p8 = re.compile(r'^\s*Extended +Community\:'
-                         ' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
-                         '(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$')
-
-        # Extended Community: SoO:65109:999 RT:65109:50
-        # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
-        # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
-        p8_2 = re.compile(r'^\s*Extended +Community *:'
-                           ' +(?P<ext_community>([a-zA-Z0-9\-\:\s]+))'
-                           '(?: *, +(?P<recursive>(recursive-via-connected)))?$')
-
-        # Community: 62000:1
-        p8_3 = re.compile(r'^\s*Community: +(?P<community>(\S+))$')
-
-        # AGI version(0), VE Block Size(10) Label Base(16)
-        p8_4 = re.compile(r'^\s*AGI +version\((?P<agi_version>(\d+))\),'
-                           ' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
-                           ' +Label +Base\((?P<label_base>(\d+))\)$')
-
-        # Originator: 192.168.165.220, Cluster list: 0.0.0.61
-        p8_5 = re.compile(r'^\s*Originator: +(?P<originator>(\S+)),'
-                           ' +Cluster +list: +(?P<cluster_list>(\S+))$')
-
-        # rx pathid: 0, tx pathid: 0
-        p9 = re.compile(r'^\s*rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
-                         ' +tx +pathid\:'
-                         ' +(?P<transfer_pathid>[0-9x]+)$')
-
-        # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
-        p10 = re.compile(r'^\s*EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,'
-                          ' +Gateway +Address\: +'
-                          '(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,'
-                          ' +local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)'
-                          '\, +[L|l]abel +(?P<label>[0-9]+)$')
-
-        # Local vxlan vtep:
-        p11 = re.compile(r'^\s*Local +vxlan +vtep\:$')
-
-        # bdi:BDI200
-        p12 = re.compile(r'^\s*bdi\:(?P<bdi>[A-Z0-9]+)$')
-
-        # vrf:evpn1, vni:30000
-        p13 = re.compile(r'^\s*vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
-                          ' +vni\:(?P<vni>[0-9]+)$')
-
-        # local router mac:001E.7A13.E9BF
-        p14 = re.compile(r'^\s*local +router +mac\:'
-                          '(?P<local_router_mac>[a-zA-Z0-9\.]+)$')
-
-        # encap:8
-        p15 = re.compile(r'^\s*encap\:(?P<encap>[0-9]+)$')
-
-        # vtep-ip:10.21.33.33
-        p16 = re.compile(r'^\s*vtep-ip\:(?P<vtep_ip>[0-9\.]+)$')
-
-        # Local
-        # 65530
-        # Local, imported path from base
-        # 200 33299 51178 47751 {27016}
-        # 200 33299 51178 47751 {27016}, imported path from 200:2:10.1.1.0/24 (global)
-        # 400 33299 51178 47751 {27016}, imported path from [400:1]646:22:22:4::/64 (VRF2)
-        # 62000, (Received from a RR-client)
-        p17 = re.compile(r'^\s*(?P<route_info>[a-zA-Z0-9\-\.\,\{\}\s\(\)\.\/\:\[\]]+)$')
-
 
         for line in output.splitlines():
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
             # For address family: L2VPN E-VPN
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 index = 0
                 address_family = str(m.groupdict()['address_family']).lower()
@@ -1020,7 +1031,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Paths: (1 available, best #1, table VRF1)
             # Paths: (1 available, best #1, no table)
             # Paths: (1 available, best #1, table default, RIB-failure(17))
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 original_address_family = address_family.lower()
                 if 'instance' not in ret_dict:
@@ -1129,7 +1140,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
             # Route Distinguisher: 100:100 (default for vrf VRF1)
             # Route Distinguisher: 65535:1 (default for vrf evpn1)
-            m = p2_1.match(line)
+            m = self.p2_1.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 default_vrf = str(m.groupdict()['vrf_id'])
@@ -1152,7 +1163,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # BGP routing table entry for 2001:DB8:1:1::/64, version 5
             # BGP routing table entry for 2001:2:2:2::2/128, version 2
             # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
-            m = p3_1.match(line)
+            m = self.p3_1.match(line)
             if m:
                 update_group = 0
                 index = 0
@@ -1163,7 +1174,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
-            m = p3_2.match(line)
+            m = self.p3_2.match(line)
             if m:
                 update_group = 0
                 index = 0
@@ -1177,7 +1188,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
             # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
             # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 index += 1
                 nexthop = m.groupdict()['nexthop']
@@ -1193,12 +1204,10 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                     if index not in ret_dict['instance']['default']['vrf'][vrf]\
                         ['address_family'][new_address_family]['prefixes']\
                         [prefixes]['index']:
-                        ret_dict['instance']['default']['vrf'][vrf]\
-                        ['address_family'][new_address_family]['prefixes']\
-                                [prefixes]['index'][index] = {}
-                        subdict = ret_dict['instance']['default']['vrf'][vrf]\
+                        subdict = open_path(
+                            self, ret_dict['instance']['default']['vrf'][vrf]\
                             ['address_family'][new_address_family]['prefixes']\
-                            [prefixes]['index'][index]
+                            [prefixes]['index'], index)
 
                     subdict['next_hop'] = nexthop
                     subdict['gateway'] = gateway
@@ -1226,12 +1235,10 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                     if index not in ret_dict['instance']['default']['vrf']\
                         [vrf]['address_family'][address_family]['prefixes']\
                         [prefixes]['index']:
-                        ret_dict['instance']['default']['vrf'][vrf]\
-                        ['address_family'][address_family]['prefixes']\
-                                [prefixes]['index'][index] = {}
-                        subdict = ret_dict['instance']['default']['vrf'][vrf]\
+                        subdict = open_path(
+                            self, ret_dict['instance']['default']['vrf'][vrf]\
                             ['address_family'][address_family]['prefixes']\
-                            [prefixes]['index'][index]
+                            [prefixes]['index'], index)
 
                     subdict['next_hop'] = nexthop
                     subdict['gateway'] = gateway
@@ -1250,7 +1257,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Origin incomplete, metric 0, localpref 100, valid, internal
             # Origin incomplete, metric 0, localpref 100, valid, internal, best
             # Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 status_codes = ''
                 if m.groupdict()['locprf']:
@@ -1289,20 +1296,20 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Advertised to update-groups:
-            m = p6_1.match(line)
+            m = self.p6_1.match(line)
             if m:
                 next_line_update_group = True
                 continue
 
             # Not advertised to any peer
-            m = p6_2.match(line)
+            m = self.p6_2.match(line)
             if m:
                 next_line_update_group = False
                 continue
 
             # 3
             # # 38         44         45
-            m = p6_3.match(line)
+            m = self.p6_3.match(line)
             if m:
                 group = m.groupdict()
                 if group['group2'] and group['group3']:
@@ -1316,14 +1323,14 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Refresh Epoch 1
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 refresh_epoch_flag = True
                 refresh_epoch = int(m.groupdict()['refresh_epoch'])
                 continue
 
             # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7A13.E9BF
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 if 'evpn' not in subdict:
                     subdict['evpn'] = {}
@@ -1338,7 +1345,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Extended Community: SoO:65109:999 RT:65109:50
             # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
             # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
-            m = p8_2.match(line)
+            m = self.p8_2.match(line)
             if m:
                 ext_community = m.groupdict()['ext_community']
                 if 'evpn' in subdict:
@@ -1352,13 +1359,13 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Community: 62000:1
-            m = p8_3.match(line)
+            m = self.p8_3.match(line)
             if m:
                 subdict['community'] = m.groupdict()['community']
                 continue
 
             # AGI version(0), VE Block Size(10) Label Base(16)
-            m = p8_4.match(line)
+            m = self.p8_4.match(line)
             if m:
                 group = m.groupdict()
                 subdict['agi_version'] = int(group['agi_version'])
@@ -1367,14 +1374,14 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Originator: 192.168.165.220, Cluster list: 0.0.0.61
-            m = p8_5.match(line)
+            m = self.p8_5.match(line)
             if m:
                 group = m.groupdict()
                 subdict['cluster_list'] = group['cluster_list']
                 continue
 
             # rx pathid: 0, tx pathid: 0
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 recipient_pathid = str(m.groupdict()['recipient_pathid'])
                 transfer_pathid = str(m.groupdict()['transfer_pathid'])
@@ -1384,7 +1391,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 if 'evpn' not in subdict:
                     subdict['evpn'] = {}
@@ -1396,7 +1403,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Local vxlan vtep:
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 if 'local_vxlan_vtep' not in subdict:
                     subdict['local_vxlan_vtep'] = {}
@@ -1404,34 +1411,34 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # bdi:BDI200
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m and local_vxlan_vtep:
                 subdict['local_vxlan_vtep']['bdi'] = str(m.groupdict()['bdi'])
                 continue
 
             # vrf:evpn1, vni:30000
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m and local_vxlan_vtep:
                 subdict['local_vxlan_vtep']['vrf'] = str(m.groupdict()['vrf'])
                 subdict['local_vxlan_vtep']['vni'] = str(m.groupdict()['vni'])
                 continue
 
             # local router mac:001E.7A13.E9BF
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m and local_vxlan_vtep:
                 subdict['local_vxlan_vtep']['local_router_mac'] = \
                     str(m.groupdict()['local_router_mac'])
                 continue
 
             # encap:8
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m and local_vxlan_vtep:
                 subdict['local_vxlan_vtep']['encap'] = \
                     str(m.groupdict()['encap'])
                 continue
 
             # vtep-ip:10.21.33.33
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m and local_vxlan_vtep:
                 subdict['local_vxlan_vtep']['vtep_ip'] = \
                 str(m.groupdict()['vtep_ip'])
@@ -1444,7 +1451,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # 200 33299 51178 47751 {27016}, imported path from 200:2:10.1.1.0/24 (global)
             # 400 33299 51178 47751 {27016}, imported path from [400:1]646:22:22:4::/64 (VRF2)
             # 62000, (Received from a RR-client)
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m and refresh_epoch_flag:
                 route_info = str(m.groupdict()['route_info'])
                 refresh_epoch_flag = False
@@ -1459,7 +1466,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 #   * 'show bgp vrf {vrf} {route}'
 #   * 'show bgp {address_family} vrf {vrf} {route}'
 # =================================================
-class ShowBgpAllDetail(ShowBgpDetailSuperParser, ShowBgpAllDetailSchema):
+class ShowBgpAllDetail(ShowBgpDetailSuperParser, ShowBgpAllDetailSchema,
+                       CompactParser, SharedPathParser):
 
     ''' Parser for:
         * 'show bgp all detail'
@@ -1474,6 +1482,7 @@ class ShowBgpAllDetail(ShowBgpDetailSuperParser, ShowBgpAllDetailSchema):
     exclude = ['table_version', 'refresh_epoch', 'best_path', 'status_codes', 'transfer_pathid', 'paths']
 
 
+    @interned
     def cli(self, vrf='', route='', address_family='',output=None):
 
         if output is None:
@@ -2685,382 +2694,377 @@ class ShowBgpNeighborSuperParser(MetaParser):
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor}'
     '''
 
-    def cli(self, neighbor='', address_family='', vrf='', output=None):
+    # For address family: IPv4 Unicast
+    # For address family: L2VPN E-VPN
+    p1 = LazyRegex(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
+
+    # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
+    p2_1 = LazyRegex(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
+                     ' +(?P<remote_as>(\d+)), +(?P<link>[a-zA-Z]+) +link$')
+
+    # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
+    # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
+    p2_2 = LazyRegex(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
+                      ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
+                      ' +(?P<link>[a-zA-Z]+) +link$')
+
+    # IOS output
+    # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
+    # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
+    p2_3 = LazyRegex(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
+                      '(?: +vrf +(?P<vrf>(\S+)),)?'
+                      ' +remote +AS +(?P<remote_as>(\d+)),'
+                      ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
+                      '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$')
+
+    # Description: router22222222
+    p3 = LazyRegex(r'^Description: +(?P<description>(\S+))$')
+
+    # Administratively shut down
+    p4 = LazyRegex(r'^Administratively shut down$')
+
+    # BGP version 4, remote router ID 10.16.2.2
+    p5 = LazyRegex(r'^BGP +version +(?P<bgp_version>(\d+)), +remote'
+                    ' +router +ID +(?P<router_id>(\S+))$')
+
+    # BGP state = Established, up for 01:10:35
+    # BGP state = Idle, down for 01:10:35
+    # BGP state = Idle
+    # BGP state = Established, up for 1w2d
+    # Session state = Closing
+    p6 = LazyRegex(r'^(BGP|Session) +state += +(?P<session_state>(\S+))'
+                    '(?:, +(?P<state>(up|down)) +for +(?P<time>(\S+)))?$')
+
+    # Last read 00:00:04, last write 00:00:09, hold time is 180, keepalive interval is 60 seconds
+    p7_1 = LazyRegex(r'^Last +read +(?P<last_read>(\S+)), +last +write'
+                      ' +(?P<last_write>(\S+)), +hold +time +is'
+                      ' +(?P<hold_time>(\d+)), +keepalive +interval +is'
+                      ' +(?P<keepalive>(\d+)) +seconds$')
+
+    # Configured hold time is 90, keepalive interval is 30 seconds
+    p7_2 = LazyRegex(r'^Configured +hold +time +is (?P<holdtime>(\d+)),'
+                      ' +keepalive +interval +is +(?P<keepalive>(\d+))'
+                      ' +seconds$')
+
+    # Minimum holdtime from neighbor is 0 seconds
+    p7_3 = LazyRegex(r'^Minimum +holdtime +from +neighbor +is'
+                      ' +(?P<min_holdtime>(\d+)) +seconds$')
+
+    # Neighbor sessions:
+    p7_4 = LazyRegex(r'^Neighbor +sessions:+$')
+
+    # Neighbor sessions:
+    #  1 active, is not multisession capable (disabled)
+    p8 = LazyRegex(r'^(?P<sessions>(\d+)) active,(?: +is +not +multisession'
+                    ' +capable( +\(disabled\))?)?$')
+
+    # Neighbor capabilities:
+    p9 = LazyRegex(r'^Neighbor +capabilities:$')
+
+    #  Route refresh: advertised and received(new)
+    p10 = LazyRegex(r'^Route +refresh: +(?P<route_refresh>(.*))$')
+
+    #  Four-octets ASN Capability: advertised and received
+    p11 = LazyRegex(r'^Four-octets +ASN +Capability: +(?P<cap>(.*))$')
+
+    # Address family VPNv4 Unicast: advertised and received
+    # Address family VPNv6 Unicast: advertised and received
+    # Address family link-state link-state: advertised
+    p12 = LazyRegex(r'^Address +family +(?P<af_type>([a-zA-Z0-9\s\-]+)) *:'
+                     ' +(?P<val>(.*))$')
+
+    #  Graceful Restart Capability: received
+    p13 = LazyRegex(r'^Graceful +Restart +Capability: +(?P<gr>(.*))$')
+
+    #   Remote Restart timer is 120 seconds
+    p14 = LazyRegex(r'^Remote +Restart +timer +is +(?P<timer>(\d+))'
+                     ' +seconds$')
+
+    #   Address families advertised by peer:
+    #    VPNv4 Unicast (was not preserved, VPNv6 Unicast (was not preserved
+    p15 = LazyRegex(r'^(?P<af_type1>([a-zA-Z0-9\s]+)) +\(was +not'
+                     ' +preserved, +(?P<af_type2>([a-zA-Z0-9\s]+))'
+                     ' +\(was +not +preserved$')
+
+    #  Enhanced Refresh Capability: advertised
+    p16 = LazyRegex(r'^Enhanced +Refresh +Capability: +(?P<erc>(.*))$')
+
+    #  Multisession Capability:
+    #  Multisession Capability: advertised
+    p17 = LazyRegex(r'^Multisession +Capability: +(?P<multisession>(.*))$')
+
+    #  Stateful switchover support enabled: NO for session 1
+    p18 = LazyRegex(r'^Stateful +switchover +support +(?P<state>(\S+)):'
+                    ' +(?P<value>(.*))$')
+
+    # Message statistics:
+    # Message statistics for 192.168.10.253 active:
+    p19 = LazyRegex(r'^Message +statistics( +for +(?P<state>[\w. ]+))?:$')
+
+    #  InQ depth is 0
+    #  OutQ depth is 0
+    p20 = LazyRegex(r'^(?P<qtype>(InQ|OutQ)) +depth +is +(?P<val>(\d+))$')
+
+    # Prefix activity:               ----       ----
+    # Local Policy Denied Prefixes:    --------    -------
+    # Refresh activity:          ----   ----
+    p21 = LazyRegex(r'^(?P<table_type>(Prefix activity|'
+                     'Local Policy Denied Prefixes|Refresh activity)) *:'
+                     ' +(.*)$')
+
+    #  Opens:                  1          1
+    #  Notifications:          0          0
+    #  Updates:               11          6
+    #  Keepalives:            75         74
+    #  Route Refresh:          0          0
+    #  Total:                 87         81
+    #  Prefixes Current:     403        201 (Consumes 27336 bytes)
+    #  Used as bestpath:     n/a          0
+    #  Used as multipath:    n/a          0
+    p22 = LazyRegex('^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
+                    ' +(?P<recv>(n/a|\d+))(?:\(Consumes +(?P<bytes>(\d+))'
+                    ' +bytes\))?$')
+
+    # Default minimum time between advertisement runs is 0 seconds
+    p23 = LazyRegex(r'^Default +minimum +time +between +advertisement'
+                     ' +runs +is +(?P<time>(\d+)) +seconds$')
+
+    # Address tracking is enabled, the RIB does have a route to 10.16.2.2
+    # Address tracking is enabled, the RIB does not have a route to 10.16.2.2
+    p24 = LazyRegex(r'^Address +tracking +is +(?P<status>(\S+)), +the +RIB'
+                     ' +does( +(?P<rip_has_route>(not)+))? +have +a +route +to +(?P<route>(\S+))$')
+
+    # Connections established 1; dropped 0
+    p25 = LazyRegex(r'^Connections +established +(?P<established>(\d+));'
+                     ' +dropped +(?P<dropped>(\d+))$')
+
+    # Last reset never
+    # Last reset 01:05:09, due to Active open failed
+    p26 = LazyRegex(r'^Last +reset +(?P<reset>(\S+))(?:, +due +to'
+                     ' +(?P<reason>(.*)))?$')
+
+    # Transport(tcp) path-mtu-discovery is enabled
+    p27 = LazyRegex(r'^Transport\(tcp\) +path-mtu-discovery +is'
+                     ' +(?P<status>(\S+))$')
+
+    # Graceful-Restart is disabled
+    # Graceful-Restart is enabled, restart-time 120 seconds, stalepath-time 360 seconds
+    p28 = LazyRegex(r'^Graceful-Restart +is +(?P<gr>(enabled|disabled))'
+                     '(?:, +restart-time +(?P<restart>(\d+)) +seconds,'
+                     ' +stalepath-time +(?P<stalepath>(\d+)) +seconds)?$')
+
+    # Connection state is ESTAB, I/O status: 1, unread input bytes: 0
+    p29 = LazyRegex(r'^Connection +state +is +(?P<state>(\S+)), +I/O'
+                     ' +status: (?P<io>(\d+)), +unread +input +bytes:'
+                     ' +(?P<bytes>(\d+))$')
+
+    # Connection is ECN Disabled, Mininum incoming TTL 0, Outgoing TTL 255
+    p30 = LazyRegex(r'^Connection +is +ECN +(?P<ecn_state>(\S+)),'
+                     ' +Mininum +incoming +TTL +(?P<incoming_ttl>(\d+)),'
+                     ' +Outgoing +TTL +(?P<outgoing_ttl>(\d+))$')
+
+    # Local host: 10.64.4.4, Local port: 35281
+    p31 = LazyRegex(r'^Local +host: +(?P<local_host>(\S+)), +Local +port:'
+                     ' +(?P<local_port>(\d+))$')
+
+    # Foreign host: 10.16.2.2, Foreign port: 179
+    p32 = LazyRegex(r'^Foreign +host: +(?P<foreign_host>(\S+)), +Foreign'
+                     ' +port: +(?P<foreign_port>(\d+))$')
+
+    # Connection tableid (VRF): 0
+    p33 = LazyRegex(r'^Connection +tableid +\(VRF\): +(?P<val>(\d+))$')
+
+    # Maximum output segment queue size: 50
+    p34 = LazyRegex(r'^Maximum +output +segment +queue +size:'
+                     ' +(?P<size>(\d+))$')
+
+    # Enqueued packets for retransmit: 0, input: 0  mis-ordered: 0 (0 bytes)
+    p35 = LazyRegex(r'^Enqueued +packets +for +retransmit:'
+                     ' +(?P<retransmit>(\d+)), +input: +(?P<input>(\d+))'
+                     ' +mis-ordered: +(?P<misordered>(\d+))'
+                     ' +\((?P<bytes>(\d+)) +bytes+\)$')
+
+    # Event Timers (current time is 0x530449):
+    p36 = LazyRegex(r'^Event +Timers +\(+current +time +is'
+                     ' +(?P<time>(\S+))+\):$')
+
+    # Timer          Starts    Wakeups            Next
+    # Retrans            86          0             0x0
+    # TimeWait            0          0             0x0
+    # AckHold            80         72             0x0
+    # SendWnd             0          0             0x0
+    # KeepAlive           0          0             0x0
+    # GiveUp              0          0             0x0
+    # PmtuAger            1          1             0x0
+    # DeadWait            0          0             0x0
+    # Linger              0          0             0x0
+    # ProcessQ            0          0             0x0
+    p37 = LazyRegex(r'^(?P<item>(\S+)) +(?P<starts>(\d+))'
+                     ' +(?P<wakeups>(\d+)) +(?P<next>0x[0-9a-f]+)$')
+
+    # iss:   55023811  snduna:   55027115  sndnxt:   55027115
+    p38 = LazyRegex(r'^iss: +(?P<iss>(\d+)) +snduna: +(?P<snduna>(\d+))'
+                     ' +sndnxt: +(?P<sndnxt>(\d+))$')
+
+    # irs:  109992783  rcvnxt:  109995158
+    p39 = LazyRegex(r'^irs: +(?P<irs>(\d+)) +rcvnxt: +(?P<rcvnxt>(\d+))$')
+
+    # sndwnd:  16616  scale:      0  maxrcvwnd:  16384
+    p40 = LazyRegex(r'^sndwnd: +(?P<sndwnd>(\d+)) +scale: +(?P<scale>(\d+))'
+                     ' +maxrcvwnd: +(?P<maxrcvwnd>(\d+))$')
+
+    # rcvwnd:  16327  scale:      0  delrcvwnd:     57
+    p41 = LazyRegex(r'^rcvwnd: +(?P<rcvwnd>(\d+)) +scale: +(?P<scale>(\d+))'
+                     ' +delrcvwnd: +(?P<delrcvwnd>(\d+))$')
+
+    # SRTT: 1000 ms, RTTO: 1003 ms, RTV: 3 ms, KRTT: 0 ms
+    p42 = LazyRegex(r'^SRTT: +(?P<srtt>(\d+)) +ms, +RTTO: +(?P<rtto>(\d+))'
+                     ' +ms, +RTV: +(?P<rtv>(\d+)) +ms, +KRTT:'
+                     ' +(?P<krtt>(\d+)) +ms$')
+
+    # minRTT: 4 ms, maxRTT: 1000 ms, ACK hold: 200 ms
+    p43 = LazyRegex(r'^minRTT: +(?P<min_rtt>(\d+)) +ms, +maxRTT:'
+                     ' +(?P<max_rtt>(\d+)) +ms, +ACK +hold:'
+                     ' +(?P<ack_hold>(\d+)) +ms$')
+
+    # uptime: 4236258 ms, Sent idletime: 4349 ms, Receive idletime: 4549 ms
+    p44 = LazyRegex(r'^uptime: +(?P<uptime>(\d+)) +ms, +Sent +idletime:'
+                     ' +(?P<sent>(\d+)) +ms, +Receive +idletime:'
+                     ' +(?P<receive>(\d+)) +ms$')
+
+    # Status Flags: active open
+    p45 = LazyRegex(r'^Status +Flags: +(?P<flags>(.*))$')
+
+    # Option Flags: nagle, path mtu capable
+    p46 = LazyRegex(r'^Option +Flags: +(?P<flags>(.*))$')
+
+    # IP Precedence value : 6
+    p47 = LazyRegex(r'^IP +Precedence +value : +(?P<value>(\d+))$')
+
+    # Datagrams (max data segment is 536 bytes):
+    p48 = LazyRegex(r'^Datagrams +\(max +data +segment +is'
+                     ' +(?P<bytes>(\d+)) +bytes\):$')
+
+    # Rcvd: 164 (out of order: 0), with data: 80, total data bytes: 2374
+    p49 = LazyRegex(r'^Rcvd: +(?P<received>(\d+)) +\(out +of +order:'
+                     ' +(?P<out_of_order>(\d+))\), +with +data:'
+                     ' (?P<with_data>(\d+)), +total +data +bytes:'
+                     ' (?P<total_data>(\d+))$')
+
+    # Sent: 166 (retransmit: 0, fastretransmit: 0, partialack: 0, Second Congestion: 0), with data: 87, total data bytes: 3303
+    p50 = LazyRegex(r'^Sent: (?P<sent>(\d+)) +\(retransmit:'
+                     ' +(?P<retransmit>(\d+)), +fastretransmit:'
+                     ' +(?P<fastretransmit>(\d+)), +partialack:'
+                     ' +(?P<partialack>(\d+)), +Second +Congestion:'
+                     ' +(?P<second_congestion>(\d+))\), +with +data:'
+                     ' (?P<sent_with_data>(\d+)), +total +data +bytes:'
+                     ' +(?P<sent_total_data>(\d+))$')
+
+    # Packets received in fast path: 0, fast processed: 0, slow path: 0
+    p51 = LazyRegex(r'^Packets +received +in +fast +path: +(?P<rcv>(\d+)),'
+                     ' +fast +processed: +(?P<processed>(\d+)),'
+                     ' +slow +path: +(?P<path>(\d+))$')
+
+    # fast lock acquisition failures: 0, slow path: 0
+    p52 = LazyRegex(r'^fast +lock +acquisition +failures:'
+                     ' +(?P<failures>(\d+)), +slow +path: +(?P<path>(\d+))$')
+
+    # TCP Semaphore      0x1286E7EC  FREE
+    p53 = LazyRegex(r'^TCP +Semaphore +(?P<semaphore>0x[0-9a-fA-F]+)'
+                     ' +(?P<status>(\S+))$')
+
+    # BGP table version 9431, neighbor version 9431/0
+    p54 = LazyRegex(r'^BGP +table +version +(?P<bgp_table_version>(\d+)),'
+                     ' +neighbor +version +(?P<nbr_version>(\S+))$')
+
+    # Output queue size : 0
+    p55 = LazyRegex(r'^Output +queue +size *: +(?P<size>(\d+))$')
+
+    # Index 38, Advertise bit 1
+    p56 = LazyRegex(r'^Index +(?P<index>(\d+)), +Advertise +bit'
+                    ' +(?P<adv_bit>(\d+))$')
+
+    # Route-Reflector Client
+    p57 = LazyRegex(r'^Route-Reflector +Client$')
+
+    # 38 update-group member
+    p58 = LazyRegex(r'^(?P<num>(\d+)) +update-group +member$')
+
+    # Community attribute sent to this neighbor
+    p59 = LazyRegex(r'^Community +attribute +sent +to +this +neighbor$')
+
+    # Extended-community attribute sent to this neighbor
+    p60 = LazyRegex(r'^Extended-community +attribute +sent +to +this'
+                    ' +neighbor$')
 
-        # Init vars
-        ret_dict = {}
-        list_of_neighbors = []
-        af_name = None ; af_dict = {} ; nbr_dict = {}
-        message_statistics = False
-        prefix_activity = True
-        local_prefix = False
-        refresh_activity = False
-
-        # For address family: IPv4 Unicast
-        # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
-
-        # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-        p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
-                         ' +(?P<remote_as>(\d+)), +(?P<link>[a-zA-Z]+) +link$')
-
-        # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
-        # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-        p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
-                           ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +(?P<link>[a-zA-Z]+) +link$')
-
-        # IOS output
-        # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
-        # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
-        p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
-                           '(?: +vrf +(?P<vrf>(\S+)),)?'
-                           ' +remote +AS +(?P<remote_as>(\d+)),'
-                           ' +local +AS +(?P<local_as>\d+)(?P<no_prepend> no-prepend)?'
-                           '(?P<replace_as> replace-as)?, +(?P<link>(\S+)) +link$')
-
-        # Description: router22222222
-        p3 = re.compile(r'^Description: +(?P<description>(\S+))$')
-
-        # Administratively shut down
-        p4 = re.compile(r'^Administratively shut down$')
-
-        # BGP version 4, remote router ID 10.16.2.2
-        p5 = re.compile(r'^BGP +version +(?P<bgp_version>(\d+)), +remote'
-                         ' +router +ID +(?P<router_id>(\S+))$')
-
-        # BGP state = Established, up for 01:10:35
-        # BGP state = Idle, down for 01:10:35
-        # BGP state = Idle
-        # BGP state = Established, up for 1w2d
-        # Session state = Closing
-        p6 = re.compile(r'^(BGP|Session) +state += +(?P<session_state>(\S+))'
-                         '(?:, +(?P<state>(up|down)) +for +(?P<time>(\S+)))?$')
-
-        # Last read 00:00:04, last write 00:00:09, hold time is 180, keepalive interval is 60 seconds
-        p7_1 = re.compile(r'^Last +read +(?P<last_read>(\S+)), +last +write'
-                           ' +(?P<last_write>(\S+)), +hold +time +is'
-                           ' +(?P<hold_time>(\d+)), +keepalive +interval +is'
-                           ' +(?P<keepalive>(\d+)) +seconds$')
-
-        # Configured hold time is 90, keepalive interval is 30 seconds
-        p7_2 = re.compile(r'^Configured +hold +time +is (?P<holdtime>(\d+)),'
-                           ' +keepalive +interval +is +(?P<keepalive>(\d+))'
-                           ' +seconds$')
-
-        # Minimum holdtime from neighbor is 0 seconds
-        p7_3 = re.compile(r'^Minimum +holdtime +from +neighbor +is'
-                           ' +(?P<min_holdtime>(\d+)) +seconds$')
-
-        # Neighbor sessions:
-        p7_4 = re.compile(r'^Neighbor +sessions:+$')
-
-        # Neighbor sessions:
-        #  1 active, is not multisession capable (disabled)
-        p8 = re.compile(r'^(?P<sessions>(\d+)) active,(?: +is +not +multisession'
-                         ' +capable( +\(disabled\))?)?$')
-
-        # Neighbor capabilities:
-        p9 = re.compile(r'^Neighbor +capabilities:$')
-
-        #  Route refresh: advertised and received(new)
-        p10 = re.compile(r'^Route +refresh: +(?P<route_refresh>(.*))$')
-
-        #  Four-octets ASN Capability: advertised and received
-        p11 = re.compile(r'^Four-octets +ASN +Capability: +(?P<cap>(.*))$')
-
-        # Address family VPNv4 Unicast: advertised and received
-        # Address family VPNv6 Unicast: advertised and received
-        # Address family link-state link-state: advertised
-        p12 = re.compile(r'^Address +family +(?P<af_type>([a-zA-Z0-9\s\-]+)) *:'
-                          ' +(?P<val>(.*))$')
-
-        #  Graceful Restart Capability: received
-        p13 = re.compile(r'^Graceful +Restart +Capability: +(?P<gr>(.*))$')
-
-        #   Remote Restart timer is 120 seconds
-        p14 = re.compile(r'^Remote +Restart +timer +is +(?P<timer>(\d+))'
-                          ' +seconds$')
-
-        #   Address families advertised by peer:
-        #    VPNv4 Unicast (was not preserved, VPNv6 Unicast (was not preserved
-        p15 = re.compile(r'^(?P<af_type1>([a-zA-Z0-9\s]+)) +\(was +not'
-                          ' +preserved, +(?P<af_type2>([a-zA-Z0-9\s]+))'
-                          ' +\(was +not +preserved$')
-
-        # Address families advertised by peer before restart:
-        #   IPv4 Unicast, VPNv4 Unicast, L2VPN Vpls
-
-        #  Enhanced Refresh Capability: advertised
-        p16 = re.compile(r'^Enhanced +Refresh +Capability: +(?P<erc>(.*))$')
-
-
-        #  Multisession Capability:
-        #  Multisession Capability: advertised
-        p17 = re.compile(r'^Multisession +Capability: +(?P<multisession>(.*))$')
-
-        #  Stateful switchover support enabled: NO for session 1
-        p18 = re.compile(r'^Stateful +switchover +support +(?P<state>(\S+)):'
-                         ' +(?P<value>(.*))$')
-
-        # Message statistics:
-        # Message statistics for 192.168.10.253 active:
-        p19 = re.compile(r'^Message +statistics( +for +(?P<state>[\w. ]+))?:$')
-
-        #  InQ depth is 0
-        #  OutQ depth is 0
-        p20 = re.compile(r'^(?P<qtype>(InQ|OutQ)) +depth +is +(?P<val>(\d+))$')
-
-        # Prefix activity:               ----       ----
-        # Local Policy Denied Prefixes:    --------    -------
-        # Refresh activity:          ----   ----
-        p21 = re.compile(r'^(?P<table_type>(Prefix activity|'
-                          'Local Policy Denied Prefixes|Refresh activity)) *:'
-                          ' +(.*)$')
-
-        #  Opens:                  1          1
-        #  Notifications:          0          0
-        #  Updates:               11          6
-        #  Keepalives:            75         74
-        #  Route Refresh:          0          0
-        #  Total:                 87         81
-        #  Prefixes Current:     403        201 (Consumes 27336 bytes)
-        #  Used as bestpath:     n/a          0
-        #  Used as multipath:    n/a          0
-        p22 = re.compile('^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
-                         ' +(?P<recv>(n/a|\d+))(?:\(Consumes +(?P<bytes>(\d+))'
-                         ' +bytes\))?$')
-
-        # Do log neighbor state changes (via global configuration)
-
-        # Default minimum time between advertisement runs is 0 seconds
-        p23 = re.compile(r'^Default +minimum +time +between +advertisement'
-                          ' +runs +is +(?P<time>(\d+)) +seconds$')
-
-        # Address tracking is enabled, the RIB does have a route to 10.16.2.2
-        # Address tracking is enabled, the RIB does not have a route to 10.16.2.2
-        p24 = re.compile(r'^Address +tracking +is +(?P<status>(\S+)), +the +RIB'
-                          ' +does( +(?P<rip_has_route>(not)+))? +have +a +route +to +(?P<route>(\S+))$')
-
-        # Connections established 1; dropped 0
-        p25 = re.compile(r'^Connections +established +(?P<established>(\d+));'
-                          ' +dropped +(?P<dropped>(\d+))$')
-
-        # Last reset never
-        # Last reset 01:05:09, due to Active open failed
-        p26 = re.compile(r'^Last +reset +(?P<reset>(\S+))(?:, +due +to'
-                          ' +(?P<reason>(.*)))?$')
-
-        # Transport(tcp) path-mtu-discovery is enabled
-        p27 = re.compile(r'^Transport\(tcp\) +path-mtu-discovery +is'
-                          ' +(?P<status>(\S+))$')
-
-        # Graceful-Restart is disabled
-        # Graceful-Restart is enabled, restart-time 120 seconds, stalepath-time 360 seconds
-        p28 = re.compile(r'^Graceful-Restart +is +(?P<gr>(enabled|disabled))'
-                          '(?:, +restart-time +(?P<restart>(\d+)) +seconds,'
-                          ' +stalepath-time +(?P<stalepath>(\d+)) +seconds)?$')
-
-        # Connection state is ESTAB, I/O status: 1, unread input bytes: 0
-        p29 = re.compile(r'^Connection +state +is +(?P<state>(\S+)), +I/O'
-                          ' +status: (?P<io>(\d+)), +unread +input +bytes:'
-                          ' +(?P<bytes>(\d+))$')
-
-        # Connection is ECN Disabled, Mininum incoming TTL 0, Outgoing TTL 255
-        p30 = re.compile(r'^Connection +is +ECN +(?P<ecn_state>(\S+)),'
-                          ' +Mininum +incoming +TTL +(?P<incoming_ttl>(\d+)),'
-                          ' +Outgoing +TTL +(?P<outgoing_ttl>(\d+))$')
-
-        # Local host: 10.64.4.4, Local port: 35281
-        p31 = re.compile(r'^Local +host: +(?P<local_host>(\S+)), +Local +port:'
-                          ' +(?P<local_port>(\d+))$')
-
-        # Foreign host: 10.16.2.2, Foreign port: 179
-        p32 = re.compile(r'^Foreign +host: +(?P<foreign_host>(\S+)), +Foreign'
-                          ' +port: +(?P<foreign_port>(\d+))$')
-
-        # Connection tableid (VRF): 0
-        p33 = re.compile(r'^Connection +tableid +\(VRF\): +(?P<val>(\d+))$')
-
-        # Maximum output segment queue size: 50
-        p34 = re.compile(r'^Maximum +output +segment +queue +size:'
-                          ' +(?P<size>(\d+))$')
-
-        # Enqueued packets for retransmit: 0, input: 0  mis-ordered: 0 (0 bytes)
-        p35 = re.compile(r'^Enqueued +packets +for +retransmit:'
-                          ' +(?P<retransmit>(\d+)), +input: +(?P<input>(\d+))'
-                          ' +mis-ordered: +(?P<misordered>(\d+))'
-                          ' +\((?P<bytes>(\d+)) +bytes+\)$')
-
-        # Event Timers (current time is 0x530449):
-        p36 = re.compile(r'^Event +Timers +\(+current +time +is'
-                          ' +(?P<time>(\S+))+\):$')
-
-        # Timer          Starts    Wakeups            Next
-        # Retrans            86          0             0x0
-        # TimeWait            0          0             0x0
-        # AckHold            80         72             0x0
-        # SendWnd             0          0             0x0
-        # KeepAlive           0          0             0x0
-        # GiveUp              0          0             0x0
-        # PmtuAger            1          1             0x0
-        # DeadWait            0          0             0x0
-        # Linger              0          0             0x0
-        # ProcessQ            0          0             0x0
-        p37 = re.compile(r'^(?P<item>(\S+)) +(?P<starts>(\d+))'
-                          ' +(?P<wakeups>(\d+)) +(?P<next>0x[0-9a-f]+)$')
-
-        # iss:   55023811  snduna:   55027115  sndnxt:   55027115
-        p38 = re.compile(r'^iss: +(?P<iss>(\d+)) +snduna: +(?P<snduna>(\d+))'
-                          ' +sndnxt: +(?P<sndnxt>(\d+))$')
-
-        # irs:  109992783  rcvnxt:  109995158
-        p39 = re.compile(r'^irs: +(?P<irs>(\d+)) +rcvnxt: +(?P<rcvnxt>(\d+))$')
-
-
-        # sndwnd:  16616  scale:      0  maxrcvwnd:  16384
-        p40 = re.compile(r'^sndwnd: +(?P<sndwnd>(\d+)) +scale: +(?P<scale>(\d+))'
-                          ' +maxrcvwnd: +(?P<maxrcvwnd>(\d+))$')
-
-        # rcvwnd:  16327  scale:      0  delrcvwnd:     57
-        p41 = re.compile(r'^rcvwnd: +(?P<rcvwnd>(\d+)) +scale: +(?P<scale>(\d+))'
-                          ' +delrcvwnd: +(?P<delrcvwnd>(\d+))$')
-
-        # SRTT: 1000 ms, RTTO: 1003 ms, RTV: 3 ms, KRTT: 0 ms
-        p42 = re.compile(r'^SRTT: +(?P<srtt>(\d+)) +ms, +RTTO: +(?P<rtto>(\d+))'
-                          ' +ms, +RTV: +(?P<rtv>(\d+)) +ms, +KRTT:'
-                          ' +(?P<krtt>(\d+)) +ms$')
-
-        # minRTT: 4 ms, maxRTT: 1000 ms, ACK hold: 200 ms
-        p43 = re.compile(r'^minRTT: +(?P<min_rtt>(\d+)) +ms, +maxRTT:'
-                          ' +(?P<max_rtt>(\d+)) +ms, +ACK +hold:'
-                          ' +(?P<ack_hold>(\d+)) +ms$')
-
-
-        # uptime: 4236258 ms, Sent idletime: 4349 ms, Receive idletime: 4549 ms
-        p44 = re.compile(r'^uptime: +(?P<uptime>(\d+)) +ms, +Sent +idletime:'
-                          ' +(?P<sent>(\d+)) +ms, +Receive +idletime:'
-                          ' +(?P<receive>(\d+)) +ms$')
-
-        # Status Flags: active open
-        p45 = re.compile(r'^Status +Flags: +(?P<flags>(.*))$')
-
-        # Option Flags: nagle, path mtu capable
-        p46 = re.compile(r'^Option +Flags: +(?P<flags>(.*))$')
-
-        # IP Precedence value : 6
-        p47 = re.compile(r'^IP +Precedence +value : +(?P<value>(\d+))$')
-
-        # Datagrams (max data segment is 536 bytes):
-        p48 = re.compile(r'^Datagrams +\(max +data +segment +is'
-                          ' +(?P<bytes>(\d+)) +bytes\):$')
-
-        # Rcvd: 164 (out of order: 0), with data: 80, total data bytes: 2374
-        p49 = re.compile(r'^Rcvd: +(?P<received>(\d+)) +\(out +of +order:'
-                          ' +(?P<out_of_order>(\d+))\), +with +data:'
-                          ' (?P<with_data>(\d+)), +total +data +bytes:'
-                          ' (?P<total_data>(\d+))$')
-
-        # Sent: 166 (retransmit: 0, fastretransmit: 0, partialack: 0, Second Congestion: 0), with data: 87, total data bytes: 3303
-        p50 = re.compile(r'^Sent: (?P<sent>(\d+)) +\(retransmit:'
-                          ' +(?P<retransmit>(\d+)), +fastretransmit:'
-                          ' +(?P<fastretransmit>(\d+)), +partialack:'
-                          ' +(?P<partialack>(\d+)), +Second +Congestion:'
-                          ' +(?P<second_congestion>(\d+))\), +with +data:'
-                          ' (?P<sent_with_data>(\d+)), +total +data +bytes:'
-                          ' +(?P<sent_total_data>(\d+))$')
-
-
-        # Packets received in fast path: 0, fast processed: 0, slow path: 0
-        p51 = re.compile(r'^Packets +received +in +fast +path: +(?P<rcv>(\d+)),'
-                          ' +fast +processed: +(?P<processed>(\d+)),'
-                          ' +slow +path: +(?P<path>(\d+))$')
-
-        # fast lock acquisition failures: 0, slow path: 0
-        p52 = re.compile(r'^fast +lock +acquisition +failures:'
-                          ' +(?P<failures>(\d+)), +slow +path: +(?P<path>(\d+))$')
-
-
-        # TCP Semaphore      0x1286E7EC  FREE
-        p53 = re.compile(r'^TCP +Semaphore +(?P<semaphore>0x[0-9a-fA-F]+)'
-                          ' +(?P<status>(\S+))$')
-
-        # BGP table version 9431, neighbor version 9431/0
-        p54 = re.compile(r'^BGP +table +version +(?P<bgp_table_version>(\d+)),'
-                          ' +neighbor +version +(?P<nbr_version>(\S+))$')
-
-        # Output queue size : 0
-        p55 = re.compile(r'^Output +queue +size *: +(?P<size>(\d+))$')
-
-        # Index 38, Advertise bit 1
-        p56 = re.compile(r'^Index +(?P<index>(\d+)), +Advertise +bit'
-                        ' +(?P<adv_bit>(\d+))$')
-
-        # Route-Reflector Client
-        p57 = re.compile(r'^Route-Reflector +Client$')
+    # Suppress LDP signaling protocol
+    p61 = LazyRegex(r'^Suppress +LDP +signaling +protocol$')
 
-        # 38 update-group member
-        p58 = re.compile(r'^(?P<num>(\d+)) +update-group +member$')
+    # Slow-peer detection is disabled
+    p62 = LazyRegex(r'^Slow-peer +detection +is'
+                     ' +(?P<state>(enabled|disabled))$')
 
-        # Community attribute sent to this neighbor
-        p59 = re.compile(r'^Community +attribute +sent +to +this +neighbor$')
+    # Slow-peer split-update-group dynamic is disabled
+    p63 = LazyRegex(r'^Slow-peer +split-update-group +dynamic +is'
+                     ' +(?P<state>(enabled|disabled))$')
 
-        # Extended-community attribute sent to this neighbor
-        p60 = re.compile(r'^Extended-community +attribute +sent +to +this'
-                        ' +neighbor$')
+    # Number of NLRIs in the update sent: max 199, min 0
+    p64 = LazyRegex(r'^Number +of +NLRIs +in +the +update +sent: +max'
+                    ' +(?P<max>(\d+)), +min +(?P<min>(\d+))$')
 
-        # Suppress LDP signaling protocol
-        p61 = re.compile(r'^Suppress +LDP +signaling +protocol$')
+    # Last detected as dynamic slow peer: never
+    p65 = LazyRegex(r'^Last +detected +as +dynamic +slow +peer:'
+                     ' +(?P<val>(\S+))$')
 
-        # Slow-peer detection is disabled
-        p62 = re.compile(r'^Slow-peer +detection +is'
-                          ' +(?P<state>(enabled|disabled))$')
+    # Dynamic slow peer recovered: never
+    p66 = LazyRegex(r'^Dynamic +slow +peer +recovered: +(?P<val>(\S+))$')
 
-        # Slow-peer split-update-group dynamic is disabled
-        p63 = re.compile(r'^Slow-peer +split-update-group +dynamic +is'
-                          ' +(?P<state>(enabled|disabled))$')
+    # Refresh Epoch: 3
+    p67 = LazyRegex(r'^Refresh +Epoch: +(?P<num>(\d+))$')
 
-        # Number of NLRIs in the update sent: max 199, min 0
-        p64 = re.compile(r'^Number +of +NLRIs +in +the +update +sent: +max'
-                        ' +(?P<max>(\d+)), +min +(?P<min>(\d+))$')
+    # Last Sent Refresh Start-of-rib: 02:41:38
+    # Last Received Refresh Start-of-rib: 02:01:36
+    p68 = LazyRegex(r'^Last +(Sent|Received) +Refresh +Start-of-rib:'
+                     ' +(?P<val>(\S+))$')
 
-        # Last detected as dynamic slow peer: never
-        p65 = re.compile(r'^Last +detected +as +dynamic +slow +peer:'
-                          ' +(?P<val>(\S+))$')
+    # Last Sent Refresh End-of-rib: 02:41:38
+    # Last Received Refresh End-of-rib: 02:01:32
+    p69 = LazyRegex(r'^Last +(Sent|Received) +Refresh +End-of-rib:'
+                     ' +(?P<val>(\S+))$')
 
-        # Dynamic slow peer recovered: never
-        p66 = re.compile(r'^Dynamic +slow +peer +recovered: +(?P<val>(\S+))$')
+    # Refresh-Out took 0 seconds
+    # Refresh-In took 4 seconds
+    p70 = LazyRegex(r'^Refresh-(?P<type>(In|Out)) +took +(?P<val>(\d+))'
+                     ' +seconds$')
 
-        # Refresh Epoch: 3
-        p67 = re.compile(r'^Refresh +Epoch: +(?P<num>(\d+))$')
+    # SSO is disabled
+    p71 = LazyRegex(r'^SSO +is +(?P<state>(enabled|disabled))$')
 
-        # Last Sent Refresh Start-of-rib: 02:41:38
-        # Last Received Refresh Start-of-rib: 02:01:36
-        p68 = re.compile(r'^Last +(Sent|Received) +Refresh +Start-of-rib:'
-                          ' +(?P<val>(\S+))$')
+    # No active TCP connection
+    p72 = LazyRegex(r'^No +active +TCP +connection$')
 
-        # Last Sent Refresh End-of-rib: 02:41:38
-        # Last Received Refresh End-of-rib: 02:01:32
-        p69 = re.compile(r'^Last +(Sent|Received) +Refresh +End-of-rib:'
-                          ' +(?P<val>(\S+))$')
+    def cli(self, neighbor='', address_family='', vrf='', output=None):
 
-        # Refresh-Out took 0 seconds
-        # Refresh-In took 4 seconds
-        p70 = re.compile(r'^Refresh-(?P<type>(In|Out)) +took +(?P<val>(\d+))'
-                          ' +seconds$')
+        # Init vars
+        ret_dict = {}
+        list_of_neighbors = []
+        af_name = None ; af_dict = {} ; nbr_dict = {}
+        message_statistics = False
+        prefix_activity = True
+        local_prefix = False
+        refresh_activity = False
 
-        # SSO is disabled
-        p71 = re.compile(r'^SSO +is +(?P<state>(enabled|disabled))$')
+        # Address families advertised by peer before restart:
+        #   IPv4 Unicast, VPNv4 Unicast, L2VPN Vpls
 
-        # No active TCP connection
-        p72 = re.compile(r'^No +active +TCP +connection$')
+        # Do log neighbor state changes (via global configuration)
 
         for line in output.splitlines():
 
             line = line.strip()
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 af_name = m.groupdict()['af'].lower().replace("-", "")
                 # af_dict
@@ -3070,7 +3074,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-            m = p2_1.match(line)
+            m = self.p2_1.match(line)
             if m:
                 group = m.groupdict()
                 neighbor = group['neighbor']
@@ -3098,7 +3102,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
             # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-            m = p2_2.match(line)
+            m = self.p2_2.match(line)
             if m:
                 group = m.groupdict()
                 neighbor = group['neighbor']
@@ -3125,7 +3129,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
             # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
-            m = p2_3.match(line)
+            m = self.p2_3.match(line)
             if m:
                 group = m.groupdict()
                 neighbor = group['neighbor']
@@ -3161,19 +3165,19 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Description: router22222222
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 nbr_dict['description'] = m.groupdict()['description']
                 continue
 
             # Administratively shut down
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 nbr_dict['shutdown'] = True
                 continue
 
             # BGP version 4, remote router ID 10.16.2.2
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 group = m.groupdict()
                 nbr_dict['bgp_version'] = int(group['bgp_version'])
@@ -3184,7 +3188,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # BGP state = Idle, down for 01:10:35
             # BGP state = Idle
             # BGP state = Established, up for 1w2d
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 group = m.groupdict()
                 nbr_dict['session_state'] = group['session_state']
@@ -3198,7 +3202,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Last read 00:00:04, last write 00:00:09, hold time is 180, keepalive interval is 60 seconds
-            m = p7_1.match(line)
+            m = self.p7_1.match(line)
             if m:
                 group = m.groupdict()
                 timers_dict = nbr_dict.\
@@ -3211,7 +3215,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Configured hold time is 90, keepalive interval is 30 seconds
-            m = p7_2.match(line)
+            m = self.p7_2.match(line)
             if m:
                 group = m.groupdict()
                 timers_dict = nbr_dict.\
@@ -3221,13 +3225,13 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Minimum holdtime from neighbor is 0 seconds
-            m = p7_3.match(line)
+            m = self.p7_3.match(line)
             if m:
                 timers_dict['min_holdtime'] = int(m.groupdict()['min_holdtime'])
                 continue
 
             # Neighbor sessions:
-            m = p7_4.match(line)
+            m = self.p7_4.match(line)
             if m:
                 neighbor_type = 'neighbor_session'
                 nbr_session_dict = nbr_dict.\
@@ -3235,16 +3239,15 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             #  1 active, is not multisession capable (disabled)
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 neighbor_active_sessions = int(m.groupdict()['sessions'])
                 if neighbor_type == 'neighbor_session':
                     nbr_session_dict.update({'sessions': neighbor_active_sessions})
                 continue
 
-
             # Neighbor capabilities:
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 neighbor_type = 'neighbor_capabilities'
                 nbr_cap_dict = nbr_dict.\
@@ -3252,13 +3255,13 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             #  Route refresh: advertised and received(new)
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 nbr_cap_dict['route_refresh'] = m.groupdict()['route_refresh']
                 continue
 
             #  Four-octets ASN Capability: advertised and received
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 nbr_cap_dict['four_octets_asn'] = m.groupdict()['cap']
                 continue
@@ -3268,7 +3271,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # Address family IPv4 Unicast: advertised and received
             # Address family IPv6 Unicast: advertised and received
             # Address family link-state link-state: advertised
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 group = m.groupdict()
                 af_type = group['af_type'].lower().replace(" ", "_")
@@ -3276,20 +3279,20 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             #  Graceful Restart Capability: received
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 nbr_cap_dict['graceful_restart'] = m.groupdict()['gr']
                 continue
 
             #   Remote Restart timer is 120 seconds
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 nbr_cap_dict['remote_restart_timer'] = int(m.groupdict()['timer'])
                 continue
 
             #   Address families advertised by peer:
             #    VPNv4 Unicast (was not preserved, VPNv6 Unicast (was not preserved
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 af_list = []
                 group = m.groupdict()
@@ -3299,20 +3302,20 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             #  Enhanced Refresh Capability: advertised
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 nbr_cap_dict['enhanced_refresh'] = m.groupdict()['erc']
                 continue
 
             #  Multisession Capability:
             #  Multisession Capability: advertised
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 nbr_cap_dict['multisession'] = m.groupdict()['multisession']
                 continue
 
             # Stateful switchover support enabled: NO for session 1
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 if neighbor_type == 'neighbor_session':
                     nbr_session_dict['stateful_switchover'] = m.groupdict()['value']
@@ -3322,7 +3325,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Message statistics:
             # Message statistics for 192.168.10.253 active:
-            m = p19.match(line)
+            m = self.p19.match(line)
             if m:
                 message_statistics = True
                 prefix_activity = False
@@ -3346,7 +3349,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             #  InQ depth is 0
             #  OutQ depth is 0
-            m = p20.match(line)
+            m = self.p20.match(line)
             if m:
                 group = m.groupdict()
                 key = '{}_depth'.format(group['qtype'].lower().\
@@ -3357,7 +3360,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # Prefix activity:               ----       ----
             # Local Policy Denied Prefixes:    --------    -------
             # Refresh activity:          ----   ----
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 table_type = m.groupdict()['table_type'].lower()
                 if table_type == 'prefix activity':
@@ -3397,7 +3400,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             #  Keepalives:            75         74
             #  Route Refresh:          0          0
             #  Total:                 87         81
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 group = m.groupdict()
                 item = group['item'].strip().lower().replace(" ", "_").\
@@ -3427,7 +3430,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Default minimum time between advertisement runs is 0 seconds
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 session_transport_dict = nbr_dict.\
                                         setdefault('bgp_session_transport', {})
@@ -3437,7 +3440,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Address tracking is enabled, the RIB does have a route to 10.16.2.2
             # Address tracking is enabled, the RIB does not have a route to 10.16.2.2
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['address_tracking_status'] = group['status']
@@ -3446,7 +3449,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connections established 1; dropped 0
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 group = m.groupdict()
                 conn_dict = session_transport_dict.setdefault('connection', {})
@@ -3455,7 +3458,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Last reset never
-            m = p26.match(line)
+            m = self.p26.match(line)
             if m:
                 group = m.groupdict()
                 conn_dict['last_reset'] = group['reset']
@@ -3464,7 +3467,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Transport(tcp) path-mtu-discovery is enabled
-            m = p27.match(line)
+            m = self.p27.match(line)
             if m:
                 session_transport_dict['tcp_path_mtu_discovery'] = \
                                                         m.groupdict()['status']
@@ -3472,7 +3475,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Graceful-Restart is disabled
             # Graceful-Restart is enabled, restart-time 120 seconds, stalepath-time 360 seconds
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['graceful_restart'] = group['gr']
@@ -3485,7 +3488,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connection state is ESTAB, I/O status: 1, unread input bytes: 0
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['connection_state'] = \
@@ -3495,7 +3498,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connection is ECN Disabled, Mininum incoming TTL 0, Outgoing TTL 255
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['ecn_connection'] = \
@@ -3507,7 +3510,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Local host: 10.64.4.4, Local port: 35281
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 group = m.groupdict()
                 transport_dict = session_transport_dict.\
@@ -3517,7 +3520,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Foreign host: 10.16.2.2, Foreign port: 179
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 group = m.groupdict()
                 transport_dict['foreign_host'] = group['foreign_host']
@@ -3525,21 +3528,21 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connection tableid (VRF): 0
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 session_transport_dict['connection_tableid'] = \
                                                     int(m.groupdict()['val'])
                 continue
 
             # Maximum output segment queue size: 50
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 session_transport_dict['maximum_output_segment_queue_size'] = \
                                                     int(m.groupdict()['size'])
                 continue
 
             # Enqueued packets for retransmit: 0, input: 0  mis-ordered: 0 (0 bytes)
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 group = m.groupdict()
                 enq_dict = session_transport_dict.setdefault('enqueued_packets', {})
@@ -3549,7 +3552,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Event Timers (current time is 0x530449):
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 af_dict['current_time'] = m.groupdict()['time']
                 event_timers_dict = nbr_dict.setdefault('bgp_event_timer', {})
@@ -3569,7 +3572,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # DeadWait            0          0             0x0
             # Linger              0          0             0x0
             # ProcessQ            0          0             0x0
-            m = p37.match(line)
+            m = self.p37.match(line)
             if m:
                 group = m.groupdict()
                 item = group['item'].lower()
@@ -3579,7 +3582,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # iss:   55023811  snduna:   55027115  sndnxt:   55027115
-            m = p38.match(line)
+            m = self.p38.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['iss'] = int(group['iss'])
@@ -3588,7 +3591,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # irs:  109992783  rcvnxt:  109995158
-            m = p39.match(line)
+            m = self.p39.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['irs'] = int(group['irs'])
@@ -3596,7 +3599,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # sndwnd:  16616  scale:      0  maxrcvwnd:  16384
-            m = p40.match(line)
+            m = self.p40.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['sndwnd'] = int(group['sndwnd'])
@@ -3605,7 +3608,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # rcvwnd:  16327  scale:      0  delrcvwnd:     57
-            m = p41.match(line)
+            m = self.p41.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['rcvwnd'] = int(group['rcvwnd'])
@@ -3614,7 +3617,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # SRTT: 1000 ms, RTTO: 1003 ms, RTV: 3 ms, KRTT: 0 ms
-            m = p42.match(line)
+            m = self.p42.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['srtt'] = int(group['srtt'])
@@ -3624,7 +3627,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # minRTT: 4 ms, maxRTT: 1000 ms, ACK hold: 200 ms
-            m = p43.match(line)
+            m = self.p43.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['min_rtt'] = int(group['min_rtt'])
@@ -3633,7 +3636,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # uptime: 4236258 ms, Sent idletime: 4349 ms, Receive idletime: 4549 ms
-            m = p44.match(line)
+            m = self.p44.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['uptime'] = int(group['uptime'])
@@ -3642,26 +3645,26 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Status Flags: active open
-            m = p45.match(line)
+            m = self.p45.match(line)
             if m:
                 session_transport_dict['status_flags'] = m.groupdict()['flags']
                 continue
 
             # Option Flags: nagle, path mtu capable
-            m = p46.match(line)
+            m = self.p46.match(line)
             if m:
                 session_transport_dict['option_flags'] = m.groupdict()['flags']
                 continue
 
             # IP Precedence value : 6
-            m = p47.match(line)
+            m = self.p47.match(line)
             if m:
                 session_transport_dict['ip_precedence_value'] = \
                                                     int(m.groupdict()['value'])
                 continue
 
             # Datagrams (max data segment is 536 bytes):
-            m = p48.match(line)
+            m = self.p48.match(line)
             if m:
                 session_transport_dict['transport']['mss'] = \
                                                     int(m.groupdict()['bytes'])
@@ -3669,7 +3672,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Rcvd: 164 (out of order: 0), with data: 80, total data bytes: 2374
-            m = p49.match(line)
+            m = self.p49.match(line)
             if m:
                 group = m.groupdict()
                 datagram_rcv_dict = datagram_dict.\
@@ -3682,7 +3685,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Sent: 166 (retransmit: 0, fastretransmit: 0, partialack: 0, Second Congestion: 0),
             #       with data: 87, total data bytes: 3303
-            m = p50.match(line)
+            m = self.p50.match(line)
             if m:
                 group = m.groupdict()
                 datagram_sent_dict = datagram_dict.\
@@ -3697,7 +3700,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Packets received in fast path: 0, fast processed: 0, slow path: 0
-            m = p51.match(line)
+            m = self.p51.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['packet_fast_path'] = int(group['rcv'])
@@ -3707,7 +3710,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # fast lock acquisition failures: 0, slow path: 0
-            m = p52.match(line)
+            m = self.p52.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['fast_lock_acquisition_failures'] = \
@@ -3716,7 +3719,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # TCP Semaphore      0x1286E7EC  FREE
-            m = p53.match(line)
+            m = self.p53.match(line)
             if m:
                 group = m.groupdict()
                 session_transport_dict['tcp_semaphore'] = group['semaphore']
@@ -3725,7 +3728,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Session: 192.168.197.254
             # BGP table version 9431, neighbor version 9431/0
-            m = p54.match(line)
+            m = self.p54.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['bgp_table_version'] = int(group['bgp_table_version'])
@@ -3733,13 +3736,13 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Output queue size : 0
-            m = p55.match(line)
+            m = self.p55.match(line)
             if m:
                 af_dict['output_queue_size'] = int(m.groupdict()['size'])
                 continue
 
             # Index 38, Advertise bit 1
-            m = p56.match(line)
+            m = self.p56.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['index'] = int(group['index'])
@@ -3747,37 +3750,37 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Route-Reflector Client
-            m = p57.match(line)
+            m = self.p57.match(line)
             if m:
                 af_dict['route_reflector_client'] = True
                 continue
 
             # 38 update-group member
-            m = p58.match(line)
+            m = self.p58.match(line)
             if m:
                 af_dict['update_group_member'] = int(m.groupdict()['num'])
                 continue
 
             # Community attribute sent to this neighbor
-            m = p59.match(line)
+            m = self.p59.match(line)
             if m:
                 af_dict['community_attribute_sent'] = True
                 continue
 
             # Extended-community attribute sent to this neighbor
-            m = p60.match(line)
+            m = self.p60.match(line)
             if m:
                 af_dict['extended_community_attribute_sent'] = True
                 continue
 
             # Suppress LDP signaling protocol
-            m = p61.match(line)
+            m = self.p61.match(line)
             if m:
                 af_dict['suppress_ldp_signaling'] = True
                 continue
 
             # Slow-peer detection is disabled
-            m = p62.match(line)
+            m = self.p62.match(line)
             if m:
                 if m.groupdict()['state'] == 'disabled':
                     af_dict['slow_peer_detection'] = False
@@ -3786,7 +3789,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Slow-peer split-update-group dynamic is disabled
-            m = p63.match(line)
+            m = self.p63.match(line)
             if m:
                 if m.groupdict()['state'] == 'disabled':
                     af_dict['slow_peer_split_update_group_dynamic'] = False
@@ -3795,7 +3798,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Number of NLRIs in the update sent: max 199, min 0
-            m = p64.match(line)
+            m = self.p64.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['max_nlri'] = int(group['max'])
@@ -3803,26 +3806,26 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Last detected as dynamic slow peer: never
-            m = p65.match(line)
+            m = self.p65.match(line)
             if m:
                 af_dict['last_detected_dynamic_slow_peer'] = m.groupdict()['val']
                 continue
 
             # Dynamic slow peer recovered: never
-            m = p66.match(line)
+            m = self.p66.match(line)
             if m:
                 af_dict['dynamic_slow_peer_recovered'] = m.groupdict()['val']
                 continue
 
             # Refresh Epoch: 3
-            m = p67.match(line)
+            m = self.p67.match(line)
             if m:
                 af_dict['refresh_epoch'] = int(m.groupdict()['num'])
                 continue
 
             # Last Sent Refresh Start-of-rib: 02:41:38
             # Last Received Refresh Start-of-rib: 02:01:36
-            m = p68.match(line)
+            m = self.p68.match(line)
             if m:
                 if 'Sent' in line:
                     af_dict['last_sent_refresh_start_of_rib'] = \
@@ -3834,7 +3837,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Last Sent Refresh End-of-rib: 02:41:38
             # Last Received Refresh End-of-rib: 02:01:32
-            m = p69.match(line)
+            m = self.p69.match(line)
             if m:
                 if 'Sent' in line:
                     af_dict['last_sent_refresh_end_of_rib'] = \
@@ -3846,7 +3849,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Refresh-Out took 0 seconds
             # Refresh-In took 4 seconds
-            m = p70.match(line)
+            m = self.p70.match(line)
             if m:
                 if m.groupdict()['type'] == 'Out':
                     af_dict['refresh_out'] = int(m.groupdict()['val'])
@@ -3855,7 +3858,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # SSO is disabled
-            m = p71.match(line)
+            m = self.p71.match(line)
             if m:
                 if m.groupdict()['state'] == 'disabled':
                     session_transport_dict['sso'] = False
@@ -3864,7 +3867,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # No active TCP connection
-            m = p72.match(line)
+            m = self.p72.match(line)
             if m:
                 session_transport_dict['tcp_connection'] = False
                 continue
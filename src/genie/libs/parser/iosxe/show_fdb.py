@@ -19,6 +19,9 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.stream import iter_lines, IncrementalParser
+from genie.libs.parser.utils.records import CompactParser
+from genie.libs.parser.utils.interning import interned
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -52,13 +55,15 @@ class ShowMacAddressTableSchema(MetaParser):
         Optional('total_mac_addresses'): int,
     }
 
-class ShowMacAddressTable(ShowMacAddressTableSchema):
+class ShowMacAddressTable(ShowMacAddressTableSchema, IncrementalParser,
+                          CompactParser):
     """Parser for show mac address-table"""
 
     cli_command = 'show mac address-table'
 
-    def cli(self,output=None):
-        if output is None:
+    @interned
+    def cli(self, output=None, output_stream=None):
+        if output is None and output_stream is None:
             # get output from device
             out = self.device.execute(self.cli_command)
         else:
@@ -80,7 +85,7 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
             ' +(?P<entry_type>\w+) +(?P<age>[\d\-\~]+) +(?P<secure>\w+) '
             '+(?P<ntfy>\w+) +(?P<intfs>(vPC )?[\w\/\,\-\(\)]+)$')
         
-        for line in out.splitlines():
+        for line in iter_lines(out, output_stream):
             line = line.strip()
 
             # Total Mac Addresses for this criterion: 93
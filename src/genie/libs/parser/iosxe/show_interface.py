@@ -45,6 +45,11 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.regex import LazyRegex
+from genie.libs.parser.utils.dispatch import LineDispatcher
+from genie.libs.parser.utils.blocks import merge_parsed
+from genie.libs.parser.utils.reparse import DifferentialParser
+from genie.libs.parser.utils.interning import interned
 
 logger = logging.getLogger(__name__)
 
@@ -178,7 +183,7 @@ class ShowInterfacesSchema(MetaParser):
     }
 
 
-class ShowInterfaces(ShowInterfacesSchema):
+class ShowInterfaces(ShowInterfacesSchema, DifferentialParser):
     """parser for show interfaces
                   show interfaces <interface>"""
 
@@ -194,6 +199,242 @@ class ShowInterfaces(ShowInterfacesSchema):
         'reliability']
 
 
+    # GigabitEthernet1 is up, line protocol is up 
+    # Port-channel12 is up, line protocol is up (connected)
+    # Vlan1 is administratively down, line protocol is down , Autostate Enabled
+    # Dialer1 is up (spoofing), line protocol is up (spoofing)
+    p1 = LazyRegex(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
+                   r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
+                   r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
+
+    p1_1 = LazyRegex(r'^(?P<interface>[\w\/\.\-]+) +is'
+                     r' +(?P<enabled>[\w\s]+),'
+                     r' +line +protocol +is +(?P<line_protocol>\w+)'
+                     r'( *, *(?P<attribute>[\w\s]+))?$')
+
+    # Hardware is Gigabit Ethernet, address is 0057.d228.1a64 (bia 0057.d228.1a64)
+    # Hardware is Loopback
+    p2 = LazyRegex(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
+                   r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
+                   r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
+
+    # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
+    p2_2 = LazyRegex(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
+                     r'(?P<mac_address>.*)(?P<phys_address>.*)')
+
+    # Description: desc
+    # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
+    p3 = LazyRegex(r'^Description: *(?P<description>.*)$')
+
+    # Secondary address 10.2.2.2/24
+    p4 = LazyRegex(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                   r'\/(?P<prefix_length>[0-9]+))$')
+
+    # Internet address is 10.4.4.4/24
+    p5 = LazyRegex(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                   r'\/(?P<prefix_length>[0-9]+))$')
+
+    # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
+    # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
+    p6 = LazyRegex(r'^MTU +(?P<mtu>[0-9]+) +bytes, +BW'
+                   r' +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?, +DLY'
+                   r' +(?P<delay>[0-9]+) +usec,$')
+
+    # reliability 255/255, txload 1/255, rxload 1/255
+    p7 = LazyRegex(r'^reliability +(?P<reliability>[\d\/]+),'
+                   r' +txload +(?P<txload>[\d\/]+), +rxload'
+                   r' +(?P<rxload>[\d\/]+)$')
+
+    # Encapsulation LOOPBACK, loopback not set
+    # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
+    # Encapsulation ARPA, medium is broadcast
+    # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
+    # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
+    # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
+    p8 = LazyRegex(r'^Encapsulation +(?P<encapsulation>[\w\s\.]+),'
+                   r' +(?P<rest>.*)$')
+
+    # Keepalive set (10 sec)
+    p10 = LazyRegex(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
+                    r' +sec\)$')
+
+    # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
+    # Full-duplex, 1000Mb/s, link type is auto, media type is
+    # Full Duplex, 1000Mbps, link type is auto, media type is RJ45
+    # Full Duplex, Auto Speed, link type is auto, media type is RJ45
+    # Full Duplex, 10000Mbps, link type is force-up, media type is unknown media type
+    # full-duplex, 1000 Mb/s
+    # auto-duplex, auto-speed
+    # auto-duplex, 10 Gb/s, media type is 10G
+    # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
+    # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
+    p11 = LazyRegex(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
+                    r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
+                    r'(S|s)peed)(?:(?:\, +link +type +is '
+                    r'+(?P<link_type>\S+))?(?:\, *media +type +is '
+                    r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$')
+
+    # input flow-control is off, output flow-control is unsupported
+    p12 = LazyRegex(r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
+                     '(output|input) +flow-control +is +(?P<send>\w+)$')
+
+    # ARP type: ARPA, ARP Timeout 04:00:00
+    p13 = LazyRegex(r'^ARP +type: +(?P<arp_type>\w+), +'
+                     'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
+
+    # Last input never, output 00:01:05, output hang never
+    p14 = LazyRegex(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+                     'output +(?P<last_output>[\w\.\:]+), '
+                     'output +hang +(?P<output_hang>[\w\.\:]+)$')
+
+    # Members in this channel: Gi1/0/2
+    # Members in this channel: Fo1/0/2 Fo1/0/4
+    p15 = LazyRegex(r'^Members +in +this +channel: +'
+                     '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')   
+
+    # No. of active members in this channel: 12 
+    p15_1 = LazyRegex(r'^No\. +of +active +members +in +this +'
+                       'channel: +(?P<active_members>\d+)$')
+
+    # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
+    p15_2 = LazyRegex(r'^Member +\d+ +: +(?P<interface>\S+) +,'
+                       ' +\S+, +\S+$')
+
+    # No. of PF_JUMBO supported members in this channel : 0
+    p15_3 = LazyRegex(r'^No\. +of +PF_JUMBO +supported +members +'
+                       'in +this +channel +: +(?P<number>\d+)$')
+
+    # Last clearing of "show interface" counters 1d02h
+    p16 = LazyRegex(r'^Last +clearing +of +\"show +interface\" +counters +'
+                     '(?P<last_clear>[\w\:\.]+)$')
+
+    # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
+    p17 = LazyRegex(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
+                     '(?P<drops>\d+)\/(?P<flushes>\d+) +'
+                     '\(size\/max\/drops\/flushes\); +'
+                     'Total +output +drops: +(?P<output_drop>\d+)$')
+
+    # Queueing strategy: fifo
+    # Queueing strategy: Class-based queueing
+    p18 = LazyRegex(r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$')
+
+    # Output queue: 0/0 (size/max)
+    # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
+    p19 = LazyRegex(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
+                     '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
+                     '+\(size\/max(?: +total\/threshold\/drops\))?.*$')
+
+    # 5 minute input rate 0 bits/sec, 0 packets/sec
+    p20 = LazyRegex(r'^(?P<load_interval>[0-9\#]+)'
+                     ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
+                     ' *(?P<in_rate>[0-9]+) *bits/sec,'
+                     ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
+
+    # 5 minute output rate 0 bits/sec, 0 packets/sec
+    p21 = LazyRegex(r'^(?P<load_interval>[0-9\#]+)'
+                     ' *(minute|second|minutes|seconds) *output *rate'
+                     ' *(?P<out_rate>[0-9]+) *bits/sec,'
+                     ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
+
+    # 0 packets input, 0 bytes, 0 no buffer
+    # 13350 packets input, 2513375 bytes
+    p22 = LazyRegex(r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
+                     '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$')
+
+    # Received 4173 broadcasts (0 IP multicasts)
+    # Received 535996 broadcasts (535961 multicasts)
+    p23 = LazyRegex(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
+                     '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+
+    # 0 runts, 0 giants, 0 throttles
+    p24 = LazyRegex(r'^(?P<in_runts>[0-9]+) *runts,'
+                     ' *(?P<in_giants>[0-9]+) *giants,'
+                     ' *(?P<in_throttles>[0-9]+) *throttles$')
+
+    # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
+    # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+    p25 = LazyRegex(r'^(?P<in_errors>[0-9]+) +input +errors, +'
+                     '(?P<in_crc_errors>[0-9]+) +CRC, +'
+                     '(?P<in_frame>[0-9]+) +frame, +'
+                     '(?P<in_overrun>[0-9]+) +overrun, +'
+                     '(?P<in_ignored>[0-9]+) +ignored'
+                     '(, *(?P<in_abort>[0-9]+) +abort)?$')
+
+    # 0 watchdog, 535961 multicast, 0 pause input
+    p26 = LazyRegex(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
+                     '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
+                     '(?P<in_pause_input>[0-9]+) +pause +input$')
+
+    # 0 input packets with dribble condition detected
+    p27 = LazyRegex(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
+                     'dribble +condition +detected$')
+
+    # 23376 packets output, 3642296 bytes, 0 underruns
+    # 13781 packets output, 2169851 bytes
+    p28 = LazyRegex(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
+                     '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
+
+    # Received 4173 broadcasts (0 IP multicasts)
+    # Received 535996 broadcasts (535961 multicasts)
+    p29 = LazyRegex(r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
+                     '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+
+    # 0 output errors, 0 collisions, 2 interface resets
+    # 0 output errors, 0 interface resets
+    p30 = LazyRegex(r'^(?P<out_errors>[0-9]+) +output +errors,'
+                     '( *(?P<out_collision>[0-9]+) +collisions,)? +'
+                     '(?P<out_interface_resets>[0-9]+) +interface +resets$')
+
+    # 0 unknown protocol drops
+    p31 = LazyRegex(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
+                     'unknown +protocol +drops$')
+
+    # 0 babbles, 0 late collision, 0 deferred
+    p32 = LazyRegex(r'^(?P<out_babble>[0-9]+) +babbles, +'
+                     '(?P<out_late_collision>[0-9]+) +late +collision, +'
+                     '(?P<out_deferred>[0-9]+) +deferred$')
+
+    # 0 lost carrier, 0 no carrier, 0 pause output
+    p33 = LazyRegex(r'^(?P<out_lost_carrier>[0-9]+) +lost +carrier, +'
+                     '(?P<out_no_carrier>[0-9]+) +no +carrier, +'
+                     '(?P<out_pause_output>[0-9]+) +pause +output$')
+
+    # 0 output buffer failures, 0 output buffers swapped out
+    p34 = LazyRegex(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
+                     '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
+
+    # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
+    # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
+    p35 = LazyRegex(r'^Interface +is +unnumbered. +Using +address +of +'
+                     '(?P<unnumbered_intf>[\w\/\.]+) +'
+                     '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
+
+    # Carrier delay is 10 sec
+    p_cd = LazyRegex(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
+
+    # Asymmetric Carrier-Delay Up Timer is 2 sec
+    # Asymmetric Carrier-Delay Down Timer is 10 sec
+    p_cd_2 = LazyRegex(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
+                        ' +Timer +is +(?P<carrier_delay>\d+).*$')
+
+    # Only try the regexes whose leading token matches the line
+    dispatcher = LineDispatcher()
+
+    # parse_blocks: one block per interface
+    block_header = ('p1', 'p1_1')
+
+    # reparse: lines changing between polls, with the lines they depend on:
+    # the lines creating the dicts they write into, the lines whose values
+    # they read and the lines writing the same keys
+    reparse_lines = [('p7', ()), ('p14', ()), ('p17', ()), ('p19', ()),
+                     ('p16', ('p20',)), ('p20', ('p16', 'p21')),
+                     ('p21', ('p20',)), ('p22', ()),
+                     ('p23', ('p22', 'p26')), ('p26', ('p22', 'p23'))] + \
+                    [(regex, ('p22',)) for regex in (
+                        'p24', 'p25', 'p27', 'p28', 'p29', 'p30', 'p31',
+                        'p32', 'p33', 'p34')]
+
+    @interned
     def cli(self,interface="",output=None):
         if output is None:
             if interface:
@@ -204,227 +445,23 @@ class ShowInterfaces(ShowInterfacesSchema):
         else:
             out = output
 
-        # GigabitEthernet1 is up, line protocol is up 
-        # Port-channel12 is up, line protocol is up (connected)
-        # Vlan1 is administratively down, line protocol is down , Autostate Enabled
-        # Dialer1 is up (spoofing), line protocol is up (spoofing)
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+)(?: '
-                        r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
-                        r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                           r' +(?P<enabled>[\w\s]+),'
-                           r' +line +protocol +is +(?P<line_protocol>\w+)'
-                           r'( *, *(?P<attribute>[\w\s]+))?$')
-
-        # Hardware is Gigabit Ethernet, address is 0057.d228.1a64 (bia 0057.d228.1a64)
-        # Hardware is Loopback
-        p2 = re.compile(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
-                        r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
-
-        # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-        p2_2 = re.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
-                          r'(?P<mac_address>.*)(?P<phys_address>.*)')
-
-        # Description: desc
-        # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p3 = re.compile(r'^Description: *(?P<description>.*)$')
-
-        # Secondary address 10.2.2.2/24
-        p4 = re.compile(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
-
-        # Internet address is 10.4.4.4/24
-        p5 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
-
-        # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
-        # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
-        p6 = re.compile(r'^MTU +(?P<mtu>[0-9]+) +bytes, +BW'
-                        r' +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?, +DLY'
-                        r' +(?P<delay>[0-9]+) +usec,$')
-
-        # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability +(?P<reliability>[\d\/]+),'
-                        r' +txload +(?P<txload>[\d\/]+), +rxload'
-                        r' +(?P<rxload>[\d\/]+)$')
-
-        # Encapsulation LOOPBACK, loopback not set
-        # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
-        # Encapsulation ARPA, medium is broadcast
-        # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
-        # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
-        # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-        p8 = re.compile(r'^Encapsulation +(?P<encapsulation>[\w\s\.]+),'
-                        r' +(?P<rest>.*)$')
-            
-        # Keepalive set (10 sec)
-        p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
-                        r' +sec\)$')
-
-
-        # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
-        # Full-duplex, 1000Mb/s, link type is auto, media type is
-        # Full Duplex, 1000Mbps, link type is auto, media type is RJ45
-        # Full Duplex, Auto Speed, link type is auto, media type is RJ45
-        # Full Duplex, 10000Mbps, link type is force-up, media type is unknown media type
-        # full-duplex, 1000 Mb/s
-        # auto-duplex, auto-speed
-        # auto-duplex, 10 Gb/s, media type is 10G
-        # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
-        # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-        p11 = re.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
-                         r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
-                         r'(S|s)peed)(?:(?:\, +link +type +is '
-                         r'+(?P<link_type>\S+))?(?:\, *media +type +is '
-                         r'*(?P<media_type>[\w\/\- ]+)?)(?: +media +type)?)?$')
-
-        # input flow-control is off, output flow-control is unsupported
-        p12 = re.compile(r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
-                          '(output|input) +flow-control +is +(?P<send>\w+)$')
-
-        # ARP type: ARPA, ARP Timeout 04:00:00
-        p13 = re.compile(r'^ARP +type: +(?P<arp_type>\w+), +'
-                          'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
-
-        # Last input never, output 00:01:05, output hang never
-        p14 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+), '
-                          'output +hang +(?P<output_hang>[\w\.\:]+)$')
-
-        # Members in this channel: Gi1/0/2
-        # Members in this channel: Fo1/0/2 Fo1/0/4
-        p15 = re.compile(r'^Members +in +this +channel: +'
-                          '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')   
-
-        # No. of active members in this channel: 12 
-        p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
-                            'channel: +(?P<active_members>\d+)$')
-
-        # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-        p15_2 = re.compile(r'^Member +\d+ +: +(?P<interface>\S+) +,'
-                            ' +\S+, +\S+$')
-
-        # No. of PF_JUMBO supported members in this channel : 0
-        p15_3 = re.compile(r'^No\. +of +PF_JUMBO +supported +members +'
-                            'in +this +channel +: +(?P<number>\d+)$')
-
-        # Last clearing of "show interface" counters 1d02h
-        p16 = re.compile(r'^Last +clearing +of +\"show +interface\" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
-
-        # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-        p17 = re.compile(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
-                          '(?P<drops>\d+)\/(?P<flushes>\d+) +'
-                          '\(size\/max\/drops\/flushes\); +'
-                          'Total +output +drops: +(?P<output_drop>\d+)$')
-
-        # Queueing strategy: fifo
-        # Queueing strategy: Class-based queueing
-        p18 = re.compile(r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$')
-
-        # Output queue: 0/0 (size/max)
-        # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-        p19 = re.compile(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
-                          '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
-                          '+\(size\/max(?: +total\/threshold\/drops\))?.*$')
-
-        # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p20 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
-                          ' *(?P<in_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
-
-        # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(minute|second|minutes|seconds) *output *rate'
-                          ' *(?P<out_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
-
-        # 0 packets input, 0 bytes, 0 no buffer
-        # 13350 packets input, 2513375 bytes
-        p22 = re.compile(r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
-                          '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$')
-
-        # Received 4173 broadcasts (0 IP multicasts)
-        # Received 535996 broadcasts (535961 multicasts)
-        p23 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
-
-        # 0 runts, 0 giants, 0 throttles
-        p24 = re.compile(r'^(?P<in_runts>[0-9]+) *runts,'
-                          ' *(?P<in_giants>[0-9]+) *giants,'
-                          ' *(?P<in_throttles>[0-9]+) *throttles$')
-
-        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
-        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p25 = re.compile(r'^(?P<in_errors>[0-9]+) +input +errors, +'
-                          '(?P<in_crc_errors>[0-9]+) +CRC, +'
-                          '(?P<in_frame>[0-9]+) +frame, +'
-                          '(?P<in_overrun>[0-9]+) +overrun, +'
-                          '(?P<in_ignored>[0-9]+) +ignored'
-                          '(, *(?P<in_abort>[0-9]+) +abort)?$')
-
-        # 0 watchdog, 535961 multicast, 0 pause input
-        p26 = re.compile(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
-                          '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
-                          '(?P<in_pause_input>[0-9]+) +pause +input$')
-
-        # 0 input packets with dribble condition detected
-        p27 = re.compile(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
-                          'dribble +condition +detected$')
-
-        # 23376 packets output, 3642296 bytes, 0 underruns
-        # 13781 packets output, 2169851 bytes
-        p28 = re.compile(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
-                          '+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
-
-        # Received 4173 broadcasts (0 IP multicasts)
-        # Received 535996 broadcasts (535961 multicasts)
-        p29 = re.compile(r'^Received +(?P<out_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
-
-        # 0 output errors, 0 collisions, 2 interface resets
-        # 0 output errors, 0 interface resets
-        p30 = re.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
-                          '( *(?P<out_collision>[0-9]+) +collisions,)? +'
-                          '(?P<out_interface_resets>[0-9]+) +interface +resets$')
-
-        # 0 unknown protocol drops
-        p31 = re.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
-                          'unknown +protocol +drops$')
-
-        # 0 babbles, 0 late collision, 0 deferred
-        p32 = re.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
-                          '(?P<out_late_collision>[0-9]+) +late +collision, +'
-                          '(?P<out_deferred>[0-9]+) +deferred$')
-
-        # 0 lost carrier, 0 no carrier, 0 pause output
-        p33 = re.compile(r'^(?P<out_lost_carrier>[0-9]+) +lost +carrier, +'
-                          '(?P<out_no_carrier>[0-9]+) +no +carrier, +'
-                          '(?P<out_pause_output>[0-9]+) +pause +output$')
-
-        # 0 output buffer failures, 0 output buffers swapped out
-        p34 = re.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
-                          '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
-
-        # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
-        # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-        p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                          '(?P<unnumbered_intf>[\w\/\.]+) +'
-                          '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
+        interface_dict, unnumbered_dict = self._parse_interfaces(out)
+        return self._add_unnumbered(interface_dict, unnumbered_dict)
+
+    def _parse_interfaces(self, out):
         interface_dict = {}
         unnumbered_dict = {}
         for line in out.splitlines():
             line = line.strip()
+            matches = self.dispatcher.match(line)
             
             # GigabitEthernet1 is up, line protocol is up 
             # Port-channel12 is up, line protocol is up (connected)
             # Vlan1 is administratively down, line protocol is down , Autostate Enabled
             # Dialer1 is up (spoofing), line protocol is up (spoofing)
 
-            m = p1.match(line)
-            m1 = p1_1.match(line)
+            m = matches.get('p1')
+            m1 = matches.get('p1_1')
             m = m if m else m1
             if m:
                 interface = m.groupdict()['interface']
@@ -464,10 +501,10 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Hardware is Gigabit Ethernet, address is 0057.d228.1a64 (bia 0057.d228.1a64)
             # Hardware is Loopback
-            m = p2.match(line)
+            m = matches.get('p2')
 
             # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS 
-            m1 = p2_2.match(line)
+            m1 = matches.get('p2_2')
             m = m if m else m1
             if m:
                 types = m.groupdict()['type']
@@ -481,7 +518,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             # Description: desc
             # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-            m = p3.match(line)
+            m = matches.get('p3')
             if m:
                 description = m.groupdict()['description']
 
@@ -489,7 +526,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Secondary address 10.2.2.2/24
-            m = p4.match(line)
+            m = matches.get('p4')
             if m:
                 ip_sec = m.groupdict()['ip']
                 prefix_length_sec = m.groupdict()['prefix_length']
@@ -509,7 +546,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Internet Address is 10.4.4.4/24
-            m = p5.match(line)
+            m = matches.get('p5')
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -528,7 +565,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             
             # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
             # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec, 
-            m = p6.match(line)
+            m = matches.get('p6')
             if m:
                 mtu = m.groupdict()['mtu']
                 bandwidth = m.groupdict()['bandwidth']
@@ -541,7 +578,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
+            m = matches.get('p7')
             if m:
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
@@ -557,7 +594,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-            m = p8.match(line)
+            m = matches.get('p8')
             if m:
                 encapsulation = m.groupdict()['encapsulation']
                 encapsulation = m.groupdict()['encapsulation'].lower()
@@ -606,7 +643,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Keepalive set (10 sec)
-            m = p10.match(line)
+            m = matches.get('p10')
             if m:
                 keepalive = m.groupdict()['keepalive']
                 if keepalive:
@@ -623,7 +660,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # auto-duplex, 10 Gb/s, media type is 10G
             # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
             # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
-            m = p11.match(line)
+            m = matches.get('p11')
             if m:
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed'].lower().replace('-speed', '')
@@ -647,7 +684,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # input flow-control is off, output flow-control is unsupported
-            m = p12.match(line)
+            m = matches.get('p12')
             if m:
                 receive = m.groupdict()['receive'].lower()
                 send = m.groupdict()['send'].lower()
@@ -665,8 +702,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Carrier delay is 10 sec
-            p_cd = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd.match(line)
+            m = matches.get('p_cd')
             if m:
                 group = m.groupdict()
                 sub_dict = interface_dict.setdefault(interface, {})
@@ -674,9 +710,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Asymmetric Carrier-Delay Up Timer is 2 sec
             # Asymmetric Carrier-Delay Down Timer is 10 sec
-            p_cd_2 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
-                                 ' +Timer +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd_2.match(line)
+            m = matches.get('p_cd_2')
             if m:
                 group = m.groupdict()
                 tp = group['type'].lower()
@@ -687,7 +721,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                     sub_dict['carrier_delay_down'] = int(group['carrier_delay'])
 
             # ARP type: ARPA, ARP Timeout 04:00:00
-            m = p13.match(line)
+            m = matches.get('p13')
             if m:
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
@@ -696,7 +730,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05, output hang never
-            m = p14.match(line)
+            m = matches.get('p14')
             if m:
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
@@ -708,7 +742,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Members in this channel: Gi1/0/2
             # Members in this channel: Fo1/0/2 Fo1/0/4
-            m = p15.match(line)
+            m = matches.get('p15')
             if m:
                 interface_dict[interface]['port_channel']\
                     ['port_channel_member'] = True
@@ -728,7 +762,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of active members in this channel: 12 
-            m = p15_1.match(line)
+            m = matches.get('p15_1')
             if m:
                 group = m.groupdict()
                 active_members = int(group['active_members'])
@@ -739,7 +773,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-            m = p15_2.match(line)
+            m = matches.get('p15_2')
             if m:
                 group = m.groupdict()
                 intf = group['interface']
@@ -753,7 +787,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of PF_JUMBO supported members in this channel : 0
-            m = p15_3.match(line)
+            m = matches.get('p15_3')
             if m:
                 group = m.groupdict()
                 number = int(group['number'])
@@ -762,13 +796,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p16.match(line)
+            m = matches.get('p16')
             if m:                
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-            m = p17.match(line)
+            m = matches.get('p17')
             if m:
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
@@ -787,7 +821,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Queueing strategy: fifo
             # Queueing strategy: Class-based queueing
-            m = p18.match(line)
+            m = matches.get('p18')
             if m:
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
@@ -797,7 +831,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Output queue: 0/0 (size/max)
             # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-            m = p19.match(line)
+            m = matches.get('p19')
             if m:
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
@@ -813,7 +847,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p20.match(line)
+            m = matches.get('p20')
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
@@ -847,7 +881,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p21.match(line)
+            m = matches.get('p21')
             if m:
                 out_rate = int(m.groupdict()['out_rate'])
                 out_rate_pkts = int(m.groupdict()['out_rate_pkts'])
@@ -859,7 +893,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 no buffer
-            m = p22.match(line)
+            m = matches.get('p22')
             if m:
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
@@ -875,7 +909,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p23.match(line)
+            m = matches.get('p23')
             if m:
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
                     int(m.groupdict()['in_broadcast_pkts'])
@@ -884,7 +918,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles
-            m = p24.match(line)
+            m = matches.get('p24')
             if m:
                 interface_dict[interface]['counters']['in_runts'] = \
                     int(m.groupdict()['in_runts'])
@@ -896,7 +930,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p25.match(line)
+            m = matches.get('p25')
             if m:
                 interface_dict[interface]['counters']['in_errors'] = \
                     int(m.groupdict()['in_errors'])
@@ -914,7 +948,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 watchdog, 535961 multicast, 0 pause input
-            m = p26.match(line)
+            m = matches.get('p26')
             if m:
                 interface_dict[interface]['counters']['in_watchdog'] = \
                     int(m.groupdict()['in_watchdog'])
@@ -925,14 +959,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 input packets with dribble condition detected
-            m = p27.match(line)
+            m = matches.get('p27')
             if m:
                 interface_dict[interface]['counters']['in_with_dribble'] = \
                     int(m.groupdict()['in_with_dribble'])
                 continue
 
             # 23376 packets output, 3642296 bytes, 0 underruns
-            m = p28.match(line)
+            m = matches.get('p28')
             if m:
                 interface_dict[interface]['counters']['out_pkts'] = \
                     int(m.groupdict()['out_pkts'])
@@ -945,7 +979,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p29.match(line)
+            m = matches.get('p29')
             if m:
                 interface_dict[interface]['counters']['out_broadcast_pkts'] = \
                     int(m.groupdict()['out_broadcast_pkts'])
@@ -955,7 +989,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 output errors, 0 collisions, 2 interface resets
             # 0 output errors, 0 interface resets
-            m = p30.match(line)
+            m = matches.get('p30')
             if m:
                 interface_dict[interface]['counters']['out_errors'] = \
                     int(m.groupdict()['out_errors'])
@@ -967,14 +1001,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 unknown protocol drops
-            m = p31.match(line)
+            m = matches.get('p31')
             if m:
                 interface_dict[interface]['counters']['out_unknown_protocl_drops'] = \
                     int(m.groupdict()['out_unknown_protocl_drops'])
                 continue
 
             # 0 babbles, 0 late collision, 0 deferred
-            m = p32.match(line)
+            m = matches.get('p32')
             if m:
                 interface_dict[interface]['counters']['out_babble'] = \
                     int(m.groupdict()['out_babble'])
@@ -985,7 +1019,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 lost carrier, 0 no carrier, 0 pause output
-            m = p33.match(line)
+            m = matches.get('p33')
             if m:
                 interface_dict[interface]['counters']['out_lost_carrier'] = \
                     int(m.groupdict()['out_lost_carrier'])
@@ -996,7 +1030,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p34.match(line)
+            m = matches.get('p34')
             if m:
                 interface_dict[interface]['counters']['out_buffer_failure'] = \
                     int(m.groupdict()['out_buffer_failure'])
@@ -1006,13 +1040,16 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
             # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-            m = p35.match(line)
+            m = matches.get('p35')
             if m:
                 unnumbered_dict[interface] = {}
                 unnumbered_dict[interface]['unnumbered_intf'] = m.groupdict()['unnumbered_intf']
                 unnumbered_dict[interface]['unnumbered_ip'] = m.groupdict()['unnumbered_ip']
                 continue
 
+        return interface_dict, unnumbered_dict
+
+    def _add_unnumbered(self, interface_dict, unnumbered_dict):
         # create strucutre for unnumbered interface
         if not unnumbered_dict:
             return(interface_dict)
@@ -1036,6 +1073,25 @@ class ShowInterfaces(ShowInterfacesSchema):
                                 ['interface_ref'] = unnumbered_intf
         return(interface_dict)
 
+    def parse_block(self, block, **kwargs):
+        # Unnumbered interfaces are resolved once all the blocks are merged
+        return self._parse_interfaces(block)
+
+    def merge_blocks(self, parsed_blocks):
+        interface_dict = {}
+        unnumbered_dict = {}
+        for interfaces, unnumbered in parsed_blocks:
+            for intf, intf_dict in interfaces.items():
+                # Interfaces are not members until a port-channel lists them,
+                # whichever block comes first
+                if intf in interface_dict and intf_dict.get(
+                        'port_channel', {}).get('port_channel_member') is False:
+                    del intf_dict['port_channel']['port_channel_member']
+            merge_parsed(interface_dict, interfaces)
+            unnumbered_dict.update(unnumbered)
+
+        return self._add_unnumbered(interface_dict, unnumbered_dict)
+
 
 # parser using parsergen
 # ----------------------
@@ -1795,6 +1851,186 @@ class ShowIpInterface(ShowIpInterfaceSchema):
     cli_command = ['show ip interface','show ip interface {interface}']
     exclude = ['unnumbered', 'address_determined_by', '(Tunnel.*)', 'joins', 'leaves']
 
+    # Vlan211 is up, line protocol is up
+    # GigabitEthernet2 is administratively down, line protocol is down
+    p1 = LazyRegex(r'^(?P<interface>[\w\/\.\-]+) +is'
+                    ' +(?P<enabled>[\w\s]+),'
+                    ' +line +protocol +is +(?P<oper_status>\w+)$')
+
+    # Internet address is 192.168.76.1/24
+    p2 = LazyRegex(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                    '\/(?P<prefix_length>[0-9]+))$')
+
+    # Secondary address 10.2.2.2/24
+    p2_1 = LazyRegex(r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
+                     '\/(?P<prefix_length>[0-9]+))$')
+
+    # Internet address will be negotiated using DHCP
+    p2_2 = LazyRegex(r'^Internet +[A|a]ddress +will +be +negotiated +using +DHCP$')
+
+    # Broadcast address is 255.255.255.255
+    p3 = LazyRegex(r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$')
+
+    # MTU is 1500 bytes
+    p4 = LazyRegex(r'^MTU +is +(?P<mtu>\d+) +bytes$')
+
+    # Helper address is not set
+    p5 = LazyRegex(r'^Helper +address +is +(?P<address>[\w\.\:\s]+)$')
+
+    # Directed broadcast forwarding is disabled
+    p6 = LazyRegex(r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$')
+
+    # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
+    p41 = LazyRegex(r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$')
+
+    # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
+    p41_1 = LazyRegex(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
+
+    # Outgoing Common access list is not set 
+    p7 = LazyRegex(r'^Outgoing +Common +access +list +is +'
+                    '(?P<access_list>[\w\s]+)$')
+
+    # Outgoing access list is not set
+    p8 = LazyRegex(r'^Outgoing +access +list +is +'
+                    '(?P<access_list>[\w\s]+)$')
+
+    # Inbound Common access list is not set
+    p9 = LazyRegex(r'^Inbound +Common +access +list +is +'
+                    '(?P<access_list>[\w\s]+)$')
+
+    # Inbound  access list is not set
+    p10 = LazyRegex(r'^Outgoing +access +list +is +'
+                    '(?P<access_list>[\w\s]+)$')
+
+    # Proxy ARP is enabled
+    p11 = LazyRegex(r'^Proxy +ARP +is +'
+                    '(?P<status>\w+)$')
+
+    # Local Proxy ARP is disabled
+    p12 = LazyRegex(r'^Local +Proxy +ARP +is +'
+                    '(?P<status>\w+)$')
+
+    # Security level is default
+    p13 = LazyRegex(r'^Security +level +is +'
+                    '(?P<level>\w+)$')
+
+    # Split horizon is enabled
+    p14 = LazyRegex(r'^Split +horizon +is +'
+                    '(?P<status>\w+)$')
+
+    # ICMP redirects are always sent
+    p15 = LazyRegex(r'^ICMP +redirects +are +'
+                    '(?P<sent>[\w\s]+)$')
+
+    # ICMP unreachables are always sent
+    p16 = LazyRegex(r'^ICMP +unreachables +are +'
+                    '(?P<sent>[\w\s]+)$')
+
+    # ICMP mask replies are never sent
+    p17 = LazyRegex(r'^ICMP +mask +replies +are +'
+                    '(?P<sent>[\w\s]+)$')
+
+    # IP fast switching is enabled
+    p18 = LazyRegex(r'^IP +fast +switching +is +'
+                    '(?P<status>\w+)$')
+
+    # IP Flow switching is disabled
+    p19 = LazyRegex(r'^IP +Flow +switching +is +'
+                    '(?P<status>\w+)$')
+
+    # IP CEF switching is enabled
+    p20 = LazyRegex(r'^IP +CEF +switching +is +'
+                    '(?P<status>\w+)$')
+
+    # IP CEF switching turbo vector
+    p21 = LazyRegex(r'^IP +CEF +switching +turbo +vector$')
+
+    # IP Null turbo vector
+    p22 = LazyRegex(r'^IP +Null +turbo +vector$')
+
+    # VPN Routing/Forwarding "Mgmt-vrf"
+    p23 = LazyRegex(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
+
+    # Associated unicast routing topologies:
+    #     Topology "base", operation state is UP
+    p24 = LazyRegex(r'^Associated +unicast +routing +topologies:$')
+
+    p24_1 = LazyRegex(r'^Topology +\"(?P<topo>\w+)\", +'
+                       'operation +state +is +(?P<topo_status>\w+)$')
+
+    # IP multicast fast switching is disabled
+    p25 = LazyRegex(r'^IP +multicast +fast +switching +is +'
+                    '(?P<status>\w+)$')
+
+    # IP multicast distributed fast switching is disabled
+    p25_1 = LazyRegex(r'^IP +multicast +distributed +fast +switching +is +'
+                      '(?P<status>\w+)$')
+
+    # IP route-cache flags are Fast, CEF
+    p26 = LazyRegex(r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$')
+
+    # Router Discovery is disabled
+    p27 = LazyRegex(r'^Router +Discovery +is +'
+                    '(?P<status>\w+)$')
+
+    # IP output packet accounting is disabled
+    p28 = LazyRegex(r'^IP +output +packet +accounting +is +'
+                    '(?P<status>\w+)$')
+
+    # IP access violation accounting is disabled
+    p29 = LazyRegex(r'^IP +access +violation +accounting +is +'
+                    '(?P<status>\w+)$')
+
+    # TCP/IP header compression is disabled
+    p30 = LazyRegex(r'^TCP\/IP +header +compression +is +'
+                    '(?P<status>\w+)$')
+
+    # RTP/IP header compression is disabled
+    p31 = LazyRegex(r'^RTP\/IP +header +compression +is +'
+                    '(?P<status>\w+)$')
+
+    # Probe proxy name replies are disabled
+    p32 = LazyRegex(r'^Probe +proxy +name +replies +are +'
+                    '(?P<status>\w+)$')
+
+    # Policy routing is disabled
+    p33 = LazyRegex(r'^Policy +routing +is +'
+                    '(?P<status>\w+)$')
+
+    # Network address translation is disabled
+    p34 = LazyRegex(r'^Network +address +translation +is +'
+                    '(?P<status>\w+)$')
+
+    # BGP Policy Mapping is disabled
+    p35 = LazyRegex(r'^BGP +Policy +Mapping +is +'
+                    '(?P<status>\w+)$')
+
+    # Address determined by configuration file
+    # Address determined by non-volatile memory
+    p36 = LazyRegex(r'^Address +determined +by +(?P<file>[\w\s\-]+)$')
+
+    # Input features: MCI Check
+    # Input features: QoS Classification, QoS Marking, MCI Check
+    p36_1 = LazyRegex(r'^Input +features: +(?P<input_feature>[\w\s\,]+)$')
+
+    # IPv4 WCCP Redirect outbound is disable
+    p37 = LazyRegex(r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$')
+
+    # IPv4 WCCP Redirect inbound is disabled
+    p38 = LazyRegex(r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$')
+
+    # IPv4 WCCP Redirect exclude is disabled
+    p39 = LazyRegex(r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$')
+
+    # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
+    p40 = LazyRegex(r'^Interface +is +unnumbered. +Using +address +of +'
+                     '(?P<unnumbered_intf>[\w\/\-\.]+) +'
+                     '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
+
+    # Only try the regexes whose leading token matches the line, p41_1 is
+    # used with findall
+    dispatcher = LineDispatcher(exclude=['p41_1'])
+
     def cli(self,interface="",output=None):
         if output is None:
             if interface:
@@ -1809,13 +2045,11 @@ class ShowIpInterface(ShowIpInterfaceSchema):
         unnumbered_dict = {}
         for line in out.splitlines():
             line = line.strip()
+            matches = self.dispatcher.match(line)
 
             # Vlan211 is up, line protocol is up
             # GigabitEthernet2 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-]+) +is'
-                              ' +(?P<enabled>[\w\s]+),'
-                              ' +line +protocol +is +(?P<oper_status>\w+)$')
-            m = p1.match(line)
+            m = matches.get('p1')
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled'].lower()
@@ -1833,9 +2067,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Internet address is 192.168.76.1/24
-            p2 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                             '\/(?P<prefix_length>[0-9]+))$')
-            m = p2.match(line)
+            m = matches.get('p2')
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -1855,9 +2087,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Secondary address 10.2.2.2/24
-            p2_1 = re.compile(r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                             '\/(?P<prefix_length>[0-9]+))$')
-            m = p2_1.match(line)
+            m = matches.get('p2_1')
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -1876,8 +2106,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     ['secondary'] = True
                 continue
             # Internet address will be negotiated using DHCP
-            p2_2 = re.compile(r'^Internet +[A|a]ddress +will +be +negotiated +using +DHCP$')
-            m = p2_2.match(line)
+            m = matches.get('p2_2')
             if m:
                 address='dhcp_negotiated'
                 ipv4_dict = interface_dict[interface].setdefault('ipv4',{})
@@ -1886,8 +2115,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Broadcast address is 255.255.255.255
-            p3 = re.compile(r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$')
-            m = p3.match(line)
+            m = matches.get('p3')
             if m:
                 interface_dict[interface]['ipv4'][address]['broadcase_address'] = \
                     m.groupdict()['address']
@@ -1895,24 +2123,21 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
             # Address determined by configuration file
             # Address determined by non-volatile memory
-            p36 = re.compile(r'^Address +determined +by +(?P<file>[\w\s\-]+)$')
-            m = p36.match(line)
+            m = matches.get('p36')
             if m:
                 interface_dict[interface]['address_determined_by'] = \
                     m.groupdict()['file']
                 continue
 
             # MTU is 1500 bytes
-            p4 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
-            m = p4.match(line)
+            m = matches.get('p4')
             if m:
                 interface_dict[interface]['mtu'] = \
                     int(m.groupdict()['mtu'])
                 continue
 
             # Helper address is not set
-            p5 = re.compile(r'^Helper +address +is +(?P<address>[\w\.\:\s]+)$')
-            m = p5.match(line)
+            m = matches.get('p5')
             if m:
                 if 'not set' not in m.groupdict()['address']:
                     interface_dict[interface]['helper_address'] = \
@@ -1920,8 +2145,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Directed broadcast forwarding is disabled
-            p6 = re.compile(r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$')
-            m = p6.match(line)
+            m = matches.get('p6')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['directed_broadcast_forwarding'] = False
@@ -1930,8 +2154,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
-            p41 = re.compile(r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$')
-            m = p41.match(line)
+            m = matches.get('p41')
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups'])
 
@@ -1943,8 +2166,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
-            p41_1 = re.compile(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
-            m = p41_1.findall(line)
+            m = self.p41_1.findall(line)
             if m and multicast_groups:
                 multicast_groups.extend(m)
                 interface_dict[interface]['multicast_groups']\
@@ -1952,9 +2174,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Outgoing Common access list is not set 
-            p7 = re.compile(r'^Outgoing +Common +access +list +is +'
-                             '(?P<access_list>[\w\s]+)$')
-            m = p7.match(line)
+            m = matches.get('p7')
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['out_common_access_list'] = \
@@ -1962,9 +2182,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Outgoing access list is not set
-            p8 = re.compile(r'^Outgoing +access +list +is +'
-                             '(?P<access_list>[\w\s]+)$')
-            m = p8.match(line)
+            m = matches.get('p8')
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['out_access_list'] = \
@@ -1972,9 +2190,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Inbound Common access list is not set
-            p9 = re.compile(r'^Inbound +Common +access +list +is +'
-                             '(?P<access_list>[\w\s]+)$')
-            m = p9.match(line)
+            m = matches.get('p9')
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['inbound_common_access_list'] = \
@@ -1982,9 +2198,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Inbound  access list is not set
-            p10 = re.compile(r'^Outgoing +access +list +is +'
-                             '(?P<access_list>[\w\s]+)$')
-            m = p10.match(line)
+            m = matches.get('p10')
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['inbound_access_list'] = \
@@ -1992,9 +2206,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Proxy ARP is enabled
-            p11 = re.compile(r'^Proxy +ARP +is +'
-                             '(?P<status>\w+)$')
-            m = p11.match(line)
+            m = matches.get('p11')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['proxy_arp'] = False
@@ -2003,9 +2215,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Local Proxy ARP is disabled
-            p12 = re.compile(r'^Local +Proxy +ARP +is +'
-                             '(?P<status>\w+)$')
-            m = p12.match(line)
+            m = matches.get('p12')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['local_proxy_arp'] = False
@@ -2014,17 +2224,13 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Security level is default
-            p13 = re.compile(r'^Security +level +is +'
-                             '(?P<level>\w+)$')
-            m = p13.match(line)
+            m = matches.get('p13')
             if m:
                 interface_dict[interface]['sevurity_level'] = m.groupdict()['level']
                 continue
 
             # Split horizon is enabled
-            p14 = re.compile(r'^Split +horizon +is +'
-                             '(?P<status>\w+)$')
-            m = p14.match(line)
+            m = matches.get('p14')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['split_horizon'] = False
@@ -2033,9 +2239,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # ICMP redirects are always sent
-            p15 = re.compile(r'^ICMP +redirects +are +'
-                             '(?P<sent>[\w\s]+)$')
-            m = p15.match(line)
+            m = matches.get('p15')
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2045,9 +2249,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # ICMP unreachables are always sent
-            p16 = re.compile(r'^ICMP +unreachables +are +'
-                             '(?P<sent>[\w\s]+)$')
-            m = p16.match(line)
+            m = matches.get('p16')
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2057,9 +2259,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # ICMP mask replies are never sent
-            p17 = re.compile(r'^ICMP +mask +replies +are +'
-                             '(?P<sent>[\w\s]+)$')
-            m = p17.match(line)
+            m = matches.get('p17')
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2069,9 +2269,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP fast switching is enabled
-            p18 = re.compile(r'^IP +fast +switching +is +'
-                             '(?P<status>\w+)$')
-            m = p18.match(line)
+            m = matches.get('p18')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_fast_switching'] = False
@@ -2080,9 +2278,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP Flow switching is disabled
-            p19 = re.compile(r'^IP +Flow +switching +is +'
-                             '(?P<status>\w+)$')
-            m = p19.match(line)
+            m = matches.get('p19')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_flow_switching'] = False
@@ -2091,9 +2287,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP CEF switching is enabled
-            p20 = re.compile(r'^IP +CEF +switching +is +'
-                             '(?P<status>\w+)$')
-            m = p20.match(line)
+            m = matches.get('p20')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_cef_switching'] = False
@@ -2102,38 +2296,32 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP CEF switching turbo vector
-            p21 = re.compile(r'^IP +CEF +switching +turbo +vector$')
-            m = p21.match(line)
+            m = matches.get('p21')
             if m:
                 interface_dict[interface]['ip_cef_switching_turbo_vector'] = True
                 continue
 
             # IP Null turbo vector
-            p22 = re.compile(r'^IP +Null +turbo +vector$')
-            m = p22.match(line)
+            m = matches.get('p22')
             if m:
                 interface_dict[interface]['ip_null_turbo_vector'] = True
                 continue
 
             # VPN Routing/Forwarding "Mgmt-vrf"
-            p23 = re.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
-            m = p23.match(line)
+            m = matches.get('p23')
             if m:
                 interface_dict[interface]['vrf'] = m.groupdict()['vrf']
                 continue
 
             # Associated unicast routing topologies:
             #     Topology "base", operation state is UP
-            p24 = re.compile(r'^Associated +unicast +routing +topologies:$')
-            m = p24.match(line)
+            m = matches.get('p24')
             if m:
                 if 'unicast_routing_topologies' not in interface_dict[interface]:
                     interface_dict[interface]['unicast_routing_topologies'] = {}
                 continue
 
-            p24_1 = re.compile(r'^Topology +\"(?P<topo>\w+)\", +'
-                                'operation +state +is +(?P<topo_status>\w+)$')
-            m = p24_1.match(line)
+            m = matches.get('p24_1')
             if m:
                 if 'unicast_routing_topologies' in interface_dict[interface]:
                     if 'topology' not in interface_dict[interface]\
@@ -2149,9 +2337,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP multicast fast switching is disabled
-            p25 = re.compile(r'^IP +multicast +fast +switching +is +'
-                             '(?P<status>\w+)$')
-            m = p25.match(line)
+            m = matches.get('p25')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_multicast_fast_switching'] = False
@@ -2160,9 +2346,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP multicast distributed fast switching is disabled
-            p25 = re.compile(r'^IP +multicast +distributed +fast +switching +is +'
-                             '(?P<status>\w+)$')
-            m = p25.match(line)
+            m = matches.get('p25_1')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_multicast_distributed_fast_switching'] = False
@@ -2171,8 +2355,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP route-cache flags are Fast, CEF
-            p26 = re.compile(r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$')
-            m = p26.match(line)
+            m = matches.get('p26')
             if m:
                 ret = m.groupdict()['flags'].split(',')
                 ret = [i.strip() for i in ret]
@@ -2180,9 +2363,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Router Discovery is disabled
-            p27 = re.compile(r'^Router +Discovery +is +'
-                             '(?P<status>\w+)$')
-            m = p27.match(line)
+            m = matches.get('p27')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['router_discovery'] = False
@@ -2191,9 +2372,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP output packet accounting is disabled
-            p28 = re.compile(r'^IP +output +packet +accounting +is +'
-                             '(?P<status>\w+)$')
-            m = p28.match(line)
+            m = matches.get('p28')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_output_packet_accounting'] = False
@@ -2202,9 +2381,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IP access violation accounting is disabled
-            p29 = re.compile(r'^IP +access +violation +accounting +is +'
-                             '(?P<status>\w+)$')
-            m = p29.match(line)
+            m = matches.get('p29')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_access_violation_accounting'] = False
@@ -2213,9 +2390,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # TCP/IP header compression is disabled
-            p30 = re.compile(r'^TCP\/IP +header +compression +is +'
-                             '(?P<status>\w+)$')
-            m = p30.match(line)
+            m = matches.get('p30')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['tcp_ip_header_compression'] = False
@@ -2224,9 +2399,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # RTP/IP header compression is disabled
-            p31 = re.compile(r'^RTP\/IP +header +compression +is +'
-                             '(?P<status>\w+)$')
-            m = p31.match(line)
+            m = matches.get('p31')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['rtp_ip_header_compression'] = False
@@ -2235,9 +2408,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Probe proxy name replies are disabled
-            p32 = re.compile(r'^Probe +proxy +name +replies +are +'
-                             '(?P<status>\w+)$')
-            m = p32.match(line)
+            m = matches.get('p32')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['probe_proxy_name_replies'] = False
@@ -2246,9 +2417,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Policy routing is disabled
-            p33 = re.compile(r'^Policy +routing +is +'
-                             '(?P<status>\w+)$')
-            m = p33.match(line)
+            m = matches.get('p33')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['policy_routing'] = False
@@ -2257,9 +2426,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # Network address translation is disabled
-            p34 = re.compile(r'^Network +address +translation +is +'
-                             '(?P<status>\w+)$')
-            m = p34.match(line)
+            m = matches.get('p34')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['network_address_translation'] = False
@@ -2268,9 +2435,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # BGP Policy Mapping is disabled
-            p35 = re.compile(r'^BGP +Policy +Mapping +is +'
-                             '(?P<status>\w+)$')
-            m = p35.match(line)
+            m = matches.get('p35')
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['bgp_policy_mapping'] = False
@@ -2280,8 +2445,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
             # Input features: MCI Check
             # Input features: QoS Classification, QoS Marking, MCI Check
-            p36 = re.compile(r'^Input +features: +(?P<input_feature>[\w\s\,]+)$')
-            m = p36.match(line)
+            m = matches.get('p36_1')
             if m:
                 features = m.groupdict()['input_feature'].split(',')
                 features = [i.strip() for i in features]
@@ -2289,8 +2453,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IPv4 WCCP Redirect outbound is disable
-            p37 = re.compile(r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$')
-            m = p37.match(line)
+            m = matches.get('p37')
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2303,8 +2466,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 continue
 
             # IPv4 WCCP Redirect inbound is disabled
-            p38 = re.compile(r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$')
-            m = p38.match(line)
+            m = matches.get('p38')
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2316,8 +2478,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['redirect_inbound'] = True
 
             # IPv4 WCCP Redirect exclude is disabled
-            p39 = re.compile(r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$')
-            m = p39.match(line)
+            m = matches.get('p39')
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2329,10 +2490,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['redirect_exclude'] = True
 
             # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
-            p40 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                              '(?P<unnumbered_intf>[\w\/\-\.]+) +'
-                              '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-            m = p40.match(line)
+            m = matches.get('p40')
             if m:
                 unnumbered_dict[interface] = {}
                 unnumbered_intf = m.groupdict()['unnumbered_intf']
@@ -11,6 +11,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# Parser utils
+from genie.libs.parser.utils.log_tail import TailParser
+
 
 # ==============================================
 # Schema for:
@@ -33,7 +36,7 @@ class ShowLoggingSchema(MetaParser):
 #   * 'show logging'
 #   * 'show logging | include {include}'
 # ==============================================
-class ShowLogging(ShowLoggingSchema):
+class ShowLogging(ShowLoggingSchema, TailParser):
     '''Parser for:
         * 'show logging'
         * 'show logging | include {include}'
@@ -42,6 +45,15 @@ class ShowLogging(ShowLoggingSchema):
     cli_command = ['show logging | include {include}',
                    'show logging',]
 
+    # Lines of the log buffer, see tail()
+    tail_entry = re.compile(
+        r'^(?:(?P<sequence>\d+): +)?[*.]?'
+        r'(?P<timestamp>(?:\d{4} +)?[A-Z][a-z]{2} +\d+(?: +\d{4})? +'
+        r'\d+:\d+:\d+(?:\.\d+)?(?: +[A-Z]{2,5})?): +'
+        r'(?:%(?P<facility>[\w-]+)-(?P<severity>[0-7])-'
+        r'(?P<mnemonic>[\w-]+): +)?(?P<message>.*)$')
+    tail_start = re.compile(r'^Log +Buffer +\(\d+ +bytes\):')
+
     def cli(self, include='', output=None):
 
         if output is None:
@@ -65,7 +77,8 @@ class ShowLogging(ShowLoggingSchema):
             # Add line to 'logs'
             if line:
                 log_lines.append(line)
-                parsed_dict['logs'] = log_lines
-                continue
+
+        if log_lines:
+            parsed_dict['logs'] = log_lines
 
         return parsed_dict
@@ -40,6 +40,8 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.regex import LazyRegex
+from genie.libs.parser.utils.blocks import BlockParser
 
 # ===========================================================
 # Schema for:
@@ -339,232 +341,232 @@ class ShowIpOspf(ShowIpOspfSchema):
     cli_command = 'show ip ospf'
     exclude = ['area_scope_lsa_cksum_sum' , ]
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
+    p1 = LazyRegex(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
+                       ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
+                       ' +with +ID +(?P<router_id>(\S+))$')
 
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4' # this is ospf - always ipv4
+    p1_1 = LazyRegex(r'^Routing +Process +is +shutdown$')
 
-        p1 = re.compile(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
-                            ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
-                            ' +with +ID +(?P<router_id>(\S+))$')
+    p2 = LazyRegex(r'^Domain +ID +type +(?P<domain_id>(\S+)), +value'
+                       ' +(?P<value>(\S+))$')
 
-        p1_1 = re.compile(r'^Routing +Process +is +shutdown$')
+    p3 = LazyRegex(r'^Start +time: +(?P<start>([0-9\:\.]+)), +Time'
+                       ' +elapsed: +(?P<elapsed>(\S+))$')
 
-        p2 = re.compile(r'^Domain +ID +type +(?P<domain_id>(\S+)), +value'
-                            ' +(?P<value>(\S+))$')
+    p4 = LazyRegex(r'^Supports +only +single +TOS(TOS0) routes$')
 
-        p3 = re.compile(r'^Start +time: +(?P<start>([0-9\:\.]+)), +Time'
-                            ' +elapsed: +(?P<elapsed>(\S+))$')
+    p5 = LazyRegex(r'^Supports +opaque +LSA$')
 
-        p4 = re.compile(r'^Supports +only +single +TOS(TOS0) routes$')
+    p6 = LazyRegex(r'^Supports +Link-local +Signaling +\(LLS\)$')
 
-        p5 = re.compile(r'^Supports +opaque +LSA$')
+    p7 = LazyRegex(r'^Supports +area +transit +capability$')
 
-        p6 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
+    p8 = LazyRegex(r'^Supports +NSSA +\(compatible +with +RFC +3101\)$')
 
-        p7 = re.compile(r'^Supports +area +transit +capability$')
+    p9 = LazyRegex(r'^Supports +Database +Exchange +Summary +List'
+                       ' +Optimization +\(RFC +5243\)$')
 
-        p8 = re.compile(r'^Supports +NSSA +\(compatible +with +RFC +3101\)$')
+    p10 = LazyRegex(r'^Event-log +(?P<event_log>(enabled|disabled)),'
+                       '(?: +Maximum +number +of +events:'
+                       ' +(?P<max_events>(\d+)),'
+                       ' +Mode: +(?P<mode>(\S+)))?$')
 
-        p9 = re.compile(r'^Supports +Database +Exchange +Summary +List'
-                            ' +Optimization +\(RFC +5243\)$')
+    p11 = LazyRegex(r'^It +is +an'
+                       '(?: +(?P<abr>(area border)))?'
+                       '(?: +and)?'
+                       '(?: +(?P<asbr>(autonomous system boundary)))?'
+                       ' +router$')
 
-        p10 = re.compile(r'^Event-log +(?P<event_log>(enabled|disabled)),'
-                            '(?: +Maximum +number +of +events:'
-                            ' +(?P<max_events>(\d+)),'
-                            ' +Mode: +(?P<mode>(\S+)))?$')
+    p12_1 = LazyRegex(r'^Redistributing +External +Routes +from,$')
 
-        p11 = re.compile(r'^It +is +an'
-                            '(?: +(?P<abr>(area border)))?'
-                            '(?: +and)?'
-                            '(?: +(?P<asbr>(autonomous system boundary)))?'
-                            ' +router$')
+    p12_2 = LazyRegex(r'^(?P<type>(connected|static))(?: +with +metric'
+                       ' +mapped +to +(?P<metric>(\d+)))?$')
 
-        p12_1 = re.compile(r'^Redistributing +External +Routes +from,$')
+    p12_2_1 = LazyRegex(r'^(?P<type>(connected|static|isis))'
+                           ', +includes +(?P<redist>(subnets)) +in +redistribution')
 
-        p12_2 = re.compile(r'^(?P<type>(connected|static))(?: +with +metric'
-                            ' +mapped +to +(?P<metric>(\d+)))?$')
+    p12_3 = LazyRegex(r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))'
+                       '(?: +with +metric +mapped +to +(?P<metric>(\d+)))?'
+                       '(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?'
+                       '(?:, +(?P<nssa>(nssa areas only)))?$')
 
-        p12_2_1 = re.compile(r'^(?P<type>(connected|static|isis))'
-                                ', +includes +(?P<redist>(subnets)) +in +redistribution')
+    p12_4 = LazyRegex(r'^Maximum +number +of +redistributed +prefixes'
+                       ' +(?P<num_prefix>(\d+))'
+                       '(?: +\((?P<warn>(warning-only))\))?')
 
-        p12_3 = re.compile(r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))'
-                            '(?: +with +metric +mapped +to +(?P<metric>(\d+)))?'
-                            '(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?'
-                            '(?:, +(?P<nssa>(nssa areas only)))?$')
+    p12_5 = LazyRegex(r'^Threshold +for +warning +message'
+                       ' +(?P<thld>(\d+))\%$')
 
-        p12_4 = re.compile(r'^Maximum +number +of +redistributed +prefixes'
-                            ' +(?P<num_prefix>(\d+))'
-                            '(?: +\((?P<warn>(warning-only))\))?')
+    p13 = LazyRegex(r'^Router +is +not +originating +router-LSAs'
+                       ' +with +maximum +metric$')
 
-        p12_5 = re.compile(r'^Threshold +for +warning +message'
-                            ' +(?P<thld>(\d+))\%$')
+    p14_1 = LazyRegex(r'^Originating +router-LSAs +with +maximum'
+                       ' +metric$')
 
-        p13 = re.compile(r'^Router +is +not +originating +router-LSAs'
-                            ' +with +maximum +metric$')
+    p14_3 = LazyRegex(r'^Advertise +stub +links +with +maximum +metric'
+                       ' +in +router\-LSAs$')
 
-        p14_1 = re.compile(r'^Originating +router-LSAs +with +maximum'
-                            ' +metric$')
+    p14_4 = LazyRegex(r'^Advertise +summary\-LSAs +with +metric'
+                       ' +(?P<metric>(\d+))$')
 
-        p14_2 = re.compile(r'^Condition:'
-                            ' +(?P<condition>(always|on \S+))'
-                            '(?: +for +(?P<seconds>(\d+)) +seconds,)?'
-                            ' +State: +(?P<state>(\S+))$')
+    p14_5 = LazyRegex(r'^^Advertise +external\-LSAs +with +metric'
+                       ' +(?P<metric>(\d+))$')
 
-        p14_3 = re.compile(r'^Advertise +stub +links +with +maximum +metric'
-                            ' +in +router\-LSAs$')
+    p15 = LazyRegex(r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
+                       ' +msecs$')
 
-        p14_4 = re.compile(r'^Advertise +summary\-LSAs +with +metric'
-                            ' +(?P<metric>(\d+))$')
+    p16 = LazyRegex(r'^Minimum +hold +time +between +two +consecutive'
+                       ' +SPFs +(?P<time>(\S+)) +msecs$')
 
-        p14_5 = re.compile(r'^^Advertise +external\-LSAs +with +metric'
-                            ' +(?P<metric>(\d+))$')
+    p17 = LazyRegex(r'^Maximum +wait +time +between +two +consecutive'
+                       ' +SPFs +(?P<time>(\S+)) +msecs$')
 
-        p15 = re.compile(r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
-                            ' +msecs$')
+    p18 = LazyRegex(r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
+                       ' +msecs$')
 
-        p16 = re.compile(r'^Minimum +hold +time +between +two +consecutive'
-                            ' +SPFs +(?P<time>(\S+)) +msecs$')
+    p19 = LazyRegex(r'^Minimum +hold +time +for +LSA +throttle'
+                       ' +(?P<time>(\S+)) +msecs$')
 
-        p17 = re.compile(r'^Maximum +wait +time +between +two +consecutive'
-                            ' +SPFs +(?P<time>(\S+)) +msecs$')
+    p20 = LazyRegex(r'^Maximum +wait +time +for +LSA +throttle'
+                       ' +(?P<time>(\S+)) +msecs$')
 
-        p18 = re.compile(r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
-                            ' +msecs$')
+    p21 = LazyRegex(r'^Minimum +LSA +arrival'
+                       ' +(?P<arrival>(\S+)) +msecs$')
 
-        p19 = re.compile(r'^Minimum +hold +time +for +LSA +throttle'
-                            ' +(?P<time>(\S+)) +msecs$')
+    p22 = LazyRegex(r'^Incremental-SPF +(?P<incr>(disabled|enabled))$')
 
-        p20 = re.compile(r'^Maximum +wait +time +for +LSA +throttle'
-                            ' +(?P<time>(\S+)) +msecs$')
+    p23 = LazyRegex(r'LSA +group +pacing +timer'
+                       ' +(?P<pacing>(\d+)) +secs$')
 
-        p21 = re.compile(r'^Minimum +LSA +arrival'
-                            ' +(?P<arrival>(\S+)) +msecs$')
+    p24 = LazyRegex(r'Interface +flood +pacing +timer'
+                       ' +(?P<interface>(\d+)) +msecs$')
 
-        p22 = re.compile(r'^Incremental-SPF +(?P<incr>(disabled|enabled))$')
+    p25 = LazyRegex(r'Retransmission +pacing +timer'
+                       ' +(?P<retransmission>(\d+)) +msecs$')
 
-        p23 = re.compile(r'LSA +group +pacing +timer'
-                            ' +(?P<pacing>(\d+)) +secs$')
+    p26 = LazyRegex(r'EXCHANGE/LOADING +adjacency +limit: +initial'
+                       ' +(?P<initial>(\S+)), +process +maximum'
+                       ' +(?P<maximum>(\d+))$')
 
-        p24 = re.compile(r'Interface +flood +pacing +timer'
-                            ' +(?P<interface>(\d+)) +msecs$')
+    p27 = LazyRegex(r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
+                       ' +Checksum +Sum +(?P<checksum>(\S+))$')
 
-        p25 = re.compile(r'Retransmission +pacing +timer'
-                            ' +(?P<retransmission>(\d+)) +msecs$')
+    p28 = LazyRegex(r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
+                       ' +Checksum +Sum +(?P<checksum>(\S+))$')
 
-        p26 = re.compile(r'EXCHANGE/LOADING +adjacency +limit: +initial'
-                            ' +(?P<initial>(\S+)), +process +maximum'
-                            ' +(?P<maximum>(\d+))$')
+    p29 = LazyRegex(r'^Number +of +DCbitless +external +and +opaque'
+                       ' +AS +LSA +(?P<num>(\d+))$')
 
-        p27 = re.compile(r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum>(\S+))$')
+    p30 = LazyRegex(r'^Number +of +DoNotAge +external +and +opaque'
+                       ' +AS +LSA +(?P<num>(\d+))$')
 
-        p28 = re.compile(r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum>(\S+))$')
+    p31 = LazyRegex(r'^Number +of +areas +in +this +router +is'
+                       ' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
+                       ' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
+                       ' +nssa$')
 
-        p29 = re.compile(r'^Number +of +DCbitless +external +and +opaque'
-                            ' +AS +LSA +(?P<num>(\d+))$')
+    p32 = LazyRegex(r'Number +of +areas +transit +capable +is'
+                       ' +(?P<num>(\d+))$')
 
-        p30 = re.compile(r'^Number +of +DoNotAge +external +and +opaque'
-                            ' +AS +LSA +(?P<num>(\d+))$')
+    p33 = LazyRegex(r'^Maximum +number +of +non +self-generated +LSA'
+                       ' +allowed +(?P<max_lsa>(\d+))$')
 
-        p31 = re.compile(r'^Number +of +areas +in +this +router +is'
-                            ' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
-                            ' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
-                            ' +nssa$')
+    p33_1 = LazyRegex(r'^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$')
 
-        p32 = re.compile(r'Number +of +areas +transit +capable +is'
-                            ' +(?P<num>(\d+))$')
+    p33_2 = LazyRegex(r'^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$')
 
-        p33 = re.compile(r'^Maximum +number +of +non +self-generated +LSA'
-                            ' +allowed +(?P<max_lsa>(\d+))$')
+    p33_3 = LazyRegex(r'^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,'
+                       ' +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$')
 
-        p33_1 = re.compile(r'^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$')
+    p33_4 = LazyRegex(r'^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),'
+                       ' +current ignore\-count +(?P<max_lsa_current_count>\d+)$')
 
-        p33_2 = re.compile(r'^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$')
+    p33_5 = LazyRegex(r'^Maximum +limit +of +redistributed +prefixes +(?P<max_lsa_limit>\d+) +\(warning\-only\)$')
 
-        p33_3 = re.compile(r'^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,'
-                            ' +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$')
+    p34 = LazyRegex(r'^External +flood +list +length +(?P<num>(\d+))$')
 
-        p33_4 = re.compile(r'^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),'
-                            ' +current ignore\-count +(?P<max_lsa_current_count>\d+)$')
+    p35 = LazyRegex(r'^(?P<gr_type>(IETF|Cisco)) +Non-Stop +Forwarding'
+                       ' +(?P<enable>(enabled|disabled))$')
 
-        p33_5 = re.compile(r'^Maximum +limit +of +redistributed +prefixes +(?P<max_lsa_limit>\d+) +\(warning\-only\)$')
+    p36 = LazyRegex(r'^(?P<gr_type>(IETF|Cisco)) +NSF +helper +support'
+                       ' +(?P<gr_helper>(enabled|disabled))$')
 
-        p34 = re.compile(r'^External +flood +list +length +(?P<num>(\d+))$')
+    p36_1 = LazyRegex(r'^restart-interval +limit *: +(?P<num>(\d+)) +sec$')
 
-        p35 = re.compile(r'^(?P<gr_type>(IETF|Cisco)) +Non-Stop +Forwarding'
-                            ' +(?P<enable>(enabled|disabled))$')
+    p37 = LazyRegex(r'^Reference +bandwidth +unit +is'
+                       ' +(?P<bd>(\d+)) +(?P<unit>(mbps))$')
 
-        p36 = re.compile(r'^(?P<gr_type>(IETF|Cisco)) +NSF +helper +support'
-                            ' +(?P<gr_helper>(enabled|disabled))$')
+    p38 = LazyRegex(r'^Area +(?P<area>(\S+))(?: *\((I|i)nactive\))?$')
 
-        p36_1 = re.compile(r'^restart-interval +limit *: +(?P<num>(\d+)) +sec$')
+    p39_1 = LazyRegex(r'^It +is +a +(?P<area_type>(\S+)) +area'
+                       '(?:, +(?P<summary>(no +summary +LSA +in +this'
+                       ' +area)))?$')
 
-        p37 = re.compile(r'^Reference +bandwidth +unit +is'
-                            ' +(?P<bd>(\d+)) +(?P<unit>(mbps))$')
+    p39_2 = LazyRegex(r'^generates +stub +default +route +with +cost'
+                       ' +(?P<default_cost>(\d+))$')
 
-        p38 = re.compile(r'^Area +(?P<area>(\S+))(?: *\((I|i)nactive\))?$')
+    p40_1 = LazyRegex(r'^Area ranges are$')
 
-        p39_1 = re.compile(r'^It +is +a +(?P<area_type>(\S+)) +area'
-                            '(?:, +(?P<summary>(no +summary +LSA +in +this'
-                            ' +area)))?$')
+    p40_2 = LazyRegex(r'^(?P<prefix>([0-9\.\/]+)) +(Passive|Active)'
+                       '(?:\((?P<cost>(\d+)) +\- +configured\))?'
+                       ' +(?P<advertise>(Advertise|DoNotAdvertise))$')
 
-        p39_2 = re.compile(r'^generates +stub +default +route +with +cost'
-                            ' +(?P<default_cost>(\d+))$')
+    p41 = LazyRegex(r'^Number +of +interfaces +in +this +area +is'
+                       ' +(?P<num_intf>(\d+))(?:'
+                       ' *\((?P<loopback>(\d+)) +loopback\))?$')
 
-        p40_1 = re.compile(r'^Area ranges are$')
+    p42 = LazyRegex(r'^Area +has +RRR +enabled$')
 
-        p40_2 = re.compile(r'^(?P<prefix>([0-9\.\/]+)) +(Passive|Active)'
-                            '(?:\((?P<cost>(\d+)) +\- +configured\))?'
-                            ' +(?P<advertise>(Advertise|DoNotAdvertise))$')
+    p43 = LazyRegex(r'^SPF +algorithm +executed +(?P<count>(\d+))'
+                       ' +times$')
 
-        p41 = re.compile(r'^Number +of +interfaces +in +this +area +is'
-                            ' +(?P<num_intf>(\d+))(?:'
-                            ' *\((?P<loopback>(\d+)) +loopback\))?$')
+    p44 = LazyRegex(r'^SPF +algorithm +last +executed'
+                       ' +(?P<last_exec>(\S+)) +ago$')
 
-        p42 = re.compile(r'^Area +has +RRR +enabled$')
+    p45 = LazyRegex(r'^Area +has +no +authentication$')
 
-        p43 = re.compile(r'^SPF +algorithm +executed +(?P<count>(\d+))'
-                            ' +times$')
+    p46 = LazyRegex(r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
+                       ' +Checksum +Sum +(?P<checksum_sum>(\S+))$')
 
-        p44 = re.compile(r'^SPF +algorithm +last +executed'
-                            ' +(?P<last_exec>(\S+)) +ago$')
+    p47 = LazyRegex(r'^Number +of opaque +link +LSA'
+                       ' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
+                       ' +(?P<checksum_sum>(\S+))$')
 
-        p45 = re.compile(r'^Area +has +no +authentication$')
+    p48 = LazyRegex(r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$')
 
-        p46 = re.compile(r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum_sum>(\S+))$')
+    p49 = LazyRegex(r'^Number +of +indication +LSA +(?P<count>(\d+))$')
 
-        p47 = re.compile(r'^Number +of opaque +link +LSA'
-                            ' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
-                            ' +(?P<checksum_sum>(\S+))$')
+    p50 = LazyRegex(r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$')
 
-        p48 = re.compile(r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$')
+    p51 = LazyRegex(r'^Flood +list +length +(?P<len>(\d+))$')
 
-        p49 = re.compile(r'^Number +of +indication +LSA +(?P<count>(\d+))$')
+    p52 = LazyRegex(r'^Non-Stop +Routing +(?P<nsr>(enabled))$')
 
-        p50 = re.compile(r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$')
+    p53_1 = LazyRegex(r'^BFD +is +enabled +in +strict +mode$')
 
-        p51 = re.compile(r'^Flood +list +length +(?P<len>(\d+))$')
+    p53_2 = LazyRegex(r'^BFD +is +enabled$')
 
-        p52 = re.compile(r'^Non-Stop +Routing +(?P<nsr>(enabled))$')
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
 
-        p53_1 = re.compile(r'^BFD +is +enabled +in +strict +mode$')
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4' # this is ospf - always ipv4
 
-        p53_2 = re.compile(r'^BFD +is +enabled$')
+        p14_2 = re.compile(r'^Condition:'
+                            ' +(?P<condition>(always|on \S+))'
+                            '(?: +for +(?P<seconds>(\d+)) +seconds,)?'
+                            ' +State: +(?P<state>(\S+))$')
 
         for line in out.splitlines():
             line = line.strip()
 
             # Routing Process "ospf 1" with ID 10.36.3.3
             # VRF VRF1 in Routing Process "ospf 1" with ID 10.36.3.3
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 instance = str(m.groupdict()['instance'])
                 router_id = str(m.groupdict()['router_id'])
@@ -604,64 +606,64 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Routing Process is shutdown
-            m = p1_1.match(line)
+            m = self.p1_1.match(line)
             if m:
                 sub_dict['enable'] = False
                 continue
 
             # Domain ID type 0x0005, value 0.0.0.2
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 sub_dict['domain_id_type'] = str(m.groupdict()['domain_id'])
                 sub_dict['domain_id_value'] = str(m.groupdict()['value'])
                 continue
 
             # Start time: 00:23:49.050, Time elapsed: 1d01h
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 sub_dict['start_time'] = str(m.groupdict()['start'])
                 sub_dict['elapsed_time'] = str(m.groupdict()['elapsed'])
                 continue
 
             # Supports only single TOS(TOS0) routes
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 sub_dict['single_tos_route'] = True
                 continue
 
             # Supports opaque LSA
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 sub_dict['opqaue_lsa'] = True
                 continue
 
             # Supports Link-local Signaling (LLS)
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 sub_dict['lls'] = True
                 continue
 
             # Supports area transit capability
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 sub_dict['area_transit'] = True
                 continue
 
             # Supports NSSA (compatible with RFC 3101)
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 sub_dict['nssa'] = True
                 continue
 
             # Supports Database Exchange Summary List Optimization (RFC 5243)
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 sub_dict['db_exchange_summary_list_optimization'] = True
                 continue
 
             # Event-log disabled
             # Event-log enabled, Maximum number of events: 1000, Mode: cyclic
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 if 'event_log' not in sub_dict:
                     sub_dict['event_log'] = {}
@@ -679,7 +681,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # It is an area border router
             # It is an autonomous system boundary router
             # It is an area border and autonomous system boundary router
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 if 'flags' not in sub_dict:
                     sub_dict['flags'] = {}
@@ -690,7 +692,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Redistributing External Routes from,
-            m = p12_1.match(line)
+            m = self.p12_1.match(line)
             if m:
                 if 'redistribution' not in sub_dict:
                     sub_dict['redistribution'] = {}
@@ -700,7 +702,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # connected with metric mapped to 10
             # static
             # static with metric mapped to 10
-            m = p12_2.match(line)
+            m = self.p12_2.match(line)
             if m:
                 the_type = str(m.groupdict()['type'])
                 if the_type not in sub_dict['redistribution']:
@@ -714,7 +716,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # connected, includes subnets in redistribution
             # static, includes subnets in redistribution
             # isis, includes subnets in redistribution
-            m = p12_2_1.match(line)
+            m = self.p12_2_1.match(line)
             if m:
                 the_type = str(m.groupdict()['type'])
                 if the_type not in sub_dict['redistribution']:
@@ -727,7 +729,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # isis 10 with metric mapped to 3333
             # bgp 100 with metric mapped to 100, includes subnets in redistribution, nssa areas only
             # bgp 100, includes subnets in redistribution
-            m = p12_3.match(line)
+            m = self.p12_3.match(line)
             if m:
                 prot = str(m.groupdict()['prot'])
                 if prot not in sub_dict['redistribution']:
@@ -752,7 +754,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Maximum number of redistributed prefixes 4000
             # Maximum number of redistributed prefixes 3000 (warning-only)
-            m = p12_4.match(line)
+            m = self.p12_4.match(line)
             if m:
                 if 'max_prefix' not in sub_dict['redistribution']:
                     sub_dict['redistribution']['max_prefix'] = {}
@@ -765,7 +767,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                     continue
 
             # Threshold for warning message 70%
-            m = p12_5.match(line)
+            m = self.p12_5.match(line)
             if m:
                 if 'max_prefix' not in sub_dict['redistribution']:
                     sub_dict['redistribution']['max_prefix'] = {}
@@ -774,7 +776,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Router is not originating router-LSAs with maximum metric
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 if 'stub_router' not in sub_dict:
                     sub_dict['stub_router'] = {}
@@ -788,7 +790,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Originating router-LSAs with maximum metric
-            m = p14_1.match(line)
+            m = self.p14_1.match(line)
             if m:
                 if 'stub_router' not in sub_dict:
                     sub_dict['stub_router'] = {}
@@ -821,13 +823,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Advertise stub links with maximum metric in router-LSAs
-            m = p14_3.match(line)
+            m = self.p14_3.match(line)
             if m:
                 sub_dict['stub_router'][condition]['include_stub'] = True
                 continue
 
             # Advertise summary-LSAs with metric 16711680
-            m = p14_4.match(line)
+            m = self.p14_4.match(line)
             if m:
                 sub_dict['stub_router'][condition]['summary_lsa'] = True
                 sub_dict['stub_router'][condition]['summary_lsa_metric'] = \
@@ -835,7 +837,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Advertise external-LSAs with metric 16711680
-            m = p14_5.match(line)
+            m = self.p14_5.match(line)
             if m:
                 sub_dict['stub_router'][condition]['external_lsa'] = True
                 sub_dict['stub_router'][condition]['external_lsa_metric'] = \
@@ -843,7 +845,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Initial SPF schedule delay 50 msecs
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 start = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -856,7 +858,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Minimum hold time between two consecutive SPFs 200 msecs
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 hold = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -869,7 +871,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum wait time between two consecutive SPFs 5000 msecs
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 maximum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -882,7 +884,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Initial LSA throttle delay 50 msecs
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 start = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -895,7 +897,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Minimum hold time for LSA throttle 200 msecs
-            m = p19.match(line)
+            m = self.p19.match(line)
             if m:
                 hold = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -908,7 +910,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum wait time for LSA throttle 5000 msecs
-            m = p20.match(line)
+            m = self.p20.match(line)
             if m:
                 maximum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -922,7 +924,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Minimum LSA interval 200 msecs. Minimum LSA arrival 100 msecs
             # Minimum LSA arrival 100 msecs
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 if 'lsa' not in sub_dict['spf_control']['throttle']:
                     sub_dict['spf_control']['throttle']['lsa'] = {}
@@ -931,7 +933,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Incremental-SPF disabled
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 if 'spf_control' not in sub_dict:
                     sub_dict['spf_control'] = {}
@@ -942,28 +944,28 @@ class ShowIpOspf(ShowIpOspfSchema):
                     continue
 
             # LSA group pacing timer 240 secs
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 sub_dict['lsa_group_pacing_timer'] = \
                     int(float(m.groupdict()['pacing']))
                 continue
 
             # Interface flood pacing timer 33 msecs
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 sub_dict['interface_flood_pacing_timer'] = \
                     int(float(m.groupdict()['interface']))
                 continue
 
             # Retransmission pacing timer 66 msecs
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 sub_dict['retransmission_pacing_timer'] = \
                     int(float(m.groupdict()['retransmission']))
                 continue
 
             # EXCHANGE/LOADING adjacency limit: initial 300, process maximum 300
-            m = p26.match(line)
+            m = self.p26.match(line)
             if m:
                 if 'adjacency_stagger' not in sub_dict:
                     sub_dict['adjacency_stagger'] = {}
@@ -977,7 +979,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of external LSA 1. Checksum Sum 0x00607f
-            m = p27.match(line)
+            m = self.p27.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -987,7 +989,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of opaque AS LSA 0. Checksum Sum 00000000
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -997,7 +999,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DCbitless external and opaque AS LSA 0
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -1005,7 +1007,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DoNotAge external and opaque AS LSA 0
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -1013,7 +1015,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of areas in this router is 1. 1 normal 0 stub 0 nssa
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 sub_dict['total_areas'] = int(m.groupdict()['total_areas'])
                 sub_dict['total_normal_areas'] = int(m.groupdict()['normal'])
@@ -1022,13 +1024,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of areas transit capable is 0
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 sub_dict['total_areas_transit_capable'] = int(m.groupdict()['num'])
                 continue
 
             # Maximum number of non self-generated LSA allowed 123
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1037,7 +1039,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Current number of non self-generated LSA 0
-            m = p33_1.match(line)
+            m = self.p33_1.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1046,7 +1048,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Threshold for warning message 75%
-            m = p33_2.match(line)
+            m = self.p33_2.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1055,7 +1057,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Ignore-time 5 minutes, reset-time 10 minutes
-            m = p33_3.match(line)
+            m = self.p33_3.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1066,7 +1068,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Ignore-count allowed 5, current ignore-count 0
-            m = p33_4.match(line)
+            m = self.p33_4.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1077,7 +1079,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum limit of redistributed prefixes 5000 (warning-only)
-            m = p33_5.match(line)
+            m = self.p33_5.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1086,14 +1088,14 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # External flood list length 0
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 sub_dict['external_flood_list_length'] = int(m.groupdict()['num'])
                 continue
 
             # Non-Stop Forwarding enabled
             # IETF Non-Stop Forwarding enabled
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 gr_type = str(m.groupdict()['gr_type']).lower()
                 if 'enabled' in m.groupdict()['enable']:
@@ -1110,7 +1112,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # IETF NSF helper support enabled
             # Cisco NSF helper support enabled
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 gr_type = str(m.groupdict()['gr_type']).lower()
                 if 'enabled' in m.groupdict()['gr_helper']:
@@ -1129,7 +1131,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # restart-interval limit: 11 sec
-            m = p36_1.match(line)
+            m = self.p36_1.match(line)
             if m:
                 sub_dict['graceful_restart'][gr_type]['restart_interval'] = \
                     int(m.groupdict()['num'])
@@ -1137,7 +1139,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Reference bandwidth unit is 100 mbps
             # Reference bandwidth unit is 4294967 mbps
-            m = p37.match(line)
+            m = self.p37.match(line)
             if m:
                 bd = int(m.groupdict()['bd'])
                 if 'auto_cost' not in sub_dict:
@@ -1154,7 +1156,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # Area BACKBONE(0)
             # Area BACKBONE(0.0.0.0) (Inactive)
             # Area 1
-            m = p38.match(line)
+            m = self.p38.match(line)
             if m:
                 parsed_area = str(m.groupdict()['area'])
                 n = re.match('BACKBONE\((?P<area_num>(\S+))\)', parsed_area)
@@ -1177,7 +1179,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # It is a stub area
             # It is a stub area, no summary LSA in this area
             # It is a NSSA area
-            m = p39_1.match(line)
+            m = self.p39_1.match(line)
             if m:
                 area_type = str(m.groupdict()['area_type']).lower()
                 sub_dict['areas'][area]['area_type'] = area_type
@@ -1190,14 +1192,14 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # generates stub default route with cost 111
             # generates stub default route with cost 222
-            m = p39_2.match(line)
+            m = self.p39_2.match(line)
             if m:
                 sub_dict['areas'][area]['default_cost'] = \
                     int(m.groupdict()['default_cost'])
                 continue
 
             # Area ranges are
-            m = p40_1.match(line)
+            m = self.p40_1.match(line)
             if m:
                 if 'ranges' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['ranges'] = {}
@@ -1206,7 +1208,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # 10.4.1.0/24 Passive Advertise
             # 10.4.0.0/16 Passive DoNotAdvertise 
             # 10.4.0.0/16 Active(10 - configured) Advertise
-            m = p40_2.match(line)
+            m = self.p40_2.match(line)
             if m:
                 prefix = str(m.groupdict()['prefix'])
                 if 'ranges' not in sub_dict['areas'][area]:
@@ -1225,7 +1227,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Number of interfaces in this area is 3
             # Number of interfaces in this area is 3 (1 loopback)
-            m = p41.match(line)
+            m = self.p41.match(line)
             if m:
                 if 'areas' not in sub_dict:
                     sub_dict['areas'] = {}
@@ -1241,13 +1243,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Area has RRR enabled
-            m = p42.match(line)
+            m = self.p42.match(line)
             if m:
                 sub_dict['areas'][area]['rrr_enabled'] = True
                 continue
 
             # SPF algorithm executed 26 times
-            m = p43.match(line)
+            m = self.p43.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1256,7 +1258,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # SPF algorithm last executed 00:19:54.849 ago
-            m = p44.match(line)
+            m = self.p44.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1265,12 +1267,12 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Area has no authentication
-            m = p45.match(line)
+            m = self.p45.match(line)
             if m:
                 continue
 
             # Number of LSA 19.  Checksum Sum 0x0a2fb5
-            m = p46.match(line)
+            m = self.p46.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1282,7 +1284,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of opaque link LSA 0.  Checksum Sum 00000000
-            m = p47.match(line)
+            m = self.p47.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1295,7 +1297,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DCbitless LSA 5
-            m = p48.match(line)
+            m = self.p48.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1304,7 +1306,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of indication LSA 0
-            m = p49.match(line)
+            m = self.p49.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1313,7 +1315,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DoNotAge LSA 0
-            m = p50.match(line)
+            m = self.p50.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1322,7 +1324,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Flood list length 0
-            m = p51.match(line)
+            m = self.p51.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1331,13 +1333,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
         
             # Non-Stop Routing enabled
-            m = p52.match(line)
+            m = self.p52.match(line)
             if m:
                 sub_dict['nsr']['enable'] = True
                 continue
 
             # BFD is enabled in strict mode
-            m = p53_1.match(line)
+            m = self.p53_1.match(line)
             if m:
                 if 'bfd' not in sub_dict:
                     sub_dict['bfd'] = {}
@@ -1346,7 +1348,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # BFD is enabled
-            m = p53_2.match(line)
+            m = self.p53_2.match(line)
             if m:
                 if 'bfd' not in sub_dict:
                     sub_dict['bfd'] = {}
@@ -3859,243 +3861,246 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
         * 'show ip ospf database opaque-area self-originate''
     '''
 
-    def cli(self, db_type, out=None):
+    p1 = LazyRegex(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                       ' +\(Process +ID +(?P<instance>(\d+))'
+                       '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
-        assert db_type in ['external', 'network', 'summary', 'router',
-                           'opaque']
+    p2 = LazyRegex(r'^(?P<lsa_type_name>(.*)) +Link +States'
+                       '(?: +\(Area +(?P<area>(\S+))\))?$')
 
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4'
-        default_mt_id = 0
-        capabilities_flag = False
-        tlv_type_flag = False
-        sub_tlv_type_flag = False
+    p3_1 = LazyRegex(r'^Routing +Bit +Set +on +this +LSA$')
 
-        # Router
-        # Network Link
-        # Summary Network
-        # Opaque Area
-        # Type-5 AS External
-        lsa_type_mapping = {
-            'router': 1,
-            'network': 2,
-            'summary': 3,
-            'external': 5,
-            'opaque': 10,
-            }
+    p3_2 = LazyRegex(r'^LS +age: +(?P<age>(\d+))$')
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\d+))'
-                            '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
-       
-        p2 = re.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
-                            '(?: +\(Area +(?P<area>(\S+))\))?$')
-       
-        p3_1 = re.compile(r'^Routing +Bit +Set +on +this +LSA$')
-       
-        p3_2 = re.compile(r'^LS +age: +(?P<age>(\d+))$')
-       
-        p3_2_1 = re.compile(r'^LS +age: +\w+\((?P<age>(\d+))\)$')
-       
-        p4 = re.compile(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
-                        '(?: *\((?P<option_desc>(.*))\))?$')
-       
-        p5_1 = re.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
-       
-        p5_2 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
-                            '(?: +\(.*\))?$')
-       
-        p6 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
-       
-        p7 = re.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
-       
-        p8 = re.compile(r'^Checksum: +(?P<checksum>(\S+))$')
-       
-        p9 = re.compile(r'^Length *: +(?P<length>(\d+))$')
-       
-        p10 = re.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
-       
-        p11_1 = re.compile(r'^Metric +Type: +2 +\(.*\)$')
-       
-        p11_2 = re.compile(r'^Metric +Type: +1 +\(.*\)$')
-       
-        p12 = re.compile(r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
-                            ' +(?P<metric>(\d+)))?$')
-       
-        p13 = re.compile(r'^Metric: +(?P<metric>(\d+))$')
-       
-        p14 = re.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
-       
-        p15 = re.compile(r'^External +Route +Tag: +(?P<tag>(\d+))$')
-       
-        p16 = re.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
-       
-        p17 = re.compile(r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$')
-       
-        p18 = re.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
-       
-        p18_1 = re.compile(r'^Link\s+connected +to\s*: +(?P<type>(.*))$')
-       
-        p19_1 = re.compile(r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
-                            ' +(?P<link_id>(\S+))$')
-       
-        p19_2 = re.compile(r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
-                            ' +(a|A)ddress: +(?P<link_id>(\S+))$')
-       
-        p19_3 = re.compile(r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
-                            ' +(I|d)D: +(?P<link_id>(\S+))$')
-       
-        p20_1 = re.compile(r'^\(Link +Data\) +Network +Mask:'
-                            ' +(?P<link_data>(\S+))$')
-       
-        p20_2 = re.compile(r'^\(Link +Data\) +Router +Interface +address:'
-                            ' +(?P<link_data>(\S+))$')
-       
-        # MTID 32 Metrics: 1
-        # MTID   : 0
-        p21 = re.compile(r'MTID\s*:*\s*(?P<mtid>\d+)\s*(?:(Metrics*\s*:*\s*(?P<metric>\d+)))?')
-       
-        p21_1 = re.compile(r'^Number +of +MTID +metrics: +(?P<num>(\d+))$')
-       
-        p22 = re.compile(r'^Opaque +Type: +(?P<type>(\d+))(?: +\((Traffic Engineering)\))?$')
-       
-        p23 = re.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
-       
-        p24 = re.compile(r'^Fragment +number *: +(?P<num>(\d+))$')
-       
-        p25 = re.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
-       
-        p26_1 = re.compile(r'^AS +Boundary +Router$')
-       
-        p26_2 = re.compile(r'^Area +Border +Router$')
-       
-        p27 = re.compile(r'^Link +connected +to\s*\:*\s+(?P<link>(.*))$')
-       
-        p28 = re.compile(r'^Link +ID *: +(?P<id>(\S+))$')
-       
-        p29 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
-       
-        p30 = re.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
-       
-        p31 = re.compile(r'^Maximum +(B|b)andwidth *:'
-                            ' +(?P<max_band>(\d+))$')
-       
-        p32 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth'
-                            '(?: +global)? *: +(?P<max_res_band>(\d+))$')
-       
-        p33 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
-       
-        p33_1 = re.compile(r'^IGP +Metric *: +(?P<igp_metric>(\d+))$')
-       
-        p33_2 = re.compile(r'^Number +of +Priority *: +(?P<num>(\d+))$')
-       
-        p34 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
-       
-        p35 = re.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
-                            ' +Length += +(?P<length>(\d+))'
-                            ' +Value += +(?P<value>(.*))$')
-       
-        p36 = re.compile(r'^Extended +Administrative +Group *: +Length *:'
-                            ' +(?P<eag_length>(\d+))$')
-       
-        p37 = re.compile(r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$')
+    p3_2_1 = LazyRegex(r'^LS +age: +\w+\((?P<age>(\d+))\)$')
 
-        # Neighbor Address : 192.168.220.2
-        p38 = re.compile(r'Neighbor\s+Address\s*:\s*(?P<neighbor_address>\S+)')
+    p4 = LazyRegex(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
+                   '(?: *\((?P<option_desc>(.*))\))?$')
 
-        # TLV Type: Router Information
-        # TLV Type: Segment Routing Algorithm
-        p39 = re.compile(r'TLV\s+Type\s*:\s*(?P<tlv_type>.+)')
+    p5_1 = LazyRegex(r'^LS +Type: +(?P<lsa_type>(.*))$')
 
-        # Router Information
-        p39_1 = re.compile(r'(R|r)outer\s+(I|i)nformation')
+    p5_2 = LazyRegex(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
+                       '(?: +\(.*\))?$')
 
-        # Segment Routing Algorithm
-        p39_2 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(A|a)lgorithm')
+    p6 = LazyRegex(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
 
-        # Segment Routing Range
-        p39_3 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(R|r)ange')
+    p7 = LazyRegex(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
 
-        # Segment Routing Node MSD
-        p39_4 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(N|n)ode\s+MSD')
+    p8 = LazyRegex(r'^Checksum: +(?P<checksum>(\S+))$')
 
-        # Segment Routing Local Block
-        p39_5 = re.compile(r'(S|s)egment\s+(R|r)outing\s+(L|l)ocal\s+(B|b)lock')
+    p9 = LazyRegex(r'^Length *: +(?P<length>(\d+))$')
 
-        # Extended Prefix
-        p39_6 = re.compile(r'(E|e)xtended\s+(P|p)refix')
+    p10 = LazyRegex(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
 
-        # Extended Link
-        p39_7 = re.compile(r'(E|e)xtended\s+(L|l)ink')
+    p11_1 = LazyRegex(r'^Metric +Type: +2 +\(.*\)$')
 
-        # Algorithm: SPF
-        # Algorithm: Strict SPF
-        p40 = re.compile(r'Algo(?:(rithm))?\s*:\s*(?P<algorithm>.+)')
+    p11_2 = LazyRegex(r'^Metric +Type: +1 +\(.*\)$')
 
-        # Range Size: 1000
-        p41 = re.compile(r'Range\s+Size\s*:\s*(?P<range_size>\d+)')
+    p12 = LazyRegex(r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
+                       ' +(?P<metric>(\d+)))?$')
 
-        # Flags  : L-Bit, V-bit
-        p42 = re.compile(r'Flags\s*\:\s*(?P<flags>.+)')        
+    p13 = LazyRegex(r'^Metric: +(?P<metric>(\d+))$')
 
-        # Weight : 0
-        p44 = re.compile(r'Weight\s*:\s*(?P<weight>\d+)')
+    p14 = LazyRegex(r'^Forward +Address: +(?P<addr>(\S+))$')
 
-        # Label  : 19
-        p45 = re.compile(r'Label\s*:\s*(?P<label>\d+)')       
-        
-        # (Link Data) Interface IP address: 192.168.220.1
-        p46 = re.compile(r'\(Link\s+Data\)\s+Interface\s+IP\s+address\s*:\s*(?P<link_data>\S+)')
+    p15 = LazyRegex(r'^External +Route +Tag: +(?P<tag>(\d+))$')
+
+    p16 = LazyRegex(r'^Attached +Router: +(?P<att_router>(\S+))$')
+
+    p17 = LazyRegex(r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$')
+
+    p18 = LazyRegex(r'^Link +connected +to: +a +(?P<type>(.*))$')
+
+    p18_1 = LazyRegex(r'^Link\s+connected +to\s*: +(?P<type>(.*))$')
+
+    p19_1 = LazyRegex(r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
+                       ' +(?P<link_id>(\S+))$')
+
+    p19_2 = LazyRegex(r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
+                       ' +(a|A)ddress: +(?P<link_id>(\S+))$')
+
+    p19_3 = LazyRegex(r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
+                       ' +(I|d)D: +(?P<link_id>(\S+))$')
+
+    p20_1 = LazyRegex(r'^\(Link +Data\) +Network +Mask:'
+                       ' +(?P<link_data>(\S+))$')
+
+    p20_2 = LazyRegex(r'^\(Link +Data\) +Router +Interface +address:'
+                       ' +(?P<link_data>(\S+))$')
+
+    # MTID 32 Metrics: 1
+    # MTID   : 0
+    p21 = LazyRegex(r'MTID\s*:*\s*(?P<mtid>\d+)\s*(?:(Metrics*\s*:*\s*(?P<metric>\d+)))?')
 
-        # Prefix    : 10.4.1.1/32
-        p47 = re.compile(r'Prefix\s*:\s*(?P<prefix>\S+)')
+    p21_1 = LazyRegex(r'^Number +of +MTID +metrics: +(?P<num>(\d+))$')
 
-        # AF        : 0
-        p48 = re.compile(r'AF\s*:\s*(?P<af>\S+)')
+    p22 = LazyRegex(r'^Opaque +Type: +(?P<type>(\d+))(?: +\((Traffic Engineering)\))?$')
 
-        # Route-type: Intra
-        p49 = re.compile(r'Route\-type\s*:\s*(?P<route_type>.+)')
+    p23 = LazyRegex(r'^Opaque +ID: +(?P<id>(\d+))$')
 
-        # Sub-TLV Type: Remote Intf Addr
-        # Sub-TLV Type: Local / Remote Intf ID
-        p50 = re.compile(r'Sub\-TLV\s+Type\s*:\s*(?P<sub_tlv_type>.+)')
+    p24 = LazyRegex(r'^Fragment +number *: +(?P<num>(\d+))$')
 
-        # Remote Interface Address   : 192.168.0.1
-        p51 = re.compile(r'Remote\s+Interface\s+Address\s*:\s*(?P<remote_interface_address>\S+)')
+    p25 = LazyRegex(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
 
-        # Local Interface ID   : 20
-        p52 = re.compile(r'Local\s+Interface\s+ID\s*:\s*(?P<local_interface_id>\S+)')
+    p26_1 = LazyRegex(r'^AS +Boundary +Router$')
 
-        # Remote Interface ID   : 20
-        p53 = re.compile(r'Remote\s+Interface\s+ID\s*:\s*(?P<remote_interface_id>\S+)')
+    p26_2 = LazyRegex(r'^Area +Border +Router$')
 
-        # SID   : 1
-        p54 = re.compile(r'SID\s*:\s*(?P<sid>\S+)')
+    p27 = LazyRegex(r'^Link +connected +to\s*\:*\s+(?P<link>(.*))$')
 
-        # Graceful Restart Helper                
-        p55 = re.compile(r'(G|g)raceful\s+(R|r)estart\s+(H|h)elper')
+    p28 = LazyRegex(r'^Link +ID *: +(?P<id>(\S+))$')
 
-        # Stub Router Support
-        p56 = re.compile(r'(S|s)tub\s+(R|r)outer\s+(S|s)upport')
+    p29 = LazyRegex(r'^Interface +Address *: +(?P<addr>(\S+))$')
 
-        # SPF
-        p57 = re.compile(r'SPF')
+    p30 = LazyRegex(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
 
-        # Strict SPF
-        p58 = re.compile(r'Strict\s+SPF')
+    p31 = LazyRegex(r'^Maximum +(B|b)andwidth *:'
+                       ' +(?P<max_band>(\d+))$')
 
-        # Sub-type: Node Max Sid Depth, Value: 13
-        p59 = re.compile(r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)')
+    p32 = LazyRegex(r'^Maximum +(R|r)eservable +(B|b)andwidth'
+                       '(?: +global)? *: +(?P<max_res_band>(\d+))$')
+
+    p33 = LazyRegex(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+
+    p33_1 = LazyRegex(r'^IGP +Metric *: +(?P<igp_metric>(\d+))$')
+
+    p33_2 = LazyRegex(r'^Number +of +Priority *: +(?P<num>(\d+))$')
+
+    p34 = LazyRegex(r'^Priority +(?P<num1>(\d+)) *:'
+                       ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+                       ' *: +(?P<band2>(\d+)))?$')
+
+    p35 = LazyRegex(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
+                       ' +Length += +(?P<length>(\d+))'
+                       ' +Value += +(?P<value>(.*))$')
+
+    p36 = LazyRegex(r'^Extended +Administrative +Group *: +Length *:'
+                       ' +(?P<eag_length>(\d+))$')
+
+    p37 = LazyRegex(r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$')
+
+    # Neighbor Address : 192.168.220.2
+    p38 = LazyRegex(r'Neighbor\s+Address\s*:\s*(?P<neighbor_address>\S+)')
+
+    # TLV Type: Router Information
+    # TLV Type: Segment Routing Algorithm
+    p39 = LazyRegex(r'TLV\s+Type\s*:\s*(?P<tlv_type>.+)')
+
+    # Router Information
+    p39_1 = LazyRegex(r'(R|r)outer\s+(I|i)nformation')
+
+    # Segment Routing Algorithm
+    p39_2 = LazyRegex(r'(S|s)egment\s+(R|r)outing\s+(A|a)lgorithm')
+
+    # Segment Routing Range
+    p39_3 = LazyRegex(r'(S|s)egment\s+(R|r)outing\s+(R|r)ange')
+
+    # Segment Routing Node MSD
+    p39_4 = LazyRegex(r'(S|s)egment\s+(R|r)outing\s+(N|n)ode\s+MSD')
+
+    # Segment Routing Local Block
+    p39_5 = LazyRegex(r'(S|s)egment\s+(R|r)outing\s+(L|l)ocal\s+(B|b)lock')
+
+    # Extended Prefix
+    p39_6 = LazyRegex(r'(E|e)xtended\s+(P|p)refix')
+
+    # Extended Link
+    p39_7 = LazyRegex(r'(E|e)xtended\s+(L|l)ink')
+
+    # Algorithm: SPF
+    # Algorithm: Strict SPF
+    p40 = LazyRegex(r'Algo(?:(rithm))?\s*:\s*(?P<algorithm>.+)')
+
+    # Range Size: 1000
+    p41 = LazyRegex(r'Range\s+Size\s*:\s*(?P<range_size>\d+)')
+
+    # Flags  : L-Bit, V-bit
+    p42 = LazyRegex(r'Flags\s*\:\s*(?P<flags>.+)')        
+
+    # Weight : 0
+    p44 = LazyRegex(r'Weight\s*:\s*(?P<weight>\d+)')
+
+    # Label  : 19
+    p45 = LazyRegex(r'Label\s*:\s*(?P<label>\d+)')       
+
+    # (Link Data) Interface IP address: 192.168.220.1
+    p46 = LazyRegex(r'\(Link\s+Data\)\s+Interface\s+IP\s+address\s*:\s*(?P<link_data>\S+)')
+
+    # Prefix    : 10.4.1.1/32
+    p47 = LazyRegex(r'Prefix\s*:\s*(?P<prefix>\S+)')
+
+    # AF        : 0
+    p48 = LazyRegex(r'AF\s*:\s*(?P<af>\S+)')
+
+    # Route-type: Intra
+    p49 = LazyRegex(r'Route\-type\s*:\s*(?P<route_type>.+)')
+
+    # Sub-TLV Type: Remote Intf Addr
+    # Sub-TLV Type: Local / Remote Intf ID
+    p50 = LazyRegex(r'Sub\-TLV\s+Type\s*:\s*(?P<sub_tlv_type>.+)')
+
+    # Remote Interface Address   : 192.168.0.1
+    p51 = LazyRegex(r'Remote\s+Interface\s+Address\s*:\s*(?P<remote_interface_address>\S+)')
+
+    # Local Interface ID   : 20
+    p52 = LazyRegex(r'Local\s+Interface\s+ID\s*:\s*(?P<local_interface_id>\S+)')
+
+    # Remote Interface ID   : 20
+    p53 = LazyRegex(r'Remote\s+Interface\s+ID\s*:\s*(?P<remote_interface_id>\S+)')
+
+    # SID   : 1
+    p54 = LazyRegex(r'SID\s*:\s*(?P<sid>\S+)')
+
+    # Graceful Restart Helper                
+    p55 = LazyRegex(r'(G|g)raceful\s+(R|r)estart\s+(H|h)elper')
+
+    # Stub Router Support
+    p56 = LazyRegex(r'(S|s)tub\s+(R|r)outer\s+(S|s)upport')
+
+    # SPF
+    p57 = LazyRegex(r'SPF')
+
+    # Strict SPF
+    p58 = LazyRegex(r'Strict\s+SPF')
+
+    # Sub-type: Node Max Sid Depth, Value: 13
+    p59 = LazyRegex(r'Sub\-type\s*:\s*Node\s+Max\s+Sid\s+Depth\,\s+Value:\s*(?P<value>\d+)')
+
+    # Number of TOS metrics: 0
+    p21_2 = LazyRegex(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
+
+    def cli(self, db_type, out=None):
+
+        assert db_type in ['external', 'network', 'summary', 'router',
+                           'opaque']
+
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4'
+        default_mt_id = 0
+        capabilities_flag = False
+        tlv_type_flag = False
+        sub_tlv_type_flag = False
+
+        # Router
+        # Network Link
+        # Summary Network
+        # Opaque Area
+        # Type-5 AS External
+        lsa_type_mapping = {
+            'router': 1,
+            'network': 2,
+            'summary': 3,
+            'external': 5,
+            'opaque': 10,
+            }
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.36.3.3) (Process ID 1)
             # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
                 instance = str(m.groupdict()['instance'])
@@ -4124,7 +4129,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
             # Summary Net Link States (Area 0.0.0.0)
             # Type-5 AS External Link States
             # Type-10 Opaque Link Area Link States (Area 0)
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 lsa_type = lsa_type_mapping[db_type]
                 
@@ -4172,13 +4177,13 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Routing Bit Set on this LSA
-            m = p3_1.match(line)
+            m = self.p3_1.match(line)
             if m:
                 routing_bit_enable = True
                 continue
 
             # LS age: 1565
-            m = p3_2.match(line)
+            m = self.p3_2.match(line)
             if m:
                 tlv_type_flag = False
                 sub_tlv_type_flag = False
@@ -4186,7 +4191,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # LS age: MAXAGE(3601)
-            m = p3_2_1.match(line)
+            m = self.p3_2_1.match(line)
             if m:
                 tlv_type_flag = False
                 sub_tlv_type_flag = False
@@ -4195,14 +4200,14 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Options: 0x20 (No TOS-capability, DC)
             # Options: (No TOS-capability, DC)
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 option = str(m.groupdict()['option'])
                 option_desc = str(m.groupdict()['option_desc'])
                 continue
 
             # LS Type: Type-5 AS-External
-            m = p5_1.match(line)
+            m = self.p5_1.match(line)
             if m:
                 lsa_type = lsa_type_mapping[db_type]
                 continue
@@ -4211,13 +4216,13 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
             # Link State ID: 10.94.44.44 (Network address)
             # Link State ID: 10.1.2.1 (Designated Router address)
             # Link State ID: 10.1.2.1 (address of Designated Router)
-            m = p5_2.match(line)
+            m = self.p5_2.match(line)
             if m:
                 lsa_id = str(m.groupdict()['lsa_id'])
                 continue
 
             # Advertising Router: 10.64.4.4
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 adv_router = str(m.groupdict()['adv_router'])
                 lsa = '{} {}'.format(lsa_id, adv_router)
@@ -4310,20 +4315,20 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                     pass
 
             # LS Seq Number: 0x80000002
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 header_dict['seq_num'] = str(m.groupdict()['ls_seq_num'])
                 continue
 
             # Checksum: 0x7d61
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 header_dict['checksum'] = str(m.groupdict()['checksum'])
                 continue
 
             # Length: 36
             # Length : 36
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 length = int(m.groupdict()['length'])
                 if sub_tlv_type_flag:
@@ -4335,7 +4340,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Network Mask: /32
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 dummy = '{}/{}'.format('0.0.0.0', m.groupdict()['net_mask'])
                 db_dict['network_mask'] = str(IPNetwork(dummy).netmask)
@@ -4343,20 +4348,20 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Metric Type: 2 (Larger than any link state path)
             # Metric Type: 2 (Larger than any link state path)
-            m = p11_1.match(line)
+            m = self.p11_1.match(line)
             if m:
                 db_topo_dict['flags'] = "E"
                 continue
 
             # Metric Type: 1 (Comparable directly to link state metric)
-            m = p11_2.match(line)
+            m = self.p11_2.match(line)
             if m:
                 # Do nothing
                 continue
 
             # TOS: 0
             # TOS: 0 Metric: 1
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 if db_type == 'router':
                     if m.groupdict()['tos']:
@@ -4373,25 +4378,25 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                         continue
 
             # Metric: 20
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 db_topo_dict['metric'] = int(m.groupdict()['metric'])
                 continue
 
             # Forward Address: 0.0.0.0
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 db_topo_dict['forwarding_address'] = str(m.groupdict()['addr'])
                 continue
 
             # External Route Tag: 0
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 db_topo_dict['external_route_tag'] = int(m.groupdict()['tag'])
                 continue
 
             # Attached Router: 10.84.66.66
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 attached_router = str(m.groupdict()['att_router'])
                 if 'attached_routers' not in db_dict:
@@ -4402,19 +4407,19 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Number of links: 3
             # Number of Links: 3
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 db_dict['num_of_links'] = int(m.groupdict()['num'])
                 continue
 
             # Link connected to: a Stub Network
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 link_type = str(m.groupdict()['type']).lower()
                 continue
 
             # Link connected to: another Router (point-to-point)
-            m = p18_1.match(line)
+            m = self.p18_1.match(line)
             if m:
                 if tlv_type_flag:                    
                     sub_link_type = str(m.groupdict()['type']).lower()
@@ -4428,7 +4433,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link ID) Network/subnet number: 10.4.1.1
-            m = p19_1.match(line)
+            m = self.p19_1.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -4454,7 +4459,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link ID) Designated Router address: 10.166.7.6
-            m = p19_2.match(line)
+            m = self.p19_2.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -4485,7 +4490,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link ID) Neighboring Router ID: 10.151.22.22
-            m = p19_3.match(line)
+            m = self.p19_3.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -4515,14 +4520,14 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link Data) Network Mask: 255.255.255.255
-            m = p20_1.match(line)
+            m = self.p20_1.match(line)
             if m:
                 db_dict['links'][link_id]['link_data'] = \
                     str(m.groupdict()['link_data'])
                 continue
 
             # (Link Data) Router Interface address: 10.166.7.6
-            m = p20_2.match(line)
+            m = self.p20_2.match(line)
             if m:
                 db_dict['links'][link_id]['link_data'] = \
                     str(m.groupdict()['link_data'])
@@ -4530,7 +4535,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # MTID 32 Metrics: 1
             # MTID   : 0
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
 
@@ -4555,58 +4560,57 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Number of MTID metrics: 0
-            m = p21_1.match(line)
+            m = self.p21_1.match(line)
             if m:
                 db_dict['links'][link_id]['num_mtid_metrics'] = \
                     int(m.groupdict()['num'])
                 continue
                 
             # Number of TOS metrics: 0
-            p21_2 = re.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
-            m = p21_2.match(line)
+            m = self.p21_2.match(line)
             if m:
                 db_dict['links'][link_id]['num_tos_metrics'] = \
                     int(m.groupdict()['num'])
                 continue
 
             # Opaque Type: 1
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 opaque_type = int(m.groupdict()['type'])
                 continue
             
             # Opaque ID: 38
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 opaque_id = int(m.groupdict()['id'])
                 continue
 
             # Fragment number: 0
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 header_dict['fragment_number'] = int(m.groupdict()['num'])
                 continue
 
             # MPLS TE router ID : 10.4.1.1
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 db_dict['mpls_te_router_id'] = str(m.groupdict()['mpls'])
                 continue
 
             # AS Boundary Router
-            m = p26_1.match(line)
+            m = self.p26_1.match(line)
             if m:
                 header_dict['as_boundary_router'] = True
                 continue
 
             # Area Border Router
-            m = p26_2.match(line)
+            m = self.p26_2.match(line)
             if m:
                 header_dict['area_border_router'] = True
                 continue
 
             # Link connected to Broadcast network
-            m = p27.match(line)
+            m = self.p27.match(line)
             if m:
                 link_tlv_counter += 1
                 if 'link_tlvs' not in db_dict:
@@ -4636,14 +4640,14 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Link ID : 10.1.4.4
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['link_id'] = \
                     str(m.groupdict()['id'])
                 continue
 
             # Interface Address : 10.1.4.1
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 addr = str(m.groupdict()['addr'])
                 if 'local_if_ipv4_addrs' not in db_dict['link_tlvs']\
@@ -4657,7 +4661,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                     continue
 
             # Admin Metric : 1
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['te_metric'] = \
                     int(m.groupdict()['te_metric'])
@@ -4665,7 +4669,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Maximum Bandwidth : 125000000
             # Maximum bandwidth : 125000000
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['max_bandwidth'] = \
                     int(m.groupdict()['max_band'])
@@ -4673,7 +4677,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Maximum reservable bandwidth : 93750000
             # Maximum reservable bandwidth global: 93750000
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]\
                     ['max_reservable_bandwidth'] = \
@@ -4681,28 +4685,28 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Affinity Bit : 0x0
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['admin_group'] = \
                     str(m.groupdict()['admin_group'])
                 continue
 
             # IGP Metric : 1
-            m = p33_1.match(line)
+            m = self.p33_1.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['igp_metric'] = \
                     int(m.groupdict()['igp_metric'])
                 continue
 
             # Number of Priority : 8
-            m = p33_2.match(line)
+            m = self.p33_2.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['total_priority'] = \
                     int(m.groupdict()['num'])
                 continue
             
             # Priority 0 : 93750000    Priority 1 : 93750000
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 value1 = '{} {}'.format(str(m.groupdict()['num1']), str(m.groupdict()['band1']))
                 value2 = '{} {}'.format(str(m.groupdict()['num2']), str(m.groupdict()['band2']))
@@ -4733,7 +4737,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                     continue
 
             # Unknown Sub-TLV   :  Type = 32770, Length = 4 Value = 00 00 00 01
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 unknown_tlvs_counter += 1
                 if 'unknown_tlvs' not in db_dict['link_tlvs'][link_tlv_counter]:
@@ -4751,7 +4755,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Extended Administrative Group : Length: 8
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 if 'extended_admin_group' not in db_dict['link_tlvs']\
                         [link_tlv_counter]:
@@ -4762,7 +4766,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # EAG[0]: 0
-            m = p37.match(line)
+            m = self.p37.match(line)
             if m:
                 group_num = int(m.groupdict()['group_num'])
                 if 'groups' not in db_dict['link_tlvs'][link_tlv_counter]\
@@ -4778,7 +4782,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Neighbor Address : 192.168.220.2
-            m = p38.match(line)
+            m = self.p38.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['remote_if_ipv4_addrs'] = {m.groupdict()['neighbor_address']: {}}
                 
@@ -4786,7 +4790,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # TLV Type: Extended Link
             # TLV Type: Segment Routing Node MSD
-            m = p39.match(line)
+            m = self.p39.match(line)
             if m:
                 tlv_type_flag = True
                 sub_tlv_type_flag = False
@@ -4795,31 +4799,31 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 tlv_type = group['tlv_type']
                 
                 # Router Information
-                if p39_1.match(tlv_type):
+                if self.p39_1.match(tlv_type):
                     tlv_type_field = 'router_capabilities_tlv'
 
                 # Segment Routing Algorithm
-                elif p39_2.match(tlv_type):
+                elif self.p39_2.match(tlv_type):
                     tlv_type_field = 'sr_algorithm_tlv'
 
                 # Segment Routing Range
-                elif p39_3.match(tlv_type):
+                elif self.p39_3.match(tlv_type):
                     tlv_type_field = 'sid_range_tlvs'
 
                 # Segment Routing Node MSD
-                elif p39_4.match(tlv_type):
+                elif self.p39_4.match(tlv_type):
                     tlv_type_field = 'node_msd_tlvs'
 
                 # Segment Routing Local Block
-                elif p39_5.match(tlv_type):
+                elif self.p39_5.match(tlv_type):
                     tlv_type_field = 'local_block_tlvs'
 
                 # Extended Prefix
-                elif p39_6.match(tlv_type):
+                elif self.p39_6.match(tlv_type):
                     tlv_type_field = 'extended_prefix_tlvs'
 
                 # Extended Link
-                elif p39_7.match(tlv_type):
+                elif self.p39_7.match(tlv_type):
                     tlv_type_field = 'extended_link_tlvs'
                 
                 tlv_types_index = db_dict.get(tlv_type_field, {}).keys()
@@ -4849,11 +4853,11 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 capability_field = None
 
                 # Graceful Restart Helper
-                if p55.match(line):
+                if self.p55.match(line):
                     capability_field = 'graceful_restart_helper'
 
                 # Stub Router Support
-                elif p56.match(line):
+                elif self.p56.match(line):
                     capability_field = 'stub_router'
 
                 if not capability_field:
@@ -4868,7 +4872,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Algorithm: SPF
             # Algorithm: Strict SPF
-            m = p40.match(line)
+            m = self.p40.match(line)
             if m:
                 group = m.groupdict()
                 algorithm = group['algorithm']
@@ -4881,11 +4885,11 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 algo_field = None
 
                 # SPF
-                if p57.match(algorithm):
+                if self.p57.match(algorithm):
                     algo_field = 'spf'
 
                 # Strict SPF
-                if p58.match(algorithm):
+                if self.p58.match(algorithm):
                     algo_field = 'strict_spf'
 
                 if not algo_field:
@@ -4897,7 +4901,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Range Size: 1000
-            m = p41.match(line)
+            m = self.p41.match(line)
             if m:
                 group = m.groupdict()
                 range_size = group['range_size']
@@ -4906,7 +4910,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Flags  : L-Bit, V-bit
-            m = p42.match(line)
+            m = self.p42.match(line)
             if m:
                 group = m.groupdict()
                 flags = group['flags']
@@ -4920,7 +4924,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Weight : 0
-            m = p44.match(line)
+            m = self.p44.match(line)
             if m:                
                 group = m.groupdict()
                 weight = int(group['weight'])
@@ -4934,7 +4938,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Label  : 19
-            m = p45.match(line)
+            m = self.p45.match(line)
             if m:
                 group = m.groupdict()
                 label = group['label']
@@ -4944,7 +4948,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # (Link Data) Interface IP address: 192.168.220.1
-            m = p46.match(line)
+            m = self.p46.match(line)
             if m:
                 group = m.groupdict()
                 tlv_type_dict['link_data'] = group['link_data']
@@ -4952,7 +4956,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Prefix    : 10.4.1.1/32
-            m = p47.match(line)
+            m = self.p47.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -4962,7 +4966,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # AF        : 0
-            m = p48.match(line)
+            m = self.p48.match(line)
             if m:
                 group = m.groupdict()
                 af = int(group['af'])
@@ -4972,7 +4976,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Route-type: Intra
-            m = p49.match(line)
+            m = self.p49.match(line)
             if m:
                 group = m.groupdict()
                 route_type = group['route_type']            
@@ -4983,7 +4987,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
 
             # Sub-TLV Type: Remote Intf Addr
             # Sub-TLV Type: Local / Remote Intf ID
-            m = p50.match(line)
+            m = self.p50.match(line)
             if m:
                 tlv_type_flag = False
                 sub_tlv_type_flag = True
@@ -5003,7 +5007,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Remote Interface Address   : 192.168.0.1
-            m = p51.match(line)
+            m = self.p51.match(line)
             if m:
                 group = m.groupdict()
                 remote_interface_address = group['remote_interface_address']
@@ -5011,7 +5015,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Local Interface ID   : 20
-            m = p52.match(line)
+            m = self.p52.match(line)
             if m:
                 group = m.groupdict()
                 local_interface_id = int(group['local_interface_id'])
@@ -5019,7 +5023,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue            
 
             # Remote Interface ID   : 20
-            m = p53.match(line)
+            m = self.p53.match(line)
             if m:
                 group = m.groupdict()
                 remote_interface_id = int(group['remote_interface_id'])
@@ -5027,7 +5031,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # SID   : 1
-            m = p54.match(line)                        
+            m = self.p54.match(line)                        
             if m:
                 group = m.groupdict()
                 sid = int(group['sid'])
@@ -5036,7 +5040,7 @@ class ShowIpOspfDatabaseTypeParser(MetaParser):
                 continue
 
             # Sub-type: Node Max Sid Depth, Value: 13
-            m = p59.match(line)
+            m = self.p59.match(line)
             if m:
                 group = m.groupdict()
                 sub_type_value = int(group['value'])
@@ -5134,7 +5138,8 @@ class ShowIpOspfDatabaseRouterSchema(MetaParser):
 # Parser for:
 #   * 'show ip ospf database router'
 # ==================================
-class ShowIpOspfDatabaseRouter(ShowIpOspfDatabaseRouterSchema, ShowIpOspfDatabaseTypeParser):
+class ShowIpOspfDatabaseRouter(ShowIpOspfDatabaseRouterSchema,
+                               ShowIpOspfDatabaseTypeParser, BlockParser):
 
     ''' Parser for:
         * 'show ip ospf database router'
@@ -5143,6 +5148,10 @@ class ShowIpOspfDatabaseRouter(ShowIpOspfDatabaseRouterSchema, ShowIpOspfDatabas
     cli_command = 'show ip ospf database router'
     exclude = ['age', 'seq_num', 'checksum', 'links']
 
+    # parse_blocks: one block per LSA, under its process and area
+    block_context = ['p1', 'p2']
+    block_header = ('p3_1', 'p3_2', 'p3_2_1')
+
 
     def cli(self, output=None):
         if not output:
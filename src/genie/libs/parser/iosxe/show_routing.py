@@ -8,6 +8,12 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+# import parser utils
+from genie.libs.parser.utils.regex import LazyRegex
+from genie.libs.parser.utils.stream import iter_lines, IncrementalParser
+from genie.libs.parser.utils.records import CompactParser
+from genie.libs.parser.utils.interning import interned
+
 # ====================================================
 #  distributor class for show ip route
 # ====================================================
@@ -173,7 +179,7 @@ class ShowIpRouteSchema(MetaParser):
 # ====================================================
 #  parser for show ip route
 # ====================================================
-class ShowIpRoute(ShowIpRouteSchema):
+class ShowIpRoute(ShowIpRouteSchema, IncrementalParser, CompactParser):
     """Parser for :
         show ip route
         show ip route vrf <vrf>"""
@@ -183,10 +189,66 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = ['updated']
     IP_VER='ipv4'
 
-    def cli(self, vrf="", protocol='', output=None):
+    # initial regexp pattern
+    p100 = LazyRegex(r'^Routing +entry +for +'
+                    '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
+                    '(, +(?P<net>[\w\s]+))?$')
+
+    p200 = LazyRegex(r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
+                    'distance +(?P<distance>\d+), +'
+                    'metric +(?P<metric>\d+)'
+                    '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
+
+    p300 = LazyRegex(r'^Redistributing +via +(?P<redist_via>\w+) *'
+                    '(?P<redist_via_tag>\d+)?$')
+
+    p400 = LazyRegex(r'^Last +update +from +(?P<from>[\w\.]+) +'
+                    'on +(?P<interface>[\w\.\/\-]+), +'
+                    '(?P<age>[\w\.\:]+) +ago$')
+
+    p500 = LazyRegex(r'^\*? *(?P<nexthop>[\w\.]+)(, +'
+                    'from +(?P<from>[\w\.]+), +'
+                    '(?P<age>[\w\.\:]+) +ago, +'
+                    'via +(?P<interface>[\w\.\/\-]+))?$')
+
+    p700 = LazyRegex(r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
+                     '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
+
+    p800 = LazyRegex(r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
+
+    p900 = LazyRegex(r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
+
+    # Routing Table: VRF1
+    p1 = LazyRegex(r'^Routing Table: +(?P<vrf>[\w]+)$')
+
+    # 10.1.0.0/32 is subnetted, 1 subnets
+    # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+    p2 = LazyRegex(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
+                   r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
+
+    #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
+    p4 = LazyRegex(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
+                   r'( +(?P<date>[0-9][\w\:]+),)?( +(?P<interface>[\S]+))?$')
+
+    #       is directly connected, GigabitEthernet0/2
+    p5 = LazyRegex(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
+                   r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
+                   r'( +(?P<interface>[\S]+))?$')
+
+    #      via 2001:DB8:1:1::2
+    #      via 10.4.1.1%default, indirectly connected
+    #      via 2001:DB8:4:6::6
+    #      via 2001:DB8:20:4:6::6%VRF2
+    #      via Null0, receive
+    p6 = LazyRegex(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
+                   r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
+                   r'( +directly connected)?( +indirectly connected)?$')
+
+    @interned
+    def cli(self, vrf="", protocol='', output=None, output_stream=None):
         if not vrf:
             vrf = 'default'
-        if output is None:
+        if output is None and output_stream is None:
             if vrf != 'default':
                 if protocol:
                     cmd = self.command[1].format(vrf=vrf, protocol=protocol)
@@ -220,38 +282,17 @@ class ShowIpRoute(ShowIpRouteSchema):
 
         result_dict = {}
 
-        # initial regexp pattern
-        p100 = re.compile(r'^Routing +entry +for +'
-                        '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
-                        '(, +(?P<net>[\w\s]+))?$')
-        p200 = re.compile(r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
-                        'distance +(?P<distance>\d+), +'
-                        'metric +(?P<metric>\d+)'
-                        '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
-        p300 = re.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
-                        '(?P<redist_via_tag>\d+)?$')
-        p400 = re.compile(r'^Last +update +from +(?P<from>[\w\.]+) +'
-                        'on +(?P<interface>[\w\.\/\-]+), +'
-                        '(?P<age>[\w\.\:]+) +ago$')
-        p500 = re.compile(r'^\*? *(?P<nexthop>[\w\.]+)(, +'
-                        'from +(?P<from>[\w\.]+), +'
-                        '(?P<age>[\w\.\:]+) +ago, +'
-                        'via +(?P<interface>[\w\.\/\-]+))?$')
         p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
                         'traffic +share +count +is +(?P<share_count>\d+)$')
 
         p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
                           'traffic +share +count +is +(?P<share_count>\d+)$')
-        p700 = re.compile(r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
-                          '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
-        p800 = re.compile(r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
-        p900 = re.compile(r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
 
         # initial variables
         ret_dict = {}
         index = 0
 
-        for line in out.splitlines():
+        for line in iter_lines(out, output_stream):
             if line:
                 line = line.strip()
             else:
@@ -259,17 +300,14 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             next_hop = interface = updated = metrics = route_preference = ""
             # Routing Table: VRF1
-            p1 = re.compile(r'^Routing Table: +(?P<vrf>[\w]+)$')
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 continue
 
             # 10.1.0.0/32 is subnetted, 1 subnets
             # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
-            p2 = re.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
-                            r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 # if you see the issue by "show ip route", it means that active is True.
                 # it means all routes in the output should be active=True
@@ -379,9 +417,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
-            p4 = re.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
-                            r'( +(?P<date>[0-9][\w\:]+),)?( +(?P<interface>[\S]+))?$')
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 routepreference = m.groupdict()['route_preference']
                 if routepreference and '/' in routepreference:
@@ -430,10 +466,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                 continue
 
             #       is directly connected, GigabitEthernet0/2
-            p5 = re.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
-                            r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
-                            r'( +(?P<interface>[\S]+))?$')
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
 
                 if m.groupdict()['route_preference']:
@@ -484,10 +517,7 @@ class ShowIpRoute(ShowIpRouteSchema):
             #      via 2001:DB8:4:6::6
             #      via 2001:DB8:20:4:6::6%VRF2
             #      via Null0, receive
-            p6 = re.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
-                            r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
-                            r'( +directly connected)?( +indirectly connected)?$')
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 vrf_val = ''
                 tmp_next_hop = m.groupdict()['next_hop']
@@ -532,7 +562,7 @@ class ShowIpRoute(ShowIpRouteSchema):
             # Routing entry for 10.151.0.0/24, 1 known subnets
             # Routing entry for 0.0.0.0/0, supernet
             # Routing entry for 192.168.154.0/24
-            m = p100.match(line)
+            m = self.p100.match(line)
             if m:
                 group = m.groupdict()
                 entry_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family',
@@ -545,7 +575,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Known via "eigrp 1", distance 130, metric 10880, type internal
             # Known via "rip", distance 120, metric 2
-            m = p200.match(line)
+            m = self.p200.match(line)
             if m:
                 group = m.groupdict()
                 route_dict.update({'distance': int(group['distance'])})
@@ -556,7 +586,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Redistributing via rip
             # Redistributing via eigrp 1
-            m = p300.match(line)
+            m = self.p300.match(line)
             if m:
                 group = m.groupdict()
                 route_dict.update({k: v for k, v in group.items() if v})
@@ -564,7 +594,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # Last update from 192.168.151.2 on Vlan101, 2w3d ago
             # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
-            m = p400.match(line)
+            m = self.p400.match(line)
             if m:
                 group = m.groupdict()
                 update_dict = route_dict.setdefault('update', {})
@@ -573,7 +603,7 @@ class ShowIpRoute(ShowIpRouteSchema):
 
             # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
             # * 10.69.1.2
-            m = p500.match(line)
+            m = self.p500.match(line)
             if m:
                 group = m.groupdict()
                 index += 1
@@ -592,21 +622,21 @@ class ShowIpRoute(ShowIpRouteSchema):
                 path_dict.update({k: v for k, v in group.items() if v})
 
             # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
-            m = p700.match(line)
+            m = self.p700.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Reliability 255/255, minimum MTU 1500 bytes
-            m = p800.match(line)
+            m = self.p800.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
             # Loading 1/255, Hops 1
-            m = p900.match(line)
+            m = self.p900.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: v for k, v in group.items() if v})
@@ -623,10 +653,10 @@ class ShowIpv6Route(ShowIpRoute):
     exclude = ['uptime']
 
     IP_VER = 'ipv6'
-    def cli(self, vrf='', protocol='', output=None):
+    def cli(self, vrf='', protocol='', output=None, output_stream=None):
         if not vrf:
             vrf = 'default'
-        if output is None:
+        if output is None and output_stream is None:
             if vrf != 'default':
                 if protocol:
                     cmd = self.command[1].format(vrf=vrf, protocol=protocol)
@@ -640,7 +670,8 @@ class ShowIpv6Route(ShowIpRoute):
             out = self.device.execute(cmd)
         else:
             out = output
-        return super().cli(vrf=vrf, protocol=protocol, output=out)
+        return super().cli(vrf=vrf, protocol=protocol, output=out,
+                           output_stream=output_stream)
 
 # ====================================================
 #  schema for show ipv6 route updated
@@ -1,5 +1,6 @@
 
 # Python
+import io
 import unittest
 from unittest.mock import Mock
 
@@ -885,6 +886,15 @@ class test_show_bgp_all(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output3)
 
+    def test_show_bgp_all_golden1_stream(self):
+        self.maxDiff = None
+        self.device = Mock()
+        output = self.golden_output1['execute.return_value']
+        obj = ShowBgpAll(device=self.device)
+        parsed_output = obj.parse(output_stream=io.StringIO(output))
+        self.assertEqual(parsed_output, self.golden_parsed_output1)
+        self.assertFalse(self.device.execute.called)
+
 
 # =======================================
 # Unit test for:
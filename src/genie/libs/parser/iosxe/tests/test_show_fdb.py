@@ -1,4 +1,5 @@
 #!/bin/env python
+import io
 import unittest
 from unittest.mock import Mock
 from ats.topology import Device
@@ -180,6 +181,15 @@ class test_show_mac_address_table(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output)
 
+    def test_golden_stream(self):
+        self.maxDiff = None
+        self.dev_c3850 = Mock()
+        output = self.golden_output['execute.return_value']
+        obj = ShowMacAddressTable(device=self.dev_c3850)
+        parsed_output = obj.parse(output_stream=io.StringIO(output))
+        self.assertEqual(parsed_output,self.golden_parsed_output)
+        self.assertFalse(self.dev_c3850.execute.called)
+
 
 class test_show_mac_address_table_2(unittest.TestCase):
     dev1 = Device(name='empty')
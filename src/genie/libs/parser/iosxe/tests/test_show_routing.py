@@ -1,3 +1,4 @@
+import io
 import unittest
 from unittest.mock import Mock
 # ATS
@@ -926,6 +927,26 @@ class TestShowIpRoute(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output_1)
 
+    def test_show_ip_route_1_stream(self):
+        self.maxDiff = None
+        self.device = Mock()
+        output = self.golden_output_1['execute.return_value']
+        obj = ShowIpRoute(device=self.device)
+        parsed_output = obj.parse(output_stream=io.StringIO(output))
+        self.assertEqual(parsed_output, self.golden_parsed_output_1)
+        self.assertFalse(self.device.execute.called)
+
+    def test_show_ip_route_1_feed(self):
+        self.maxDiff = None
+        self.device = Mock()
+        output = self.golden_output_1['execute.return_value']
+        obj = ShowIpRoute(device=self.device)
+        for i in range(0, len(output), 64):
+            obj.feed(output[i:i + 64])
+        parsed_output = obj.close()
+        self.assertEqual(parsed_output, self.golden_parsed_output_1)
+        self.assertFalse(self.device.execute.called)
+
     def test_show_ip_route_2_with_vrf(self):
         self.maxDiff = None
         self.device = Mock(**self.golden_output_2_with_vrf)
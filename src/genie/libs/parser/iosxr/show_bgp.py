@@ -57,6 +57,10 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+from genie.libs.parser.utils.regex import LazyRegex
+from genie.libs.parser.utils.stream import iter_lines, IncrementalParser
+from genie.libs.parser.utils.path_store import SharedPathParser, \
+    open_path
 
 # Logger
 logger = logging.getLogger(__name__)
@@ -1043,6 +1047,168 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                'allocated', 'freed', 'received_updates', 'num_of_scan_segments', 'state',
                'restart_count', 'memory_used', 'number']
 
+    p1 = LazyRegex(r'^\s*BGP +instance +(?P<num>\S+): +\'(?P<instance>\S+)\'$')
+
+    p1_1 = LazyRegex(r'^\s*VRF: +(?P<vrf>[a-zA-Z0-9\_]+)$')
+
+    p1_1_1 = LazyRegex(r'^BGP +Process +Information: +VRF +(?P<vrf>[\w_]+)$')
+
+    p1_2 = LazyRegex(r'^\s*BGP *Route *Distinguisher:'
+                     ' *(?P<route_distinguisher>[0-9\:]+)$')
+
+    p2 = LazyRegex(r'BGP *is *operating *in *'
+                   '(?P<operation_mode>\w+) *mode$')
+
+    p3 = LazyRegex(r'^Autonomous *System *number *format: *'
+                   '(?P<as_format>[a-zA-Z]+)$')
+
+    p4 = LazyRegex(r'^Autonomous *System: *(?P<as_number>[0-9]+)$')
+
+    p5 = LazyRegex(r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
+                   '(\([\w\s]+\))?$')
+
+    p6_1 = LazyRegex(r'^Default *Cluster *ID: *'
+                     '(?P<default_cluster_id>[\w\.\:]+) *'
+                     '(\([\w\s\:\.\,]+\))?$')
+
+    p6_2 = LazyRegex(r'^Active *Cluster *IDs: *'
+                     '(?P<active_cluster_id>[\w\.\:]+)$')
+
+    p7_1 = LazyRegex(r'^Always compare MED is enabled$')
+
+    p7_2 = LazyRegex(r'^Comparing router ID for eBGP paths$')
+
+    p7_4 = LazyRegex(r'^Treating missing MED as worst$')
+
+    p8 = LazyRegex(r'^Fast +external +fallover +enabled$')
+
+    p9 = LazyRegex(r'^Platform *RLIMIT *max: *'
+                   '(?P<platform_rlimit_max>[0-9\,]+) *bytes$')
+
+    p10 = LazyRegex(r'^Maximum +limit +for +BMP +buffer +size: *'
+                    '(?P<size>[a-zA-Z0-9]+) *MB$')
+
+    p11 = LazyRegex(r'^Default *value *for *BMP *buffer *size: *'
+                    '(?P<size>[a-zA-Z0-9]+) *MB$')
+
+    p12 = LazyRegex(r'^Current *limit *for *BMP *buffer *size: *'
+                    '(?P<size>[a-zA-Z0-9]+) *MB$')
+
+    p13 = LazyRegex(r'^Current *utilization *of *BMP *buffer *'
+                    'limit: *(?P<limit>[a-zA-Z0-9]+) *B$')
+
+    p14 = LazyRegex(r'^Neighbor *logging *is *(?P<nbr_logging>\w+)$')
+
+    p15 = LazyRegex(r'^Enforce +first +AS +(?P<as_enabled>\w+)$')
+
+    p16 = LazyRegex(r'^Default *local *preference: *'
+                    '(?P<preference>[0-9]+)$')
+
+    p17 = LazyRegex(r'^Default *keepalive: *(?P<keepalive>[0-9]+)$')
+
+    p18 = LazyRegex(r'^Non\-stop *routing *is +(?P<status>[a-zA-Z]+)$')
+
+    p19 = LazyRegex(r'^Update *delay: *(?P<update_delay>[0-9]+)$')
+
+    p20 = LazyRegex(r'^Generic *scan *interval: *'
+                    '(?P<scan_interval>[0-9]+)$')
+
+    p21 = LazyRegex(r'^BGP *Speaker *process: *'
+                    '(?P<speaker>\w+), +Node: +(?P<node>\w+)$')
+
+    p22 = LazyRegex(r'^Restart *count: *(?P<restart_count>[0-9]+)$')
+
+    p23 = LazyRegex(r'^(?P<vrf_info>[\w\-]+) +VRFs: +'
+                    '(?P<total>[0-9]+) +'
+                    '(?P<nbrs_estab>[0-9]+)/(?P<cfg>[0-9]+)$')
+
+    p24_1 = LazyRegex(r'^Updates:'
+                      ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
+
+    p24_2 = LazyRegex(r'^Notifications:'
+                      ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
+
+    p26 = LazyRegex(r'^Pool +(?P<pool>\w+): +(?P<alloc>\d+) +'
+                    '(?P<free>\d+)$')
+
+    p25 = LazyRegex(r'^(?P<att>[\w\s]+): +(?P<number>[0-9]+) +'
+                    '(?P<memory_used>[0-9]+)$')
+
+    p29 = LazyRegex(r'^Address *family: *(?P<af>[a-zA-Z0-9\s\-\_]+)$')
+
+    p29_1 = LazyRegex(r'^VRF +(?P<current_vrf>(\S+)) +Address +family:'
+                      ' +(?P<af>[a-zA-Z0-9\s\-\_]+)'
+                      '(?: +\(Table +(?P<table_state>[a-z]+)\))?$')
+
+    p30 = LazyRegex(r'^Dampening +is +(?P<dampening>[\w\s]+)$')
+
+    p31 = LazyRegex(r'^Client +reflection +is +enabled +in +global +config$')
+
+    p31_1 = LazyRegex(r'^Client +reflection +is +not +enabled +in +global +config$')
+
+    p32 = LazyRegex(r'^Dynamic *MED *is *(?P<dynamic_med>\w+)$')
+
+    p33 = LazyRegex(r'^Dynamic *MED *interval *: *'
+                    '(?P<interval>[a-zA-Z0-9\s]+)$')
+
+    p34 = LazyRegex(r'^Dynamic *MED *Timer *: *'
+                    '(?P<dynamic_med_timer>[a-zA-Z0-9\s]+)$')
+
+    p35 = LazyRegex(r'^Dynamic *MED *Periodic *Timer *: *'
+                    '(?P<timer>[a-zA-Z0-9\s]+)$')
+
+    p36 = LazyRegex(r'^Scan *interval: *(?P<scan_interval>[\w\s]+)$')
+
+    p37 = LazyRegex(r'^Total *prefixes *scanned: *'
+                    '(?P<scan>[a-zA-Z0-9\s]+)$')
+
+    p38 = LazyRegex(r'^Prefixes *scanned *per *segment: *'
+                    '(?P<prefix_scan>[a-zA-Z0-9\s]+)$')
+
+    p39 = LazyRegex(r'^Number *of *scan *segments: *'
+                    '(?P<num_of_scan_segments>[a-zA-Z0-9\s]+)$')
+
+    p40 = LazyRegex(r'^Nexthop *resolution *minimum *prefix\-length: *'
+                    '(?P<length>[\w\s\(\)]+)$')
+
+    p41 = LazyRegex(r'^Main *Table *Version: *(?P<main_tab_ver>[\w\s]+)$')
+
+    p42 = LazyRegex(r'^Table *version *synced *to *RIB: *'
+                    '(?P<rib>[a-zA-Z0-9\s]+)$')
+
+    p43 = LazyRegex(r'^Table *version *acked *by *RIB: *'
+                    '(?P<rib>[a-zA-Z0-9\s]+)$')
+
+    p44 = LazyRegex(r'^RIB *has *not *converged: *'
+                    '(?P<rib>[a-zA-Z0-9\s]+)$')
+
+    p54 = LazyRegex(r'^RIB *table *prefix\-limit *reached +\? *'
+                    '\[(?P<rib>\w+)\], +version +(?P<ver>\d+)$')
+
+    p45 = LazyRegex(r'^Permanent +Network +(?P<status>\w+)$')
+
+    p46 = LazyRegex(r'^State: *(?P<state>[a-zA-Z\s]+).$')
+
+    p47 = LazyRegex(r'^BGP *Table *Version: *(?P<tab_ver>\w+)$')
+
+    p48 = LazyRegex(r'^Attribute *download: *(?P<attr>[\w\s]+)$')
+
+    p49 = LazyRegex(r'^Label *retention *timer *value *'
+                    '(?P<timer>[a-zA-Z0-9\s]+)$')
+
+    p50 = LazyRegex(r'^Soft *Reconfig *Entries: *(?P<ent>\d+)$')
+
+    p51 = LazyRegex(r'^Table *bit\-field *size *: *'
+                    '(?P<size>[0-9\s]+) *Chunk *element *size *: *'
+                    '(?P<elememt_size>\d+)$')
+
+    p52 = LazyRegex(r'^(?P<thread>\w+\s\w+) *'
+                    '(?P<trigger>\w+\s\d+\s[\d\:\.]+) +(?P<ver>[0-9]+) +'
+                    '(?P<tbl_ver>[0-9]+) +(?P<trig_tid>[0-9]+)$')
+
+    p53 = LazyRegex(r'^(?P<remote>[\w\s\-]+): *(?P<v1>\d+) *'
+                    '(?P<v2>[0-9]+)$')
+
     def cli(self, vrf_type='all', instance='all', vrf='all', address_family='', output=None):
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
@@ -1064,107 +1230,6 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                                                    vrf=vrf))
         else:
             out = output
-        p1 = re.compile(r'^\s*BGP +instance +(?P<num>\S+): +\'(?P<instance>\S+)\'$')
-        p1_1 = re.compile(r'^\s*VRF: +(?P<vrf>[a-zA-Z0-9\_]+)$')
-        p1_1_1 = re.compile(r'^BGP +Process +Information: +VRF +(?P<vrf>[\w_]+)$')
-        p1_2 = re.compile(r'^\s*BGP *Route *Distinguisher:'
-                          ' *(?P<route_distinguisher>[0-9\:]+)$')
-        p2 = re.compile(r'BGP *is *operating *in *'
-                        '(?P<operation_mode>\w+) *mode$')
-        p3 = re.compile(r'^Autonomous *System *number *format: *'
-                        '(?P<as_format>[a-zA-Z]+)$')
-        p4 = re.compile(r'^Autonomous *System: *(?P<as_number>[0-9]+)$')
-        p5 = re.compile(r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
-                        '(\([\w\s]+\))?$')
-        p6_1 = re.compile(r'^Default *Cluster *ID: *'
-                          '(?P<default_cluster_id>[\w\.\:]+) *'
-                          '(\([\w\s\:\.\,]+\))?$')
-        p6_2 = re.compile(r'^Active *Cluster *IDs: *'
-                          '(?P<active_cluster_id>[\w\.\:]+)$')
-        p7_1 = re.compile(r'^Always compare MED is enabled$')
-        p7_2 = re.compile(r'^Comparing router ID for eBGP paths$')
-        p7_4 = re.compile(r'^Treating missing MED as worst$')
-        p8 = re.compile(r'^Fast +external +fallover +enabled$')
-        p9 = re.compile(r'^Platform *RLIMIT *max: *'
-                        '(?P<platform_rlimit_max>[0-9\,]+) *bytes$')
-        p10 = re.compile(r'^Maximum +limit +for +BMP +buffer +size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p11 = re.compile(r'^Default *value *for *BMP *buffer *size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p12 = re.compile(r'^Current *limit *for *BMP *buffer *size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p13 = re.compile(r'^Current *utilization *of *BMP *buffer *'
-                         'limit: *(?P<limit>[a-zA-Z0-9]+) *B$')
-        p14 = re.compile(r'^Neighbor *logging *is *(?P<nbr_logging>\w+)$')
-        p15 = re.compile(r'^Enforce +first +AS +(?P<as_enabled>\w+)$')
-        p16 = re.compile(r'^Default *local *preference: *'
-                         '(?P<preference>[0-9]+)$')
-        p17 = re.compile(r'^Default *keepalive: *(?P<keepalive>[0-9]+)$')
-        p18 = re.compile(r'^Non\-stop *routing *is +(?P<status>[a-zA-Z]+)$')
-        p19 = re.compile(r'^Update *delay: *(?P<update_delay>[0-9]+)$')
-        p20 = re.compile(r'^Generic *scan *interval: *'
-                         '(?P<scan_interval>[0-9]+)$')
-        p21 = re.compile(r'^BGP *Speaker *process: *'
-                         '(?P<speaker>\w+), +Node: +(?P<node>\w+)$')
-        p22 = re.compile(r'^Restart *count: *(?P<restart_count>[0-9]+)$')
-        p23 = re.compile(r'^(?P<vrf_info>[\w\-]+) +VRFs: +'
-                         '(?P<total>[0-9]+) +'
-                         '(?P<nbrs_estab>[0-9]+)/(?P<cfg>[0-9]+)$')
-        p24_1 = re.compile(r'^Updates:'
-                           ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
-        p24_2 = re.compile(r'^Notifications:'
-                           ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
-        p26 = re.compile(r'^Pool +(?P<pool>\w+): +(?P<alloc>\d+) +'
-                         '(?P<free>\d+)$')
-        p25 = re.compile(r'^(?P<att>[\w\s]+): +(?P<number>[0-9]+) +'
-                         '(?P<memory_used>[0-9]+)$')
-        p29 = re.compile(r'^Address *family: *(?P<af>[a-zA-Z0-9\s\-\_]+)$')
-        p29_1 = re.compile(r'^VRF +(?P<current_vrf>(\S+)) +Address +family:'
-                           ' +(?P<af>[a-zA-Z0-9\s\-\_]+)'
-                           '(?: +\(Table +(?P<table_state>[a-z]+)\))?$')
-        p30 = re.compile(r'^Dampening +is +(?P<dampening>[\w\s]+)$')
-        p31 = re.compile(r'^Client +reflection +is +enabled +in +global +config$')
-        p31_1 = re.compile(r'^Client +reflection +is +not +enabled +in +global +config$')
-        p32 = re.compile(r'^Dynamic *MED *is *(?P<dynamic_med>\w+)$')
-        p33 = re.compile(r'^Dynamic *MED *interval *: *'
-                         '(?P<interval>[a-zA-Z0-9\s]+)$')
-        p34 = re.compile(r'^Dynamic *MED *Timer *: *'
-                         '(?P<dynamic_med_timer>[a-zA-Z0-9\s]+)$')
-        p35 = re.compile(r'^Dynamic *MED *Periodic *Timer *: *'
-                         '(?P<timer>[a-zA-Z0-9\s]+)$')
-        p36 = re.compile(r'^Scan *interval: *(?P<scan_interval>[\w\s]+)$')
-        p37 = re.compile(r'^Total *prefixes *scanned: *'
-                         '(?P<scan>[a-zA-Z0-9\s]+)$')
-        p38 = re.compile(r'^Prefixes *scanned *per *segment: *'
-                         '(?P<prefix_scan>[a-zA-Z0-9\s]+)$')
-        p39 = re.compile(r'^Number *of *scan *segments: *'
-                         '(?P<num_of_scan_segments>[a-zA-Z0-9\s]+)$')
-        p40 = re.compile(r'^Nexthop *resolution *minimum *prefix\-length: *'
-                         '(?P<length>[\w\s\(\)]+)$')
-        p41 = re.compile(r'^Main *Table *Version: *(?P<main_tab_ver>[\w\s]+)$')
-        p42 = re.compile(r'^Table *version *synced *to *RIB: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p43 = re.compile(r'^Table *version *acked *by *RIB: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p44 = re.compile(r'^RIB *has *not *converged: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p54 = re.compile(r'^RIB *table *prefix\-limit *reached +\? *'
-                         '\[(?P<rib>\w+)\], +version +(?P<ver>\d+)$')
-        p45 = re.compile(r'^Permanent +Network +(?P<status>\w+)$')
-        p46 = re.compile(r'^State: *(?P<state>[a-zA-Z\s]+).$')
-        p47 = re.compile(r'^BGP *Table *Version: *(?P<tab_ver>\w+)$')
-        p48 = re.compile(r'^Attribute *download: *(?P<attr>[\w\s]+)$')
-        p49 = re.compile(r'^Label *retention *timer *value *'
-                         '(?P<timer>[a-zA-Z0-9\s]+)$')
-        p50 = re.compile(r'^Soft *Reconfig *Entries: *(?P<ent>\d+)$')
-        p51 = re.compile(r'^Table *bit\-field *size *: *'
-                         '(?P<size>[0-9\s]+) *Chunk *element *size *: *'
-                         '(?P<elememt_size>\d+)$')
-        p52 = re.compile(r'^(?P<thread>\w+\s\w+) *'
-                         '(?P<trigger>\w+\s\d+\s[\d\:\.]+) +(?P<ver>[0-9]+) +'
-                         '(?P<tbl_ver>[0-9]+) +(?P<trig_tid>[0-9]+)$')
-        p53 = re.compile(r'^(?P<remote>[\w\s\-]+): *(?P<v1>\d+) *'
-                         '(?P<v2>[0-9]+)$')
         # Init dict
         ret_dict = {}
 
@@ -1179,7 +1244,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP instance 0: 'default'
 
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 instance = m.groupdict()['instance']
 
@@ -1198,7 +1263,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # VRF: VRF1
 
-            m = p1_1.match(line)
+            m = self.p1_1.match(line)
             if m:
                 ret_dict.setdefault('instance', {}).setdefault(instance, {})
                 vrf = str(m.groupdict()['vrf'])
@@ -1225,7 +1290,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                 continue
             # BGP Process Information: VRF VRF1
 
-            m = p1_1_1.match(line)
+            m = self.p1_1_1.match(line)
             if m:
                 vrf = str(m.groupdict()['vrf'])
                 ret_dict.setdefault('instance', {}).setdefault(instance, {}).setdefault(
@@ -1250,7 +1315,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP Route Distinguisher: 100:1
 
-            m = p1_2.match(line)
+            m = self.p1_2.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
 
@@ -1260,7 +1325,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP is operating in STANDALONE mode
 
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 operation_mode = m.groupdict()['operation_mode'].lower()
                 ret_dict.setdefault('instance', {}).setdefault(instance, {}).setdefault(
@@ -1271,7 +1336,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Autonomous System number format: ASPLAIN
 
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 as_format = m.groupdict()['as_format']
 
@@ -1281,7 +1346,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Autonomous System: 100
 
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 as_number = int(m.groupdict()['as_number'])
 
@@ -1291,7 +1356,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Router ID: 10.4.1.1 (manually configured)
 
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 router_id = m.groupdict()['router_id']
 
@@ -1302,7 +1367,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Default Cluster ID: 10.4.1.1
             # Default Cluster ID: 10 (manually configured)
 
-            m = p6_1.match(line)
+            m = self.p6_1.match(line)
             if m:
                 default_cluster_id = m.groupdict()['default_cluster_id']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1311,7 +1376,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Active Cluster IDs:  10.4.1.1
 
-            m = p6_2.match(line)
+            m = self.p6_2.match(line)
             if m:
                 active_cluster_id = m.groupdict()['active_cluster_id']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1320,7 +1385,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Always compare MED is enabled
 
-            m = p7_1.match(line)
+            m = self.p7_1.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['always_compare_med'] = True
@@ -1328,7 +1393,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Comparing router ID for eBGP paths
 
-            m = p7_2.match(line)
+            m = self.p7_2.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['bestpath_compare_routerid'] = True
@@ -1336,7 +1401,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Treating missing MED as worst
 
-            m = p7_4.match(line)
+            m = self.p7_4.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['bestpath_med_missing_at_worst'] = True
@@ -1344,7 +1409,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Fast external fallover enabled
 
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['fast_external_fallover'] = True
@@ -1352,7 +1417,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Platform RLIMIT max: 2147483648 bytes
 
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 platform_rlimit_max = int(m.groupdict()['platform_rlimit_max'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1361,7 +1426,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Maximum limit for BMP buffer size: 409 MB
 
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 size = int(m.groupdict()['size'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1370,7 +1435,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Default value for BMP buffer size: 307 MB
 
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 size = int(m.groupdict()['size'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1379,7 +1444,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Current limit for BMP buffer size: 307 MB
 
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 size = int(m.groupdict()['size'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1388,7 +1453,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Current utilization of BMP buffer limit: 0 B
 
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 limit = int(m.groupdict()['limit'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1397,7 +1462,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Neighbor logging is enabled
 
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 nbr_logging = m.groupdict()['nbr_logging']
                 if nbr_logging == 'enabled':
@@ -1410,7 +1475,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Enforce first AS enabled
 
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 as_enabled = m.groupdict()['as_enabled']
                 if as_enabled == 'enabled':
@@ -1423,7 +1488,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Default local preference: 100
 
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 default_local_preference = int(m.groupdict()['preference'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1432,7 +1497,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Default keepalive: 60
 
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 default_keepalive = int(m.groupdict()['keepalive'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1441,7 +1506,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Non-stop routing is enabled
 
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 status = m.groupdict()['status']
                 if status == 'enabled':
@@ -1454,7 +1519,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Update delay: 120
 
-            m = p19.match(line)
+            m = self.p19.match(line)
             if m:
                 update_delay = int(m.groupdict()['update_delay'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1463,7 +1528,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Generic scan interval: 60
 
-            m = p20.match(line)
+            m = self.p20.match(line)
             if m:
                 scan_interval = int(m.groupdict()['scan_interval'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1472,7 +1537,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP Speaker process: 0, Node: node0_0_CPU0
 
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 speaker = int(m.groupdict()['speaker'])
                 node = m.groupdict()['node']
@@ -1484,7 +1549,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Restart count: 1
 
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 restart_count = int(m.groupdict()['restart_count'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1495,7 +1560,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Default vrfs:              1               2/2
             # Non-Default vrfs:          2               4/4
 
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 if 'vrf_info' not in ret_dict['instance'][instance]['vrf'][vrf] \
                         :
@@ -1533,7 +1598,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             if re.compile(r'BMP +pool +summary:').match(line):
                 flag = 'bmp'
 
-            m = p26.match(line)
+            m = self.p26.match(line)
 
             if m and flag == 'message':
                 if 'message_logging_pool_summary' not in ret_dict['instance'] \
@@ -1600,7 +1665,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Updates:                   14              24
             # Notifications:             1               0
 
-            m = p24_1.match(line)
+            m = self.p24_1.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['sent_updates'] = int(m.groupdict()['sent'])
@@ -1612,7 +1677,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Updates:                   14              24
             # Notifications:             1               0
 
-            m = p24_2.match(line)
+            m = self.p24_2.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['sent_notifications'] = int(m.groupdict()['sent'])
@@ -1633,8 +1698,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Route Reflector Entries:   4               320
             # Nexthop Entries:           32              12800
 
-
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m and not flag:
                 if 'att' not in ret_dict['instance'][instance]['vrf'][vrf] \
                         :
@@ -1659,7 +1723,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Address family: VPNv4 Unicast
 
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 af = str(m.groupdict()['af']).lower()
                 af.strip()
@@ -1675,7 +1739,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # VRF VRF1 Address family: IPv6 Unicast
             # VRF a Address family: IPv4 Unicast (Table inactive)
 
-            m = p29_1.match(line)
+            m = self.p29_1.match(line)
             if m:
                 af = str(m.groupdict()['af']).lower()
                 af.strip()
@@ -1698,7 +1762,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dampening is not enabled
 
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 dampening = m.groupdict()['dampening'].lower()
                 if 'not enabled' in dampening:
@@ -1711,7 +1775,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Client reflection is enabled in global config
 
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['address_family'][af]['client_to_client_reflection'] = True
@@ -1719,7 +1783,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Client reflection is not enabled in global config
 
-            m = p31_1.match(line)
+            m = self.p31_1.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['address_family'][af]['client_to_client_reflection'] = False
@@ -1727,7 +1791,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED is Disabled
 
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 dynamic_med = m.groupdict()['dynamic_med'].lower()
                 if status == 'enabled':
@@ -1740,7 +1804,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED interval : 10 minutes
 
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 interval = m.groupdict()['interval']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1749,7 +1813,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED Timer : Not Running
 
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 timer = m.groupdict()['dynamic_med_timer']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1758,7 +1822,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED Periodic Timer : Not Running
 
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 timer = m.groupdict()['timer']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1767,7 +1831,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Scan interval: 60
 
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 scan_interval = m.groupdict()['scan_interval']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1776,7 +1840,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Total prefixes scanned: 40
 
-            m = p37.match(line)
+            m = self.p37.match(line)
             if m:
                 scan = m.groupdict()['scan']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1785,7 +1849,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Prefixes scanned per segment: 100000
 
-            m = p38.match(line)
+            m = self.p38.match(line)
             if m:
                 prefix_scan = m.groupdict()['prefix_scan']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1794,7 +1858,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Number of scan segments: 1
 
-            m = p39.match(line)
+            m = self.p39.match(line)
             if m:
                 ret = m.groupdict()['num_of_scan_segments']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1803,7 +1867,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Nexthop resolution minimum prefix-length: 0 (not configured)
 
-            m = p40.match(line)
+            m = self.p40.match(line)
             if m:
                 length = m.groupdict()['length']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1813,7 +1877,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Main Table Version: 43
 
-            m = p41.match(line)
+            m = self.p41.match(line)
             if m:
                 main_tab_ver = m.groupdict()['main_tab_ver']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1822,7 +1886,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Table version synced to RIB: 43
 
-            m = p42.match(line)
+            m = self.p42.match(line)
             if m:
                 rib = m.groupdict()['rib']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1831,7 +1895,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Table version acked by RIB: 0
 
-            m = p43.match(line)
+            m = self.p43.match(line)
             if m:
                 rib = m.groupdict()['rib']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1840,7 +1904,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # RIB has not converged: version 0
 
-            m = p44.match(line)
+            m = self.p44.match(line)
             if m:
                 rib = m.groupdict()['rib']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1849,7 +1913,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # RIB table prefix-limit reached ?  [No], version 0
 
-            m = p54.match(line)
+            m = self.p54.match(line)
             if m:
                 rib = m.groupdict()['rib'].lower()
                 ver = m.groupdict()['ver']
@@ -1861,7 +1925,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Permanent Network Unconfigured
 
-            m = p45.match(line)
+            m = self.p45.match(line)
             if m:
                 status = m.groupdict()['status'].lower()
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1870,7 +1934,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # State: Normal mode.
 
-            m = p46.match(line)
+            m = self.p46.match(line)
             if m:
                 state = m.groupdict()['state'].lower()
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1879,7 +1943,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP Table Version: 43
 
-            m = p47.match(line)
+            m = self.p47.match(line)
             if m:
                 tab_ver = m.groupdict()['tab_ver']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1888,7 +1952,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Attribute download: Disabled
 
-            m = p48.match(line)
+            m = self.p48.match(line)
             if m:
                 attr = str(m.groupdict()['attr'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1897,7 +1961,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Label retention timer value 5 mins
 
-            m = p49.match(line)
+            m = self.p49.match(line)
             if m:
                 timer = m.groupdict()['timer']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1906,7 +1970,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Soft Reconfig Entries: 0
 
-            m = p50.match(line)
+            m = self.p50.match(line)
             if m:
                 ent = m.groupdict()['ent']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1915,7 +1979,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Table bit-field size : 1 Chunk element size : 3
 
-            m = p51.match(line)
+            m = self.p51.match(line)
             if m:
                 table_bit_field_size = m.groupdict()['size']
                 chunk_elememt_size = m.groupdict()['elememt_size']
@@ -1937,8 +2001,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             #                    Jun 28 18:24:52.694   33          33          3       
             #                    Total triggers: 17
 
-
-            m = p52.match(line)
+            m = self.p52.match(line)
             if m:
                 if 'thread' not in ret_dict['instance'][instance]['vrf'][vrf] \
                         ['address_family'][af]:
@@ -1989,8 +2052,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             if re.compile(r'^Number +Mem Used$').match(line):
                 flag = 'number'
 
-
-            m = p53.match(line)
+            m = self.p53.match(line)
             if m and flag == 'allocated':
                 try:
                     af
@@ -2338,6 +2400,177 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
         , 'cummulative_no_no_policy', 'route_refresh_request_sent']
 
         
+    p1 = LazyRegex(r'^BGP +instance +(?P<instance_number>[0-9]+): +'
+                       '(?P<instance>[a-zA-Z0-9\-\_\']+)$')
+
+    p2 = LazyRegex(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
+
+    p2_1 = LazyRegex(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>[a-zA-Z0-9]+)$')
+
+    p3 = LazyRegex(r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS'
+                       ' +(?P<local_as_as_no>[0-9]+)'
+                       '(?:, +(?P<link_state>[a-zA-Z\s]+))?$')
+
+    p4 = LazyRegex(r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$')
+
+    p5 = LazyRegex(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
+                       '(?:, +up +for +(?P<up_time>[\w\:]+))?$')
+
+    p5_1 = LazyRegex(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)(?:(?P<reason>.*))')
+
+    p6 = LazyRegex(r'^NSR *State: *(?P<nsr_state>[a-zA-Z]+)$')
+
+    p7 = LazyRegex(r'^Last *read *(?P<last_read>[0-9\:]+), *Last *read *before *reset *(?P<last_read_before_reset>[0-9\:]+)$')
+
+    p8 = LazyRegex(r'^Hold +time +is +(?P<holdtime>[0-9]+), +keepalive'
+                       ' +interval +is +(?P<keepalive_interval>[0-9]+)'
+                       ' +seconds$')
+
+    p9 = LazyRegex(r'^Configured +hold +time:'
+                       ' +(?P<holdtime>[0-9]+), +keepalive:'
+                       ' +(?P<keepalive_interval>[0-9]+), +min'
+                       ' +acceptable +hold +time:'
+                       ' +(?P<min_acceptable_hold_time>[0-9]+)$')
+
+    p10 = LazyRegex(r'^Last *write *(?P<last_write>[0-9\:]+), *attempted *(?P<attempted>[0-9]+), *written *(?P<written>[0-9]+)$')
+
+    p11 = LazyRegex(r'^Second *last *write *(?P<second_last_write>[0-9\:]+), *attempted *(?P<second_attempted>[0-9]+), *written *(?P<second_written>[0-9]+)$')
+
+    p12 = LazyRegex(r'^Last *write *before *reset *(?P<last_write_before_reset>[0-9\:]+), *attempted *(?P<last_write_attempted>[0-9]+), *written *(?P<last_write_written>[0-9]+)$')
+
+    p13 = LazyRegex(r'^Second *last *write *before *reset *(?P<second_last_write_before_reset>[0-9\:]+), *attempted *(?P<second_last_write_before_attempted>[0-9]+), written *(?P<second_last_write_before_written>[0-9]+)$')
+
+    p14 = LazyRegex(r'^Last *write *pulse *rcvd *(?P<last_write_pulse_rcvd>[a-zA-Z0-9\:\.\s]+) *last *full *not *set *pulse *count *(?P<last_full_not_set_pulse_count>[0-9]+)$')
+
+    p15 = LazyRegex(r'^Last +write +pulse +rcvd +before +reset +(?P<last_write_pulse_rcvd_before_reset>[0-9\:]+)$')
+
+    p15_1 = LazyRegex(r'^Socket *(?P<socket_status>[a-z\s\,])$')
+
+    p16 = LazyRegex(r'^Last *write *thread *event *before *reset *(?P<last_write_thread_event_before_reset>[0-9\:]+), *second *last *(?P<last_write_thread_event_second_last>[0-9\:]+)$')
+
+    p17 = LazyRegex(r'^Last *KA *expiry *before *reset *(?P<last_ka_expiry_before_reset>[0-9\:]+), *second *last *(?P<last_ka_expiry_before_second_last>[0-9\:]+)$')
+
+    p18 = LazyRegex(r'^Last *KA *error *before *reset *(?P<last_ka_error_before_reset>[0-9\:]+), *KA *not *sent *(?P<last_ka_error_ka_not_sent>[0-9\:]+)$')
+
+    p19 = LazyRegex(r'^Last *KA *start *before *reset *(?P<last_ka_start_before_reset>[0-9\:]+), *second *last *(?P<last_ka_start_before_second_last>[0-9\:]+)$')
+
+    p20 = LazyRegex(r'^Precedence: *(?P<precedence>[a-z]+)$')
+
+    p21 = LazyRegex(r'^Non-stop +routing +is +enabled$')
+
+    p22 = LazyRegex(r'^TCP *Initial *Sync :(?: *(?P<tcp_initial_sync>[a-zA-Z0-9\-\s]+))?$')
+
+    p23 = LazyRegex(r'^TCP *Initial *Sync *phase *Two :(?: *(?P<tcp_initial_sync_phase_two>[a-zA-Z0-9\-\s]+))?$')
+
+    p24 = LazyRegex(r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$')
+
+    p25 = LazyRegex(r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$')
+
+    p26 = LazyRegex(r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$')
+
+    p27 = LazyRegex(r'^Neighbor +capabilities: +Adv +Rcvd$')
+
+    p27_1 = LazyRegex(r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+): *(?P<adv>(Y|y)es|(N|n)o) *(?P<rcvd>(Y|y)es|(N|n)o+)$')
+
+    p28 = LazyRegex(r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$')
+
+    p29 = LazyRegex(r'^(?P<name>[a-zA-Z\s]+) *: *'
+                       '(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
+                       '(?P<sent>[0-9]+) *'
+                       '(?P<last_received>\w+ *\d+ *[\d\:\.\-]+) *'
+                       '(?P<received>[0-9]+)$')
+
+    p29_1 = LazyRegex(r'^(?P<name>[a-zA-Z\s]+) *: *'
+                       '(?P<last_sent>[\-]+) *'
+                       '(?P<sent>[0-9]+) *'
+                       '(?P<last_received>[\-]+) *'
+                       '(?P<received>[0-9]+)$')
+
+    p30 = LazyRegex(r'^Minimum *time *between *advertisement *runs *is *(?P<minimum_time_between_adv_runs>[0-9]+) *secs$')
+
+    p31 = LazyRegex(r'^Inbound *message *logging *enabled, *(?P<inbound_message>[0-9]+) *messages *buffered$')
+
+    p32 = LazyRegex(r'^Outbound *message *logging *enabled, *(?P<outbound_message>[0-9]+) *messages *buffered$')
+
+    p33 = LazyRegex(r'^For +Address +Family *: +(?P<address_family>[\S\s]+)$')
+
+    p34 = LazyRegex(r'^BGP +neighbor +version'
+                       ' +(?P<neighbor_version>[0-9]+)$')
+
+    p35 = LazyRegex(r'^Update +group: +(?P<update_group>[0-9\.]+) +Filter-group: +(?P<filter_group>[0-9\.]+) +(?P<refresh_request_status>[a-zA-Z\s]+)$')
+
+    p36 = LazyRegex(r'^Route *refresh *request: *received *(?P<route_refresh_request_received>[0-9]+), *sent *(?P<route_refresh_request_sent>[0-9]+)$')
+
+    p37 = LazyRegex(r'^Policy *for *incoming *advertisements *is *(?P<route_map_name_in>[\w\-\_]+)$')
+
+    p38 = LazyRegex(r'^Policy *for *outgoing *advertisements *is *(?P<route_map_name_out>[\w\-\_]+)$')
+
+    p39 = LazyRegex(r'^(?P<accepted_prefixes>[0-9]+) *accepted *prefixes, *(?P<best_paths>[0-9]+) *are *bestpaths$')
+
+    p40 = LazyRegex(r'^Exact *no\. *of *prefixes *denied *: *(?P<exact_no_prefixes_denied>[0-9]+)\.$')
+
+    p41 = LazyRegex(r'^Cumulative *no\. *of *prefixes *denied: *(?P<cummulative_no_prefixes_denied>[0-9]+)\.$')
+
+    p42 = LazyRegex(r'^No *policy: *(?P<cummulative_no_no_policy>[0-9]+), *Failed *RT *match: *(?P<cummulative_no_failed_rt_match>[0-9]+)$')
+
+    p43 = LazyRegex(r'^By *ORF *policy: *(?P<cummulative_no_by_orf_policy>[0-9]+), *By *policy: *(?P<cummulative_no_by_policy>[0-9]+)$')
+
+    p44 = LazyRegex(r'^Prefix +advertised +(?P<prefix_advertised>[0-9]+), +suppressed +(?P<prefix_suppressed>[0-9]+), +withdrawn +(?P<prefix_withdrawn>[0-9]+)$')
+
+    p45 = LazyRegex(r'^Maximum +prefixes +allowed'
+                    ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)$')
+
+    p46 = LazyRegex(r'^Threshold +for +(?P<warn>warning)? *message +(?P<threshold_warning_message>[0-9\%]+), +restart +interval +(?P<threshold_restart_interval>[0-9]+) +min$')
+
+    p47 = LazyRegex(r'^An *EoR *(?P<eor_status>[a-z\-\s]+)$')
+
+    p48 = LazyRegex(r'^Last *ack *version *(?P<last_ack_version>[0-9]+), *Last *synced *ack *version *(?P<last_synced_ack_version>[0-9]+)$')
+
+    p49 = LazyRegex(r'^Outstanding +version +objects: +current +(?P<outstanding_version_objects_current>[0-9]+), +max +(?P<outstanding_version_objects_max>[0-9]+)$')
+
+    p50 = LazyRegex(r'^Additional-paths +operation: +(?P<additional_paths_operation>[a-zA-Z]+)$')
+
+    p50_1 = LazyRegex(r'^Advertise +routes +with +local-label +via +(?P<additional_routes_local_label>[a-zA-Z\s]+)$')
+
+    p50_2 = LazyRegex(r'^Send +Multicast +Attributes$')
+
+    p51 = LazyRegex(r'^Connections *(?P<bgp_state>\w+) *'
+                       '(?P<num>[0-9]+)\; *dropped *(?P<connections_dropped>[0-9]+)$')
+
+    p52 = LazyRegex(r'^Local *host: *(?P<local_host>[\w\.\:]+), *Local *port: *(?P<local_port>[0-9]+), *IF *Handle: *(?P<if_handle>[a-z0-9]+)$')
+
+    p53 = LazyRegex(r'^Foreign *host: *(?P<foreign_host>[\w\.\:]+), *Foreign *port: *(?P<foreign_port>[0-9]+)$')
+
+    p54 = LazyRegex(r'^Last *reset *(?P<last_reset>[0-9\:]+)$')
+
+    p55 = LazyRegex(r'^Capability +4-byte-as +suppress +is +configured$')
+
+    p56 = LazyRegex(r'^Description: +(?P<description>[\w\s\,\.\:\-]+)$')
+
+    p57 = LazyRegex(r'^Private +AS +number +removed +from +updates +to +this +neighbor$')
+
+    p58 = LazyRegex(r'^Administratively +shut +down$')
+
+    p59 = LazyRegex(r'^External +BGP +neighbor +may +be +up +to +'
+                       '(?P<hop>\d+) +hops +away$')
+
+    p60 = LazyRegex(r'^TCP +open +mode: +(?P<mode>[\w\s]+)$')
+
+    p61 = LazyRegex(r'^My +AS +number +is +allowed +(?P<num>\d+) +'
+                       'times +in +received +updates$')
+
+    p62 = LazyRegex(r'^Route\-Reflector +Client$')
+
+    p63 = LazyRegex(r'^(?P<send_com>\w+) +community +attribute +sent +to +this +neighbor$')
+
+    p64 = LazyRegex(r'^Inbound +soft +reconfiguration +allowed$')
+
+    p65 = LazyRegex(r'^AS +override +is +set$')
+
+    p66 = LazyRegex(r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$')
+
+    p67 = LazyRegex(r'^site\-of\-origin +(?P<soo>[\w\:]+)$')
+
     def cli(self, vrf_type='all', vrf='all', instance='all', neighbor='', address_family='', output=None):
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
@@ -2376,109 +2609,12 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             out = output
         # Init variables
         ret_dict = {}
-        p1 = re.compile(r'^BGP +instance +(?P<instance_number>[0-9]+): +'
-                            '(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p2 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p2_1 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>[a-zA-Z0-9]+)$')
-        p3 = re.compile(r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS'
-                            ' +(?P<local_as_as_no>[0-9]+)'
-                            '(?:, +(?P<link_state>[a-zA-Z\s]+))?$')
-        p4 = re.compile(r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$')
-        p5 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
-                            '(?:, +up +for +(?P<up_time>[\w\:]+))?$')
-        p5_1 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)(?:(?P<reason>.*))')
-        p6 = re.compile(r'^NSR *State: *(?P<nsr_state>[a-zA-Z]+)$')
-        p7 = re.compile(r'^Last *read *(?P<last_read>[0-9\:]+), *Last *read *before *reset *(?P<last_read_before_reset>[0-9\:]+)$')
-        p8 = re.compile(r'^Hold +time +is +(?P<holdtime>[0-9]+), +keepalive'
-                            ' +interval +is +(?P<keepalive_interval>[0-9]+)'
-                            ' +seconds$')
-        p9 = re.compile(r'^Configured +hold +time:'
-                            ' +(?P<holdtime>[0-9]+), +keepalive:'
-                            ' +(?P<keepalive_interval>[0-9]+), +min'
-                            ' +acceptable +hold +time:'
-                            ' +(?P<min_acceptable_hold_time>[0-9]+)$')
-        p10 = re.compile(r'^Last *write *(?P<last_write>[0-9\:]+), *attempted *(?P<attempted>[0-9]+), *written *(?P<written>[0-9]+)$')
-        p11 = re.compile(r'^Second *last *write *(?P<second_last_write>[0-9\:]+), *attempted *(?P<second_attempted>[0-9]+), *written *(?P<second_written>[0-9]+)$')
-        p12 = re.compile(r'^Last *write *before *reset *(?P<last_write_before_reset>[0-9\:]+), *attempted *(?P<last_write_attempted>[0-9]+), *written *(?P<last_write_written>[0-9]+)$')
-        p13 = re.compile(r'^Second *last *write *before *reset *(?P<second_last_write_before_reset>[0-9\:]+), *attempted *(?P<second_last_write_before_attempted>[0-9]+), written *(?P<second_last_write_before_written>[0-9]+)$')
-        p14 =  re.compile(r'^Last *write *pulse *rcvd *(?P<last_write_pulse_rcvd>[a-zA-Z0-9\:\.\s]+) *last *full *not *set *pulse *count *(?P<last_full_not_set_pulse_count>[0-9]+)$')
-        p15 = re.compile(r'^Last +write +pulse +rcvd +before +reset +(?P<last_write_pulse_rcvd_before_reset>[0-9\:]+)$')
-        p15_1 = re.compile(r'^Socket *(?P<socket_status>[a-z\s\,])$')
-        p16 =  re.compile(r'^Last *write *thread *event *before *reset *(?P<last_write_thread_event_before_reset>[0-9\:]+), *second *last *(?P<last_write_thread_event_second_last>[0-9\:]+)$')
-        p17 = re.compile(r'^Last *KA *expiry *before *reset *(?P<last_ka_expiry_before_reset>[0-9\:]+), *second *last *(?P<last_ka_expiry_before_second_last>[0-9\:]+)$')
-        p18 = re.compile(r'^Last *KA *error *before *reset *(?P<last_ka_error_before_reset>[0-9\:]+), *KA *not *sent *(?P<last_ka_error_ka_not_sent>[0-9\:]+)$')
-        p19 =  re.compile(r'^Last *KA *start *before *reset *(?P<last_ka_start_before_reset>[0-9\:]+), *second *last *(?P<last_ka_start_before_second_last>[0-9\:]+)$')
-        p20 =  re.compile(r'^Precedence: *(?P<precedence>[a-z]+)$')
-        p21 =  re.compile(r'^Non-stop +routing +is +enabled$')
-        p22 =  re.compile(r'^TCP *Initial *Sync :(?: *(?P<tcp_initial_sync>[a-zA-Z0-9\-\s]+))?$')
-        p23 = re.compile(r'^TCP *Initial *Sync *phase *Two :(?: *(?P<tcp_initial_sync_phase_two>[a-zA-Z0-9\-\s]+))?$')
-        p24 = re.compile(r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$')
-        p25 = re.compile(r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$')
-        p26 =  re.compile(r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$')
-        p27 = re.compile(r'^Neighbor +capabilities: +Adv +Rcvd$')
-        p27_1= re.compile(r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+): *(?P<adv>(Y|y)es|(N|n)o) *(?P<rcvd>(Y|y)es|(N|n)o+)$')
-        p28 = re.compile(r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$')
-        p29 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
-                            '(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
-                            '(?P<sent>[0-9]+) *'
-                            '(?P<last_received>\w+ *\d+ *[\d\:\.\-]+) *'
-                            '(?P<received>[0-9]+)$')
-        p29_1 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
-                            '(?P<last_sent>[\-]+) *'
-                            '(?P<sent>[0-9]+) *'
-                            '(?P<last_received>[\-]+) *'
-                            '(?P<received>[0-9]+)$')
-        p30 = re.compile(r'^Minimum *time *between *advertisement *runs *is *(?P<minimum_time_between_adv_runs>[0-9]+) *secs$')
-        p31 = re.compile(r'^Inbound *message *logging *enabled, *(?P<inbound_message>[0-9]+) *messages *buffered$')
-        p32 = re.compile(r'^Outbound *message *logging *enabled, *(?P<outbound_message>[0-9]+) *messages *buffered$')
-        p33 = re.compile(r'^For +Address +Family *: +(?P<address_family>[\S\s]+)$')
-        p34 = re.compile(r'^BGP +neighbor +version'
-                            ' +(?P<neighbor_version>[0-9]+)$')
-        p35 = re.compile(r'^Update +group: +(?P<update_group>[0-9\.]+) +Filter-group: +(?P<filter_group>[0-9\.]+) +(?P<refresh_request_status>[a-zA-Z\s]+)$')
-        p36 = re.compile(r'^Route *refresh *request: *received *(?P<route_refresh_request_received>[0-9]+), *sent *(?P<route_refresh_request_sent>[0-9]+)$')
-        p37 = re.compile(r'^Policy *for *incoming *advertisements *is *(?P<route_map_name_in>[\w\-\_]+)$')
-        p38 = re.compile(r'^Policy *for *outgoing *advertisements *is *(?P<route_map_name_out>[\w\-\_]+)$')
-        p39 = re.compile(r'^(?P<accepted_prefixes>[0-9]+) *accepted *prefixes, *(?P<best_paths>[0-9]+) *are *bestpaths$')
-        p40 = re.compile(r'^Exact *no\. *of *prefixes *denied *: *(?P<exact_no_prefixes_denied>[0-9]+)\.$')
-        p41 = re.compile(r'^Cumulative *no\. *of *prefixes *denied: *(?P<cummulative_no_prefixes_denied>[0-9]+)\.$')
-        p42 = re.compile(r'^No *policy: *(?P<cummulative_no_no_policy>[0-9]+), *Failed *RT *match: *(?P<cummulative_no_failed_rt_match>[0-9]+)$')
-        p43 = re.compile(r'^By *ORF *policy: *(?P<cummulative_no_by_orf_policy>[0-9]+), *By *policy: *(?P<cummulative_no_by_policy>[0-9]+)$')
-        p44 = re.compile(r'^Prefix +advertised +(?P<prefix_advertised>[0-9]+), +suppressed +(?P<prefix_suppressed>[0-9]+), +withdrawn +(?P<prefix_withdrawn>[0-9]+)$')
-        p45 = re.compile(r'^Maximum +prefixes +allowed'
-                        ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)$')
-        p46 = re.compile(r'^Threshold +for +(?P<warn>warning)? *message +(?P<threshold_warning_message>[0-9\%]+), +restart +interval +(?P<threshold_restart_interval>[0-9]+) +min$')
-        p47 = re.compile(r'^An *EoR *(?P<eor_status>[a-z\-\s]+)$')
-        p48 = re.compile(r'^Last *ack *version *(?P<last_ack_version>[0-9]+), *Last *synced *ack *version *(?P<last_synced_ack_version>[0-9]+)$')
-        p49 = re.compile(r'^Outstanding +version +objects: +current +(?P<outstanding_version_objects_current>[0-9]+), +max +(?P<outstanding_version_objects_max>[0-9]+)$')
-        p50 = re.compile(r'^Additional-paths +operation: +(?P<additional_paths_operation>[a-zA-Z]+)$')
-        p50_1 = re.compile(r'^Advertise +routes +with +local-label +via +(?P<additional_routes_local_label>[a-zA-Z\s]+)$')
-        p50_2 = re.compile(r'^Send +Multicast +Attributes$')
-        p51 = re.compile(r'^Connections *(?P<bgp_state>\w+) *'
-                            '(?P<num>[0-9]+)\; *dropped *(?P<connections_dropped>[0-9]+)$')
-        p52 = re.compile(r'^Local *host: *(?P<local_host>[\w\.\:]+), *Local *port: *(?P<local_port>[0-9]+), *IF *Handle: *(?P<if_handle>[a-z0-9]+)$')
-        p53 = re.compile(r'^Foreign *host: *(?P<foreign_host>[\w\.\:]+), *Foreign *port: *(?P<foreign_port>[0-9]+)$')
-        p54 = re.compile(r'^Last *reset *(?P<last_reset>[0-9\:]+)$')
-        p55 = re.compile(r'^Capability +4-byte-as +suppress +is +configured$')
-        p56 = re.compile(r'^Description: +(?P<description>[\w\s\,\.\:\-]+)$')
-        p57 = re.compile(r'^Private +AS +number +removed +from +updates +to +this +neighbor$')
-        p58 = re.compile(r'^Administratively +shut +down$')
-        p59 = re.compile(r'^External +BGP +neighbor +may +be +up +to +'
-                            '(?P<hop>\d+) +hops +away$')
-        p60 = re.compile(r'^TCP +open +mode: +(?P<mode>[\w\s]+)$')
-        p61 = re.compile(r'^My +AS +number +is +allowed +(?P<num>\d+) +'
-                            'times +in +received +updates$')
-        p62 = re.compile(r'^Route\-Reflector +Client$')
-        p63 = re.compile(r'^(?P<send_com>\w+) +community +attribute +sent +to +this +neighbor$')
-        p64 = re.compile(r'^Inbound +soft +reconfiguration +allowed$')
-        p65 = re.compile(r'^AS +override +is +set$')
-        p66 = re.compile(r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$')
-        p67 = re.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+)$')
         for line in out.splitlines():
             line = line.strip()
 
             # BGP instance 0: 'default'
 
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 instance = str(m.groupdict()['instance'])
                 instance_number = int(m.groupdict()['instance_number'])
@@ -2489,7 +2625,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP neighbor is 10.16.2.2
 
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 vrf = 'default'
@@ -2509,7 +2645,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP neighbor is 10.1.5.5, vrf VRF1
 
-            m = p2_1.match(line)
+            m = self.p2_1.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 vrf = str(m.groupdict()['vrf'])
@@ -2534,7 +2670,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Remote AS 200, local AS 100, external link
 
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 sub_dict['remote_as'] = int(m.groupdict()['remote_as'])
                 if m.groupdict()['link_state']:
@@ -2549,7 +2685,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Remote router ID 10.1.5.5
 
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
 
@@ -2558,7 +2694,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP state = Established, up for 00:53:54
 
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 session_state = str(m.groupdict()['session_state']).lower()
 
@@ -2569,7 +2705,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP state = Idle (No route to multi-hop neighbor)
 
-            m = p5_1.match(line)
+            m = self.p5_1.match(line)
             if m:
                 session_state = str(m.groupdict()['session_state']).lower()
                 sub_dict['session_state'] = session_state
@@ -2579,7 +2715,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # NSR State: None
 
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 nsr_state = str(m.groupdict()['nsr_state'])
 
@@ -2588,7 +2724,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last read 00:00:51, Last read before reset 00:00:00
 
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 last_read = str(m.groupdict()['last_read'])
                 last_read_before_reset = str(m.groupdict()['last_read_before_reset'])
@@ -2599,7 +2735,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Hold time is 180, keepalive interval is 60 seconds
 
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 sub_dict['holdtime'] = int(m.groupdict()['holdtime'])
                 sub_dict['keepalive_interval'] = \
@@ -2608,7 +2744,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Configured hold time: 180, keepalive: 60, min acceptable hold time: 3
 
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 sub_dict['holdtime'] = int(m.groupdict()['holdtime'])
                 sub_dict['keepalive_interval'] = \
@@ -2619,7 +2755,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write 00:00:38, attempted 19, written 19
 
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 last_write = str(m.groupdict()['last_write'])
                 attempted = int(m.groupdict()['attempted'])
@@ -2632,7 +2768,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Second last write 00:01:38, attempted 19, written 19
 
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 second_last_write = str(m.groupdict()['second_last_write'])
                 second_attempted = int(m.groupdict()['second_attempted'])
@@ -2645,7 +2781,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write before reset 00:00:00, attempted 0, written 0
 
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 last_write_before_reset = str(m.groupdict()['last_write_before_reset'])
                 last_write_attempted = int(m.groupdict()['last_write_attempted'])
@@ -2658,7 +2794,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Second last write before reset 00:00:00, attempted 0, written 0
 
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 second_last_write_before_reset =  str(m.groupdict()['second_last_write_before_reset'])
                 second_last_write_before_attempted = int(m.groupdict()['second_last_write_before_attempted'])
@@ -2671,7 +2807,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write pulse rcvd  Jun 28 19:17:44.716 last full not set pulse count 113
 
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 last_write_pulse_rcvd = str(m.groupdict()['last_write_pulse_rcvd'])
                 last_full_not_set_pulse_count = int(m.groupdict()['last_full_not_set_pulse_count'])
@@ -2682,7 +2818,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write pulse rcvd before reset 00:00:00
 
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 last_write_pulse_rcvd_before_reset = str(m.groupdict()['last_write_pulse_rcvd_before_reset'])
 
@@ -2691,7 +2827,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Socket not armed for io, armed for read, armed for write
 
-            m = p15_1.match(line)
+            m = self.p15_1.match(line)
             if m:
                 socket_status = str(m.groupdict()['socket_status'])
 
@@ -2700,7 +2836,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write thread event before reset 00:00:00, second last 00:00:00
 
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 last_write_thread_event_before_reset = str(m.groupdict()['last_write_thread_event_before_reset'])
                 last_write_thread_event_second_last = str(m.groupdict()['last_write_thread_event_second_last'])
@@ -2711,7 +2847,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last KA expiry before reset 00:00:00, second last 00:00:00
 
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 last_ka_expiry_before_reset =  str(m.groupdict()['last_ka_expiry_before_reset'])
                 last_ka_expiry_before_second_last = str(m.groupdict()['last_ka_expiry_before_second_last'])
@@ -2722,7 +2858,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last KA error before reset 00:00:00, KA not sent 00:00:00
 
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 last_ka_error_before_reset = str(m.groupdict()['last_ka_error_before_reset'])
                 last_ka_error_ka_not_sent = str(m.groupdict()['last_ka_error_ka_not_sent'])
@@ -2733,7 +2869,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Last KA start before reset 00:00:00, second last 00:00:00
 
-            m = p19.match(line)
+            m = self.p19.match(line)
             if m:
                 last_ka_start_before_reset = str(m.groupdict()['last_ka_start_before_reset'])
                 last_ka_start_before_second_last = str(m.groupdict()['last_ka_start_before_second_last'])
@@ -2743,7 +2879,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
 
             # Precedence: internet
-            m = p20.match(line)
+            m = self.p20.match(line)
             if m:
                 precedence = str(m.groupdict()['precedence'])
 
@@ -2752,14 +2888,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Non-stop routing is enabled
 
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 sub_dict['non_stop_routing'] = True
                 continue
 
             # TCP Initial Sync :              ---                   
 
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 tcp_initial_sync = str(m.groupdict()['tcp_initial_sync'])
 
@@ -2768,7 +2904,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # TCP Initial Sync Phase Two :    ---
 
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 tcp_initial_sync_phase_two = str(m.groupdict()['tcp_initial_sync_phase_two'])
 
@@ -2776,7 +2912,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
 
             # TCP Initial Sync Done :         ---
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 tcp_initial_sync_done = str(m.groupdict()['tcp_initial_sync_done']) 
 
@@ -2785,7 +2921,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Enforcing first AS is enabled
 
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 enforcing_first_as = str(m.groupdict()['enforcing_first_as'])
 
@@ -2794,7 +2930,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Multi-protocol capability not received
 
-            m = p26.match(line)
+            m = self.p26.match(line)
             if m:
                 multiprotocol_capability = str(m.groupdict()['multiprotocol_capability'])
 
@@ -2803,7 +2939,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Neighbor capabilities:            Adv         Rcvd
 
-            m = p27.match(line)
+            m = self.p27.match(line)
             if m:
                 if 'bgp_negotiated_capabilities' not in sub_dict:
                     sub_dict['bgp_negotiated_capabilities'] = {}
@@ -2812,7 +2948,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             #    4-byte AS:                      Yes         No
             #    Address family IPv4 Unicast:    Yes         Yes
 
-            m = p27_1.match(line)
+            m = self.p27_1.match(line)
             if m:
                 name = m.groupdict()['name'].lower()
                 adv = 'advertised' if m.groupdict()['adv'].lower() == 'yes' else ''
@@ -2837,7 +2973,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             #  Message stats:
             #    InQ depth: 0, OutQ depth: 0
 
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 message_stats_output_queue = int(m.groupdict()['message_stats_output_queue'])
                 message_stats_input_queue = int(m.groupdict()['message_stats_input_queue'])
@@ -2855,10 +2991,9 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             #    Route_Refresh:  ---                        0  ---                        0
             #    Total:                                    58                            56
 
-            m = p29.match(line)
-
+            m = self.p29.match(line)
 
-            m1 = p29_1.match(line)
+            m1 = self.p29_1.match(line)
             if m or m1:
                 if 'bgp_neighbor_counters' not in sub_dict:
                     sub_dict['bgp_neighbor_counters'] = {}
@@ -2880,7 +3015,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Minimum time between advertisement runs is 0 secs
 
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 minimum_time_between_adv_runs = int(m.groupdict()['minimum_time_between_adv_runs'])
 
@@ -2889,7 +3024,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Inbound message logging enabled, 3 messages buffered
 
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 inbound_message = str(m.groupdict()['inbound_message'])
 
@@ -2898,7 +3033,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Outbound message logging enabled, 3 messages buffered
 
-            m =p32.match(line)
+            m =self.p32.match(line)
             if m:
                 outbound_message = str(m.groupdict()['outbound_message'])
 
@@ -2907,7 +3042,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # For Address Family: IPv4 Unicast
 
-            m = p33.match(line)            
+            m = self.p33.match(line)            
             if m:
                 address_family = str(m.groupdict()['address_family']).lower()
                 address_family.strip()
@@ -2920,7 +3055,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # BGP neighbor version 43
 
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 sub_dict['address_family'][address_family]['neighbor_version'] =\
                     int(m.groupdict()['neighbor_version'])
@@ -2928,7 +3063,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Update group: 0.2 Filter-group: 0.2  No Refresh request being processed
 
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 update_group = str(m.groupdict()['update_group'])
                 filter_group = str(m.groupdict()['filter_group'])
@@ -2941,7 +3076,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Route refresh request: received 0, sent 0
 
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 route_refresh_request_received = int(m.groupdict()['route_refresh_request_received'])
                 route_refresh_request_sent = int(m.groupdict()['route_refresh_request_sent'])
@@ -2952,7 +3087,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Policy for incoming advertisements is all-pass
 
-            m = p37.match(line)
+            m = self.p37.match(line)
             if m:
                 route_map_name_in = m.groupdict()['route_map_name_in']
 
@@ -2961,7 +3096,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Policy for outgoing advertisements is all-pass
 
-            m = p38.match(line)
+            m = self.p38.match(line)
             if m:
                 route_map_name_out = m.groupdict()['route_map_name_out']
 
@@ -2970,7 +3105,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # 0 accepted prefixes, 0 are bestpaths
 
-            m = p39.match(line)
+            m = self.p39.match(line)
             if m:
                 accepted_prefixes = int(m.groupdict()['accepted_prefixes'])
                 best_paths = int(m.groupdict()['best_paths'])
@@ -2981,7 +3116,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Exact no. of prefixes denied : 0.
 
-            m = p40.match(line)
+            m = self.p40.match(line)
             if m:
                 exact_no_prefixes_denied = int(m.groupdict()['exact_no_prefixes_denied'])
 
@@ -2990,7 +3125,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Cumulative no. of prefixes denied: 5.
 
-            m = p41.match(line)
+            m = self.p41.match(line)
             if m:
                 cummulative_no_prefixes_denied = int(m.groupdict()['cummulative_no_prefixes_denied'])
 
@@ -2999,7 +3134,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # No policy: 5, Failed RT match: 0
 
-            m = p42.match(line)
+            m = self.p42.match(line)
             if m:
                 cummulative_no_no_policy = int(m.groupdict()['cummulative_no_no_policy'])
                 cummulative_no_failed_rt_match = int(m.groupdict()['cummulative_no_failed_rt_match'])
@@ -3010,7 +3145,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # By ORF policy: 0, By policy: 0
 
-            m = p43.match(line)
+            m = self.p43.match(line)
             if m:
                 cummulative_no_by_orf_policy = int(m.groupdict()['cummulative_no_by_orf_policy'])
                 cummulative_no_by_policy = int(m.groupdict()['cummulative_no_by_policy'])
@@ -3021,7 +3156,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Prefix advertised 10, suppressed 0, withdrawn 0
 
-            m = p44.match(line)
+            m = self.p44.match(line)
             if m:
                 prefix_advertised = int(m.groupdict()['prefix_advertised'])
                 prefix_suppressed = int(m.groupdict()['prefix_suppressed'])
@@ -3034,7 +3169,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Maximum prefixes allowed 1048576
 
-            m = p45.match(line)
+            m = self.p45.match(line)
             if m:
                 sub_dict['address_family'][address_family]\
                     ['maximum_prefix_max_prefix_no'] = \
@@ -3043,7 +3178,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Threshold for warning message 75%, restart interval 0 min
 
-            m = p46.match(line)
+            m = self.p46.match(line)
             if m:
                 threshold_warning_message = m.groupdict()['threshold_warning_message']
                 threshold_restart_interval = int(m.groupdict()['threshold_restart_interval'])
@@ -3055,7 +3190,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # An EoR was not received during read-only mode
 
-            m = p47.match(line)
+            m = self.p47.match(line)
             if m:
                 eor_status = str(m.groupdict()['eor_status'])
 
@@ -3064,7 +3199,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last ack version 43, Last synced ack version 0
 
-            m = p48.match(line)
+            m = self.p48.match(line)
             if m:
                 last_synced_ack_version = int(m.groupdict()['last_synced_ack_version'])
                 last_ack_version = int(m.groupdict()['last_ack_version'])
@@ -3075,7 +3210,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Outstanding version objects: current 0, max 1
 
-            m = p49.match(line)
+            m = self.p49.match(line)
             if m:
                 outstanding_version_objects_current = int(m.groupdict()['outstanding_version_objects_current'])
                 outstanding_version_objects_max = int(m.groupdict()['outstanding_version_objects_max'])
@@ -3086,7 +3221,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Additional-paths operation: None
 
-            m = p50.match(line)
+            m = self.p50.match(line)
             if m:
                 additional_paths_operation = str(m.groupdict()['additional_paths_operation'])
 
@@ -3095,7 +3230,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Advertise routes with local-label via Unicast SAFI
 
-            m = p50_1.match(line)
+            m = self.p50_1.match(line)
             if m:
                 additional_routes_local_label = str(m.groupdict()['additional_routes_local_label'])
 
@@ -3103,14 +3238,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
 
             # Send Multicast Attributes
-            m = p50_2.match(line)
+            m = self.p50_2.match(line)
             if m:
                 sub_dict['address_family'][address_family]['send_multicast_attributes'] = True
                 continue
 
             # Connections established 1; dropped 0
 
-            m = p51.match(line)
+            m = self.p51.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3129,7 +3264,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Local host: 10.1.5.1, Local port: 179, IF Handle: 0x00000060
 
-            m = p52.match(line)
+            m = self.p52.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3147,7 +3282,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Foreign host: 10.1.5.5, Foreign port: 11052
 
-            m = p53.match(line)
+            m = self.p53.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3163,7 +3298,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last reset 00:00:00
 
-            m = p54.match(line)
+            m = self.p54.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3176,41 +3311,40 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 # TODO when have output -- reset_reason
                 continue
 
-
             # ######################################
             # add the lines for missing keys of ops
             # ######################################
 
             # Capability 4-byte-as suppress is configured
 
-            m = p55.match(line)
+            m = self.p55.match(line)
             if m:
                 sub_dict['suppress_four_byte_as_capability'] = True
                 continue
 
             # Description: PEER
 
-            m = p56.match(line)
+            m = self.p56.match(line)
             if m:
                 sub_dict['description'] = m.groupdict()['description']
                 
             # Private AS number removed from updates to this neighbor
 
-            m = p57.match(line)
+            m = self.p57.match(line)
             if m:
                 sub_dict['remove_private_as'] = True
                 continue
                 
             # Administratively shut down
 
-            m = p58.match(line)
+            m = self.p58.match(line)
             if m:
                 sub_dict['shutdown'] = True
                 continue
                 
             # External BGP neighbor may be up to 222 hops away
 
-            m = p59.match(line)
+            m = self.p59.match(line)
             if m:
                 sub_dict['ebgp_multihop'] = True
                 sub_dict['ebgp_multihop_max_hop'] = int(m.groupdict()['hop'])
@@ -3218,7 +3352,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # TCP open mode: passive only
 
-            m = p60.match(line)
+            m = self.p60.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3234,7 +3368,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # My AS number is allowed 3 times in received updates
 
-            m = p61.match(line)
+            m = self.p61.match(line)
             if m:
                 sub_dict['address_family'][address_family]['allowas_in'] = True
                 sub_dict['address_family'][address_family]['allowas_in_as_number'] = \
@@ -3243,14 +3377,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Route-Reflector Client
 
-            m = p62.match(line)
+            m = self.p62.match(line)
             if m:
                 sub_dict['address_family'][address_family]['route_reflector_client'] = True
                 continue
 
             # Extended community attribute sent to this neighbor
 
-            m = p63.match(line)
+            m = self.p63.match(line)
             if m:
                 sub_dict['address_family'][address_family]['send_community'] = \
                     m.groupdict()['send_com'].lower()
@@ -3258,21 +3392,21 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Inbound soft reconfiguration allowed
 
-            m = p64.match(line)
+            m = self.p64.match(line)
             if m:
                 sub_dict['address_family'][address_family]['soft_configuration'] = True
                 continue
 
             # AS override is set
 
-            m = p65.match(line)
+            m = self.p65.match(line)
             if m:
                 sub_dict['address_family'][address_family]['as_override'] = True
                 continue
 
             # Default information originate: default sent
 
-            m = p66.match(line)
+            m = self.p66.match(line)
             if m:
                 sub_dict['address_family'][address_family]['default_originate'] = True
                 sub_dict['address_family'][address_family]['default_originate_route_map'] = \
@@ -3281,7 +3415,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # site-of-origin 100:100
 
-            m = p67.match(line)
+            m = self.p67.match(line)
             if m:
                 sub_dict['address_family'][address_family]['soo'] = m.groupdict()['soo']
                 continue
@@ -4747,7 +4881,8 @@ class ShowBgpInstanceAllAllSchema(MetaParser):
 #   * show bgp instance {instance} all all
 #   * show bgp instance {instance} vrf {vrf} {address_family}
 # ============================================================
-class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
+class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema, IncrementalParser,
+                            SharedPathParser):
 
     '''Parser for:
         show bgp instance all all all
@@ -4764,14 +4899,110 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
     exclude = ['bgp_table_version', 'rd_version', 'nsr_initial_init_ver_status', 'nsr_initial_initsync_version']
 
-    def cli(self, vrf_type='all', address_family='', instance='all', vrf='all', output=None):
+    # BGP instance 0: 'default'
+    p1 = LazyRegex(r'^\s*BGP +instance +(?P<instance_number>[0-9]+):'
+                   r' +(?P<instance>(\S+))$')
+
+    # VRF: VRF1
+    p2 = LazyRegex(r'^\s*VRF: +(?P<vrf>(\S+))$')
+
+    # Address Family: VPNv6 Unicast
+    p3 = LazyRegex(r'^\s*Address +Family: +(?P<address_family>[\S\s]+)$')
+
+    # BGP VRF VRF1, state: Active
+    p4 = LazyRegex(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
+                   r' +(?P<vrf_state>(\S+))$')
+
+    # VRF ID: 0x60000001
+    p5 = LazyRegex(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
+
+    # BGP router identifier 10.4.1.1, local AS number 100
+    p6 = LazyRegex(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+                   r' +local +AS +number +(?P<local_as>(\d+))$')
+
+    # BGP generic scan interval 60 secs
+    p7 = LazyRegex(r'^\s*BGP +generic +scan +interval'
+                   r' +(?P<interval>(\d+)) +secs$')
+
+    # Non-stop routing is enabled
+    p8 = LazyRegex(r'^\s*Non-stop +routing is enabled$')
+
+    # BGP table state: Active
+    p9 = LazyRegex(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+
+    # Table ID: 0xe0000010   RD version: 43
+    p10 = LazyRegex(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+                    r' +(?P<rd_version>[0-9]+)$')
+
+    # BGP main routing table version 43
+    p11 = LazyRegex(r'^\s*BGP +main +routing +table +version'
+                    r' +(?P<bgp_table_version>[0-9]+)$')
+
+    # BGP NSR Initial initsync version 11 (Reached)
+    p12 = LazyRegex(r'^\s*BGP +NSR +Initial +initsync +version'
+                    r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+                    r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+
+    # BGP NSR/ISSU Sync-Group versions 0/0
+    p13 = LazyRegex(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+                    r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+
+    # BGP scan interval 60 secs 
+    p14 = LazyRegex(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
+                    r' +secs$')
+
+    # Route Distinguisher: 200:1 (default for vrf VRF1)
+    # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
+    # Route Distinguisher: 172.16.2.88:1000
+    p15 = LazyRegex(r'^\s*Route +Distinguisher:'
+                    r' +(?P<route_distinguisher>\S+)'
+                    r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+
+    # *> 615:11:11:3::/64   2001:db8:20:1:5::5
+    # *>i[2][0][48][0014.0100.0001][32][10.249.249.10]/136
+    p16_1 = LazyRegex(r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+                      r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)/(?P<mask>\d+))'
+                      r'(?: +(?P<next_hop>\S+))?$')
+
+    # 2219             0 200 33299 51178 47751 {27016} e
+    p16_2 = LazyRegex(r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
+                      r' +(?P<path>[0-9\{\}\s]+) '
+                      r'+(?P<origin_codes>(i|e|\?))$')
+
+    # Network            Next Hop   Metric LocPrf Weight Path
+    # 172.16.2.88                        0    100      0 ?
+    # 172.16.2.88                             100      0 i
+    # 0.0.0.0                                          0 i
+    p16_3 = LazyRegex(r'^\s*(?P<next_hop>(\S+))(?: +(?P<metric>(\d+)))?'
+                      r'(?: +(?P<locprf>(\d+)))? +(?P<weight>(\d+))'
+                      r' +(?P<origin_codes>(\?|i|e))$')
+
+    # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
+    # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
+    # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
+    # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
+    # *>i200.1.0.0/24       99.99.99.98                                                    0       0 i
+    p16 = LazyRegex(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+                    r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)/(?P<mask>\d+))?'
+                    r' +(?P<next_hop>\S+) +(?P<number>[\d\s\{\}]+)'
+                    r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+
+    p17 = LazyRegex(r'(?P<path>[\d\s]+)'
+                    r' *(?P<origin_codes>(i|e|\?))?$')
+
+    # Processed 40 prefixes, 50 paths
+    p18 = LazyRegex(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+                    r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+
+    def cli(self, vrf_type='all', address_family='', instance='all', vrf='all', output=None,
+            output_stream=None):
 
         # Verify vrf_type and address_family
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
 
         # Execute command
-        if output is None:
+        if output is None and output_stream is None:
             if vrf_type == 'all':
                 output = self.device.execute(self.cli_command[0].\
                                              format(instance=instance))
@@ -4805,109 +5036,14 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             else:
                 af_default = 'vpnv4 unicast'
 
-        # BGP instance 0: 'default'
-        p1 = re.compile(r'^\s*BGP +instance +(?P<instance_number>[0-9]+):'
-                        r' +(?P<instance>(\S+))$')
-
-        # VRF: VRF1
-        p2 = re.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
-
-        # Address Family: VPNv6 Unicast
-        p3 = re.compile(r'^\s*Address +Family: +(?P<address_family>[\S\s]+)$')
-
-        # BGP VRF VRF1, state: Active
-        p4 = re.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
-                        r' +(?P<vrf_state>(\S+))$')
-
         # BGP Route Distinguisher: 200:1
         # BGP Route Distinguisher: 172.16.2.90:1
 
-        # VRF ID: 0x60000001
-        p5 = re.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
-
-        # BGP router identifier 10.4.1.1, local AS number 100
-        p6 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>(\d+))$')
-
-        # BGP generic scan interval 60 secs
-        p7 =  re.compile(r'^\s*BGP +generic +scan +interval'
-                         r' +(?P<interval>(\d+)) +secs$')
-
-        # Non-stop routing is enabled
-        p8 = re.compile(r'^\s*Non-stop +routing is enabled$')
-
-        # BGP table state: Active
-        p9 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
-
-        # Table ID: 0xe0000010   RD version: 43
-        p10 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
-                         r' +(?P<rd_version>[0-9]+)$')
-
-        # BGP main routing table version 43
-        p11 = re.compile(r'^\s*BGP +main +routing +table +version'
-                         r' +(?P<bgp_table_version>[0-9]+)$')
-
-        # BGP NSR Initial initsync version 11 (Reached)
-        p12 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
-                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
-                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-
-        # BGP NSR/ISSU Sync-Group versions 0/0
-        p13 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
-                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
-
-        # BGP scan interval 60 secs 
-        p14 = re.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
-                         r' +secs$')
-
-        # Route Distinguisher: 200:1 (default for vrf VRF1)
-        # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
-        # Route Distinguisher: 172.16.2.88:1000
-        p15 = re.compile(r'^\s*Route +Distinguisher:'
-                         r' +(?P<route_distinguisher>\S+)'
-                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
-
-        # *> 615:11:11:3::/64   2001:db8:20:1:5::5
-        # *>i[2][0][48][0014.0100.0001][32][10.249.249.10]/136
-        p16_1 = re.compile(r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                           r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)/(?P<mask>\d+))'
-                           r'(?: +(?P<next_hop>\S+))?$')
-
-        # 2219             0 200 33299 51178 47751 {27016} e
-        p16_2 = re.compile(r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
-                           r' +(?P<path>[0-9\{\}\s]+) '
-                           r'+(?P<origin_codes>(i|e|\?))$')
-
-        # Network            Next Hop   Metric LocPrf Weight Path
-        # 172.16.2.88                        0    100      0 ?
-        # 172.16.2.88                             100      0 i
-        # 0.0.0.0                                          0 i
-        p16_3 = re.compile(r'^\s*(?P<next_hop>(\S+))(?: +(?P<metric>(\d+)))?'
-                           r'(?: +(?P<locprf>(\d+)))? +(?P<weight>(\d+))'
-                           r' +(?P<origin_codes>(\?|i|e))$')
-
-        # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
-        # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
-        # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
-        # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
-        # *>i200.1.0.0/24       99.99.99.98                                                    0       0 i
-        p16 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                         r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)/(?P<mask>\d+))?'
-                         r' +(?P<next_hop>\S+) +(?P<number>[\d\s\{\}]+)'
-                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
-
-        p17 = re.compile(r'(?P<path>[\d\s]+)'
-                         r' *(?P<origin_codes>(i|e|\?))?$')
-
-        # Processed 40 prefixes, 50 paths
-        p18 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
-                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
-
-        for line in output.splitlines():
+        for line in iter_lines(output, output_stream):
             line = line.rstrip()
 
             # BGP instance 0: 'default'
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = group['instance'].replace("'","")
@@ -4921,7 +5057,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # VRF: VRF1
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 vrf_dict = inst_dict.setdefault('vrf', {}).setdefault(vrf, {})
@@ -4935,7 +5071,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
             # Address Family: VPNv4 Unicast
             # Address family: IPv6 Labeled-unicast
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 original_address_family = address_family
@@ -4945,7 +5081,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # BGP VRF VRF1, state: Active
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 group = m.groupdict()
                 # if no vrf key, set it to be the user input
@@ -4963,14 +5099,14 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # VRF ID: 0x60000001
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 vrf_id = m.groupdict()['vrf_id']
                 af_dict['vrf_id'] = vrf_id
                 continue
 
             # BGP router identifier 10.4.1.1, local AS number 100
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['router_identifier'] = group['router_identifier']
@@ -4978,25 +5114,25 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue 
 
             # BGP generic scan interval 60 secs 
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 af_dict['generic_scan_interval'] = m.groupdict()['interval']
                 continue          
 
             # Non-stop routing is enabled
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 af_dict['non_stop_routing'] = True
                 continue
 
             # BGP table state: Active
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 af_dict['table_state'] = m.groupdict()['table_state'].lower()
                 continue
 
             # Table ID: 0x0   RD version: 0
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['table_id'] = group['table_id']
@@ -5004,13 +5140,13 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # BGP main routing table version 43
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 af_dict['bgp_table_version'] = int(m.groupdict()['bgp_table_version'])
                 continue
 
             # BGP NSR Initial initsync version 11 (Reached)
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['nsr_initial_initsync_version'] = group['nsr_initial_initsync_version']
@@ -5018,20 +5154,20 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # BGP NSR/ISSU Sync-Group versions 0/0
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 af_dict['nsr_issu_sync_group_versions'] = \
                                 m.groupdict()['nsr_issu_sync_group_versions']
                 continue
 
             # BGP scan interval 60 secs
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                af_dict['scan_interval'] = int(m.groupdict()['scan_interval'])
                continue
 
             # Route Distinguisher: 200:1 (default for vrf VRF1)
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 group = m.groupdict()
                 rd = group['route_distinguisher']
@@ -5048,7 +5184,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
             # *> 615:11:11:3::/64   2001:db8:20:1:5::5
             # *>i[2][0][48][0014.0100.0001][32][10.249.249.10]/136
-            m = p16_1.match(line)
+            m = self.p16_1.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -5058,8 +5194,9 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 else:
                     index += 1
                 # Set dict
-                pfx_dict = af_dict.setdefault('prefix', {}).setdefault(last_prefix, {}).\
-                                   setdefault('index', {}).setdefault(index, {})
+                pfx_dict = open_path(
+                    self, af_dict.setdefault('prefix', {})
+                    .setdefault(last_prefix, {}).setdefault('index', {}), index)
                 # Set keys
                 pfx_dict['status_codes'] = group['status_codes'].strip().replace(" ", "")
                 if group['next_hop']:
@@ -5067,7 +5204,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # 2219             0 200 33299 51178 47751 {27016} e
-            m = p16_2.match(line)
+            m = self.p16_2.match(line)
             if m:
                 group = m.groupdict()
                 pfx_dict['metric'] = group['metric']
@@ -5079,7 +5216,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # Network            Next Hop   Metric LocPrf Weight Path
             # 172.16.2.88                        0    100      0 ?
             # 172.16.2.88                             100      0 i
-            m = p16_3.match(line)
+            m = self.p16_3.match(line)
             if m:
                 group = m.groupdict()
                 pfx_dict['next_hop'] = group['next_hop']
@@ -5096,7 +5233,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # *>i10.9.2.0/24        10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
             # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
             # *>i200.1.0.0/24       99.99.99.98                                                    0       0 i
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -5106,8 +5243,9 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 else:
                     index += 1
                 # Set dict
-                pfx_dict = af_dict.setdefault('prefix', {}).setdefault(last_prefix, {}).\
-                                   setdefault('index', {}).setdefault(index, {})
+                pfx_dict = open_path(
+                    self, af_dict.setdefault('prefix', {})
+                    .setdefault(last_prefix, {}).setdefault('index', {}), index)
                 # Set keys
                 pfx_dict['next_hop'] = group['next_hop']
                 pfx_dict['status_codes'] = group['status_codes'].strip().replace(" ", "")
@@ -5142,7 +5280,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # 
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 group = m.groupdict()
                 if 'path' in pfx_dict:
@@ -5152,7 +5290,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # Processed 40 prefixes, 50 paths
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['processed_prefix'] = int(group['processed_prefix'])
@@ -30,6 +30,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.regex import LazyRegex
 
 logger = logging.getLogger(__name__)
 
@@ -456,6 +457,173 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
         'interface_state', 'in_unknown_protos', 'last_clear', 'carrier_transitions', 'in_giants']
 
 
+    # MgmtEth0/0/CPU0/0 is administratively down, line protocol is administratively down
+    p1 = LazyRegex(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
+                    ' +(?P<enabled>(administratively down|down))(?:,'
+                    ' +line +protocol +is +(?P<line_protocol>'
+                    '(administratively down|down)))?$')
+
+    p1_1 = LazyRegex(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
+                      ' +(?P<enabled>(administratively up|up))(?:,'
+                      ' +line +protocol +is +(?P<line_protocol>'
+                      '(administratively up|up)))?$')
+
+    # Interface state transitions: 1
+    p2 = LazyRegex(r'^\s*Interface +state +transitions:'
+                    ' +(?P<interface_state>[0-9]+)$')
+
+    p3 = LazyRegex(r'^\s*Hardware is (?P<types>[a-zA-Z\,\s]+)(?:'
+                    ' +address +is (?P<mac_address>[a-z0-9\.]+) +\(bia'
+                    ' +(?P<phys_address>[a-z0-9\.]+)\))?$')
+
+    # Hardware is VLAN sub-interface(s), address is aaaa.bbbb.cccc
+    p3_1 = LazyRegex(r'^\s*Hardware is (?P<types>[\w\W]+) +address'
+                      ' +is +(?P<mac_address>[a-z0-9\.]+)$')
+
+    #Description: desc
+    p3_2 = LazyRegex(r'^\s*Description: +(?P<description>[\w\W]+)$')
+
+    # Internet address is 10.1.1.1/24
+    p4 = LazyRegex(r'^\s*Internet +address +is +(?P<ip>[a-z0-9\.]+)'
+                    '(\/(?P<prefix_length>[0-9]+))?$')
+
+    # MTU 1500 bytes, BW 0 Kbit (Max: 1000000 Kbit)
+    # MTU 6000 bytes, BW 20000000 Kbit (Max: 20000000 Kbit)
+    p5 = LazyRegex(r'^\s*MTU +(?P<mtu>[0-9]+) +bytes, +BW'
+                    ' +(?P<bandwidth>[0-9]+) +Kbit(?: *\(Max: +\d+'
+                    ' +Kbit\))?$')
+
+    # reliability 255/255, txload Unknown, rxload Unknown
+    p6 = LazyRegex(r'^\s*reliability +(?P<reliability>[a-zA-Z0-9\/]+),'
+                    ' +txload +(?P<txload>[a-zA-Z0-9\/]+), +rxload'
+                    ' +(?P<rxload>[a-zA-Z0-9\/]+)$')
+
+    # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
+    p7 = LazyRegex(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                    ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN'
+                    ' +Id +(?P<second_dot1q>[0-9]+),$')
+
+    # Encapsulation 802.1Q Virtual LAN, VLAN Id 20,  loopback not set,
+    p7_1 = LazyRegex(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                      ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +loopback'
+                      ' +(?P<loopback_status>[a-zA-Z\s]+),$')
+
+    p7_2 = LazyRegex(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                      ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN +Id'
+                      ' +(?P<second_dot1q>[0-9]+),(?: +loopback'
+                      ' +(?P<loopback_status>[a-zA-Z\s]+),)?$')
+
+    # Encapsulation ARPA,
+    p7_3 = LazyRegex(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),$')
+
+    # Encapsulation Null,  loopback not set,
+    p7_4 = LazyRegex(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                      ' +loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
+
+    # loopback not set,
+    p7_5 = LazyRegex(r'^\s*loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
+
+    # Last input never, output never
+    p8 = LazyRegex(r'^\s*Last +input +(?P<last_input>[\w\W]+),'
+                    ' +output +(?P<last_output>[\w\W]+)$')
+
+    # ARP type ARPA, ARP timeout 04:00:00
+    p8_1 = LazyRegex(r'^\s*ARP +type +(?P<arp_type>\S+), +ARP +timeout'
+                      ' +(?P<arp_timeout>\S+)')
+
+    p8_2 = LazyRegex(r'^\s*Last +link +flapped +(?P<last_link_flapped>\S+)$')
+
+    # Last clearing of "show interface" counters never
+    p8_3 = LazyRegex(r'^\s*Last +clearing +of +"show interface"'
+                      ' +counters +(?P<last_clear>[\w\W]+)$')
+
+    # 5 minute input rate 0 bits/sec, 0 packets/sec
+    p9 = LazyRegex(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
+                    ' +input +rate +(?P<in_rate>[0-9]+) +bits/sec,'
+                    ' +(?P<in_rate_pkts>[0-9]+) +packets/sec$')
+
+    # Full-duplex, 1000Mb/s, unknown, link type is autonegotiation
+    # Duplex unknown, 0Kb/s, unknown, link type is autonegotiation
+    p9_1 = LazyRegex(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+)(Mb/s|Kb/s|Gb/s),'
+                      ' +(?P<location>\S+), +link +type +is'
+                      ' +(?P<auto_negotiate>(autonegotiation))$')
+
+    p9_2 = LazyRegex(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+),'
+                      ' +(?P<location>\S+), +link +type +is +(?P<auto_negotiate>(force-up))$')
+
+    # output flow control is off, input flow control is off
+    p9_3 = LazyRegex(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
+                      ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
+
+    p9_4 = LazyRegex(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
+                      ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
+
+    p9_5 = LazyRegex(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
+                      ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
+
+    p9_6 = LazyRegex(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
+                      ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
+
+    # Carrier delay (up) is 10 msec
+    p9_7 = LazyRegex(r'^\s*Carrier +delay +\(up\) +is'
+                      ' +(?P<carrier_delay>[0-9]+) +msec$')
+
+    # 5 minute output rate 0 bits/sec, 0 packets/sec
+    p10 = LazyRegex(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
+                     ' +output +rate +(?P<out_rate>[0-9]+) +bits/sec,'
+                     ' +(?P<out_rate_pkts>[0-9]+) +packets/sec$')
+
+    # 0 packets input, 0 bytes, 0 total input drops
+    p11 = LazyRegex(r'^\s*(?P<in_pkts>[0-9]+) +packets +input,'
+                     ' +(?P<in_octets>[0-9]+) +bytes, +(?P<in_discards>[0-9]+)'
+                     ' +total +input +drops$')
+
+    # 0 drops for unrecognized upper-level protocol
+    p12 = LazyRegex(r'^\s*(?P<in_unknown_protos>[0-9]+) +drops +for +unrecognized'
+                     ' +upper-level +protocol$')
+
+    # Received 0 broadcast packets, 0 multicast packets
+    p13 = LazyRegex(r'^\s*Received +(?P<in_broadcast_pkts>[0-9]+)'
+                     ' +broadcast +packets, +(?P<in_multicast_pkts>[0-9]+)'
+                     ' +multicast +packets$')
+
+    # 0 runts, 0 giants, 0 throttles, 0 parity
+    p14 = LazyRegex(r'^\s*(?P<in_runts>[0-9]+) +runts, +(?P<in_giants>[0-9]+)'
+                     ' +giants, +(?P<in_throttles>[0-9]+) +throttles,'
+                     ' +(?P<in_parity>[0-9]+) parity$')
+
+    # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+    p15 = LazyRegex(r'^\s*(?P<in_frame_errors>[0-9]+) +input +errors,'
+                     ' +(?P<in_crc_errors>[0-9]+) +CRC,'
+                     ' +(?P<in_frame>[0-9]+)'
+                     ' +frame, +(?P<in_overrun>[0-9]+) +overrun,'
+                     ' +(?P<in_ignored>[0-9]+) +ignored,'
+                     ' +(?P<in_abort>[0-9]+) +abort$')
+
+    # 0 packets output, 0 bytes, 0 total output drops 
+    p16 = LazyRegex(r'^\s*(?P<out_pkts>[0-9]+) +packets +output,'
+                     ' +(?P<out_octets>[0-9]+) +bytes, +(?P<out_discards>[0-9]+)'
+                     ' +total +output +drops$')
+
+    # Output 0 broadcast packets, 0 multicast packets
+    p17 = LazyRegex(r'^\s*Output +(?P<out_broadcast_pkts>[0-9]+)'
+                     ' +broadcast +packets, +(?P<out_multicast_pkts>[0-9]+)'
+                     ' +multicast +packets$')
+
+    # 0 output errors, 0 underruns, 0 applique, 0 resets
+    p18 = LazyRegex(r'^\s*(?P<out_errors>[0-9]+) +output +errors,'
+                     ' +(?P<out_underruns>[0-9]+) +underruns,'
+                     ' +(?P<out_applique>[0-9]+) +applique,'
+                     ' +(?P<out_resets>[0-9]+) +resets$')
+
+    # 0 output buffer failures, 0 output buffers swapped out
+    p19 = LazyRegex(r'^\s*(?P<out_buffer_failures>[0-9]+) +output'
+                     ' +buffer +failures, +(?P<out_buffer_swapped_out>[0-9]+)'
+                     ' +output +buffers +swapped +out$')
+
+    # 0 carrier transitions
+    p20 = LazyRegex(r'^\s*(?P<carrier_transitions>[0-9]+) +carrier +transitions$')
+
     def cli(self, interface='', output=None):
         if output is None:
             if interface:
@@ -479,11 +647,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
             line = line.strip()
 
             # MgmtEth0/0/CPU0/0 is administratively down, line protocol is administratively down
-            p1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
-                             ' +(?P<enabled>(administratively down|down))(?:,'
-                             ' +line +protocol +is +(?P<line_protocol>'
-                             '(administratively down|down)))?$')
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
@@ -496,11 +660,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['enabled'] = False
                 continue
 
-            p1_1 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\.\-]+) +is'
-                               ' +(?P<enabled>(administratively up|up))(?:,'
-                               ' +line +protocol +is +(?P<line_protocol>'
-                               '(administratively up|up)))?$')
-            m = p1_1.match(line)
+            m = self.p1_1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
@@ -514,9 +674,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Interface state transitions: 1
-            p2 = re.compile(r'^\s*Interface +state +transitions:'
-                             ' +(?P<interface_state>[0-9]+)$')
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 interface_state = int(m.groupdict()['interface_state'])
                 interface_detail_dict[interface]['interface_state'] = interface_state
@@ -525,10 +683,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
             # Hardware is Null interface
             # Hardware is Management Ethernet, address is 5254.00c3.6c43 (bia 5254.00c3.6c43)
 
-            p3 = re.compile(r'^\s*Hardware is (?P<types>[a-zA-Z\,\s]+)(?:'
-                             ' +address +is (?P<mac_address>[a-z0-9\.]+) +\(bia'
-                             ' +(?P<phys_address>[a-z0-9\.]+)\))?$')
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 types = m.groupdict()['types'].lower()
                 types = types.replace(",","")
@@ -545,9 +700,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Hardware is VLAN sub-interface(s), address is aaaa.bbbb.cccc
-            p3_1 = re.compile(r'^\s*Hardware is (?P<types>[\w\W]+) +address'
-                               ' +is +(?P<mac_address>[a-z0-9\.]+)$')
-            m = p3_1.match(line)
+            m = self.p3_1.match(line)
             if m:
                 types = m.groupdict()['types'].lower()
                 types = types.replace(",","")
@@ -560,17 +713,14 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             #Description: desc
-            p3_2 = re.compile(r'^\s*Description: +(?P<description>[\w\W]+)$')
-            m = p3_2.match(line)
+            m = self.p3_2.match(line)
             if m:
                 interface_detail_dict[interface]['description']\
                 = str(m.groupdict()['description'])
                 continue
 
             # Internet address is 10.1.1.1/24
-            p4 = re.compile(r'^\s*Internet +address +is +(?P<ip>[a-z0-9\.]+)'
-                             '(\/(?P<prefix_length>[0-9]+))?$')
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -588,10 +738,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
 
             # MTU 1500 bytes, BW 0 Kbit (Max: 1000000 Kbit)
             # MTU 6000 bytes, BW 20000000 Kbit (Max: 20000000 Kbit)
-            p5 = re.compile(r'^\s*MTU +(?P<mtu>[0-9]+) +bytes, +BW'
-                             ' +(?P<bandwidth>[0-9]+) +Kbit(?: *\(Max: +\d+'
-                             ' +Kbit\))?$')
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
@@ -601,10 +748,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # reliability 255/255, txload Unknown, rxload Unknown
-            p6 = re.compile(r'^\s*reliability +(?P<reliability>[a-zA-Z0-9\/]+),'
-                             ' +txload +(?P<txload>[a-zA-Z0-9\/]+), +rxload'
-                             ' +(?P<rxload>[a-zA-Z0-9\/]+)$')
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload'].lower()
@@ -616,10 +760,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
             
             # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-            p7 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                             ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN'
-                             ' +Id +(?P<second_dot1q>[0-9]+),$')
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
 
@@ -635,10 +776,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Encapsulation 802.1Q Virtual LAN, VLAN Id 20,  loopback not set,
-            p7_1 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +loopback'
-                               ' +(?P<loopback_status>[a-zA-Z\s]+),$')
-            m = p7_1.match(line)
+            m = self.p7_1.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
                 loopback_status = str(m.groupdict()['loopback_status'])
@@ -656,11 +794,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                     = m.groupdict()['loopback_status']
                 continue
             
-            p7_2 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +VLAN +Id +(?P<first_dot1q>[0-9]+), +2nd +VLAN +Id'
-                               ' +(?P<second_dot1q>[0-9]+),(?: +loopback'
-                               ' +(?P<loopback_status>[a-zA-Z\s]+),)?$')
-            m = p7_2.match(line)
+            m = self.p7_2.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
                 loopback_status = str(m.groupdict()['loopback_status'])
@@ -681,8 +815,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Encapsulation ARPA,
-            p7_3 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),$')
-            m = p7_3.match(line)
+            m = self.p7_3.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
 
@@ -694,14 +827,11 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Encapsulation Null,  loopback not set,
-            p7_4 = re.compile(r'^\s*Encapsulation +(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                               ' +loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
-            m = p7_4.match(line)
+            m = self.p7_4.match(line)
             if m:
                 encapsulation = str(m.groupdict()['encapsulation']).lower()
                 loopback_status = str(m.groupdict()['loopback_status'])
 
-
                 if 'encapsulations' not in interface_detail_dict[interface]:
                     interface_detail_dict[interface]['encapsulations'] = {}
 
@@ -714,8 +844,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # loopback not set,
-            p7_5 = re.compile(r'^\s*loopback +(?P<loopback_status>[a-zA-Z\s]+),$')
-            m = p7_5.match(line)
+            m = self.p7_5.match(line)
             if m:
                 loopback_status = str(m.groupdict()['loopback_status'])
 
@@ -725,9 +854,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Last input never, output never
-            p8 = re.compile(r'^\s*Last +input +(?P<last_input>[\w\W]+),'
-                             ' +output +(?P<last_output>[\w\W]+)$')
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 interface_detail_dict[interface]['last_input']\
                  = m.groupdict()['last_input']
@@ -736,9 +863,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # ARP type ARPA, ARP timeout 04:00:00
-            p8_1 = re.compile(r'^\s*ARP +type +(?P<arp_type>\S+), +ARP +timeout'
-                               ' +(?P<arp_timeout>\S+)')
-            m = p8_1.match(line)
+            m = self.p8_1.match(line)
             if m:
                 arp_type = str(m.groupdict()['arp_type']).lower()
 
@@ -748,26 +873,20 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                  = m.groupdict()['arp_timeout']
                 continue
 
-            p8_2 = re.compile(r'^\s*Last +link +flapped +(?P<last_link_flapped>\S+)$')
-            m = p8_2.match(line)
+            m = self.p8_2.match(line)
             if m:
                 interface_detail_dict[interface]['last_link_flapped']\
                  = m.groupdict()['last_link_flapped']
                 continue
 
             # Last clearing of "show interface" counters never
-            p8_3 = re.compile(r'^\s*Last +clearing +of +"show interface"'
-                               ' +counters +(?P<last_clear>[\w\W]+)$')
-            m = p8_3.match(line)
+            m = self.p8_3.match(line)
             if m:
                 last_clear = str(m.groupdict()['last_clear'])
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            p9 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
-                             ' +input +rate +(?P<in_rate>[0-9]+) +bits/sec,'
-                             ' +(?P<in_rate_pkts>[0-9]+) +packets/sec$')
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
@@ -794,10 +913,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
 
             # Full-duplex, 1000Mb/s, unknown, link type is autonegotiation
             # Duplex unknown, 0Kb/s, unknown, link type is autonegotiation
-            p9_1 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+)(Mb/s|Kb/s|Gb/s),'
-                               ' +(?P<location>\S+), +link +type +is'
-                               ' +(?P<auto_negotiate>(autonegotiation))$')
-            m = p9_1.match(line)
+            m = self.p9_1.match(line)
             if m:
                 auto_negotiate = m.groupdict()['auto_negotiate']
                 duplex_mode = str(m.groupdict()['duplex_mode']).lower()
@@ -809,9 +925,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['auto_negotiate'] = True
                 continue
 
-            p9_2 = re.compile(r'^\s*(?P<duplex_mode>[\w\W]+), +(?P<port_speed>\S+),'
-                               ' +(?P<location>\S+), +link +type +is +(?P<auto_negotiate>(force-up))$')
-            m = p9_2.match(line)
+            m = self.p9_2.match(line)
             if m:
                 auto_negotiate = m.groupdict()['auto_negotiate']
                 duplex_mode = str(m.groupdict()['duplex_mode']).lower()
@@ -824,9 +938,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # output flow control is off, input flow control is off
-            p9_3 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
-            m = p9_3.match(line)
+            m = self.p9_3.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
                 flow_control_receive = m.groupdict()['flow_control_receive']
@@ -838,9 +950,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
                 continue
 
-            p9_4 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
-            m = p9_4.match(line)
+            m = self.p9_4.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
                 flow_control_receive = m.groupdict()['flow_control_receive']
@@ -852,9 +962,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = True
                 continue
 
-            p9_5 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(on)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(off))$')
-            m = p9_5.match(line)
+            m = self.p9_5.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
                 flow_control_receive = m.groupdict()['flow_control_receive']
@@ -866,9 +974,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 interface_detail_dict[interface]['flow_control']['flow_control_receive'] = False
                 continue
 
-            p9_6 = re.compile(r'^\s*output +flow +control +is +(?P<flow_control_send>(off)),'
-                               ' +input +flow +control +is +(?P<flow_control_receive>(on))$')
-            m = p9_6.match(line)
+            m = self.p9_6.match(line)
             if m:
                 flow_control_send = m.groupdict()['flow_control_send']
                 flow_control_receive = m.groupdict()['flow_control_receive']
@@ -881,9 +987,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # Carrier delay (up) is 10 msec
-            p9_7 = re.compile(r'^\s*Carrier +delay +\(up\) +is'
-                               ' +(?P<carrier_delay>[0-9]+) +msec$')
-            m = p9_7.match(line)
+            m = self.p9_7.match(line)
             if m:
                 carrier_delay = m.groupdict()['carrier_delay']
 
@@ -891,10 +995,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            p10 = re.compile(r'^\s*(?P<load_interval>[0-9]+) +(?P<timecheck>minute|second|)'
-                              ' +output +rate +(?P<out_rate>[0-9]+) +bits/sec,'
-                              ' +(?P<out_rate_pkts>[0-9]+) +packets/sec$')
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
                 out_rate = int(m.groupdict()['out_rate'])
@@ -918,10 +1019,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 total input drops
-            p11 = re.compile(r'^\s*(?P<in_pkts>[0-9]+) +packets +input,'
-                              ' +(?P<in_octets>[0-9]+) +bytes, +(?P<in_discards>[0-9]+)'
-                              ' +total +input +drops$')
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 in_pkts = int(m.groupdict()['in_pkts'])
                 in_octets = int(m.groupdict()['in_octets'])
@@ -936,19 +1034,14 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 drops for unrecognized upper-level protocol
-            p12 = re.compile(r'^\s*(?P<in_unknown_protos>[0-9]+) +drops +for +unrecognized'
-                              ' +upper-level +protocol$')
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
                 continue
 
             # Received 0 broadcast packets, 0 multicast packets
-            p13 = re.compile(r'^\s*Received +(?P<in_broadcast_pkts>[0-9]+)'
-                              ' +broadcast +packets, +(?P<in_multicast_pkts>[0-9]+)'
-                              ' +multicast +packets$')
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['in_broadcast_pkts'] = int(m.groupdict()['in_broadcast_pkts'])
@@ -957,10 +1050,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles, 0 parity
-            p14 = re.compile(r'^\s*(?P<in_runts>[0-9]+) +runts, +(?P<in_giants>[0-9]+)'
-                              ' +giants, +(?P<in_throttles>[0-9]+) +throttles,'
-                              ' +(?P<in_parity>[0-9]+) parity$')
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['in_runts'] = int(m.groupdict()['in_runts'])
@@ -973,13 +1063,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            p15 = re.compile(r'^\s*(?P<in_frame_errors>[0-9]+) +input +errors,'
-                              ' +(?P<in_crc_errors>[0-9]+) +CRC,'
-                              ' +(?P<in_frame>[0-9]+)'
-                              ' +frame, +(?P<in_overrun>[0-9]+) +overrun,'
-                              ' +(?P<in_ignored>[0-9]+) +ignored,'
-                              ' +(?P<in_abort>[0-9]+) +abort$')
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['in_frame_errors'] = int(m.groupdict()['in_frame_errors'])
@@ -996,10 +1080,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 packets output, 0 bytes, 0 total output drops 
-            p16 = re.compile(r'^\s*(?P<out_pkts>[0-9]+) +packets +output,'
-                              ' +(?P<out_octets>[0-9]+) +bytes, +(?P<out_discards>[0-9]+)'
-                              ' +total +output +drops$')
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 interface_detail_dict[interface].setdefault('counters', {})
                 interface_detail_dict[interface]['counters']\
@@ -1011,10 +1092,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
     
             # Output 0 broadcast packets, 0 multicast packets
-            p17 = re.compile(r'^\s*Output +(?P<out_broadcast_pkts>[0-9]+)'
-                              ' +broadcast +packets, +(?P<out_multicast_pkts>[0-9]+)'
-                              ' +multicast +packets$')
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['out_broadcast_pkts'] = int(m.groupdict()['out_broadcast_pkts'])
@@ -1023,11 +1101,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 output errors, 0 underruns, 0 applique, 0 resets
-            p18 = re.compile(r'^\s*(?P<out_errors>[0-9]+) +output +errors,'
-                              ' +(?P<out_underruns>[0-9]+) +underruns,'
-                              ' +(?P<out_applique>[0-9]+) +applique,'
-                              ' +(?P<out_resets>[0-9]+) +resets$')
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['out_errors'] = int(m.groupdict()['out_errors'])
@@ -1040,10 +1114,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            p19 = re.compile(r'^\s*(?P<out_buffer_failures>[0-9]+) +output'
-                              ' +buffer +failures, +(?P<out_buffer_swapped_out>[0-9]+)'
-                              ' +output +buffers +swapped +out$')
-            m = p19.match(line)
+            m = self.p19.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['out_buffer_failures'] = int(m.groupdict()['out_buffer_failures'])
@@ -1052,8 +1123,7 @@ class ShowInterfacesDetail(ShowInterfacesDetailSchema):
                 continue
 
             # 0 carrier transitions
-            p20 = re.compile(r'^\s*(?P<carrier_transitions>[0-9]+) +carrier +transitions$')
-            m = p20.match(line)
+            m = self.p20.match(line)
             if m:
                 interface_detail_dict[interface]['counters']\
                 ['carrier_transitions'] = int(m.groupdict()['carrier_transitions'])
@@ -2351,6 +2421,176 @@ class ShowInterfaces(ShowInterfacesSchema):
     exclude = []
 
 
+    # GigabitEthernet1 is up, line protocol is up 
+    # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
+    p1 = LazyRegex(r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
+                    '+line +protocol +is +(?P<line_protocol>[\w\s]+)$')
+
+    # Interface state transitions: 9 
+    p2 = LazyRegex(r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$')
+
+    # Hardware is Loopback
+    # Hardware is Gigabit Ethernet, address is 0057.d228.1a64 (bia 0057.d228.1a64)
+    p3 = LazyRegex(r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
+                    '(, *address +is +(?P<mac_address>[\w\.]+))?'
+                    '( *\(bia *(?P<phys_address>[\w\.]+)\))?$')
+
+    # Layer 2 Transport Mode
+    p4 = LazyRegex(r'^Layer +2 +Transport +Mode$')
+
+    # Description: to-ML26-BE1
+    p5 = LazyRegex(r'^Description: *(?P<description>.*)$')
+
+    # Internet address is 10.4.4.4/24
+    # Internet address is Unknown
+    p6 = LazyRegex(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
+                    '\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$')
+
+    # MTU 1500 bytes, BW 10000 Kbit
+    # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
+    p7 = LazyRegex(r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
+                    '(.*Max: +(?P<bandwidth_max>[\d]+).*)?$')
+
+    # reliability 255/255, txload 1/255, rxload 1/255
+    # reliability Unknown, txload Unknown, rxload Unknown
+    p8 = LazyRegex(r'^reliability +(?P<reliability>[\w\/]+), '
+                    '+txload +(?P<txload>[\w\/]+), +rxload '
+                    '+(?P<rxload>[\w\/]+)$')
+
+    # Encapsulation ARPA,
+    # Encapsulation 802.1Q Virtual LAN,
+    # Encapsulation ARPA,  loopback not set,
+    # Encapsulation 802.1Q Virtual LAN, VLAN Id 10,  loopback not set,
+    # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
+    p9 = LazyRegex(r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
+                    '( +VLAN +Id +(?P<first_dot1q>\d+),)?'
+                    '( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
+                    '( +loopback +(?P<loopback>[\w\s]+),)?$')
+
+    # Outer Match: Dot1Q VLAN 300
+    p10 = LazyRegex(r'^Outer +Match: +(?P<outer_match>[\w\s]+)$')
+
+    # Ethertype Any, MAC Match src any, dest any
+    p11 = LazyRegex(r'^Ethertype +(?P<ethertype>\w+), '
+                      '+MAC +Match +(?P<mac_match>[\w\s]+), '
+                      '+dest +(?P<dest>\w+)$')
+
+    # Full-duplex, 0Kb/s
+    # Full-duplex, 1000Mb/s, link type is force-up
+    # Full-duplex, Auto Speed, SR, link type is force-up
+    # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
+    p12 = LazyRegex(r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
+                     '+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
+                     '(, +link +type +is +(?P<link_type>\S+))?$')
+
+    # output flow control is off, input flow control is off
+    # output flow control is off, input flow control is unsupported
+    p13 = LazyRegex(r'^output +flow +control +is +(?P<send>\w+), +'
+                     'input +flow +control +is +(?P<receive>\w+)$')
+
+    # Carrier delay (up) is 10 msec
+    # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
+    p14 = LazyRegex(r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
+            '(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$')
+
+    # loopback not set,
+    p15 = LazyRegex(r'^loopback +(?P<loopback>[\w\s]+),$')
+
+    # Last link flapped 5w6d
+    p16 = LazyRegex(r'^Last +link +flapped +(?P<last_link_flapped>\S+)$')
+
+    # ARP type ARPA, ARP timeout 04:00:00
+    p17 = LazyRegex(r'^ARP +type +(?P<arp_type>\w+), +'
+                     'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$')
+
+    # Last input never, output 00:01:05
+    p18 = LazyRegex(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+                     'output +(?P<last_output>[\w\.\:]+)$')
+
+    # No. of members in this bundle: 1
+    p19 = LazyRegex(r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$')
+
+    # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
+    p20 = LazyRegex(r'^(?P<interface>[\w\/\.]+) '
+                     '+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
+                     '+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$')
+
+    # Last clearing of "show interface" counters 1d02h
+    p21 = LazyRegex(r'^Last +clearing +of +"show +interface" +counters +'
+                     '(?P<last_clear>[\w\:\.]+)$')
+
+    # Input/output data rate is disabled.
+    p22 = LazyRegex(r'^Input\/output +data +rate +is +disabled\.$')
+
+    # 5 minute input rate 0 bits/sec, 0 packets/sec
+    p23 = LazyRegex(r'^(?P<load_interval>[\d\#]+)'
+                     ' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
+                     ' +(?P<in_rate>[\d]+) +bits/sec,'
+                     ' +(?P<in_rate_pkts>[\d]+) +packets/sec$')
+
+    # 5 minute output rate 0 bits/sec, 0 packets/sec
+    p24 = LazyRegex(r'^(?P<load_interval>[\d\#]+)'
+                     ' *(minute|second|minutes|seconds) +output +rate'
+                     ' +(?P<out_rate>[\d]+) +bits/sec,'
+                     ' +(?P<out_rate_pkts>[\d]+) +packets/sec$')
+
+    # 0 packets input, 0 bytes
+    # 0 packets input, 0 bytes, 0 total input drops
+    p25 = LazyRegex(r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
+                     '(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$')
+
+    # 1258859 drops for unrecognized upper-level protocol
+    p26 = LazyRegex(r'(?P<in_unknown_protos>[\d]+) +drops +for '
+                     '+unrecognized +upper-level +protocol$')
+
+    # 0 input drops, 0 queue drops, 0 input errors
+    p27 = LazyRegex(r'(?P<in_drops>[\d]+) +input +drops, '
+                     '+(?P<in_queue_drops>[\d]+) +queue +drops, '
+                     '+(?P<in_errors>[\d]+) +input +errors$')
+
+    # Received 0 broadcast packets, 0 multicast packets
+    p28 = LazyRegex(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
+                     '+(?P<in_multicast_pkts>\d+) +multicast +packets$')
+
+    # 0 runts, 0 giants, 0 throttles, 0 parity
+    p29 = LazyRegex(r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
+                     '+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$')
+
+    # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
+    p30 = LazyRegex(r'^(?P<in_errors>[\d]+) +input +errors, +'
+                     '(?P<in_crc_errors>[\d]+) +CRC, +'
+                     '(?P<in_frame>[\d]+) +frame, +'
+                     '(?P<in_overrun>[\d]+) +overrun, +'
+                     '(?P<in_ignored>[\d]+) +ignored, +'
+                     '(?P<in_abort>[\d]+) +abort$')
+
+    # 0 packets output, 0 bytes
+    # 0 packets output, 0 bytes, 0 total output drops
+    p31 = LazyRegex(r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
+                     '(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$')
+
+    # Output 0 broadcast packets, 178045 multicast packets
+    p32 = LazyRegex(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
+                     '+(?P<out_multicast_pkts>\d+) +multicast +packets$')
+
+    # 0 output errors, 0 underruns, 0 applique, 0 resets
+    p33 = LazyRegex(r'^(?P<out_errors>[\d]+) +output +errors, '
+                     '+(?P<out_underruns>[\d]+) +underruns, '
+                     '+(?P<out_applique>[\d]+) +applique, '
+                     '+(?P<out_resets>[\d]+) +resets$')
+
+    # 0 output drops, 0 queue drops, 0 output errors
+    p34 = LazyRegex(r'(?P<out_drops>[\d]+) +output +drops, '
+                     '+(?P<out_queue_drops>[\d]+) +queue +drops, '
+                     '+(?P<out_errors>[\d]+) +output +errors$')
+
+    # 0 output buffer failures, 0 output buffers swapped out
+    p35 = LazyRegex(r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
+                     '+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$')
+
+    # 0 carrier transitions
+    p36 = LazyRegex(r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$')
+
     def cli(self, interface="", output=None):
         if output is None:
             if interface:
@@ -2363,182 +2603,12 @@ class ShowInterfaces(ShowInterfacesSchema):
 
         result_dict = {}
 
-        # GigabitEthernet1 is up, line protocol is up 
-        # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-        p1 = re.compile(r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
-                         '+line +protocol +is +(?P<line_protocol>[\w\s]+)$')
-
-        # Interface state transitions: 9 
-        p2 = re.compile(r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$')
-
-        # Hardware is Loopback
-        # Hardware is Gigabit Ethernet, address is 0057.d228.1a64 (bia 0057.d228.1a64)
-        p3 = re.compile(r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
-                         '(, *address +is +(?P<mac_address>[\w\.]+))?'
-                         '( *\(bia *(?P<phys_address>[\w\.]+)\))?$')
-
-        # Layer 2 Transport Mode
-        p4 = re.compile(r'^Layer +2 +Transport +Mode$')
-
-        # Description: to-ML26-BE1
-        p5 = re.compile(r'^Description: *(?P<description>.*)$')
-
-        # Internet address is 10.4.4.4/24
-        # Internet address is Unknown
-        p6 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
-                         '\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$')
-
-        # MTU 1500 bytes, BW 10000 Kbit
-        # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-        p7 = re.compile(r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
-                         '(.*Max: +(?P<bandwidth_max>[\d]+).*)?$')
-
-        # reliability 255/255, txload 1/255, rxload 1/255
-        # reliability Unknown, txload Unknown, rxload Unknown
-        p8 = re.compile(r'^reliability +(?P<reliability>[\w\/]+), '
-                         '+txload +(?P<txload>[\w\/]+), +rxload '
-                         '+(?P<rxload>[\w\/]+)$')
-
-        # Encapsulation ARPA,
-        # Encapsulation 802.1Q Virtual LAN,
-        # Encapsulation ARPA,  loopback not set,
-        # Encapsulation 802.1Q Virtual LAN, VLAN Id 10,  loopback not set,
-        # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-        p9 = re.compile(r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
-                         '( +VLAN +Id +(?P<first_dot1q>\d+),)?'
-                         '( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
-                         '( +loopback +(?P<loopback>[\w\s]+),)?$')
-
-        # Outer Match: Dot1Q VLAN 300
-        p10 = re.compile(r'^Outer +Match: +(?P<outer_match>[\w\s]+)$')
-
-        # Ethertype Any, MAC Match src any, dest any
-        p11 = re.compile(r'^Ethertype +(?P<ethertype>\w+), '
-                           '+MAC +Match +(?P<mac_match>[\w\s]+), '
-                           '+dest +(?P<dest>\w+)$')
-
-        # Full-duplex, 0Kb/s
-        # Full-duplex, 1000Mb/s, link type is force-up
-        # Full-duplex, Auto Speed, SR, link type is force-up
-        # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-        p12 = re.compile(r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
-                          '+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
-                          '(, +link +type +is +(?P<link_type>\S+))?$')
-
-        # output flow control is off, input flow control is off
-        # output flow control is off, input flow control is unsupported
-        p13 = re.compile(r'^output +flow +control +is +(?P<send>\w+), +'
-                          'input +flow +control +is +(?P<receive>\w+)$')
-
-        # Carrier delay (up) is 10 msec
-        # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-        p14 = re.compile(r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
-                '(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$')
-
-        # loopback not set,
-        p15 = re.compile(r'^loopback +(?P<loopback>[\w\s]+),$')
-
-        # Last link flapped 5w6d
-        p16 = re.compile(r'^Last +link +flapped +(?P<last_link_flapped>\S+)$')
-
-        # ARP type ARPA, ARP timeout 04:00:00
-        p17 = re.compile(r'^ARP +type +(?P<arp_type>\w+), +'
-                          'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$')
-
-        # Last input never, output 00:01:05
-        p18 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+)$')
-
-        # No. of members in this bundle: 1
-        p19 = re.compile(r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$')
-
-        # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-        p20 = re.compile(r'^(?P<interface>[\w\/\.]+) '
-                          '+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
-                          '+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$')
-
-        # Last clearing of "show interface" counters 1d02h
-        p21 = re.compile(r'^Last +clearing +of +"show +interface" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
-
-        # Input/output data rate is disabled.
-        p22 = re.compile(r'^Input\/output +data +rate +is +disabled\.$')
-
-        # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p23 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
-                          ' +(?P<in_rate>[\d]+) +bits/sec,'
-                          ' +(?P<in_rate_pkts>[\d]+) +packets/sec$')
-
-        # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p24 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          ' *(minute|second|minutes|seconds) +output +rate'
-                          ' +(?P<out_rate>[\d]+) +bits/sec,'
-                          ' +(?P<out_rate_pkts>[\d]+) +packets/sec$')
-
-        # 0 packets input, 0 bytes
-        # 0 packets input, 0 bytes, 0 total input drops
-        p25 = re.compile(r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
-                          '(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$')
-
-        # 1258859 drops for unrecognized upper-level protocol
-        p26 = re.compile(r'(?P<in_unknown_protos>[\d]+) +drops +for '
-                          '+unrecognized +upper-level +protocol$')
-
-        # 0 input drops, 0 queue drops, 0 input errors
-        p27 = re.compile(r'(?P<in_drops>[\d]+) +input +drops, '
-                          '+(?P<in_queue_drops>[\d]+) +queue +drops, '
-                          '+(?P<in_errors>[\d]+) +input +errors$')
-
-        # Received 0 broadcast packets, 0 multicast packets
-        p28 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
-                          '+(?P<in_multicast_pkts>\d+) +multicast +packets$')
-
-        # 0 runts, 0 giants, 0 throttles, 0 parity
-        p29 = re.compile(r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
-                          '+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$')
-
-        # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p30 = re.compile(r'^(?P<in_errors>[\d]+) +input +errors, +'
-                          '(?P<in_crc_errors>[\d]+) +CRC, +'
-                          '(?P<in_frame>[\d]+) +frame, +'
-                          '(?P<in_overrun>[\d]+) +overrun, +'
-                          '(?P<in_ignored>[\d]+) +ignored, +'
-                          '(?P<in_abort>[\d]+) +abort$')
-
-        # 0 packets output, 0 bytes
-        # 0 packets output, 0 bytes, 0 total output drops
-        p31 = re.compile(r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
-                          '(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$')
-
-        # Output 0 broadcast packets, 178045 multicast packets
-        p32 = re.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
-                          '+(?P<out_multicast_pkts>\d+) +multicast +packets$')
-        
-        # 0 output errors, 0 underruns, 0 applique, 0 resets
-        p33 = re.compile(r'^(?P<out_errors>[\d]+) +output +errors, '
-                          '+(?P<out_underruns>[\d]+) +underruns, '
-                          '+(?P<out_applique>[\d]+) +applique, '
-                          '+(?P<out_resets>[\d]+) +resets$')
-
-        # 0 output drops, 0 queue drops, 0 output errors
-        p34 = re.compile(r'(?P<out_drops>[\d]+) +output +drops, '
-                          '+(?P<out_queue_drops>[\d]+) +queue +drops, '
-                          '+(?P<out_errors>[\d]+) +output +errors$')
-
-        # 0 output buffer failures, 0 output buffers swapped out
-        p35 = re.compile(r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
-                          '+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$')
-
-        # 0 carrier transitions
-        p36 = re.compile(r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$')
-
         for line in out.splitlines():
             line = line.strip()
 
             # GigabitEthernet1 is up, line protocol is up
             # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 group = m.groupdict()
                 interface = group['interface']
@@ -2557,7 +2627,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Interface state transitions: 9
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 interface_state_transitions = int(m.groupdict()['interface_state_transitions'])
                 intf_dict['interface_state_transitions'] = interface_state_transitions
@@ -2565,7 +2635,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Hardware is Loopback
             # Hardware is Gigabit Ethernet, address is 0057.d228.1a64 (bia 0057.d228.1a64)
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 types = m.groupdict()['type']
                 mac_address = m.groupdict()['mac_address']
@@ -2578,13 +2648,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Layer 2 Transport Mode
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 intf_dict['layer2'] = True
                 continue
 
             # Description: desc
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 description = m.groupdict()['description']
                 intf_dict['description'] = description
@@ -2592,7 +2662,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Internet Address is 10.4.4.4/24
             # Internet address is Unknown
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 ipv4 = m.groupdict()['ipv4']
                 ip = m.groupdict()['ip']
@@ -2607,7 +2677,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # MTU 1500 bytes, BW 10000 Kbit
             # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 mtu = m.groupdict()['mtu']
                 bandwidth = m.groupdict()['bandwidth']
@@ -2620,7 +2690,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
@@ -2634,7 +2704,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation ARPA,
             # Encapsulation 802.1Q Virtual LAN, Vlan ID 1, loopback not set
             # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 group = m.groupdict()
                 encapsulation = group['encapsulation'].lower()
@@ -2657,14 +2727,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Outer Match: Dot1Q VLAN 300
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 outer_match = m.groupdict()['outer_match']
                 encap_dict['outer_match'] = outer_match
                 continue
 
             # Ethertype Any, MAC Match src any, dest any
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 group = m.groupdict()
                 ethertype = group['ethertype']
@@ -2680,7 +2750,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Full-duplex, 1000Mb/s, link type is force-up
             # Full-duplex, Auto Speed, SR, link type is force-up
             # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 group = m.groupdict()
                 duplex_mode = group['duplex_mode'].lower()
@@ -2702,7 +2772,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # output flow control is off, input flow control is off
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 receive = m.groupdict()['receive'].lower()
                 send = m.groupdict()['send'].lower()
@@ -2721,7 +2791,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Carrier delay (up) is 10 msec
             # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 group = m.groupdict()
                 carrier_delay_up = group['carrier_delay_up']
@@ -2734,22 +2804,21 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # loopback not set,
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 loopback = m.groupdict()['loopback']
                 intf_dict['loopback'] = loopback
                 continue
 
             # Last link flapped 5w6d
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 last_link_flapped = m.groupdict()['last_link_flapped']
                 intf_dict['last_link_flapped'] = last_link_flapped
                 continue
 
-
             # ARP type ARPA, ARP timeout 04:00:00
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
@@ -2758,7 +2827,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
@@ -2767,14 +2836,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of members in this bundle: 1
-            m = p19.match(line)
+            m = self.p19.match(line)
             if m:
                 port_dict = intf_dict.setdefault('port_channel', {})
                 port_dict['member_count'] = int(m.groupdict()['member_count'])
                 continue
 
             # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-            m = p20.match(line)
+            m = self.p20.match(line)
             if m:
                 group = m.groupdict()
                 interface = group['interface']
@@ -2790,7 +2859,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 last_clear = m.groupdict()['last_clear']
                 counter_dict = intf_dict.setdefault('counters', {})
@@ -2798,7 +2867,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 group = m.groupdict()
                 load_interval = int(group['load_interval'])
@@ -2817,7 +2886,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 group = m.groupdict()
                 out_rate = int(group['out_rate'])
@@ -2830,7 +2899,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 packets input, 0 bytes
             # 0 packets input, 0 bytes, 0 total input drops
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict = intf_dict.setdefault('counters', {})
@@ -2840,34 +2909,34 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 1258859 drops for unrecognized upper-level protocol
-            m = p26.match(line)
+            m = self.p26.match(line)
             if m:
                 counter_dict['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
                 continue
 
             # 0 input drops, 0 queue drops, 0 input errors
-            m = p27.match(line)
+            m = self.p27.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # Received 0 broadcast packets, 0 multicast packets
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 runts, 0 giants, 0 throttles, 0 parity
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
@@ -2875,7 +2944,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 packets output, 0 bytes
             # 0 packets output, 0 bytes, 0 total output drops
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 group = m.groupdict()
                 for k, v in group.items():
@@ -2884,36 +2953,35 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Output 0 broadcast packets, 178045 multicast packets
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
-
             # 0 output errors, 0 underruns, 0 applique, 0 resets
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 output drops, 0 queue drops, 0 output errors
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 carrier transitions
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
@@ -24,6 +24,7 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.blocks import BlockParser
 
 
 #==================================
@@ -2976,13 +2977,25 @@ class ShowIsisDatabaseDetailSchema(MetaParser):
         }
     }
 
-class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema):
+class ShowIsisDatabaseDetail(ShowIsisDatabaseDetailSchema, BlockParser):
     ''' Parser for commands:
        * show isis database detail 
     '''
 
     cli_command = 'show isis database detail'
 
+    # parse_blocks: one block per LSP, under its instance and level
+    block_context = [re.compile(r'IS\-IS\s+(?P<instance>\S+)?\s*\(*Level\-'
+                                r'(?P<level>\d+)\)*\s+Link\s+State\s+'
+                                r'Database')]
+    block_header = re.compile(r'(?P<lspid>[\w\-\.]+)\s*(?P<local_router>\**)'
+                              r'\s+(?P<lsp_seq_num>\S+)\s+'
+                              r'(?P<lsp_checksum>\S+)\s+'
+                              r'(?P<lsp_holdtime>\d+|\*)\s+'
+                              r'(/*(?P<lsp_rcvd>\d*|\*)?)\s+'
+                              r'(?P<attach_bit>\d+)/(?P<p_bit>\d+)/'
+                              r'(?P<overload_bit>\d+)')
+
     def cli(self, output=None):
 
         if not output:
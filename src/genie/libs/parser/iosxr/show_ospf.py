@@ -21,6 +21,7 @@ from netaddr import IPAddress, IPNetwork
 # Metaparser
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
+from genie.libs.parser.utils.regex import LazyRegex
 
 
 # ==================================================
@@ -1305,6 +1306,187 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
     exclude = ['area_scope_lsa_cksum_sum', 'topology_version', 'spf_runs_count', 'external_lsa_checksum']
 
 
+    p1 = LazyRegex(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
+                       ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
+                       ' +with +ID +(?P<router_id>(\S+))$')
+
+    p2 = LazyRegex(r'^Role *: +(?P<role>([a-zA-z0-9\s]+))$')
+
+    p3 = LazyRegex(r'^NSR +\(Non-stop routing\) +is +(?P<nsr>(\S+))$')
+
+    p3_1 = LazyRegex(r'^Supports +only +single +TOS(TOS0) routes$')
+
+    p3_2 = LazyRegex(r'^Supports +opaque +LSA$')
+
+    p4 = LazyRegex(r'^Redistributing +External +Routes +from,$')
+
+    p4_1 = LazyRegex(r'^(?P<type>(connected|static))(?: +with +metric'
+                       ' +mapped +to +(?P<metric>(\d+)))?$')
+
+    p4_2 = LazyRegex(r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))(?: +with'
+                       ' +metric +mapped +to +(?P<metric>(\d+)))?$')
+
+    p4_3 = LazyRegex(r'^Maximum +number +of +redistributed +prefixes'
+                       ' +(?P<num_prefix>(\d+))'
+                       '(?: +\((?P<warn>(warning-only))\))?')
+
+    p4_4 = LazyRegex(r'^Threshold +for +warning +message'
+                       ' +(?P<thld>(\d+))\%$')
+
+    p5_0 = LazyRegex(r'^It +is +an'
+                       '(?: +(?P<abr>(area border)))?'
+                       '(?: +and)?'
+                       '(?: +(?P<asbr>(autonomous system boundary)))?'
+                       ' +router$')
+
+    p5_1 = LazyRegex(r'^Router +is +not +originating +router-LSAs'
+                       ' +with +maximum +metric$')
+
+    p5_2 = LazyRegex(r'^Originating +router-LSAs +with +maximum'
+                       ' +metric$')
+
+    p5_3 = LazyRegex(r'^Condition:'
+                       ' +(?P<condition>(always|on switch-over|on start-up|on proc-restart))'
+                       '(?: +for +(?P<seconds>(\d+)) +seconds,)?'
+                       ' +State: +(?P<state>(\S+))$')
+
+    p5_4 = LazyRegex(r'^Advertise +stub +links +with +maximum +metric'
+                       ' +in +router\-LSAs$')
+
+    p5_5 = LazyRegex(r'^Advertise +summary\-LSAs +with +metric'
+                       ' +(?P<metric>(\d+))$')
+
+    p5_6 = LazyRegex(r'^^Advertise +external\-LSAs +with +metric'
+                       ' +(?P<metric>(\d+))$')
+
+    p6 = LazyRegex(r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
+                       ' +msecs$')
+
+    p7 = LazyRegex(r'^Minimum +hold +time +between +two +consecutive'
+                       ' +SPFs +(?P<time>(\S+)) +msecs$')
+
+    p8 = LazyRegex(r'^Maximum +wait +time +between +two +consecutive'
+                       ' +SPFs +(?P<time>(\S+)) +msecs$')
+
+    p9 = LazyRegex(r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
+                       ' +msecs$')
+
+    p10 = LazyRegex(r'^Minimum +hold +time +for +LSA +throttle'
+                       ' +(?P<time>(\S+)) +msecs$')
+
+    p11 = LazyRegex(r'^Maximum +wait +time +for +LSA +throttle'
+                       ' +(?P<time>(\S+)) +msecs$')
+
+    p12 = LazyRegex(r'^Minimum +LSA +interval +(?P<interval>(\S+))'
+                       ' +msecs. +Minimum +LSA +arrival'
+                       ' +(?P<arrival>(\S+)) +msecs$')
+
+    p13 = LazyRegex(r'^LSA +refresh +interval +(?P<refresh>(\S+))'
+                       ' +seconds$')
+
+    p14 = LazyRegex(r'^Flood +pacing +interval +(?P<flood>(\d+))'
+                       ' +msecs\. +Retransmission +pacing +interval'
+                       ' +(?P<retransmission>(\d+)) +msecs$')
+
+    p15 = LazyRegex(r'^Adjacency +stagger +(?P<adj>(\S+)); +initial'
+                       ' +\(per +area\): +(?P<init>(\d+)),'
+                       ' +maximum: +(?P<max>(\d+))$')
+
+    p16 = LazyRegex(r'^Number +of +neighbors +forming:'
+                       ' +(?P<form>(\d+)), +(?P<full>(\d+)) +full$')
+
+    p17 = LazyRegex(r'^Maximum +number +of +configured +interfaces'
+                       ' +(?P<max>(\d+))$')
+
+    p18 = LazyRegex(r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
+                       ' +Checksum +Sum +(?P<checksum>(\S+))$')
+
+    p19 = LazyRegex(r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
+                       ' +Checksum +Sum +(?P<checksum>(\S+))$')
+
+    p20 = LazyRegex(r'^Number +of +DCbitless +external +and +opaque'
+                       ' +AS +LSA +(?P<num>(\d+))$')
+
+    p21 = LazyRegex(r'^Number +of +DoNotAge +external +and +opaque'
+                       ' +AS +LSA +(?P<num>(\d+))$')
+
+    p22 = LazyRegex(r'^Number +of +areas +in +this +router +is'
+                       ' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
+                       ' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
+                       ' +nssa$')
+
+    p23 = LazyRegex(r'^External +flood +list +length +(?P<num>(\d+))$')
+
+    p43 = LazyRegex(r'^LDP +Sync +(?P<sync>(Enabled|Disabled)),'
+                       ' +Sync +Status: +(?P<status>(.*))$')
+
+    p25 = LazyRegex(r'^LSD +(?P<lsd>([a-zA-Z\,\s]+)), +revision'
+                       ' +(?P<revision>(\d+))$')
+
+    p26 = LazyRegex(r'^Segment +Routing +Global +Block +default'
+                       ' +\((?P<sr_block>([0-9\-]+))\),'
+                       ' +(?P<status>(.*))$')
+
+    p27 = LazyRegex(r'^Strict-SPF +capability +is +(?P<state>(\S+))$')
+
+    p28_1 = LazyRegex(r'^Area +(?P<area>(\S+))(?: +(inactive|\(Inactive\)))?$')
+
+    p28_2 = LazyRegex(r'^It +is +a +(?P<area_type>(\S+)) +area'
+                       '(?:, +(?P<summary>(no +summary +LSA +in +this'
+                       ' +area)))?$')
+
+    p28_3 = LazyRegex(r'^generates +stub +default +route +with +cost'
+                       ' +(?P<default_cost>(\d+))$')
+
+    p28_4 = LazyRegex(r'^Perform +(?P<trans>(\S+)) +LSA +translation$')
+
+    p28_5 = LazyRegex(r'^Area ranges are$')
+
+    p28_6 = LazyRegex(r'^(?P<prefix>([0-9\.\/]+)) +Passive'
+                       ' +(?P<advertise>(Advertise|DoNotAdvertise))$')
+
+    p29 = LazyRegex(r'^Number +of +interfaces +in +this +area +is'
+                       ' +(?P<num_intf>(\d+))$')
+
+    p30 = LazyRegex(r'^Area +has +RRR +enabled, +topology +version'
+                       ' +(?P<topo_version>(\d+))$')
+
+    p31 = LazyRegex(r'^SPF +algorithm +executed +(?P<count>(\d+))'
+                       ' +times$')
+
+    p32 = LazyRegex(r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
+                       ' +Checksum +Sum +(?P<checksum_sum>(\S+))$')
+
+    p33 = LazyRegex(r'^Number +of opaque +link +LSA'
+                       ' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
+                       ' +(?P<checksum_sum>(\S+))$')
+
+    p34 = LazyRegex(r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$')
+
+    p35 = LazyRegex(r'^Number +of +indication +LSA +(?P<count>(\d+))$')
+
+    p36 = LazyRegex(r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$')
+
+    p37 = LazyRegex(r'^Flood +list +length +(?P<len>(\d+))$')
+
+    p38 = LazyRegex(r'^Number +of +LFA +enabled +interfaces'
+                       ' +(?P<count>(\d+)), +LFA +revision'
+                       ' +(?P<revision>(\d+))$')
+
+    p39 = LazyRegex(r'^Number +of +Per +Prefix +LFA +enabled'
+                       ' +interfaces +(?P<count>(\d+))$')
+
+    p40 = LazyRegex(r'^Number +of +neighbors +forming +in +staggered'
+                       ' +mode +(?P<mode>(\d+)), +(?P<full>(\d+)) +full$')
+
+    p41 = LazyRegex(r'^Maximum +number +of +non +self-generated +LSA'
+                       ' +allowed +(?P<max_lsa>(\d+))$')
+
+    p42 = LazyRegex(r'^Non-Stop +Forwarding +enabled$')
+
+    # SNMP trap is enabled
+    p24 = LazyRegex(r'^SNMP +trap +is +(?P<snmp>(\S+))$')
+
     def cli(self, vrf='', output=None):
         if output is None:
             if vrf:
@@ -1317,132 +1499,13 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
         # Init vars
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
-        p1 = re.compile(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
-                            ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
-                            ' +with +ID +(?P<router_id>(\S+))$')
-        p2 = re.compile(r'^Role *: +(?P<role>([a-zA-z0-9\s]+))$')
-        p3 = re.compile(r'^NSR +\(Non-stop routing\) +is +(?P<nsr>(\S+))$')
-        p3_1 = re.compile(r'^Supports +only +single +TOS(TOS0) routes$')
-        p3_2 = re.compile(r'^Supports +opaque +LSA$')
-        p4 = re.compile(r'^Redistributing +External +Routes +from,$')
-        p4_1 = re.compile(r'^(?P<type>(connected|static))(?: +with +metric'
-                            ' +mapped +to +(?P<metric>(\d+)))?$')
-        p4_2 = re.compile(r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))(?: +with'
-                            ' +metric +mapped +to +(?P<metric>(\d+)))?$')
-        p4_3 = re.compile(r'^Maximum +number +of +redistributed +prefixes'
-                            ' +(?P<num_prefix>(\d+))'
-                            '(?: +\((?P<warn>(warning-only))\))?')
-        p4_4 = re.compile(r'^Threshold +for +warning +message'
-                            ' +(?P<thld>(\d+))\%$')
-        p5_0 = re.compile(r'^It +is +an'
-                            '(?: +(?P<abr>(area border)))?'
-                            '(?: +and)?'
-                            '(?: +(?P<asbr>(autonomous system boundary)))?'
-                            ' +router$')
-        p5_1 = re.compile(r'^Router +is +not +originating +router-LSAs'
-                            ' +with +maximum +metric$')
-        p5_2 = re.compile(r'^Originating +router-LSAs +with +maximum'
-                            ' +metric$')
-        p5_3 = re.compile(r'^Condition:'
-                            ' +(?P<condition>(always|on switch-over|on start-up|on proc-restart))'
-                            '(?: +for +(?P<seconds>(\d+)) +seconds,)?'
-                            ' +State: +(?P<state>(\S+))$')
-        p5_4 = re.compile(r'^Advertise +stub +links +with +maximum +metric'
-                            ' +in +router\-LSAs$')
-        p5_5 = re.compile(r'^Advertise +summary\-LSAs +with +metric'
-                            ' +(?P<metric>(\d+))$')
-        p5_6 = re.compile(r'^^Advertise +external\-LSAs +with +metric'
-                            ' +(?P<metric>(\d+))$')
-        p6 = re.compile(r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
-                            ' +msecs$')
-        p7 = re.compile(r'^Minimum +hold +time +between +two +consecutive'
-                            ' +SPFs +(?P<time>(\S+)) +msecs$')
-        p8 = re.compile(r'^Maximum +wait +time +between +two +consecutive'
-                            ' +SPFs +(?P<time>(\S+)) +msecs$')
-        p9 = re.compile(r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
-                            ' +msecs$')
-        p10 = re.compile(r'^Minimum +hold +time +for +LSA +throttle'
-                            ' +(?P<time>(\S+)) +msecs$')
-        p11 = re.compile(r'^Maximum +wait +time +for +LSA +throttle'
-                            ' +(?P<time>(\S+)) +msecs$')
-        p12 = re.compile(r'^Minimum +LSA +interval +(?P<interval>(\S+))'
-                            ' +msecs. +Minimum +LSA +arrival'
-                            ' +(?P<arrival>(\S+)) +msecs$')
-        p13 = re.compile(r'^LSA +refresh +interval +(?P<refresh>(\S+))'
-                            ' +seconds$')
-        p14 = re.compile(r'^Flood +pacing +interval +(?P<flood>(\d+))'
-                            ' +msecs\. +Retransmission +pacing +interval'
-                            ' +(?P<retransmission>(\d+)) +msecs$')
-        p15 = re.compile(r'^Adjacency +stagger +(?P<adj>(\S+)); +initial'
-                            ' +\(per +area\): +(?P<init>(\d+)),'
-                            ' +maximum: +(?P<max>(\d+))$')
-        p16 = re.compile(r'^Number +of +neighbors +forming:'
-                            ' +(?P<form>(\d+)), +(?P<full>(\d+)) +full$')
-        p17 = re.compile(r'^Maximum +number +of +configured +interfaces'
-                            ' +(?P<max>(\d+))$')
-        p18 = re.compile(r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum>(\S+))$')
-        p19 = re.compile(r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum>(\S+))$')
-        p20 = re.compile(r'^Number +of +DCbitless +external +and +opaque'
-                            ' +AS +LSA +(?P<num>(\d+))$')
-        p21 = re.compile(r'^Number +of +DoNotAge +external +and +opaque'
-                            ' +AS +LSA +(?P<num>(\d+))$')
-        p22 = re.compile(r'^Number +of +areas +in +this +router +is'
-                            ' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
-                            ' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
-                            ' +nssa$')
-        p23 = re.compile(r'^External +flood +list +length +(?P<num>(\d+))$')
-        p43 = re.compile(r'^LDP +Sync +(?P<sync>(Enabled|Disabled)),'
-                            ' +Sync +Status: +(?P<status>(.*))$')
-        p25 = re.compile(r'^LSD +(?P<lsd>([a-zA-Z\,\s]+)), +revision'
-                            ' +(?P<revision>(\d+))$')
-        p26 = re.compile(r'^Segment +Routing +Global +Block +default'
-                            ' +\((?P<sr_block>([0-9\-]+))\),'
-                            ' +(?P<status>(.*))$')
-        p27 = re.compile(r'^Strict-SPF +capability +is +(?P<state>(\S+))$')
-        p28_1 = re.compile(r'^Area +(?P<area>(\S+))(?: +(inactive|\(Inactive\)))?$')
-        p28_2 = re.compile(r'^It +is +a +(?P<area_type>(\S+)) +area'
-                            '(?:, +(?P<summary>(no +summary +LSA +in +this'
-                            ' +area)))?$')
-        p28_3 = re.compile(r'^generates +stub +default +route +with +cost'
-                            ' +(?P<default_cost>(\d+))$')
-        p28_4 = re.compile(r'^Perform +(?P<trans>(\S+)) +LSA +translation$')
-        p28_5 = re.compile(r'^Area ranges are$')
-        p28_6 = re.compile(r'^(?P<prefix>([0-9\.\/]+)) +Passive'
-                            ' +(?P<advertise>(Advertise|DoNotAdvertise))$')
-        p29 = re.compile(r'^Number +of +interfaces +in +this +area +is'
-                            ' +(?P<num_intf>(\d+))$')
-        p30 = re.compile(r'^Area +has +RRR +enabled, +topology +version'
-                            ' +(?P<topo_version>(\d+))$')
-        p31 = re.compile(r'^SPF +algorithm +executed +(?P<count>(\d+))'
-                            ' +times$')
-        p32 = re.compile(r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum_sum>(\S+))$')
-        p33 = re.compile(r'^Number +of opaque +link +LSA'
-                            ' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
-                            ' +(?P<checksum_sum>(\S+))$')
-        p34 = re.compile(r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$')
-        p35 = re.compile(r'^Number +of +indication +LSA +(?P<count>(\d+))$')
-        p36 = re.compile(r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$')
-        p37 = re.compile(r'^Flood +list +length +(?P<len>(\d+))$')
-        p38 = re.compile(r'^Number +of +LFA +enabled +interfaces'
-                            ' +(?P<count>(\d+)), +LFA +revision'
-                            ' +(?P<revision>(\d+))$')
-        p39 = re.compile(r'^Number +of +Per +Prefix +LFA +enabled'
-                            ' +interfaces +(?P<count>(\d+))$')
-        p40 = re.compile(r'^Number +of +neighbors +forming +in +staggered'
-                            ' +mode +(?P<mode>(\d+)), +(?P<full>(\d+)) +full$')
-        p41 = re.compile(r'^Maximum +number +of +non +self-generated +LSA'
-                            ' +allowed +(?P<max_lsa>(\d+))$')
-        p42 = re.compile(r'^Non-Stop +Forwarding +enabled$')
 
         for line in out.splitlines():
             line = line.strip()
 
             # Routing Process "ospf 1" with ID 10.36.3.3
             # VRF VRF1 in Routing Process "ospf 1" with ID 10.36.3.3
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 instance = str(m.groupdict()['instance'])
                 router_id = str(m.groupdict()['router_id'])
@@ -1474,13 +1537,13 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Role: Primary Active
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 sub_dict['role'] = str(m.groupdict()['role']).lower()
                 continue
 
             # NSR (Non-stop routing) is Enabled
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 nsr = str(m.groupdict()['nsr']).lower()
                 if 'nsr' not in sub_dict:
@@ -1492,19 +1555,19 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                     continue
 
             # Supports only single TOS(TOS0) routes
-            m = p3_1.match(line)
+            m = self.p3_1.match(line)
             if m:
                 # Not sure what the key is
                 continue
 
             # Supports opaque LSA
-            m = p3_2.match(line)
+            m = self.p3_2.match(line)
             if m:
                 # Not sure what the key is
                 continue
 
             # Redistributing External Routes from,
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 if 'redistribution' not in sub_dict:
                     sub_dict['redistribution'] = {}
@@ -1514,7 +1577,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
             # connected with metric mapped to 10
             # static
             # static with metric mapped to 10
-            m = p4_1.match(line)
+            m = self.p4_1.match(line)
             if m:
                 the_type = str(m.groupdict()['type'])
                 if the_type not in sub_dict['redistribution']:
@@ -1527,7 +1590,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
 
             # bgp 100 with metric mapped to 111
             # isis 10 with metric mapped to 3333
-            m = p4_2.match(line)
+            m = self.p4_2.match(line)
             if m:
                 prot = str(m.groupdict()['prot'])
                 if prot not in sub_dict['redistribution']:
@@ -1545,7 +1608,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
 
             # Maximum number of redistributed prefixes 4000
             # Maximum number of redistributed prefixes 3000 (warning-only)
-            m = p4_3.match(line)
+            m = self.p4_3.match(line)
             if m:
                 if 'max_prefix' not in sub_dict['redistribution']:
                     sub_dict['redistribution']['max_prefix'] = {}
@@ -1558,7 +1621,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                     continue
 
             # Threshold for warning message 70%
-            m = p4_4.match(line)
+            m = self.p4_4.match(line)
             if m:
                 if 'max_prefix' not in sub_dict['redistribution']:
                     sub_dict['redistribution']['max_prefix'] = {}
@@ -1569,7 +1632,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
             # It is an area border router
             # It is an autonomous system boundary router
             # It is an area border and autonomous system boundary router
-            m = p5_0.match(line)
+            m = self.p5_0.match(line)
             if m:
                 if 'flags' not in sub_dict:
                     sub_dict['flags'] = {}
@@ -1580,7 +1643,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Router is not originating router-LSAs with maximum metric
-            m = p5_1.match(line)
+            m = self.p5_1.match(line)
             if m:
                 if 'stub_router' not in sub_dict:
                     sub_dict['stub_router'] = {}
@@ -1594,7 +1657,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Originating router-LSAs with maximum metric
-            m = p5_2.match(line)
+            m = self.p5_2.match(line)
             if m:
                 if 'stub_router' not in sub_dict:
                     sub_dict['stub_router'] = {}
@@ -1604,7 +1667,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
             # Condition: on switch-over for 10 seconds, State: inactive
             # Condition: on start-up for 5 seconds, State: inactive
             # Condition: on proc-restart for 900 seconds, State: inactive
-            m = p5_3.match(line)
+            m = self.p5_3.match(line)
             if m:
                 condition = str(m.groupdict()['condition']).lower().replace("-", "")
                 condition = condition.replace(" ", "_")
@@ -1623,13 +1686,13 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Advertise stub links with maximum metric in router-LSAs
-            m = p5_4.match(line)
+            m = self.p5_4.match(line)
             if m:
                 sub_dict['stub_router'][condition]['include_stub'] = True
                 continue
 
             # Advertise summary-LSAs with metric 16711680
-            m = p5_5.match(line)
+            m = self.p5_5.match(line)
             if m:
                 sub_dict['stub_router'][condition]['summary_lsa'] = True
                 sub_dict['stub_router'][condition]['summary_lsa_metric'] = \
@@ -1637,7 +1700,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Advertise external-LSAs with metric 16711680
-            m = p5_6.match(line)
+            m = self.p5_6.match(line)
             if m:
                 sub_dict['stub_router'][condition]['external_lsa'] = True
                 sub_dict['stub_router'][condition]['external_lsa_metric'] = \
@@ -1645,7 +1708,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Initial SPF schedule delay 50 msecs
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 start = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -1658,7 +1721,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Minimum hold time between two consecutive SPFs 200 msecs
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 hold = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -1671,7 +1734,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Maximum wait time between two consecutive SPFs 5000 msecs
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 maximum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -1684,7 +1747,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Initial LSA throttle delay 50 msecs
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 start = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -1697,7 +1760,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Minimum hold time for LSA throttle 200 msecs
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 hold = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -1710,7 +1773,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Maximum wait time for LSA throttle 5000 msecs
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 maximum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -1723,7 +1786,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Minimum LSA interval 200 msecs. Minimum LSA arrival 100 msecs
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 sub_dict['spf_control']['throttle']['lsa']['interval'] = \
                     int(float(m.groupdict()['interval']))
@@ -1732,14 +1795,14 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # LSA refresh interval 1800 seconds
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 sub_dict['spf_control']['throttle']['lsa']\
                     ['refresh_interval'] = int(float(m.groupdict()['refresh']))
                 continue
 
             # Flood pacing interval 33 msecs. Retransmission pacing interval 66 msecs
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 sub_dict['flood_pacing_interval_msec'] = \
                     int(float(m.groupdict()['flood']))
@@ -1748,7 +1811,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Adjacency stagger enabled; initial (per area): 2, maximum: 64
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 if 'adjacency_stagger' not in sub_dict:
                     sub_dict['adjacency_stagger'] = {}
@@ -1763,7 +1826,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of neighbors forming: 0, 2 full
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 if 'adjacency_stagger' not in sub_dict:
                     sub_dict['adjacency_stagger'] = {}
@@ -1774,13 +1837,13 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Maximum number of configured interfaces 1024
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 sub_dict['maximum_interfaces'] = int(m.groupdict()['max'])
                 continue
 
             # Number of external LSA 1. Checksum Sum 0x00607f
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -1790,7 +1853,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of opaque AS LSA 0. Checksum Sum 00000000
-            m = p19.match(line)
+            m = self.p19.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -1800,7 +1863,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of DCbitless external and opaque AS LSA 0
-            m = p20.match(line)
+            m = self.p20.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -1808,7 +1871,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of DoNotAge external and opaque AS LSA 0
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -1816,7 +1879,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of areas in this router is 1. 1 normal 0 stub 0 nssa
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 sub_dict['total_areas'] = int(m.groupdict()['total_areas'])
                 sub_dict['total_normal_areas'] = int(m.groupdict()['normal'])
@@ -1825,14 +1888,13 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # External flood list length 0
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 sub_dict['external_flood_list_length'] = int(m.groupdict()['num'])
                 continue
 
             # SNMP trap is enabled
-            p24 = re.compile(r'^SNMP +trap +is +(?P<snmp>(\S+))$')
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 if 'enabled' in m.groupdict()['snmp']:
                     sub_dict['snmp_trap'] = True
@@ -1841,7 +1903,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # LDP Sync Enabled, Sync Status: Not Achieved
-            m = p43.match(line)
+            m = self.p43.match(line)
             if m:
                 if 'mpls' not in sub_dict:
                     sub_dict['mpls'] = {}
@@ -1856,14 +1918,14 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # LSD connected, registered, bound, revision 1
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 sub_dict['lsd_state'] = str(m.groupdict()['lsd'])
                 sub_dict['lsd_revision'] = int(m.groupdict()['revision'])
                 continue
 
             # Segment Routing Global Block default (16000-23999), not allocated
-            m = p26.match(line)
+            m = self.p26.match(line)
             if m:
                 sub_dict['segment_routing_global_block_default'] = \
                     str(m.groupdict()['sr_block'])
@@ -1872,7 +1934,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Strict-SPF capability is enabled
-            m = p27.match(line)
+            m = self.p27.match(line)
             if m:
                 if 'enabled' in m.groupdict()['state']:
                     sub_dict['strict_spf'] = True
@@ -1883,7 +1945,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
             # Area BACKBONE(0)
             # Area 1
             # Area BACKBONE(0) (Inactive)
-            m = p28_1.match(line)
+            m = self.p28_1.match(line)
             if m:
                 parsed_area = str(m.groupdict()['area'])
                 n = re.match('BACKBONE\((?P<area_num>(\S+))\)', parsed_area)
@@ -1910,7 +1972,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
             # It is a stub area
             # It is a stub area, no summary LSA in this area
             # It is a NSSA area
-            m = p28_2.match(line)
+            m = self.p28_2.match(line)
             if m:
                 area_type = str(m.groupdict()['area_type']).lower()
                 sub_dict['areas'][area]['area_type'] = area_type
@@ -1923,21 +1985,21 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
 
             # generates stub default route with cost 111
             # generates stub default route with cost 222
-            m = p28_3.match(line)
+            m = self.p28_3.match(line)
             if m:
                 sub_dict['areas'][area]['default_cost'] = \
                     int(m.groupdict()['default_cost'])
                 continue
 
             # Perform type-7/type-5 LSA translation
-            m = p28_4.match(line)
+            m = self.p28_4.match(line)
             if m:
                 sub_dict['areas'][area]['lsa_translation'] = \
                     str(m.groupdict()['trans'])
                 continue
 
             # Area ranges are
-            m = p28_5.match(line)
+            m = self.p28_5.match(line)
             if m:
                 if 'ranges' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['ranges'] = {}
@@ -1945,7 +2007,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
 
             # 10.16.2.0/24 Passive Advertise
             # 10.4.0.0/16 Passive DoNotAdvertise 
-            m = p28_6.match(line)
+            m = self.p28_6.match(line)
             if m:
                 prefix = str(m.groupdict()['prefix'])
                 if 'ranges' not in sub_dict['areas'][area]:
@@ -1960,7 +2022,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                     continue
 
             # Number of interfaces in this area is 3
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1969,7 +2031,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Area has RRR enabled, topology version 15
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 sub_dict['areas'][area]['rrr_enabled'] = True
                 sub_dict['areas'][area]['topology_version'] = \
@@ -1977,7 +2039,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # SPF algorithm executed 26 times
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1986,7 +2048,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of LSA 19.  Checksum Sum 0x0a2fb5
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1998,7 +2060,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of opaque link LSA 0.  Checksum Sum 00000000
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -2011,7 +2073,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of DCbitless LSA 5
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -2020,7 +2082,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of indication LSA 0
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -2029,7 +2091,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of DoNotAge LSA 0
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -2038,7 +2100,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Flood list length 0
-            m = p37.match(line)
+            m = self.p37.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -2047,7 +2109,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of LFA enabled interfaces 0, LFA revision 0
-            m = p38.match(line)
+            m = self.p38.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -2058,7 +2120,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of Per Prefix LFA enabled interfaces 0
-            m = p39.match(line)
+            m = self.p39.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -2068,7 +2130,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Number of neighbors forming in staggered mode 0, 2 full
-            m = p40.match(line)
+            m = self.p40.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -2079,7 +2141,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
 
             # Maximum number of non self-generated LSA allowed 123
-            m = p41.match(line)
+            m = self.p41.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -2088,7 +2150,7 @@ class ShowOspfVrfAllInclusive(ShowOspfVrfAllInclusiveSchema):
                 continue
         
             # Non-Stop Forwarding enabled
-            m = p42.match(line)
+            m = self.p42.match(line)
             if m:
                 # Execute command on device
                 out = self.device.execute('show run formal router ospf | i nsf')
@@ -2904,187 +2966,232 @@ class ShowOspfMplsTrafficEngLink(ShowOspfMplsTrafficEngLinkSchema):
 class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
     """Parser for show ospf vrf all-inclusive database <db_type>"""
 
-    def cli(self, cmd, db_type,output=None):
+    p1 = LazyRegex(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                       ' +\(Process +ID +(?P<instance>(\S+))'
+                       '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
 
-        assert db_type in ['external', 'network', 'summary', 'router',
-                           'opaque']
+    p2 = LazyRegex(r'^(?P<lsa_type_name>(.*)) +Link +States'
+                       '(?: +\(Area +(?P<area>(\S+))\))?$')
 
-        if output is None:
-            out = self.device.execute(cmd)
-        else:
-            out = output
+    p3_1 = LazyRegex(r'^Routing +Bit +Set +on +this +LSA$')
 
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4'
-        mt_id = 0
+    p3_2 = LazyRegex(r'^LS +age: +(?P<age>(\d+))$')
 
-        # Router
-        # Network Link
-        # Summary Network
-        # Opaque Area
-        # Type-5 AS External
-        lsa_type_mapping = {
-            'router': 1,
-            'network': 2,
-            'summary': 3,
-            'external': 5,
-            'opaque': 10,
-            }
+    p4 = LazyRegex(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
+                   '(?: *\((?P<option_desc>(.*))\))?$')
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\S+))'
-                            '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
-        p2 = re.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
-                            '(?: +\(Area +(?P<area>(\S+))\))?$')
-        p3_1 = re.compile(r'^Routing +Bit +Set +on +this +LSA$')
-        p3_2 = re.compile(r'^LS +age: +(?P<age>(\d+))$')
-        p4 = re.compile(r'^Options:(?: +(?P<option>([a-zA-Z0-9]+)))?'
-                        '(?: *\((?P<option_desc>(.*))\))?$')
-        p5_1 = re.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
-        p5_2 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
-                            '(?: +\(.*\))?$')
-        p6 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
-        p7 = re.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
-        p8 = re.compile(r'^Checksum: +(?P<checksum>(\S+))$')
-        p9 = re.compile(r'^Length: +(?P<length>(\d+))$')
-        p10 = re.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
-        p11_1 = re.compile(r'^Metric +Type: +2 +\(.*\)$')
-        p11_2 = re.compile(r'^Metric +Type: +1 +\(.*\)$')
-        p12 = re.compile(r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
-                            ' +(?P<metric>(\d+)))?$')
-        p13 = re.compile(r'^Metric: +(?P<metric>(\d+))$')
-        p14 = re.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
-        p15 = re.compile(r'^External +Route +Tag: +(?P<tag>(\d+))$')
-        p16 = re.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
-
-        # Number of Links : 1
-        # Number of Links: 3
-        p17 = re.compile(r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$')
-        p18 = re.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
-        p18_1 = re.compile(r'^Link +connected +to: +(?P<type>(.*))$')
-        p19_1 = re.compile(r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
-                            ' +(?P<link_id>(\S+))$')
-        p19_2 = re.compile(r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
-                            ' +(a|A)ddress: +(?P<link_id>(\S+))$')
-        p19_3 = re.compile(r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
-                            ' +(I|d)D: +(?P<link_id>(\S+))$')
-        p20_1 = re.compile(r'^\(Link +Data\) +Network +Mask:'
-                            ' +(?P<link_data>(\S+))$')
-        p20_2 = re.compile(r'^\(Link +Data\) +Router +Interface +address:'
-                            ' +(?P<link_data>(\S+))$')
-        p21 = re.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
-        p22 = re.compile(r'^Opaque +Type: +(?P<type>(\d+))$')
-        p23 = re.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
-        p24 = re.compile(r'^Fragment +number: +(?P<num>(\d+))$')
-        p25 = re.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
-        p26_1 = re.compile(r'^AS +Boundary +Router$')
-        p26_2 = re.compile(r'^Area +Border +Router$')
-        p27 = re.compile(r'^Link +connected +to +(?P<link>(.*))$')
-        p28 = re.compile(r'^Link +ID *: +(?P<id>(\S+))$')
-        p29 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
-        p30 = re.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
-        p31 = re.compile(r'^Maximum +(B|b)andwidth *:'
-                            ' +(?P<max_band>(\d+))$')
-        p32 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth'
-                            '(?: +global)? *: +(?P<max_res_band>(\d+))$')
-        p33 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
-        p33_1 = re.compile(r'^IGP +Metric *: +(?P<igp_metric>(\d+))$')
-        p33_2 = re.compile(r'^Number +of +Priority *: +(?P<num>(\d+))$')
-        p34 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
-        p35 = re.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
-                            ' +Length += +(?P<length>(\d+))'
-                            ' +Value += +(?P<value>(.*))$')
-        p36 = re.compile(r'^Extended +Administrative +Group *: +Length *:'
-                            ' +(?P<eag_length>(\d+))$')
-        p37 = re.compile(r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$')
-        
-        # --regex for opaque-- #
-        # Router Information TLV: Length: 4
-        p38 = re.compile(r'^Router +Information +TLV: +Length: +(?P<length>\d+)$')
+    p5_1 = LazyRegex(r'^LS +Type: +(?P<lsa_type>(.*))$')
+
+    p5_2 = LazyRegex(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
+                       '(?: +\(.*\))?$')
+
+    p6 = LazyRegex(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
+
+    p7 = LazyRegex(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
+
+    p8 = LazyRegex(r'^Checksum: +(?P<checksum>(\S+))$')
+
+    p9 = LazyRegex(r'^Length: +(?P<length>(\d+))$')
+
+    p10 = LazyRegex(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
+
+    p11_1 = LazyRegex(r'^Metric +Type: +2 +\(.*\)$')
+
+    p11_2 = LazyRegex(r'^Metric +Type: +1 +\(.*\)$')
+
+    p12 = LazyRegex(r'^TOS:? +(?P<tos>(\d+))(?:(\s+|\t+)Metric(?:s)?:'
+                       ' +(?P<metric>(\d+)))?$')
+
+    p13 = LazyRegex(r'^Metric: +(?P<metric>(\d+))$')
+
+    p14 = LazyRegex(r'^Forward +Address: +(?P<addr>(\S+))$')
+
+    p15 = LazyRegex(r'^External +Route +Tag: +(?P<tag>(\d+))$')
+
+    p16 = LazyRegex(r'^Attached +Router: +(?P<att_router>(\S+))$')
+
+    # Number of Links : 1
+    # Number of Links: 3
+    p17 = LazyRegex(r'^Number +of +(l|L)inks *: +(?P<num>(\d+))$')
+
+    p18 = LazyRegex(r'^Link +connected +to: +a +(?P<type>(.*))$')
+
+    p18_1 = LazyRegex(r'^Link +connected +to: +(?P<type>(.*))$')
+
+    p19_1 = LazyRegex(r'^\(Link +ID\) +Network\/(s|S)ubnet +(n|N)umber:'
+                       ' +(?P<link_id>(\S+))$')
+
+    p19_2 = LazyRegex(r'^\(Link +ID\) +(D|d)esignated +(R|r)outer'
+                       ' +(a|A)ddress: +(?P<link_id>(\S+))$')
+
+    p19_3 = LazyRegex(r'^\(Link +ID\) +(N|n)eighboring +(R|r)outer'
+                       ' +(I|d)D: +(?P<link_id>(\S+))$')
+
+    p20_1 = LazyRegex(r'^\(Link +Data\) +Network +Mask:'
+                       ' +(?P<link_data>(\S+))$')
+
+    p20_2 = LazyRegex(r'^\(Link +Data\) +Router +Interface +address:'
+                       ' +(?P<link_data>(\S+))$')
+
+    p21 = LazyRegex(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
+
+    p22 = LazyRegex(r'^Opaque +Type: +(?P<type>(\d+))$')
+
+    p23 = LazyRegex(r'^Opaque +ID: +(?P<id>(\d+))$')
+
+    p24 = LazyRegex(r'^Fragment +number: +(?P<num>(\d+))$')
+
+    p25 = LazyRegex(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
+
+    p26_1 = LazyRegex(r'^AS +Boundary +Router$')
+
+    p26_2 = LazyRegex(r'^Area +Border +Router$')
+
+    p27 = LazyRegex(r'^Link +connected +to +(?P<link>(.*))$')
+
+    p28 = LazyRegex(r'^Link +ID *: +(?P<id>(\S+))$')
+
+    p29 = LazyRegex(r'^Interface +Address *: +(?P<addr>(\S+))$')
+
+    p30 = LazyRegex(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
+
+    p31 = LazyRegex(r'^Maximum +(B|b)andwidth *:'
+                       ' +(?P<max_band>(\d+))$')
+
+    p32 = LazyRegex(r'^Maximum +(R|r)eservable +(B|b)andwidth'
+                       '(?: +global)? *: +(?P<max_res_band>(\d+))$')
+
+    p33 = LazyRegex(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+
+    p33_1 = LazyRegex(r'^IGP +Metric *: +(?P<igp_metric>(\d+))$')
+
+    p33_2 = LazyRegex(r'^Number +of +Priority *: +(?P<num>(\d+))$')
+
+    p34 = LazyRegex(r'^Priority +(?P<num1>(\d+)) *:'
+                       ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+                       ' *: +(?P<band2>(\d+)))?$')
+
+    p35 = LazyRegex(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
+                       ' +Length += +(?P<length>(\d+))'
+                       ' +Value += +(?P<value>(.*))$')
+
+    p36 = LazyRegex(r'^Extended +Administrative +Group *: +Length *:'
+                       ' +(?P<eag_length>(\d+))$')
 
-        # Capabilities:
-        #   Graceful Restart Helper Capable
-        p39 = re.compile(r'^Graceful +Restart +Helper +Capable$')
+    p37 = LazyRegex(r'^EAG\[(?P<group_num>(\d+))\]: +(?P<val>(\d+))$')
 
-        #   Stub Router Capable
-        p40 = re.compile(r'^Stub +Router +Capable$')
+    # --regex for opaque-- #
+    # Router Information TLV: Length: 4
+    p38 = LazyRegex(r'^Router +Information +TLV: +Length: +(?P<length>\d+)$')
 
-        #   All capability bits: 0x60000000
-        p41 = re.compile(r'^All +capability +bits: +(?P<bits>\w+)$')
+    # Capabilities:
+    #   Graceful Restart Helper Capable
+    p39 = LazyRegex(r'^Graceful +Restart +Helper +Capable$')
 
-        # Segment Routing Algorithm TLV: Length: 2
-        p42 = re.compile(r'^Segment +Routing +Algorithm +TLV: +Length: +(?P<length>\d+)$')
+    #   Stub Router Capable
+    p40 = LazyRegex(r'^Stub +Router +Capable$')
 
-        #   Algorithm: 0
-        #   Algorithm: 1
-        p43 = re.compile(r'^Algorithm: +(?P<algo>\d+)$')
+    #   All capability bits: 0x60000000
+    p41 = LazyRegex(r'^All +capability +bits: +(?P<bits>\w+)$')
 
-        # Segment Routing Range TLV: Length: 12
-        p44 = re.compile(r'^Segment +Routing +Range +TLV: +Length: +(?P<length>\d+)$')
+    # Segment Routing Algorithm TLV: Length: 2
+    p42 = LazyRegex(r'^Segment +Routing +Algorithm +TLV: +Length: +(?P<length>\d+)$')
 
-        #   Range Size: 65535
-        p45 = re.compile(r'^Range +Size: +(?P<range_size>\d+)$')
+    #   Algorithm: 0
+    #   Algorithm: 1
+    p43 = LazyRegex(r'^Algorithm: +(?P<algo>\d+)$')
 
-        #     SID sub-TLV: Length 3
-        #     SID sub-TLV: Length: 8
-        p46 = re.compile(r'^(?P<type>[\S\s]+) +sub-TLV: +Length:? +(?P<length>\d+)$')
+    # Segment Routing Range TLV: Length: 12
+    p44 = LazyRegex(r'^Segment +Routing +Range +TLV: +Length: +(?P<length>\d+)$')
 
-        #      Label: 16000
-        p47 = re.compile(r'^Label *: +(?P<label>\d+)$')
+    #   Range Size: 65535
+    p45 = LazyRegex(r'^Range +Size: +(?P<range_size>\d+)$')
 
-        # Node MSD TLV: Length: 2
-        p48 = re.compile(r'^Node MSD TLV: +Length: +(?P<length>\d+)$')
+    #     SID sub-TLV: Length 3
+    #     SID sub-TLV: Length: 8
+    p46 = LazyRegex(r'^(?P<type>[\S\s]+) +sub-TLV: +Length:? +(?P<length>\d+)$')
 
-        #     Type: 1, Value 10
-        p49 = re.compile(r'^Type: +(?P<type>\d+), +Value +(?P<value>\d+)$')
+    #      Label: 16000
+    p47 = LazyRegex(r'^Label *: +(?P<label>\d+)$')
 
-        # Segment Routing Local Block TLV: Length: 12
-        p50 = re.compile(r'^Segment +Routing +Local +Block +TLV: +Length: +(?P<length>\d+)$')
+    # Node MSD TLV: Length: 2
+    p48 = LazyRegex(r'^Node MSD TLV: +Length: +(?P<length>\d+)$')
 
-        # Extended Prefix Range TLV: Length: 24
-        p51 = re.compile(r'^Extended +Prefix +Range +TLV: +Length: +(?P<length>\d+)$')
+    #     Type: 1, Value 10
+    p49 = LazyRegex(r'^Type: +(?P<type>\d+), +Value +(?P<value>\d+)$')
 
-        #   AF        : 0
-        p52 = re.compile(r'^AF *: +(?P<af>\d+)$')
+    # Segment Routing Local Block TLV: Length: 12
+    p50 = LazyRegex(r'^Segment +Routing +Local +Block +TLV: +Length: +(?P<length>\d+)$')
 
-        #   Prefix    : 64.230.254.0/32
-        p53 = re.compile(r'^Prefix *: +(?P<prefix>\S+)$')
+    # Extended Prefix Range TLV: Length: 24
+    p51 = LazyRegex(r'^Extended +Prefix +Range +TLV: +Length: +(?P<length>\d+)$')
 
-        #   Flags     : 0x0
-        p54 = re.compile(r'^Flags *: +(?P<flags>\S+)$')
+    #   AF        : 0
+    p52 = LazyRegex(r'^AF *: +(?P<af>\d+)$')
 
-        #     MTID      : 0
-        p55 = re.compile(r'^MTID *: +(?P<mt_id>\d+)$')
+    #   Prefix    : 64.230.254.0/32
+    p53 = LazyRegex(r'^Prefix *: +(?P<prefix>\S+)$')
 
-        #     Algo      : 0
-        p56 = re.compile(r'^Algo *: +(?P<algo>\d+)$')
+    #   Flags     : 0x0
+    p54 = LazyRegex(r'^Flags *: +(?P<flags>\S+)$')
 
-        #     SID Index : 1028
-        p57 = re.compile(r'^SID +Index *: +(?P<sid_index>\d+)$')
+    #     MTID      : 0
+    p55 = LazyRegex(r'^MTID *: +(?P<mt_id>\d+)$')
 
-        # Extended Link TLV: Length: 76
-        p58 = re.compile(r'^Extended +Link +TLV: +Length: +(?P<length>\d+)$')
+    #     Algo      : 0
+    p56 = LazyRegex(r'^Algo *: +(?P<algo>\d+)$')
 
-        #   Link-type : 1
-        p59 = re.compile(r'^Link-type *: +(?P<link_type>\d+)$')
+    #     SID Index : 1028
+    p57 = LazyRegex(r'^SID +Index *: +(?P<sid_index>\d+)$')
 
-        #   Link Data : 172.16.0.91
-        p60 = re.compile(r'^Link +Data *: +(?P<link_data>\S+)$')
+    # Extended Link TLV: Length: 76
+    p58 = LazyRegex(r'^Extended +Link +TLV: +Length: +(?P<length>\d+)$')
 
-        #     Weight    : 0
-        p61 = re.compile(r'^Weight *: +(?P<weight>\d+)$')
+    #   Link-type : 1
+    p59 = LazyRegex(r'^Link-type *: +(?P<link_type>\d+)$')
 
-        #     Local Interface ID: 78
-        p62 = re.compile(r'^Local +Interface +ID *: +(?P<local_id>\d+)$')
+    #   Link Data : 172.16.0.91
+    p60 = LazyRegex(r'^Link +Data *: +(?P<link_data>\S+)$')
 
-        #     Remote Interface ID: 76
-        p63 = re.compile(r'^Remote +Interface +ID *: +(?P<remote_id>\d+)$')
+    #     Weight    : 0
+    p61 = LazyRegex(r'^Weight *: +(?P<weight>\d+)$')
 
-        #     Neighbor Address: 172.16.0.90
-        p64 = re.compile(r'^Neighbor +Address *: +(?P<nbr_addr>\S+)$')
+    #     Local Interface ID: 78
+    p62 = LazyRegex(r'^Local +Interface +ID *: +(?P<local_id>\d+)$')
+
+    #     Remote Interface ID: 76
+    p63 = LazyRegex(r'^Remote +Interface +ID *: +(?P<remote_id>\d+)$')
+
+    #     Neighbor Address: 172.16.0.90
+    p64 = LazyRegex(r'^Neighbor +Address *: +(?P<nbr_addr>\S+)$')
+
+    def cli(self, cmd, db_type,output=None):
+
+        assert db_type in ['external', 'network', 'summary', 'router',
+                           'opaque']
+
+        if output is None:
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4'
+        mt_id = 0
+
+        # Router
+        # Network Link
+        # Summary Network
+        # Opaque Area
+        # Type-5 AS External
+        lsa_type_mapping = {
+            'router': 1,
+            'network': 2,
+            'summary': 3,
+            'external': 5,
+            'opaque': 10,
+            }
 
         for line in out.splitlines():
             line = line.strip()
@@ -3092,7 +3199,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
             # OSPF Router with ID (10.36.3.3) (Process ID 1)
             # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
             # OSPF Router with ID (10.4.1.1) (Process ID mpls1)
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
                 instance = str(m.groupdict()['instance'])
@@ -3112,7 +3219,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
             # Summary Net Link States (Area 0.0.0.0)
             # Type-5 AS External Link States
             # Type-10 Opaque Link Area Link States (Area 0)
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 lsa_type = lsa_type_mapping[db_type]
                 
@@ -3136,27 +3243,27 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # Routing Bit Set on this LSA
-            m = p3_1.match(line)
+            m = self.p3_1.match(line)
             if m:
                 routing_bit_enable = True
                 continue
 
             # LS age: 1565
-            m = p3_2.match(line)
+            m = self.p3_2.match(line)
             if m:
                 age = int(m.groupdict()['age'])
                 continue
 
             # Options: 0x20 (No TOS-capability, DC)
             # Options: (No TOS-capability, DC)
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 option = str(m.groupdict()['option'])
                 option_desc = str(m.groupdict()['option_desc'])
                 continue
 
             # LS Type: Type-5 AS-External
-            m = p5_1.match(line)
+            m = self.p5_1.match(line)
             if m:
                 lsa_type = lsa_type_mapping[db_type]
                 continue
@@ -3165,13 +3272,13 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
             # Link State ID: 10.94.44.44 (Network address)
             # Link State ID: 10.1.2.1 (Designated Router address)
             # Link State ID: 10.1.2.1 (address of Designated Router)
-            m = p5_2.match(line)
+            m = self.p5_2.match(line)
             if m:
                 lsa_id = str(m.groupdict()['lsa_id'])
                 continue
 
             # Advertising Router: 10.64.4.4
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 adv_router = str(m.groupdict()['adv_router'])
                 lsa = lsa_id + ' ' + adv_router
@@ -3250,25 +3357,25 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                     pass
 
             # LS Seq Number: 0x80000002
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 header_dict['seq_num'] = str(m.groupdict()['ls_seq_num'])
                 continue
 
             # Checksum: 0x7d61
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 header_dict['checksum'] = str(m.groupdict()['checksum'])
                 continue
 
             # Length: 36
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 header_dict['length'] = int(m.groupdict()['length'])
                 continue
 
             # Network Mask: /32
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 dummy = '{}/{}'.format('0.0.0.0', m.groupdict()['net_mask'])
                 db_dict['network_mask'] = str(IPNetwork(dummy).netmask)
@@ -3276,20 +3383,20 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
 
             # Metric Type: 2 (Larger than any link state path)
             # Metric Type: 2 (Larger than any link state path)
-            m = p11_1.match(line)
+            m = self.p11_1.match(line)
             if m:
                 db_topo_dict['flags'] = "E"
                 continue
 
             # Metric Type: 1 (Comparable directly to link state metric)
-            m = p11_2.match(line)
+            m = self.p11_2.match(line)
             if m:
                 # Do nothing
                 continue
 
             # TOS: 0
             # TOS: 0 Metric: 1
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 if db_type == 'router':
                     if m.groupdict()['tos']:
@@ -3306,25 +3413,25 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                         continue
 
             # Metric: 20
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 db_topo_dict['metric'] = int(m.groupdict()['metric'])
                 continue
 
             # Forward Address: 0.0.0.0
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 db_topo_dict['forwarding_address'] = str(m.groupdict()['addr'])
                 continue
 
             # External Route Tag: 0
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 db_topo_dict['external_route_tag'] = int(m.groupdict()['tag'])
                 continue
 
             # Attached Router: 10.84.66.66
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 attached_router = str(m.groupdict()['att_router'])
                 if 'attached_routers' not in db_dict:
@@ -3334,25 +3441,25 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                     continue
 
             # Number of Links: 3
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 db_dict['num_of_links'] = int(m.groupdict()['num'])
                 continue
 
             # Link connected to: a Stub Network
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 link_type = str(m.groupdict()['type']).lower()
                 continue
 
             # Link connected to: another Router (point-to-point)
-            m = p18_1.match(line)
+            m = self.p18_1.match(line)
             if m:
                 link_type = str(m.groupdict()['type']).lower()
                 continue
 
             # (Link ID) Network/subnet number: 10.4.1.1
-            m = p19_1.match(line)
+            m = self.p19_1.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -3378,7 +3485,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # (Link ID) Designated Router address: 10.166.7.6
-            m = p19_2.match(line)
+            m = self.p19_2.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -3404,7 +3511,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # (Link ID) Neighboring Router ID: 10.151.22.22
-            m = p19_3.match(line)
+            m = self.p19_3.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -3430,64 +3537,64 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # (Link Data) Network Mask: 255.255.255.255
-            m = p20_1.match(line)
+            m = self.p20_1.match(line)
             if m:
                 db_dict['links'][link_id]['link_data'] = \
                     str(m.groupdict()['link_data'])
                 continue
 
             # (Link Data) Router Interface address: 10.166.7.6
-            m = p20_2.match(line)
+            m = self.p20_2.match(line)
             if m:
                 db_dict['links'][link_id]['link_data'] = \
                     str(m.groupdict()['link_data'])
                 continue
 
             # Number of TOS metrics: 0
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 db_dict['links'][link_id]['num_tos_metrics'] = \
                     int(m.groupdict()['num'])
                 continue
 
             # Opaque Type: 1
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 opaque_type = int(m.groupdict()['type'])
                 continue
             
             # Opaque ID: 38
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 opaque_id = int(m.groupdict()['id'])
                 continue
 
             # Fragment number: 0
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 header_dict['fragment_number'] = int(m.groupdict()['num'])
                 continue
 
             # MPLS TE router ID : 10.4.1.1
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 header_dict['mpls_te_router_id'] = str(m.groupdict()['mpls'])
                 continue
 
             # AS Boundary Router
-            m = p26_1.match(line)
+            m = self.p26_1.match(line)
             if m:
                 header_dict['as_boundary_router'] = True
                 continue
 
             # Area Border Router
-            m = p26_2.match(line)
+            m = self.p26_2.match(line)
             if m:
                 header_dict['area_border_router'] = True
                 continue
 
             # Link connected to Broadcast network
-            m = p27.match(line)
+            m = self.p27.match(line)
             if m:
                 tlv_idx = len(db_dict.get('link_tlvs', {})) + 1
                 tlv_dict = db_dict.setdefault('link_tlvs', {}).setdefault(tlv_idx, {})
@@ -3512,58 +3619,58 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # Link ID : 10.1.4.4
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 tlv_dict['link_id'] = m.groupdict()['id']
                 continue
 
             # Interface Address : 10.1.4.1
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 addr = m.groupdict()['addr']
                 tlv_dict.setdefault('local_if_ipv4_addrs', {}).setdefault(addr, {})
                 continue
 
             # Admin Metric : 1
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 tlv_dict['te_metric'] = int(m.groupdict()['te_metric'])
                 continue
 
             # Maximum Bandwidth : 125000000
             # Maximum bandwidth : 125000000
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 tlv_dict['max_bandwidth'] = int(m.groupdict()['max_band'])
                 continue
 
             # Maximum reservable bandwidth : 93750000
             # Maximum reservable bandwidth global: 93750000
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 tlv_dict['max_reservable_bandwidth'] = int(m.groupdict()['max_res_band'])
                 continue
 
             # Affinity Bit : 0x0
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 tlv_dict['admin_group'] = m.groupdict()['admin_group']
                 continue
 
             # IGP Metric : 1
-            m = p33_1.match(line)
+            m = self.p33_1.match(line)
             if m:
                 tlv_dict['igp_metric'] = int(m.groupdict()['igp_metric'])
                 continue
 
             # Number of Priority : 8
-            m = p33_2.match(line)
+            m = self.p33_2.match(line)
             if m:
                 tlv_dict['total_priority'] = int(m.groupdict()['num'])
                 continue
             
             # Priority 0 : 93750000    Priority 1 : 93750000
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 value1 = m.groupdict()['num1'] + ' ' + m.groupdict()['band1']
                 value2 = m.groupdict()['num2'] + ' ' + m.groupdict()['band2']
@@ -3579,7 +3686,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # Unknown Sub-TLV   :  Type = 32770, Length = 4 Value = 00 00 00 01
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 unknown_tlvs_counter += 1
                 unknown_dict = tlv_dict.setdefault('unknown_tlvs', {}).\
@@ -3591,14 +3698,14 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # Extended Administrative Group : Length: 8
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 ext_dict = tlv_dict.setdefault('extended_admin_group', {})
                 ext_dict['length'] = int(m.groupdict()['eag_length'])
                 continue
 
             # EAG[0]: 0
-            m = p37.match(line)
+            m = self.p37.match(line)
             if m:
                 group_num = int(m.groupdict()['group_num'])
                 gr_dict = ext_dict.setdefault('groups', {}).setdefault(group_num, {})
@@ -3606,7 +3713,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # Router Information TLV: Length: 4
-            m = p38.match(line)
+            m = self.p38.match(line)
             if m:
                 tlv_idx = len(db_dict.get('router_capabilities_tlv', {})) + 1
                 tlv_dict = db_dict.setdefault('router_capabilities_tlv', {}).\
@@ -3620,28 +3727,28 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
 
             # Capabilities:
             #   Graceful Restart Helper Capable
-            m = p39.match(line)
+            m = self.p39.match(line)
             if m:
                 info_dict = tlv_dict.setdefault('information_capabilities', {})
                 info_dict['graceful_restart_helper'] = True
                 continue
 
             #   Stub Router Capable
-            m = p40.match(line)
+            m = self.p40.match(line)
             if m:
                 info_dict = tlv_dict.setdefault('information_capabilities', {})
                 info_dict['stub_router'] = True
                 continue
 
             #   All capability bits: 0x60000000
-            m = p41.match(line)
+            m = self.p41.match(line)
             if m:
                 info_dict = tlv_dict.setdefault('information_capabilities', {})
                 info_dict['capability_bits'] = m.groupdict()['bits']
                 continue
 
             # Segment Routing Algorithm TLV: Length: 2
-            m = p42.match(line)
+            m = self.p42.match(line)
             if m:
                 tlv_idx = len(db_dict.get('sr_algorithm_tlv', {})) + 1
                 tlv_dict = db_dict.setdefault('sr_algorithm_tlv', {}).setdefault(tlv_idx, {})
@@ -3654,14 +3761,14 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
 
             #   Algorithm: 0
             #   Algorithm: 1
-            m = p43.match(line)
+            m = self.p43.match(line)
             if m:
                 algo = tlv_dict.setdefault('algorithm', {})
                 algo.update({m.groupdict()['algo']: True})
                 continue
 
             # Segment Routing Range TLV: Length: 12
-            m = p44.match(line)
+            m = self.p44.match(line)
             if m:
                 tlv_idx = len(db_dict.get('sid_range_tlvs', {})) + 1
                 tlv_dict = db_dict.setdefault('sid_range_tlvs', {}).setdefault(tlv_idx, {})
@@ -3674,14 +3781,14 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             #   Range Size: 65535
-            m = p45.match(line)
+            m = self.p45.match(line)
             if m:
                 tlv_dict['range_size'] = int(m.groupdict()['range_size'])
                 continue
 
             #     SID sub-TLV: Length 3
             #     SID sub-TLV: Length: 8
-            m = p46.match(line)
+            m = self.p46.match(line)
             if m:
                 group = m.groupdict()
                 sub_tlv_idx += 1
@@ -3693,7 +3800,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             #      Label: 16000
-            m = p47.match(line)
+            m = self.p47.match(line)
             if m:
                 if is_sub_tlv:
                     tmp = sub_tlv_dict
@@ -3704,7 +3811,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # Node MSD TLV: Length: 2
-            m = p48.match(line)
+            m = self.p48.match(line)
             if m:
                 tlv_idx = len(db_dict.get('node_msd_tlvs', {})) + 1
                 tlv_dict = db_dict.setdefault('node_msd_tlvs', {}).setdefault(tlv_idx, {})
@@ -3716,7 +3823,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             #     Type: 1, Value 10
-            m = p49.match(line)
+            m = self.p49.match(line)
             if m:
                 # check if is sub_tlv
                 if is_sub_tlv:
@@ -3729,7 +3836,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # Segment Routing Local Block TLV: Length: 12
-            m = p50.match(line)
+            m = self.p50.match(line)
             if m:
                 tlv_idx = len(db_dict.get('local_block_tlvs', {})) + 1
                 tlv_dict = db_dict.setdefault('local_block_tlvs', {}).setdefault(tlv_idx, {})
@@ -3741,7 +3848,7 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             # Extended Prefix Range TLV: Length: 24
-            m = p51.match(line)
+            m = self.p51.match(line)
             if m:
                 tlv_idx = len(db_dict.get('extended_prefix_tlvs', {})) + 1
                 tlv_dict = db_dict.setdefault('extended_prefix_tlvs', {}).setdefault(tlv_idx, {})
@@ -3753,19 +3860,19 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             #   AF   : 0
-            m = p52.match(line)
+            m = self.p52.match(line)
             if m:
                 tlv_dict['af'] = int(m.groupdict()['af'])
                 continue
 
             #   Prefix    : 64.230.254.0/32
-            m = p53.match(line)
+            m = self.p53.match(line)
             if m:
                 tlv_dict['prefix'] = m.groupdict()['prefix']
                 continue
 
             #   Flags     : 0x0
-            m = p54.match(line)
+            m = self.p54.match(line)
             if m:
                 # check if is sub_tlv
                 if is_sub_tlv:
@@ -3777,26 +3884,26 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             #     MTID      : 0
-            m = p55.match(line)
+            m = self.p55.match(line)
             if m:
                 sub_tlv_dict['mt_id'] = m.groupdict()['mt_id']
                 continue
 
             #     Algo      : 0
-            m = p56.match(line)
+            m = self.p56.match(line)
             if m:
                 # check if is sub_tlv
                 sub_tlv_dict['algo'] = int(m.groupdict()['algo'])
                 continue
 
             #     SID Index : 1028
-            m = p57.match(line)
+            m = self.p57.match(line)
             if m:
                 sub_tlv_dict['sid'] = int(m.groupdict()['sid_index'])
                 continue
 
             # Extended Link TLV: Length: 76
-            m = p58.match(line)
+            m = self.p58.match(line)
             if m:
                 tlv_idx = len(db_dict.get('extended_link_tlvs', {})) + 1
                 tlv_dict = db_dict.setdefault('extended_link_tlvs', {}).setdefault(tlv_idx, {})
@@ -3808,37 +3915,37 @@ class ShowOspfVrfAllInclusiveDatabaseParser(MetaParser):
                 continue
 
             #   Link-type : 1
-            m = p59.match(line)
+            m = self.p59.match(line)
             if m:
                 tlv_dict['link_type'] = int(m.groupdict()['link_type'])
                 continue
 
             #   Link Data : 172.16.0.91
-            m = p60.match(line)
+            m = self.p60.match(line)
             if m:
                 tlv_dict['link_data'] = m.groupdict()['link_data']
                 continue
 
             #     Weight    : 0
-            m = p61.match(line)
+            m = self.p61.match(line)
             if m:
                 sub_tlv_dict['weight'] = int(m.groupdict()['weight'])
                 continue
 
             #     Local Interface ID: 78
-            m = p62.match(line)
+            m = self.p62.match(line)
             if m:
                 sub_tlv_dict['local_interface_id'] = int(m.groupdict()['local_id'])
                 continue
 
             #     Remote Interface ID: 76
-            m = p63.match(line)
+            m = self.p63.match(line)
             if m:
                 sub_tlv_dict['remote_interface_id'] = int(m.groupdict()['remote_id'])
                 continue
 
             #     Neighbor Address: 172.16.0.90
-            m = p64.match(line)
+            m = self.p64.match(line)
             if m:
                 if is_sub_tlv:
                     tmp = sub_tlv_dict
@@ -8,6 +8,8 @@ from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional
 
+from genie.libs.parser.utils.records import CompactParser
+
 
 # ====================================================
 #  schema for show route ipv4
@@ -87,7 +89,7 @@ class ShowRouteIpv4Schema(MetaParser):
 # ====================================================
 #  parser for show ip route
 # ====================================================
-class ShowRouteIpv4(ShowRouteIpv4Schema):
+class ShowRouteIpv4(ShowRouteIpv4Schema, CompactParser):
     """Parser for :
        show route ipv4
        show route vrf <vrf> ipv4"""
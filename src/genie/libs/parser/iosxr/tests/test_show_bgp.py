@@ -8227,6 +8227,18 @@ class TestShowBgpInstanceAllAll(unittest.TestCase):
         obj = ShowBgpInstanceAllAll(device=self.device)
         parsed_output = obj.parse(vrf_type='vrf')
         self.assertEqual(parsed_output, self.golden_parsed_output3)
+
+    def test_golden3_feed(self):
+        self.device = Mock()
+        output = self.golden_output3['execute.return_value']
+        obj = ShowBgpInstanceAllAll(device=self.device)
+        obj.start(vrf_type='vrf')
+        # chunks cut in the middle of lines, as read from the terminal
+        for i in range(0, len(output), 100):
+            obj.feed(output[i:i + 100].encode())
+        parsed_output = obj.close()
+        self.assertEqual(parsed_output, self.golden_parsed_output3)
+        self.assertFalse(self.device.execute.called)
     
     def test_golden4(self):
         self.device = Mock(**self.golden_output4)
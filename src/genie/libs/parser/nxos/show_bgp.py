@@ -63,6 +63,26 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.regex import LazyRegex
+from genie.libs.parser.utils.stream import iter_lines, IncrementalParser
+from genie.libs.parser.utils.records import CompactParser
+from genie.libs.parser.utils.path_store import SharedPathParser, \
+    open_path
+from genie.libs.parser.utils.xml_rows import iter_xml_rows
+from genie.libs.parser.utils.json_rows import JsonParser, iter_json_rows, \
+                                              loads
+
+
+def xml_time(value):
+    '''"PT1H4M41S" of the xml replies as "01:04:41", 'never' if it does
+    not convert'''
+    value = Common.convert_xml_time(value)
+    return 'never' if 'P' in value else value
+
+
+def xml_bool(value):
+    '''"true" / "false" of the xml replies as a bool'''
+    return value != 'false'
 
 
 # =====================================
@@ -190,6 +210,167 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
       'paths',
       'routes']
 
+    p1 = LazyRegex(r'^\s*BGP +Process +ID *: +(?P<bgp_pid>[0-9]+)$')
+
+    p2 = LazyRegex(r'^\s*BGP Protocol Started, +reason: *:'
+                       ' +(?P<reason>[a-zA-Z\s]+)$')
+
+    p2_1 = LazyRegex(r'^\s*BGP +Performance +Mode: *:'
+                       ' +(?P<performance_mode>[a-zA-Z\s]+)$')
+
+    p3 = LazyRegex(r'^\s*BGP +Protocol +Tag *:'
+                       ' +(?P<bgp_tag>[a-zA-Z0-9]+)$')
+
+    p4 = LazyRegex(r'^\s*BGP +Protocol +State *:'
+                       ' +(?P<protocol_state>[a-zA-Z\(\)\s]+)$')
+
+    p4_1 = LazyRegex(r'^\s*BGP +Isolate +Mode *:'
+                       ' +(?P<isolate_mode>[a-zA-Z\s]+)$')
+
+    p4_3 = LazyRegex(r'^\s*BGP +MMODE *:'
+                       ' +(?P<mmode>[a-zA-Z\s]+)$')
+
+    p5 = LazyRegex(r'^\s*BGP +Memory +State *:'
+                       ' +(?P<memory_state>[\w\s]+)$')
+
+    p5_1 = LazyRegex(r'^\s*BGP +asformat *:'
+                       ' +(?P<asformat>[a-zA-Z\s]+)$')
+
+    p5_2 = LazyRegex(r'^\s*Segment +Routing +Global +Block *:'
+                       ' +(?P<segment>[0-9\-]+)$')
+
+    p6 = LazyRegex(r'^\s*Number +of +attribute +entries *:'
+                       ' +(?P<num_attr_entries>[0-9]+)$')
+
+    p7 = LazyRegex(r'^\s*HWM +of +attribute +entries *:'
+                       ' +(?P<hwm_attr_entries>[0-9]+)$')
+
+    p8 = LazyRegex(r'^\s*Bytes +used +by +entries *:'
+                       ' +(?P<bytes_used>[0-9]+)$')
+
+    p9 = LazyRegex(r'^\s*Entries +pending +delete *:'
+                       ' +(?P<entries_pending_delete>[0-9]+)$')
+
+    p10 = LazyRegex(r'^\s*HWM +of +entries +pending +delete *:'
+                       ' +(?P<hwm_entries_pending_delete>[0-9]+)$')
+
+    p11 = LazyRegex(r'^\s*BGP +paths +per +attribute +HWM *:'
+                       ' +(?P<bgp_paths_per_hwm_attr>[0-9]+)$')
+
+    p12 = LazyRegex(r'^\s*BGP +AS +path +entries *:'
+                       ' +(?P<bgp_as_path_entries>[0-9]+)$')
+
+    p13 = LazyRegex(r'^\s*Bytes +used +by +AS +path +entries *:'
+                       ' +(?P<bytes_used_as_path_entries>[0-9]+)$')
+
+    p14 = LazyRegex(r'^\s*BGP +Information +for +VRF'
+                       ' +(?P<vrf_name>(\S+))$')
+
+    p15 = LazyRegex(r'^\s*VRF +Id *:'
+                       ' +(?P<vrf_id>[a-zA-Z0-9]+)$')
+
+    p16 = LazyRegex(r'^\s*VRF +state *:'
+                       ' +(?P<vrf_state>[a-zA-Z]+)$')
+
+    p16_1 = LazyRegex(r'^\s*VNID *:'
+                       ' +(?P<vnid>[a-zA-Z0-9]+)(?: +\((\S+)\))?$')
+
+    p16_2 = LazyRegex(r'^\s*Topo +Id *: +(?P<topo_id>(\d+))$')
+
+    p16_3 = LazyRegex(r'^\s*Encap +type *: +(?P<etype>(\S+))$')
+
+    p16_4 = LazyRegex(r'^\s*VTEP +IP *: +(?P<vtep_ip>(\S+))$')
+
+    p16_5 = LazyRegex(r'^\s*VTEP +Virtual +IP *: +(?P<vtep_vip>(\S+))$')
+
+    p16_6 = LazyRegex(r'^\s*VTEP +VIP-R *: +(?P<vipr>(\S+))$')
+
+    p16_7 = LazyRegex(r'^\s*Router-MAC *: +(?P<router_mac>(\S+))$')
+
+    p16_8 = LazyRegex(r'^\s*VIP +Derived +MAC *: +(?P<vipd_mac>(\S+))$')
+
+    p17 = LazyRegex(r'^\s*Router-ID *:'
+                       ' +(?P<router_id>[0-9\.]+)$')
+
+    p18 = LazyRegex(r'^\s*Configured +Router-ID *:'
+                       ' +(?P<conf_router_id>[0-9\.]+)$')
+
+    p19 = LazyRegex(r'^\s*Confed-ID *:'
+                       ' +(?P<confed_id>[0-9]+)$')
+
+    p20 = LazyRegex(r'^\s*Cluster-ID *:'
+                       ' +(?P<cluster_id>[0-9\.]+)$')
+
+    p21 = LazyRegex(r'^\s*No. +of +configured +peers *:'
+                       ' +(?P<num_conf_peers>[0-9]+)$')
+
+    p22 = LazyRegex(r'^\s*No. +of +pending +config +peers *:'
+                       ' +(?P<num_pending_conf_peers>[0-9]+)$')
+
+    p23 = LazyRegex(r'^\s*No. +of +established +peers *:'
+                       ' +(?P<num_established_peers>[0-9]+)$')
+
+    p24 = LazyRegex(r'^\s*VRF +RD *:'
+                       ' +(?P<vrf_rd>[a-zA-Z0-9\:\.\s]+)$')
+
+    p24_1 = LazyRegex(r'^\s*VRF +EVPN +RD *:'
+                       ' +(?P<vrf_evpn_rd>[a-zA-Z0-9\:\.\s]+)$')
+
+    p25 = LazyRegex(r'^\s*Information +for +address +family'
+                       ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)'
+                       ' +in +VRF +(?P<vrf>(\S+))$')
+
+    p26 = LazyRegex(r'^\s*Table +Id *: +(?P<table_id>(\S+))$')
+
+    p27 = LazyRegex(r'^\s*Table +state *: +(?P<table_state>[a-zA-Z]+)$')
+
+    p28 = LazyRegex(r'^\s*(?P<peers>[0-9]+) +(?P<active_peers>[0-9]+)'
+                       ' +(?P<routes>[0-9]+) +(?P<paths>[0-9]+)'
+                       ' +(?P<networks>[0-9]+) +(?P<aggregates>[0-9]+)$')
+
+    p29 = LazyRegex(r'^\s*(?P<name>[a-zA-Z]+),'
+                       ' +route-map +(?P<route_map>[a-zA-Z0-9\-\_]+)$')
+
+    p30 = LazyRegex(r'^\s*(?P<type>(Export|Import|EVPN Export|'
+                       'EVPN Import|MVPN Export|MVPN Import)) +RT +list'
+                       ' *:(?: +(?P<rt_list>[0-9\:]+))?$')
+
+    p31 = LazyRegex(r'^\s*(?P<rt_list>(\d+)\:(\d+))$')
+
+    p32 = LazyRegex(r'^\s*Label +mode *: +(?P<label_mode>[a-zA-Z\-]+)$')
+
+    p32_1 = LazyRegex(r'^\s*Is +a +Route\-reflector$')
+
+    p33 = LazyRegex(r'^\s*Aggregate +label *:'
+                       ' +(?P<aggregate_label>[a-zA-Z0-9\-]+)$')
+
+    p33_1 = LazyRegex(r'^\s*Allocate-index *:'
+                      ' +(?P<allocate_index>[a-zA-Z0-9\-]+)$')
+
+    p34 = LazyRegex(r'^\s*Import +default +limit *:'
+                       ' +(?P<import_default_prefix_limit>[0-9]+)$')
+
+    p35 = LazyRegex(r'^\s*Import +default +prefix +count *:'
+                       ' +(?P<import_default_prefix_count>[0-9]+)$')
+
+    p36 = LazyRegex(r'^\s*Import +default +map *:'
+                       ' +(?P<import_default_map>[a-zA-Z0-9\_\-]+)$')
+
+    p37 = LazyRegex(r'^\s*Export +default +limit *:'
+                       ' +(?P<export_default_prefix_limit>[0-9]+)$')
+
+    p38 = LazyRegex(r'^\s*Export +default +prefix +count *:'
+                       ' +(?P<export_default_prefix_count>[0-9]+)$')
+
+    p39 = LazyRegex(r'^\s*Export +default +map *:'
+                       ' +(?P<export_default_map>[a-zA-Z0-9\_\-]+)$')
+
+    p40 = LazyRegex(r'^\s*Nexthop +trigger-delay$')
+
+    p41 = LazyRegex(r'^\s*critical +(?P<critical>[0-9]+) +ms$')
+
+    p42 = LazyRegex(r'^\s*non-critical +(?P<non_critical>[0-9]+) +ms$')
+
     def cli(self, vrf='', output=None):
         if vrf:
             cmd = self.cli_command[1].format(vrf=vrf)
@@ -203,177 +384,72 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
         # Init vars
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*BGP +Process +ID *: +(?P<bgp_pid>[0-9]+)$')
-        p2 = re.compile(r'^\s*BGP Protocol Started, +reason: *:'
-                            ' +(?P<reason>[a-zA-Z\s]+)$')
-        p2_1 = re.compile(r'^\s*BGP +Performance +Mode: *:'
-                            ' +(?P<performance_mode>[a-zA-Z\s]+)$')
-        p3 = re.compile(r'^\s*BGP +Protocol +Tag *:'
-                            ' +(?P<bgp_tag>[a-zA-Z0-9]+)$')
-        p4 = re.compile(r'^\s*BGP +Protocol +State *:'
-                            ' +(?P<protocol_state>[a-zA-Z\(\)\s]+)$')
-        p4_1 = re.compile(r'^\s*BGP +Isolate +Mode *:'
-                            ' +(?P<isolate_mode>[a-zA-Z\s]+)$')
-        p4_3 = re.compile(r'^\s*BGP +MMODE *:'
-                            ' +(?P<mmode>[a-zA-Z\s]+)$')
-        p5 = re.compile(r'^\s*BGP +Memory +State *:'
-                            ' +(?P<memory_state>[\w\s]+)$')
-        p5_1 = re.compile(r'^\s*BGP +asformat *:'
-                            ' +(?P<asformat>[a-zA-Z\s]+)$')
-        p5_2 = re.compile(r'^\s*Segment +Routing +Global +Block *:'
-                            ' +(?P<segment>[0-9\-]+)$')
-        p6 = re.compile(r'^\s*Number +of +attribute +entries *:'
-                            ' +(?P<num_attr_entries>[0-9]+)$')
-        p7 = re.compile(r'^\s*HWM +of +attribute +entries *:'
-                            ' +(?P<hwm_attr_entries>[0-9]+)$')
-        p8 = re.compile(r'^\s*Bytes +used +by +entries *:'
-                            ' +(?P<bytes_used>[0-9]+)$')
-        p9 = re.compile(r'^\s*Entries +pending +delete *:'
-                            ' +(?P<entries_pending_delete>[0-9]+)$')
-        p10 = re.compile(r'^\s*HWM +of +entries +pending +delete *:'
-                            ' +(?P<hwm_entries_pending_delete>[0-9]+)$')
-        p11 = re.compile(r'^\s*BGP +paths +per +attribute +HWM *:'
-                            ' +(?P<bgp_paths_per_hwm_attr>[0-9]+)$')
-        p12 = re.compile(r'^\s*BGP +AS +path +entries *:'
-                            ' +(?P<bgp_as_path_entries>[0-9]+)$')
-        p13 = re.compile(r'^\s*Bytes +used +by +AS +path +entries *:'
-                            ' +(?P<bytes_used_as_path_entries>[0-9]+)$')
-        p14 = re.compile(r'^\s*BGP +Information +for +VRF'
-                            ' +(?P<vrf_name>(\S+))$')
-        p15 = re.compile(r'^\s*VRF +Id *:'
-                            ' +(?P<vrf_id>[a-zA-Z0-9]+)$')
-        p16 = re.compile(r'^\s*VRF +state *:'
-                            ' +(?P<vrf_state>[a-zA-Z]+)$')
-        p16_1 = re.compile(r'^\s*VNID *:'
-                            ' +(?P<vnid>[a-zA-Z0-9]+)(?: +\((\S+)\))?$')
-        p16_2 = re.compile(r'^\s*Topo +Id *: +(?P<topo_id>(\d+))$')
-        p16_3 = re.compile(r'^\s*Encap +type *: +(?P<etype>(\S+))$')
-        p16_4 = re.compile(r'^\s*VTEP +IP *: +(?P<vtep_ip>(\S+))$')
-        p16_5 = re.compile(r'^\s*VTEP +Virtual +IP *: +(?P<vtep_vip>(\S+))$')
-        p16_6 = re.compile(r'^\s*VTEP +VIP-R *: +(?P<vipr>(\S+))$')
-        p16_7 = re.compile(r'^\s*Router-MAC *: +(?P<router_mac>(\S+))$')
-        p16_8 = re.compile(r'^\s*VIP +Derived +MAC *: +(?P<vipd_mac>(\S+))$')
-        p17 = re.compile(r'^\s*Router-ID *:'
-                            ' +(?P<router_id>[0-9\.]+)$')
-        p18 = re.compile(r'^\s*Configured +Router-ID *:'
-                            ' +(?P<conf_router_id>[0-9\.]+)$')
-        p19 = re.compile(r'^\s*Confed-ID *:'
-                            ' +(?P<confed_id>[0-9]+)$')
-        p20 = re.compile(r'^\s*Cluster-ID *:'
-                            ' +(?P<cluster_id>[0-9\.]+)$')
-        p21 = re.compile(r'^\s*No. +of +configured +peers *:'
-                            ' +(?P<num_conf_peers>[0-9]+)$')
-        p22 = re.compile(r'^\s*No. +of +pending +config +peers *:'
-                            ' +(?P<num_pending_conf_peers>[0-9]+)$')
-        p23 = re.compile(r'^\s*No. +of +established +peers *:'
-                            ' +(?P<num_established_peers>[0-9]+)$')
-        p24 = re.compile(r'^\s*VRF +RD *:'
-                            ' +(?P<vrf_rd>[a-zA-Z0-9\:\.\s]+)$')
-        p24_1 = re.compile(r'^\s*VRF +EVPN +RD *:'
-                            ' +(?P<vrf_evpn_rd>[a-zA-Z0-9\:\.\s]+)$')
-        p25 = re.compile(r'^\s*Information +for +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)'
-                            ' +in +VRF +(?P<vrf>(\S+))$')
-        p26 = re.compile(r'^\s*Table +Id *: +(?P<table_id>(\S+))$')
-        p27 = re.compile(r'^\s*Table +state *: +(?P<table_state>[a-zA-Z]+)$')
-        p28 = re.compile(r'^\s*(?P<peers>[0-9]+) +(?P<active_peers>[0-9]+)'
-                            ' +(?P<routes>[0-9]+) +(?P<paths>[0-9]+)'
-                            ' +(?P<networks>[0-9]+) +(?P<aggregates>[0-9]+)$')
-        p29 = re.compile(r'^\s*(?P<name>[a-zA-Z]+),'
-                            ' +route-map +(?P<route_map>[a-zA-Z0-9\-\_]+)$')
-        p30 = re.compile(r'^\s*(?P<type>(Export|Import|EVPN Export|'
-                            'EVPN Import|MVPN Export|MVPN Import)) +RT +list'
-                            ' *:(?: +(?P<rt_list>[0-9\:]+))?$')
-        p31 = re.compile(r'^\s*(?P<rt_list>(\d+)\:(\d+))$')
-        p32 = re.compile(r'^\s*Label +mode *: +(?P<label_mode>[a-zA-Z\-]+)$')
-        p32_1 = re.compile(r'^\s*Is +a +Route\-reflector$')
-        p33 = re.compile(r'^\s*Aggregate +label *:'
-                            ' +(?P<aggregate_label>[a-zA-Z0-9\-]+)$')
-        p33_1 = re.compile(r'^\s*Allocate-index *:'
-                           ' +(?P<allocate_index>[a-zA-Z0-9\-]+)$')
-        p34 = re.compile(r'^\s*Import +default +limit *:'
-                            ' +(?P<import_default_prefix_limit>[0-9]+)$')
-        p35 = re.compile(r'^\s*Import +default +prefix +count *:'
-                            ' +(?P<import_default_prefix_count>[0-9]+)$')
-        p36 = re.compile(r'^\s*Import +default +map *:'
-                            ' +(?P<import_default_map>[a-zA-Z0-9\_\-]+)$')
-        p37 = re.compile(r'^\s*Export +default +limit *:'
-                            ' +(?P<export_default_prefix_limit>[0-9]+)$')
-        p38 = re.compile(r'^\s*Export +default +prefix +count *:'
-                            ' +(?P<export_default_prefix_count>[0-9]+)$')
-        p39 = re.compile(r'^\s*Export +default +map *:'
-                            ' +(?P<export_default_map>[a-zA-Z0-9\_\-]+)$')
-        p40 = re.compile(r'^\s*Nexthop +trigger-delay$')
-        p41 = re.compile(r'^\s*critical +(?P<critical>[0-9]+) +ms$')
-        p42 = re.compile(r'^\s*non-critical +(?P<non_critical>[0-9]+) +ms$')
-
-
         for line in out.splitlines():
             line = line.replace('\t', '    ')
             line = line.rstrip()
 
             # BGP Process ID                 : 29474
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 parsed_dict['bgp_pid'] = int(m.groupdict()['bgp_pid'])
                 continue
 
             # BGP Protocol Started, reason:  : configuration
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 parsed_dict['bgp_protocol_started_reason'] = \
                     str(m.groupdict()['reason']).lower()
                 continue
 
             # BGP Performance Mode:          : No
-            m = p2_1.match(line)
+            m = self.p2_1.match(line)
             if m:
                 parsed_dict['bgp_performance_mode'] = \
                     str(m.groupdict()['performance_mode'])
                 continue
 
             # BGP Protocol Tag               : 100
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 parsed_dict['bgp_tag'] = str(m.groupdict()['bgp_tag']).lower()
                 continue
 
             # BGP Protocol State             : Running
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 parsed_dict['bgp_protocol_state'] = \
                     str(m.groupdict()['protocol_state']).lower()
                 continue
 
             # BGP Isolate Mode               : No
-            m = p4_1.match(line)
+            m = self.p4_1.match(line)
             if m:
                 parsed_dict['bgp_isolate_mode'] = \
                     str(m.groupdict()['isolate_mode'])
                 continue
 
             # BGP MMODE                      : Initialized
-            m = p4_3.match(line)
+            m = self.p4_3.match(line)
             if m:
                 parsed_dict['bgp_mmode'] = str(m.groupdict()['mmode'])
                 continue
 
             # BGP Memory State               : OK
             # BGP Memory State               : Severe Alert
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 parsed_dict['bgp_memory_state'] = \
                     str(m.groupdict()['memory_state']).lower()
                 continue
 
             # BGP asformat                   : asplain
-            m = p5_1.match(line)
+            m = self.p5_1.match(line)
             if m:
                 parsed_dict['bgp_asformat'] = str(m.groupdict()['asformat'])
                 continue
 
             # Segment Routing Global Block   : 10000-25000
-            m = p5_2.match(line)
+            m = self.p5_2.match(line)
             if m:
                 parsed_dict['segment_routing_global_block'] = \
                     str(m.groupdict()['segment'])
@@ -381,62 +457,62 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             # BGP attributes information
             # Number of attribute entries    : 4
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 parsed_dict['num_attr_entries'] = \
                     int(m.groupdict()['num_attr_entries'])
                 continue
 
             # HWM of attribute entries       : 5
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 parsed_dict['hwm_attr_entries'] = \
                     int(m.groupdict()['hwm_attr_entries'])
                 continue
 
             # Bytes used by entries          : 368
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 parsed_dict['bytes_used'] = int(m.groupdict()['bytes_used'])
                 continue
 
             # Entries pending delete         : 0
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 parsed_dict['entries_pending_delete'] = \
                     int(m.groupdict()['entries_pending_delete'])
                 continue
 
             # HWM of entries pending delete  : 0
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 parsed_dict['hwm_entries_pending_delete'] = \
                     int(m.groupdict()['hwm_entries_pending_delete'])
                 continue
 
             # BGP paths per attribute HWM    : 1
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 parsed_dict['bgp_paths_per_hwm_attr'] = \
                     int(m.groupdict()['bgp_paths_per_hwm_attr'])
                 continue
 
             # BGP AS path entries            : 0
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 parsed_dict['bgp_as_path_entries'] = \
                     int(m.groupdict()['bgp_as_path_entries'])
                 continue
 
             # Bytes used by AS path entries  : 0
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 parsed_dict['bytes_used_as_path_entries'] = \
                     int(m.groupdict()['bytes_used_as_path_entries'])
                 continue
 
             # BGP Information for VRF VRF1
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 if 'vrf' not in parsed_dict:
                     parsed_dict['vrf'] = {}
@@ -446,118 +522,118 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                     continue
 
             # VRF Id                         : 3
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_id'] = \
                     str(m.groupdict()['vrf_id'])
                 continue
 
             # VRF state                      : UP
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_state'] = \
                     str(m.groupdict()['vrf_state']).lower()
                 continue
 
             # VNID                           : 9105 (valid)
-            m = p16_1.match(line)
+            m = self.p16_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vnid'] = m.groupdict()['vnid']
                 continue
 
             # Topo Id                        : 1005
-            m = p16_2.match(line)
+            m = self.p16_2.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['topo_id'] = \
                     m.groupdict()['topo_id']
                 continue
 
             # Encap type                     : VXLAN
-            m = p16_3.match(line)
+            m = self.p16_3.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['encap_type'] = \
                     m.groupdict()['etype']
                 continue
 
             # VTEP IP                        : 10.49.1.1
-            m = p16_4.match(line)
+            m = self.p16_4.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vtep_ip'] = \
                     m.groupdict()['vtep_ip']
                 continue
 
             # VTEP Virtual IP                : 10.49.2.1
-            m = p16_5.match(line)
+            m = self.p16_5.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vtep_virtual_ip'] = \
                     m.groupdict()['vtep_vip']
                 continue
 
             # VTEP VIP-R                     : 10.49.2.1
-            m = p16_6.match(line)
+            m = self.p16_6.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vtep_vip_r'] = \
                     m.groupdict()['vipr']
                 continue
 
             # Router-MAC                     : 000c.29e2.c046
-            m = p16_7.match(line)
+            m = self.p16_7.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['router_mac'] = \
                     m.groupdict()['router_mac']
                 continue
 
             # VIP Derived MAC                : 000c.29e2.c046
-            m = p16_8.match(line)
+            m = self.p16_8.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vip_derived_mac'] = \
                     m.groupdict()['vipd_mac']
                 continue
 
             # Router-ID                      : 10.229.11.11
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['router_id'] = \
                     str(m.groupdict()['router_id'])
                 continue
 
             # Configured Router-ID           : 0.0.0.0
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['conf_router_id'] = \
                     str(m.groupdict()['conf_router_id'])
                 continue
 
             # Confed-ID                      : 0
-            m = p19.match(line)
+            m = self.p19.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['confed_id'] = \
                     int(m.groupdict()['confed_id'])
                 continue
 
             # Cluster-ID                     : 0.0.0.0
-            m = p20.match(line)
+            m = self.p20.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['cluster_id'] = \
                     str(m.groupdict()['cluster_id'])
                 continue
 
             # No. of configured peers        : 1
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['num_conf_peers'] = \
                     int(m.groupdict()['num_conf_peers'])
                 continue
             
             # No. of pending config peers    : 0
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['num_pending_conf_peers'] = \
                     int(m.groupdict()['num_pending_conf_peers'])
                 continue
             
             # No. of established peers       : 0
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['num_established_peers'] = \
                     int(m.groupdict()['num_established_peers'])
@@ -565,7 +641,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             
             # VRF RD                         : 100:100
             # VRF RD                         : 10.49.1.0:4
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_rd'] = \
                     str(m.groupdict()['vrf_rd']).lower()
@@ -573,14 +649,14 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             # VRF EVPN RD                    : 100:100
             # VRF EVPN RD                    : 10.49.1.0:4
-            m = p24_1.match(line)
+            m = self.p24_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_evpn_rd'] = \
                     str(m.groupdict()['vrf_evpn_rd']).lower()
                 continue
 
             #     Information for address family IPv4 Unicast in VRF VRF1
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 if 'address_family' not in parsed_dict['vrf'][vrf_name]:
                     parsed_dict['vrf'][vrf_name]['address_family'] = {}
@@ -600,7 +676,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             #     Table Id                   : 10
             #     Table Id                   : 0x80000001
-            m = p26.match(line)
+            m = self.p26.match(line)
             if m:
                 table_id = str(m.groupdict()['table_id'])
                 if '0x' in table_id:
@@ -612,7 +688,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                 continue
             
             #     Table state                : UP
-            m = p27.match(line)
+            m = self.p27.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['table_state'] = str(m.groupdict()['table_state']).lower()
@@ -620,7 +696,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             #     Peers      Active-peers    Routes     Paths      Networks   Aggregates
             #     1          0               5          5          1          2      
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 if 'peers' not in parsed_dict['vrf'][vrf_name]\
                     ['address_family'][address_family]:
@@ -654,7 +730,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             #         direct, route-map genie_redistribution
             #         static, route-map genie_redistribution
             #         eigrp, route-map test-map
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 if 'redistribution' not in parsed_dict['vrf'][vrf_name]\
                     ['address_family'][address_family]:
@@ -680,7 +756,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             # MVPN Import RT list:
             # Export RT list: 100:1
             # Import RT list: 100:1
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 rt_list_type = str(m.groupdict()['type']).lower()
                 rt_list_type = rt_list_type.replace(' ', '_')
@@ -694,7 +770,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             # 100:1
             # 400:400
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 values = values + ' ' + m.groupdict()['rt_list']
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
@@ -702,35 +778,35 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                 continue
 
             #     Label mode: per-prefix
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['label_mode'] = str(m.groupdict()['label_mode'])
                 continue
 
             #     Is a Route-reflector
-            m = p32_1.match(line)
+            m = self.p32_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['route_reflector'] = True
                 continue
 
             #     Aggregate label: 492287
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['aggregate_label'] = str(m.groupdict()['aggregate_label'])
                 continue
 
             #     Allocate-index:
-            m = p33_1.match(line)
+            m = self.p33_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family] \
                     ['allocate_index'] = str(m.groupdict()['allocate_index'])
                 continue
 
             # Import default limit       : 1000
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['import_default_prefix_limit'] = \
@@ -738,42 +814,42 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                 continue
 
             # Import default prefix count : 3
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['import_default_prefix_count'] = \
                         int(m.groupdict()['import_default_prefix_count'])
 
             # Import default map         : PERMIT_ALL_RM
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['import_default_map'] = \
                         str(m.groupdict()['import_default_map'])
 
             # Export default limit       : 1000
-            m = p37.match(line)
+            m = self.p37.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['export_default_prefix_limit'] = \
                         int(m.groupdict()['export_default_prefix_limit'])
 
             # Export default prefix count : 2
-            m = p38.match(line)
+            m = self.p38.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['export_default_prefix_count'] = \
                         int(m.groupdict()['export_default_prefix_count'])
 
             # Export default map         : PERMIT_ALL_RM
-            m = p39.match(line)
+            m = self.p39.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['export_default_map'] = \
                         str(m.groupdict()['export_default_map'])
 
             # Nexthop trigger-delay
-            m = p40.match(line)
+            m = self.p40.match(line)
             if m:
                 if 'next_hop_trigger_delay' not in parsed_dict['vrf'][vrf_name]\
                     ['address_family'][address_family]:
@@ -781,14 +857,14 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                         [address_family]['next_hop_trigger_delay'] = {}
 
             # critical 3000 ms
-            m = p41.match(line)
+            m = self.p41.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family']\
                     [address_family]['next_hop_trigger_delay']['critical'] = \
                     int(m.groupdict()['critical'])
 
             # non-critical 3000 ms
-            m = p42.match(line)
+            m = self.p42.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family']\
                     [address_family]['next_hop_trigger_delay']['non_critical'] = \
@@ -796,6 +872,74 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
         return parsed_dict
 
+    # Leaves of the rows of the xml reply
+    xml_fields = {
+        '__readonly__': {
+            'processid': ('bgp_pid', int),
+            'protocolstartedreason': 'bgp_protocol_started_reason',
+            'protocoltag': 'bgp_tag',
+            'protocolstate': ('bgp_protocol_state', str.lower),
+            'isolatemode': 'bgp_isolate_mode',
+            'mmode': 'bgp_mmode',
+            'memorystate': ('bgp_memory_state', str.lower),
+            'forwardingstatesaved': ('bgp_performance_mode',
+                                     lambda value: 'No' if value == 'false'
+                                     else 'Yes'),
+            'asformat': 'bgp_asformat',
+            'srgbmin': 'srgbmin',
+            'srgbmax': 'srgbmax',
+            'attributeentries': ('num_attr_entries', int),
+            'hwmattributeentries': ('hwm_attr_entries', int),
+            'bytesused': ('bytes_used', int),
+            'entriespendingdelete': ('entries_pending_delete', int),
+            'hwmentriespendingdelete': ('hwm_entries_pending_delete', int),
+            'pathsperattribute': ('bgp_paths_per_hwm_attr', int),
+            'aspathentries': ('bgp_as_path_entries', int),
+            'aspathbytes': ('bytes_used_as_path_entries', int)},
+        'ROW_vrf': {
+            'vrf-name-out': 'vrf',
+            'vrf-id': 'vrf_id',
+            'vrf-state': ('vrf_state', str.lower),
+            'vrf-router-id': 'router_id',
+            'vrf-cfgd-id': 'conf_router_id',
+            'vrf-confed-id': ('confed_id', int),
+            'vrf-cluster-id': 'cluster_id',
+            'vrf-peers': ('num_conf_peers', int),
+            'vrf-pending-peers': ('num_pending_conf_peers', int),
+            'vrf-est-peers': ('num_established_peers', int),
+            'vrf-rd': 'vrf_rd'},
+        'ROW_af': {
+            'af-name': ('af', str.lower),
+            'af-table-id': ('table_id', lambda value: value if '0x' in value
+                            else '0x' + value),
+            'af-state': ('table_state', str.lower),
+            'af-num-peers': ('peers', int),
+            'af-num-active-peers': ('active_peers', int),
+            'af-peer-routes': ('routes', int),
+            'af-peer-paths': ('paths', int),
+            'af-peer-networks': ('networks', int),
+            'af-peer-aggregates': ('aggregates', int),
+            'af-rr': ('route_reflector', xml_bool),
+            'nexthop-trigger-delay-critical': ('critical', int),
+            'nexthop-trigger-delay-non-critical': ('non_critical', int),
+            'af-aggregate-label': 'aggregate_label',
+            'af-label-mode': 'label_mode',
+            'importdefault_map': 'import_default_map',
+            'importdefault_prefixlimit': ('import_default_prefix_limit', int),
+            'importdefault_prefixcount': ('import_default_prefix_count', int),
+            'exportdefault_map': 'export_default_map',
+            'exportdefault_prefixlimit': ('export_default_prefix_limit', int),
+            'exportdefault_prefixcount': ('export_default_prefix_count',
+                                          int)},
+        'ROW_redist': {
+            'protocol': 'protocol',
+            'route-map': 'route_map'},
+        'ROW_evpn_export_rt': {
+            'evpn-export-rt': 'rt'},
+        'ROW_evpn_import_rt': {
+            'evpn-import-rt': 'rt'},
+    }
+
     def xml(self, vrf='', output=None):
         if output is None:
             if vrf:
@@ -806,259 +950,68 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             out = output
 
         etree_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        xml_output = ET.fromstring(out)
-
-        for item in xml_output:
-            for data in item:
-                for show in data:
-                    for bgp in show:
-                        for __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf in bgp:
-                            for process in __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf:
-                                for __XML__OPT_Cmd_show_bgp_process_cmd_vrf in process:
-                                    for __XML__OPT_Cmd_show_bgp_process_cmd___readonly__ in __XML__OPT_Cmd_show_bgp_process_cmd_vrf:
-                                        for key in __XML__OPT_Cmd_show_bgp_process_cmd___readonly__:
-                                            # Get key text
-                                            text = key.tag[key.tag.find('}')+1:]
-                                            # bgp_pid
-                                            if text == 'processid':
-                                                etree_dict['bgp_pid'] = int(key.text)
-                                            # bgp_protocol_started_reason
-                                            if text == 'protocolstartedreason':
-                                                etree_dict['bgp_protocol_started_reason'] = key.text
-                                            # bgp_tag
-                                            if text == 'protocoltag':
-                                                etree_dict['bgp_tag'] = key.text
-                                            # bgp_protocol_state
-                                            if text == 'protocolstate':
-                                                etree_dict['bgp_protocol_state'] = str(key.text).lower()
-                                            # bgp_isolate_mode
-                                            if text == 'isolatemode':
-                                                etree_dict['bgp_isolate_mode'] = key.text
-                                            # bgp_mmode
-                                            if text == 'mmode':
-                                                etree_dict['bgp_mmode'] = key.text
-                                            # bgp_memory_state
-                                            if text == 'memorystate':
-                                                etree_dict['bgp_memory_state'] = str(key.text).lower()
-                                            # bgp_performance_mode
-                                            if text == 'forwardingstatesaved':
-                                                if key.text == 'false':
-                                                    etree_dict['bgp_performance_mode'] = 'No'
-                                                else:
-                                                    etree_dict['bgp_performance_mode'] = 'Yes'
-                                            # bgp_asformat
-                                            if text == 'asformat':
-                                                etree_dict['bgp_asformat'] = key.text
-                                            if text == 'srgbmin':
-                                                srgbin = key.text
-                                            if text == 'srgbmax':
-                                                srgmax = key.text
-                                                try:
-                                                    etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
-                                                except Exception:
-                                                    pass
-                                            # num_attr_entries
-                                            if text == 'attributeentries':
-                                                etree_dict['num_attr_entries'] = int(key.text)
-                                            # hwm_attr_entries
-                                            if text == 'hwmattributeentries':
-                                                etree_dict['hwm_attr_entries'] = int(key.text)
-                                            # bytes_used
-                                            if text == 'bytesused':
-                                                etree_dict['bytes_used'] = int(key.text)
-                                            # entries_pending_delete
-                                            if text == 'entriespendingdelete':
-                                                etree_dict['entries_pending_delete'] = int(key.text)
-                                            # hwm_entries_pending_delete
-                                            if text == 'hwmentriespendingdelete':
-                                                etree_dict['hwm_entries_pending_delete'] = int(key.text)
-                                            # bgp_paths_per_hwm_attr
-                                            if text == 'pathsperattribute':
-                                                etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
-                                            # bgp_as_path_entries
-                                            if text == 'aspathentries':
-                                                etree_dict['bgp_as_path_entries'] = int(key.text)
-                                            # bytes_used_as_path_entries
-                                            if text == 'aspathbytes':
-                                                etree_dict['bytes_used_as_path_entries'] = int(key.text)
-                                            
-                                            if text == 'TABLE_vrf':
-                                                for table_vrf in key:
-                                                    for row_vrf in table_vrf:
-                                                        vrf_tag = row_vrf.tag[row_vrf.tag.find('}')+1:]
-
-                                                        # vrf
-                                                        #   vrf_name
-                                                        if vrf_tag == 'vrf-name-out':
-                                                            vrf_name = row_vrf.text
-                                                            if 'vrf' not in etree_dict:
-                                                                etree_dict['vrf'] = {}
-                                                            if vrf_name not in etree_dict['vrf']:
-                                                                etree_dict['vrf'][vrf_name] = {}
-                                                                vrf_dict = etree_dict['vrf'][vrf_name]
-                                                        # vrf_id
-                                                        if vrf_tag == 'vrf-id':
-                                                            vrf_dict['vrf_id'] = row_vrf.text
-                                                        # vrf_state
-                                                        if vrf_tag == 'vrf-state':
-                                                            vrf_dict['vrf_state'] = str(row_vrf.text).lower()
-                                                        # router_id
-                                                        if vrf_tag == 'vrf-router-id':
-                                                            vrf_dict['router_id'] = row_vrf.text
-                                                        # conf_router_id
-                                                        if vrf_tag == 'vrf-cfgd-id':
-                                                            vrf_dict['conf_router_id'] = row_vrf.text
-                                                        # confed_id
-                                                        if vrf_tag == 'vrf-confed-id':
-                                                            vrf_dict['confed_id'] = int(row_vrf.text)
-                                                        # cluster_id
-                                                        if vrf_tag == 'vrf-cluster-id':
-                                                           vrf_dict['cluster_id'] = row_vrf.text
-                                                        # num_conf_peers
-                                                        if vrf_tag == 'vrf-peers':
-                                                            vrf_dict['num_conf_peers'] = int(row_vrf.text)
-                                                        # num_pending_conf_peers
-                                                        if vrf_tag == 'vrf-pending-peers':
-                                                            vrf_dict['num_pending_conf_peers'] = int(row_vrf.text)
-                                                        # num_established_peers
-                                                        if vrf_tag == 'vrf-est-peers':
-                                                            vrf_dict['num_established_peers'] = int(row_vrf.text)
-                                                            vrf_dict['vrf_rd'] = 'not configured'
-                                                        # vrf_rd
-                                                        if vrf_tag == 'vrf-rd':
-                                                            vrf_dict['vrf_rd'] = row_vrf.text
-
-                                                        if vrf_tag == 'TABLE_af':
-                                                            for table_af in row_vrf:
-                                                                for row_af in table_af:
-                                                                    af_tag = row_af.tag[row_af.tag.find('}')+1:]
-
-                                                                    # address_family
-                                                                    #   address_family_name
-                                                                    if af_tag == 'af-name':
-                                                                        address_family_name = str(row_af.text).lower()
-                                                                        if 'address_family' not in etree_dict['vrf'][vrf_name]:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'] = {}
-                                                                        if address_family_name not in etree_dict['vrf'][vrf_name]['address_family']:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'][address_family_name] = {}
-                                                                            af_dict = etree_dict['vrf'][vrf_name]['address_family'][address_family_name]
-                                                                        # Initialize empty lists
-                                                                        export_rt_list = ''
-                                                                        import_rt_list = ''
-                                                                    # table_id
-                                                                    if af_tag == 'af-table-id':
-                                                                        table_id = str(row_af.text)
-                                                                        if '0x' in table_id:
-                                                                            af_dict['table_id'] = table_id
-                                                                        else:
-                                                                            af_dict['table_id'] = '0x' + table_id
-                                                                    # table_state
-                                                                    if af_tag == 'af-state':
-                                                                        af_dict['table_state'] = str(row_af.text).lower()
-                                                                    # peers
-                                                                    if af_tag == 'af-num-peers':
-                                                                        peers = int(row_af.text)
-                                                                        if 'peers' not in af_dict:
-                                                                            af_dict['peers'] = {}
-                                                                        if peers not in af_dict['peers']:
-                                                                            af_dict['peers'][peers] = {}
-                                                                    # active_peers
-                                                                    if af_tag == 'af-num-active-peers':
-                                                                        af_dict['peers'][peers]['active_peers'] = int(row_af.text)
-                                                                    # routes
-                                                                    if af_tag == 'af-peer-routes':
-                                                                        af_dict['peers'][peers]['routes'] = int(row_af.text)
-                                                                    # paths
-                                                                    if af_tag == 'af-peer-paths':
-                                                                        af_dict['peers'][peers]['paths'] = int(row_af.text)
-                                                                    # networks
-                                                                    if af_tag == 'af-peer-networks':
-                                                                        af_dict['peers'][peers]['networks'] = int(row_af.text)
-                                                                    # aggregates
-                                                                    if af_tag == 'af-peer-aggregates':
-                                                                        af_dict['peers'][peers]['aggregates'] = int(row_af.text)
-                                                                    # route_reflector
-                                                                    if af_tag == 'af-rr':
-                                                                        if row_af.text == 'true':
-                                                                            af_dict['route_reflector'] = True
-                                                                    # next_hop_trigger_delay
-                                                                    #   critical
-                                                                    if af_tag == 'nexthop-trigger-delay-critical':
-                                                                        if 'next_hop_trigger_delay' not in af_dict:
-                                                                            af_dict['next_hop_trigger_delay'] = {}
-                                                                        af_dict['next_hop_trigger_delay']['critical'] = int(row_af.text)
-                                                                    # next_hop_trigger_delay
-                                                                    #   non_critical
-                                                                    if af_tag == 'nexthop-trigger-delay-non-critical':
-                                                                        af_dict['next_hop_trigger_delay']['non_critical'] = int(row_af.text)
-                                                                    # aggregate_label
-                                                                    if af_tag == 'af-aggregate-label':
-                                                                        af_dict['aggregate_label'] = row_af.text
-                                                                    # label_mode
-                                                                    if af_tag == 'af-label-mode':
-                                                                        af_dict['label_mode'] = row_af.text
-                                                                    # import_default_map
-                                                                    if af_tag == 'importdefault_map':
-                                                                        af_dict['import_default_map'] = row_af.text
-                                                                    # import_default_prefix_limit
-                                                                    if af_tag == 'importdefault_prefixlimit':
-                                                                        af_dict['import_default_prefix_limit'] = int(row_af.text)
-                                                                    # import_default_prefix_count
-                                                                    if af_tag == 'importdefault_prefixcount':
-                                                                        af_dict['import_default_prefix_count'] = int(row_af.text)
-                                                                    # export_default_map
-                                                                    if af_tag == 'exportdefault_map':
-                                                                        af_dict['export_default_map'] = row_af.text
-                                                                    # export_default_prefix_limit
-                                                                    if af_tag == 'exportdefault_prefixlimit':
-                                                                        af_dict['export_default_prefix_limit'] = int(row_af.text)
-                                                                    # export_default_prefix_count
-                                                                    if af_tag == 'exportdefault_prefixcount':
-                                                                        af_dict['export_default_prefix_count'] = int(row_af.text)
-
-                                                                    # TABLE_redist
-                                                                    #   ROW_redist
-                                                                    if af_tag == 'TABLE_redist':
-                                                                        for table_redist in row_af:
-                                                                            for row_redist in table_redist:
-                                                                                row_redist_tag = row_redist.tag[row_redist.tag.find('}')+1:]
-                                                                                # protocol
-                                                                                if row_redist_tag == 'protocol':
-                                                                                    protocol = row_redist.text
-                                                                                    if 'redistribution' not in af_dict:
-                                                                                        af_dict['redistribution'] = {}
-                                                                                    if protocol not in af_dict['redistribution']:
-                                                                                        af_dict['redistribution'][protocol] = {}
-                                                                                # route_map
-                                                                                if row_redist_tag == 'route-map':
-                                                                                    af_dict['redistribution'][protocol]['route_map'] = row_redist.text
-
-                                                                    # TABLE_evpn_export_rt
-                                                                    #   ROW_evpn_export_rt
-                                                                    if af_tag == 'TABLE_evpn_export_rt':
-                                                                        for table_evpn_export in row_af:
-                                                                            for row_export in table_evpn_export:
-                                                                                row_export_tag = row_export.tag[row_export.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_export_tag == 'evpn-export-rt':
-                                                                                    export_rt_list = str(export_rt_list + ' ' + row_export.text).strip()
-                                                                                    af_dict['export_rt_list'] = export_rt_list
-                                                                    # TABLE_evpn_import_rt
-                                                                    #   ROW_evpn_import_rt
-                                                                    if af_tag == 'TABLE_evpn_import_rt':
-                                                                        for table_evpn_import in row_af:
-                                                                            for row_import in table_evpn_import:
-                                                                                row_import_tag = row_import.tag[row_import.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_import_tag == 'evpn-import-rt':
-                                                                                    import_rt_list = str(import_rt_list + ' ' + row_import.text).strip()
-                                                                                    af_dict['import_rt_list'] = import_rt_list
-
-                                                                    # parsed all tags
-                                                                    continue
-                                                                                    
+
+        # Rows come once read, the rows nested in a row before it
+        for row in iter_xml_rows(self.xml_fields, output=out):
+            values = row.values
+
+            if row.tag == 'ROW_redist':
+                # redistribution of the address family
+                if 'protocol' in values:
+                    row.parents[-1].values.setdefault('redistribution', {})\
+                        [values.pop('protocol')] = values
+
+            elif row.tag in ('ROW_evpn_export_rt', 'ROW_evpn_import_rt'):
+                # export_rt_list / import_rt_list of the address family
+                if 'rt' in values:
+                    key = 'export_rt_list' if 'export' in row.tag else \
+                        'import_rt_list'
+                    row.parents[-1].values.setdefault(key, []).append(
+                        values['rt'])
+
+            elif row.tag == 'ROW_af':
+                vrf_name = row.parents[-1].values.get('vrf')
+                if vrf_name is None or 'af' not in values:
+                    continue
+                af_dict = etree_dict.setdefault('vrf', {})\
+                    .setdefault(vrf_name, {})\
+                    .setdefault('address_family', {})\
+                    .setdefault(values.pop('af'), {})
+                if 'peers' in values:
+                    peers = af_dict.setdefault('peers', {})\
+                        .setdefault(values.pop('peers'), {})
+                    for key in ('active_peers', 'routes', 'paths',
+                                'networks', 'aggregates'):
+                        if key in values:
+                            peers[key] = values.pop(key)
+                for key in ('critical', 'non_critical'):
+                    if key in values:
+                        af_dict.setdefault('next_hop_trigger_delay', {})\
+                            [key] = values.pop(key)
+                if values.pop('route_reflector', False):
+                    af_dict['route_reflector'] = True
+                for key in ('export_rt_list', 'import_rt_list'):
+                    if key in values:
+                        values[key] = ' '.join(values[key]).strip()
+                af_dict.update(values)
+
+            elif row.tag == 'ROW_vrf':
+                if 'vrf' not in values:
+                    continue
+                vrf_dict = etree_dict.setdefault('vrf', {})\
+                    .setdefault(values.pop('vrf'), {})
+                if 'num_established_peers' in values:
+                    vrf_dict['vrf_rd'] = 'not configured'
+                vrf_dict.update(values)
+
+            else:
+                srgb = (values.pop('srgbmin', None),
+                        values.pop('srgbmax', None))
+                if None not in srgb:
+                    etree_dict['segment_routing_global_block'] = \
+                        '-'.join(srgb)
+                etree_dict.update(values)
+
         return etree_dict
 
     def yang(self, vrf=''):
@@ -1722,7 +1675,8 @@ class ShowBgpVrfAllAllSchema(MetaParser):
 # =================================
 # Parser for 'show bgp vrf all all'
 # =================================
-class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
+class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema, IncrementalParser,
+                       CompactParser, JsonParser, SharedPathParser):
     """Parser for show bgp vrf <vrf>> <address_family>"""
 
     cli_command = 'show bgp vrf {vrf} {address_family}'
@@ -1733,8 +1687,9 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
       'path_type',
       'weight']
 
-    def cli(self, vrf='all', address_family='all', output=None):
-        if output is None:
+    def cli(self, vrf='all', address_family='all', output=None,
+            output_stream=None):
+        if output is None and output_stream is None:
             out = self.device.execute(self.cli_command.format(vrf=vrf,
                                                               address_family=address_family))
         else:
@@ -1793,7 +1748,7 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                                 ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
                                 ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
 
-        for line in out.splitlines():
+        for line in iter_lines(out, output_stream):
             line = line.rstrip()
             # Network            Next Hop            Metric     LocPrf     Weight Path
             m = p.match(line)
@@ -1844,8 +1799,9 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                         index += 1
 
                     # Init dict
-                    index_dict = af_dict.setdefault('prefixes', {}).setdefault(prefix, {})\
-                      .setdefault('index', {}).setdefault(index, {})
+                    index_dict = open_path(
+                        self, af_dict.setdefault('prefixes', {})
+                        .setdefault(prefix, {}).setdefault('index', {}), index)
 
                     # Set keys
                     index_dict['next_hop'] = next_hop
@@ -1882,8 +1838,7 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                     af_dict['prefixes'][prefix] = {}
                 if 'index' not in af_dict['prefixes'][prefix]:
                     af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+                open_path(self, af_dict['prefixes'][prefix]['index'], index)
 
                 # Set keys
                 af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
@@ -1948,8 +1903,7 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                     af_dict['prefixes'][prefix] = {}
                 if 'index' not in af_dict['prefixes'][prefix]:
                     af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+                open_path(self, af_dict['prefixes'][prefix]['index'], index)
 
                 # Set keys
                 af_dict['prefixes'][prefix]['index'][index]['next_hop'] = next_hop
@@ -2082,10 +2036,7 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
                     af_dict['prefixes'][prefix] = {}
                 if 'index' not in af_dict['prefixes'][prefix]:
                     af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+                open_path(self, af_dict['prefixes'][prefix]['index'], index)
 
                 # Set keys
                 af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
@@ -2180,6 +2131,117 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
 
         return parsed_dict
 
+    # show bgp vrf all all | json
+    json_fields = {
+        'ROW_vrf': {'vrf-name-out': 'vrf'},
+        'ROW_safi': {'af-name': ('address_family', str.lower),
+                     'table-version': ('bgp_table_version', int),
+                     'router-id': 'local_router_id'},
+        'ROW_rd': {'rd_val': 'route_distinguisher',
+                   'rd_vrf': 'default_vrf'},
+        'ROW_prefix': {'ipprefix': 'prefix',
+                       'ipv6prefix': 'prefix'},
+        'ROW_path': {'statuscode': 'status',
+                     'bestcode': 'best',
+                     'typecode': 'path_type',
+                     'ipnexthop': 'next_hop',
+                     'ipv6nexthop': 'next_hop',
+                     'metric': ('metric', int),
+                     'localpref': ('localprf', int),
+                     'weight': ('weight', int),
+                     'aspath': ('path', str.strip),
+                     'origin': 'origin_codes'}}
+
+    def json(self, vrf='all', address_family='all', output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(
+                vrf=vrf, address_family=address_family) + ' | json')
+
+        parsed_dict = {}
+        # Paths of the prefixes, indexed once all read
+        paths = {}
+
+        for row in iter_json_rows(self.json_fields, loads(output)):
+            if row.tag not in ('ROW_path', 'ROW_rd', 'ROW_safi'):
+                continue
+            rows = {parent.tag: parent.values
+                    for parent in row.parents + (row,)}
+            af_dict = self._json_af(parsed_dict, rows)
+            if af_dict is None or row.tag != 'ROW_path':
+                continue
+            prefix = rows.get('ROW_prefix', {}).get('prefix')
+            values = row.values
+            if not prefix or not values.get('next_hop'):
+                continue
+
+            index_dict = {'next_hop': values['next_hop']}
+            status_codes = values.get('status', '') + values.get('best', '')
+            if status_codes.strip():
+                index_dict['status_codes'] = status_codes
+            path_type = values.get('path_type', '').strip()
+            if path_type:
+                index_dict['path_type'] = path_type
+            for key in ('metric', 'localprf', 'weight', 'path',
+                        'origin_codes'):
+                if values.get(key, '') != '':
+                    index_dict[key] = values[key]
+            paths.setdefault(id(af_dict), (af_dict, {}))[1]\
+                .setdefault(prefix, []).append(index_dict)
+
+            # Check if aggregate_address_ipv4_address
+            if 'a' in path_type:
+                if ':' in prefix:
+                    af_dict['v6_aggregate_address_ipv6_address'] = prefix
+                    af_dict['v6_aggregate_address_as_set'] = True
+                    af_dict['v6_aggregate_address_summary_only'] = True
+                else:
+                    address, mask = prefix.split('/')
+                    af_dict['aggregate_address_ipv4_address'] = address
+                    af_dict['aggregate_address_ipv4_mask'] = mask
+                    af_dict['aggregate_address_as_set'] = True
+                    af_dict['aggregate_address_summary_only'] = True
+
+        # Indexes ordered by next hop, as cli()
+        for af_dict, prefixes in paths.values():
+            prefixes_dict = af_dict.setdefault('prefixes', {})
+            for prefix, index_dicts in prefixes.items():
+                index_dicts.sort(key=lambda index_dict: index_dict['next_hop'])
+                prefixes_dict[prefix] = {'index': {
+                    index: index_dict
+                    for index, index_dict in enumerate(index_dicts, 1)}}
+
+        return parsed_dict
+
+    @staticmethod
+    def _json_af(parsed_dict, rows):
+        # Address family dict of the ROW_safi, or of the route distinguisher
+        # of its ROW_rd, rows being the values of the rows by tag
+        vrf_name = rows.get('ROW_vrf', {}).get('vrf')
+        safi = rows.get('ROW_safi', {})
+        address_family = safi.get('address_family')
+        if not vrf_name or not address_family:
+            return None
+        af_dicts = parsed_dict.setdefault('vrf', {}).setdefault(vrf_name, {})\
+            .setdefault('address_family', {})
+        af_dict = af_dicts.setdefault(address_family, {})
+        for key in ('bgp_table_version', 'local_router_id'):
+            if key in safi:
+                af_dict[key] = safi[key]
+
+        rd = rows.get('ROW_rd', {})
+        route_distinguisher = rd.get('route_distinguisher')
+        if not route_distinguisher:
+            return af_dict
+        rd_dict = af_dicts.setdefault(
+            address_family + ' RD ' + route_distinguisher, {})
+        rd_dict.update({key: af_dict[key] for key in
+                        ('bgp_table_version', 'local_router_id')
+                        if key in af_dict})
+        rd_dict['route_distinguisher'] = route_distinguisher
+        if rd.get('default_vrf'):
+            rd_dict['default_vrf'] = rd['default_vrf']
+        return rd_dict
+
 
 # ==============================================
 # Schema for 'show bgp vrf <vrf> all neighbors'
@@ -2365,6 +2427,189 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
       'tbl_ver',
       'msg_rcvd']
 
+    p1 = LazyRegex(r'^\s*BGP +neighbor +is +(?P<neighbor_id>[a-zA-Z0-9\.\:]+),'
+                       ' +remote +AS +(?P<remote_as>[0-9]+),'
+                       '(?: +local +AS +(?P<local_as>[0-9]+),)?'
+                       ' +(?P<link>[a-zA-Z]+) +link,'
+                       '( +(?P<peer_fab_type>[fabric\-\S]+),)?'
+                       ' +Peer +index +(?P<peer_index>[0-9]+)$')
+
+    p2 = LazyRegex(r'^\s*Description *: +(?P<description>(\S+))$')
+
+    p3 = LazyRegex(r'^\s*BGP +version +(?P<bgp_version>[0-9]+),'
+                       ' +remote +router +ID +(?P<router_id>[0-9\.]+)$')
+
+    p4 = LazyRegex(r'^\s*\s*BGP +state += +(?P<session_state>(\S+))'
+                       '(?: +\((?P<reason>([a-zA-Z\s]+))\))?,'
+                       ' +(up|down) +for +(?P<up_time>[a-zA-Z0-9\:\.]+)'
+                       '(?: *, +retry +in +(?P<retry_time>[0-9\.\:]+))?$')
+
+    p5 = LazyRegex(r'^\s*Using +(?P<update_source>[a-zA-Z0-9]+)'
+                       ' +as +update +source +for +this +peer$')
+
+    p6 = LazyRegex(r'^\s*BFD live-detection is configured'
+                       '(?: +and +(?P<bfd_enabled>(\S+)), +state +is'
+                       ' +(?P<bfd_state>(\S+)))?$')
+
+    p7 = LazyRegex(r'^\s*Neighbor +local-as +command'
+                       ' +(?P<nbr_local_as_cmd>[a-zA-Z\s]+)$')
+
+    p8 = LazyRegex(r'^\s*Last +read +(?P<last_read>[a-zA-Z0-9\:]+),'
+                       ' +hold +time += +(?P<holdtime>[0-9]+), +keepalive'
+                       ' +interval +is +(?P<keepalive_interval>[0-9]+)'
+                       ' +seconds$')
+
+    p9 = LazyRegex(r'^\s*Last +written'
+                       ' +(?P<last_written>[a-zA-Z0-9\:]+), +keepalive'
+                       ' +timer +(?P<keepalive_timer>[a-zA-Z0-9\:\s]+)$')
+
+    p10 = LazyRegex(r'^\s*Inherits +session +configuration +from'
+                    ' +session-template +(?P<template>[a-zA-Z\-\_]+)$')
+
+    p11 = LazyRegex(r'^\s*Connected check is disabled$')
+
+    p11_2 = LazyRegex(r'^\s*Private +AS +numbers +removed +from +updates +sent +to +this +neighbor$')
+
+    p12_1 = LazyRegex(r'^\s*External +BGP +peer +might +be +upto'
+                       ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
+
+    p12_2 = LazyRegex(r'^\s*External +BGP +peer +might +be +up to'
+                       ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
+
+    p13 = LazyRegex(r'^\s*TCP +MD5 +authentication +is'
+                       ' +(?P<tcp_md5_auth>[a-zA-Z\(\)\s]+)$')
+
+    p14 = LazyRegex(r'^\s*Only +passive +connection +setup +allowed$')
+
+    p15 = LazyRegex(r'^\s*Received +(?P<received_messages>[0-9]+)'
+                       ' +messages, +(?P<received_notifications>[0-9]+)'
+                       ' +notifications, +(?P<received_bytes>[0-9]+)'
+                       ' +bytes +in +queue$')
+
+    p16 = LazyRegex(r'^\s*Sent +(?P<sent_messages>[0-9]+)'
+                       ' +messages, +(?P<sent_notifications>[0-9]+)'
+                       ' +notifications, +(?P<sent_bytes_queue>[0-9]+)'
+                       ' +bytes +in +queue$')
+
+    p17 = LazyRegex(r'^\s*Connections +established'
+                       ' +(?P<esablished>[0-9]+), +dropped'
+                       ' +(?P<dropped>[0-9]+)$')
+
+    p17_1 = LazyRegex(r'^\s*Connections +attempts'
+                       ' +(?P<attemps>[0-9]+)$')
+
+    p18 = LazyRegex(r'^\s*Last +reset +by (?P<reset_by>[a-zA-Z]+)'
+                       ' +(?P<last_reset>[a-zA-Z0-9\:\s]+), +due +to'
+                       ' +(?P<reset_reason>[a-zA-Z\-\s]+)$')
+
+    p19 = LazyRegex(r'^\s*Neighbor +capabilities *:$')
+
+    p20_1 = LazyRegex(r'^\s*Dynamic +capability *:'
+                       ' +(?P<dynamic_capability>[a-zA-Z\,\(\)\s]+)$')
+
+    p20_2 = LazyRegex(r'^\s*Dynamic +capability +\(old\) *:'
+                       ' +(?P<dynamic_capability_old>[a-zA-Z\s]+)$')
+
+    p21 = LazyRegex(r'^\s*Route +refresh +capability +\(new\) *:'
+                       ' +(?P<route_refresh>[a-zA-Z\s]+)$')
+
+    p21_1 = LazyRegex(r'^\s*Route +refresh +capability +\(old\) *:'
+                       ' +(?P<route_refresh_old>[a-zA-Z\s]+)$')
+
+    p22 = LazyRegex(r'^\s*4-Byte AS capability: +(?P<capability>[\w\s]+)$')
+
+    p23 = LazyRegex(r'^\s*Address +family +VPNv4 +Unicast *:'
+                       ' +(?P<vpnv4_unicast>[a-zA-Z\s]+)$')
+
+    p24 = LazyRegex(r'^\s*Address +family +VPNv6 +Unicast *:'
+                       ' +(?P<vpnv6_unicast>[a-zA-Z\s]+)$')
+
+    p24_1 = LazyRegex(r'^\s*Address +family +IPv4 +MVPN:'
+                       ' +(?P<ipv4_mvpn>[\w\s]+)$')
+
+    p25 = LazyRegex(r'^\s*Graceful +Restart +capability *:'
+                       ' +(?P<graceful_restart>[a-zA-Z\s]+)$')
+
+    p26 = LazyRegex(r'^\s*Graceful +Restart +Parameters *:$')
+
+    p27_1 = LazyRegex(r'^\s*$')
+
+    p27_2 = LazyRegex(r'^\s*$')
+
+    p28_1 = LazyRegex(r'^\s*Restart +time +advertised +to +peer *:'
+                       ' +(?P<time>[0-9]+) +seconds$')
+
+    p28_2 = LazyRegex(r'^\s*Restart +time +advertised +by +peer *:'
+                       ' +(?P<time>[0-9]+) +seconds$')
+
+    p28 = LazyRegex(r'^\s*Stale +time +for +routes +advertised +by'
+                       ' +peer *: +(?P<time>[0-9]+) +seconds$')
+
+    p30 = LazyRegex(r'^\s*(?P<message_stat>[a-zA-Z\s]+) *:'
+                       ' +(?P<sent>[0-9]+) +(?P<received>[0-9]+)$')
+
+    p31 = LazyRegex(r'^\s*For +address +family *:'
+                       ' +(?P<af>[a-zA-Z0-9\s]+)$')
+
+    p32 = LazyRegex(r'^\s*BGP +table +version'
+                       ' +(?P<af_bgp_table_version>[0-9]+), +neighbor'
+                       ' +version +(?P<nbr_version>[0-9]+)$')
+
+    p33 = LazyRegex(r'^\s*(?P<accepted_paths>[0-9]+) +accepted'
+                       ' +paths +consume +(?P<bytes_consumed>[0-9]+)'
+                       ' +bytes +of +memory$')
+
+    p34 = LazyRegex(r'^\s*(?P<num_sent_paths>[0-9]+) +sent +paths$')
+
+    p35 = LazyRegex(r'^\s*Community +attribute +sent +to +this'
+                       ' +neighbor$')
+
+    p36 = LazyRegex(r'^\s*Extended +community +attribute +sent +to'
+                       ' +this +neighbor$')
+
+    p37 = LazyRegex(r'^\s*Maximum +prefixes +allowed +(?P<num>[0-9]+)$')
+
+    p38 = LazyRegex(r'^\s*Inbound +route-map +configured +is'
+                       ' +(?P<route_map_name_in>(\S+)), +handle'
+                       ' +obtained$')
+
+    p39 = LazyRegex(r'^\s*Outbound +route-map +configured +is'
+                       ' +(?P<route_map_name_out>(\S+)), +handle'
+                       ' +obtained$')
+
+    p40 = LazyRegex(r'^\s*Third-party +Nexthop +will +not +be'
+                       ' +computed.$')
+
+    p41 = LazyRegex(r'^\s*SOO +Extcommunity *:'
+                       ' +(?P<soo>[a-zA-Z0-9\:]+)$')
+
+    p42 = LazyRegex(r'^\s*Inbound +soft +reconfiguration +allowed$')
+
+    p43 = LazyRegex(r'\s*Nexthop(?: +always)? +set +to +local +peering'
+                       ' +address, +(?P<ip>[\w\.\:]+)$')
+
+    p44 = LazyRegex(r'^\s*Allow +my +ASN +(?P<num>[0-9]+) +times$')
+
+    p45 = LazyRegex(r'^\s*ASN override is enabled$')
+
+    p46 = LazyRegex(r'^\s*Default +information +originate,'
+                       '(?: +route-map +(?P<route_map>(\S+)),)?'
+                       ' +default(?: +not)? +sent$')
+
+    p48 = LazyRegex(r'^\s*(?P<inherit_peer_seq>[0-9]+)'
+                       ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
+
+    p49 = LazyRegex(r'^\s*Local +host *: +(?P<local_host>[0-9\.\:]+),'
+                       ' +Local +port *: +(?P<local_port>[0-9]+)$')
+
+    p50 = LazyRegex(r'^\s*Foreign +host *:'
+                       ' +(?P<foreign_host>[0-9\.\:]+), +Foreign'
+                       ' +port *: +(?P<foreign_port>[0-9]+)$')
+
+    p51 = LazyRegex(r'^\s*fd += +(?P<fd>[0-9]+)$')
+
+    p52 = LazyRegex(r'^\s*Route reflector client$')
+
     def cli(self, vrf='all', address_family='all', neighbor='', output=None):
         if output is None:
             if neighbor:
@@ -2384,138 +2629,13 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
         parsed_dict = {}
         standard_send_community = False
 
-        p1 = re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor_id>[a-zA-Z0-9\.\:]+),'
-                            ' +remote +AS +(?P<remote_as>[0-9]+),'
-                            '(?: +local +AS +(?P<local_as>[0-9]+),)?'
-                            ' +(?P<link>[a-zA-Z]+) +link,'
-                            '( +(?P<peer_fab_type>[fabric\-\S]+),)?'
-                            ' +Peer +index +(?P<peer_index>[0-9]+)$')
-        p2 = re.compile(r'^\s*Description *: +(?P<description>(\S+))$')
-        p3 = re.compile(r'^\s*BGP +version +(?P<bgp_version>[0-9]+),'
-                            ' +remote +router +ID +(?P<router_id>[0-9\.]+)$')
-        p4 = re.compile(r'^\s*\s*BGP +state += +(?P<session_state>(\S+))'
-                            '(?: +\((?P<reason>([a-zA-Z\s]+))\))?,'
-                            ' +(up|down) +for +(?P<up_time>[a-zA-Z0-9\:\.]+)'
-                            '(?: *, +retry +in +(?P<retry_time>[0-9\.\:]+))?$')
-        p5 = re.compile(r'^\s*Using +(?P<update_source>[a-zA-Z0-9]+)'
-                            ' +as +update +source +for +this +peer$')
-        p6 = re.compile(r'^\s*BFD live-detection is configured'
-                            '(?: +and +(?P<bfd_enabled>(\S+)), +state +is'
-                            ' +(?P<bfd_state>(\S+)))?$')
-        p7 = re.compile(r'^\s*Neighbor +local-as +command'
-                            ' +(?P<nbr_local_as_cmd>[a-zA-Z\s]+)$')
-        p8 = re.compile(r'^\s*Last +read +(?P<last_read>[a-zA-Z0-9\:]+),'
-                            ' +hold +time += +(?P<holdtime>[0-9]+), +keepalive'
-                            ' +interval +is +(?P<keepalive_interval>[0-9]+)'
-                            ' +seconds$')
-        p9 = re.compile(r'^\s*Last +written'
-                            ' +(?P<last_written>[a-zA-Z0-9\:]+), +keepalive'
-                            ' +timer +(?P<keepalive_timer>[a-zA-Z0-9\:\s]+)$')
-        p10 = re.compile(r'^\s*Inherits +session +configuration +from'
-                        ' +session-template +(?P<template>[a-zA-Z\-\_]+)$')
-        p11 = re.compile(r'^\s*Connected check is disabled$')
-        p11_2 = re.compile(r'^\s*Private +AS +numbers +removed +from +updates +sent +to +this +neighbor$')
-        p12_1 = re.compile(r'^\s*External +BGP +peer +might +be +upto'
-                            ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
-        p12_2 = re.compile(r'^\s*External +BGP +peer +might +be +up to'
-                            ' +(?P<ebgp_multihop_max_hop>[0-9]+) +hops +away$')
-        p13 = re.compile(r'^\s*TCP +MD5 +authentication +is'
-                            ' +(?P<tcp_md5_auth>[a-zA-Z\(\)\s]+)$')
-        p14 = re.compile(r'^\s*Only +passive +connection +setup +allowed$')
-        p15 = re.compile(r'^\s*Received +(?P<received_messages>[0-9]+)'
-                            ' +messages, +(?P<received_notifications>[0-9]+)'
-                            ' +notifications, +(?P<received_bytes>[0-9]+)'
-                            ' +bytes +in +queue$')
-        p16 = re.compile(r'^\s*Sent +(?P<sent_messages>[0-9]+)'
-                            ' +messages, +(?P<sent_notifications>[0-9]+)'
-                            ' +notifications, +(?P<sent_bytes_queue>[0-9]+)'
-                            ' +bytes +in +queue$')
-        p17 = re.compile(r'^\s*Connections +established'
-                            ' +(?P<esablished>[0-9]+), +dropped'
-                            ' +(?P<dropped>[0-9]+)$')
-        p17_1 = re.compile(r'^\s*Connections +attempts'
-                            ' +(?P<attemps>[0-9]+)$')
-        p18 = re.compile(r'^\s*Last +reset +by (?P<reset_by>[a-zA-Z]+)'
-                            ' +(?P<last_reset>[a-zA-Z0-9\:\s]+), +due +to'
-                            ' +(?P<reset_reason>[a-zA-Z\-\s]+)$')
-        p19 = re.compile(r'^\s*Neighbor +capabilities *:$')
-        p20_1 = re.compile(r'^\s*Dynamic +capability *:'
-                            ' +(?P<dynamic_capability>[a-zA-Z\,\(\)\s]+)$')
-        p20_2 = re.compile(r'^\s*Dynamic +capability +\(old\) *:'
-                            ' +(?P<dynamic_capability_old>[a-zA-Z\s]+)$')
-        p21 = re.compile(r'^\s*Route +refresh +capability +\(new\) *:'
-                            ' +(?P<route_refresh>[a-zA-Z\s]+)$')
-        p21_1 = re.compile(r'^\s*Route +refresh +capability +\(old\) *:'
-                            ' +(?P<route_refresh_old>[a-zA-Z\s]+)$')
-        p22 = re.compile(r'^\s*4-Byte AS capability: +(?P<capability>[\w\s]+)$')
-        p23 = re.compile(r'^\s*Address +family +VPNv4 +Unicast *:'
-                            ' +(?P<vpnv4_unicast>[a-zA-Z\s]+)$')
-        p24 = re.compile(r'^\s*Address +family +VPNv6 +Unicast *:'
-                            ' +(?P<vpnv6_unicast>[a-zA-Z\s]+)$')
-        p24_1 = re.compile(r'^\s*Address +family +IPv4 +MVPN:'
-                            ' +(?P<ipv4_mvpn>[\w\s]+)$')
-        p25 = re.compile(r'^\s*Graceful +Restart +capability *:'
-                            ' +(?P<graceful_restart>[a-zA-Z\s]+)$')
-        p26 = re.compile(r'^\s*Graceful +Restart +Parameters *:$')
-        p27_1 = re.compile(r'^\s*$')
-        p27_2 = re.compile(r'^\s*$')
-        p28_1 = re.compile(r'^\s*Restart +time +advertised +to +peer *:'
-                            ' +(?P<time>[0-9]+) +seconds$')
-        p28_2 = re.compile(r'^\s*Restart +time +advertised +by +peer *:'
-                            ' +(?P<time>[0-9]+) +seconds$')
-        p28 = re.compile(r'^\s*Stale +time +for +routes +advertised +by'
-                            ' +peer *: +(?P<time>[0-9]+) +seconds$')
-        p30 = re.compile(r'^\s*(?P<message_stat>[a-zA-Z\s]+) *:'
-                            ' +(?P<sent>[0-9]+) +(?P<received>[0-9]+)$')
-        p31 = re.compile(r'^\s*For +address +family *:'
-                            ' +(?P<af>[a-zA-Z0-9\s]+)$')
-        p32 = re.compile(r'^\s*BGP +table +version'
-                            ' +(?P<af_bgp_table_version>[0-9]+), +neighbor'
-                            ' +version +(?P<nbr_version>[0-9]+)$')
-        p33 = re.compile(r'^\s*(?P<accepted_paths>[0-9]+) +accepted'
-                            ' +paths +consume +(?P<bytes_consumed>[0-9]+)'
-                            ' +bytes +of +memory$')
-        p34 = re.compile(r'^\s*(?P<num_sent_paths>[0-9]+) +sent +paths$')
-        p35 = re.compile(r'^\s*Community +attribute +sent +to +this'
-                            ' +neighbor$')
-        p36 = re.compile(r'^\s*Extended +community +attribute +sent +to'
-                            ' +this +neighbor$')
-        p37 = re.compile(r'^\s*Maximum +prefixes +allowed +(?P<num>[0-9]+)$')
-        p38 = re.compile(r'^\s*Inbound +route-map +configured +is'
-                            ' +(?P<route_map_name_in>(\S+)), +handle'
-                            ' +obtained$')
-        p39 = re.compile(r'^\s*Outbound +route-map +configured +is'
-                            ' +(?P<route_map_name_out>(\S+)), +handle'
-                            ' +obtained$')
-        p40 = re.compile(r'^\s*Third-party +Nexthop +will +not +be'
-                            ' +computed.$')
-        p41 = re.compile(r'^\s*SOO +Extcommunity *:'
-                            ' +(?P<soo>[a-zA-Z0-9\:]+)$')
-        p42 = re.compile(r'^\s*Inbound +soft +reconfiguration +allowed$')
-        p43 = re.compile(r'\s*Nexthop(?: +always)? +set +to +local +peering'
-                            ' +address, +(?P<ip>[\w\.\:]+)$')
-        p44 = re.compile(r'^\s*Allow +my +ASN +(?P<num>[0-9]+) +times$')
-        p45 = re.compile(r'^\s*ASN override is enabled$')
-        p46 = re.compile(r'^\s*Default +information +originate,'
-                            '(?: +route-map +(?P<route_map>(\S+)),)?'
-                            ' +default(?: +not)? +sent$')
-        p48 = re.compile(r'^\s*(?P<inherit_peer_seq>[0-9]+)'
-                            ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
-        p49 = re.compile(r'^\s*Local +host *: +(?P<local_host>[0-9\.\:]+),'
-                            ' +Local +port *: +(?P<local_port>[0-9]+)$')
-        p50 = re.compile(r'^\s*Foreign +host *:'
-                            ' +(?P<foreign_host>[0-9\.\:]+), +Foreign'
-                            ' +port *: +(?P<foreign_port>[0-9]+)$')
-        p51 = re.compile(r'^\s*fd += +(?P<fd>[0-9]+)$')
-        p52 = re.compile(r'^\s*Route reflector client$')
-            
         for line in out.splitlines():
             line = line.rstrip()
 
             # BGP neighbor is 10.16.2.2,  remote AS 100, ibgp link,  Peer index 1
             # BGP neighbor is 10.16.2.5,  remote AS 200, local AS 333, ebgp link,  Peer index 2
             # BGP neighbor is 10.186.0.4, remote AS 1, ibgp link, fabric-internal, Peer index 2
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 standard_send_community = False
                 if 'neighbor' not in parsed_dict:
@@ -2540,14 +2660,14 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                     continue
 
             # Description: nei_desc
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['description'] = \
                         str(m.groupdict()['description'])
                 continue
 
             # BGP version 4, remote router ID 10.16.2.2
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['bgp_version'] = \
                         int(m.groupdict()['bgp_version'])
@@ -2558,7 +2678,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # BGP state = Established, up for 5w0d
             # BGP state = Idle, down for 4w6d, retry in 0.000000
             # BGP state = Shut (Admin), down for 5w0d
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['session_state'] = \
                         str(m.groupdict()['session_state']).lower()
@@ -2577,7 +2697,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                     continue
 
             # Using loopback0 as update source for this peer
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['update_source'] = \
                         str(m.groupdict()['update_source'])
@@ -2585,7 +2705,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # BFD live-detection is configured
             # BFD live-detection is configured and enabled, state is Up
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['bfd_live_detection'] = \
                     True
@@ -2598,7 +2718,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Neighbor local-as command not active
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['nbr_local_as_cmd'] = \
                         str(m.groupdict()['nbr_local_as_cmd'])
@@ -2607,7 +2727,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # Last read 00:00:24, hold time = 99, keepalive interval is 33 seconds
             # Last read never, hold time = 180, keepalive interval is 60 seconds
             # Last read never, hold time = 45, keepalive interval is 15 seconds
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 if 'bgp_negotiated_keepalive_timers' not in \
                     parsed_dict['neighbor'][neighbor_id]:
@@ -2626,7 +2746,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # Last written 00:00:02, keepalive timer expiry due 00:00:30
             # Last written never, keepalive timer not running
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 if 'bgp_negotiated_keepalive_timers' not in \
                     parsed_dict['neighbor'][neighbor_id]:
@@ -2641,27 +2761,27 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Inherits session configuration from session-template PEER-SESSION
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['inherit_peer_session'] = \
                     str(m.groupdict()['template'])
                 continue
 
             # Connected check is disabled
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['disable_connected_check'] = True
                 continue
 
             # Private AS numbers removed from updates sent to this neighbor
-            m = p11_2.match(line)
+            m = self.p11_2.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['remove_private_as'] = True
                 continue
 
             # External BGP peer might be upto 255 hops away
-            m = p12_1.match(line)
+            m = self.p12_1.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['ebgp_multihop'] = True
                 parsed_dict['neighbor'][neighbor_id]['ebgp_multihop_max_hop'] =\
@@ -2669,7 +2789,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # External BGP peer might be up to 5 hops away
-            m = p12_2.match(line)
+            m = self.p12_2.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['ebgp_multihop'] = True
                 parsed_dict['neighbor'][neighbor_id]['ebgp_multihop_max_hop'] =\
@@ -2678,7 +2798,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # TCP MD5 authentication is enabled
             # TCP MD5 authentication is set (disabled)
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['tcp_md5_auth'] = \
                     str(m.groupdict()['tcp_md5_auth'])
@@ -2687,7 +2807,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
             
             # Only passive connection setup allowed
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2702,7 +2822,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Received 92717 messages, 3 notifications, 0 bytes in queue
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['received_messages'] = \
                     int(m.groupdict()['received_messages'])
@@ -2713,7 +2833,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Sent 92730 messages, 5 notifications, 0 bytes in queue
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['sent_messages'] = \
                     int(m.groupdict()['sent_messages'])
@@ -2724,7 +2844,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Connections established 9, dropped 8
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2742,7 +2862,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Connections attempts 0
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2759,7 +2879,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # Last reset by us 5w0d, due to session cleared
             # Last reset by peer 5w0d, due to session cleared
             # Last reset by us never, due to No error
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2781,7 +2901,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Neighbor capabilities:
-            m = p19.match(line)
+            m = self.p19.match(line)
             if m:
                 if 'bgp_negotiated_capabilities' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2790,7 +2910,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Dynamic capability: advertised (mp, refresh, gr) received (mp, refresh, gr)
-            m = p20_1.match(line)
+            m = self.p20_1.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['dynamic_capability'] = \
@@ -2798,7 +2918,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Dynamic capability (old): advertised received
-            m = p20_2.match(line)
+            m = self.p20_2.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['dynamic_capability_old'] = \
@@ -2806,7 +2926,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Route refresh capability (new): advertised received
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['route_refresh'] = \
@@ -2814,7 +2934,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Route refresh capability (old): advertised received 
-            m = p21_1.match(line)
+            m = self.p21_1.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['route_refresh_old'] = \
@@ -2823,14 +2943,14 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # 4-Byte AS capability: disabled
             # 4-Byte AS capability: disabled received
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 if 'disabled' in m.groupdict()['capability']:
                     parsed_dict['neighbor'][neighbor_id]['suppress_four_byte_as_capability'] = True
                 continue
 
             # Address family VPNv4 Unicast: advertised received
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['vpnv4_unicast'] = \
@@ -2838,7 +2958,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Address family VPNv6 Unicast: advertised received 
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['vpnv6_unicast'] = \
@@ -2846,7 +2966,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Address family IPv4 MVPN: advertised received
-            m = p24_1.match(line)
+            m = self.p24_1.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id] \
                     ['bgp_negotiated_capabilities']['ipv4_mvpn'] = \
@@ -2854,7 +2974,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Graceful Restart capability: advertised received
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['bgp_negotiated_capabilities']['graceful_restart'] = \
@@ -2862,7 +2982,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Graceful Restart Parameters:
-            m = p26.match(line)
+            m = self.p26.match(line)
             if m:
                 if 'graceful_restart_paramters' not in \
                     parsed_dict['neighbor'][neighbor_id]:
@@ -2872,19 +2992,19 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # Address families advertised to peer:
             # VPNv4 Unicast  VPNv6 Unicast 
-            m = p27_1.match(line)
+            m = self.p27_1.match(line)
             if m:
                 continue
 
             # Address families received from peer:
             # VPNv4 Unicast  VPNv6 Unicast  
-            m = p27_2.match(line)
+            m = self.p27_2.match(line)
             if m:
                 continue
 
             # Forwarding state preserved by peer for:
             # Restart time advertised to peer: 240 seconds
-            m = p28_1.match(line)
+            m = self.p28_1.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['graceful_restart_paramters']\
@@ -2893,7 +3013,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Restart time advertised by peer: 120 seconds
-            m = p28_2.match(line)
+            m = self.p28_2.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['graceful_restart_paramters']\
@@ -2902,7 +3022,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Stale time for routes advertised by peer: 600 seconds
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]\
                     ['graceful_restart_paramters']\
@@ -2921,7 +3041,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # Total:                     92730              92717  
             # Total bytes:             1763812            1763099  
             # Bytes in queue:                0                  0
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 if 'bgp_neighbor_counters' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -2956,7 +3076,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # For address family: VPNv4 Unicast
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 if 'address_family' not in  parsed_dict['neighbor'][neighbor_id]:
                     parsed_dict['neighbor'][neighbor_id]['address_family'] = {}
@@ -2975,7 +3095,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # BGP table version 48, neighbor version 48
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 standard_send_community = False
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
@@ -2987,7 +3107,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # 1 accepted paths consume 48 bytes of memory
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 if 'path' not in parsed_dict['neighbor'][neighbor_id]\
                     ['address_family'][address_family]:
@@ -3002,7 +3122,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # 2 sent paths
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 if 'path' not in parsed_dict['neighbor'][neighbor_id]\
                     ['address_family'][address_family]:
@@ -3014,7 +3134,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
             
             # Community attribute sent to this neighbor
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 standard_send_community = True
                 parsed_dict['neighbor'][neighbor_id]['address_family'] \
@@ -3022,7 +3142,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Extended community attribute sent to this neighbor
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family'] \
                     [address_family]['send_community'] = 'extended'
@@ -3033,7 +3153,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Maximum prefixes allowed 300000
-            m = p37.match(line)
+            m = self.p37.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['maximum_prefix_max_prefix_no'] = \
@@ -3041,7 +3161,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Inbound route-map configured is genie_redistribution, handle obtained
-            m = p38.match(line)
+            m = self.p38.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['route_map_name_in'] = \
@@ -3049,7 +3169,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Outbound route-map configured is genie_redistribution, handle obtained
-            m = p39.match(line)
+            m = self.p39.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['route_map_name_out'] = \
@@ -3057,21 +3177,21 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Third-party Nexthop will not be computed.
-            m = p40.match(line)
+            m = self.p40.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['third_party_nexthop'] = True
                 continue
             
             # SOO Extcommunity: SOO:100:100
-            m = p41.match(line)
+            m = self.p41.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['soo'] = str(m.groupdict()['soo'])
                 continue
 
             # Inbound soft reconfiguration allowed
-            m = p42.match(line)
+            m = self.p42.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['soft_configuration'] = True
@@ -3079,14 +3199,14 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
 
             # Nexthop always set to local peering address, 0.0.0.0
             # Nexthop set to local peering address, 0.0.0.0
-            m = p43.match(line)
+            m = self.p43.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['next_hop_self'] = True
                 continue
 
             # Allow my ASN 9 times
-            m = p44.match(line)
+            m = self.p44.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['as_override_count'] = \
@@ -3094,7 +3214,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # ASN override is enabled
-            m = p45.match(line)
+            m = self.p45.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['as_override'] = True
@@ -3103,7 +3223,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # Default information originate, default not sent
             # Default information originate, default sent
             # Default information originate, route-map SOMENAME, default not sent
-            m = p46.match(line)
+            m = self.p46.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['default_originate'] = True
@@ -3117,7 +3237,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
             # Preference    Name
             #         10    PEER-POLICY                                                 
             #         20    PEER-POLICY2
-            m = p48.match(line)
+            m = self.p48.match(line)
             if m:
                 policy_name = str(m.groupdict()['policy_name'])
                 inherit_peer_seq = int(m.groupdict()['inherit_peer_seq'])
@@ -3137,7 +3257,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                     continue
 
             # Local host: 10.4.1.1, Local port: 179
-            m = p49.match(line)
+            m = self.p49.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -3156,7 +3276,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Foreign host: 10.16.2.2, Foreign port: 4466
-            m = p50.match(line)
+            m = self.p50.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -3175,7 +3295,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
             
             # fd = 44
-            m = p51.match(line)
+            m = self.p51.match(line)
             if m:
                 if 'bgp_session_transport' not in parsed_dict['neighbor']\
                     [neighbor_id]:
@@ -3190,7 +3310,7 @@ class ShowBgpVrfAllNeighbors(ShowBgpVrfAllNeighborsSchema):
                 continue
 
             # Route reflector client
-            m = p52.match(line)
+            m = self.p52.match(line)
             if m:
                 parsed_dict['neighbor'][neighbor_id]['address_family']\
                     [address_family]['route_reflector_client'] = True
@@ -3837,313 +3957,155 @@ class ShowBgpVrfAllAllSummary(ShowBgpVrfAllAllSummarySchema):
 
         return sum_dict
 
-    def xml(self, vrf='all', address_family='all'):
+    # Leaves of the rows of the xml reply
+    xml_fields = {
+        'ROW_vrf': {
+            'vrf-name-out': 'vrf',
+            'vrf-router-id': 'route_identifier',
+            'vrf-local-as': ('local_as', int)},
+        'ROW_saf': {
+            'af-name': ('af', str.lower),
+            'tableversion': ('bgp_table_version', int),
+            'configuredpeers': ('config_peers', int),
+            'capablepeers': ('capable_peers', int),
+            'totalnetworks': ('total_prefix_entries', int),
+            'totalpaths': ('total_path_entries', int),
+            'memoryused': ('memory_usage', int),
+            'numberattrs': 'numberattrs',
+            'bytesattrs': 'bytesattrs',
+            'numberpaths': 'numberpaths',
+            'bytespaths': 'bytespaths',
+            'numbercommunities': 'numbercommunities',
+            'bytescommunities': 'bytescommunities',
+            'numberclusterlist': 'numberclusterlist',
+            'bytesclusterlist': 'bytesclusterlist',
+            'dampening': ('dampening', str.lower),
+            'historypaths': ('history_paths', int),
+            'dampenedpaths': ('dampened_paths', int),
+            'softreconfigrecvdpaths': ('soft_reconfig_recvd_paths', int),
+            'softreconfigidenticalpaths':
+                ('soft_reconfig_identical_paths', int),
+            'softreconfigcombopaths': ('soft_reconfig_combo_paths', int),
+            'softreconfigfilteredrecvd':
+                ('soft_reconfig_filtered_recvd', int),
+            'softreconfigbytes': ('soft_reconfig_bytes', int)},
+        'ROW_neighbor': {
+            'neighborid': 'neighbor',
+            'neighborversion': ('neighbor_table_version', int),
+            'msgrecvd': ('msg_rcvd', int),
+            'msgsent': ('msg_sent', int),
+            'neighbortableversion': ('tbl_ver', int),
+            'inq': ('inq', int),
+            'outq': ('outq', int),
+            'neighboras': ('as', int),
+            'time': 'up_down',
+            'state': ('state', str.lower),
+            'prefixreceived': 'prefix_received'},
+    }
 
-        out = self.device.execute(self.xml_command.format(vrf=vrf))
+    # '[<number>/<bytes>]' entries of the address families
+    xml_entries = [('attribute_entries', 'numberattrs', 'bytesattrs'),
+                   ('as_path_entries', 'numberpaths', 'bytespaths'),
+                   ('community_entries', 'numbercommunities',
+                    'bytescommunities'),
+                   ('clusterlist_entries', 'numberclusterlist',
+                    'bytesclusterlist')]
+
+    def _xml_af(self, row):
+        # Attributes of the address family of a ROW_saf, copied to each of
+        # its neighbors, None for an invalid entry
+        values = row.values
+        # for valid entry, table version should be there
+        if 'af' not in values or 'bgp_table_version' not in values:
+            return None
+        vrf_values = row.parents[0].values
+        af_dict = {}
+        if vrf_values.get('route_identifier'):
+            af_dict['route_identifier'] = vrf_values['route_identifier']
+        if 'local_as' in vrf_values:
+            af_dict['local_as'] = vrf_values['local_as']
+        for key in ('bgp_table_version', 'config_peers', 'capable_peers',
+                    'history_paths', 'dampened_paths',
+                    'soft_reconfig_recvd_paths',
+                    'soft_reconfig_identical_paths',
+                    'soft_reconfig_combo_paths',
+                    'soft_reconfig_filtered_recvd', 'soft_reconfig_bytes'):
+            if key in values:
+                af_dict[key] = values[key]
+        if 'total_prefix_entries' in values:
+            af_dict['prefixes'] = \
+                {'total_entries': values['total_prefix_entries']}
+        if 'total_path_entries' in values:
+            af_dict['path'] = {'total_entries': values['total_path_entries']}
+        if 'memory_usage' in values:
+            for key in ('path', 'prefixes'):
+                if key not in af_dict:
+                    break
+                af_dict[key]['memory_usage'] = values['memory_usage']
+        for key, number, size in self.xml_entries:
+            if number in values and size in values:
+                af_dict[key] = '[{0}/{1}]'.format(values[number],
+                                                  values[size])
+        dampening = values.get('dampening', '')
+        if 'enabled' in dampening or 'true' in dampening:
+            af_dict['dampening'] = True
+        return values['af'], af_dict
+
+    def xml(self, vrf='all', address_family='all', output=None):
+
+        if output is None:
+            out = self.device.execute(self.xml_command.format(vrf=vrf))
+        else:
+            out = output
 
         etree_dict = {}
+        # Neighbors of the address family being read, which come before it
+        neighbors = []
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
+        for row in iter_xml_rows(
+                self.xml_fields, output=out,
+                command=self.cli_command[2].format(
+                    vrf=vrf, address_family=address_family)):
+            if row.tag == 'ROW_neighbor':
+                neighbors.append(row)
+                continue
+            if row.tag != 'ROW_saf':
+                continue
+            af = self._xml_af(row)
+            vrf_name = row.parents[0].values.get('vrf')
+            if af is None or vrf_name is None:
+                neighbors = []
+                continue
 
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
+            # -----   loop neighbors  -----
+            for nei_row in neighbors:
+                values = nei_row.values
+                nei = values.pop('neighbor', None)
+                if nei is None:
+                    continue
 
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=self.cli_command[2].format(vrf=vrf,
-                                                                              address_family=address_family))
+                sub_dict = etree_dict.setdefault('vrf', {})\
+                    .setdefault(vrf_name, {}).setdefault('neighbor', {})\
+                    .setdefault(nei, {}).setdefault('address_family', {})\
+                    .setdefault(af[0], {})
 
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
+                #  ---   AF attributes -------
+                sub_dict.update(deepcopy(af[1]))
 
-        if not root:
-            return etree_dict
+                #  ---   Neighbors attributes -------
+                state = values.pop('state', None)
+                prefix_received = values.pop('prefix_received', None)
+                sub_dict.update(values)
+                if state is None:
+                    continue
+                sub_dict['state'] = state
+                if 'established' in state:
+                    sub_dict['prefix_received'] = prefix_received
+                    sub_dict['state_pfxrcd'] = prefix_received
+                else:
+                    sub_dict['state_pfxrcd'] = state
+            neighbors = []
 
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # <vrf-router-id>10.106.0.6</vrf-router-id>
-            try:
-                route_identifier = vrf_tree.find('{}vrf-router-id'.format(namespace)).text
-            except Exception:
-                route_identifier = None
-
-            # <vrf-local-as>333</vrf-local-as>
-            try:
-                local_as = vrf_tree.find('{}vrf-local-as'.format(namespace)).text
-            except Exception:
-                local_as = None
-
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_af'.format(namespace))
-            if not af_tree:
-                continue
-            for af_root in af_tree.findall('{}ROW_af'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_saf'.format(namespace))
-                if not saf_tree:
-                    continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_saf'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                        # initial af dictionary
-                        af_dict = {}
-                        if route_identifier:
-                            af_dict['route_identifier'] = route_identifier
-                        if local_as:
-                            af_dict['local_as'] = int(local_as)
-                    except Exception:
-                        continue
-
-                    # <tableversion>7</tableversion>
-                    try:
-                        af_dict['bgp_table_version'] = int(
-                            saf_root.find('{}tableversion'.format(namespace)).text)
-                    except Exception:
-                        # for valide entry, table version should be there
-                        continue
-
-                    # <configuredpeers>3</configuredpeers>
-                    af_dict['config_peers'] = \
-                        int(saf_root.find('{}configuredpeers'.format(namespace)).text)
-                        
-                    # <capablepeers>2</capablepeers>
-                    af_dict['capable_peers'] = \
-                        int(saf_root.find('{}capablepeers'.format(namespace)).text)
-
-                    # <totalnetworks>5</totalnetworks>
-                    try:
-                        total_prefix_entries = \
-                            int(saf_root.find('{}totalnetworks'.format(namespace)).text)
-                        if 'prefixes' not in af_dict:
-                            af_dict['prefixes'] = {}
-                        af_dict['prefixes']['total_entries'] = total_prefix_entries
-                    except Exception:
-                        pass
-                        
-                    # <totalpaths>10</totalpaths>
-                    try:
-                        total_path_entries = \
-                            int(saf_root.find('{}totalpaths'.format(namespace)).text)
-                        if 'path' not in af_dict:
-                            af_dict['path'] = {}
-                        af_dict['path']['total_entries'] = total_path_entries
-                    except Exception:
-                        pass
-                        
-                    # <memoryused>1820</memoryused>
-                    try:
-                        memory_usage = \
-                            int(saf_root.find('{}memoryused'.format(namespace)).text)
-                        af_dict['path']['memory_usage'] = memory_usage
-                        af_dict['prefixes']['memory_usage'] = memory_usage
-                    except Exception:
-                        pass
-
-                    try:
-                        # <numberattrs>1</numberattrs>
-                        entries_1 = \
-                            saf_root.find('{}numberattrs'.format(namespace)).text
-                            
-                        # <bytesattrs>160</bytesattrs>
-                        entries_2 = \
-                            saf_root.find('{}bytesattrs'.format(namespace)).text
-
-                        af_dict['attribute_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberpaths>1</numberpaths>
-                        entries_1 = \
-                            saf_root.find('{}numberpaths'.format(namespace)).text
-
-                        # <bytespaths>34</bytespaths>
-                        entries_2 = \
-                            saf_root.find('{}bytespaths'.format(namespace)).text
-
-                        af_dict['as_path_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numbercommunities>0</numbercommunities>
-                        entries_1 = \
-                            saf_root.find('{}numbercommunities'.format(namespace)).text
-
-                        # <bytescommunities>0</bytescommunities>
-                        entries_2 = \
-                            saf_root.find('{}bytescommunities'.format(namespace)).text
-
-                        af_dict['community_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-                        
-                    try:
-                        # <numberclusterlist>0</numberclusterlist>
-                        entries_1 = \
-                            saf_root.find('{}numberclusterlist'.format(namespace)).text
-
-                        # <bytesclusterlist>0</bytesclusterlist>
-                        entries_2 = \
-                            saf_root.find('{}bytesclusterlist'.format(namespace)).text
-
-                        af_dict['clusterlist_entries'] = '[{0}/{1}]'.format(entries_1, entries_2)
-                    except Exception:
-                        pass
-
-                    # <dampening>Enabled</dampening>
-                    dampening = saf_root.find('{}dampening'.format(namespace)).text.lower()
-                    if 'enabled' in dampening or 'true' in dampening:
-                        af_dict['dampening'] = True
-
-                    # <historypaths>0</historypaths>
-                    try:
-                        af_dict['history_paths'] = int(saf_root.find('{}historypaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <dampenedpaths>0</dampenedpaths>
-                    try:
-                        af_dict['dampened_paths'] = int(saf_root.find('{}dampenedpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <softreconfigrecvdpaths>10</softreconfigrecvdpaths>
-                    try:
-                        af_dict['soft_reconfig_recvd_paths'] = int(
-                                saf_root.find('{}softreconfigrecvdpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigidenticalpaths>10</softreconfigidenticalpaths>
-                    try:
-                        af_dict['soft_reconfig_identical_paths'] = int(
-                                saf_root.find('{}softreconfigidenticalpaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <softreconfigcombopaths>0</softreconfigcombopaths>
-                    try:
-                        af_dict['soft_reconfig_combo_paths'] = int(
-                                saf_root.find('{}softreconfigcombopaths'.format(namespace)).text)
-                    except Exception:
-                        pass
-
-                    # <softreconfigfilteredrecvd>0</softreconfigfilteredrecvd>
-                    try:
-                        af_dict['soft_reconfig_filtered_recvd'] = int(
-                                saf_root.find('{}softreconfigfilteredrecvd'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                    # <softreconfigbytes>0</softreconfigbytes>
-                    try:
-                        af_dict['soft_reconfig_bytes'] = int(
-                                saf_root.find('{}softreconfigbytes'.format(namespace)).text)
-                    except Exception:
-                        pass
-                        
-                     # Neighbor table
-                    nei_tree = saf_root.find('{}TABLE_neighbor'.format(namespace))
-                    if not nei_tree:
-                        continue
-
-                    # -----   loop neighbors  -----
-                    for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                        # neighbor
-                        try:
-                            nei = nei_root.find('{}neighborid'.format(namespace)).text
-                        except Exception:
-                            continue
-
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'neighbor' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['neighbor'] = {}
-                        if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]['neighbor'][nei]:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['neighbor'][nei]['address_family']:
-                            etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af] = {}
-                    
-                        sub_dict = etree_dict['vrf'][vrf]['neighbor'][nei]['address_family'][af]
-
-                        #  ---   AF attributes -------
-                        update_dict = deepcopy(af_dict)
-                        sub_dict.update(update_dict)
-
-                        #  ---   Neighbors attributes -------
-                        # <neighborversion>4</neighborversion>
-                        sub_dict['neighbor_table_version'] = int(
-                            nei_root.find('{}neighborversion'.format(namespace)).text)
-
-                        # <msgrecvd>5471</msgrecvd>
-                        sub_dict['msg_rcvd'] = int(
-                            nei_root.find('{}msgrecvd'.format(namespace)).text)
-                        
-                        # <msgsent>5459</msgsent>
-                        sub_dict['msg_sent'] = int(
-                            nei_root.find('{}msgsent'.format(namespace)).text)
-                        
-                        # <neighbortableversion>7</neighbortableversion>
-                        sub_dict['tbl_ver'] = int(
-                            nei_root.find('{}neighbortableversion'.format(namespace)).text)
-                        
-                        # <inq>0</inq>
-                        sub_dict['inq'] = int(
-                            nei_root.find('{}inq'.format(namespace)).text)
-                        
-                        # <outq>0</outq>
-                        sub_dict['outq'] = int(
-                            nei_root.find('{}outq'.format(namespace)).text)
-                        
-                        # <neighboras>333</neighboras>
-                        sub_dict['as'] = int(
-                            nei_root.find('{}neighboras'.format(namespace)).text)
-                        
-                        # <time>3d18h</time>
-                        sub_dict['up_down'] = \
-                            nei_root.find('{}time'.format(namespace)).text
-                        
-                        # <state>Established</state>
-                        state = nei_root.find('{}state'.format(namespace)).text.lower()
-
-                        # <prefixreceived>5</prefixreceived>
-                        prefix_received = \
-                            nei_root.find('{}prefixreceived'.format(namespace)).text
-
-                        if 'established' in state:
-                            sub_dict['state'] = state
-                            sub_dict['prefix_received'] = prefix_received
-                            sub_dict['state_pfxrcd'] = prefix_received
-                        else:
-                            sub_dict['state'] = state
-                            sub_dict['state_pfxrcd'] = state
-                
         return etree_dict
 
 
@@ -6100,126 +6062,233 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
     cli_command = 'show running-config bgp'
 
+    p1 = LazyRegex(r'^\s*router +bgp +(?P<bgp_id>[0-9]+)$')
+
+    p2 = LazyRegex(r'^\s*shutdown$')
+
+    p2_1 = LazyRegex(r'^\s*evpn$')
+
+    p2_2 = LazyRegex(r'^\s*vni +(?P<evpn_vni>\d+) +l2$')
+
+    p2_3 = LazyRegex(r'^\s*rd +(?P<rd>[\w]+)$')
+
+    p2_4 = LazyRegex(r'^\s*route-target +(?P<evpn_vni_rt_type>[\w]+) +(?P<evpn_vni_rt>[\w\s]+)$')
+
+    p3 = LazyRegex(r'^\s*vrf +(?P<vrf>[\w\-]+)$')
+
+    p3_1 = LazyRegex(r'^\s*rd +(?P<rd>[\w]+)$')
+
+    p4 = LazyRegex(r'^\s*bestpath +(?P<best_path>[a-z\-\s]+)$')
+
+    p5 = LazyRegex(r'^\s*cluster-id +(?P<cluster_id>[0-9\.]+)$')
+
+    p6 = LazyRegex(r'^\s*confederation +identifier +(?P<confederation_identifier>[0-9]+)$')
+
+    p7 = LazyRegex(r'^\s*confederation +peers +(?P<confederation_peers_as>[0-9]+)$')
+
+    p8 = LazyRegex(r'^\s*no graceful-restart$')
+
+    p9 = LazyRegex(r'^\s*graceful-restart'
+                ' +(?P<graceful_restart_type>[a-z\-]+)'
+                ' +(?P<time>[0-9]+)$')
+
+    p10 = LazyRegex(r'^\s*log-neighbor-changes$')
+
+    p11 = LazyRegex(r'^\s*router-id +(?P<router_id>[0-9\.]+)$')
+
+    p12 = LazyRegex(r'^\s*timers +bgp +(?P<keepalive_interval>[0-9]+)'
+                ' +(?P<holdtime>[0-9]+)$')
+
+    p13 = LazyRegex(r'^\s*no enforce-first-as$')
+
+    p14 = LazyRegex(r'^\s*no fast-external-fallover$')
+
+    p15 = LazyRegex(r'^\s*dynamic-med-interval +(?P<dynamic_med_interval>[0-9]+)$')
+
+    p16 = LazyRegex(r'^\s*flush-routes$')
+
+    p17 = LazyRegex(r'^\s*isolate$')
+
+    p18 = LazyRegex(r'^\s*disable-policy-batching ipv4 prefix-list +(?P<disable_policy_batching_ipv4>[a-zA-Z0-9]+)$')
+
+    p19 = LazyRegex(r'^\s*disable-policy-batching ipv6 prefix-list +(?P<disable_policy_batching_ipv6>[a-zA-Z0-9]+)$')
+
+    p20 = LazyRegex(r'^\s*address-family +(?P<af_name>[a-z0-9\-\s]+)$')
+
+    p21_1 = LazyRegex(r'^\s*route-target +(?P<af_evpn_vni_rt_type>[\w]+) +(?P<af_evpn_vni_rt>[\w\s]+)$')
+
+    p21 = LazyRegex(r'^\s*dampening '
+                    '+(?P<af_dampening_half_life_time>[0-9]+) '
+                    '+(?P<af_dampening_reuse_time>[0-9]+) '
+                    '+(?P<af_dampening_suppress_time>[0-9]+) '
+                    '+(?P<af_dampening_max_suppress_time>[0-9]+)$')
+
+    p22 = LazyRegex(r'^\s*dampening +route-map +(?P<af_dampening_route_map>[A-Z0-9\-\_]+)$')
+
+    p23 = LazyRegex(r'^\s*nexthop +route-map +(?P<af_nexthop_route_map>[A-Za-z0-9\-\_]+)$')
+
+    p24 = LazyRegex(r'^\s*nexthop +trigger-delay +critical +(?P<af_nexthop_trigger_delay_critical>[0-9]+) +non-critical +(?P<af_nexthop_trigger_delay_non_critical>[0-9]+)$')
+
+    p25 = LazyRegex(r'^\s*no nexthop trigger-delay$')
+
+    p26 = LazyRegex(r'^\s*no client-to-client reflection$')
+
+    p27 = LazyRegex(r'^\s*distance +(?P<af_distance_extern_as>[0-9]+) +(?P<af_distance_internal_as>[0-9]+) +(?P<af_distance_local>[0-9]+)$')
+
+    p28 = LazyRegex(r'^\s*maximum-paths( +(?P<af_maximum_paths_type>[a-z]+))? +(?P<af_maximum_paths_value>[0-9]+)$')
+
+    p29 = LazyRegex(r'^\s*maximum-paths +eibgp +(?P<af_maximum_paths_eibgp>[0-9]+)$')
+
+    p30 = LazyRegex(r'^\s*aggregate-address +(?P<af_aggregate_address_address>[a-z0-9\.\:]+)(\/(?P<af_aggregate_address_ipv4_mask>[0-9]+))?( +(?P<extra_line>[a-z\-\s]+))?$')
+
+    p31 = LazyRegex(r'^\s*network +(?P<af_network_number>[0-9\.\:]+)( +mask +(?P<af_network_mask>[0-9\.]+))?( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
+
+    p32 = LazyRegex(r'^\s*network +(?P<af_network_number>[0-9\.]+)\/(?P<af_network_mask>[0-9]+)( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
+
+    p33 = LazyRegex(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
+
+    p34 = LazyRegex(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
+
+    p35 = LazyRegex(r'^\s*redistribute +(ospf|ospfv3) +(?P<af_redist_ospf>[0-9]+) +route-map +(?P<af_redist_ospf_route_policy>[A-Za-z0-9\-\_]+)$')
+
+    p36 = LazyRegex(r'^\s*redistribute +rip +(?P<af_redist_rip>[0-9]+) +route-map +(?P<af_redist_rip_route_policy>[A-Za-z0-9\-\_]+)$')
+
+    p37 = LazyRegex(r'^\s*redistribute +static +route-map +(?P<af_redist_static_route_policy>[A-Za-z0-9\-\_]+)$')
+
+    p38 = LazyRegex(r'^\s*redistribute +direct +route-map +(?P<af_redist_connected_route_policy>[A-Za-z0-9\-\_]+)$')
+
+    p39 = LazyRegex(r'^\s*allocate-label all$')
+
+    p40 = LazyRegex(r'^\s*retain route-target all$')
+
+    p41 = LazyRegex(r'^\s*label-allocation-mode +(?P<per_vrf>[A-Za-z0-9]+)$')
+
+    p103 = LazyRegex(r'^\s*advertise-pip$')
+
+    p42 = LazyRegex(r'^\s*neighbor +(?P<neighbor_id>[a-z0-9\.\:]+)$')
+
+    p43 = LazyRegex(r'^\s*bfd$')
+
+    p44 = LazyRegex(r'^\s*capability suppress 4-byte-as$')
+
+    p45 = LazyRegex(r'^\s*description +(?P<nbr_description>[A-Za-z0-9]+)$')
+
+    p46 = LazyRegex(r'^\s*disable-connected-check$')
+
+    p47 = LazyRegex(r'^\s*ebgp-multihop +(?P<nbr_ebgp_multihop_max_hop>[0-9]+)$')
+
+    p48 = LazyRegex(r'^\s*inherit peer-session +(?P<nbr_inherit_peer_session>[A-Za-z0-9\-]+)$')
+
+    p49 = LazyRegex(r'^\s*local-as +(?P<nbr_local_as_as_no>[0-9\.]+)( +(?P<no_prepend>no-prepend)( +(?P<replace_as>replace-as)( +(?P<dual_as>dual-as))?)?)?$')
+
+    p50 = LazyRegex(r'^\s*remote-as +(?P<nbr_remote_as>[0-9]+)$')
+
+    p51 = LazyRegex(r'^\s*remove-private-as$')
+
+    p52 = LazyRegex(r'^\s*shutdown$')
+
+    p53 = LazyRegex(r'^\s*timers +(?P<nbr_keepalive_interval>[0-9]+) +(?P<nbr_holdtime>[0-9]+)$')
+
+    p54 = LazyRegex(r'^\s*update-source +(?P<nbr_update_source>[A-Za-z0-9\/\.]+)$')
+
+    p55 = LazyRegex(r'^\s*password +(?P<nbr_password_text>.*)$')
+
+    p56 = LazyRegex(r'^\s*transport connection-mode +(?P<nbr_transport_connection_mode>[a-z]+)$')
+
+    p101 = LazyRegex(r'^\s*peer-type +(?P<nbr_peer_type>[\w\-]+)$')
+
+    p57 = LazyRegex(r'^\s*address-family +(?P<nbr_af_name>[A-Za-z0-9\s\-]+)$')
+
+    p58 = LazyRegex(r'^\s*allowas-in( +(?P<nbr_af_allowas_in_as_number>[0-9]+))?$')
+
+    p59 = LazyRegex(r'^\s*inherit peer-policy +(?P<nbr_af_inherit_peer_policy>[A-Za-z0-9\-]+) +(?P<nbr_af_inherit_peer_seq>[0-9]+)$')
+
+    p60 = LazyRegex(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
+
+    p61 = LazyRegex(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +(?P<nbr_af_maximum_prefix_warning_only>warning-only))?$')
+
+    p62 = LazyRegex(r'^\s*route-map +(?P<nbr_af_route_map_name_in>.*) in$')
+
+    p63 = LazyRegex(r'^\s*route-map +(?P<nbr_af_route_map_name_out>.*) out$')
+
+    p64 = LazyRegex(r'^\s*route-reflector-client$')
+
+    p65 = LazyRegex(r'^\s*send-community$')
+
+    p66 = LazyRegex(r'^\s*send-community +extended$')
+
+    p100 = LazyRegex(r'^\s*rewrite-evpn-rt-asn$')
+
+    p67 = LazyRegex(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
+
+    p68 = LazyRegex(r'^\s*next-hop-self$')
+
+    p69 = LazyRegex(r'^\s*as-override$')
+
+    p70 = LazyRegex(r'^\s*default-originate( +route-map +(?P<nbr_af_default_originate_route_map>.*))?$')
+
+    p71 = LazyRegex(r'^\s*soo +(?P<nbr_af_soo>.*)$')
+
+    p72 = LazyRegex(r'^\s*template peer-session +(?P<ps_name>.*)$')
+
+    p73 = LazyRegex(r'^\s*bfd$')
+
+    p74 = LazyRegex(r'^\s*bfd$')
+
+    p75 = LazyRegex(r'^\s*description +(?P<ps_description>.*)$')
+
+    p76 = LazyRegex(r'^\s*disable-connected-check$')
+
+    p77 = LazyRegex(r'^\s*ebgp-multihop +(?P<ps_ebgp_multihop_max_hop>[0-9]+)$$')
+
+    p78 = LazyRegex(r'^\s*local-as +(?P<ps_local_as_as_no>[0-9\.]+)( +no-prepend( +replace-as( +dual-as)?)?)?$')
+
+    p79 = LazyRegex(r'^\s*password +(?P<ps_password_text>.*)$')
+
+    p80 = LazyRegex(r'^\s*remote-as +(?P<ps_remote_as>[0-9]+)$')
+
+    p81 = LazyRegex(r'^\s*shutdown$')
+
+    p82 = LazyRegex(r'^\s*timers +(?P<ps_keepalive_interval>[0-9]+) +(?P<ps_hodltime>[0-9]+)$')
+
+    p83 = LazyRegex(r'^\s*transport connection-mode +(?P<ps_transport_connection_mode>[a-z]+)$')
+
+    p84 = LazyRegex(r'^\s*update-source +(?P<ps_update_source>[A-Za-z0-9\/\.]+)$')
+
+    p85 = LazyRegex(r'^\s*template peer-session +(?P<pp_name>.*)$')
+
+    p86 = LazyRegex(r'^\s*allowas-in( +(?P<pp_allowas_in_as_number>[0-9]+))?$')
+
+    p87 = LazyRegex(r'^\s*as-override$')
+
+    p88 = LazyRegex(r'^\s*default-originate( +route-map +(?P<pp_default_originate_route_map>.*))?$')
+
+    p89 = LazyRegex(r'^\s*route-map +(?P<pp_route_map_name_in>.*) in$')
+
+    p90 = LazyRegex(r'^\s*route-map +(?P<pp_route_map_name_out>.*) out$')
+
+    p91 = LazyRegex(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?(restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
+
+    p92 = LazyRegex(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<pp_maximum_prefix_threshold>[0-9]+))?( +(?P<pp_maximum_prefix_warning_only>warning-only))?$')
+
+    p93 = LazyRegex(r'^\s*next-hop-self$')
+
+    p94 = LazyRegex(r'^\s*route-reflector-client$')
+
+    p95 = LazyRegex(r'^\s*send-community$')
+
+    p96 = LazyRegex(r'^\s*send-community +extended$')
+
+    p97 = LazyRegex(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
+
+    p98 = LazyRegex(r'^\s*soo +(?P<pp_soo>.*)$')
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        p1 = re.compile(r'^\s*router +bgp +(?P<bgp_id>[0-9]+)$')
-        p2 = re.compile(r'^\s*shutdown$')
-        p2_1 = re.compile(r'^\s*evpn$')
-        p2_2 = re.compile(r'^\s*vni +(?P<evpn_vni>\d+) +l2$')
-        p2_3 = re.compile(r'^\s*rd +(?P<rd>[\w]+)$')
-        p2_4 = re.compile(r'^\s*route-target +(?P<evpn_vni_rt_type>[\w]+) +(?P<evpn_vni_rt>[\w\s]+)$')
-        p3 = re.compile(r'^\s*vrf +(?P<vrf>[\w\-]+)$')
-        p3_1 = re.compile(r'^\s*rd +(?P<rd>[\w]+)$')
-        p4 = re.compile(r'^\s*bestpath +(?P<best_path>[a-z\-\s]+)$')
-        p5 = re.compile(r'^\s*cluster-id +(?P<cluster_id>[0-9\.]+)$')
-        p6 = re.compile(r'^\s*confederation +identifier +(?P<confederation_identifier>[0-9]+)$')
-        p7 = re.compile(r'^\s*confederation +peers +(?P<confederation_peers_as>[0-9]+)$')
-        p8 = re.compile(r'^\s*no graceful-restart$')
-        p9 = re.compile(r'^\s*graceful-restart'
-                    ' +(?P<graceful_restart_type>[a-z\-]+)'
-                    ' +(?P<time>[0-9]+)$')
-        p10 = re.compile(r'^\s*log-neighbor-changes$')
-        p11 = re.compile(r'^\s*router-id +(?P<router_id>[0-9\.]+)$')
-        p12 = re.compile(r'^\s*timers +bgp +(?P<keepalive_interval>[0-9]+)'
-                    ' +(?P<holdtime>[0-9]+)$')
-        p13 = re.compile(r'^\s*no enforce-first-as$')
-        p14 = re.compile(r'^\s*no fast-external-fallover$')
-        p15 = re.compile(r'^\s*dynamic-med-interval +(?P<dynamic_med_interval>[0-9]+)$')
-        p16 = re.compile(r'^\s*flush-routes$')
-        p17 = re.compile(r'^\s*isolate$')
-        p18 = re.compile(r'^\s*disable-policy-batching ipv4 prefix-list +(?P<disable_policy_batching_ipv4>[a-zA-Z0-9]+)$')
-        p19 = re.compile(r'^\s*disable-policy-batching ipv6 prefix-list +(?P<disable_policy_batching_ipv6>[a-zA-Z0-9]+)$')
-        p20 = re.compile(r'^\s*address-family +(?P<af_name>[a-z0-9\-\s]+)$')
-        p21_1 = re.compile(r'^\s*route-target +(?P<af_evpn_vni_rt_type>[\w]+) +(?P<af_evpn_vni_rt>[\w\s]+)$')
-        p21 = re.compile(r'^\s*dampening '
-                        '+(?P<af_dampening_half_life_time>[0-9]+) '
-                        '+(?P<af_dampening_reuse_time>[0-9]+) '
-                        '+(?P<af_dampening_suppress_time>[0-9]+) '
-                        '+(?P<af_dampening_max_suppress_time>[0-9]+)$')
-        p22 = re.compile(r'^\s*dampening +route-map +(?P<af_dampening_route_map>[A-Z0-9\-\_]+)$')
-        p23 = re.compile(r'^\s*nexthop +route-map +(?P<af_nexthop_route_map>[A-Za-z0-9\-\_]+)$')
-        p24 = re.compile(r'^\s*nexthop +trigger-delay +critical +(?P<af_nexthop_trigger_delay_critical>[0-9]+) +non-critical +(?P<af_nexthop_trigger_delay_non_critical>[0-9]+)$')
-        p25 = re.compile(r'^\s*no nexthop trigger-delay$')
-        p26 = re.compile(r'^\s*no client-to-client reflection$')
-        p27 = re.compile(r'^\s*distance +(?P<af_distance_extern_as>[0-9]+) +(?P<af_distance_internal_as>[0-9]+) +(?P<af_distance_local>[0-9]+)$')
-        p28 = re.compile(r'^\s*maximum-paths( +(?P<af_maximum_paths_type>[a-z]+))? +(?P<af_maximum_paths_value>[0-9]+)$')
-        p29 = re.compile(r'^\s*maximum-paths +eibgp +(?P<af_maximum_paths_eibgp>[0-9]+)$')
-        p30 = re.compile(r'^\s*aggregate-address +(?P<af_aggregate_address_address>[a-z0-9\.\:]+)(\/(?P<af_aggregate_address_ipv4_mask>[0-9]+))?( +(?P<extra_line>[a-z\-\s]+))?$')
-        p31 = re.compile(r'^\s*network +(?P<af_network_number>[0-9\.\:]+)( +mask +(?P<af_network_mask>[0-9\.]+))?( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
-        p32 = re.compile(r'^\s*network +(?P<af_network_number>[0-9\.]+)\/(?P<af_network_mask>[0-9]+)( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
-        p33 = re.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
-        p34 = re.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
-        p35 = re.compile(r'^\s*redistribute +(ospf|ospfv3) +(?P<af_redist_ospf>[0-9]+) +route-map +(?P<af_redist_ospf_route_policy>[A-Za-z0-9\-\_]+)$')
-        p36 = re.compile(r'^\s*redistribute +rip +(?P<af_redist_rip>[0-9]+) +route-map +(?P<af_redist_rip_route_policy>[A-Za-z0-9\-\_]+)$')
-        p37 = re.compile(r'^\s*redistribute +static +route-map +(?P<af_redist_static_route_policy>[A-Za-z0-9\-\_]+)$')
-        p38 = re.compile(r'^\s*redistribute +direct +route-map +(?P<af_redist_connected_route_policy>[A-Za-z0-9\-\_]+)$')
-        p39 = re.compile(r'^\s*allocate-label all$')
-        p40 = re.compile(r'^\s*retain route-target all$')
-        p41 = re.compile(r'^\s*label-allocation-mode +(?P<per_vrf>[A-Za-z0-9]+)$')
-        p103 = re.compile(r'^\s*advertise-pip$')
-        p42 = re.compile(r'^\s*neighbor +(?P<neighbor_id>[a-z0-9\.\:]+)$')
-        p43 = re.compile(r'^\s*bfd$')
-        p44 = re.compile(r'^\s*capability suppress 4-byte-as$')
-        p45 = re.compile(r'^\s*description +(?P<nbr_description>[A-Za-z0-9]+)$')
-        p46 = re.compile(r'^\s*disable-connected-check$')
-        p47 = re.compile(r'^\s*ebgp-multihop +(?P<nbr_ebgp_multihop_max_hop>[0-9]+)$')
-        p48 = re.compile(r'^\s*inherit peer-session +(?P<nbr_inherit_peer_session>[A-Za-z0-9\-]+)$')
-        p49 = re.compile(r'^\s*local-as +(?P<nbr_local_as_as_no>[0-9\.]+)( +(?P<no_prepend>no-prepend)( +(?P<replace_as>replace-as)( +(?P<dual_as>dual-as))?)?)?$')
-        p50 = re.compile(r'^\s*remote-as +(?P<nbr_remote_as>[0-9]+)$')
-        p51 = re.compile(r'^\s*remove-private-as$')
-        p52 = re.compile(r'^\s*shutdown$')
-        p53 = re.compile(r'^\s*timers +(?P<nbr_keepalive_interval>[0-9]+) +(?P<nbr_holdtime>[0-9]+)$')
-        p54 = re.compile(r'^\s*update-source +(?P<nbr_update_source>[A-Za-z0-9\/\.]+)$')
-        p55 = re.compile(r'^\s*password +(?P<nbr_password_text>.*)$')
-        p56 = re.compile(r'^\s*transport connection-mode +(?P<nbr_transport_connection_mode>[a-z]+)$')
-        p101 = re.compile(r'^\s*peer-type +(?P<nbr_peer_type>[\w\-]+)$')
-        p57 = re.compile(r'^\s*address-family +(?P<nbr_af_name>[A-Za-z0-9\s\-]+)$')
-        p58 = re.compile(r'^\s*allowas-in( +(?P<nbr_af_allowas_in_as_number>[0-9]+))?$')
-        p59 = re.compile(r'^\s*inherit peer-policy +(?P<nbr_af_inherit_peer_policy>[A-Za-z0-9\-]+) +(?P<nbr_af_inherit_peer_seq>[0-9]+)$')
-        p60 = re.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
-        p61 = re.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +(?P<nbr_af_maximum_prefix_warning_only>warning-only))?$')
-        p62 = re.compile(r'^\s*route-map +(?P<nbr_af_route_map_name_in>.*) in$')
-        p63 = re.compile(r'^\s*route-map +(?P<nbr_af_route_map_name_out>.*) out$')
-        p64 = re.compile(r'^\s*route-reflector-client$')
-        p65 = re.compile(r'^\s*send-community$')
-        p66 = re.compile(r'^\s*send-community +extended$')
-        p100 = re.compile(r'^\s*rewrite-evpn-rt-asn$')
-        p67 = re.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
-        p68 = re.compile(r'^\s*next-hop-self$')
-        p69 = re.compile(r'^\s*as-override$')
-        p70 = re.compile(r'^\s*default-originate( +route-map +(?P<nbr_af_default_originate_route_map>.*))?$')
-        p71 = re.compile(r'^\s*soo +(?P<nbr_af_soo>.*)$')
-        p72 = re.compile(r'^\s*template peer-session +(?P<ps_name>.*)$')
-        p73 = re.compile(r'^\s*bfd$')
-        p74 = re.compile(r'^\s*bfd$')
-        p75 = re.compile(r'^\s*description +(?P<ps_description>.*)$')
-        p76 = re.compile(r'^\s*disable-connected-check$')
-        p77 = re.compile(r'^\s*ebgp-multihop +(?P<ps_ebgp_multihop_max_hop>[0-9]+)$$')
-        p78 = re.compile(r'^\s*local-as +(?P<ps_local_as_as_no>[0-9\.]+)( +no-prepend( +replace-as( +dual-as)?)?)?$')
-        p79 = re.compile(r'^\s*password +(?P<ps_password_text>.*)$')
-        p80 = re.compile(r'^\s*remote-as +(?P<ps_remote_as>[0-9]+)$')
-        p81 = re.compile(r'^\s*shutdown$')
-        p82 = re.compile(r'^\s*timers +(?P<ps_keepalive_interval>[0-9]+) +(?P<ps_hodltime>[0-9]+)$')
-        p83 = re.compile(r'^\s*transport connection-mode +(?P<ps_transport_connection_mode>[a-z]+)$')
-        p84 = re.compile(r'^\s*update-source +(?P<ps_update_source>[A-Za-z0-9\/\.]+)$')
-        p85 = re.compile(r'^\s*template peer-session +(?P<pp_name>.*)$')
-        p86 = re.compile(r'^\s*allowas-in( +(?P<pp_allowas_in_as_number>[0-9]+))?$')
-        p87 = re.compile(r'^\s*as-override$')
-        p88 = re.compile(r'^\s*default-originate( +route-map +(?P<pp_default_originate_route_map>.*))?$')
-        p89 = re.compile(r'^\s*route-map +(?P<pp_route_map_name_in>.*) in$')
-        p90 = re.compile(r'^\s*route-map +(?P<pp_route_map_name_out>.*) out$')
-        p91 = re.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?(restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
-        p92 = re.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<pp_maximum_prefix_threshold>[0-9]+))?( +(?P<pp_maximum_prefix_warning_only>warning-only))?$')
-        p93 = re.compile(r'^\s*next-hop-self$')
-        p94 = re.compile(r'^\s*route-reflector-client$')
-        p95 = re.compile(r'^\s*send-community$')
-        p96 = re.compile(r'^\s*send-community +extended$')
-        p97 = re.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
-        p98 = re.compile(r'^\s*soo +(?P<pp_soo>.*)$')
         # Init vars
         bgp_dict = {}
         bgp_id = ''
@@ -6236,7 +6305,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
         for line in out.splitlines():
             line = line.rstrip()
             # router bgp 333
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 bgp_id = int(m.groupdict()['bgp_id'])
                 if 'bgp' not in bgp_dict:
@@ -6257,13 +6326,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
             if bgp_id:
                 #   shutdown
-                m = p2.match(line)
+                m = self.p2.match(line)
                 if m:
                     bgp_dict['bgp']['instance']['default']['protocol_shutdown'] = True
                     continue
 
                 # evpn
-                m = p2_1.match(line)
+                m = self.p2_1.match(line)
                 if m:
                     if 'vxlan' not in bgp_dict:
                         bgp_dict['vxlan'] = {}
@@ -6272,7 +6341,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     continue
 
                 # vni 5001 l2
-                m = p2_2.match(line)
+                m = self.p2_2.match(line)
                 if m:
                     vni_flag = True
                     if 'evpn_vni' not in bgp_dict['vxlan']['evpn']:
@@ -6285,14 +6354,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if vni_flag:
                     # rd auto
-                    m = p2_3.match(line)
+                    m = self.p2_3.match(line)
                     if m:
                         bgp_dict['vxlan']['evpn']['evpn_vni'][evpn_vni]['evpn_vni_rd'] = m.groupdict()['rd']
                         continue
 
                     # route-target import auto
                     # route-target export auto
-                    m = p2_4.match(line)
+                    m = self.p2_4.match(line)
                     if m:
                         evpn_vni_rt = m.groupdict()['evpn_vni_rt']
                         if 'evpn_vni_rt' not in bgp_dict['vxlan']['evpn']['evpn_vni'][evpn_vni]:
@@ -6306,7 +6375,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             ['evpn_vni_rt'] = evpn_vni_rt
                         continue
 
-                m = p3.match(line)
+                m = self.p3.match(line)
                 if m:
                     # Get keys
                     vrf = str(m.groupdict()['vrf'])
@@ -6322,7 +6391,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if vrf:
                     # rd auto
-                    m = p3_1.match(line)
+                    m = self.p3_1.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['rd'] =  m.groupdict()['rd']
                         continue
@@ -6331,7 +6400,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     #   bestpath compare-routerid
                     #   bestpath med missing-as-worst
                     #   bestpath always-compare-med
-                    m = p4.match(line)
+                    m = self.p4.match(line)
                     if m:
                         # Get keys
                         best_path = str(m.groupdict()['best_path'])
@@ -6355,28 +6424,28 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   cluster-id <cluster_id>
-                    m = p5.match(line)
+                    m = self.p5.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['cluster_id'] = \
                             str(m.groupdict()['cluster_id'])
                         continue
 
                     #   confederation identifier <confederation_identifier>
-                    m = p6.match(line)
+                    m = self.p6.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['confederation_identifier'] = \
                             int(m.groupdict()['confederation_identifier'])
                         continue
 
                     #   confederation peers <confederation_peers_as>
-                    m = p7.match(line)
+                    m = self.p7.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['confederation_peers_as'] = \
                             str(m.groupdict()['confederation_peers_as'])
                         continue
 
                     #   no graceful-restart
-                    m = p8.match(line)
+                    m = self.p8.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['graceful_restart'] = False
                         continue
@@ -6385,7 +6454,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                     #   graceful-restart restart-time 121
                     #   graceful-restart stalepath-time 301
-                    m = p9.match(line)
+                    m = self.p9.match(line)
                     if m:
                         graceful_restart_type = \
                             str(m.groupdict()['graceful_restart_type'])
@@ -6400,7 +6469,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   log-neighbor-changes
-                    m = p10.match(line)
+                    m = self.p10.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['log_neighbor_changes'] = True
                         continue
@@ -6408,14 +6477,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['log_neighbor_changes'] = False
 
                     #   router-id <router-id>
-                    m = p11.match(line)
+                    m = self.p11.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['router_id'] = \
                             str(m.groupdict()['router_id'])
                         continue
 
                     #   timers bgp <keepalive-interval> <holdtime>
-                    m = p12.match(line)
+                    m = self.p12.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['keepalive_interval'] = \
                             int(m.groupdict()['keepalive_interval'])
@@ -6424,7 +6493,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   no enforce-first-as
-                    m = p13.match(line)
+                    m = self.p13.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['enforce_first_as'] = False
                         continue
@@ -6432,7 +6501,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['enforce_first_as'] = True
 
                     #   no fast-external-fallover
-                    m = p14.match(line)
+                    m = self.p14.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['fast_external_fallover'] = False
                         continue
@@ -6440,14 +6509,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['fast_external_fallover'] = True
 
                     #   dynamic-med-interval 70
-                    m = p15.match(line)
+                    m = self.p15.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['dynamic_med_interval'] = \
                             int(m.groupdict()['dynamic_med_interval'])
                         continue
 
                     #   flush-routes
-                    m = p16.match(line)
+                    m = self.p16.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['flush_routes'] = True
                         continue
@@ -6455,7 +6524,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['flush_routes'] = False
 
                     #   isolate
-                    m = p17.match(line)
+                    m = self.p17.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['isolate'] = True
                         continue
@@ -6463,14 +6532,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['isolate'] = False
 
                     #   disable-policy-batching ipv4 prefix-list <WORD>
-                    m = p18.match(line)
+                    m = self.p18.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['disable_policy_batching_ipv4'] = \
                             str(m.groupdict()['disable_policy_batching_ipv4'])
                         continue
 
                     #   disable-policy-batching ipv4 prefix-list <WORD>
-                    m = p19.match(line)
+                    m = self.p19.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['vrf'][vrf]['disable_policy_batching_ipv6'] = \
                             str(m.groupdict()['disable_policy_batching_ipv6'])
@@ -6478,7 +6547,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                     if neighbor_id == '':
                         #   address-family ipv4 multicast
-                        m = p20.match(line)
+                        m = self.p20.match(line)
                         if m:
                             # Get keys
                             af_name = str(m.groupdict()['af_name'])
@@ -6491,7 +6560,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     if af_name:
                         # route-target both auto
                         # route-target both auto evpn
-                        m = p21_1.match(line)
+                        m = self.p21_1.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_evpn_vni_rt_type'] =\
                                 m.groupdict()['af_evpn_vni_rt_type']
@@ -6503,7 +6572,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         #    <af_dampening_resuse_time> <af_dampening_suppress_time>
                         #    <af_dampening_max_suppress_time> } |
                         #    { route-map <af_dampening_route_map> } ]
-                        m = p21.match(line)
+                        m = self.p21.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_dampening'] = \
                                 True
@@ -6518,7 +6587,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    dampening [ { route-map <af_dampening_route_map> } ]
-                        m = p22.match(line)
+                        m = self.p22.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_dampening'] = \
                                 True
@@ -6527,7 +6596,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    nexthop route-map <af_nexthop_route_map>
-                        m = p23.match(line)
+                        m = self.p23.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_nexthop_route_map'] = \
                                 str(m.groupdict()['af_nexthop_route_map'])
@@ -6537,7 +6606,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         #     <af_nexthop_trigger_delay_critical> non-critical
                         #     <af_nexthop_trigger_delay_non_critical> } |
                         #     { no nexthop trigger-delay }
-                        m = p24.match(line)
+                        m = self.p24.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_nexthop_trigger_enable'] = \
                                 True
@@ -6548,14 +6617,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #     {no nexthop trigger-delay }
-                        m = p25.match(line)
+                        m = self.p25.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_nexthop_trigger_enable'] = \
                                 False
                             continue
 
                         #     {no client-to-client reflection }
-                        m = p26.match(line)
+                        m = self.p26.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_client_to_client_reflection'] = \
                                 False
@@ -6565,7 +6634,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 True
 
                         #    distance <af_distance_extern_as> <af_distance_internal_as> <af_distance_local> | no distance [ <af_distance_extern_as> <af_distance_internal_as> <af_distance_local> ]
-                        m = p27.match(line)
+                        m = self.p27.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_distance_extern_as'] = \
                                 int(m.groupdict()['af_distance_extern_as'])
@@ -6577,7 +6646,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         #    maximum-paths <af_maximum_paths_ebgp>
                         #    maximum-paths ibgp <af_maximum_paths_ibgp>
-                        m = p28.match(line)
+                        m = self.p28.match(line)
                         if m:
                             if m.groupdict()['af_maximum_paths_type']:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_maximum_paths_ibgp'] = \
@@ -6588,7 +6657,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    maximum-paths eibgp <af_maximum_paths_eibgp>
-                        m = p29.match(line)
+                        m = self.p29.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_maximum_paths_eibgp'] = \
                                 int(m.groupdict()['af_maximum_paths_eibgp'])
@@ -6596,7 +6665,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         #    aggregate-address <af_aggregate_address_ipv4_address>/<af_aggregate_address_ipv4_mask> [ as-set | summary-only ] +
                         #    aggregate-address <af_v6_aggregate_address_ipv6_address> [ as-set | summary-only ] +
-                        m = p30.match(line)
+                        m = self.p30.match(line)
                         if m:
                             ip_address = str(m.groupdict()['af_aggregate_address_address'])
                             if '::' not in ip_address:
@@ -6635,7 +6704,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         #    network { <af_network_number> mask <af_network_mask> } [ route-map <rmap-name> ] +
                         #    network <af_v6_network_number> [ route-map <af_v6_network_route_map> ] +
-                        m = p31.match(line)
+                        m = self.p31.match(line)
                         if m:
                             if m.groupdict()['af_network_mask']:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_network_number'] = \
@@ -6654,7 +6723,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    network { <af_network_number>/<ip-prefix> } [ route-map <rmap-name> ] +
-                        m = p32.match(line)
+                        m = self.p32.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_network_number'] = \
                                 str(m.groupdict()['af_network_number'])
@@ -6666,7 +6735,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute isis <Isis.pid> route-map <route_policy>
-                        m = p33.match(line)
+                        m = self.p33.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_redist_isis'] = \
                                 str(m.groupdict()['af_redist_isis'])
@@ -6675,7 +6744,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute isis <Isis.pid> route-map <route_policy>
-                        m = p34.match(line)
+                        m = self.p34.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_redist_isis'] = \
                                 str(m.groupdict()['af_redist_isis'])
@@ -6685,7 +6754,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         #    redistribute ospf <Ospf.pid> route-map <route_policy>
                         #    redistribute ospfv3 <Ospf.pid> route-map <route_policy>
-                        m = p35.match(line)
+                        m = self.p35.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_redist_ospf'] = \
                                 str(m.groupdict()['af_redist_ospf'])
@@ -6694,7 +6763,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    Redistribute rip <Rip.pid> route-map <route_policy>
-                        m = p36.match(line)
+                        m = self.p36.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_redist_rip'] = \
                                 str(m.groupdict()['af_redist_rip'])
@@ -6703,7 +6772,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute static route-map <route_policy>
-                        m = p37.match(line)
+                        m = self.p37.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_redist_static'] = True
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_redist_static_route_policy'] = \
@@ -6711,7 +6780,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute direct route-map <route_policy>
-                        m = p38.match(line)
+                        m = self.p38.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_redist_connected'] = True
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_redist_connected_route_policy'] = \
@@ -6719,32 +6788,32 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    allocate-label all
-                        m = p39.match(line)
+                        m = self.p39.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_v6_allocate_label_all'] = True
                             continue
 
                         #    retain route-target all
-                        m = p40.match(line)
+                        m = self.p40.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_retain_rt_all'] = True
                             continue
 
                         #    label-allocation-mode per-vrf
-                        m = p41.match(line)
+                        m = self.p41.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]['af_label_allocation_mode'] = \
                                 str(m.groupdict()['per_vrf'])
                             continue
 
                         #    advertise-pip
-                        m = p103.match(line)
+                        m = self.p103.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['af_name'][af_name]\
                                 ['af_advertise_pip'] = True
                             continue
                     #   neighbor <neighbor_id>
-                    m = p42.match(line)
+                    m = self.p42.match(line)
                     if m:
                         # Get keys
                         neighbor_id = str(m.groupdict()['neighbor_id'])
@@ -6757,7 +6826,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     #   Same line of configuration can be configured under the peer session section
                     if neighbor_id:
                         #   bfd
-                        m = p43.match(line)
+                        m = self.p43.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_fall_over_bfd'] = \
                                 True
@@ -6767,7 +6836,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 False
 
                         #   capability suppress 4-byte-as
-                        m = p44.match(line)
+                        m = self.p44.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_suppress_four_byte_as_capability'] = \
                                 True
@@ -6777,14 +6846,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 False
 
                         #   description <nbr_description>
-                        m = p45.match(line)
+                        m = self.p45.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_description'] = \
                                 str(m.groupdict()['nbr_description'])
                             continue
 
                         #   disable-connected-check
-                        m = p46.match(line)
+                        m = self.p46.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_disable_connected_check'] = \
                                 True
@@ -6794,7 +6863,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 False
 
                         #   ebgp-multihop <nbr_ebgp_multihop_max_hop>
-                        m = p47.match(line)
+                        m = self.p47.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_ebgp_multihop'] = \
                                 True
@@ -6806,14 +6875,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 False
 
                         #   inherit peer-session <nbr_inherit_peer_session>
-                        m = p48.match(line)
+                        m = self.p48.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_inherit_peer_session'] = \
                                 str(m.groupdict()['nbr_inherit_peer_session'])
                             continue
 
                         #    { local-as <nbr_local_as_as_no> [ no-prepend [ replace-as [ dual-as ] ] ] }
-                        m = p49.match(line)
+                        m = self.p49.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_local_as_as_no'] = \
                                 int(m.groupdict()['nbr_local_as_as_no'])
@@ -6834,14 +6903,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 False
 
                         #   { remote-as <nbr_remote_as> }
-                        m = p50.match(line)
+                        m = self.p50.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_remote_as'] = \
                                 int(m.groupdict()['nbr_remote_as'])
                             continue
 
                         #   remove-private-as
-                        m = p51.match(line)
+                        m = self.p51.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_remove_private_as'] = \
                                 True
@@ -6851,7 +6920,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 False
 
                         #   shutdown
-                        m = p52.match(line)
+                        m = self.p52.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_shutdown'] = \
                                 True
@@ -6861,7 +6930,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 False
 
                         #   timers <nbr_keepalive_interval> <nbr_holdtime>
-                        m = p53.match(line)
+                        m = self.p53.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_keepalive_interval'] = \
                                 int(m.groupdict()['nbr_keepalive_interval'])
@@ -6870,35 +6939,35 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #   update-source <nbr_update_source>
-                        m = p54.match(line)
+                        m = self.p54.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_update_source'] = \
                                 str(m.groupdict()['nbr_update_source'])
                             continue
 
                         #   password <nbr_password_text>
-                        m = p55.match(line)
+                        m = self.p55.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_password_text'] = \
                                 str(m.groupdict()['nbr_password_text'])
                             continue
 
                         #   transport connection-mode <nbr_transport_connection_mode>
-                        m = p56.match(line)
+                        m = self.p56.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_transport_connection_mode'] = \
                                 str(m.groupdict()['nbr_transport_connection_mode'])
                             continue
 
                         # peer-type fabric-external
-                        m = p101.match(line)
+                        m = self.p101.match(line)
                         if m:
                             bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]\
                                 ['nbr_peer_type'] = m.groupdict()['nbr_peer_type']
                             continue
 
                         #   address-family <nbr_af_name>
-                        m = p57.match(line)
+                        m = self.p57.match(line)
                         if m:
                             nbr_af_name = str(m.groupdict()['nbr_af_name'])
                             if 'nbr_af_name' not in bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]:
@@ -6909,7 +6978,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         if nbr_af_name:
                             #   allowas-in [ <allowas-in-cnt> ]
-                            m = p58.match(line)
+                            m = self.p58.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_allowas_in'] = \
                                     True
@@ -6922,7 +6991,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                     False
 
                             #   inherit peer-policy <nbr_af_inherit_peer_policy> <nbr_af_inherit_peer_seq>
-                            m = p59.match(line)
+                            m = self.p59.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_inherit_peer_policy'] = \
                                     str(m.groupdict()['nbr_af_inherit_peer_policy'])
@@ -6931,7 +7000,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   maximum-prefix <nbr_af_maximum_prefix_max_prefix_no> [ <nbr_af_maximum_prefix_threshold> ] [ restart <nbr_af_maximum_prefix_restart> ]
-                            m = p60.match(line)
+                            m = self.p60.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_maximum_prefix_max_prefix_no'] = \
                                     int(m.groupdict()['nbr_af_maximum_prefix_max_prefix_no'])
@@ -6944,7 +7013,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   maximum-prefix <nbr_af_maximum_prefix_max_prefix_no> [ <nbr_af_maximum_prefix_threshold> ] [ warning-only ]
-                            m = p61.match(line)
+                            m = self.p61.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_maximum_prefix_max_prefix_no'] = \
                                     int(m.groupdict()['nbr_af_maximum_prefix_max_prefix_no'])
@@ -6959,21 +7028,21 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   route-map <nbr_af_route_map_name_in> in
-                            m = p62.match(line)
+                            m = self.p62.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_route_map_name_in'] = \
                                     str(m.groupdict()['nbr_af_route_map_name_in'])
                                 continue
 
                             #   route-map <nbr_af_route_map_name_out> out
-                            m = p63.match(line)
+                            m = self.p63.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_route_map_name_out'] = \
                                     str(m.groupdict()['nbr_af_route_map_name_out'])
                                 continue
 
                             #   route-reflector-client
-                            m = p64.match(line)
+                            m = self.p64.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_route_reflector_client'] = \
                                     True
@@ -6983,7 +7052,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                     False
 
                             #   send-community
-                            m = p65.match(line)
+                            m = self.p65.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_send_community'] = \
                                     'standard'
@@ -6991,7 +7060,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   send-community extended
-                            m = p66.match(line)
+                            m = self.p66.match(line)
                             if m:
                                 if send_community_standard_match:
                                     bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_send_community'] = \
@@ -7002,14 +7071,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             # rewrite-evpn-rt-asn
-                            m = p100.match(line)
+                            m = self.p100.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id][
                                     'nbr_af_name'][nbr_af_name]['nbr_af_rewrite_evpn_rt_asn'] = True
                                 continue
 
                             #   route-reflector-client
-                            m = p67.match(line)
+                            m = self.p67.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_soft_reconfiguration'] = \
                                     True
@@ -7019,7 +7088,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                     False
 
                             #   next-hop-self
-                            m = p68.match(line)
+                            m = self.p68.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_next_hop_self'] = \
                                     True
@@ -7029,7 +7098,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                     False
 
                             #   as-override
-                            m = p69.match(line)
+                            m = self.p69.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_as_override'] = \
                                     True
@@ -7039,7 +7108,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                     False
 
                             #   default-originate [ route-map <nbr_af_default_originate_route_map> ]
-                            m = p70.match(line)
+                            m = self.p70.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_default_originate'] = \
                                     True
@@ -7052,14 +7121,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                     False
 
                             #   soo <nbr_af_soo>
-                            m = p71.match(line)
+                            m = self.p71.match(line)
                             if m:
                                 bgp_dict['bgp']['instance']['default']['vrf'][vrf]['neighbor_id'][neighbor_id]['nbr_af_name'][nbr_af_name]['nbr_af_soo'] = \
                                     str(m.groupdict()['nbr_af_soo'])
                                 continue
 
                 #   template peer-session PEER-SESSION
-                m = p72.match(line)
+                m = self.p72.match(line)
                 if m:
                     # Get keys
                     ps_name = str(m.groupdict()['ps_name'])
@@ -7071,7 +7140,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if ps_name:
                     #   bfd
-                    m = p73.match(line)
+                    m = self.p73.match(line)
                     if m:
                         # Get keys
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_fall_over_bfd'] = True
@@ -7080,7 +7149,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_fall_over_bfd'] = False
 
                     #   capability suppress 4-byte-as
-                    m = p74.match(line)
+                    m = self.p74.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_suppress_four_byte_as_capability'] = True
                         continue
@@ -7088,7 +7157,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_suppress_four_byte_as_capability'] = False
 
                     #   description <ps_description>
-                    m = p75.match(line)
+                    m = self.p75.match(line)
                     if m:
                         # Get keys
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_description'] = \
@@ -7096,7 +7165,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   disable-connected-check
-                    m = p76.match(line)
+                    m = self.p76.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_disable_connected_check'] = True
                         continue
@@ -7104,7 +7173,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_disable_connected_check'] = False
 
                     #   ebgp-multihop <ps_ebgp_multihop_max_hop>
-                    m = p77.match(line)
+                    m = self.p77.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_ebgp_multihop'] = True
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_ebgp_multihop_max_hop'] = \
@@ -7114,7 +7183,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_ebgp_multihop'] = False
 
                     #    { local-as <ps_local_as_as_no> [ no-prepend [ replace-as [ dual-as ] ] ] }
-                    m = p78.match(line)
+                    m = self.p78.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_local_as_as_no'] = \
                             str(m.groupdict()['ps_local_as_as_no'])
@@ -7134,21 +7203,21 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             False
 
                     #   password <ps_password_text>
-                    m = p79.match(line)
+                    m = self.p79.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_password_text'] = \
                             str(m.groupdict()['ps_password_text'])
                         continue
 
                     #   { remote-as <ps_remote_as> }
-                    m = p80.match(line)
+                    m = self.p80.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_remote_as'] = \
                             int(m.groupdict()['ps_remote_as'])
                         continue
 
                     #   shutdown
-                    m = p81.match(line)
+                    m = self.p81.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_shutdown'] = \
                             True
@@ -7158,7 +7227,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             False
 
                     #   timers <ps_keepalive_interval> <ps_hodltime>
-                    m = p82.match(line)
+                    m = self.p82.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_keepalive_interval'] = \
                             int(m.groupdict()['ps_keepalive_interval'])
@@ -7167,7 +7236,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   transport connection-mode <ps_transport_connection_mode>
-                    m = p83.match(line)
+                    m = self.p83.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['ps_name'][ps_name]['ps_transport_connection_mode'] = \
                             str(m.groupdict()['ps_transport_connection_mode'])
@@ -7180,7 +7249,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                 #   template peer-policy <pp_name>
-                m = p85.match(line)
+                m = self.p85.match(line)
                 if m:
                     # Get keys
                     pp_name = str(m.groupdict()['pp_name'])
@@ -7192,7 +7261,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if pp_name:
                     #   allowas-in [ <allowas-in-cnt> ]
-                    m = p86.match(line)
+                    m = self.p86.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_allowas_in'] = \
                             True
@@ -7205,7 +7274,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             False
 
                     #   as-override
-                    m = p87.match(line)
+                    m = self.p87.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_as_override'] = \
                             True
@@ -7215,7 +7284,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             False
 
                     #   default-originate [ route-map <pp_default_originate_route_map> ]
-                    m = p88.match(line)
+                    m = self.p88.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_default_originate'] = \
                             True
@@ -7228,21 +7297,21 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             False
 
                     #   route-map <pp_route_map_name_in> in
-                    m = p89.match(line)
+                    m = self.p89.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_route_map_name_in'] = \
                             str(m.groupdict()['pp_route_map_name_in'])
                         continue
 
                     #   route-map <nbr_af_route_map_name_out> out
-                    m = p90.match(line)
+                    m = self.p90.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_route_map_name_out'] = \
                             str(m.groupdict()['pp_route_map_name_out'])
                         continue
 
                     #    maximum-prefix <pp_maximum_prefix_max_prefix_no> [ <pp_maximum_prefix_threshold> ] [ restart <pp_maximum_prefix_restart> ]
-                    m = p91.match(line)
+                    m = self.p91.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_maximum_prefix_max_prefix_no'] = \
                             int(m.groupdict()['pp_maximum_prefix_max_prefix_no'])
@@ -7253,7 +7322,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   maximum-prefix <pp_maximum_prefix_max_prefix_no> [ <pp_maximum_prefix_threshold> ] [ warning-only ]
-                    m = p92.match(line)
+                    m = self.p92.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_maximum_prefix_max_prefix_no'] = \
                             int(m.groupdict()['pp_maximum_prefix_max_prefix_no'])
@@ -7268,7 +7337,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   next-hop-self
-                    m = p93.match(line)
+                    m = self.p93.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_next_hop_self'] = \
                             True
@@ -7278,7 +7347,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             False
 
                     #   route-reflector-client
-                    m = p94.match(line)
+                    m = self.p94.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_route_reflector_client'] = \
                             True
@@ -7288,7 +7357,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             False
 
                     #   send-community
-                    m = p95.match(line)
+                    m = self.p95.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_send_community'] = \
                             'standard'
@@ -7296,7 +7365,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   send-community extended
-                    m = p96.match(line)
+                    m = self.p96.match(line)
                     if m:
                         if peer_policy_send_community_standard_match:
                             bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_send_community'] = \
@@ -7307,7 +7376,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   route-reflector-client
-                    m = p97.match(line)
+                    m = self.p97.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_soft_reconfiguration'] = \
                             True
@@ -7317,7 +7386,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             False
 
                     #   soo <pp_soo>
-                    m = p98.match(line)
+                    m = self.p98.match(line)
                     if m:
                         bgp_dict['bgp']['instance']['default']['pp_name'][pp_name]['pp_soo'] = \
                             str(m.groupdict()['pp_soo'])
@@ -7783,230 +7852,90 @@ class ShowBgpAllNexthopDatabase(ShowBgpVrfAllAllNextHopDatabase):
     def cli(self,output=None):
         return super().cli(cmd=self.cli_command,output=output)
 
-    def xml(self):
-        out = self.device.execute(self.xml_command)
-
-        etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_nhvrf')
-        if not vrf_root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_nhvrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}nhvrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
-
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_nhafi'.format(namespace))
-
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_nhafi'.format(namespace)):
-
-                # address_family
-                row_safi = af_root.find('{}TABLE_nhsafi'.format(namespace))
-                af_root = row_safi.find('{}ROW_nhsafi'.format(namespace))
-                try:
-                    af = af_root.find('{}af-name'.format(namespace)).text.lower()
-                except Exception:
-                    continue
-
-                if 'address_family' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['address_family'] = {}
-                if af not in etree_dict['vrf'][vrf]['address_family']:
-                    etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                # af_nexthop_trigger_enable
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['af_nexthop_trigger_enable'] = True
-
-                # <nhnoncriticaldelay>10000</nhnoncriticaldelay>
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_non_critical'] = int(af_root.find('{}nhnoncriticaldelay'
-                                                             .format(namespace)).text)
-                # <nhcriticaldelay>3000</nhcriticaldelay>
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_critical'] = int(af_root.find('{}nhcriticaldelay'
-                                                             .format(namespace)).text)
-
-                # nexthop table
-                next_hop = af_root.find('{}TABLE_nexthop'.format(namespace))
-                if not next_hop:
-                    continue
-
-                # -----   loop nexthop  -----
-                for nexthop_root in next_hop.findall('{}ROW_nexthop'.format(namespace)):
-                    # nexthop
-                    # <ipnexthop-out>192.168.154.1</ipnexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipnexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    # <ipv6nexthop-out>2000::3:1</ipv6nexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipv6nexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    if 'next_hop' not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'] = {}
-
-                    if nexthop not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]['next_hop']:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'][nexthop] = {}
-
-                    sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                        ['next_hop'][nexthop]
-
-                    # <refcount>1</refcount>
-                    sub_dict['refcount'] = int(nexthop_root.find(
-                                                '{}refcount'.format(namespace)).text)
-
-                    # <igpmetric>3</igpmetric>
-                    sub_dict['igp_cost'] = \
-                        int(nexthop_root.find('{}igpmetric'.format(namespace)).text)
-
-                    # <multipath>false</multipath>
-                    try:
-                        if nexthop_root.find('{}multipath'.format(namespace)).text == 'false':
-                            sub_dict['multipath'] = 'No'
-                        else:
-                            sub_dict['multipath'] = 'Yes'
-                    except Exception:
-                        pass
-
-                    # <igptype>0</igptype>
-                    sub_dict['igp_route_type'] = \
-                        int(nexthop_root.find('{}igptype'.format(namespace)).text)
-
-                    # <igppref>110</igppref>
-                    sub_dict['igp_preference'] = \
-                        int(nexthop_root.find('{}igppref'.format(namespace)).text)
-
-                    # <attached>false</attached>
-                    if nexthop_root.find('{}attached'.format(namespace)).text == 'false':
-                        sub_dict['attached'] = False
-                    else:
-                        sub_dict['attached'] = True
-
-
-                    # <local>false</local>
-                    if nexthop_root.find('{}local'.format(namespace)).text == 'false':
-                        sub_dict['local'] = False
-                    else:
-                        sub_dict['local'] = True
-
-                    # <reachable>true</reachable>
-                    if nexthop_root.find('{}reachable'.format(namespace)).text == 'false':
-                        sub_dict['reachable'] = False
-                    else:
-                        sub_dict['reachable'] = True
-
-                    # <labeled>true</labeled>
-                    if nexthop_root.find('{}labeled'.format(namespace)).text == 'false':
-                        sub_dict['labeled'] = False
-                    else:
-                        sub_dict['labeled'] = True
-
-                    # <filtered>false</filtered>
-                    if nexthop_root.find('{}filtered'.format(namespace)).text == 'false':
-                        sub_dict['filtered'] = False
-                    else:
-                        sub_dict['filtered'] = True
-
-                    # <pendingupdate>false</pendingupdate>
-                    if nexthop_root.find('{}pendingupdate'.format(namespace)).text == 'false':
-                        sub_dict['pending_update'] = False
-                    else:
-                        sub_dict['pending_update'] = True
-
-                    # <resolvetime>18:38:21</resolvetime>
-                    sub_dict['resolve_time'] = \
-                        nexthop_root.find('{}resolvetime'.format(namespace)).text
-
-                    # <ribroute>192.168.154.1/32</ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ribroute'.format(namespace)).text
-                    except Exception:
-                        pass                    
-
-                    # <ipv6ribroute>0::/0</ipv6ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ipv6ribroute'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    # <nextadvertise>Never</nextadvertise>
-                    sub_dict['metric_next_advertise'] = \
-                        nexthop_root.find('{}nextadvertise'.format(namespace)).text.lower()
-
-                    # <rnhepoch>1</rnhepoch>
-                    sub_dict['rnh_epoch'] = \
-                        int(nexthop_root.find('{}rnhepoch'.format(namespace)).text)
-
-
-                    # attachedhops table
-                    attached = nexthop_root.find('{}TABLE_attachedhops'.format(namespace))
-                    if not attached:
-                        continue
-
-                    # -----   loop attachedhops  -----
-                    for attach_root in attached.findall('{}ROW_attachedhops'.format(namespace)):
-
-                        # <attachedhop>192.168.66.2</attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
+    # Leaves of the rows of the xml reply
+    xml_fields = {
+        'ROW_nhvrf': {
+            'nhvrf-name-out': 'vrf'},
+        'ROW_nhsafi': {
+            'af-name': ('af', str.lower),
+            'nhnoncriticaldelay': ('nexthop_trigger_delay_non_critical', int),
+            'nhcriticaldelay': ('nexthop_trigger_delay_critical', int)},
+        'ROW_nexthop': {
+            'ipnexthop-out': 'next_hop',
+            'ipv6nexthop-out': 'next_hop',
+            'refcount': ('refcount', int),
+            'igpmetric': ('igp_cost', int),
+            'multipath': ('multipath', lambda value: 'Yes' if xml_bool(value)
+                          else 'No'),
+            'igptype': ('igp_route_type', int),
+            'igppref': ('igp_preference', int),
+            'attached': ('attached', xml_bool),
+            'local': ('local', xml_bool),
+            'reachable': ('reachable', xml_bool),
+            'labeled': ('labeled', xml_bool),
+            'filtered': ('filtered', xml_bool),
+            'pendingupdate': ('pending_update', xml_bool),
+            'resolvetime': 'resolve_time',
+            'ribroute': 'rib_route',
+            'ipv6ribroute': 'rib_route',
+            'nextadvertise': ('metric_next_advertise', str.lower),
+            'rnhepoch': ('rnh_epoch', int)},
+        'ROW_attachedhops': {
+            'attachedhop': 'attached_nexthop',
+            'ipv6attachedhop': 'attached_nexthop',
+            'interface': 'attached_nexthop_interface'},
+    }
 
-                        # <ipv6attachedhop>fe80::6e9c:edff:fe4d:ff41</ipv6attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}ipv6attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'attached_nexthop' not in sub_dict:
-                            sub_dict['attached_nexthop'] = {}
+    def xml(self, output=None):
+        if output is None:
+            out = self.device.execute(self.xml_command)
+        else:
+            out = output
 
-                        if att_hop not in sub_dict['attached_nexthop']:
-                            sub_dict['attached_nexthop'][att_hop] = {}
+        etree_dict = {}
+        # Attached hops of the next hop being read, which come before it
+        attached = []
+
+        for row in iter_xml_rows(self.xml_fields, output=out,
+                                 command=self.cli_command):
+            values = row.values
+            if row.tag == 'ROW_attachedhops':
+                attached.append(values)
+                continue
+
+            # The next hops of an address family, and the address families
+            # of a vrf, come before it
+            vrf_values = row.parents[0].values if row.parents else values
+            af_values = values if row.tag == 'ROW_nhsafi' else \
+                row.parents[-1].values if row.parents else {}
+            if 'vrf' not in vrf_values:
+                attached = []
+                continue
+            vrf_dict = etree_dict.setdefault('vrf', {})\
+                .setdefault(vrf_values['vrf'], {})
+            if row.tag == 'ROW_nhvrf' or 'af' not in af_values:
+                attached = []
+                continue
+            af_dict = vrf_dict.setdefault('address_family', {})\
+                .setdefault(af_values['af'], {})
+            af_dict['af_nexthop_trigger_enable'] = True
+
+            if row.tag == 'ROW_nhsafi':
+                values.pop('af')
+                af_dict.update(values)
+                continue
+
+            # -----   nexthop  -----
+            if 'next_hop' in values:
+                sub_dict = af_dict.setdefault('next_hop', {})\
+                    .setdefault(values.pop('next_hop'), {})
+                sub_dict.update(values)
+                for hop in attached:
+                    if 'attached_nexthop' in hop:
+                        sub_dict.setdefault('attached_nexthop', {})\
+                            [hop.pop('attached_nexthop')] = hop
+            attached = []
 
-                        # <interface>port-channel2.100</interface>
-                        sub_dict['attached_nexthop'][att_hop]['attached_nexthop_interface'] = \
-                            attach_root.find('{}interface'.format(namespace)).text                                                                                                          
         return etree_dict
 
 
@@ -9338,7 +9267,33 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
 
         return ret_dict
 
-    def xml(self, vrf=''):
+    # Leaves of the rows of the xml reply
+    xml_fields = {
+        '__readonly__': {
+            'totalpeers': ('total_peers', int),
+            'totalestablishedpeers': ('total_established_peers', int),
+            'localas': ('local_as', int)},
+        'ROW_vrf': {
+            'vrf-name-out': 'vrf',
+            'local-as': ('local_as', int),
+            'vrfpeers': ('vrf_peers', int),
+            'vrfestablishedpeers': ('vrf_established_peers', int),
+            'router-id': 'router_id'},
+        'ROW_neighbor': {
+            'neighbor-id': 'neighbor',
+            'connectionsdropped': ('connections_dropped', int),
+            'remoteas': ('remote_as', int),
+            'lastflap': ('last_flap', xml_time),
+            'lastread': ('last_read', xml_time),
+            'lastwrite': ('last_write', xml_time),
+            'state': ('state', str.lower),
+            'localport': ('local_port', int),
+            'remoteport': ('remote_port', int),
+            'notificationssent': ('notifications_sent', int),
+            'notificationsreceived': ('notifications_received', int)},
+    }
+
+    def xml(self, vrf='', output=None):
         if vrf:
             cmd = self.xml_command[0].format(vrf=vrf)
             cli_cmd = self.cli_command[0].format(vrf=vrf)
@@ -9346,188 +9301,34 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
             cmd = self.xml_command[1]
             cli_cmd = self.cli_command[1]
 
-        out = self.device.execute(cmd)
-
-        etree_dict = {}
-
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
-
-        ret = Common.retrieve_xml_child(
-                root=root,
-                key='__readonly__')
-
-        if hasattr(ret, 'tag'):
-            # get total_peers                
-            try:
-                total_peers = ret.find('{}totalpeers'.format(namespace)).text
-                etree_dict['total_peers'] = int(total_peers)
-            except Exception:
-                pass
-
-            # get total_established_peers            
-            try:
-                total_established_peers = ret.find(
-                    '{}totalestablishedpeers'.format(namespace)).text
-                etree_dict['total_established_peers'] = int(total_established_peers)
-            except Exception:
-                pass
-
-            # get local_as               
-            try:
-                local_as = ret.find('{}localas'.format(namespace)).text
-                etree_dict['local_as'] = int(local_as)
-            except Exception:
-                pass
-
+        if output is None:
+            out = self.device.execute(cmd)
         else:
-            # output is empty
-            return etree_dict
-
-        # find Vrf root
-        root = ret.find('{}TABLE_vrf'.format(namespace))
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
-
-            # <local-as>333</local-as>
-            etree_dict['vrf'][vrf]['local_as'] = \
-                int(vrf_tree.find('{}local-as'.format(namespace)).text)
+            out = output
 
-            # <vrfpeers>3</vrfpeers>
-            etree_dict['vrf'][vrf]['vrf_peers'] = \
-                int(vrf_tree.find('{}vrfpeers'.format(namespace)).text)
+        etree_dict = {}
 
-            # <vrfestablishedpeers>2</vrfestablishedpeers>
-            etree_dict['vrf'][vrf]['vrf_established_peers'] = \
-                int(vrf_tree.find('{}vrfestablishedpeers'.format(namespace)).text)
-                
-            # <router-id>10.106.0.6</router-id>
-            etree_dict['vrf'][vrf]['router_id'] = \
-                vrf_tree.find('{}router-id'.format(namespace)).text
-                
-             # Neighbor table
-            nei_tree = vrf_tree.find('{}TABLE_neighbor'.format(namespace))
-            if not nei_tree:
+        for row in iter_xml_rows(self.xml_fields, output=out,
+                                 command=cli_cmd):
+            values = row.values
+            if row.tag == '__readonly__':
+                etree_dict.update(values)
                 continue
-
-            # -----   loop neighbors  -----
-            for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                # neighbor
-                try:
-                    nei = nei_root.find('{}neighbor-id'.format(namespace)).text
-                except Exception:
-                    continue
-
-                if 'neighbor' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['neighbor'] = {}
-
-                if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                    etree_dict['vrf'][vrf]['neighbor'][nei] = {}
-
-                # <connectionsdropped>0</connectionsdropped>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['connections_dropped'] = \
-                        int(nei_root.find('{}connectionsdropped'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <remoteas>333</remoteas>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['remote_as'] = \
-                        int(nei_root.find('{}remoteas'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <lastflap>PT1H4M41S</lastflap>
-                try:
-                    ret = nei_root.find('{}lastflap'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = 'never'
-                    
-                # <lastread>PT47S</lastread>
-                try:
-                    ret = nei_root.find('{}lastread'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = 'never'
-                    
-                # <lastwrite>PT15S</lastwrite>
-                try:
-                    ret = nei_root.find('{}lastwrite'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = 'never'
-                    
-                # <state>Established</state>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['state'] = \
-                        nei_root.find('{}state'.format(namespace)).text.lower()
-                except Exception:
-                    pass
-                    
-                # <localport>179</localport>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['local_port'] = \
-                        int(nei_root.find('{}localport'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <remoteport>48392</remoteport>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['remote_port'] = \
-                        int(nei_root.find('{}remoteport'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <notificationssent>0</notificationssent>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_sent'] = \
-                        int(nei_root.find('{}notificationssent'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <notificationsreceived>0</notificationsreceived>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_received'] = \
-                        int(nei_root.find('{}notificationsreceived'.format(namespace)).text)
-                except Exception:
-                    pass                    
+            # The neighbors of a vrf come before it
+            vrf = values.pop('vrf', None) if row.tag == 'ROW_vrf' else \
+                row.parents[-1].values.get('vrf')
+            if vrf is None:
+                continue
+            vrf_dict = etree_dict.setdefault('vrf', {}).setdefault(vrf, {})
+            if row.tag == 'ROW_vrf':
+                vrf_dict.update(values)
+                continue
+            nei = values.pop('neighbor', None)
+            if nei is None:
+                continue
+            for key in ('last_flap', 'last_read', 'last_write'):
+                values.setdefault(key, 'never')
+            vrf_dict.setdefault('neighbor', {})[nei] = values
 
         return etree_dict
 
@@ -21,6 +21,21 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.stream import iter_lines, IncrementalParser
+from genie.libs.parser.utils.records import CompactParser
+from genie.libs.parser.utils.json_rows import JsonParser, iter_json_rows, \
+                                              loads
+
+
+def json_flag(value):
+    # disp_is_secure, disp_is_ntfy: 'enabled' or 'disabled'
+    return 'T' if value == 'enabled' else 'F'
+
+
+def json_mac_type(value):
+    # disp_is_static: 'enabled' or 'disabled'
+    return 'static' if value == 'enabled' else 'dynamic'
+
 
 class ShowMacAddressTableVniSchema(MetaParser):
     """Schema for:
@@ -59,14 +74,15 @@ class ShowMacAddressTableVniSchema(MetaParser):
             },
         }
 
-class ShowMacAddressTableBase(ShowMacAddressTableVniSchema):
+class ShowMacAddressTableBase(ShowMacAddressTableVniSchema,
+                              IncrementalParser):
     """Base parser for:
         'show mac address-table vni <WORD> | grep <WORD>'
         'show mac address-table local vni <WORD>'
         'show mac address-table'
         'show system internal l2fwder mac'"""
 
-    def cli(self, out):
+    def cli(self, out, output_stream=None):
 
         # initial return dictionary
         ret_dict = {}
@@ -82,7 +98,7 @@ class ShowMacAddressTableBase(ShowMacAddressTableVniSchema):
             '+(?P<drop>(drop|Drop))?'
             '(?P<ports>[a-zA-Z0-9\/\.\(\)\-\s]+)?$')
 
-        for line in out.splitlines():
+        for line in iter_lines(out, output_stream):
             line = line.strip()
 
             m = p1.match(line)
@@ -129,10 +145,10 @@ class ShowMacAddressTableVni(ShowMacAddressTableBase, ShowMacAddressTableVniSche
                    'show mac address-table local vni {vni}']
 
 
-    def cli(self, vni, interface=None, output=None):
+    def cli(self, vni, interface=None, output=None, output_stream=None):
 
         cmd = ""
-        if output is None:
+        if output is None and output_stream is None:
             if vni and interface:
                 cmd = self.cli_command[0].format(vni=vni, interface=interface)
             if vni and not interface:
@@ -144,19 +160,31 @@ class ShowMacAddressTableVni(ShowMacAddressTableBase, ShowMacAddressTableVniSche
         # C 1001     0000.04b1.0000   dynamic  0         F      F    nve1(10.9.0.101)
         # * 1001     00f1.0000.0000   dynamic  0         F      F    Eth1/11
         # get return dictionary
-        ret_dict = super().cli(out)
+        ret_dict = super().cli(out, output_stream=output_stream)
 
         return ret_dict
 
 
-class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableVniSchema):
+class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableVniSchema,
+                          CompactParser, JsonParser):
     """Parser for show mac address-table"""
 
     cli_command = 'show mac address-table'
 
-    def cli(self, output=None):
+    # show mac address-table | json
+    json_fields = {
+        'ROW_mac_address': {'disp_mac_addr': 'mac_address',
+                            'disp_type': 'entry',
+                            'disp_vlan': 'vlan',
+                            'disp_is_static': ('mac_type', json_mac_type),
+                            'disp_age': 'age',
+                            'disp_is_secure': ('secure', json_flag),
+                            'disp_is_ntfy': ('ntfy', json_flag),
+                            'disp_port': 'port'}}
 
-        if output is None:
+    def cli(self, output=None, output_stream=None):
+
+        if output is None and output_stream is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
@@ -167,10 +195,48 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableVniSchema)
         # G    -     5e00.c000.0007   static   -         F      F     (R)
 
         # get return dictionary
-        ret_dict = super().cli(out)
+        ret_dict = super().cli(out, output_stream=output_stream)
 
         return ret_dict
 
+    def json(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command + ' | json')
+
+        ret_dict = {}
+        vlans = {}
+        for row in iter_json_rows(self.json_fields, loads(output)):
+            values = row.values
+            vlan = values['vlan']
+            mac_address = values['mac_address']
+            vlan_dict = vlans.setdefault(vlan, {})
+            vlan_dict['vlan'] = vlan
+            mac_dict = vlan_dict.setdefault('mac_addresses', {})\
+                .setdefault(mac_address, {})
+            mac_dict['mac_address'] = mac_address
+            entry = values.get('entry', '').strip()
+            if entry:
+                mac_dict['entry'] = entry
+            mac_dict['secure'] = values.get('secure', 'F')
+            mac_dict['ntfy'] = values.get('ntfy', 'F')
+            port = values.get('port', '').strip()
+            if port.lower() == 'drop':
+                intf_dict = mac_dict.setdefault('drop', {})
+                intf_dict['drop'] = True
+            elif port:
+                port = Common.convert_intf_name(port)
+                intf_dict = mac_dict.setdefault('interfaces', {})\
+                    .setdefault(port, {})
+                intf_dict['interface'] = port
+            else:
+                continue
+            intf_dict['mac_type'] = values.get('mac_type', 'dynamic')
+            intf_dict['age'] = values.get('age', '-')
+
+        if vlans:
+            ret_dict['mac_table'] = {'vlans': vlans}
+        return ret_dict
+
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
     """Schema for show mac address-table aging-time"""
@@ -316,8 +382,8 @@ class ShowSystemInternalL2fwderMac(ShowMacAddressTableBase, ShowMacAddressTableV
 
     cli_command = 'show system internal l2fwder mac'
 
-    def cli(self, output=None):
-        if output is None:
+    def cli(self, output=None, output_stream=None):
+        if output is None and output_stream is None:
             # get output from device
             out = self.device.execute(self.cli_command)
         else:
@@ -329,6 +395,6 @@ class ShowSystemInternalL2fwderMac(ShowMacAddressTableBase, ShowMacAddressTableV
         # *     1  fa16.3eef.6e79   dynamic   00:01:02   F     F     Eth1/4
 
         # get return dictionary
-        ret_dict = super().cli(out)
+        ret_dict = super().cli(out, output_stream=output_stream)
 
         return ret_dict
\ No newline at end of file
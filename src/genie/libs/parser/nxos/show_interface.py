@@ -22,6 +22,26 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.regex import LazyRegex
+from genie.libs.parser.utils.dispatch import LineDispatcher
+from genie.libs.parser.utils.reparse import DifferentialParser
+from genie.libs.parser.utils.json_rows import JsonParser, iter_json_rows, \
+                                              loads, nested
+
+
+def json_load(value):
+    # eth_reliability, eth_txload, eth_rxload: '255' for 255/255
+    return '{}/255'.format(int(value))
+
+
+def json_on(value):
+    # eth_autoneg, eth_in_flowctrl, eth_out_flowctrl: 'on' or 'off'
+    return value == 'on'
+
+
+def json_encap(value):
+    # eth_encap: 'ARPA', '802.1Q Virtual LAN'
+    return value.lower().replace('802.1q virtual lan', 'dot1q')
 
 
 # ===========================
@@ -147,7 +167,7 @@ class ShowInterfaceSchema(MetaParser):
 # ===========================
 # Parser for 'show interface'
 # ===========================
-class ShowInterface(ShowInterfaceSchema):
+class ShowInterface(ShowInterfaceSchema, DifferentialParser, JsonParser):
     """Parser for show interface, show interface <interface>"""
 
     cli_command = ['show interface', 'show interface {interface}']
@@ -183,6 +203,273 @@ class ShowInterface(ShowInterfaceSchema):
       'in_crc_errors',
       'reliability']
 
+    # Ethernet2/1.10 is down (Administratively down)
+    p1 = LazyRegex(r'^(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
+                      ' *(?P<enabled>(down))'
+                      '( *\((?P<link_state>[a-zA-Z0-9\-\s]+)\))?$')
+
+    # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
+    # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
+    p1_1 = LazyRegex(r'^(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
+                      ' *(?P<enabled>[\w\s]+)'
+                      '( *\((?P<link_state>[\w\-\/\s]+)\))?, +'
+                      'line +protocol +is +(?P<line_protocol>\w+),? *'
+                      '(autostate +(?P<autostate>\w+))?$')
+
+    # Ethernet2/2 is up
+    p1_2 = LazyRegex(r'^(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
+                      ' *(?P<enabled>(up))'
+                      '( *\((?P<link_state>[a-zA-Z\s]+)\))?$')
+
+    # admin state is up
+    # admin state is up,
+    # admin state is up, Dedicated Interface
+    # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
+    p2 = LazyRegex(r'^admin +state +is'
+                       ' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
+                       '(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
+                       '(?:, +\[parent +interface +is'
+                       ' +(?P<parent_intf>(\S+))\])?$')
+
+    # Dedicated Interface
+    p2_1 = LazyRegex(r'^Dedicated Interface$')
+
+    # Belongs to Po1
+    p2_2 = LazyRegex(r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$')
+
+    # Hardware: Ethernet, address: 5254.00c9.d26e (bia 5254.00c9.d26e)
+    p3 = LazyRegex(r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
+                   ' *address: *(?P<mac_address>[a-z0-9\.]+)'
+                   ' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$')
+
+    #Description: desc
+    p4 = LazyRegex(r'^Description: *(?P<description>.*)$')
+
+    #Internet Address is 10.4.4.4/24 secondary tag 10
+    p5 = LazyRegex(r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
+                       '\/(?P<prefix_length>[0-9]+)'
+                       '(?: *(?P<secondary>(secondary)))?(?: *tag'
+                       ' *(?P<route_tag>[0-9]+))?$')
+
+    # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
+    # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
+    # MTU 1500 bytes, BW 1000000 Kbit
+    p6 = LazyRegex(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+                       ' *(?P<bandwidth>[0-9]+) *Kbit(, *DLY'
+                       ' *(?P<delay>[0-9]+) *usec)?,?$')     
+
+    # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
+    p6_1 = LazyRegex(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
+                       ' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
+                       ' *([0-9]+) *Kbit, *DLY'
+                       ' *(?P<delay>[0-9]+) *usec$')   
+
+    # reliability 255/255, txload 1/255, rxload 1/255
+    p7 = LazyRegex(r'^reliability *(?P<reliability>[0-9\/]+),'
+                       ' *txload *(?P<txload>[0-9\/]+),'
+                       ' *rxload *(?P<rxload>[0-9\/]+)$')   
+
+    #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
+    #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
+    #Encapsulation ARPA, medium is broadcast
+    p8 = LazyRegex(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                       ' *medium *is *(?P<medium>[a-zA-Z]+)$')   
+
+    p8_1 = LazyRegex(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                       ' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
+                       ' *medium *is *(?P<medium>[a-z0-9]+)$') 
+
+    # Encapsulation ARPA, loopback not set
+    p8_2 = LazyRegex(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
+                       ' *([\w\s]+)$') 
+
+    #Port mode is routed
+    p9 = LazyRegex(r'^Port *mode *is *(?P<port_mode>[a-z]+)$')
+
+    # auto-duplex, auto-speed
+    p10_1 = LazyRegex(r'^auto-duplex, +auto-speed$')
+
+    #full-duplex, 1000 Mb/s
+    # auto-duplex, auto-speed
+    # full-duplex, 1000 Mb/s, media type is 1G
+    # auto-duplex, auto-speed, media type is 10G
+    p10 = LazyRegex(r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+)(?: '
+                       '*[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$')
+
+    #Beacon is turned off
+    p11 = LazyRegex(r'^Beacon *is *turned *(?P<beacon>[a-z]+)$')
+
+    #Auto-Negotiation is turned off
+    p12 = LazyRegex(r'^Auto-Negotiation *is *turned'
+                       ' *(?P<auto_negotiate>(off))$')
+
+    #Auto-Negotiation is turned on
+    p12_1 = LazyRegex(r'^Auto-Negotiation *is *turned'
+                       ' *(?P<auto_negotiate>(on))$')
+
+    #Input flow-control is off, output flow-control is off
+    p13 = LazyRegex(r'^Input *flow-control *is *(?P<receive>(off)+),'
+                       ' *output *flow-control *is *(?P<send>(off)+)$')
+
+    #Input flow-control is off, output flow-control is on
+    p13_1 = LazyRegex(r'^Input *flow-control *is *(?P<receive>(on)+),'
+                       ' *output *flow-control *is *(?P<send>(on)+)$')
+
+    #Auto-mdix is turned off
+    p14 = LazyRegex(r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$')
+
+    #Switchport monitor is off 
+    p15 = LazyRegex(r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$')
+
+    #EtherType is 0x8100 
+    p16 = LazyRegex(r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$')
+
+    #EEE (efficient-ethernet) : n/a
+    p17 = LazyRegex(r'^EEE *\(efficient-ethernet\) *:'
+                       ' *(?P<efficient_ethernet>[A-Za-z\/]+)$')
+
+    #Last link flapped 00:07:28
+    p18 = LazyRegex(r'^Last *link *flapped'
+                       ' *(?P<last_link_flapped>[a-z0-9\:]+)$')
+
+    # Last clearing of "show interface" counters never
+    p19 = LazyRegex(r'^Last *clearing *of *\"show *interface\"'
+                       ' *counters *(?P<last_clear>[a-z0-9\:]+)$')
+
+    # Last clearing of "" counters 00:15:42
+    p19_1 = LazyRegex(r'^Last *clearing *of *\" *\"'
+                       ' *counters *(?P<last_clear>[a-z0-9\:]+)$')
+
+    #1 interface resets
+    p20 = LazyRegex(r'^(?P<interface_reset>[0-9]+) *interface'
+                       ' *resets$')
+
+    # 1 minute input rate 0 bits/sec, 0 packets/sec  
+    p21 = LazyRegex(r'^(?P<load_interval>[0-9\#]+)'
+                       ' *(minute|second|minutes|seconds) *input *rate'
+                       ' *(?P<in_rate>[0-9]+) *bits/sec,'
+                       ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
+
+    #1 minute output rate 24 bits/sec, 0 packets/sec
+    p22 = LazyRegex(r'^(?P<load_interval>[0-9\#]+)'
+                       ' *(minute|second|minutes|seconds) *output'
+                       ' *rate *(?P<out_rate>[0-9]+)'
+                       ' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
+                       ' *packets/sec$')
+
+    #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
+    p23 = LazyRegex(r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
+                       ' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
+                       ' *(?P<out_rate_bps>[0-9]+) *bps,'
+                       ' *(?P<out_rate_pps>[0-9]+) *pps$')
+
+    # RX
+    p23_1 = LazyRegex(r'^(?P<rx>(RX))$')
+
+    #0 unicast packets  0 multicast packets  0 broadcast packets
+    p24 = LazyRegex(r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
+                       ' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
+                       ' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$')
+
+    # 0 input packets  0 bytes
+    # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
+    p25 = LazyRegex(r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
+                     '+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
+                     '+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$')
+
+    #0 jumbo packets  0 storm suppression packets
+    p26 = LazyRegex(r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
+                       ' *(?P<in_storm_suppression_packets>[0-9]+)'
+                       ' *storm *suppression *packets$')
+
+    #0 runts  0 giants  0 CRC/FCS  0 no buffer
+    #0 runts  0 giants  0 CRC  0 no buffer
+    p27 = LazyRegex(r'^(?P<in_runts>[0-9]+) *runts'
+                       ' *(?P<in_oversize_frame>[0-9]+) *giants'
+                       ' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
+                       ' *(?P<in_no_buffer>[0-9]+) *no *buffer$')
+
+    #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
+    p28 = LazyRegex(r'^(?P<in_errors>[0-9]+) *input *error'
+                       ' *(?P<in_short_frame>[0-9]+) *short *frame'
+                       ' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
+                       ' *underrun *(?P<in_ignored>[0-9]+) *ignored$')
+
+    #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
+    p29 = LazyRegex(r'^(?P<in_watchdog>[0-9]+) *watchdog'
+                       ' *(?P<in_bad_etype_drop>[0-9]+)'
+                       ' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
+                       ' *bad *proto'
+                       ' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$')
+
+    # 0 input with dribble  0 input discard
+    p30 = LazyRegex(r'^(?P<in_with_dribble>[0-9]+) *input *with'
+                       ' *dribble *(?P<in_discard>[0-9]+) *input *discard$')
+
+    # 0 Rx pause
+    p31 = LazyRegex(r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$')
+
+    # TX
+    p31_1 = LazyRegex(r'^(?P<tx>(TX))$')
+
+    #0 unicast packets  0 multicast packets  0 broadcast packets
+    p32 = LazyRegex(r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
+                       ' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
+                       ' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$')
+
+    #0 output packets  0 bytes
+    p33 = LazyRegex(r'^(?P<out_pkts>[0-9]+) *output *packets'
+                       ' *(?P<out_octets>[0-9]+) *bytes$')
+
+    #0 jumbo packets
+    p34 = LazyRegex(r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$')
+
+    #0 output error  0 collision  0 deferred  0 late collision
+    p35 = LazyRegex(r'^(?P<out_errors>[0-9]+) *output *error'
+                       ' *(?P<out_collision>[0-9]+) *collision'
+                       ' *(?P<out_deferred>[0-9]+) *deferred'
+                       ' *(?P<out_late_collision>[0-9]+)'
+                       ' *late *collision$')
+
+    #0 lost carrier  0 no carrier  0 babble  0 output discard
+    p36 = LazyRegex(r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
+                       ' *(?P<out_no_carrier>[0-9]+) *no *carrier'
+                       ' *(?P<out_babble>[0-9]+) *babble'
+                       ' *(?P<out_discard>[0-9]+) *output *discard$')
+
+    #0 Tx pause
+    p37 = LazyRegex(r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$')
+
+    # Members in this channel: Eth1/15, Eth1/16
+    # Members in this channel: Eth1/28
+    p38 = LazyRegex(r'^Members +in +this +channel *: *'
+                    '(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
+
+    # 28910552 broadcast packets 63295517997 bytes
+    p39 = LazyRegex(r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$')
+
+    # Only try the regexes whose leading token matches the line
+    dispatcher = LineDispatcher()
+
+    # parse_blocks: one block per interface
+    block_header = ('p1', 'p1_1', 'p1_2')
+
+    # reparse: lines changing between polls, with the lines they depend on:
+    # the lines creating the dicts they write into, the lines whose values
+    # they read and the lines writing the same keys. The counters lines are
+    # parsed under their RX or TX line
+    reparse_lines = [('p7', ()), ('p18', ()), ('p20', ()),
+                     ('p21', ('p22', 'p23')), ('p22', ('p21', 'p23')),
+                     ('p23', ('p21', 'p22')),
+                     ('p19', ('p24',)), ('p19_1', ('p24',))] + \
+                    [(regex, ('p19', 'p19_1', 'p21', 'p23_1', 'p31_1', 'p24',
+                              'p25', 'p39'))
+                     for regex in ('p24', 'p25', 'p39')] + \
+                    [(regex, ('p21', 'p23_1', 'p31_1'))
+                     for regex in ('p23_1', 'p26', 'p27', 'p28', 'p29', 'p30',
+                                   'p31', 'p31_1', 'p32', 'p33', 'p34', 'p35',
+                                   'p36', 'p37')]
+
     def cli(self, interface="", output=None):
         if output is None:
             if interface:
@@ -193,256 +480,6 @@ class ShowInterface(ShowInterfaceSchema):
         else:
             out = output
 
-        # Ethernet2/1.10 is down (Administratively down)
-        p1 =  re.compile(r'^(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
-                            ' *(?P<enabled>(down))'
-                            '( *\((?P<link_state>[a-zA-Z0-9\-\s]+)\))?$')
-
-        # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
-        # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
-        p1_1 =  re.compile(r'^(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
-                            ' *(?P<enabled>[\w\s]+)'
-                            '( *\((?P<link_state>[\w\-\/\s]+)\))?, +'
-                            'line +protocol +is +(?P<line_protocol>\w+),? *'
-                            '(autostate +(?P<autostate>\w+))?$')
-
-        # Ethernet2/2 is up
-        p1_2 =  re.compile(r'^(?P<interface>[a-zA-Z0-9\/\.\-]+) *is'
-                            ' *(?P<enabled>(up))'
-                            '( *\((?P<link_state>[a-zA-Z\s]+)\))?$')
-
-        # admin state is up
-        # admin state is up,
-        # admin state is up, Dedicated Interface
-        # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-        p2 = re.compile(r'^admin +state +is'
-                            ' +(?P<admin_state>([a-zA-Z0-9\/\.]+))(?:,)?'
-                            '(?: +(?P<dedicated_intf>(Dedicated Interface)))?'
-                            '(?:, +\[parent +interface +is'
-                            ' +(?P<parent_intf>(\S+))\])?$')
-
-        # Dedicated Interface
-        p2_1 = re.compile(r'^Dedicated Interface$')
-
-        # Belongs to Po1
-        p2_2 = re.compile(r'^Belongs *to *(?P<port_channel_int>[a-zA-Z0-9]+)$')
-
-        # Hardware: Ethernet, address: 5254.00c9.d26e (bia 5254.00c9.d26e)
-        p3 = re.compile(r'^Hardware: *(?P<types>[a-zA-Z0-9\/\s]+),'
-                        ' *address: *(?P<mac_address>[a-z0-9\.]+)'
-                        ' *\(bia *(?P<phys_address>[a-z0-9\.]+)\)$')
-
-        #Description: desc
-        p4 = re.compile(r'^Description: *(?P<description>.*)$')
-
-        #Internet Address is 10.4.4.4/24 secondary tag 10
-        p5 = re.compile(r'^Internet *Address *is *(?P<ip>[0-9\.]+)'
-                            '\/(?P<prefix_length>[0-9]+)'
-                            '(?: *(?P<secondary>(secondary)))?(?: *tag'
-                            ' *(?P<route_tag>[0-9]+))?$')
-
-        # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
-        # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
-        # MTU 1500 bytes, BW 1000000 Kbit
-        p6 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                            ' *(?P<bandwidth>[0-9]+) *Kbit(, *DLY'
-                            ' *(?P<delay>[0-9]+) *usec)?,?$')     
-
-        # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-        p6_1 = re.compile(r'^MTU *(?P<mtu>[0-9]+) *bytes, *BW'
-                            ' *(?P<bandwidth>[0-9]+) *Kbit, *,? *BW'
-                            ' *([0-9]+) *Kbit, *DLY'
-                            ' *(?P<delay>[0-9]+) *usec$')   
-
-        # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability *(?P<reliability>[0-9\/]+),'
-                            ' *txload *(?P<txload>[0-9\/]+),'
-                            ' *rxload *(?P<rxload>[0-9\/]+)$')   
-
-        #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
-        #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
-        #Encapsulation ARPA, medium is broadcast
-        p8 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                            ' *medium *is *(?P<medium>[a-zA-Z]+)$')   
-
-        p8_1 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                            ' *Vlan *ID *(?P<first_dot1q>[0-9]+),'
-                            ' *medium *is *(?P<medium>[a-z0-9]+)$') 
-
-        # Encapsulation ARPA, loopback not set
-        p8_2 = re.compile(r'^Encapsulation *(?P<encapsulation>[a-zA-Z0-9\.\s]+),'
-                            ' *([\w\s]+)$') 
-
-        #Port mode is routed
-        p9 = re.compile(r'^Port *mode *is *(?P<port_mode>[a-z]+)$')
-
-        # auto-duplex, auto-speed
-        p10_1 = re.compile(r'^auto-duplex, +auto-speed$')
-
-        #full-duplex, 1000 Mb/s
-        # auto-duplex, auto-speed
-        # full-duplex, 1000 Mb/s, media type is 1G
-        # auto-duplex, auto-speed, media type is 10G
-        p10 = re.compile(r'^(?P<duplex_mode>[a-z]+)-duplex, *(?P<port_speed>[a-z0-9\-]+)(?: '
-                            '*[G|M]b/s)?(?:, +media +type +is (?P<media_type>\w+))?$')
-
-        #Beacon is turned off
-        p11 = re.compile(r'^Beacon *is *turned *(?P<beacon>[a-z]+)$')
-
-        #Auto-Negotiation is turned off
-        p12 = re.compile(r'^Auto-Negotiation *is *turned'
-                            ' *(?P<auto_negotiate>(off))$')
-
-        #Auto-Negotiation is turned on
-        p12_1 = re.compile(r'^Auto-Negotiation *is *turned'
-                            ' *(?P<auto_negotiate>(on))$')
-
-        #Input flow-control is off, output flow-control is off
-        p13 = re.compile(r'^Input *flow-control *is *(?P<receive>(off)+),'
-                            ' *output *flow-control *is *(?P<send>(off)+)$')
-
-        #Input flow-control is off, output flow-control is on
-        p13_1 = re.compile(r'^Input *flow-control *is *(?P<receive>(on)+),'
-                            ' *output *flow-control *is *(?P<send>(on)+)$')
-
-        #Auto-mdix is turned off
-        p14 = re.compile(r'^Auto-mdix *is *turned *(?P<auto_mdix>[a-z]+)$')
-
-        #Switchport monitor is off 
-        p15 = re.compile(r'^Switchport *monitor *is *(?P<switchport_monitor>[a-z]+)$')
-
-        #EtherType is 0x8100 
-        p16 = re.compile(r'^EtherType *is *(?P<ethertype>[a-z0-9]+)$')
-
-        # Members in this channel: Eth1/15, Eth1/16
-        # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                            '(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
-
-        #EEE (efficient-ethernet) : n/a
-        p17 = re.compile(r'^EEE *\(efficient-ethernet\) *:'
-                            ' *(?P<efficient_ethernet>[A-Za-z\/]+)$')
-
-        #Last link flapped 00:07:28
-        p18 = re.compile(r'^Last *link *flapped'
-                            ' *(?P<last_link_flapped>[a-z0-9\:]+)$')
-
-        # Last clearing of "show interface" counters never
-        p19 = re.compile(r'^Last *clearing *of *\"show *interface\"'
-                            ' *counters *(?P<last_clear>[a-z0-9\:]+)$')
-
-        # Last clearing of "" counters 00:15:42
-        p19_1 = re.compile(r'^Last *clearing *of *\" *\"'
-                            ' *counters *(?P<last_clear>[a-z0-9\:]+)$')
-
-        #1 interface resets
-        p20 = re.compile(r'^(?P<interface_reset>[0-9]+) *interface'
-                            ' *resets$')
-
-        # 1 minute input rate 0 bits/sec, 0 packets/sec  
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                            ' *(minute|second|minutes|seconds) *input *rate'
-                            ' *(?P<in_rate>[0-9]+) *bits/sec,'
-                            ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
-
-        #1 minute output rate 24 bits/sec, 0 packets/sec
-        p22 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                            ' *(minute|second|minutes|seconds) *output'
-                            ' *rate *(?P<out_rate>[0-9]+)'
-                            ' *bits/sec, *(?P<out_rate_pkts>[0-9]+)'
-                            ' *packets/sec$')
-
-        #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-        p23 = re.compile(r'^input *rate *(?P<in_rate_bps>[0-9]+) *bps,'
-                            ' *(?P<in_rate_pps>[0-9]+) *pps; *output *rate'
-                            ' *(?P<out_rate_bps>[0-9]+) *bps,'
-                            ' *(?P<out_rate_pps>[0-9]+) *pps$')
-
-        # RX
-        p23_1 = re.compile(r'^(?P<rx>(RX))$')
-
-        #0 unicast packets  0 multicast packets  0 broadcast packets
-        p24 = re.compile(r'^(?P<in_unicast_pkts>[0-9]+) +unicast +packets'
-                            ' +(?P<in_multicast_pkts>[0-9]+) +multicast +packets'
-                            ' +(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets$')
-
-        # 0 input packets  0 bytes
-        # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-        p25 = re.compile(r'^(?P<in_pkts>[0-9]+) +input +packets(?: '
-                          '+(?P<in_octets>[0-9]+) +bytes)?(?: +(?P<in_unicast_pkts>[0-9]+) '
-                          '+unicast +packets +(?P<in_multicast_pkts>[0-9]+) +multicast +packets)?$')
-
-        #0 jumbo packets  0 storm suppression packets
-        p26 = re.compile(r'^(?P<in_jumbo_packets>[0-9]+) +jumbo +packets'
-                            ' *(?P<in_storm_suppression_packets>[0-9]+)'
-                            ' *storm *suppression *packets$')
-
-        #0 runts  0 giants  0 CRC/FCS  0 no buffer
-        #0 runts  0 giants  0 CRC  0 no buffer
-        p27 = re.compile(r'^(?P<in_runts>[0-9]+) *runts'
-                            ' *(?P<in_oversize_frame>[0-9]+) *giants'
-                            ' *(?P<in_crc_errors>[0-9]+) *CRC(/FCS)?'
-                            ' *(?P<in_no_buffer>[0-9]+) *no *buffer$')
-
-        #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-        p28 = re.compile(r'^(?P<in_errors>[0-9]+) *input *error'
-                            ' *(?P<in_short_frame>[0-9]+) *short *frame'
-                            ' *(?P<in_overrun>[0-9]+) *overrun *(?P<in_underrun>[0-9]+)'
-                            ' *underrun *(?P<in_ignored>[0-9]+) *ignored$')
-
-        #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-        p29 = re.compile(r'^(?P<in_watchdog>[0-9]+) *watchdog'
-                            ' *(?P<in_bad_etype_drop>[0-9]+)'
-                            ' *bad *etype *drop *(?P<in_unknown_protos>[0-9]+)'
-                            ' *bad *proto'
-                            ' *drop *(?P<in_if_down_drop>[0-9]+) *if *down *drop$')
-
-        # 0 input with dribble  0 input discard
-        p30 = re.compile(r'^(?P<in_with_dribble>[0-9]+) *input *with'
-                            ' *dribble *(?P<in_discard>[0-9]+) *input *discard$')
-
-        # 0 Rx pause
-        p31 = re.compile(r'^(?P<in_mac_pause_frames>[0-9]+) *Rx *pause$')
-
-        # TX
-        p31_1 = re.compile(r'^(?P<tx>(TX))$')
-
-        #0 unicast packets  0 multicast packets  0 broadcast packets
-        p32 = re.compile(r'^(?P<out_unicast_pkts>[0-9]+) *unicast *packets'
-                            ' *(?P<out_multicast_pkts>[0-9]+) *multicast *packets'
-                            ' *(?P<out_broadcast_pkts>[0-9]+) *broadcast *packets$')
-
-        #0 output packets  0 bytes
-        p33 = re.compile(r'^(?P<out_pkts>[0-9]+) *output *packets'
-                            ' *(?P<out_octets>[0-9]+) *bytes$')
-
-        #0 jumbo packets
-        p34 = re.compile(r'^(?P<out_jumbo_packets>[0-9]+) *jumbo *packets$')
-
-        #0 output error  0 collision  0 deferred  0 late collision
-        p35 = re.compile(r'^(?P<out_errors>[0-9]+) *output *error'
-                            ' *(?P<out_collision>[0-9]+) *collision'
-                            ' *(?P<out_deferred>[0-9]+) *deferred'
-                            ' *(?P<out_late_collision>[0-9]+)'
-                            ' *late *collision$')
-
-        #0 lost carrier  0 no carrier  0 babble  0 output discard
-        p36 = re.compile(r'^(?P<out_lost_carrier>[0-9]+) *lost *carrier'
-                            ' *(?P<out_no_carrier>[0-9]+) *no *carrier'
-                            ' *(?P<out_babble>[0-9]+) *babble'
-                            ' *(?P<out_discard>[0-9]+) *output *discard$')
-
-        #0 Tx pause
-        p37 = re.compile(r'^(?P<out_mac_pause_frames>[0-9]+) *Tx *pause$')
-
-        # Members in this channel: Eth1/15, Eth1/16
-        # Members in this channel: Eth1/28
-        p38 = re.compile(r'^Members +in +this +channel *: *'
-                          '(?P<port_channel_member_intfs>[\w\/\.\-\,\s]+)$')
-
-        # 28910552 broadcast packets 63295517997 bytes
-        p39 = re.compile(r'^(?P<in_broadcast_pkts>[0-9]+) +broadcast +packets +(?P<in_octets>[0-9]+) +bytes$')
-
         interface_dict = {}
 
         rx = False
@@ -450,9 +487,10 @@ class ShowInterface(ShowInterfaceSchema):
         for line in out.splitlines():
             line = line.replace('\t', '    ')
             line = line.strip()
+            matches = self.dispatcher.match(line)
 
             # Ethernet2/1.10 is down (Administratively down)
-            m = p1.match(line)
+            m = matches.get('p1')
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
@@ -473,7 +511,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             # Vlan1 is down (Administratively down), line protocol is down, autostate enabled
             # Vlan23 is administratively down (Administratively down), line protocol is down, autostate enabled
-            m = p1_1.match(line)
+            m = matches.get('p1_1')
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
@@ -503,7 +541,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Ethernet2/2 is up
-            m = p1_2.match(line)
+            m = matches.get('p1_2')
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled']
@@ -526,7 +564,7 @@ class ShowInterface(ShowInterfaceSchema):
             # admin state is up,
             # admin state is up, Dedicated Interface
             # admin state is up, Dedicated Interface, [parent interface is Ethernet2/1]
-            m = p2.match(line)
+            m = matches.get('p2')
             if m:
                 # admin_state
                 interface_dict[interface]['admin_state'] = \
@@ -541,13 +579,13 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Dedicated Interface
-            m = p2_1.match(line)
+            m = matches.get('p2_1')
             if m:
                 interface_dict[interface]['dedicated_intface'] = True
                 continue
 
             # Belongs to Po1
-            m = p2_2.match(line)
+            m = matches.get('p2_2')
             if m:
                 port_channel_int = str(m.groupdict()['port_channel_int'])
                 if 'port_channel' not in interface_dict[interface]:
@@ -559,7 +597,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Hardware: Ethernet, address: 5254.00c9.d26e (bia 5254.00c9.d26e)
-            m = p3.match(line)
+            m = matches.get('p3')
             if m:
                 types = m.groupdict()['types']
                 mac_address = m.groupdict()['mac_address']
@@ -573,7 +611,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Description: desc
-            m = p4.match(line)
+            m = matches.get('p4')
             if m:
                 description = m.groupdict()['description']
 
@@ -581,7 +619,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Internet Address is 10.4.4.4/24 secondary tag 10
-            m = p5.match(line)
+            m = matches.get('p5')
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = str(m.groupdict()['prefix_length'])
@@ -610,7 +648,7 @@ class ShowInterface(ShowInterfaceSchema):
             # MTU 1600 bytes, BW 768 Kbit, DLY 3330 usec
             # MTU 1500 bytes, BW 1000000 Kbit, DLY 10 usec,
             # MTU 1500 bytes, BW 1000000 Kbit
-            m = p6.match(line)
+            m = matches.get('p6')
             if m:
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
@@ -622,7 +660,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             
             # MTU 1500 bytes,  BW 40000000 Kbit,, BW 40000000 Kbit, DLY 10 usec
-            m = p6_1.match(line)
+            m = matches.get('p6_1')
             if m:
                 mtu = int(m.groupdict()['mtu'])
                 bandwidth = int(m.groupdict()['bandwidth'])
@@ -633,7 +671,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
+            m = matches.get('p7')
             if m:
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
@@ -647,7 +685,7 @@ class ShowInterface(ShowInterfaceSchema):
             #Encapsulation 802.1Q Virtual LAN, Vlan ID 10, medium is broadcast
             #Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
             #Encapsulation ARPA, medium is broadcast
-            m = p8.match(line)
+            m = matches.get('p8')
             if m:
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
@@ -661,7 +699,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['medium'] = medium
                 continue
 
-            m = p8_1.match(line)
+            m = matches.get('p8_1')
             if m:
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
@@ -679,7 +717,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Encapsulation ARPA, loopback not set
-            m = p8_2.match(line)
+            m = matches.get('p8_2')
             if m:
                 encapsulation = m.groupdict()['encapsulation'].lower()
 
@@ -691,14 +729,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Port mode is routed
-            m = p9.match(line)
+            m = matches.get('p9')
             if m:
                 port_mode = m.groupdict()['port_mode']
                 interface_dict[interface]['port_mode'] = port_mode
                 continue
 
             # auto-duplex, auto-speed
-            m = p10_1.match(line)
+            m = matches.get('p10_1')
             if m:
                 # not caring for this line
                 continue
@@ -707,7 +745,7 @@ class ShowInterface(ShowInterfaceSchema):
             # auto-duplex, auto-speed
             # full-duplex, 1000 Mb/s, media type is 1G
             # auto-duplex, auto-speed, media type is 10G
-            m = p10.match(line)
+            m = matches.get('p10')
             if m:
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed']
@@ -721,28 +759,28 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Beacon is turned off
-            m = p11.match(line)
+            m = matches.get('p11')
             if m:
                 beacon = m.groupdict()['beacon']
                 interface_dict[interface]['beacon'] = beacon
                 continue
 
             #Auto-Negotiation is turned off
-            m = p12.match(line)
+            m = matches.get('p12')
             if m:
                 auto_negotiation = m.groupdict()['auto_negotiate']
                 interface_dict[interface]['auto_negotiate'] = False
                 continue
 
             #Auto-Negotiation is turned on
-            m = p12_1.match(line)
+            m = matches.get('p12_1')
             if m:
                 auto_negotiation = m.groupdict()['auto_negotiate']
                 interface_dict[interface]['auto_negotiate'] = True
                 continue
 
             #Input flow-control is off, output flow-control is off
-            m = p13.match(line)
+            m = matches.get('p13')
             if m:
                 receive = m.groupdict()['receive']
                 send = m.groupdict()['send']
@@ -754,7 +792,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['flow_control']['send'] = False
                 continue
             #Input flow-control is off, output flow-control is on
-            m = p13_1.match(line)
+            m = matches.get('p13_1')
             if m:
                 receive = m.groupdict()['receive']
                 send = m.groupdict()['send']
@@ -767,21 +805,21 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #Auto-mdix is turned off
-            m = p14.match(line)
+            m = matches.get('p14')
             if m:
                 auto_mdix = m.groupdict()['auto_mdix']
                 interface_dict[interface]['auto_mdix'] = auto_mdix
                 continue
 
             #Switchport monitor is off 
-            m = p15.match(line)
+            m = matches.get('p15')
             if m:
                 switchport_monitor = m.groupdict()['switchport_monitor']
                 interface_dict[interface]['switchport_monitor'] = switchport_monitor
                 continue
 
             #EtherType is 0x8100 
-            m = p16.match(line)
+            m = matches.get('p16')
             if m:
                 ethertype = m.groupdict()['ethertype']
                 interface_dict[interface]['ethertype'] = ethertype
@@ -789,7 +827,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             # Members in this channel: Eth1/15, Eth1/16
             # Members in this channel: Eth1/28
-            m = p38.match(line)
+            m = matches.get('p38')
             if m:
                 port_channel_member_intfs = m.groupdict()['port_channel_member_intfs']
                 if port_channel_member_intfs:
@@ -803,14 +841,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
             
             #EEE (efficient-ethernet) : n/a
-            m = p17.match(line)
+            m = matches.get('p17')
             if m:
                 efficient_ethernet = m.groupdict()['efficient_ethernet']
                 interface_dict[interface]['efficient_ethernet'] = efficient_ethernet
                 continue
 
             #Last link flapped 00:07:28
-            m = p18.match(line)
+            m = matches.get('p18')
             if m:
                 last_link_flapped = m.groupdict()['last_link_flapped']
                 interface_dict[interface]['last_link_flapped']\
@@ -818,26 +856,26 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # Last clearing of "show interface" counters never
-            m = p19.match(line)
+            m = matches.get('p19')
             if m:
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Last clearing of "" counters 00:15:42
-            m = p19_1.match(line)
+            m = matches.get('p19_1')
             if m:
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             #1 interface resets
-            m = p20.match(line)
+            m = matches.get('p20')
             if m:
                 interface_reset = int(m.groupdict()['interface_reset'])
                 interface_dict[interface]['interface_reset'] = interface_reset
                 continue
 
             # 1 minute input rate 0 bits/sec, 0 packets/sec  
-            m = p21.match(line)
+            m = matches.get('p21')
             if m:
 
                 load_interval = int(m.groupdict()['load_interval'])
@@ -858,7 +896,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #1 minute output rate 24 bits/sec, 0 packets/sec
-            m = p22.match(line)
+            m = matches.get('p22')
             if m:
                 load_interval = int(m.groupdict()['load_interval'])
                 out_rate = int(m.groupdict()['out_rate'])
@@ -873,7 +911,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #input rate 0 bps, 0 pps; output rate 0 bps, 0 pps
-            m = p23.match(line)
+            m = matches.get('p23')
             if m:
                 in_rate_bps = int(m.groupdict()['in_rate_bps'])
                 in_rate_pps = int(m.groupdict()['in_rate_pps'])
@@ -895,7 +933,7 @@ class ShowInterface(ShowInterfaceSchema):
                 ['out_rate_pps'] = out_rate_pps
                 continue
             # RX
-            m = p23_1.match(line)
+            m = matches.get('p23_1')
             if m:
                 rx = m.groupdict()['rx']
                 if 'counters' not in interface_dict[interface]:
@@ -906,7 +944,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             if rx:
                 #0 unicast packets  0 multicast packets  0 broadcast packets
-                m = p24.match(line)
+                m = matches.get('p24')
                 if m:
                     in_unicast_pkts = int(m.groupdict()['in_unicast_pkts'])
                     in_multicast_pkts = int(m.groupdict()['in_multicast_pkts'])
@@ -921,10 +959,9 @@ class ShowInterface(ShowInterfaceSchema):
                         pass
                     continue
                     
-
             # 0 input packets  0 bytes
             # 607382344 input packets 445986207 unicast packets 132485585 multicast packets
-            m = p25.match(line)
+            m = matches.get('p25')
             if m:
                 group = m.groupdict()
                 if 'counters' not in interface_dict[interface]:
@@ -939,7 +976,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 28910552 broadcast packets 63295517997 bytes
-            m = p39.match(line)
+            m = matches.get('p39')
             if m:
                 in_octets = int(m.groupdict()['in_octets'])
                 interface_dict[interface]['counters']['in_octets'] = in_octets
@@ -948,7 +985,7 @@ class ShowInterface(ShowInterfaceSchema):
                 interface_dict[interface]['counters']['in_broadcast_pkts'] = in_broadcast_pkts
 
             #0 jumbo packets  0 storm suppression packets
-            m = p26.match(line)
+            m = matches.get('p26')
             if m:
                 in_jumbo_packets = int(m.groupdict()['in_jumbo_packets'])
                 in_storm_suppression_packets = int(m.groupdict()['in_storm_suppression_packets'])
@@ -960,7 +997,7 @@ class ShowInterface(ShowInterfaceSchema):
 
             #0 runts  0 giants  0 CRC/FCS  0 no buffer
             #0 runts  0 giants  0 CRC  0 no buffer
-            m = p27.match(line)
+            m = matches.get('p27')
             if m:
 
                 interface_dict[interface]['counters']['in_runts'] = int(m.groupdict()['in_runts'])
@@ -970,7 +1007,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 input error  0 short frame  0 overrun   0 underrun  0 ignored
-            m = p28.match(line)
+            m = matches.get('p28')
             if m:
 
                 interface_dict[interface]['counters']['in_errors'] = int(m.groupdict()['in_errors'])
@@ -981,7 +1018,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
-            m = p29.match(line)
+            m = matches.get('p29')
             if m:
 
                 interface_dict[interface]['counters']['in_watchdog'] = int(m.groupdict()['in_watchdog'])
@@ -991,7 +1028,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 0 input with dribble  0 input discard
-            m = p30.match(line)
+            m = matches.get('p30')
             if m:
                 in_with_dribble = int(m.groupdict()['in_with_dribble'])
                 in_discard = int(m.groupdict()['in_discard'])
@@ -1001,14 +1038,14 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             # 0 Rx pause
-            m = p31.match(line)
+            m = matches.get('p31')
             if m:
                 in_mac_pause_frames = int(m.groupdict()['in_mac_pause_frames'])
 
                 interface_dict[interface]['counters']['in_mac_pause_frames'] = in_mac_pause_frames
                 continue
             # TX
-            m = p31_1.match(line)
+            m = matches.get('p31_1')
             if m:
                 rx = False
                 tx = m.groupdict()['tx']
@@ -1019,7 +1056,7 @@ class ShowInterface(ShowInterfaceSchema):
                 
             if tx:
                 #0 unicast packets  0 multicast packets  0 broadcast packets
-                m = p32.match(line)
+                m = matches.get('p32')
                 if m:
                     interface_dict[interface]['counters']['out_unicast_pkts'] = int(m.groupdict()['out_unicast_pkts'])
                     interface_dict[interface]['counters']['out_multicast_pkts'] = int(m.groupdict()['out_multicast_pkts'])
@@ -1027,7 +1064,7 @@ class ShowInterface(ShowInterfaceSchema):
                     continue
 
             #0 output packets  0 bytes
-            m = p33.match(line)
+            m = matches.get('p33')
             if m:
                 out_pkts = int(m.groupdict()['out_pkts'])
                 out_octets = int(m.groupdict()['out_octets'])
@@ -1037,7 +1074,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 jumbo packets
-            m = p34.match(line)
+            m = matches.get('p34')
             if m:
                 out_jumbo_packets = int(m.groupdict()['out_jumbo_packets'])
 
@@ -1045,7 +1082,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 output error  0 collision  0 deferred  0 late collision
-            m = p35.match(line)
+            m = matches.get('p35')
             if m:
                 interface_dict[interface]['counters']['out_errors'] = int(m.groupdict()['out_errors'])
                 interface_dict[interface]['counters']['out_collision'] = int(m.groupdict()['out_collision'])
@@ -1054,7 +1091,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 lost carrier  0 no carrier  0 babble  0 output discard
-            m = p36.match(line)
+            m = matches.get('p36')
             if m:
 
                 interface_dict[interface]['counters']['out_lost_carrier'] = int(m.groupdict()['out_lost_carrier'])
@@ -1064,7 +1101,7 @@ class ShowInterface(ShowInterfaceSchema):
                 continue
 
             #0 Tx pause
-            m = p37.match(line)
+            m = matches.get('p37')
             if m:
                 out_mac_pause_frames = int(m.groupdict()['out_mac_pause_frames'])
 
@@ -1073,6 +1110,159 @@ class ShowInterface(ShowInterfaceSchema):
 
         return interface_dict
 
+    # show interface | json: the leaves of ROW_interface by key, the keys
+    # of the dicts under the interface as tuples
+    json_fields = {'ROW_interface': {
+        'interface': 'interface',
+        'state': 'oper_status',
+        'state_rsn_desc': 'link_state',
+        'admin_state': 'admin_state',
+        'share_state': 'share_state',
+        'svi_line_proto': 'line_protocol',
+        'svi_admin_state': 'admin_state',
+        'eth_hw_desc': 'types',
+        'svi_hw_desc': 'types',
+        'eth_hw_addr': 'mac_address',
+        'svi_mac': 'mac_address',
+        'eth_bia_addr': 'phys_address',
+        'desc': 'description',
+        'eth_ip_addr': 'ip',
+        'svi_ip_addr': 'ip',
+        'eth_ip_mask': 'prefix_length',
+        'svi_ip_mask': 'prefix_length',
+        'eth_mtu': ('mtu', int),
+        'svi_mtu': ('mtu', int),
+        'eth_bw': ('bandwidth', int),
+        'svi_bw': ('bandwidth', int),
+        'eth_dly': ('delay', int),
+        'svi_delay': ('delay', int),
+        'eth_reliability': ('reliability', json_load),
+        'eth_txload': ('txload', json_load),
+        'eth_rxload': ('rxload', json_load),
+        'eth_encap': (('encapsulations', 'encapsulation'), json_encap),
+        'eth_vlanid': (('encapsulations', 'first_dot1q'), str),
+        'medium': 'medium',
+        'eth_mode': 'port_mode',
+        'eth_duplex': 'duplex_mode',
+        'eth_speed': ('port_speed', lambda value: value.split()[0]),
+        'eth_media': 'media_type',
+        'eth_beacon': 'beacon',
+        'eth_autoneg': ('auto_negotiate', json_on),
+        'eth_in_flowctrl': (('flow_control', 'receive'), json_on),
+        'eth_out_flowctrl': (('flow_control', 'send'), json_on),
+        'eth_mdix': 'auto_mdix',
+        'eth_swt_monitor': 'switchport_monitor',
+        'eth_ethertype': 'ethertype',
+        'eth_eee_state': 'efficient_ethernet',
+        'eth_link_flapped': 'last_link_flapped',
+        'eth_reset_cntr': ('interface_reset', int),
+        'eth_bundle': 'bundle',
+        'eth_members': 'members',
+        'eth_clear_counters': (('counters', 'last_clear'), str),
+        'eth_load_interval1_rx': (('counters', 'rate', 'load_interval'), int),
+        'eth_inrate1_bits': (('counters', 'rate', 'in_rate'), int),
+        'eth_inrate1_pkts': (('counters', 'rate', 'in_rate_pkts'), int),
+        'eth_outrate1_bits': (('counters', 'rate', 'out_rate'), int),
+        'eth_outrate1_pkts': (('counters', 'rate', 'out_rate_pkts'), int),
+        'eth_inucast': (('counters', 'in_unicast_pkts'), int),
+        'eth_inmcast': (('counters', 'in_multicast_pkts'), int),
+        'eth_inbcast': (('counters', 'in_broadcast_pkts'), int),
+        'eth_inpkts': (('counters', 'in_pkts'), int),
+        'eth_inbytes': (('counters', 'in_octets'), int),
+        'eth_jumbo_inpkts': (('counters', 'in_jumbo_packets'), int),
+        'eth_storm_supp': (('counters', 'in_storm_suppression_packets'),
+                           int),
+        'eth_runts': (('counters', 'in_runts'), int),
+        'eth_giants': (('counters', 'in_oversize_frame'), int),
+        'eth_crc': (('counters', 'in_crc_errors'), int),
+        'eth_nobuf': (('counters', 'in_no_buffer'), int),
+        'eth_inerr': (('counters', 'in_errors'), int),
+        'eth_frame': (('counters', 'in_short_frame'), int),
+        'eth_overrun': (('counters', 'in_overrun'), int),
+        'eth_underrun': (('counters', 'in_underrun'), int),
+        'eth_ignored': (('counters', 'in_ignored'), int),
+        'eth_watchdog': (('counters', 'in_watchdog'), int),
+        'eth_bad_eth': (('counters', 'in_bad_etype_drop'), int),
+        'eth_bad_proto': (('counters', 'in_unknown_protos'), int),
+        'eth_in_ifdown_drops': (('counters', 'in_if_down_drop'), int),
+        'eth_dribble': (('counters', 'in_with_dribble'), int),
+        'eth_indiscard': (('counters', 'in_discard'), int),
+        'eth_inpause': (('counters', 'in_mac_pause_frames'), int),
+        'eth_outucast': (('counters', 'out_unicast_pkts'), int),
+        'eth_outmcast': (('counters', 'out_multicast_pkts'), int),
+        'eth_outbcast': (('counters', 'out_broadcast_pkts'), int),
+        'eth_outpkts': (('counters', 'out_pkts'), int),
+        'eth_outbytes': (('counters', 'out_octets'), int),
+        'eth_jumbo_outpkts': (('counters', 'out_jumbo_packets'), int),
+        'eth_outerr': (('counters', 'out_errors'), int),
+        'eth_coll': (('counters', 'out_collision'), int),
+        'eth_deferred': (('counters', 'out_deferred'), int),
+        'eth_latecoll': (('counters', 'out_late_collision'), int),
+        'eth_lostcarrier': (('counters', 'out_lost_carrier'), int),
+        'eth_nocarrier': (('counters', 'out_no_carrier'), int),
+        'eth_babbles': (('counters', 'out_babble'), int),
+        'eth_outdiscard': (('counters', 'out_discard'), int),
+        'eth_outpause': (('counters', 'out_mac_pause_frames'), int),
+        }}
+
+    def json(self, interface="", output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            output = self.device.execute(cmd + ' | json')
+
+        interface_dict = {}
+        for row in iter_json_rows(self.json_fields, loads(output)):
+            intf_dict = nested(row.values)
+            interface = intf_dict.pop('interface', None)
+            if not interface:
+                continue
+            interface_dict[interface] = intf_dict
+
+            oper_status = intf_dict.get('oper_status', 'down').lower()
+            intf_dict['oper_status'] = oper_status
+            intf_dict['enabled'] = 'down' not in oper_status
+            if intf_dict.get('link_state', 'none') == 'none':
+                intf_dict.pop('link_state', None)
+            if intf_dict.pop('share_state', None) == 'Dedicated':
+                intf_dict['dedicated_intface'] = True
+            if 'line_protocol' in intf_dict:
+                intf_dict['line_protocol'] = intf_dict['line_protocol'].lower()
+
+            # Internet Address is 10.4.4.4/24
+            ip = intf_dict.pop('ip', None)
+            prefix_length = intf_dict.pop('prefix_length', None)
+            if ip and prefix_length:
+                intf_dict['ipv4'] = {
+                    '{}/{}'.format(ip, prefix_length): {
+                        'ip': ip, 'prefix_length': prefix_length}}
+
+            # Belongs to Po1, Members in this channel: Eth1/15, Eth1/16
+            port_channel = intf_dict['port_channel'] = \
+                {'port_channel_member': False}
+            bundle = intf_dict.pop('bundle', None)
+            if bundle:
+                port_channel['port_channel_member'] = True
+                port_channel['port_channel_int'] = Common.convert_intf_name(
+                    bundle if not bundle.isdigit() else 'Po' + bundle)
+            members = intf_dict.pop('members', None)
+            if members:
+                port_channel['port_channel_member'] = True
+                port_channel['port_channel_member_intfs'] = \
+                    Common.convert_intf_names(
+                        member.strip() for member in members.split(','))
+
+            counters = intf_dict.get('counters')
+            if counters:
+                if any(key.startswith('in_') for key in counters):
+                    counters['rx'] = True
+                if any(key.startswith('out_') for key in counters):
+                    counters['tx'] = True
+
+        return interface_dict
+
 
 # ===================================
 # Schema for 'show interface vrf all'
@@ -1202,6 +1392,179 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
             'iod',
             '(tunnel.*)',
             'multicast_groups_address']
+
+    # IP Interface Status for VRF "VRF1"
+    p1 = LazyRegex(r'^\s*IP *Interface *Status *for *VRF'
+                    ' *(?P<vrf>\S+)$')
+
+    #Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36,
+    p2 = LazyRegex(r'^\s*(?P<interface>[a-zA-Z0-9\/\-\.]+), *Interface'
+                    ' *status: *(?P<interface_status>[a-z\-\/\s]+),'
+                    ' *iod: *(?P<iod>[0-9]+),$')
+
+    # Unnumbered interfaces of loopback0: first iod 46
+    p2_1 = LazyRegex(r'^\s*Unnumbered +interfaces +of +(?P<unnumbered_intf>[\w\.\/]+): *'
+                      'first +iod +(?P<first_iod>\d+)$')
+
+    # Ethernet2/11:
+    # mti18: tunnel-te11: tunnel-te12:
+    p2_2 = LazyRegex(r'(([E|e]thernet|[L|l]oopback|[T|t]unnel|[V|v]lan|mti|[t|T]unnel-te|[p|P]ort-channel)[\d\/\.]+):')
+
+    # IP address: 10.4.4.4, IP subnet: 10.4.4.0/24 secondary
+    # IP address: 10.64.4.4, IP subnet: 10.64.4.0/24
+    p3 = LazyRegex(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP'
+                    ' *subnet: *(?P<ip_subnet>[a-z0-9\.]+)\/'
+                    '(?P<prefix_length>[0-9]+)'
+                    ' *(?P<secondary>(secondary))?$')
+
+    # IP address: 192.168.106.1, IP subnet: 192.168.106.0/24 route-preference: 0, tag: 0
+    p3_1 = LazyRegex(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP'
+                      ' *subnet: *(?P<ip_subnet>[a-z0-9\.]+)\/'
+                      '(?P<prefix_length>[0-9\,]+)(?: *route-preference:'
+                      ' *(?P<route_preference>[0-9]+),)?(?: *tag:'
+                      ' *(?P<route_tag>[0-9]+))?$')
+
+    #IP broadcast address: 255.255.255.255
+    p4 = LazyRegex(r'^\s*IP *broadcast *address:'
+                    ' *(?P<broadcast_address>[0-9\.]+)$')
+
+    #IP multicast groups locally joined: none
+    #224.0.0.6  224.0.0.5  224.0.0.2 
+    p5 = LazyRegex(r'^\s*IP *multicast *groups *locally *joined:'
+                    ' *(?P<multicast_groups_address>[a-z]+)$')
+
+    #224.0.0.6  224.0.0.5  224.0.0.2 
+    p5_1 = LazyRegex(r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
+
+    #IP MTU: 1600 bytes (using link MTU)
+    p6 = LazyRegex(r'^\s*IP *MTU: *(?P<ip_mtu>[0-9]+)'
+                    ' *bytes *\(using *link *MTU\)$')
+
+    #IP primary address route-preference: 0, tag: 0
+    p7 = LazyRegex(r'^\s*IP *primary *address *route-preference:'
+                    ' *(?P<route_preference>[0-9]+), *tag:'
+                    ' *(?P<route_tag>[0-9]+)$')
+
+    #IP proxy ARP : disabled
+    p8 = LazyRegex(r'^\s*IP *proxy *ARP *: *(?P<proxy_arp>[a-z]+)$')
+
+    #IP Local Proxy ARP : disabled
+    p9 = LazyRegex(r'^\s*IP *Local *Proxy *ARP *:'
+                    ' *(?P<local_proxy_arp>[a-z]+)$')
+
+    #IP multicast routing: disabled
+    p10 = LazyRegex(r'^\s*IP *multicast *routing:'
+                     ' *(?P<multicast_routing>[a-z]+)$')
+
+    #IP icmp redirects: disabled
+    p11 = LazyRegex(r'^\s*IP *icmp *redirects:'
+                     ' *(?P<icmp_redirects>[a-z]+)$')
+
+    #IP directed-broadcast: disabled
+    p12 = LazyRegex(r'^\s*IP directed-broadcast:'
+                     ' *(?P<directed_broadcast>[a-z]+)$')
+
+    #IP Forwarding: disabled
+    p13 = LazyRegex(r'^\s*IP *Forwarding: *(?P<ip_forwarding>[a-z]+)$') 
+
+    #IP icmp unreachables (except port): disabled
+    p14 = LazyRegex(r'^\s*IP *icmp *unreachables *\(except *port\):'
+                     ' *(?P<icmp_unreachable>[a-z]+)$')
+
+    #IP icmp port-unreachable: enabled
+    p15 = LazyRegex(r'^\s*IP *icmp *port-unreachable:'
+                     ' *(?P<icmp_port_unreachable>[a-z]+)$')
+
+    #IP unicast reverse path forwarding: none
+    p16 = LazyRegex(r'^\s*IP *unicast *reverse *path *forwarding:'
+                     ' *(?P<unicast_reverse_path>\w+)$')
+
+    #IP load sharing: none 
+    p17 = LazyRegex(r'^\s*IP *load *sharing: *(?P<load_sharing>\w+)$')
+
+    #IP interface statistics last reset: never
+    p18 = LazyRegex(r'^\s*IP *interface *statistics *last *reset:'
+                     ' *(?P<int_stat_last_reset>[a-zA-Z0-9\:]+)')
+
+    #Unicast packets    : 0/0/0/0/0
+    p20 = LazyRegex(r'^\s*Unicast *packets *:'
+                     ' *(?P<unicast_packets_sent>[0-9]+)\/'
+                     '(?P<unicast_packets_received>[0-9]+)\/'
+                     '(?P<unicast_packets_forwarded>[0-9]+)\/'
+                     '(?P<unicast_packets_originated>[0-9]+)\/'
+                     '(?P<unicast_packets_consumed>[0-9]+)$')
+
+    #Unicast bytes      : 0/0/0/0/0
+    p21 = LazyRegex(r'^\s*Unicast *bytes *:'
+                     ' *(?P<unicast_bytes_sent>[0-9]+)\/'
+                     '(?P<unicast_bytes_received>[0-9]+)\/'
+                     '(?P<unicast_bytes_forwarded>[0-9]+)\/'
+                     '(?P<unicast_bytes_originated>[0-9]+)\/'
+                     '(?P<unicast_bytes_consumed>[0-9]+)$')
+
+    #Multicast packets  : 0/0/0/0/0
+    p22 = LazyRegex(r'^\s*Multicast *packets *:'
+                     ' *(?P<multicast_packets_sent>[0-9]+)\/'
+                     '(?P<multicast_packets_received>[0-9]+)\/'
+                     '(?P<multicast_packets_forwarded>[0-9]+)\/'
+                     '(?P<multicast_packets_originated>[0-9]+)\/'
+                     '(?P<multicast_packets_consumed>[0-9]+)$')
+
+    #Multicast bytes    : 0/0/0/0/0
+    p23 = LazyRegex(r'^\s*Multicast *bytes *:'
+                     ' *(?P<multicast_bytes_sent>[0-9]+)\/'
+                     '(?P<multicast_bytes_received>[0-9]+)\/'
+                     '(?P<multicast_bytes_forwarded>[0-9]+)\/'
+                     '(?P<multicast_bytes_originated>[0-9]+)\/'
+                     '(?P<multicast_bytes_consumed>[0-9]+)$')
+
+    #Broadcast packets  : 0/0/0/0/0
+    p24 = LazyRegex(r'^\s*Broadcast *packets *:'
+                     ' *(?P<broadcast_packets_sent>[0-9]+)\/'
+                     '(?P<broadcast_packets_received>[0-9]+)\/'
+                     '(?P<broadcast_packets_forwarded>[0-9]+)\/'
+                     '(?P<broadcast_packets_originated>[0-9]+)\/'
+                     '(?P<broadcast_packets_consumed>[0-9]+)$')
+
+    #Broadcast bytes    : 0/0/0/0/0
+    p25 = LazyRegex(r'^\s*Broadcast *bytes *:'
+                     ' *(?P<broadcast_bytes_sent>[0-9]+)\/'
+                     '(?P<broadcast_bytes_received>[0-9]+)\/'
+                     '(?P<broadcast_bytes_forwarded>[0-9]+)\/'
+                     '(?P<broadcast_bytes_originated>[0-9]+)\/'
+                     '(?P<broadcast_bytes_consumed>[0-9]+)$')
+
+    #Labeled packets    : 0/0/0/0/0
+    p26 = LazyRegex(r'^\s*Labeled *packets *:'
+                     ' *(?P<labeled_packets_sent>[0-9]+)\/'
+                     '(?P<labeled_packets_received>[0-9]+)\/'
+                     '(?P<labeled_packets_forwarded>[0-9]+)\/'
+                     '(?P<labeled_packets_originated>[0-9]+)\/'
+                     '(?P<labeled_packets_consumed>[0-9]+)$')
+
+    #Labeled bytes      : 0/0/0/0/0
+    p27 = LazyRegex(r'^\s*Labeled *bytes *:'
+                     ' *(?P<labeled_bytes_sent>[0-9]+)\/'
+                     '(?P<labeled_bytes_received>[0-9]+)\/'
+                     '(?P<labeled_bytes_forwarded>[0-9]+)\/'
+                     '(?P<labeled_bytes_originated>[0-9]+)\/'
+                     '(?P<labeled_bytes_consumed>[0-9]+)$')
+
+    #WCCP Redirect outbound: disabled
+    p28 = LazyRegex(r'^\s*WCCP *Redirect *outbound:'
+                     ' *(?P<wccp_redirect_outbound>[a-z]+)$')
+
+    #WCCP Redirect inbound: disabled
+    p29 = LazyRegex(r'^\s*WCCP *Redirect *inbound:'
+                     ' *(?P<wccp_redirect_inbound>[a-z]+)$')
+
+    #WCCP Redirect exclude: disabled
+    p30 = LazyRegex(r'^\s*WCCP *Redirect *exclude:'
+                     ' *(?P<wccp_redirect_exclude>[a-z]+)$')
+
+    # IP unnumbered interface (loopback0)
+    p31 = LazyRegex(r'^\s*IP +unnumbered +interface +\((?P<unnum_intf>[\w\/\.]+)\)$')
+
     def cli(self, interface='', vrf='', output=None):
         if interface and vrf:
             cmd = self.cli_command[0].format(interface=interface, vrf=vrf)
@@ -1223,19 +1586,14 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
             line = line.rstrip()
 
             # IP Interface Status for VRF "VRF1"
-            p1 = re.compile(r'^\s*IP *Interface *Status *for *VRF'
-                             ' *(?P<vrf>\S+)$')
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 vrf = vrf.replace('"',"")
                 continue
 
             #Ethernet2/1, Interface status: protocol-up/link-up/admin-up, iod: 36,
-            p2 = re.compile(r'^\s*(?P<interface>[a-zA-Z0-9\/\-\.]+), *Interface'
-                             ' *status: *(?P<interface_status>[a-z\-\/\s]+),'
-                             ' *iod: *(?P<iod>[0-9]+),$')
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 interface_status = m.groupdict()['interface_status']
@@ -1262,19 +1620,15 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                             address = key
                 continue
                 
-
             # Unnumbered interfaces of loopback0: first iod 46
-            p2_1 = re.compile(r'^\s*Unnumbered +interfaces +of +(?P<unnumbered_intf>[\w\.\/]+): *'
-                               'first +iod +(?P<first_iod>\d+)$')
-            m = p2_1.match(line)
+            m = self.p2_1.match(line)
             if m:
                 unnumbered_intf = m.groupdict()['unnumbered_intf']
                 continue
 
             # Ethernet2/11:
             # mti18: tunnel-te11: tunnel-te12:
-            p2_2 = re.compile(r'(([E|e]thernet|[L|l]oopback|[T|t]unnel|[V|v]lan|mti|[t|T]unnel-te|[p|P]ort-channel)[\d\/\.]+):')
-            m = p2_2.findall(line)
+            m = self.p2_2.findall(line)
             if m and unnumbered_intf:
                 temp_intf = []
                 temp_intf = [i[0] for i in m]
@@ -1285,11 +1639,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
             # IP address: 10.4.4.4, IP subnet: 10.4.4.0/24 secondary
             # IP address: 10.64.4.4, IP subnet: 10.64.4.0/24
-            p3 = re.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP'
-                             ' *subnet: *(?P<ip_subnet>[a-z0-9\.]+)\/'
-                             '(?P<prefix_length>[0-9]+)'
-                             ' *(?P<secondary>(secondary))?$')
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 ip_subnet = m.groupdict()['ip_subnet']
@@ -1327,12 +1677,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP address: 192.168.106.1, IP subnet: 192.168.106.0/24 route-preference: 0, tag: 0
-            p3_1 = re.compile(r'^\s*IP *address: *(?P<ip>[0-9\.]+), *IP'
-                               ' *subnet: *(?P<ip_subnet>[a-z0-9\.]+)\/'
-                               '(?P<prefix_length>[0-9\,]+)(?: *route-preference:'
-                               ' *(?P<route_preference>[0-9]+),)?(?: *tag:'
-                               ' *(?P<route_tag>[0-9]+))?$')
-            m = p3_1.match(line)
+            m = self.p3_1.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 ip_subnet = m.groupdict()['ip_subnet']
@@ -1372,9 +1717,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP broadcast address: 255.255.255.255
-            p4 = re.compile(r'^\s*IP *broadcast *address:'
-                             ' *(?P<broadcast_address>[0-9\.]+)$')
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 broadcast_address = str(m.groupdict()['broadcast_address'])
                 if 'ipv4' in ip_interface_vrf_all_dict[interface]:
@@ -1383,9 +1726,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
             
             #IP multicast groups locally joined: none
             #224.0.0.6  224.0.0.5  224.0.0.2 
-            p5 = re.compile(r'^\s*IP *multicast *groups *locally *joined:'
-                             ' *(?P<multicast_groups_address>[a-z]+)$')
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 multicast_groups_address = m.groupdict()['multicast_groups_address']
 
@@ -1394,8 +1735,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #224.0.0.6  224.0.0.5  224.0.0.2 
-            p5_1 = re.compile(r'^\s*(?P<multicast_groups_address>[a-z0-9\.\s]+)$')
-            m = p5_1.match(line)
+            m = self.p5_1.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups_address'])
 
@@ -1411,9 +1751,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP MTU: 1600 bytes (using link MTU)
-            p6 = re.compile(r'^\s*IP *MTU: *(?P<ip_mtu>[0-9]+)'
-                             ' *bytes *\(using *link *MTU\)$')
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 ip_mtu = int(m.groupdict()['ip_mtu'])
 
@@ -1421,10 +1759,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP primary address route-preference: 0, tag: 0
-            p7 = re.compile(r'^\s*IP *primary *address *route-preference:'
-                             ' *(?P<route_preference>[0-9]+), *tag:'
-                             ' *(?P<route_tag>[0-9]+)$')
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 route_preference = m.groupdict()['route_preference']
                 route_tag = m.groupdict()['route_tag']
@@ -1439,8 +1774,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP proxy ARP : disabled
-            p8 = re.compile(r'^\s*IP *proxy *ARP *: *(?P<proxy_arp>[a-z]+)$')
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 proxy_arp = m.groupdict()['proxy_arp']
 
@@ -1448,9 +1782,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP Local Proxy ARP : disabled
-            p9 = re.compile(r'^\s*IP *Local *Proxy *ARP *:'
-                             ' *(?P<local_proxy_arp>[a-z]+)$')
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 local_proxy_arp = m.groupdict()['local_proxy_arp']
 
@@ -1459,9 +1791,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP multicast routing: disabled
-            p10 = re.compile(r'^\s*IP *multicast *routing:'
-                              ' *(?P<multicast_routing>[a-z]+)$')
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 multicast_routing = m.groupdict()['multicast_routing']
 
@@ -1470,9 +1800,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP icmp redirects: disabled
-            p11 = re.compile(r'^\s*IP *icmp *redirects:'
-                              ' *(?P<icmp_redirects>[a-z]+)$')
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 icmp_redirects = m.groupdict()['icmp_redirects']
 
@@ -1481,9 +1809,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP directed-broadcast: disabled
-            p12 = re.compile(r'^\s*IP directed-broadcast:'
-                              ' *(?P<directed_broadcast>[a-z]+)$')
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 directed_broadcast = m.groupdict()['directed_broadcast']
 
@@ -1492,8 +1818,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP Forwarding: disabled
-            p13 = re.compile(r'^\s*IP *Forwarding: *(?P<ip_forwarding>[a-z]+)$') 
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 ip_forwarding = m.groupdict()['ip_forwarding']
 
@@ -1502,9 +1827,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP icmp unreachables (except port): disabled
-            p14 = re.compile(r'^\s*IP *icmp *unreachables *\(except *port\):'
-                              ' *(?P<icmp_unreachable>[a-z]+)$')
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 icmp_unreachable = m.groupdict()['icmp_unreachable']
 
@@ -1513,9 +1836,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP icmp port-unreachable: enabled
-            p15 = re.compile(r'^\s*IP *icmp *port-unreachable:'
-                              ' *(?P<icmp_port_unreachable>[a-z]+)$')
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 icmp_port_unreachable = m.groupdict()['icmp_port_unreachable']
 
@@ -1524,9 +1845,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP unicast reverse path forwarding: none
-            p16 = re.compile(r'^\s*IP *unicast *reverse *path *forwarding:'
-                              ' *(?P<unicast_reverse_path>\w+)$')
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 unicast_reverse_path = m.groupdict()['unicast_reverse_path']
 
@@ -1535,8 +1854,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP load sharing: none 
-            p17 = re.compile(r'^\s*IP *load *sharing: *(?P<load_sharing>\w+)$')
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 load_sharing = m.groupdict()['load_sharing']
 
@@ -1545,9 +1863,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #IP interface statistics last reset: never
-            p18 = re.compile(r'^\s*IP *interface *statistics *last *reset:'
-                              ' *(?P<int_stat_last_reset>[a-zA-Z0-9\:]+)')
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 int_stat_last_reset = m.groupdict()['int_stat_last_reset']
 
@@ -1571,13 +1887,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
 
             if 'ipv4' in ip_interface_vrf_all_dict[interface]:
                 #Unicast packets    : 0/0/0/0/0
-                p20 = re.compile(r'^\s*Unicast *packets *:'
-                                  ' *(?P<unicast_packets_sent>[0-9]+)\/'
-                                  '(?P<unicast_packets_received>[0-9]+)\/'
-                                  '(?P<unicast_packets_forwarded>[0-9]+)\/'
-                                  '(?P<unicast_packets_originated>[0-9]+)\/'
-                                  '(?P<unicast_packets_consumed>[0-9]+)$')
-                m = p20.match(line)
+                m = self.p20.match(line)
                 if m:
                     if 'counters' not in ip_interface_vrf_all_dict[interface]['ipv4'][address]:
                         ip_interface_vrf_all_dict[interface]['ipv4']['counters'] = {}
@@ -1595,13 +1905,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Unicast bytes      : 0/0/0/0/0
-                p21 = re.compile(r'^\s*Unicast *bytes *:'
-                                  ' *(?P<unicast_bytes_sent>[0-9]+)\/'
-                                  '(?P<unicast_bytes_received>[0-9]+)\/'
-                                  '(?P<unicast_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<unicast_bytes_originated>[0-9]+)\/'
-                                  '(?P<unicast_bytes_consumed>[0-9]+)$')
-                m = p21.match(line)
+                m = self.p21.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['unicast_bytes_sent']= int(m.groupdict()['unicast_bytes_sent'])
@@ -1616,13 +1920,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Multicast packets  : 0/0/0/0/0
-                p22 = re.compile(r'^\s*Multicast *packets *:'
-                                  ' *(?P<multicast_packets_sent>[0-9]+)\/'
-                                  '(?P<multicast_packets_received>[0-9]+)\/'
-                                  '(?P<multicast_packets_forwarded>[0-9]+)\/'
-                                  '(?P<multicast_packets_originated>[0-9]+)\/'
-                                  '(?P<multicast_packets_consumed>[0-9]+)$')
-                m = p22.match(line)
+                m = self.p22.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['multicast_packets_sent']= int(m.groupdict()['multicast_packets_sent'])
@@ -1637,13 +1935,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Multicast bytes    : 0/0/0/0/0
-                p23 = re.compile(r'^\s*Multicast *bytes *:'
-                                  ' *(?P<multicast_bytes_sent>[0-9]+)\/'
-                                  '(?P<multicast_bytes_received>[0-9]+)\/'
-                                  '(?P<multicast_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<multicast_bytes_originated>[0-9]+)\/'
-                                  '(?P<multicast_bytes_consumed>[0-9]+)$')
-                m = p23.match(line)
+                m = self.p23.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['multicast_bytes_sent']= int(m.groupdict()['multicast_bytes_sent'])
@@ -1658,13 +1950,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Broadcast packets  : 0/0/0/0/0
-                p24 = re.compile(r'^\s*Broadcast *packets *:'
-                                  ' *(?P<broadcast_packets_sent>[0-9]+)\/'
-                                  '(?P<broadcast_packets_received>[0-9]+)\/'
-                                  '(?P<broadcast_packets_forwarded>[0-9]+)\/'
-                                  '(?P<broadcast_packets_originated>[0-9]+)\/'
-                                  '(?P<broadcast_packets_consumed>[0-9]+)$')
-                m = p24.match(line)
+                m = self.p24.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['broadcast_packets_sent']= int(m.groupdict()['broadcast_packets_sent'])
@@ -1679,13 +1965,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Broadcast bytes    : 0/0/0/0/0
-                p25 = re.compile(r'^\s*Broadcast *bytes *:'
-                                  ' *(?P<broadcast_bytes_sent>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_received>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_originated>[0-9]+)\/'
-                                  '(?P<broadcast_bytes_consumed>[0-9]+)$')
-                m = p25.match(line)
+                m = self.p25.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['broadcast_bytes_sent']= int(m.groupdict()['broadcast_bytes_sent'])
@@ -1700,13 +1980,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Labeled packets    : 0/0/0/0/0
-                p26 = re.compile(r'^\s*Labeled *packets *:'
-                                  ' *(?P<labeled_packets_sent>[0-9]+)\/'
-                                  '(?P<labeled_packets_received>[0-9]+)\/'
-                                  '(?P<labeled_packets_forwarded>[0-9]+)\/'
-                                  '(?P<labeled_packets_originated>[0-9]+)\/'
-                                  '(?P<labeled_packets_consumed>[0-9]+)$')
-                m = p26.match(line)
+                m = self.p26.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['labeled_packets_sent']= int(m.groupdict()['labeled_packets_sent'])
@@ -1721,13 +1995,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
                 #Labeled bytes      : 0/0/0/0/0
-                p27 = re.compile(r'^\s*Labeled *bytes *:'
-                                  ' *(?P<labeled_bytes_sent>[0-9]+)\/'
-                                  '(?P<labeled_bytes_received>[0-9]+)\/'
-                                  '(?P<labeled_bytes_forwarded>[0-9]+)\/'
-                                  '(?P<labeled_bytes_originated>[0-9]+)\/'
-                                  '(?P<labeled_bytes_consumed>[0-9]+)$')
-                m = p27.match(line)
+                m = self.p27.match(line)
                 if m:
                     ip_interface_vrf_all_dict[interface]['ipv4']['counters']\
                     ['labeled_bytes_sent']= int(m.groupdict()['labeled_bytes_sent'])
@@ -1742,9 +2010,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                     continue
 
             #WCCP Redirect outbound: disabled
-            p28 = re.compile(r'^\s*WCCP *Redirect *outbound:'
-                              ' *(?P<wccp_redirect_outbound>[a-z]+)$')
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 wccp_redirect_outbound = m.groupdict()['wccp_redirect_outbound']
 
@@ -1753,9 +2019,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #WCCP Redirect inbound: disabled
-            p29 = re.compile(r'^\s*WCCP *Redirect *inbound:'
-                              ' *(?P<wccp_redirect_inbound>[a-z]+)$')
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 wccp_redirect_inbound = m.groupdict()['wccp_redirect_inbound']
 
@@ -1764,9 +2028,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             #WCCP Redirect exclude: disabled
-            p30 = re.compile(r'^\s*WCCP *Redirect *exclude:'
-                              ' *(?P<wccp_redirect_exclude>[a-z]+)$')
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 wccp_redirect_exclude = m.groupdict()['wccp_redirect_exclude']
 
@@ -1775,8 +2037,7 @@ class ShowIpInterfaceVrfAll(ShowIpInterfaceVrfAllSchema):
                 continue
 
             # IP unnumbered interface (loopback0)
-            p31 = re.compile(r'^\s*IP +unnumbered +interface +\((?P<unnum_intf>[\w\/\.]+)\)$')
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 unnum_intf = m.groupdict()['unnum_intf']
                 if 'ipv4' in ip_interface_vrf_all_dict[interface]:
@@ -12,6 +12,9 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
+# Parser utils
+from genie.libs.parser.utils.log_tail import TailParser
+
 
 # ==============================================
 # Schema for:
@@ -35,7 +38,7 @@ class ShowLoggingLogfileSchema(MetaParser):
 #   * 'show logging logfile'
 #   * 'show logging logfile | include {include}'
 # ==============================================
-class ShowLoggingLogfile(ShowLoggingLogfileSchema):
+class ShowLoggingLogfile(ShowLoggingLogfileSchema, TailParser):
 
     '''Schema for:
         * 'show logging logfile'
@@ -47,6 +50,14 @@ class ShowLoggingLogfile(ShowLoggingLogfileSchema):
                    ]
     exclude = ['logs']
 
+    # Lines of the log buffer, see tail()
+    tail_entry = re.compile(
+        r'^(?P<timestamp>\d{4} +[A-Z][a-z]{2} +\d+ +'
+        r'\d+:\d+:\d+(?:\.\d+)?)(?: +(?P<host>[^\s%]+))? +'
+        r'%(?P<facility>[\w-]+)-(?P<severity>[0-7])-(?P<mnemonic>[\w-]+): +'
+        r'(?P<message>.*)$')
+    tail_start = re.compile(r'^show +logging +logfile')
+
     def cli(self, include='', output=None):
 
         if output is None:
@@ -70,7 +81,8 @@ class ShowLoggingLogfile(ShowLoggingLogfileSchema):
             # Add line to 'logs'
             if line and 'show logging logfile' not in line:
                 log_lines.append(line)
-                parsed_dict['logs'] = log_lines
-                continue
+
+        if log_lines:
+            parsed_dict['logs'] = log_lines
 
         return parsed_dict
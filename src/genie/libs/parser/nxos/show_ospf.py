@@ -31,6 +31,16 @@ from netaddr import IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.regex import LazyRegex
+from genie.libs.parser.utils.json_rows import JsonParser, iter_json_rows, \
+                                              loads
+
+
+def json_mask(value):
+    # nwmask: prefix length, or the mask
+    if '.' in value:
+        return value
+    return str(IPNetwork('0.0.0.0/{}'.format(int(value))).netmask)
 
 
 # ======================================
@@ -173,6 +183,112 @@ class ShowIpOspf(ShowIpOspfSchema):
     cli_command = ['show ip ospf vrf {vrf}', 'show ip ospf']
     exclude = ['existed']
 
+    p1 = LazyRegex(r'^Routing +Process +(?P<instance>\d+) +'
+                       'with +ID +(?P<router_id>[\d\.]+) +'
+                       'VRF +(?P<vrf>\S+)$')
+
+    p2 = LazyRegex(r'^Routing +Process +Instance +Number'
+                       ' +(?P<instance>\d+)$')
+
+    p3 = LazyRegex(r'^Stateful +High +Availability +(?P<enable>\w+)$')
+
+    p4 = LazyRegex(r'^Graceful\-restart +is +(?P<gr_enable>\w+)$')
+
+    p5 = LazyRegex(r'^Grace +period: +(?P<interval>\w+) +'
+                       'state: +(?P<state>\w+)$')
+
+    p6 = LazyRegex(r'^Last +graceful +restart +exit +status:'
+                       ' +(?P<status>\w+)$')
+
+    p7 = LazyRegex(r'^Supports +only +single +TOS\(TOS0\) +routes$')
+
+    p8 = LazyRegex(r'^Supports +opaque +LSA$')
+
+    p9 = LazyRegex(r'^Administrative +distance +(?P<pref_all>\d+)$')
+
+    p10 = LazyRegex(r'^BFD +is +enabled$')
+
+    p11 = LazyRegex(r'^Reference +Bandwidth +is +(?P<bd>\d+)'
+                    ' +(?P<unit>\w+)$')
+
+    p12 = LazyRegex(r'^SPF +throttling +delay +time +of'
+                       ' +(?P<time>[\d\.]+) +msecs,$')
+
+    p13 = LazyRegex(r'^SPF +throttling +hold +time +of'
+                       ' +(?P<time>[\d\.]+) +msecs,$')
+
+    p14 = LazyRegex(r'^SPF +throttling +maximum +wait +time +of'
+                       ' +(?P<time>[\d\.]+) +msecs$')
+
+    p15 = LazyRegex(r'^LSA +throttling +start +time +of'
+                       ' +(?P<time>[\d\.]+) +msecs,$')
+
+    p16 = LazyRegex(r'^LSA +throttling +hold +interval +of'
+                       ' +(?P<time>[\d\.]+) +msecs,$')
+
+    p17 = LazyRegex(r'^LSA +throttling +maximum +wait +time +of'
+                       ' +(?P<time>[\d\.]+) +msecs$')
+
+    p18 = LazyRegex(r'^Minimum +LSA +arrival +(?P<time>[\d\.]+) +msec$')
+
+    p19 = LazyRegex(r'^Maximum +number +of +non +self\-generated +'
+                       'LSA +allowed +(?P<max>\d+)$')
+
+    p19_1 = LazyRegex(r'^Originating +router +LSA +with +maximum +metric$')
+
+    p20 = LazyRegex(r'^LSA +group +pacing +timer +(?P<time>\d+) +secs$')
+
+    p21 = LazyRegex(r'^Maximum paths to destination +(?P<path>\d+)$')
+
+    p22 = LazyRegex(r'^Number +of +external +LSAs +(?P<total>\d+), +'
+                       'checksum +sum +(?P<checksum>\w+)$')
+
+    p23 = LazyRegex(r'^Number +of +opaque +AS +LSAs +(?P<total>\d+),'
+                       ' +checksum +sum +(?P<checksum>\w+)$')
+
+    p24 = LazyRegex(r'^Number +of +areas +is +(?P<total>\d+), +'
+                       '(?P<normal>\d+) +normal, +'
+                       '(?P<stub>\d+) +stub, +'
+                       '(?P<nssa>\d+) +nssa$')
+
+    p25 = LazyRegex(r'^Number +of +active +areas +is +(?P<total>\d+),'
+                       ' +(?P<normal>\d+) +normal, +'
+                       '(?P<stub>\d+) +stub, +'
+                       '(?P<nssa>\d+) +nssa$')
+
+    p26 = LazyRegex(r'^Install +discard +route +for +'
+                       'summarized +(?P<type>\w+) +routes.$')
+
+    p27 = LazyRegex(r'^Area +(?P<type>\w+)?\((?P<area>[\w\.\:]+)\)'
+                       '( *\((?P<status>\w+)\))?$')
+
+    p34 = LazyRegex(r'^This +area +is +a +(?P<type>\w+) +area$')
+
+    p35 = LazyRegex(r'^Generates +stub +default +route +with +'
+                       'cost +(?P<cost>\d+)$')
+
+    p28 = LazyRegex(r'^Area +has +existed +for +(?P<time>[\w\.\:]+)$')
+
+    p29 = LazyRegex(r'^Interfaces +in +this +area: +(?P<num1>\d+) +'
+                       'Active +interfaces: +(?P<num2>\d+)$')
+
+    p30 = LazyRegex(r'^Passive +interfaces: +(?P<num1>\d+) +'
+                       'Loopback +interfaces: +(?P<num2>\d+)$')
+
+    p30_1 = LazyRegex(r'No +authentication +available$')
+
+    p31 = LazyRegex(r'^SPF +calculation +has +run +(?P<num1>\d+) +times$')
+
+    p32 = LazyRegex(r'^Last +SPF +ran +for +(?P<num1>[\d\.]+)s$')
+
+    p36 = LazyRegex(r'^(?P<prefix>[\d\/\.]+) +'
+                       '(Active|Passive) +\(Num +nets: +(?P<net>\d+)\) +'
+                       '(?P<advertise>\w+) +'
+                       'Cost +configured +(?P<cost>\d+)$')
+
+    p33 = LazyRegex(r'^Number +of +LSAs: +(?P<num1>\d+), +'
+                       'checksum +sum +(?P<num2>\w+)$')
+
     def cli(self, vrf='', output=None):
         if vrf:
             cmd = self.cli_command[0].format(vrf=vrf)
@@ -188,79 +304,11 @@ class ShowIpOspf(ShowIpOspfSchema):
         ret_dict = {}
         sub_dict = {}
 
-        p1 = re.compile(r'^Routing +Process +(?P<instance>\d+) +'
-                            'with +ID +(?P<router_id>[\d\.]+) +'
-                            'VRF +(?P<vrf>\S+)$')
-        p2 = re.compile(r'^Routing +Process +Instance +Number'
-                            ' +(?P<instance>\d+)$')
-        p3 = re.compile(r'^Stateful +High +Availability +(?P<enable>\w+)$')
-        p4 = re.compile(r'^Graceful\-restart +is +(?P<gr_enable>\w+)$')
-        p5 = re.compile(r'^Grace +period: +(?P<interval>\w+) +'
-                            'state: +(?P<state>\w+)$')
-        p6 = re.compile(r'^Last +graceful +restart +exit +status:'
-                            ' +(?P<status>\w+)$')
-        p7 = re.compile(r'^Supports +only +single +TOS\(TOS0\) +routes$')
-        p8 = re.compile(r'^Supports +opaque +LSA$')
-        p9 = re.compile(r'^Administrative +distance +(?P<pref_all>\d+)$')
-        p10 = re.compile(r'^BFD +is +enabled$')
-        p11 = re.compile(r'^Reference +Bandwidth +is +(?P<bd>\d+)'
-                        ' +(?P<unit>\w+)$')
-        p12 = re.compile(r'^SPF +throttling +delay +time +of'
-                            ' +(?P<time>[\d\.]+) +msecs,$')
-        p13 = re.compile(r'^SPF +throttling +hold +time +of'
-                            ' +(?P<time>[\d\.]+) +msecs,$')
-        p14 = re.compile(r'^SPF +throttling +maximum +wait +time +of'
-                            ' +(?P<time>[\d\.]+) +msecs$')
-        p15 = re.compile(r'^LSA +throttling +start +time +of'
-                            ' +(?P<time>[\d\.]+) +msecs,$')
-        p16 = re.compile(r'^LSA +throttling +hold +interval +of'
-                            ' +(?P<time>[\d\.]+) +msecs,$')
-        p17 = re.compile(r'^LSA +throttling +maximum +wait +time +of'
-                            ' +(?P<time>[\d\.]+) +msecs$')
-        p18 = re.compile(r'^Minimum +LSA +arrival +(?P<time>[\d\.]+) +msec$')
-        p19 = re.compile(r'^Maximum +number +of +non +self\-generated +'
-                            'LSA +allowed +(?P<max>\d+)$')
-        p19_1 = re.compile(r'^Originating +router +LSA +with +maximum +metric$')
-        p20 = re.compile(r'^LSA +group +pacing +timer +(?P<time>\d+) +secs$')
-        p21 = re.compile(r'^Maximum paths to destination +(?P<path>\d+)$')
-        p22 = re.compile(r'^Number +of +external +LSAs +(?P<total>\d+), +'
-                            'checksum +sum +(?P<checksum>\w+)$')
-        p23 = re.compile(r'^Number +of +opaque +AS +LSAs +(?P<total>\d+),'
-                            ' +checksum +sum +(?P<checksum>\w+)$')
-        p24 = re.compile(r'^Number +of +areas +is +(?P<total>\d+), +'
-                            '(?P<normal>\d+) +normal, +'
-                            '(?P<stub>\d+) +stub, +'
-                            '(?P<nssa>\d+) +nssa$')
-        p25 = re.compile(r'^Number +of +active +areas +is +(?P<total>\d+),'
-                            ' +(?P<normal>\d+) +normal, +'
-                            '(?P<stub>\d+) +stub, +'
-                            '(?P<nssa>\d+) +nssa$')
-        p26 = re.compile(r'^Install +discard +route +for +'
-                            'summarized +(?P<type>\w+) +routes.$')
-        p27 = re.compile(r'^Area +(?P<type>\w+)?\((?P<area>[\w\.\:]+)\)'
-                            '( *\((?P<status>\w+)\))?$')
-        p34 = re.compile(r'^This +area +is +a +(?P<type>\w+) +area$')
-        p35 = re.compile(r'^Generates +stub +default +route +with +'
-                            'cost +(?P<cost>\d+)$')
-        p28 = re.compile(r'^Area +has +existed +for +(?P<time>[\w\.\:]+)$')
-        p29 = re.compile(r'^Interfaces +in +this +area: +(?P<num1>\d+) +'
-                            'Active +interfaces: +(?P<num2>\d+)$')
-        p30 = re.compile(r'^Passive +interfaces: +(?P<num1>\d+) +'
-                            'Loopback +interfaces: +(?P<num2>\d+)$')
-        p30_1 = re.compile(r'No +authentication +available$')
-        p31 = re.compile(r'^SPF +calculation +has +run +(?P<num1>\d+) +times$')
-        p32 = re.compile(r'^Last +SPF +ran +for +(?P<num1>[\d\.]+)s$')
-        p36 = re.compile(r'^(?P<prefix>[\d\/\.]+) +'
-                            '(Active|Passive) +\(Num +nets: +(?P<net>\d+)\) +'
-                            '(?P<advertise>\w+) +'
-                            'Cost +configured +(?P<cost>\d+)$')
-        p33 = re.compile(r'^Number +of +LSAs: +(?P<num1>\d+), +'
-                            'checksum +sum +(?P<num2>\w+)$')
         for line in out.splitlines():
             line = line.strip()
 
             # Routing Process 1 with ID 10.16.2.2 VRF default
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 instance = m.groupdict()['instance']
@@ -293,13 +341,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Routing Process Instance Number 1
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 sub_dict['instance'] = int(m.groupdict()['instance'])
                 continue
 
             # Stateful High Availability enabled
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 if 'nsr' not in sub_dict:
                     sub_dict['nsr'] = {}
@@ -308,7 +356,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Graceful-restart is configured
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 if 'graceful_restart' not in sub_dict:
                     sub_dict['graceful_restart'] = {}
@@ -317,7 +365,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Grace period: 60 state: Inactive 
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 restart_interval = int(m.groupdict()['interval'])
                 state = str(m.groupdict()['state'])
@@ -334,26 +382,26 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Last graceful restart exit status: None
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 sub_dict['graceful_restart']['ietf']['exist_status'] = \
                     m.groupdict()['status'].lower()
                 continue
 
             # Supports only single TOS(TOS0) routes
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 sub_dict['single_tos_routes_enable'] = True
                 continue
 
             # Supports opaque LSA
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 sub_dict['opaque_lsa_enable'] = True
                 continue
 
             # Administrative distance 110
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 if 'preference' not in sub_dict:
                     sub_dict['preference'] = {}
@@ -364,7 +412,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # BFD is enabled
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 if 'bfd' not in sub_dict:
                     sub_dict['bfd'] = {}
@@ -372,7 +420,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Reference Bandwidth is 40000 Mbps
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 bd = int(m.groupdict()['bd'])
                 if 'auto_cost' not in sub_dict:
@@ -389,7 +437,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                     continue
 
             # SPF throttling delay time of 200.000 msecs,
-            m = p12.match(line)
+            m = self.p12.match(line)
             if m:
                 start = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -402,7 +450,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # SPF throttling hold time of 1000.000 msecs, 
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 hold = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -415,7 +463,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # SPF throttling maximum wait time of 5000.000 msecs
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 maximum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -428,7 +476,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # LSA throttling start time of 0.000 msecs,
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 start = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -441,7 +489,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # LSA throttling hold interval of 5000.000 msecs, 
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 hold = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -454,7 +502,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # LSA throttling maximum wait time of 5000.000 msecs
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 maximum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -467,7 +515,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Minimum LSA arrival 1000.000 msec
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 minimum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -480,7 +528,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum number of non self-generated LSA allowed 123
-            m = p19.match(line)
+            m = self.p19.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -489,7 +537,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Originating router LSA with maximum metric
-            m = p19_1.match(line)
+            m = self.p19_1.match(line)
             if m:
                 if 'stub_router' not in sub_dict:
                     sub_dict['stub_router'] = {}
@@ -499,7 +547,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # LSA group pacing timer 10 secs
-            m = p20.match(line)
+            m = self.p20.match(line)
             if m:
                 if 'spf_control' not in sub_dict:
                     sub_dict['spf_control'] = {}
@@ -512,7 +560,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum paths to destination 8
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 if 'spf_control' not in sub_dict:
                     sub_dict['spf_control'] = {}
@@ -520,7 +568,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of external LSAs 1, checksum sum 0x7d61
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 if 'spf_control' not in sub_dict:
                     sub_dict['spf_control'] = {}
@@ -541,7 +589,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of opaque AS LSAs 0, checksum sum 0
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 if 'spf_control' not in sub_dict:
                     sub_dict['spf_control'] = {}
@@ -562,7 +610,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of areas is 1, 1 normal, 0 stub, 0 nssa
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -579,7 +627,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of active areas is 1, 1 normal, 0 stub, 0 nssa
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -597,7 +645,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Install discard route for summarized external routes.
             # Install discard route for summarized internal routes.
-            m = p26.match(line)
+            m = self.p26.match(line)
             if m:
                 sub_dict['discard_route_external'] = True
                 sub_dict['discard_route_internal'] = True
@@ -606,7 +654,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # Area BACKBONE(0.0.0.0) 
             # Area (0.0.0.1)
             # Area BACKBONE(0.0.0.0) (Inactive)
-            m = p27.match(line)
+            m = self.p27.match(line)
             if m:
                 area = m.groupdict()['area']
                 if 'areas' not in sub_dict:
@@ -624,27 +672,27 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # This area is a STUB area
             # This area is a NSSA area
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 sub_dict['areas'][area]['area_type'] = \
                     m.groupdict()['type'].lower()
                 continue
 
             # Generates stub default route with cost 1
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 sub_dict['areas'][area]['default_cost'] = \
                     int(m.groupdict()['cost'])
                 continue
 
             #  Area has existed for 08:30:42
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 sub_dict['areas'][area]['existed'] = m.groupdict()['time']
                 continue
 
             # Interfaces in this area: 4 Active interfaces: 4
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 if 'numbers' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['numbers'] = {}
@@ -655,7 +703,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Passive interfaces: 0  Loopback interfaces: 1
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 if 'numbers' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['numbers'] = {}
@@ -666,12 +714,12 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             #  No authentication available
-            m = p30_1.match(line)
+            m = self.p30_1.match(line)
             if m:
                 sub_dict['areas'][area]['authentication'] = 'none'
 
             # SPF calculation has run 8 times
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -680,7 +728,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Last SPF ran for 0.001386s
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -691,7 +739,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             #     Area ranges are
             # 10.4.0.0/16 Active (Num nets: 1) DoNotAdvertise Cost configured 31
             # 10.4.1.0/24 Passive (Num nets: 0) Advertise Cost configured 33
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 prefix = str(m.groupdict()['prefix'])
                 if 'ranges' not in sub_dict['areas'][area]:
@@ -708,9 +756,8 @@ class ShowIpOspf(ShowIpOspfSchema):
                     'donot' in m.groupdict()['advertise'].lower() else True
                 continue
 
-
             # Number of LSAs: 19, checksum sum 0x7a137
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -2544,6 +2591,109 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
         show ip ospf database <db_type> detail
         show ip ospf database <db_type> detail vrf <vrf>"""
 
+    p1 = LazyRegex(r'^ *OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+                       ' +\(Process +ID +(?P<instance>(\S+))'
+                       ' +VRF +(?P<vrf>(\S+))\)$')
+
+    p2 = LazyRegex(r'^(?P<lsa_type_name>(.*)) +Link +States'
+                       '(?: +\(Area +(?P<area>(\S+))\))?$')
+
+    p3 = LazyRegex(r'^LS +age: +(?P<age>\d+)'
+                       '(?P<dummy>\S+)?$')
+
+    p4 = LazyRegex(r'^Options: +(?P<option>([a-zA-Z0-9]+))(?:'
+                       ' *\((?P<option_desc>(.*))\))?$')
+
+    p5 = LazyRegex(r'^LS +Type: +(?P<lsa_type>(.*))$')
+
+    p36 = LazyRegex(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
+                       '(?: +\(.*\))?$')
+
+    p6 = LazyRegex(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
+
+    p7 = LazyRegex(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
+
+    p8 = LazyRegex(r'^Checksum: +(?P<checksum>(\S+))$')
+
+    p9 = LazyRegex(r'^Length: +(?P<length>(\d+))$')
+
+    p10 = LazyRegex(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
+
+    p11 = LazyRegex(r'^Metric +Type: +2 +\(.*\)$')
+
+    p12_1 = LazyRegex(r'^TOS: +(?P<tos>(\d+))$')
+
+    p12_2 = LazyRegex(r'^TOS: +(?P<tos>(\d+)) +Metric: +(?P<metric>(\d+))$')
+
+    p13 = LazyRegex(r'^Metric: +(?P<metric>(\d+))$')
+
+    p14 = LazyRegex(r'^Forward +Address: +(?P<addr>(\S+))$')
+
+    p15 = LazyRegex(r'^External +Route +Tag: +(?P<tag>(\S+))$')
+
+    p16 = LazyRegex(r'^Attached +Router: +(?P<att_router>(\S+))$')
+
+    p17 = LazyRegex(r'^Number +of +links: +(?P<num>(\d+))$')
+
+    p18 = LazyRegex(r'^Link +connected +to: +a +(?P<type>(.*))$')
+
+    p19_1 = LazyRegex(r'^\(Link +ID\) +Network\/Subnet +Number:'
+                       ' +(?P<link_id>(\S+))$')
+
+    p19_2 = LazyRegex(r'^\(Link +ID\) +Designated +Router +address:'
+                       ' +(?P<link_id>(\S+))$')
+
+    p19_3 = LazyRegex(r'^\(Link +ID\) +Neighboring +Router +ID:'
+                       ' +(?P<link_id>(\S+))$')
+
+    p20_1 = LazyRegex(r'^\(Link +Data\) +Network +Mask:'
+                       ' +(?P<link_data>(\S+))$')
+
+    p20_2 = LazyRegex(r'^\(Link +Data\) +Router +Interface +address:'
+                       ' +(?P<link_data>(\S+))$')
+
+    p21 = LazyRegex(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
+
+    p21_1 = LazyRegex(r'^TOS +(?P<tos>(\d+)) +Metric: +(?P<metric>(\d+))$')
+
+    p22 = LazyRegex(r'^Opaque +Type: +(?P<type>(\d+))$')
+
+    p23 = LazyRegex(r'^Opaque +ID: +(?P<id>(\d+))$')
+
+    p24 = LazyRegex(r'^Fragment +number: +(?P<num>(\d+))$')
+
+    p25 = LazyRegex(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
+
+    p26 = LazyRegex(r'^Number +of +Links *: +(?P<links>(\d+))$')
+
+    p27 = LazyRegex(r'^Link +connected +to +(?P<link>(.*))$')
+
+    p28 = LazyRegex(r'^(?:Link-ID +:)? *(Link +ID|Link-ID) *:'
+                       ' +(?P<id>(\S+))$')
+
+    p29 = LazyRegex(r'^(?:Interface +Address +:)? *Interface'
+                       ' +Address *: +(?P<addr>(\S+))$')
+
+    p30 = LazyRegex(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
+
+    p31 = LazyRegex(r'^Maximum +(B|b)andwidth *:'
+                       ' +(?P<max_band>(\d+))$')
+
+    p32 = LazyRegex(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
+                       ' +(?P<max_res_band>(\d+))$')
+
+    p33 = LazyRegex(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
+
+    p34 = LazyRegex(r'^Priority +(?P<num1>(\d+)) *:'
+                       ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+                       ' *: +(?P<band2>(\d+)))?$')
+
+    p35 = LazyRegex(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
+                       ' +Length += +(?P<length>(\d+))'
+                       ' +Value += +(?P<value>(.*))$')
+
+    p40 = LazyRegex(r'^(?P<something>([0\s]+))$')
+
     def cli(self, cmd, db_type,output):
 
         assert db_type in ['external', 'network', 'summary', 'router',
@@ -2572,74 +2722,13 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
             'opaque': 10,
             }
 
-        p1 = re.compile(r'^ *OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\S+))'
-                            ' +VRF +(?P<vrf>(\S+))\)$')
-        p2 = re.compile(r'^(?P<lsa_type_name>(.*)) +Link +States'
-                            '(?: +\(Area +(?P<area>(\S+))\))?$')
-        p3 = re.compile(r'^LS +age: +(?P<age>\d+)'
-                            '(?P<dummy>\S+)?$')
-        p4 = re.compile(r'^Options: +(?P<option>([a-zA-Z0-9]+))(?:'
-                            ' *\((?P<option_desc>(.*))\))?$')
-        p5 = re.compile(r'^LS +Type: +(?P<lsa_type>(.*))$')
-        p36 = re.compile(r'^Link +State +ID: +(?P<lsa_id>(\S+))'
-                            '(?: +\(.*\))?$')
-        p6 = re.compile(r'^Advertising +Router: +(?P<adv_router>(\S+))$')
-        p7 = re.compile(r'^LS +Seq +Number: +(?P<ls_seq_num>(\S+))$')
-        p8 = re.compile(r'^Checksum: +(?P<checksum>(\S+))$')
-        p9 = re.compile(r'^Length: +(?P<length>(\d+))$')
-        p10 = re.compile(r'^Network +Mask: +\/(?P<net_mask>(\S+))$')
-        p11 = re.compile(r'^Metric +Type: +2 +\(.*\)$')
-        p12_1 = re.compile(r'^TOS: +(?P<tos>(\d+))$')
-        p12_2 = re.compile(r'^TOS: +(?P<tos>(\d+)) +Metric: +(?P<metric>(\d+))$')
-        p13 = re.compile(r'^Metric: +(?P<metric>(\d+))$')
-        p14 = re.compile(r'^Forward +Address: +(?P<addr>(\S+))$')
-        p15 = re.compile(r'^External +Route +Tag: +(?P<tag>(\S+))$')
-        p16 = re.compile(r'^Attached +Router: +(?P<att_router>(\S+))$')
-        p17 = re.compile(r'^Number +of +links: +(?P<num>(\d+))$')
-        p18 = re.compile(r'^Link +connected +to: +a +(?P<type>(.*))$')
-        p19_1 = re.compile(r'^\(Link +ID\) +Network\/Subnet +Number:'
-                            ' +(?P<link_id>(\S+))$')
-        p19_2 = re.compile(r'^\(Link +ID\) +Designated +Router +address:'
-                            ' +(?P<link_id>(\S+))$')
-        p19_3 = re.compile(r'^\(Link +ID\) +Neighboring +Router +ID:'
-                            ' +(?P<link_id>(\S+))$')
-        p20_1 = re.compile(r'^\(Link +Data\) +Network +Mask:'
-                            ' +(?P<link_data>(\S+))$')
-        p20_2 = re.compile(r'^\(Link +Data\) +Router +Interface +address:'
-                            ' +(?P<link_data>(\S+))$')
-        p21 = re.compile(r'^Number +of +TOS +metrics: +(?P<num>(\d+))$')
-        p21_1 = re.compile(r'^TOS +(?P<tos>(\d+)) +Metric: +(?P<metric>(\d+))$')
-        p22 = re.compile(r'^Opaque +Type: +(?P<type>(\d+))$')
-        p23 = re.compile(r'^Opaque +ID: +(?P<id>(\d+))$')
-        p24 = re.compile(r'^Fragment +number: +(?P<num>(\d+))$')
-        p25 = re.compile(r'^MPLS +TE +router +ID *: +(?P<mpls>(\S+))$')
-        p26 = re.compile(r'^Number +of +Links *: +(?P<links>(\d+))$')
-        p27 = re.compile(r'^Link +connected +to +(?P<link>(.*))$')
-        p28 = re.compile(r'^(?:Link-ID +:)? *(Link +ID|Link-ID) *:'
-                            ' +(?P<id>(\S+))$')
-        p29 = re.compile(r'^(?:Interface +Address +:)? *Interface'
-                            ' +Address *: +(?P<addr>(\S+))$')
-        p30 = re.compile(r'^Admin +Metric *: +(?P<te_metric>(\d+))$')
-        p31 = re.compile(r'^Maximum +(B|b)andwidth *:'
-                            ' +(?P<max_band>(\d+))$')
-        p32 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
-                            ' +(?P<max_res_band>(\d+))$')
-        p33 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
-        p34 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
-        p35 = re.compile(r'^Unknown +Sub-TLV *: +Type += +(?P<type>(\d+)),'
-                            ' +Length += +(?P<length>(\d+))'
-                            ' +Value += +(?P<value>(.*))$')
-        p40 = re.compile(r'^(?P<something>([0\s]+))$')
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.16.2.2) (Process ID 1 VRF default)
             # OSPF Router with ID (10.151.22.22) (Process ID 1 VRF VRF1)
             # OSPF Router with ID (10.186.0.1) (Process ID UNDERLAY VRF default)
-            m = p1.match(line)
+            m = self.p1.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
                 instance = str(m.groupdict()['instance'])
@@ -2664,7 +2753,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
             # Opaque Area Link States (Area 0.0.0.0)
             # Summary Network Link States (Area 0.0.0.0)
             # Network Link States (Area 0.0.0.0)
-            m = p2.match(line)
+            m = self.p2.match(line)
             if m:
                 lsa_type = lsa_type_mapping[db_type]
                 
@@ -2709,7 +2798,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
 
             # LS age: 1565
             # LS age: 3690(Maxage)
-            m = p3.match(line)
+            m = self.p3.match(line)
             if m:
                 age = int(m.groupdict()['age'])
                 dummy = m.groupdict()['dummy']
@@ -2718,14 +2807,14 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
                 continue
 
             # Options: 0x20 (No TOS-capability, DC)
-            m = p4.match(line)
+            m = self.p4.match(line)
             if m:
                 option = str(m.groupdict()['option'])
                 option_desc = str(m.groupdict()['option_desc'])
                 continue
 
             # LS Type: Type-5 AS-External
-            m = p5.match(line)
+            m = self.p5.match(line)
             if m:
                 lsa_type = lsa_type_mapping[db_type]
                 continue
@@ -2733,13 +2822,13 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
             # Link State ID: 10.4.1.1
             # Link State ID: 10.94.44.44 (Network address)
             # Link State ID: 10.1.2.1 (Designated Router address)
-            m = p36.match(line)
+            m = self.p36.match(line)
             if m:
                 lsa_id = str(m.groupdict()['lsa_id'])
                 continue
 
             # Advertising Router: 10.64.4.4
-            m = p6.match(line)
+            m = self.p6.match(line)
             if m:
                 adv_router = str(m.groupdict()['adv_router'])
                 lsa = lsa_id + ' ' + adv_router
@@ -2833,69 +2922,69 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
                     pass
 
             # LS Seq Number: 0x80000002
-            m = p7.match(line)
+            m = self.p7.match(line)
             if m:
                 header_dict['seq_num'] = str(m.groupdict()['ls_seq_num'])
                 continue
 
             # Checksum: 0x7d61
-            m = p8.match(line)
+            m = self.p8.match(line)
             if m:
                 header_dict['checksum'] = str(m.groupdict()['checksum'])
                 continue
 
             # Length: 36
-            m = p9.match(line)
+            m = self.p9.match(line)
             if m:
                 header_dict['length'] = int(m.groupdict()['length'])
                 continue
 
             # Network Mask: /32
-            m = p10.match(line)
+            m = self.p10.match(line)
             if m:
                 dummy = '{}/{}'.format('0.0.0.0', m.groupdict()['net_mask'])
                 db_dict['network_mask'] = str(IPNetwork(dummy).netmask)
                 continue
 
             # Metric Type: 2 (Larger than any link state path)
-            m = p11.match(line)
+            m = self.p11.match(line)
             if m:
                 db_topo_dict['flags'] = "E"
                 continue
 
             # TOS: 0
-            m = p12_1.match(line)
+            m = self.p12_1.match(line)
             if m:
                 db_topo_dict['tos'] = int(m.groupdict()['tos'])
                 continue
 
             # TOS: 0 Metric: 1
-            m = p12_2.match(line)
+            m = self.p12_2.match(line)
             if m:
                 db_topo_dict['tos'] = int(m.groupdict()['tos'])
                 db_topo_dict['metric'] = int(m.groupdict()['metric'])
                 continue
 
             # Metric: 20
-            m = p13.match(line)
+            m = self.p13.match(line)
             if m:
                 db_topo_dict['metric'] = int(m.groupdict()['metric'])
                 continue
 
             # Forward Address: 0.0.0.0
-            m = p14.match(line)
+            m = self.p14.match(line)
             if m:
                 db_topo_dict['forwarding_address'] = str(m.groupdict()['addr'])
                 continue
 
             # External Route Tag: 0
-            m = p15.match(line)
+            m = self.p15.match(line)
             if m:
                 db_topo_dict['external_route_tag'] = int(m.groupdict()['tag'])            
                 continue
 
             # Attached Router: 10.84.66.66
-            m = p16.match(line)
+            m = self.p16.match(line)
             if m:
                 attached_router = str(m.groupdict()['att_router'])
                 if 'attached_routers' not in db_dict:
@@ -2905,19 +2994,19 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
                     continue
 
             # Number of links: 3
-            m = p17.match(line)
+            m = self.p17.match(line)
             if m:
                 db_dict['num_of_links'] = int(m.groupdict()['num'])
                 continue
 
             # Link connected to: a Stub Network
-            m = p18.match(line)
+            m = self.p18.match(line)
             if m:
                 link_type = str(m.groupdict()['type']).lower()
                 continue
 
             # (Link ID) Network/Subnet Number: 10.4.1.1
-            m = p19_1.match(line)
+            m = self.p19_1.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -2944,7 +3033,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
                 continue
                 
             # (Link ID) Designated Router address: 10.166.7.6
-            m = p19_2.match(line)
+            m = self.p19_2.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -2972,7 +3061,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
 
             # (Link ID) Neighboring Router ID: 10.151.22.22
             # (Link ID) Neighboring Router ID: 10.186.0.2
-            m = p19_3.match(line)
+            m = self.p19_3.match(line)
             if m:
                 link_id = str(m.groupdict()['link_id'])
 
@@ -2999,28 +3088,28 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
                 continue
 
             # (Link Data) Network Mask: 255.255.255.255
-            m = p20_1.match(line)
+            m = self.p20_1.match(line)
             if m:
                 db_dict['links'][link_id]['link_data'] = \
                     str(m.groupdict()['link_data'])
                 continue
 
             # (Link Data) Router Interface address: 10.166.7.6
-            m = p20_2.match(line)
+            m = self.p20_2.match(line)
             if m:
                 db_dict['links'][link_id]['link_data'] = \
                     str(m.groupdict()['link_data'])
                 continue
 
             # Number of TOS metrics: 0
-            m = p21.match(line)
+            m = self.p21.match(line)
             if m:
                 db_dict['links'][link_id]['num_tos_metrics'] = \
                     int(m.groupdict()['num'])
                 continue
 
             # TOS   0 Metric: 1
-            m = p21_1.match(line)
+            m = self.p21_1.match(line)
             if m:
                 if db_type == 'router':
                     db_dict['links'][link_id]['topologies'][mt_id]['tos'] = int(m.groupdict()['tos'])
@@ -3028,37 +3117,37 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
                 continue
 
             # Opaque Type: 1
-            m = p22.match(line)
+            m = self.p22.match(line)
             if m:
                 opaque_type = int(m.groupdict()['type'])
                 continue
             
             # Opaque ID: 38
-            m = p23.match(line)
+            m = self.p23.match(line)
             if m:
                 opaque_id = int(m.groupdict()['id'])
                 continue
 
             # Fragment number: 0
-            m = p24.match(line)
+            m = self.p24.match(line)
             if m:
                 header_dict['fragment_number'] = int(m.groupdict()['num'])
                 continue
 
             # MPLS TE router ID : 10.4.1.1
-            m = p25.match(line)
+            m = self.p25.match(line)
             if m:
                 header_dict['mpls_te_router_id'] = str(m.groupdict()['mpls'])
                 continue
 
             # Number of Links : 0
-            m = p26.match(line)
+            m = self.p26.match(line)
             if m:
                 header_dict['num_links'] = int(m.groupdict()['links'])
                 continue
 
             # Link connected to Broadcast network
-            m = p27.match(line)
+            m = self.p27.match(line)
             if m:
                 link_tlv_counter += 1
                 if 'link_tlvs' not in db_dict:
@@ -3090,7 +3179,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
             # Link ID : 10.1.4.4
             # Link-ID : 10.1.11.2
             # Link-ID :   Link ID : 192.168.106.2
-            m = p28.match(line)
+            m = self.p28.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['link_id'] = \
                     str(m.groupdict()['id'])
@@ -3098,7 +3187,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
 
             # Interface Address : 10.1.4.1
             # Interface Address :   Interface Address : 192.168.106.2
-            m = p29.match(line)
+            m = self.p29.match(line)
             if m:
                 addr = str(m.groupdict()['addr'])
                 if 'local_if_ipv4_addrs' not in db_dict['link_tlvs']\
@@ -3112,21 +3201,21 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
                     continue
 
             # Admin Metric : 1
-            m = p30.match(line)
+            m = self.p30.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['te_metric'] = \
                     int(m.groupdict()['te_metric'])
                 continue
 
             # Maximum Bandwidth : 125000000
-            m = p31.match(line)
+            m = self.p31.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['max_bandwidth'] = \
                     int(m.groupdict()['max_band'])
                 continue
 
             # Maximum reservable bandwidth : 93750000
-            m = p32.match(line)
+            m = self.p32.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]\
                     ['max_reservable_bandwidth'] = \
@@ -3134,7 +3223,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
                 continue
 
             # Affinity Bit : 0x0
-            m = p33.match(line)
+            m = self.p33.match(line)
             if m:
                 db_dict['link_tlvs'][link_tlv_counter]['admin_group'] = \
                     str(m.groupdict()['admin_group'])
@@ -3143,7 +3232,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
             # Number of Priority : 8
             
             # Priority 0 : 93750000    Priority 1 : 93750000
-            m = p34.match(line)
+            m = self.p34.match(line)
             if m:
                 value1 = str(m.groupdict()['num1']) + ' ' + \
                          str(m.groupdict()['band1'])
@@ -3176,7 +3265,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
                     continue
 
             # Unknown Sub-TLV   :  Type = 32770, Length = 4 Value = 00 00 00 01
-            m = p35.match(line)
+            m = self.p35.match(line)
             if m:
                 unknown_tlvs_counter += 1
                 tlv_value = ''
@@ -3197,7 +3286,7 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
 
             # 0 00 00 00 00 00 00 00 00 00 00 00 00 00 00
             # 00 00 00 00 00 00 00 00 00 00 00 00 
-            m = p40.match(line)
+            m = self.p40.match(line)
             if m:
                 tlv_value = tlv_value + ' ' + line
                 db_dict['link_tlvs'][link_tlv_counter]['unknown_tlvs']\
@@ -3206,6 +3295,100 @@ class ShowIpOspfDatabaseDetailParser(MetaParser):
 
         return ret_dict
 
+    # show ip ospf database <db_type> detail | json, for the external,
+    # network and summary LSAs
+    json_fields = {
+        'ROW_ctx': {'ptag': 'instance',
+                    'cname': 'vrf'},
+        'ROW_area': {'area': 'area'},
+        'ROW_lsa': {'age': ('age', int),
+                    'maxage': ('maxage', lambda value: value == 'true'),
+                    'options': 'option',
+                    'options_desc': 'option_desc',
+                    'lsaid': 'lsa_id',
+                    'advrtr': 'adv_router',
+                    'seqnum': 'seq_num',
+                    'checksum': 'checksum',
+                    'length': ('length', int),
+                    'nwmask': ('network_mask', json_mask),
+                    'metrictype': 'metric_type',
+                    'tos': ('tos', int),
+                    'metric': ('metric', int),
+                    'fwdaddr': 'forwarding_address',
+                    'tag': ('external_route_tag', int)},
+        'ROW_attached_rtr': {'attached_rtr': 'router'}}
+
+    def json(self, cmd, db_type, output):
+
+        assert db_type in ['external', 'network', 'summary']
+
+        if output is None:
+            output = self.device.execute(cmd + ' | json')
+
+        ret_dict = {}
+        lsa_type = {'network': 2, 'summary': 3, 'external': 5}[db_type]
+
+        for row in iter_json_rows(self.json_fields, loads(output)):
+            if row.tag == 'ROW_attached_rtr':
+                # Attached Router: 10.84.66.66, of the LSA read
+                if 'router' in row.values and row.parents:
+                    row.parents[-1].values.setdefault(
+                        'attached_routers', []).append(row.values['router'])
+                continue
+            if row.tag != 'ROW_lsa':
+                continue
+
+            rows = {parent.tag: parent.values for parent in row.parents}
+            vrf = rows.get('ROW_ctx', {}).get('vrf')
+            instance = rows.get('ROW_ctx', {}).get('instance')
+            area = rows.get('ROW_area', {}).get('area', '0.0.0.0')
+            values = row.values
+            lsa_id = values.get('lsa_id')
+            adv_router = values.get('adv_router')
+            if not vrf or not instance or not lsa_id or not adv_router:
+                continue
+
+            sub_dict = ret_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                .setdefault('address_family', {}).setdefault('ipv4', {})\
+                .setdefault('instance', {}).setdefault(instance, {})\
+                .setdefault('areas', {}).setdefault(area, {})\
+                .setdefault('database', {}).setdefault('lsa_types', {})\
+                .setdefault(lsa_type, {})
+            sub_dict['lsa_type'] = lsa_type
+
+            header_dict = {key: values[key] for key in
+                           ('age', 'maxage', 'option', 'option_desc',
+                            'lsa_id', 'adv_router', 'seq_num', 'checksum',
+                            'length') if key in values}
+            header_dict['type'] = lsa_type
+
+            db_dict = {}
+            if 'network_mask' in values:
+                db_dict['network_mask'] = values['network_mask']
+            if db_type == 'network':
+                if 'attached_routers' in values:
+                    db_dict['attached_routers'] = {
+                        router: {} for router in values['attached_routers']}
+            else:
+                db_topo_dict = {'mt_id': 0}
+                keys = ('tos', 'metric')
+                if db_type == 'external':
+                    keys += ('forwarding_address', 'external_route_tag')
+                    # Metric Type: 2 (Larger than any link state path)
+                    if values.get('metric_type') == '2':
+                        db_topo_dict['flags'] = 'E'
+                db_topo_dict.update((key, values[key]) for key in keys
+                                    if key in values)
+                db_dict['topologies'] = {0: db_topo_dict}
+
+            sub_dict.setdefault('lsas', {})[lsa_id + ' ' + adv_router] = {
+                'lsa_id': lsa_id,
+                'adv_router': adv_router,
+                'ospfv2': {'header': header_dict,
+                           'body': {db_type: db_dict}}}
+
+        return ret_dict
+
 
 # ===============================================================
 # Schema for 'show ip ospf database external detail [vrf <WORD>]'
@@ -3278,7 +3461,9 @@ class ShowIpOspfDatabaseExternalDetailSchema(MetaParser):
 # ===================================================================
 # Super parser for 'show ip ospf database <WORD> detail [vrf <WORD>]'
 # ===================================================================
-class ShowIpOspfDatabaseExternalDetail(ShowIpOspfDatabaseExternalDetailSchema, ShowIpOspfDatabaseDetailParser):
+class ShowIpOspfDatabaseExternalDetail(ShowIpOspfDatabaseExternalDetailSchema,
+                                       ShowIpOspfDatabaseDetailParser,
+                                       JsonParser):
     """Parser for:
         show ip ospf database external detail
         show ip ospf database external detail vrf <vrf>"""
@@ -3298,6 +3483,14 @@ class ShowIpOspfDatabaseExternalDetail(ShowIpOspfDatabaseExternalDetailSchema, S
 
         return super().cli(cmd=cmd, db_type='external',output=output)
 
+    def json(self, vrf='', output=None):
+        if vrf:
+            cmd = self.cli_command[0].format(vrf=vrf)
+        else:
+            cmd = self.cli_command[1]
+
+        return super().json(cmd=cmd, db_type='external', output=output)
+
 
 # ==============================================================
 # Schema for 'show ip ospf database network detail [vrf <WORD>]'
@@ -3364,7 +3557,9 @@ class ShowIpOspfDatabaseNetworkDetailSchema(MetaParser):
 # ===============================================================
 # Parser for 'show ip ospf database network detail [vrf <WORD>]'
 # ===============================================================
-class ShowIpOspfDatabaseNetworkDetail(ShowIpOspfDatabaseNetworkDetailSchema, ShowIpOspfDatabaseDetailParser):
+class ShowIpOspfDatabaseNetworkDetail(ShowIpOspfDatabaseNetworkDetailSchema,
+                                      ShowIpOspfDatabaseDetailParser,
+                                      JsonParser):
     """Parser for:
         show ip ospf database network detail
         show ip ospf database network detail vrf <vrf>"""
@@ -3385,6 +3580,14 @@ class ShowIpOspfDatabaseNetworkDetail(ShowIpOspfDatabaseNetworkDetailSchema, Sho
 
         return super().cli(cmd=cmd, db_type='network',output=output)
 
+    def json(self, vrf='', output=None):
+        if vrf:
+            cmd = self.cli_command[0].format(vrf=vrf)
+        else:
+            cmd = self.cli_command[1]
+
+        return super().json(cmd=cmd, db_type='network', output=output)
+
 
 # ==============================================================
 # Schema for 'show ip ospf database summary detail [vrf <WORD>]'
@@ -3455,7 +3658,9 @@ class ShowIpOspfDatabaseSummaryDetailSchema(MetaParser):
 # ===============================================================
 # Parser for 'show ip ospf database summary detail [vrf <WORD>]'
 # ===============================================================
-class ShowIpOspfDatabaseSummaryDetail(ShowIpOspfDatabaseSummaryDetailSchema, ShowIpOspfDatabaseDetailParser):
+class ShowIpOspfDatabaseSummaryDetail(ShowIpOspfDatabaseSummaryDetailSchema,
+                                      ShowIpOspfDatabaseDetailParser,
+                                      JsonParser):
     """Parser for:
         show ip ospf database summary detail
         show ip ospf database summary detail vrf <vrf>"""
@@ -3477,6 +3682,14 @@ class ShowIpOspfDatabaseSummaryDetail(ShowIpOspfDatabaseSummaryDetailSchema, Sho
 
         return super().cli(cmd=cmd, db_type='summary',output=output)
 
+    def json(self, vrf='', output=None):
+        if vrf:
+            cmd = self.cli_command[0].format(vrf=vrf)
+        else:
+            cmd = self.cli_command[1]
+
+        return super().json(cmd=cmd, db_type='summary', output=output)
+
 
 # =============================================================
 # Schema for 'show ip ospf database router detail [vrf <WORD>]'
@@ -49,6 +49,10 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.stream import iter_lines, IncrementalParser
+from genie.libs.parser.utils.records import CompactParser
+from genie.libs.parser.utils.json_rows import JsonParser, iter_json_rows, \
+                                              loads
 
 # =================================
 # Parser for 'show routing vrf all'
@@ -129,13 +133,14 @@ class ShowRoutingVrfAllSchema(MetaParser):
     }
 
 
-class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
+class ShowRoutingVrfAll(ShowRoutingVrfAllSchema, IncrementalParser,
+                        CompactParser, JsonParser):
 
     """Parser for show routing ip vrf all
                 show routing ip vrf <vrf>"""
     cli_command = ['show routing {ip} vrf all', 'show routing vrf all', 'show routing {ip} vrf {vrf}', 'show routing vrf {vrf}']
     exclude = ['uptime']
-    def cli(self, ip='', vrf='', output=None):
+    def cli(self, ip='', vrf='', output=None, output_stream=None):
         if ip and vrf:
             cmd = self.cli_command[2].format(ip=ip, vrf=vrf)
         elif ip :
@@ -146,7 +151,7 @@ class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
             cmd = self.cli_command[1]
         # excute command to get output
 
-        if output is None:
+        if output is None and output_stream is None:
             out = self.device.execute(cmd)
         else:
             out = output
@@ -159,7 +164,7 @@ class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
         if ip and (':' in ip or ip == 'ipv6'):
             is_ipv6 = True
 
-        for line in out.splitlines():
+        for line in iter_lines(out, output_stream):
             line = line.strip()
 
             # IP Route Table for VRF "default"
@@ -301,13 +306,119 @@ class ShowRoutingVrfAll(ShowRoutingVrfAllSchema):
 
         return result_dict
 
+    # show routing vrf all | json
+    json_fields = {
+        'ROW_vrf': {'vrf-name-out': 'vrf'},
+        'ROW_addrf': {'addrf': 'addrf'},
+        'ROW_prefix': {'ipprefix': 'ip_mask',
+                       'ipv6prefix': 'ip_mask',
+                       'ucast-nhops': 'ubest_num',
+                       'mcast-nhops': 'mbest_num',
+                       'attached': ('attach', lambda value:
+                                    'attached' if value == 'true' else None)},
+        'ROW_path': {'ipnexthop': 'nexthop',
+                     'ipv6nexthop': 'nexthop',
+                     'nhvrf': 'route_table',
+                     'ifname': ('interface', Common.convert_intf_name),
+                     'uptime': 'uptime',
+                     'pref': 'preference',
+                     'metric': 'metric',
+                     'clientname': 'clientname',
+                     'type': 'attribute',
+                     'tag': 'tag',
+                     'ubest': 'ubest',
+                     'mbest': 'mbest',
+                     'mpls': ('mpls', lambda value: value == 'true'),
+                     'mpls-vpn': ('mpls_vpn', lambda value: value == 'true'),
+                     'evpn': ('evpn', lambda value: value == 'true'),
+                     'segid': ('segid', int),
+                     'tunnelid': 'tunnelid',
+                     'encap': ('encap', str.lower)}}
+
+    def json(self, ip='', vrf='', output=None):
+        if output is None:
+            if ip and vrf:
+                cmd = self.cli_command[2].format(ip=ip, vrf=vrf)
+            elif ip:
+                cmd = self.cli_command[0].format(ip=ip)
+            elif vrf:
+                cmd = self.cli_command[3].format(vrf=vrf)
+            else:
+                cmd = self.cli_command[1]
+            output = self.device.execute(cmd + ' | json')
+
+        result_dict = {}
+        is_ipv6 = bool(ip) and (':' in ip or ip == 'ipv6')
+
+        for row in iter_json_rows(self.json_fields, loads(output)):
+            if row.tag != 'ROW_path':
+                continue
+            rows = {parent.tag: parent.values for parent in row.parents}
+            af_values = rows.get('ROW_addrf', {})
+            ip_values = rows.get('ROW_prefix', {})
+            vrf = rows.get('ROW_vrf', {}).get('vrf')
+            ip_mask = ip_values.get('ip_mask')
+            path = row.values
+            # *via Null0, [1/0], 18:47:42, static
+            nexthop = path.pop('nexthop', None) or path.pop('interface', None)
+            if not vrf or not ip_mask or not nexthop:
+                continue
+
+            # Address family named as cli()
+            ipv6 = af_values.get('addrf', 'ipv6' if is_ipv6 else 'ipv4') \
+                == 'ipv6'
+            if vrf == 'default':
+                address_family = 'ipv6 unicast' if ipv6 else 'ipv4 unicast'
+            else:
+                address_family = 'vpnv6 unicast' if ipv6 else 'vpnv4 unicast'
+            af_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).\
+                setdefault('address_family', {}).\
+                setdefault(address_family, {})
+            ip_dict = af_dict.setdefault('ip', {}).setdefault(ip_mask, {})
+            for key in ('ubest_num', 'mbest_num', 'attach'):
+                if ip_values.get(key):
+                    ip_dict[key] = ip_values[key]
+
+            if path.pop('mbest', None) == 'true':
+                hop_dict = ip_dict.setdefault('best_route', {}).\
+                    setdefault('multicast', {}).setdefault('nexthop', {})
+            elif path.pop('ubest', None) == 'true':
+                hop_dict = ip_dict.setdefault('best_route', {}).\
+                    setdefault('unicast', {}).setdefault('nexthop', {})
+            else:
+                hop_dict = ip_dict.setdefault('routes', {}).\
+                    setdefault('nexthop', {})
+            path.pop('ubest', None)
+
+            # bgp-100, ospf-1, direct
+            protocol, _, process = path.pop('clientname', '').partition('-')
+            if process:
+                path['protocol_id'] = process
+            prot_dict = hop_dict.setdefault(nexthop, {}).\
+                setdefault('protocol', {}).setdefault(protocol, {})
+            prot_dict.update((key, value) for key, value in path.items()
+                             if value != '' and value is not False)
+
+            # Set extra values for BGP Ops
+            attribute = path.get('attribute')
+            preference = path.get('preference')
+            if protocol == 'bgp' and preference:
+                if attribute == 'external':
+                    af_dict['bgp_distance_extern_as'] = int(preference)
+                elif attribute == 'internal':
+                    af_dict['bgp_distance_internal_as'] = int(preference)
+                elif attribute == 'discard':
+                    af_dict['bgp_distance_local'] = int(preference)
+
+        return result_dict
+
 
 class ShowRouting(ShowRoutingVrfAll):
     """Parser for show routing
                 show routing <ip>"""
     cli_command = ['show routing', 'show routing {ip}']
-    def cli(self, ip='', output=None):
-        if output is None:
+    def cli(self, ip='', output=None, output_stream=None):
+        if output is None and output_stream is None:
             if ip:
                 cmd = self.cli_command[1].format(ip=ip)
             else:
@@ -315,7 +426,16 @@ class ShowRouting(ShowRoutingVrfAll):
             out = self.device.execute(cmd)
         else:
             out = output
-        return super().cli(ip=ip, output=out)
+        return super().cli(ip=ip, output=out, output_stream=output_stream)
+
+    def json(self, ip='', output=None):
+        if output is None:
+            if ip:
+                cmd = self.cli_command[1].format(ip=ip)
+            else:
+                cmd = self.cli_command[0]
+            output = self.device.execute(cmd + ' | json')
+        return super().json(ip=ip, output=output)
 
 
 class ShowRoutingIpv6VrfAll(ShowRoutingVrfAll):
@@ -325,8 +445,12 @@ class ShowRoutingIpv6VrfAll(ShowRoutingVrfAll):
     exclude = [
         'uptime']
 
-    def cli(self, vrf='', output=None):
-        return super().cli(ip='ipv6', vrf=vrf, output=output)
+    def cli(self, vrf='', output=None, output_stream=None):
+        return super().cli(ip='ipv6', vrf=vrf, output=output,
+                           output_stream=output_stream)
+
+    def json(self, vrf='', output=None):
+        return super().json(ip='ipv6', vrf=vrf, output=output)
 
 
 # ====================================================
@@ -7117,12 +7117,115 @@ class test_show_bgp_vrf_all_all(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output,self.golden_parsed_output4)
 
+    def test_show_bgp_vrf_all_all_golden1_stream(self):
+        self.maxDiff = None
+        self.device = Mock()
+        output = self.golden_output1['execute.return_value']
+        # bytes lines, as read from a socket
+        lines = (line.encode() + b'\r\n' for line in output.splitlines())
+        obj = ShowBgpVrfAllAll(device=self.device)
+        parsed_output = obj.parse(output_stream=lines)
+        self.assertEqual(parsed_output, self.golden_parsed_output1)
+        self.assertFalse(self.device.execute.called)
+
     def test_show_bgp_vrf_all_all_empty(self):
         self.device = Mock(**self.empty_output)
         obj = ShowBgpVrfAllAll(device=self.device)
         with self.assertRaises(SchemaEmptyParserError):
             parsed_output = obj.parse()
 
+# ===============================================
+#  Unit test for 'show bgp vrf <WORD> all | json'
+# ===============================================
+class test_show_bgp_vrf_all_all_json(unittest.TestCase):
+    device = Device(name='aDevice')
+
+    cli_output = {'execute.return_value': '''
+        BGP routing table information for VRF VRF1, address family IPv4 Unicast
+        BGP table version is 35, local router ID is 10.229.11.11
+        Status: s-suppressed, x-deleted, S-stale, d-dampened, h-history, *-valid, >-best
+        Path type: i-internal, e-external, c-confed, l-local, a-aggregate, r-redist
+        Origin codes: i - IGP, e - EGP, ? - incomplete, | - multipath
+
+           Network            Next Hop            Metric     LocPrf     Weight Path
+        *>a10.121.0.0/8         0.0.0.0                           100      32768 i
+        *>i10.21.33.33/32     10.36.3.3                  0        100          0 ?
+        *>e10.49.0.0/16       10.70.2.2                                      0 100 300 ?
+
+        BGP routing table information for VRF default, address family VPNv4 Unicast
+        BGP table version is 48, local router ID is 10.4.1.1
+        Status: s-suppressed, x-deleted, S-stale, d-dampened, h-history, *-valid, >-best
+        Path type: i-internal, e-external, c-confed, l-local, a-aggregate, r-redist
+        Origin codes: i - IGP, e - EGP, ? - incomplete, | - multipath
+
+           Network            Next Hop            Metric     LocPrf     Weight Path
+        Route Distinguisher: 100:100     (VRF VRF1)
+        *>r10.229.11.11/32     0.0.0.0                  0        100      32768 ?
+        *>i10.21.33.33/32     10.36.3.3                  0        100          0 ?
+        '''}
+
+    json_output = {'execute.return_value': '''
+        {"TABLE_vrf": {"ROW_vrf": [
+          {"vrf-name-out": "VRF1",
+           "TABLE_afi": {"ROW_afi": {"afi": 1,
+            "TABLE_safi": {"ROW_safi": {"safi": 1, "af-name": "IPv4 Unicast",
+             "table-version": 35, "router-id": "10.229.11.11",
+             "TABLE_rd": {"ROW_rd": {
+              "TABLE_prefix": {"ROW_prefix": [
+               {"ipprefix": "10.121.0.0/8",
+                "TABLE_path": {"ROW_path": {"pathnr": 0, "statuscode": "*",
+                 "bestcode": ">", "typecode": "a", "ipnexthop": "0.0.0.0",
+                 "weight": 32768, "metric": "", "localpref": 100, "aspath": "",
+                 "origin": "i"}}},
+               {"ipprefix": "10.21.33.33/32",
+                "TABLE_path": {"ROW_path": {"pathnr": 0, "statuscode": "*",
+                 "bestcode": ">", "typecode": "i", "ipnexthop": "10.36.3.3",
+                 "weight": 0, "metric": 0, "localpref": 100, "aspath": "",
+                 "origin": "?"}}},
+               {"ipprefix": "10.49.0.0/16",
+                "TABLE_path": {"ROW_path": {"pathnr": 0, "statuscode": "*",
+                 "bestcode": ">", "typecode": "e", "ipnexthop": "10.70.2.2",
+                 "weight": 0, "metric": "", "localpref": "", "aspath": "100 300",
+                 "origin": "?"}}}]}}}}}}}},
+          {"vrf-name-out": "default",
+           "TABLE_afi": {"ROW_afi": {"afi": 1,
+            "TABLE_safi": {"ROW_safi": {"safi": 128, "af-name": "VPNv4 Unicast",
+             "table-version": 48, "router-id": "10.4.1.1",
+             "TABLE_rd": {"ROW_rd": {"rd_val": "100:100", "rd_vrf": "VRF1",
+              "TABLE_prefix": {"ROW_prefix": [
+               {"ipprefix": "10.229.11.11/32",
+                "TABLE_path": {"ROW_path": {"pathnr": 0, "statuscode": "*",
+                 "bestcode": ">", "typecode": "r", "ipnexthop": "0.0.0.0",
+                 "weight": 32768, "metric": 0, "localpref": 100, "aspath": "",
+                 "origin": "?"}}},
+               {"ipprefix": "10.21.33.33/32",
+                "TABLE_path": {"ROW_path": {"pathnr": 0, "statuscode": "*",
+                 "bestcode": ">", "typecode": "i", "ipnexthop": "10.36.3.3",
+                 "weight": 0, "metric": 0, "localpref": 100, "aspath": "",
+                 "origin": "?"}}}]}}}}}}}}]}}
+        '''}
+
+    def test_show_bgp_vrf_all_all_json_golden(self):
+        self.maxDiff = None
+        self.device = Mock(**self.json_output)
+        obj = ShowBgpVrfAllAll(device=self.device)
+        parsed_output = obj.parse_json()
+        self.device.execute.assert_called_once_with(
+            'show bgp vrf all all | json')
+        cli_output = self.cli_output['execute.return_value']
+        self.assertEqual(parsed_output, ShowBgpVrfAllAll(
+            device=Mock()).parse(output=cli_output))
+
+    def test_show_bgp_vrf_all_all_json_fallback(self):
+        self.device = Mock(**self.cli_output)
+        obj = ShowBgpVrfAllAll(device=self.device)
+        parsed_output = obj.parse_json(vrf='VRF1',
+                                       address_family='ipv4 unicast')
+        self.assertIsNotNone(obj.json_error)
+        self.assertEqual(self.device.execute.call_args_list[-1][0][0],
+                         'show bgp vrf VRF1 ipv4 unicast')
+        self.assertEqual(sorted(parsed_output['vrf']), ['VRF1', 'default'])
+
 # ==================================================
 #  Unit test for 'show bgp vrf <WORD> all neighbors'
 # ==================================================
@@ -723,6 +723,15 @@ class test_show_mac_address_table(unittest.TestCase):
         parsed_output = obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
+    def test_golden_stream(self):
+        self.maxDiff = None
+        self.device = Mock()
+        output = self.golden_output['execute.return_value']
+        obj = ShowMacAddressTable(device=self.device)
+        parsed_output = obj.parse(output_stream=iter(output.splitlines()))
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.assertFalse(self.device.execute.called)
+
     def test_empty(self):
         self.device = Mock(**self.empty_output)
         obj = ShowMacAddressTable(device=self.device)
@@ -730,6 +739,69 @@ class test_show_mac_address_table(unittest.TestCase):
             parsed_output = obj.parse()
 
 
+class test_show_mac_address_table_json(unittest.TestCase):
+    device = Device(name='aDevice')
+
+    cli_output = {'execute.return_value': '''
+    Legend:
+            * - primary entry, G - Gateway MAC, (R) - Routed MAC, O - Overlay MAC
+            age - seconds since last seen,+ - primary entry using vPC Peer-Link,
+            (T) - True, (F) - False, C - ControlPlane MAC, ~ - vsan
+       VLAN     MAC Address      Type      age     Secure NTFY Ports
+    ---------+-----------------+--------+---------+------+----+------------------
+    *   10     aaaa.bbbb.cccc   static   -         F      F    Eth1/2
+    *   20     aaaa.bbbb.cccc   static   -         F      F    Drop
+    *   30     aaaa.bbbb.cccc   dynamic  0         F      T    Po12
+    G    -     0000.dead.beef   static   -         F      F    sup-eth1(R)
+    '''}
+
+    json_output = {'execute.return_value': '''
+    {"TABLE_mac_address": {"ROW_mac_address": [
+      {"disp_mac_addr": "aaaa.bbbb.cccc", "disp_type": "* ",
+       "disp_vlan": "10", "disp_is_static": "enabled", "disp_age": "-",
+       "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+       "disp_port": "Eth1/2"},
+      {"disp_mac_addr": "aaaa.bbbb.cccc", "disp_type": "* ",
+       "disp_vlan": "20", "disp_is_static": "enabled", "disp_age": "-",
+       "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+       "disp_port": "Drop"},
+      {"disp_mac_addr": "aaaa.bbbb.cccc", "disp_type": "* ",
+       "disp_vlan": "30", "disp_is_static": "disabled", "disp_age": "0",
+       "disp_is_secure": "disabled", "disp_is_ntfy": "enabled",
+       "disp_port": "Po12"},
+      {"disp_mac_addr": "0000.dead.beef", "disp_type": "G ",
+       "disp_vlan": "-", "disp_is_static": "enabled", "disp_age": "-",
+       "disp_is_secure": "disabled", "disp_is_ntfy": "disabled",
+       "disp_port": "sup-eth1(R)"}]}}
+    '''}
+
+    def test_golden(self):
+        self.maxDiff = None
+        self.device = Mock(**self.json_output)
+        obj = ShowMacAddressTable(device=self.device)
+        parsed_output = obj.parse_json()
+        self.device.execute.assert_called_once_with(
+            'show mac address-table | json')
+        self.assertEqual(parsed_output, ShowMacAddressTable(
+            device=Mock()).parse(output=self.cli_output['execute.return_value']))
+        self.assertIsNone(obj.json_error)
+
+    def test_fallback(self):
+        self.device = Mock(**self.cli_output)
+        obj = ShowMacAddressTable(device=self.device)
+        parsed_output = obj.parse_json()
+        self.assertEqual(self.device.execute.call_count, 2)
+        self.assertIsNotNone(obj.json_error)
+        self.assertEqual(sorted(parsed_output['mac_table']['vlans']),
+                         ['-', '10', '20', '30'])
+
+    def test_empty(self):
+        self.device = Mock(**{'execute.return_value': '{}'})
+        obj = ShowMacAddressTable(device=self.device)
+        with self.assertRaises(SchemaEmptyParserError):
+            parsed_output = obj.parse_json()
+
+
 class test_show_mac_address_table_limit(unittest.TestCase):
     device = Device(name='aDevice')
     empty_output = {'execute.return_value': ''}
@@ -1206,6 +1206,149 @@ class TestShowInterface(unittest.TestCase):
         self.maxDiff = None
         self.assertEqual(parsed_output, self.golden_parsed_output_4)
 
+#############################################################################
+# unitest For Show Interface | json
+#############################################################################
+
+class TestShowInterfaceJson(unittest.TestCase):
+    device = Device(name='aDevice')
+
+    cli_output = {'execute.return_value': '''
+    Ethernet1/1 is up
+    admin state is up, Dedicated Interface
+      Belongs to Po10
+      Hardware: 100/1000/10000 Ethernet, address: 5254.0012.3456 (bia 5254.0012.3456)
+      MTU 1500 bytes, BW 10000000 Kbit, DLY 10 usec
+      reliability 255/255, txload 1/255, rxload 2/255
+      Encapsulation ARPA, medium is broadcast
+      Port mode is trunk
+      full-duplex, 10 Gb/s, media type is 10G
+      Beacon is turned off
+      Auto-Negotiation is turned on
+      Input flow-control is off, output flow-control is off
+      Auto-mdix is turned off
+      Switchport monitor is off
+      EtherType is 0x8100
+      EEE (efficient-ethernet) : n/a
+      Last link flapped 1d02h
+      Last clearing of "show interface" counters never
+      2 interface resets
+      30 seconds input rate 1240 bits/sec, 1 packets/sec
+      30 seconds output rate 3320 bits/sec, 2 packets/sec
+      RX
+        1200 unicast packets  35 multicast packets  4 broadcast packets
+        1239 input packets  154321 bytes
+        0 jumbo packets  0 storm suppression packets
+        0 runts  0 giants  3 CRC/FCS  0 no buffer
+        3 input error  0 short frame  0 overrun   0 underrun  0 ignored
+        0 watchdog  0 bad etype drop  0 bad proto drop  0 if down drop
+        0 input with dribble  0 input discard
+        0 Rx pause
+      TX
+        2400 unicast packets  70 multicast packets  8 broadcast packets
+        2478 output packets  308642 bytes
+        0 jumbo packets
+        0 output error  0 collision  0 deferred  0 late collision
+        0 lost carrier  0 no carrier  0 babble  0 output discard
+        0 Tx pause
+    port-channel10 is down (No operational members)
+    admin state is up
+      Hardware: Port-Channel, address: 5254.0012.3456 (bia 5254.0012.3456)
+      Description: uplink to core
+      Internet Address is 10.1.1.1/24
+      MTU 9216 bytes, BW 20000000 Kbit, DLY 10 usec
+      reliability 255/255, txload 1/255, rxload 1/255
+      Encapsulation ARPA, medium is broadcast
+      Port mode is routed
+      auto-duplex, auto-speed
+      Input flow-control is off, output flow-control is off
+      Auto-mdix is turned off
+      Switchport monitor is off
+      EtherType is 0x8100
+      Members in this channel: Eth1/1, Eth1/2
+    '''}
+
+    json_output = {'execute.return_value': '''
+    {
+      "TABLE_interface": {
+        "ROW_interface": [
+          {
+            "interface": "Ethernet1/1", "state": "up", "admin_state": "up",
+            "share_state": "Dedicated", "eth_bundle": "10",
+            "eth_hw_desc": "100/1000/10000 Ethernet",
+            "eth_hw_addr": "5254.0012.3456", "eth_bia_addr": "5254.0012.3456",
+            "eth_mtu": "1500", "eth_bw": 10000000, "eth_dly": 10,
+            "eth_reliability": "255", "eth_txload": "1", "eth_rxload": "2",
+            "medium": "broadcast", "eth_mode": "trunk", "eth_duplex": "full",
+            "eth_speed": "10 Gb/s", "eth_media": "10G", "eth_beacon": "off",
+            "eth_autoneg": "on", "eth_in_flowctrl": "off",
+            "eth_out_flowctrl": "off", "eth_mdix": "off",
+            "eth_swt_monitor": "off", "eth_ethertype": "0x8100",
+            "eth_eee_state": "n/a", "eth_link_flapped": "1d02h",
+            "eth_clear_counters": "never", "eth_reset_cntr": 2,
+            "eth_load_interval1_rx": 30, "eth_inrate1_bits": "1240",
+            "eth_inrate1_pkts": "1", "eth_load_interval1_tx": "30",
+            "eth_outrate1_bits": "3320", "eth_outrate1_pkts": "2",
+            "eth_inucast": 1200, "eth_inmcast": 35, "eth_inbcast": 4,
+            "eth_inpkts": 1239, "eth_inbytes": 154321,
+            "eth_jumbo_inpkts": "0", "eth_storm_supp": "0", "eth_runts": 0,
+            "eth_giants": 0, "eth_crc": 3, "eth_nobuf": 0, "eth_inerr": 3,
+            "eth_frame": 0, "eth_overrun": 0, "eth_underrun": 0,
+            "eth_ignored": 0, "eth_watchdog": 0, "eth_bad_eth": 0,
+            "eth_bad_proto": 0, "eth_in_ifdown_drops": 0, "eth_dribble": 0,
+            "eth_indiscard": 0, "eth_inpause": 0, "eth_outucast": 2400,
+            "eth_outmcast": 70, "eth_outbcast": 8, "eth_outpkts": 2478,
+            "eth_outbytes": 308642, "eth_jumbo_outpkts": "0",
+            "eth_outerr": 0, "eth_coll": 0, "eth_deferred": 0,
+            "eth_latecoll": 0, "eth_lostcarrier": 0, "eth_nocarrier": 0,
+            "eth_babbles": 0, "eth_outdiscard": 0, "eth_outpause": 0,
+            "eth_encap": "ARPA"
+          },
+          {
+            "interface": "port-channel10", "state": "down",
+            "state_rsn_desc": "No operational members", "admin_state": "up",
+            "eth_hw_desc": "Port-Channel", "eth_hw_addr": "5254.0012.3456",
+            "eth_bia_addr": "5254.0012.3456", "desc": "uplink to core",
+            "eth_ip_addr": "10.1.1.1", "eth_ip_mask": 24,
+            "eth_ip_prefix": "10.1.1.0", "eth_mtu": "9216",
+            "eth_bw": 20000000, "eth_dly": 10, "eth_reliability": "255",
+            "eth_txload": "1", "eth_rxload": "1", "eth_encap": "ARPA",
+            "medium": "broadcast", "eth_mode": "routed",
+            "eth_duplex": "auto", "eth_speed": "auto-speed",
+            "eth_in_flowctrl": "off", "eth_out_flowctrl": "off",
+            "eth_mdix": "off", "eth_swt_monitor": "off",
+            "eth_ethertype": "0x8100", "eth_members": "Eth1/1, Eth1/2"
+          }
+        ]
+      }
+    }
+    '''}
+
+    def test_golden(self):
+        self.maxDiff = None
+        self.device = Mock(**self.json_output)
+        interface_obj = ShowInterface(device=self.device)
+        parsed_output = interface_obj.parse_json(interface='Ethernet1/1')
+        self.device.execute.assert_called_once_with(
+            'show interface Ethernet1/1 | json')
+        cli_parsed_output = ShowInterface(device=Mock()).parse(
+            output=self.cli_output['execute.return_value'])
+        # Lines cli() does not match: auto-duplex, auto-speed and the
+        # Hardware: Port-Channel line
+        cli_parsed_output['port-channel10'].update(
+            {'duplex_mode': 'auto', 'port_speed': 'auto-speed',
+             'types': 'Port-Channel', 'mac_address': '5254.0012.3456',
+             'phys_address': '5254.0012.3456'})
+        self.assertEqual(parsed_output, cli_parsed_output)
+
+    def test_fallback(self):
+        self.device = Mock(**self.cli_output)
+        interface_obj = ShowInterface(device=self.device)
+        parsed_output = interface_obj.parse_json()
+        self.assertIsNotNone(interface_obj.json_error)
+        self.assertEqual(sorted(parsed_output),
+                         ['Ethernet1/1', 'port-channel10'])
+
 # #############################################################################
 # # Unitest For Show Ip Interface Vrf All
 # #############################################################################
@@ -3214,6 +3214,150 @@ class test_show_ip_ospf_database_summary_detail_vrf_all(unittest.TestCase):
             parsed_output = obj.parse()
 
 
+# ======================================================================
+#  Unit test for 'show ip ospf database <db_type> detail vrf all | json'
+# ======================================================================
+class test_show_ip_ospf_database_detail_json(unittest.TestCase):
+
+    '''Unit test for 'show ip ospf database <db_type> detail vrf all | json' '''
+
+    device = Device(name='aDevice')
+
+    external_output = {'execute.return_value': '''
+        OSPF Router with ID (10.16.2.2) (Process ID UNDERLAY VRF default)
+
+                Type-5 AS External Link States
+
+        LS age: 1565
+        Options: 0x20 (No TOS-capability, DC)
+        LS Type: Type-5 AS-External
+        Link State ID: 10.94.44.44 (Network address)
+        Advertising Router: 10.64.4.4
+        LS Seq Number: 0x80000002
+        Checksum: 0x7d61
+        Length: 36
+        Network Mask: /32
+             Metric Type: 2 (Larger than any link state path)
+             TOS: 0
+             Metric: 20
+             Forward Address: 0.0.0.0
+             External Route Tag: 0
+        '''}
+
+    external_json_output = {'execute.return_value': '''
+        {"TABLE_ctx": {"ROW_ctx": {"ptag": "UNDERLAY", "cname": "default",
+          "rid": "10.16.2.2",
+          "TABLE_lsa": {"ROW_lsa": {"age": 1565, "options": "0x20",
+           "options_desc": "No TOS-capability, DC", "lsaid": "10.94.44.44",
+           "advrtr": "10.64.4.4", "seqnum": "0x80000002", "checksum": "0x7d61",
+           "length": 36, "nwmask": "32", "metrictype": "2", "tos": 0,
+           "metric": 20, "fwdaddr": "0.0.0.0", "tag": 0}}}}}
+        '''}
+
+    network_output = {'execute.return_value': '''
+        OSPF Router with ID (10.16.2.2) (Process ID 1 VRF default)
+
+                Network Link States (Area 0.0.0.0)
+
+        LS age: 772
+        Options: 0x22 (No TOS-capability, DC)
+        LS Type: Network Links
+        Link State ID: 10.1.2.1 (Designated Router address)
+        Advertising Router: 10.4.1.1
+        LS Seq Number: 0x80000010
+        Checksum: 0x3bd1
+        Length: 32
+        Network Mask: /24
+             Attached Router: 10.4.1.1
+             Attached Router: 10.16.2.2
+
+        LS age: 1482
+        Options: 0x22 (No TOS-capability, DC)
+        LS Type: Network Links
+        Link State ID: 10.1.4.4 (Designated Router address)
+        Advertising Router: 10.64.4.4
+        LS Seq Number: 0x8000002f
+        Checksum: 0xa232
+        Length: 32
+        Network Mask: /24
+             Attached Router: 10.64.4.4
+             Attached Router: 10.4.1.1
+        '''}
+
+    network_json_output = {'execute.return_value': '''
+        {"TABLE_ctx": {"ROW_ctx": {"ptag": "1", "cname": "default",
+          "rid": "10.16.2.2",
+          "TABLE_area": {"ROW_area": {"area": "0.0.0.0",
+           "TABLE_lsa": {"ROW_lsa": [
+            {"age": 772, "options": "0x22",
+             "options_desc": "No TOS-capability, DC", "lsaid": "10.1.2.1",
+             "advrtr": "10.4.1.1", "seqnum": "0x80000010", "checksum": "0x3bd1",
+             "length": 32, "nwmask": "24",
+             "TABLE_attached_rtr": {"ROW_attached_rtr": [
+              {"attached_rtr": "10.4.1.1"}, {"attached_rtr": "10.16.2.2"}]}},
+            {"age": 1482, "options": "0x22",
+             "options_desc": "No TOS-capability, DC", "lsaid": "10.1.4.4",
+             "advrtr": "10.64.4.4", "seqnum": "0x8000002f", "checksum": "0xa232",
+             "length": 32, "nwmask": "24",
+             "TABLE_attached_rtr": {"ROW_attached_rtr": [
+              {"attached_rtr": "10.64.4.4"}, {"attached_rtr": "10.4.1.1"}]}}]}}}}}}
+        '''}
+
+    summary_output = {'execute.return_value': '''
+        OSPF Router with ID (10.36.3.3) (Process ID 1 VRF default)
+
+                Summary Network Link States (Area 0.0.0.1)
+
+        LS age: 401
+        Options: 0x2 (No TOS-capability, No DC)
+        LS Type: Network Summary
+        Link State ID: 10.64.4.4 (Network address)
+        Advertising Router: 10.36.3.3
+        LS Seq Number: 0x80000003
+        Checksum: 0xef26
+        Length: 28
+        Network Mask: /32
+          TOS:   0 Metric: 41
+        '''}
+
+    summary_json_output = {'execute.return_value': '''
+        {"TABLE_ctx": {"ROW_ctx": {"ptag": "1", "cname": "default",
+          "rid": "10.36.3.3",
+          "TABLE_area": {"ROW_area": {"area": "0.0.0.1",
+           "TABLE_lsa": {"ROW_lsa": {"age": 401, "options": "0x2",
+            "options_desc": "No TOS-capability, No DC", "lsaid": "10.64.4.4",
+            "advrtr": "10.36.3.3", "seqnum": "0x80000003", "checksum": "0xef26",
+            "length": 28, "nwmask": "32", "tos": 0, "metric": 41}}}}}}}
+        '''}
+
+    def test_golden(self):
+        self.maxDiff = None
+        for parser, db_type in ((ShowIpOspfDatabaseExternalDetail, 'external'),
+                                (ShowIpOspfDatabaseNetworkDetail, 'network'),
+                                (ShowIpOspfDatabaseSummaryDetail, 'summary')):
+            with self.subTest(db_type=db_type):
+                output = getattr(self, db_type + '_output')
+                json_output = getattr(self, db_type + '_json_output')
+                self.device = Mock(**json_output)
+                obj = parser(device=self.device)
+                parsed_output = obj.parse_json(vrf='all')
+                self.device.execute.assert_called_once_with(
+                    'show ip ospf database {} detail vrf all | json'.format(
+                        db_type))
+                self.assertEqual(parsed_output, parser(device=Mock()).parse(
+                    output=output['execute.return_value']))
+
+    def test_fallback(self):
+        self.maxDiff = None
+        self.device = Mock(**self.network_output)
+        obj = ShowIpOspfDatabaseNetworkDetail(device=self.device)
+        parsed_output = obj.parse_json()
+        self.assertIsNotNone(obj.json_error)
+        self.assertEqual(parsed_output, ShowIpOspfDatabaseNetworkDetail(
+            device=Mock()).parse(
+                output=self.network_output['execute.return_value']))
+
+
 # ============================================================
 #  Unit test for 'show ip ospf database router detail vrf all'
 # ============================================================
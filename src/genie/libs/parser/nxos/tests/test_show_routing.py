@@ -1,4 +1,5 @@
 # Python
+import io
 import unittest
 from unittest.mock import Mock
 # Ats
@@ -588,6 +589,15 @@ class test_show_routing_vrf_all(unittest.TestCase):
         parsed_output = bgp_obj.parse()
         self.assertEqual(parsed_output, self.golden_parsed_output)
 
+    def test_golden_stream(self):
+        self.maxDiff = None
+        self.device = Mock()
+        output = self.golden_output['execute.return_value']
+        bgp_obj = ShowRoutingVrfAll(device=self.device)
+        parsed_output = bgp_obj.parse(output_stream=io.StringIO(output))
+        self.assertEqual(parsed_output, self.golden_parsed_output)
+        self.assertFalse(self.device.execute.called)
+
     def test_golden_custom(self):
         self.maxDiff = None
         self.device = Mock(**self.golden_output_custom)
@@ -616,6 +626,123 @@ class test_show_routing_vrf_all(unittest.TestCase):
         self.assertEqual(parsed_output, self.golden_parsed_output2)
 
 
+# ============================================
+#  Unit test for 'show routing vrf all | json'
+# ============================================
+class test_show_routing_vrf_all_json(unittest.TestCase):
+    device = Device(name='aDevice')
+
+    cli_output = {'execute.return_value': '''
+        IP Route Table for VRF "default"
+        '*' denotes best ucast next-hop
+        '**' denotes best mcast next-hop
+        '[x/y]' denotes [preference/metric]
+
+        10.16.1.0/24, ubest/mbest: 1/0
+            *via 10.1.1.2, Eth1/1, [200/4444], 15:57:39, bgp-333, internal, tag 333
+        10.106.0.5/8, ubest/mbest: 1/0
+            *via Null0, [1/0], 18:47:42, static
+
+        IP Route Table for VRF "VRF1"
+        '*' denotes best ucast next-hop
+        '**' denotes best mcast next-hop
+        '[x/y]' denotes [preference/metric]
+
+        10.21.33.33/32, ubest/mbest: 1/1
+            *via 10.36.3.3%default, [33/0], 5w0d, bgp-100, internal, tag 100 (mpls-vpn)
+            **via 10.36.3.3%default, [33/0], 5w0d, bgp-100, internal, tag 100 (mpls-vpn)
+        10.189.1.0/24, ubest/mbest: 1/0 time
+            *via 10.55.130.3%default, [33/0], 3d10h, bgp-1, internal, tag 1 (evpn), segid: 50051 tunnelid: 0x64008203 encap: VXLAN
+        10.229.11.11/32, ubest/mbest: 2/0, attached
+            *via 10.229.11.11, Lo1, [0/0], 5w4d, local
+            *via 10.229.11.11, Lo1, [0/0], 5w4d, direct
+        10.4.1.1/32, ubest/mbest: 1/0
+            via 10.2.4.2, Eth2/4, [110/81], 00:18:35, ospf-1, intra
+    '''}
+
+    json_output = {'execute.return_value': '''
+        {"TABLE_vrf": {"ROW_vrf": [
+          {"vrf-name-out": "default",
+           "TABLE_addrf": {"ROW_addrf": {"addrf": "ipv4",
+            "TABLE_prefix": {"ROW_prefix": [
+             {"ipprefix": "10.16.1.0/24", "ucast-nhops": "1", "mcast-nhops": "0",
+              "attached": "false",
+              "TABLE_path": {"ROW_path": {"ipnexthop": "10.1.1.2",
+               "ifname": "Eth1/1", "uptime": "15:57:39", "pref": "200",
+               "metric": "4444", "clientname": "bgp-333", "type": "internal",
+               "tag": "333", "ubest": "true", "mbest": "false"}}},
+             {"ipprefix": "10.106.0.5/8", "ucast-nhops": "1", "mcast-nhops": "0",
+              "attached": "false",
+              "TABLE_path": {"ROW_path": {"ifname": "Null0",
+               "uptime": "18:47:42", "pref": "1", "metric": "0",
+               "clientname": "static", "ubest": "true", "mbest": "false"}}}]}}}},
+          {"vrf-name-out": "VRF1",
+           "TABLE_addrf": {"ROW_addrf": {"addrf": "ipv4",
+            "TABLE_prefix": {"ROW_prefix": [
+             {"ipprefix": "10.21.33.33/32", "ucast-nhops": "1", "mcast-nhops": "1",
+              "attached": "false",
+              "TABLE_path": {"ROW_path": [
+               {"ipnexthop": "10.36.3.3", "nhvrf": "default", "uptime": "5w0d",
+                "pref": "33", "metric": "0", "clientname": "bgp-100",
+                "type": "internal", "tag": "100", "mpls-vpn": "true",
+                "ubest": "true", "mbest": "false"},
+               {"ipnexthop": "10.36.3.3", "nhvrf": "default", "uptime": "5w0d",
+                "pref": "33", "metric": "0", "clientname": "bgp-100",
+                "type": "internal", "tag": "100", "mpls-vpn": "true",
+                "ubest": "false", "mbest": "true"}]}},
+             {"ipprefix": "10.189.1.0/24", "ucast-nhops": "1", "mcast-nhops": "0",
+              "attached": "false",
+              "TABLE_path": {"ROW_path": {"ipnexthop": "10.55.130.3",
+               "nhvrf": "default", "uptime": "3d10h", "pref": "33", "metric": "0",
+               "clientname": "bgp-1", "type": "internal", "tag": "1",
+               "evpn": "true", "segid": "50051", "tunnelid": "0x64008203",
+               "encap": "VXLAN", "ubest": "true", "mbest": "false"}}},
+             {"ipprefix": "10.229.11.11/32", "ucast-nhops": "2", "mcast-nhops": "0",
+              "attached": "true",
+              "TABLE_path": {"ROW_path": [
+               {"ipnexthop": "10.229.11.11", "ifname": "Lo1", "uptime": "5w4d",
+                "pref": "0", "metric": "0", "clientname": "local",
+                "ubest": "true", "mbest": "false"},
+               {"ipnexthop": "10.229.11.11", "ifname": "Lo1", "uptime": "5w4d",
+                "pref": "0", "metric": "0", "clientname": "direct",
+                "ubest": "true", "mbest": "false"}]}},
+             {"ipprefix": "10.4.1.1/32", "ucast-nhops": "1", "mcast-nhops": "0",
+              "attached": "false",
+              "TABLE_path": {"ROW_path": {"ipnexthop": "10.2.4.2",
+               "ifname": "Eth2/4", "uptime": "00:18:35", "pref": "110",
+               "metric": "81", "clientname": "ospf-1", "type": "intra",
+               "ubest": "false", "mbest": "false"}}}]}}}}]}}
+    '''}
+
+    def test_golden(self):
+        self.maxDiff = None
+        self.device = Mock(**self.json_output)
+        obj = ShowRoutingVrfAll(device=self.device)
+        parsed_output = obj.parse_json(vrf='all')
+        self.device.execute.assert_called_once_with(
+            'show routing vrf all | json')
+        cli_output = self.cli_output['execute.return_value']
+        self.assertEqual(parsed_output, ShowRoutingVrfAll(
+            device=Mock()).parse(output=cli_output))
+
+    def test_ipv6(self):
+        self.device = Mock(**self.json_output)
+        obj = ShowRoutingIpv6VrfAll(device=self.device)
+        obj.parse_json(vrf='VRF1')
+        self.device.execute.assert_called_once_with(
+            'show routing ipv6 vrf VRF1 | json')
+
+    def test_fallback(self):
+        self.device = Mock(**self.cli_output)
+        obj = ShowRouting(device=self.device)
+        parsed_output = obj.parse_json()
+        self.assertIsNotNone(obj.json_error)
+        self.assertEqual([args[0][0] for args in
+                          self.device.execute.call_args_list],
+                         ['show routing | json', 'show routing'])
+        self.assertEqual(sorted(parsed_output['vrf']), ['VRF1', 'default'])
+
+
 # ===========================================
 #  Unit test for 'show routing ipv6  vrf all'
 # ===========================================
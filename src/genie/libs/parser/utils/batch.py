@@ -0,0 +1,262 @@
+'''Batch parsing of recorded outputs over a pool of processes
+
+Outputs collected from many devices and parsed offline keep one core busy
+when parsed in one process. BatchParser spreads (os, command, output)
+records over a process pool:
+
+    * each record is resolved to a parser with get_parser, then parsed from
+      its output, no device is connected to
+    * the workers are started once and warmed up: the parser index is
+      loaded and the parser modules of the warm commands are imported
+      before the first record arrives
+    * records are sent to the workers in chunks, to pickle fewer, larger
+      messages
+    * results come back in the order of the records, or as they are parsed
+
+    with BatchParser(processes=8, warm=[('iosxe', 'show version')]) as batch:
+        for result in batch.parse(records):
+            if result.error:
+                print(result.command, result.error)
+            else:
+                store(result.parsed)
+'''
+
+# python
+import queue
+import logging
+import itertools
+import collections
+import multiprocessing
+
+# Parser
+from genie.libs.parser.utils import common
+
+log = logging.getLogger(__name__)
+
+BatchResult = collections.namedtuple(
+    'BatchResult', ['index', 'os', 'command', 'parsed', 'error'])
+BatchResult.__doc__ = '''Outcome of one record, index being its position in
+the records. error is None, or 'ExceptionType: message' and parsed is
+None'''
+
+
+class OfflineDevice(object):
+    '''Device a recorded output comes from
+
+    Only carries what get_parser needs to resolve the parser, executing a
+    command raises: parsers sending more commands than the one recorded
+    cannot be parsed offline.
+    '''
+
+    def __init__(self, os, platform=None, model=None):
+        self.name = 'offline-{}'.format(os)
+        self.os = os
+        self.platform = platform
+        self.model = model
+
+    def execute(self, command, *args, **kwargs):
+        raise Exception("Cannot execute '{c}', parsing recorded output "
+                        "only".format(c=command))
+
+
+def error_text(e):
+    '''Text of an exception, 'ExceptionType: message'
+
+    Exceptions are not all picklable, results sent between processes keep
+    their text instead.
+    '''
+    return '{}: {}'.format(type(e).__name__, e)
+
+
+def parse_output(parser_cls, kwargs, output, os, platform=None, model=None):
+    '''Parse the output of a command with its parser, without a device
+
+    Module level to be sent to a process pool, the parser class is pickled
+    by reference.
+
+    Args:
+        parser_cls (`class`): parser of the command, as from get_parser
+        kwargs (`dict`): arguments of the command, as from get_parser
+        output (`str`): output of the command
+        os (`str`): os of the device the output comes from
+        platform (`str`): platform of the device
+        model (`str`): model of the device
+
+    Returns:
+        parsed output
+    '''
+    device = OfflineDevice(os, platform=platform, model=model)
+    return parser_cls(device=device).parse(output=output, **kwargs)
+
+
+def parse_record(os, command, output):
+    '''Parse the recorded output of a command
+
+    Args:
+        os (`str`): os of the device the output comes from
+        command (`str`): show command, as given to device.parse
+        output (`str`): output of the command
+
+    Returns:
+        parsed output
+
+    Raises:
+        Exception if no parser is found or the output cannot be parsed
+    '''
+    device = OfflineDevice(os)
+    parser_cls, kwargs = common.get_parser(command, device)
+    return parser_cls(device=device).parse(output=output, **kwargs)
+
+
+def _parse_indexed(record):
+    index, os, command, output = record
+    try:
+        parsed = parse_record(os, command, output)
+    except Exception as e:
+        return BatchResult(index, os, command, None, error_text(e))
+    return BatchResult(index, os, command, parsed, None)
+
+
+def _parse_chunk(chunk):
+    return [_parse_indexed(record) for record in chunk]
+
+
+def _warm(commands):
+    '''Pool initializer, import the parsers of commands'''
+    for os, command in commands:
+        try:
+            common.get_parser(command, OfflineDevice(os))
+        except Exception as e:
+            log.warning("Could not warm up '{c}' for {os}: {e}".format(
+                c=command, os=os, e=e))
+
+
+def _started(index):
+    return index
+
+
+class BatchParser(object):
+    '''Pool of processes parsing recorded outputs
+
+    Args:
+        processes (`int`): number of worker processes, number of cpus if
+                           None. 0 parses in the calling process, without
+                           a pool.
+        chunksize (`int`): number of records sent to a worker at once
+        warm (`list`): (os, command) whose parsers are imported when the
+                       workers start
+        backlog (`int`): chunks sent to the workers ahead of the results
+                         read, per process. Records are read from the
+                         iterable no faster.
+
+    example:
+        >>> with BatchParser(processes=4) as batch:
+        ...     results = list(batch.parse([('iosxe', 'show version',
+        ...                                  output)]))
+        >>> results[0].parsed['version']['os']
+        'IOS-XE'
+    '''
+
+    def __init__(self, processes=None, chunksize=16, warm=(), backlog=4):
+        self.chunksize = chunksize
+        self.warm = list(warm)
+        if processes == 0:
+            self.processes = 0
+            self._pool = None
+            _warm(self.warm)
+            return
+
+        self.processes = processes or multiprocessing.cpu_count()
+        self.backlog = backlog * self.processes
+        self._pool = multiprocessing.Pool(self.processes, initializer=_warm,
+                                          initargs=(self.warm,))
+        # Workers are warmed up before taking a task, wait for them
+        self._pool.map(_started, range(self.processes), chunksize=1)
+
+    def _chunks(self, records):
+        indexed = ((index, os, command, output) for index, (os, command,
+                   output) in zip(itertools.count(), records))
+        return iter(lambda: list(itertools.islice(indexed, self.chunksize)),
+                    [])
+
+    def parse(self, records, ordered=True):
+        '''Parse records, yielding a BatchResult for each
+
+        Args:
+            records (`iterable`): (os, command, output) records, read as
+                                  the workers need them
+            ordered (`bool`): yield the results in the order of the
+                              records if True, else as soon as they are
+                              parsed
+
+        Returns:
+            generator of BatchResult
+        '''
+        if self._pool is None:
+            for chunk in self._chunks(records):
+                yield from _parse_chunk(chunk)
+        elif ordered:
+            yield from self._parse_ordered(records)
+        else:
+            yield from self._parse_unordered(records)
+
+    def _parse_ordered(self, records):
+        pending = collections.deque()
+        for chunk in self._chunks(records):
+            pending.append(self._pool.apply_async(_parse_chunk, (chunk,)))
+            if len(pending) >= self.backlog:
+                yield from pending.popleft().get()
+        while pending:
+            yield from pending.popleft().get()
+
+    def _parse_unordered(self, records):
+        done = queue.Queue()
+        pending = 0
+        for chunk in self._chunks(records):
+            self._pool.apply_async(_parse_chunk, (chunk,),
+                                   callback=done.put,
+                                   error_callback=done.put)
+            pending += 1
+            if pending >= self.backlog:
+                yield from self._get(done)
+                pending -= 1
+        while pending:
+            yield from self._get(done)
+            pending -= 1
+
+    def _get(self, done):
+        results = done.get()
+        if isinstance(results, BaseException):
+            # The worker died or its results could not be pickled
+            raise results
+        return results
+
+    def close(self):
+        '''Stop the workers, once the records given are parsed'''
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def parse_batch(records, processes=None, chunksize=16, ordered=True):
+    '''Parse (os, command, output) records over a pool of processes
+
+    Args:
+        records (`iterable`): (os, command, output) records
+        processes (`int`): number of worker processes, see BatchParser
+        chunksize (`int`): number of records sent to a worker at once
+        ordered (`bool`): results in the order of the records, else as
+                          they are parsed
+
+    Returns:
+        list of BatchResult
+    '''
+    with BatchParser(processes=processes, chunksize=chunksize) as batch:
+        return list(batch.parse(records, ordered=ordered))
@@ -0,0 +1,316 @@
+'''Parsing of outputs made of independent blocks
+
+show interfaces prints one block per interface, show isis database detail
+one block per LSP, show ip ospf database router one block per LSA. Parsed
+line by line, a large output keeps one core busy for seconds.
+
+BlockParser cuts the output at the first line of each block, parses the
+blocks on their own, serially or in a pool of threads or processes, and
+merges the parsed blocks:
+
+    parsed = ShowInterfaces(device=device).parse_blocks(executor='process')
+
+Lines giving the context of the blocks that follow, such as the area of
+OSPF LSAs or the level of IS-IS LSPs, are repeated at the top of each
+block. A block which cannot be parsed is left out of the parsed output, its
+error is kept in block_errors, the other blocks are parsed.
+'''
+
+# python
+import os
+import re
+import logging
+import collections
+import concurrent.futures
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# Parser utils
+from genie.libs.parser.utils.capture import CaptureDevice, Captured
+from genie.libs.parser.utils.schema_compiler import compile_schema
+
+log = logging.getLogger(__name__)
+
+BlockError = collections.namedtuple('BlockError', ['index', 'header',
+                                                   'error'])
+BlockError.__doc__ = '''Block which could not be parsed, index being its
+position in the output, header its first line'''
+
+
+def merge_parsed(parsed, other):
+    '''Merge the parsed output other into parsed, recursively
+
+    Dicts are merged, any other value of other replaces the value of parsed.
+
+    Returns:
+        parsed
+    '''
+    for key, value in other.items():
+        if isinstance(value, dict) and isinstance(parsed.get(key), dict):
+            merge_parsed(parsed[key], value)
+        else:
+            parsed[key] = value
+    return parsed
+
+
+def parser_regexes(parser, regexes):
+    '''Compiled regexes of a block_header or block_context entry
+
+    Args:
+        parser (`MetaParser`): parser the regexes belong to
+        regexes: one regex or a sequence of them, each compiled or the
+                 name of the parser attribute holding it, None for none
+
+    Returns:
+        `tuple` of compiled regexes
+    '''
+    if regexes is None:
+        return ()
+    if not isinstance(regexes, (list, tuple)):
+        regexes = (regexes,)
+    return tuple(getattr(parser, regex) if isinstance(regex, str) else regex
+                 for regex in regexes)
+
+
+# (?P<name>, the groups of the regexes of a parser reuse the same names
+_NAMED_GROUP = re.compile(r'\(\?P<\w+>')
+
+
+def unnamed_pattern(regex):
+    '''Pattern of a compiled regex with its named groups made plain
+
+    The regexes of a parser reuse the same group names, their patterns can
+    only be joined in one alternation without them.
+
+    Args:
+        regex (`re.Pattern`): compiled regex
+
+    Returns:
+        `str` pattern
+    '''
+    return _NAMED_GROUP.sub('(', regex.pattern)
+
+
+def _matcher(regexes):
+    # match() of any of regexes, one regex of their alternation when they
+    # can be combined
+    if not regexes:
+        return lambda line: None
+    if len(regexes) == 1:
+        return regexes[0].match
+    flags = set(regex.flags for regex in regexes)
+    if len(flags) == 1 and not any('(?P=' in regex.pattern
+                                   for regex in regexes):
+        try:
+            return re.compile('|'.join(
+                '(?:{})'.format(unnamed_pattern(regex))
+                for regex in regexes), flags.pop()).match
+        except re.error:
+            pass
+    return lambda line: any(regex.match(line) for regex in regexes)
+
+
+def _parse_block(parser_class, block, kwargs):
+    # Parse a block in a worker process, errors are returned as they may not
+    # be raised across processes
+    try:
+        return parser_class(device=None).parse_block(block, **kwargs), None
+    except Exception as e:
+        return None, '{}: {}'.format(type(e).__name__, e)
+
+
+class BlockParser(object):
+    '''Parser mixin parsing the blocks of an output independently
+
+    Parsers set block_header, the regex (or regexes) of the first line of a
+    block, and block_context, the regexes of the lines heading the blocks
+    that follow, outermost first. Regexes are given as compiled regexes or
+    as the names of the regex attributes of the parser, LazyRegex included.
+    Lines are matched stripped.
+
+    Each block is parsed by parse_block(), cli() of the block by default,
+    and the parsed blocks are merged by merge_blocks(). Parsers whose
+    blocks depend on each other override them.
+
+    example:
+        >>> parser = ShowInterfaces(device=device)
+        >>> parsed = parser.parse_blocks(executor='thread', workers=4)
+        >>> parser.block_errors
+        [BlockError(index=12, header='Tunnel5 is up, line protocol is up',
+                    error=KeyError('counters'))]
+    '''
+
+    # Regex of the first line of a block, or a tuple of them
+    block_header = None
+
+    # Regexes of the context lines, one entry per level, outermost first. A
+    # context line ends the current block and the context of lower levels.
+    block_context = ()
+
+    def split_blocks(self, output):
+        '''Cut output into blocks, each starting with the context lines in
+        effect
+
+        A header line starts a new block once the current block has a line
+        other than headers: consecutive headers belong to the same block.
+
+        Returns:
+            list of `str`
+        '''
+        header_match = _matcher(parser_regexes(self, self.block_header))
+        context_matches = [_matcher(parser_regexes(self, level))
+                           for level in self.block_context]
+        context = [None] * len(context_matches)
+        # Level of the last context line, while it heads no block
+        unused = None
+        blocks = []
+        block = None
+        header_seen = body = False
+
+        for line in output.splitlines():
+            stripped = line.strip()
+            for level, context_match in enumerate(context_matches):
+                if context_match(stripped):
+                    if block is not None:
+                        blocks.append(block)
+                    elif unused is not None and level <= unused:
+                        # Context with no blocks, such as an empty area
+                        blocks.append([line for line in context if line])
+                    block = None
+                    context[level:] = [line] + [None] * (len(context) -
+                                                         level - 1)
+                    unused = level
+                    break
+            else:
+                if block is None and not stripped:
+                    continue
+                header = header_match(stripped)
+                if block is None or (header and header_seen and body):
+                    if block is not None:
+                        blocks.append(block)
+                    block = [line for line in context if line]
+                    unused = None
+                    header_seen = body = False
+                block.append(line)
+                if header:
+                    header_seen = True
+                elif header_seen:
+                    body = True
+
+        if block is not None:
+            blocks.append(block)
+        elif unused is not None:
+            blocks.append([line for line in context if line])
+        return ['\n'.join(block) for block in blocks]
+
+    def parse_block(self, block, **kwargs):
+        '''Parse one block, with the arguments of cli()'''
+        return self.cli(output=block, **kwargs)
+
+    def merge_blocks(self, parsed_blocks):
+        '''Merge the parsed blocks, in the order of the output'''
+        parsed = {}
+        for parsed_block in parsed_blocks:
+            merge_parsed(parsed, parsed_block)
+        return parsed
+
+    def parse_blocks(self, output=None, executor='serial', workers=None,
+                     **kwargs):
+        '''Parse the output block by block
+
+        Args:
+            output (`str`): output to parse, executed on the device if None
+            executor: 'serial', 'thread', 'process', or a
+                      concurrent.futures.Executor to parse the blocks with
+            workers (`int`): size of the thread or process pool
+            kwargs: arguments of cli()
+
+        Returns:
+            parsed output, validated against the schema of the parser
+
+        Raises:
+            the error of the first block if no block could be parsed,
+            SchemaEmptyParserError if the output has no blocks
+        '''
+        if output is None:
+            output, parsed = self._capture_output(**kwargs)
+            if output is None:
+                # No command executed, nothing to cut into blocks
+                return parsed
+
+        blocks = self.split_blocks(output)
+        results = self._parse_blocks(blocks, executor, workers, kwargs)
+
+        header_match = _matcher(parser_regexes(self, self.block_header))
+        parsed_blocks = []
+        self.block_errors = []
+        for index, (block, (parsed_block, error)) in enumerate(
+                zip(blocks, results)):
+            if error is None:
+                parsed_blocks.append(parsed_block)
+                continue
+            header = next((line.strip() for line in block.splitlines()
+                           if header_match(line.strip())),
+                          block.split('\n', 1)[0])
+            log.warning('{p}: block {i} ({h}) could not be parsed: '
+                        '{e}'.format(p=type(self).__name__, i=index,
+                                     h=header, e=error))
+            self.block_errors.append(BlockError(index, header, error))
+
+        if self.block_errors and not parsed_blocks:
+            error = self.block_errors[0].error
+            raise error if isinstance(error, Exception) else \
+                Exception(error)
+        parsed = self.merge_blocks(parsed_blocks)
+        if not parsed:
+            raise SchemaEmptyParserError(parsed)
+        schema = getattr(self, 'schema', None)
+        if schema:
+            compile_schema(schema).validate(parsed)
+        return parsed
+
+    def _capture_output(self, **kwargs):
+        # Output of the command cli() executes first
+        device = self.device
+        capture = self.device = CaptureDevice(device)
+        try:
+            parsed = self.cli(**kwargs)
+        except Captured as e:
+            if e.capture is not capture:
+                raise
+            return capture.output, None
+        finally:
+            self.device = device
+        return None, parsed
+
+    def _parse_one(self, block, kwargs):
+        try:
+            return self.parse_block(block, **kwargs), None
+        except Exception as e:
+            return None, e
+
+    def _parse_blocks(self, blocks, executor, workers, kwargs):
+        # (parsed block, error) of each block
+        if executor == 'serial':
+            return [self._parse_one(block, kwargs) for block in blocks]
+        if executor == 'thread':
+            with concurrent.futures.ThreadPoolExecutor(workers) as pool:
+                return self._parse_blocks(blocks, pool, workers, kwargs)
+        if executor == 'process':
+            with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+                return self._parse_blocks(blocks, pool, workers, kwargs)
+        if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+            # Blocks are sent in chunks, one message per block costs more
+            # than parsing it
+            chunksize = max(1, len(blocks) //
+                            (4 * (workers or os.cpu_count() or 1)))
+            return list(executor.map(_parse_block,
+                                     [type(self)] * len(blocks), blocks,
+                                     [kwargs] * len(blocks),
+                                     chunksize=chunksize))
+        if isinstance(executor, concurrent.futures.Executor):
+            return list(executor.map(lambda block: self._parse_one(block,
+                                                                   kwargs),
+                                     blocks))
+        raise ValueError("executor must be 'serial', 'thread', 'process' or "
+                         "an Executor, not {!r}".format(executor))
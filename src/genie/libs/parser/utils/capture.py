@@ -0,0 +1,66 @@
+'''Output of the command a parser executes first
+
+ParseCache keys a parsed output on the output of its command, and
+BlockParser splits that output in blocks before parsing them: both need the
+output before cli() parses it. CaptureDevice stands for the device of the
+parser, executes the first command cli() sends and stops cli() there by
+raising Captured:
+
+    capture = parser.device = CaptureDevice(device)
+    try:
+        parser.cli()
+    except Captured as e:
+        if e.capture is not capture:
+            raise    # captured by an enclosing parse
+        output = capture.output
+    finally:
+        parser.device = device
+
+In replay mode, the same command returns the captured output instead, for
+cli() to parse it without executing it again.
+'''
+
+
+class Captured(BaseException):
+    '''Raised by CaptureDevice.execute once it captured the output
+
+    Not an Exception, for the parsers catching errors of execute().
+    '''
+
+    def __init__(self, capture):
+        super().__init__(capture.command)
+        self.capture = capture
+
+
+class CaptureDevice(object):
+    '''Device executing the first command of a parser only once
+
+    In capture mode, the first command is executed on the device and cli()
+    is stopped. In replay mode, that command returns the captured output
+    and any other command goes to the device, making the parse uncacheable.
+
+    Args:
+        device (`Device`): device of the parser, given the other attributes
+        replay (`bool`): start in replay mode, with no output captured
+    '''
+
+    def __init__(self, device, replay=False):
+        self.device = device
+        self.command = None
+        self.output = None
+        self.replay = replay
+        self.cacheable = True
+
+    def execute(self, command, *args, **kwargs):
+        if not self.replay:
+            self.command = command
+            self.output = self.device.execute(command, *args, **kwargs)
+            raise Captured(self)
+        if command == self.command and self.output is not None:
+            output, self.output = self.output, None
+            return output
+        self.cacheable = False
+        return self.device.execute(command, *args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.device, name)
@@ -0,0 +1,190 @@
+'''Token trie used to resolve show commands to their parsers.json entry
+
+The templated commands of parsers.json (``show bgp vrf {vrf} {route}``) are
+split on spaces and inserted once into a trie. Literal words become literal
+edges and ``{placeholders}`` become typed wildcard edges:
+
+    * single word wildcards, for the arguments which can never contain a
+      space (vrf, rd, instance, ...)
+    * multi word wildcards, for every other argument, which consume one or
+      more words of the command
+
+Resolving a command is then a walk of the trie driven by the words of the
+command, instead of a regex match against every templated command.
+'''
+
+# python
+import re
+
+# Arguments which are matched with '\S+' instead of '.*'
+SINGLE_WORD_ARGS = ('vrf', 'rd', 'instance', 'vrf_type', 'feature')
+
+# Commands which contain any of those characters outside of a placeholder
+# are matched with their regex instead of the trie
+_REGEX_CHARS = re.compile(r'[.$*+?()\[\]\\{}]')
+_PLACEHOLDER = re.compile(r'^\{(?P<name>\w+)\}$')
+
+
+def command_regex(command):
+    '''Build the regex which matches a templated command
+
+        Args:
+            command (`str`): Templated command, ex: 'show bgp vrf {vrf}'
+
+        Returns:
+            Compiled regex with one named group per placeholder
+
+        example:
+
+            >>> command_regex('show ip route vrf {vrf}')
+    '''
+    patterns = re.findall('{.*?}', command)
+    reg = command
+    for pattern in patterns:
+        word = pattern.replace('{', '').replace('}', '')
+        new_pattern = r'(?P<{p}>\\S+)'.format(p=word) \
+            if word in SINGLE_WORD_ARGS \
+            else '(?P<{p}>.*)'.format(p=word)
+        reg = re.sub(pattern, new_pattern, reg)
+    reg += '$'
+    # Convert | to \|, and ^ to \^
+    reg = reg.replace('|', r'\|').replace('^', r'\^')
+    return re.compile(reg)
+
+
+def literal_words(command):
+    '''Number of distinct literal words of a templated command; the more
+    literal words, the more specific the command'''
+    patterns = re.findall('{.*?}', command)
+    return len(set(command.split()) - set(patterns))
+
+
+class _Node(object):
+    '''One node of the trie'''
+
+    __slots__ = ('literals', 'single', 'multi', 'commands')
+
+    def __init__(self):
+        # word -> _Node
+        self.literals = {}
+        # argument name -> _Node
+        self.single = {}
+        self.multi = {}
+        # templated commands ending on this node
+        self.commands = []
+
+
+class CommandTrie(object):
+    '''Index of templated commands, built once, to resolve a show command to
+    the templated command it matches and the kwargs to pass to the parser.
+
+        Args:
+            commands (`iterable`): Templated commands to index. Commands
+                                   without '{' are ignored as they are found
+                                   with a dict lookup.
+
+        example:
+
+            >>> trie = CommandTrie(['show bgp vrf {vrf}',
+                                    'show bgp {address_family} vrf {vrf}'])
+            >>> trie.search('show bgp ipv4 unicast vrf VRF1')
+            [('show bgp {address_family} vrf {vrf}',
+              {'address_family': 'ipv4 unicast', 'vrf': 'VRF1'})]
+    '''
+
+    def __init__(self, commands=()):
+        self._root = _Node()
+        # command -> (insertion order, number of literal words)
+        self._rank = {}
+        # commands which can't be tokenized, matched with their regex
+        self._fallback = []
+        for command in commands:
+            self.add(command)
+
+    def __len__(self):
+        return len(self._rank)
+
+    def __contains__(self, command):
+        return command in self._rank
+
+    def add(self, command):
+        '''Add one templated command to the trie'''
+        if '{' not in command or command in self._rank:
+            return
+
+        words = literal_words(command)
+        if not words:
+            # Never selected by the regex lookup either
+            return
+        self._rank[command] = (len(self._rank), words)
+
+        edges = []
+        for token in command.split(' '):
+            m = _PLACEHOLDER.match(token)
+            if m:
+                name = m.groupdict()['name']
+                kind = 'single' if name in SINGLE_WORD_ARGS else 'multi'
+                edges.append((kind, name))
+            elif _REGEX_CHARS.search(token):
+                # Placeholder within a word, or regex characters which
+                # changes the meaning of the word
+                self._fallback.append((command, command_regex(command)))
+                return
+            else:
+                edges.append(('literal', token))
+
+        node = self._root
+        for kind, value in edges:
+            children = getattr(node, 'literals' if kind == 'literal' else kind)
+            node = children.setdefault(value, _Node())
+        node.commands.append(command)
+
+    def search(self, command):
+        '''Find all templated commands matching a command
+
+            Args:
+                command (`str`): Show command, ex: 'show bgp vrf VRF1'
+
+            Returns:
+                list of (templated command, kwargs) tuples, the most
+                specific command (most literal words) first. Commands with
+                the same number of literal words keep their insertion order.
+        '''
+        found = {}
+        self._walk(self._root, command.split(' '), 0, {}, found)
+
+        for key, reg in self._fallback:
+            if key not in found:
+                m = reg.match(command)
+                if m:
+                    found[key] = m.groupdict()
+
+        rank = self._rank
+        return sorted(found.items(),
+                      key=lambda item: (-rank[item[0]][1], rank[item[0]][0]))
+
+    def _walk(self, node, tokens, index, kwargs, found):
+        if index == len(tokens):
+            for key in node.commands:
+                # First match is the greedy one, same as the regex
+                if key not in found:
+                    found[key] = dict(kwargs)
+            return
+
+        token = tokens[index]
+        child = node.literals.get(token)
+        if child is not None:
+            self._walk(child, tokens, index + 1, kwargs, found)
+
+        if token:
+            for name, child in node.single.items():
+                kwargs[name] = token
+                self._walk(child, tokens, index + 1, kwargs, found)
+                del kwargs[name]
+
+        # Multi words arguments are greedy, try the longest value first
+        for name, child in node.multi.items():
+            for end in range(len(tokens), index, -1):
+                kwargs[name] = ' '.join(tokens[index:end])
+                self._walk(child, tokens, end, kwargs, found)
+                del kwargs[name]
@@ -7,10 +7,13 @@ import json
 import sys
 import warnings
 import logging
+import functools
 import importlib
-from genie.libs import parser
 from genie.abstract import Lookup
 
+from genie.libs.parser.utils.command_trie import CommandTrie
+from genie.libs.parser.utils.parser_index import ParserIndex
+
 log = logging.getLogger(__name__)
 
 
@@ -32,8 +35,29 @@ def _load_parser_json():
             parser_data = json.load(f)
     return parser_data
 
-# Parser within Genie
-parser_data = _load_parser_json()
+def _load_parser_index():
+    '''get the compact index of parsers.json, opened on first use'''
+    try:
+        mod = importlib.import_module('genie.libs.parser')
+        path = mod.__path__[0]
+    except Exception:
+        path = ''
+    return ParserIndex(os.path.join(path, 'parsers.idx'),
+                       os.path.join(path, 'parsers.json'))
+
+# Parser within Genie; only the package, module_name and class of each
+# parser, see get_parser_details for the doc and schema
+parser_data = _load_parser_index()
+
+_parser_details = None
+
+def get_parser_details():
+    '''get all parser data, including doc, schema and url, loaded from
+       parsers.json on first call'''
+    global _parser_details
+    if _parser_details is None:
+        _parser_details = _load_parser_json()
+    return _parser_details
 
 def get_parser_commands(device, data=parser_data):
     '''Remove all commands which contain { as this requires
@@ -68,16 +92,97 @@ def get_parser_exclude(command, device):
     except AttributeError:
         return []
 
+class LookupCache(object):
+    '''Cache of what Lookup.from_device resolves for get_parser
+
+    Lookup.from_device derives the token chain of a device (os, platform,
+    model) and walks the abstracted package to find a parser class. Both
+    only depend on the device type, so they are kept per
+    (os, platform, model, package) and re-used for every device of that
+    type.
+
+        example:
+
+            >>> lookup_cache.tokens(device)
+            ['iosxe', 'cat3k']
+            >>> lookup_cache.stats
+            {'token_hits': 4, 'token_misses': 1, 'class_hits': 4, 'class_misses': 1}
+            >>> lookup_cache.clear()
+    '''
+
+    # Device attributes the abstraction tokens are derived from
+    attributes = ('os', 'platform', 'model')
+
+    def __init__(self):
+        # (device type, package) -> token chain
+        self._tokens = {}
+        # (device type, package, module_name, class) -> parser class
+        self._classes = {}
+        self.stats = dict.fromkeys(['token_hits', 'token_misses',
+                                    'class_hits', 'class_misses'], 0)
+
+    def _device_type(self, device):
+        return tuple(getattr(device, attr, None) for attr in self.attributes)
+
+    def tokens(self, device, package='genie.libs.parser'):
+        '''Token chain of a device, as found by Lookup.from_device'''
+        key = (self._device_type(device), package)
+        try:
+            tokens = self._tokens[key]
+        except KeyError:
+            self.stats['token_misses'] += 1
+            lookup = Lookup.from_device(
+                device, packages={'parser': importlib.import_module(package)})
+            tokens = self._tokens[key] = list(lookup._tokens)
+        else:
+            self.stats['token_hits'] += 1
+        return tokens
+
+    def parser_cls(self, device, data):
+        '''Parser class of a parsers.json entry for a device'''
+        key = (self._device_type(device), data['package'],
+               data['module_name'], data['class'])
+        try:
+            cls = self._classes[key]
+        except KeyError:
+            self.stats['class_misses'] += 1
+            lookup = Lookup.from_device(device, packages={
+                'parser': importlib.import_module(data['package'])})
+            cls = getattr(getattr(lookup.parser, data['module_name']),
+                          data['class'])
+            self._classes[key] = cls
+        else:
+            self.stats['class_hits'] += 1
+        return cls
+
+    def clear(self, os=None):
+        '''Invalidate the cache, for all device types or only those of
+           one os'''
+        if os is None:
+            self._tokens.clear()
+            self._classes.clear()
+            return
+        for cache in (self._tokens, self._classes):
+            for key in [key for key in cache if key[0][0] == os]:
+                del cache[key]
+
+    def reset_stats(self):
+        for key in self.stats:
+            self.stats[key] = 0
+
+# Resolved tokens and parser classes, per device type
+lookup_cache = LookupCache()
+
 def get_parser(command, device):
     '''From a show command and device, return parser class and kwargs if any'''
 
     kwargs = {}
     if command in parser_data:
         # Then just return it
-        lookup = Lookup.from_device(device, packages={'parser': parser})
+        tokens = lookup_cache.tokens(device)
         # Check if all the tokens exists; take the farthest one
         data = parser_data[command]
-        for token in lookup._tokens:
+        for token in tokens:
             if token in data:
                 data = data[token]
         try:
@@ -87,7 +192,7 @@ def get_parser(command, device):
             # the child level tokens
             raise Exception("Could not find parser for "
                             "'{c}' under {l}".format(
-                                c=command, l=lookup._tokens)) from None
+                                c=command, l=tokens)) from None
     else:
         # Regex world!
         try:
@@ -99,59 +204,90 @@ def get_parser(command, device):
 
         return _find_parser_cls(device, found_data), kwargs
 
+def _get_command_trie(data):
+    '''Return the command trie of the templated commands of data,
+    built on first use'''
+    try:
+        cached_data, trie = _command_tries[id(data)]
+        if cached_data is data:
+            return trie
+    except KeyError:
+        pass
+    trie = CommandTrie(data)
+    _command_tries[id(data)] = (data, trie)
+    return trie
+
+# id(parser data) -> (parser data, CommandTrie)
+_command_tries = {}
+
 def _find_command(command, data, device):
-    ratio = 0
-    max_lenght = 0
-    matches = None
-    for key in data:
-        if not '{' in key:
-            # Disregard the non regex ones
+    # Candidates are sorted with the most literal words first
+    for key, kwargs in _get_command_trie(data).search(command):
+        if device.os not in data[key].keys():
             continue
+        # Found a match!
+        # Check if all the tokens exists; take the farthest one
+        ret_data = data[key]
+        for token in lookup_cache.tokens(device):
+            if token in ret_data:
+                ret_data = ret_data[token]
+        return ret_data, kwargs
 
-        # Okay... this is not optimal
-        patterns = re.findall('{.*?}', key)
-        len_normal_words = len(set(key.split()) - set(patterns))
-        reg = key
-
-        for pattern in patterns:
-            word = pattern.replace('{', '').replace('}', '')
-            new_pattern = r'(?P<{p}>\\S+)'.format(p=word) \
-                if word == 'vrf' \
-                   or word == 'rd' \
-                   or word == 'instance' \
-                   or word == 'vrf_type' \
-                   or word == 'feature' \
-                else '(?P<{p}>.*)'.format(p=word)
-            reg = re.sub(pattern, new_pattern, reg)
-        reg += '$'
-        # Convert | to \|, and ^ to \^
-        reg = reg.replace('|', '\|').replace('^', '\^')
-
-        match = re.match(reg, command)
-        if match:
-            if device.os not in data[key].keys():
-                continue
-            # Found a match!
-            lookup = Lookup.from_device(device, packages={'parser':parser})
-            # Check if all the tokens exists; take the farthest one
-            ret_data = data[key]
-            for token in lookup._tokens:
-                if token in ret_data:
-                    ret_data = ret_data[token]
-
-            if len_normal_words > max_lenght:
-                max_lenght = len_normal_words
-                matches = (ret_data, match.groupdict())
-
-    if matches:
-        return matches
     raise SyntaxError('Could not find a parser match')
 
 
 def _find_parser_cls(device, data):
-    lookup = Lookup.from_device(device, packages={'parser':importlib.import_module(data['package'])})
-
-    return getattr(getattr(lookup.parser, data['module_name']), data['class'])
+    return lookup_cache.parser_cls(device, data)
+
+
+# Short interface types and their full names. Please add more when face
+# other type of interface
+intf_types = {'Eth': 'Ethernet',
+              'Lo': 'Loopback',
+              'Fa': 'FastEthernet',
+              'Fas': 'FastEthernet',
+              'Po': 'Port-channel',
+              'PO': 'Port-channel',
+              'Null': 'Null',
+              'Gi': 'GigabitEthernet',
+              'Gig': 'GigabitEthernet',
+              'GE': 'GigabitEthernet',
+              'Te': 'TenGigabitEthernet',
+              'mgmt': 'mgmt',
+              'Vl': 'Vlan',
+              'Tu': 'Tunnel',
+              'Fe': '',
+              'Hs': 'HSSI',
+              'AT': 'ATM',
+              'Et': 'Ethernet',
+              'BD': 'BDI',
+              'Se': 'Serial',
+              'Fo': 'FortyGigabitEthernet',
+              'Hu': 'HundredGigE',
+              'vl': 'vasileft',
+              'vr': 'vasiright',
+              'BE': 'Bundle-Ether'
+              }
+
+# First run of letters, the type, and of digits, slashes and dots, the port
+_intf_type = re.compile(r'[a-zA-Z]+')
+_intf_port = re.compile(r'[\d\/\.]+')
+
+
+# Parsers convert the same few names over and over, once per line of big
+# tables, the last ones are kept
+@functools.lru_cache(maxsize=8192)
+def _convert_intf_name(intf):
+    m = _intf_type.search(intf)
+    m1 = _intf_port.search(intf)
+    if m and m1:
+        int_type = m.group(0)
+        if int_type in intf_types:
+            return intf_types[int_type] + m1.group(0)
+        # Unifying interface names
+        return intf[0].capitalize() + intf[1:].replace(
+            ' ', '').replace('ethernet', 'Ethernet')
+    return intf
 
 
 class Common():
@@ -185,47 +321,33 @@ class Common():
                 >>> convert_intf_name(intf='Eth2/1')
         '''
 
-        # Please add more when face other type of interface
-        convert = {'Eth': 'Ethernet',
-                   'Lo': 'Loopback',
-                   'Fa': 'FastEthernet',
-                   'Fas': 'FastEthernet',
-                   'Po': 'Port-channel',
-                   'PO': 'Port-channel',
-                   'Null': 'Null',
-                   'Gi': 'GigabitEthernet',
-                   'Gig': 'GigabitEthernet',
-                   'GE': 'GigabitEthernet',
-                   'Te': 'TenGigabitEthernet',
-                   'mgmt': 'mgmt',
-                   'Vl': 'Vlan',
-                   'Tu': 'Tunnel',
-                   'Fe': '',
-                   'Hs': 'HSSI',
-                   'AT': 'ATM',
-                   'Et': 'Ethernet',
-                   'BD': 'BDI',
-                   'Se': 'Serial',
-                   'Fo': 'FortyGigabitEthernet',
-                   'Hu': 'HundredGigE',
-                   'vl': 'vasileft',
-                   'vr': 'vasiright',
-                   'BE': 'Bundle-Ether'
-                   }
-        m = re.search('([a-zA-Z]+)', intf) 
-        m1 = re.search('([\d\/\.]+)', intf)
-        if hasattr(m, 'group') and hasattr(m1, 'group'):
-            int_type = m.group(0)
-            int_port = m1.group(0)
-            if int_type in convert.keys():
-                return(convert[int_type] + int_port)
-            else:
-                # Unifying interface names
-                converted_intf = intf[0].capitalize()+intf[1:].replace(
-                    ' ','').replace('ethernet', 'Ethernet')
-                return(converted_intf)
-        else:
-            return(intf)
+        return _convert_intf_name(intf)
+
+    @classmethod
+    def convert_intf_names(self, intfs):
+        '''return the full interface names of a column of names
+
+            Each distinct name is converted once, without going through
+            the memo of convert_intf_name.
+
+            Args:
+                intfs (`list`): Short versions of the interface names
+
+            Returns:
+                list of the full interface names, in the order of intfs
+
+            Raises:
+                None
+
+            example:
+
+                >>> convert_intf_names(intfs=['Gi1', 'Gi2', 'Gi1'])
+                >>> ['GigabitEthernet1', 'GigabitEthernet2', 'GigabitEthernet1']
+        '''
+        intfs = list(intfs)
+        convert = _convert_intf_name.__wrapped__
+        converted = {intf: convert(intf) for intf in set(intfs)}
+        return list(map(converted.__getitem__, intfs))
 
 
     @classmethod
@@ -0,0 +1,383 @@
+'''Deltas and rates of the interface counters of successive polls
+
+show interfaces parsers (iosxe ShowInterfaces, nxos ShowInterface, iosxr
+ShowInterfacesDetail) return the absolute counters of each interface:
+
+    {'GigabitEthernet1': {'counters': {'in_octets': 480051,
+                                       'in_crc_errors': 0,
+                                       'last_clear': 'never',
+                                       'rate': {...}, ...}, ...}}
+
+CounterTracker ingests the parsed outputs of successive polls of a fleet of
+devices and keeps the counters in one array per counter, one row per
+interface, with the delta and rate of the last poll:
+
+    tracker = CounterTracker()
+    tracker.update('R1', ShowInterfaces(device=r1).parse())
+    ...
+    tracker.update('R1', ShowInterfaces(device=r1).parse())
+    tracker.rate('R1', 'GigabitEthernet1')['in_octets']
+    tracker.top('in_crc_errors', n=5)
+    [('R7', 'GigabitEthernet3', 12.5), ...]
+
+The counters of an interface were cleared since the previous poll when the
+elapsed time of last_clear grew less than the time between the polls, with
+the resolution of last_clear ('1d02h' is to the hour) and a slack for the
+latency of the polls. A counter lower than at the previous poll, the
+counters not cleared, wrapped around its 32 or 64 bits, counted
+up to the wrap. A decrease which is not a plausible wrap is taken as a
+reset of the counter, such as a reload of the device: the delta is the
+value of the counter.
+'''
+
+# python
+import re
+import time
+import heapq
+import operator
+import collections
+from array import array
+
+_nan = float('nan')
+
+CounterEvent = collections.namedtuple('CounterEvent', ['device', 'interface',
+                                                       'counter', 'kind'])
+CounterEvent.__doc__ = '''Counter which went down between two polls, kind
+being 'wrap' or 'reset', or interface whose counters were cleared, kind
+being 'clear' and counter None'''
+
+# 1y2w, 2w3d, 1d02h, 20:01:24
+_DURATION = re.compile(r'^((?P<years>\d+)y)?((?P<weeks>\d+)w)?'
+                       r'((?P<days>\d+)d)?((?P<hours>\d+)h)?$')
+_CLOCK = re.compile(r'^(?P<hours>\d+):(?P<minutes>\d+):(?P<seconds>\d+)$')
+_SECONDS = {'years': 365 * 86400, 'weeks': 7 * 86400, 'days': 86400,
+            'hours': 3600, 'minutes': 60, 'seconds': 1}
+
+
+def last_clear_seconds(last_clear):
+    '''Seconds elapsed since the counters were cleared
+
+    Args:
+        last_clear (`str`): last clearing of the counters as parsed,
+                            '1d02h', '20:01:24' or 'never'
+
+    Returns:
+        `float` seconds, inf for 'never', None if not understood
+    '''
+    return _last_clear(last_clear)[0]
+
+
+def _last_clear(last_clear):
+    # (seconds, resolution in seconds) of last_clear, (None, None) if not
+    # understood
+    if last_clear is None:
+        return None, None
+    last_clear = last_clear.strip()
+    if last_clear == 'never':
+        return float('inf'), 0.0
+    m = last_clear and (_CLOCK.match(last_clear) or
+                        _DURATION.match(last_clear))
+    if not m:
+        return None, None
+    units = [(unit, value) for unit, value in m.groupdict().items() if value]
+    if not units:
+        return None, None
+    return (float(sum(int(value) * _SECONDS[unit] for unit, value in units)),
+            float(min(_SECONDS[unit] for unit, _ in units)))
+
+
+class _Column(object):
+    # Last value, delta and rate of one counter, one entry per row. Values
+    # are unsigned 64 bits, deltas and rates NaN where unknown
+    __slots__ = ('value', 'present', 'delta', 'rate')
+
+    def __init__(self, rows):
+        self.value = array('Q', bytes(8 * rows))
+        self.present = bytearray(rows)
+        self.delta = array('d', [_nan]) * rows
+        self.rate = array('d', [_nan]) * rows
+
+    def append(self):
+        self.value.append(0)
+        self.present.append(0)
+        self.delta.append(_nan)
+        self.rate.append(_nan)
+
+
+class CounterTracker(object):
+    '''Deltas and rates of the interface counters of a fleet of devices
+
+    Args:
+        counters (`list`): names of the counters to track, every integer
+                           of the counters dicts if None
+        counter_bits (`tuple`): widths of the counters, for wraps
+        clock: time of a poll when update() is given none
+        clear_slack (`float`): seconds the elapsed time of last_clear can
+                               lag behind the time between two polls
+                               without the counters being cleared
+
+    example:
+        >>> tracker = CounterTracker(['in_octets', 'in_crc_errors'])
+        >>> tracker.update('R1', parsed, timestamp=0)
+        []
+        >>> tracker.update('R1', next_parsed, timestamp=30)
+        []
+        >>> tracker.delta('R1', 'GigabitEthernet1')
+        {'in_octets': 91200.0, 'in_crc_errors': 0.0}
+        >>> tracker.top('in_octets', n=1)
+        [('R1', 'GigabitEthernet1', 3040.0)]
+    '''
+
+    def __init__(self, counters=None, counter_bits=(32, 64),
+                 clock=time.time, clear_slack=2.0):
+        self.counter_bits = tuple(sorted(counter_bits))
+        self.clock = clock
+        self.clear_slack = clear_slack
+        self._fixed = counters is not None
+        self._columns = collections.OrderedDict()
+        # (device, interface) -> row, and back
+        self._rows = {}
+        self.interfaces = []
+        self._device_rows = collections.defaultdict(list)
+        # Per row: time of the last poll, seconds since the previous one,
+        # seconds since the last clear at the last poll
+        self._timestamps = array('d')
+        self._intervals = array('d')
+        self._cleared = array('d')
+        for counter in counters or ():
+            self._add_column(counter)
+
+    @property
+    def counters(self):
+        '''Names of the counters tracked'''
+        return list(self._columns)
+
+    def __len__(self):
+        return len(self.interfaces)
+
+    def _add_column(self, counter):
+        column = self._columns[counter] = _Column(len(self.interfaces))
+        return column
+
+    def _add_row(self, device, interface):
+        row = self._rows[device, interface] = len(self.interfaces)
+        self.interfaces.append((device, interface))
+        self._device_rows[device].append(row)
+        self._timestamps.append(_nan)
+        self._intervals.append(_nan)
+        self._cleared.append(_nan)
+        for column in self._columns.values():
+            column.append()
+        return row
+
+    def update(self, device, parsed, timestamp=None, changed=None):
+        '''Ingest a poll of the interfaces of device
+
+        Args:
+            device (`str`): name of the device
+            parsed (`dict`): parsed output of a show interfaces parser, or
+                             the ParseSnapshot of DifferentialParser.reparse
+            timestamp (`float`): time of the poll, clock() if None
+            changed (`set`): paths which changed since the previous poll
+                             of device, as ParseSnapshot.changed. The
+                             counters of the other interfaces are not read
+
+        Returns:
+            `list` of `CounterEvent`, the counters which went down
+        '''
+        if hasattr(parsed, 'parsed') and hasattr(parsed, 'changed'):
+            if changed is None:
+                changed = parsed.changed
+            parsed = parsed.parsed
+        if timestamp is None:
+            timestamp = self.clock()
+        touched = None if changed is None else \
+            set(path[0] for path in changed)
+
+        events = []
+        seen = set()
+        for interface, attributes in parsed.items():
+            counters = attributes.get('counters') \
+                if isinstance(attributes, dict) else None
+            if not isinstance(counters, dict):
+                continue
+            row = self._rows.get((device, interface))
+            if row is None:
+                row = self._add_row(device, interface)
+            seen.add(row)
+            previous = self._timestamps[row]
+            interval = timestamp - previous if previous == previous \
+                else _nan
+            self._timestamps[row] = timestamp
+            self._intervals[row] = interval
+            if touched is not None and interface not in touched and \
+                    previous == previous:
+                self._unchanged(row, interval)
+                continue
+            self._update_row(device, interface, row, counters, interval,
+                             events)
+
+        # Interfaces gone from the output
+        for row in self._device_rows[device]:
+            if row not in seen:
+                self._intervals[row] = _nan
+                for column in self._columns.values():
+                    column.delta[row] = column.rate[row] = _nan
+        return events
+
+    def _unchanged(self, row, interval):
+        # Same counters as at the previous poll
+        rate = 0.0 if interval > 0 else _nan
+        for column in self._columns.values():
+            if column.present[row]:
+                column.delta[row] = 0.0
+                column.rate[row] = rate
+
+    def _update_row(self, device, interface, row, counters, interval,
+                    events):
+        cleared, resolution = _last_clear(counters.get('last_clear'))
+        previous_cleared = self._cleared[row]
+        self._cleared[row] = _nan if cleared is None else cleared
+        # The elapsed time since the last clear grew less than the time
+        # between the polls: cleared in between, even if it went up
+        clear = cleared is not None and interval == interval and \
+            previous_cleared == previous_cleared and \
+            cleared + resolution + self.clear_slack < \
+            previous_cleared + interval
+
+        if clear:
+            events.append(CounterEvent(device, interface, None, 'clear'))
+
+        updated = set()
+        for counter, value in counters.items():
+            if type(value) is not int or value < 0:
+                continue
+            column = self._columns.get(counter)
+            if column is None:
+                if self._fixed:
+                    continue
+                column = self._add_column(counter)
+            updated.add(counter)
+            delta = _nan
+            if column.present[row] and interval == interval:
+                old = column.value[row]
+                if clear:
+                    delta = value
+                elif value >= old:
+                    delta = value - old
+                else:
+                    delta = self._unwrap(old, value)
+                    kind = 'wrap'
+                    if delta is None:
+                        delta = value
+                        kind = 'reset'
+                    events.append(CounterEvent(device, interface, counter,
+                                               kind))
+            column.value[row] = value & 0xffffffffffffffff
+            column.present[row] = 1
+            column.delta[row] = delta
+            column.rate[row] = delta / interval if interval > 0 else _nan
+
+        if len(updated) != len(self._columns):
+            # Counters gone from the output
+            for counter, column in self._columns.items():
+                if counter not in updated:
+                    column.present[row] = 0
+                    column.delta[row] = column.rate[row] = _nan
+
+    def _unwrap(self, old, value):
+        # Delta of a counter of the smallest width old fits in which wrapped,
+        # None if the delta is too large to be a wrap
+        for bits in self.counter_bits:
+            if old < 1 << bits:
+                delta = (1 << bits) - old + value
+                return delta if delta < 1 << (bits - 1) else None
+        return None
+
+    def _row(self, device, interface):
+        try:
+            return self._rows[device, interface]
+        except KeyError:
+            raise KeyError('{} {} is not tracked'.format(device, interface))
+
+    def _values(self, row, kind):
+        values = {}
+        for counter, column in self._columns.items():
+            if column.present[row]:
+                value = getattr(column, kind)[row]
+                if value == value:
+                    values[counter] = value
+        return values
+
+    def value(self, device, interface):
+        '''Counters of the interface at the last poll, by name'''
+        row = self._row(device, interface)
+        return {counter: column.value[row]
+                for counter, column in self._columns.items()
+                if column.present[row]}
+
+    def delta(self, device, interface):
+        '''Increase of the counters of the interface since the previous
+        poll, by name, counters with no delta left out'''
+        return self._values(self._row(device, interface), 'delta')
+
+    def rate(self, device, interface):
+        '''Increase of the counters of the interface per second between the
+        last two polls, by name'''
+        return self._values(self._row(device, interface), 'rate')
+
+    def column(self, counter, kind='rate'):
+        '''array of the rates (or 'delta', or 'value') of a counter, indexed
+        like interfaces. Unknown rates and deltas are NaN'''
+        if kind not in ('rate', 'delta', 'value'):
+            raise ValueError("kind must be 'rate', 'delta' or 'value', "
+                             "not {!r}".format(kind))
+        return getattr(self._columns[counter], kind)
+
+    def _series(self, counter, kind, devices):
+        # (row, value) of counter, or the sum of a tuple of counters, for
+        # the rows of devices which have one
+        names = (counter,) if isinstance(counter, str) else tuple(counter)
+        columns = [self.column(name, kind) for name in names]
+        values = columns[0] if len(columns) == 1 else \
+            map(operator.add, *columns)
+        if kind == 'value':
+            present = [self._columns[name].present for name in names]
+            present = present[0] if len(present) == 1 else \
+                map(min, *present)
+            series = ((row, value) for row, (value, ok) in
+                      enumerate(zip(values, present)) if ok)
+        else:
+            # NaN is not equal to itself
+            series = ((row, value) for row, value in enumerate(values)
+                      if value == value)
+        if devices is not None:
+            rows = set(row for device in devices
+                       for row in self._device_rows.get(device, ()))
+            series = ((row, value) for row, value in series if row in rows)
+        return series
+
+    def top(self, counter, n=10, kind='rate', devices=None):
+        '''Interfaces with the highest rates (or deltas, or values) of a
+        counter, across the fleet
+
+        Args:
+            counter (`str`): name of the counter, or a tuple of names whose
+                             values are added, ('in_errors', 'out_errors')
+            n (`int`): number of interfaces
+            kind (`str`): 'rate', 'delta' or 'value'
+            devices (`list`): devices to rank, all if None
+
+        Returns:
+            `list` of (device, interface, value), highest first
+        '''
+        interfaces = self.interfaces
+        return [interfaces[row] + (value,) for row, value in
+                heapq.nlargest(n, self._series(counter, kind, devices),
+                               key=operator.itemgetter(1))]
+
+    def total(self, counter, kind='rate', devices=None):
+        '''Sum of the rates (or deltas, or values) of a counter across the
+        fleet, or across devices'''
+        return sum(value for _, value in self._series(counter, kind,
+                                                      devices))
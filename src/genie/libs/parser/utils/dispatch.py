@@ -0,0 +1,469 @@
+'''Line dispatch over the regexes of a parser class
+
+cli() methods usually try every line against p1, p2, ... pN in turn until one
+of them matches, so every line costs up to N regex matches. Most patterns
+start with a literal token though, ex: '^Hardware +is', a counter followed by
+a literal token, ex: '^(?P<in_pkts>[0-9]+) +packets +input', or a name
+followed by a literal token, ex: '^(?P<interface>\\S+) +is'. LineDispatcher
+indexes the regexes of a class by those tokens and only tries, for each line,
+the regexes which can match it:
+
+    class ShowInterfaces(ShowInterfacesSchema):
+
+        # Hardware is Loopback
+        p2 = LazyRegex(r'^Hardware +is +(?P<type>.+)$')
+
+        # 0 packets input, 0 bytes, 0 no buffer
+        p22 = LazyRegex(r'^(?P<in_pkts>[0-9]+) +packets +input, .*$')
+
+        dispatcher = LineDispatcher()
+
+        def cli(self, output=None):
+            ...
+            matches = self.dispatcher.match(line)
+            m = matches.get('p2')
+
+Regexes which do not start with any of those, ex: '^(?P<duplex>\\w+)-duplex',
+are tried on every line.
+'''
+
+# python
+import re
+
+# import parser utils
+from genie.libs.parser.utils.regex import compile_regexes
+
+# Leading counter of a line, ex: '0 packets input'
+_NUMBER = re.compile(r'\d+\s*')
+
+# Regex element kinds
+_LITERAL, _SPACE, _SET, _END, _OTHER = range(5)
+
+# Value of a _SET which chars are not listed but never match whitespace,
+# ex: \w or \S
+_WORD = object()
+
+
+def _quantifier(pattern, i):
+    '''Parse the quantifier at pattern[i], return (min, next index)'''
+    if i >= len(pattern) or pattern[i] not in '*+?{':
+        return 1, i
+    c = pattern[i]
+    if c == '{':
+        m = re.match(r'\{(\d*)(?:,\d*)?\}', pattern[i:])
+        if not m:
+            return None, i
+        minimum = int(m.group(1) or 0)
+        i += m.end()
+    else:
+        minimum = 1 if c == '+' else 0
+        i += 1
+    # lazy or possessive
+    if i < len(pattern) and pattern[i] in '?+':
+        i += 1
+    return minimum, i
+
+
+def _class(pattern, i):
+    '''Parse the character class at pattern[i], return (value, next index)
+
+    value is the frozenset of the chars of the class, _WORD when they can
+    not be listed but are never whitespace, or None'''
+    i += 1
+    chars = set()
+    listed = True
+    spaces = False
+    if pattern[i:i + 1] == '^':
+        listed = False
+        spaces = True
+        i += 1
+    first = True
+    while i < len(pattern) and (pattern[i] != ']' or first):
+        first = False
+        c = pattern[i]
+        if c == '\\':
+            c = pattern[i + 1]
+            i += 2
+            if c == 'd':
+                chars.update('0123456789')
+                continue
+            if c.isalnum():
+                listed = False
+                spaces = spaces or c not in 'wS'
+                continue
+        else:
+            i += 1
+        if pattern[i:i + 1] == '-' and pattern[i + 1:i + 2] not in ('', ']'):
+            end = pattern[i + 1]
+            if end == '\\':
+                end = pattern[i + 2]
+                i += 1
+            i += 2
+            chars.update(chr(x) for x in range(ord(c), ord(end) + 1))
+        else:
+            chars.add(c)
+    if listed:
+        return frozenset(chars), i + 1
+    if spaces or any(c.isspace() for c in chars):
+        return None, i + 1
+    return _WORD, i + 1
+
+
+def _group_end(pattern, i):
+    '''Index after the group opened at pattern[i]'''
+    depth = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '[':
+            i = _class(pattern, i)[1]
+            continue
+        if c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+            if not depth:
+                return i + 1
+        i += 1
+    return i
+
+
+def _branches(pattern):
+    '''Split a pattern on its top level "|"'''
+    branches = []
+    start = i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            i += 2
+        elif c == '[':
+            i = _class(pattern, i)[1]
+        elif c == '(':
+            i = _group_end(pattern, i)
+        elif c == '|':
+            branches.append(pattern[start:i])
+            start = i = i + 1
+        else:
+            i += 1
+    branches.append(pattern[start:])
+    return branches
+
+
+def _first_chars(branches):
+    '''Chars the alternatives can start with, None when they are not all
+    known'''
+    chars = set()
+    for branch in branches:
+        elements = _parse(branch)[0]
+        if not elements or elements[0][0] not in (_LITERAL, _SET) or \
+           not isinstance(elements[0][1], (str, frozenset)) or \
+           not elements[0][2]:
+            return None
+        chars.update(elements[0][1])
+    return frozenset(chars)
+
+
+def _parse(pattern):
+    '''Return the leading elements of a regex, as (kind, value, min) tuples,
+    up to the first element which is not understood, and True when the whole
+    regex was understood'''
+    elements = []
+    i = 0
+    if pattern.startswith('^'):
+        i = 1
+    while i < len(pattern):
+        c = pattern[i]
+        value = None
+        if c == '\\':
+            c = pattern[i + 1:i + 2]
+            i += 2
+            if c == 's':
+                kind = _SPACE
+            elif c == 'd':
+                kind, value = _SET, frozenset('0123456789')
+            elif c and c in 'wS':
+                kind, value = _SET, _WORD
+            elif c == 'Z':
+                kind = _END
+            elif c.isalnum() or not c:
+                kind = _OTHER
+            else:
+                kind, value = _LITERAL, c
+        elif c == '[':
+            value, i = _class(pattern, i)
+            kind = _SET if value else _OTHER
+        elif c == '(':
+            end = _group_end(pattern, i)
+            content = pattern[i + 1:end - 1]
+            minimum, i = _quantifier(pattern, end)
+            if content.startswith('?P<'):
+                content = content[content.index('>') + 1:]
+            elif content.startswith('?:'):
+                content = content[2:]
+            elif content.startswith('?'):
+                elements.append((_OTHER, None, 1))
+                return elements, False
+            branches = _branches(content)
+            if len(branches) > 1:
+                # Only the first char of the alternatives is known
+                chars = _first_chars(branches)
+                if chars and minimum:
+                    elements.append((_SET, chars, 1))
+                elements.append((_OTHER, None, 1))
+                return elements, False
+            inner, whole = _parse(content)
+            if minimum == 1 and whole:
+                # Plain group, its elements are inlined
+                elements.extend(inner)
+                continue
+            if minimum and whole and len(inner) == 1 and \
+               inner[0][0] == _SET:
+                elements.append((_SET, inner[0][1], inner[0][2] * minimum))
+                continue
+            elements.append((_OTHER, None, 1))
+            return elements, False
+        elif c == '$':
+            kind = _END
+            i += 1
+        elif c.isspace():
+            kind = _SPACE
+            i += 1
+        elif c in '.^*+?{}|)':
+            kind = _OTHER
+            i += 1
+        else:
+            kind, value = _LITERAL, c
+            i += 1
+        if kind in (_OTHER, _END):
+            elements.append((kind, None, 1))
+            return elements, False
+        minimum, i = _quantifier(pattern, i)
+        if minimum is None:
+            elements.append((_OTHER, None, 1))
+            return elements, False
+        elements.append((kind, value, minimum))
+    return elements, True
+
+
+def _literal(elements):
+    '''Literal prefix of elements, return (prefix, complete), complete is
+    True when the prefix is a whole whitespace separated token'''
+    prefix = ''
+    for kind, value, minimum in elements:
+        if kind != _LITERAL:
+            complete = (kind == _SPACE and minimum >= 1) or kind == _END
+            return prefix, complete and bool(prefix)
+        if minimum != 1:
+            # Quantified literal, only known to be there once
+            return prefix + value if minimum else prefix, False
+        prefix += value
+    return prefix, False
+
+
+def _token(elements):
+    '''Literal prefix of the token following whitespace, return
+    (prefix, complete, mandatory), mandatory is True when the whitespace
+    must be there'''
+    mandatory = False
+    while elements and elements[0][0] == _SPACE:
+        mandatory = mandatory or elements[0][2] >= 1
+        elements = elements[1:]
+    prefix, complete = _literal(elements)
+    return prefix, complete, mandatory
+
+
+class _Table(object):
+    '''Regexes indexed by the token starting the text they match'''
+
+    def __init__(self):
+        self.words = {}
+        self.chars = {}
+        self.generic = []
+
+    def add(self, entry, prefix=None, complete=False, chars=None):
+        if prefix and complete:
+            self.words.setdefault(prefix, []).append(entry + (None,))
+        elif prefix:
+            self.chars.setdefault(prefix[0], []).append(entry + (prefix,))
+        elif chars:
+            for char in chars:
+                self.chars.setdefault(char, []).append(entry + (None,))
+        else:
+            self.generic.append(entry + (None,))
+
+    def merge(self):
+        '''Build for each token and char the list of regexes to try, in
+        declaration order'''
+        chars = {}
+        for char, entries in self.chars.items():
+            chars[char] = self._sort(entries + self.generic)
+        words = {}
+        for word, entries in self.words.items():
+            words[word] = self._sort(entries + self.chars.get(word[0], []) +
+                                     self.generic)
+        self.chars = chars
+        self.words = words
+        self.generic = self._sort(self.generic)
+
+    @staticmethod
+    def _sort(entries):
+        return tuple((name, regex, prefix) for order, name, regex, prefix
+                     in sorted(entries, key=lambda entry: entry[0]))
+
+
+class LineDispatcher(object):
+    '''Class attribute matching lines against the regexes of its parser
+    class, only trying the regexes whose leading tokens match the line
+
+    The regexes are the LazyRegex of the class and its parents, indexed the
+    first time the dispatcher is used from each class.
+
+        Args:
+            exclude (`list`): Names of regexes which are not matched against
+                              whole lines, ex: used with findall
+
+        example:
+
+            >>> class Parser(object):
+            ...     p1 = LazyRegex(r'^Hostname: +(?P<hostname>\\S+)$')
+            ...     p2 = LazyRegex(r'^Version: +(?P<version>\\S+)$')
+            ...     dispatcher = LineDispatcher()
+            >>> Parser().dispatcher.match('Hostname: R1')
+            {'p1': <re.Match object; span=(0, 12), match='Hostname: R1'>}
+    '''
+
+    def __init__(self, exclude=()):
+        self.exclude = set(exclude)
+        # parser class -> _Dispatch
+        self._dispatch = {}
+
+    def __get__(self, instance, owner):
+        try:
+            return self._dispatch[owner]
+        except KeyError:
+            pass
+        regexes = [(name, regex) for name, regex in compile_regexes(owner)
+                   if name not in self.exclude]
+        dispatch = self._dispatch[owner] = _Dispatch(regexes)
+        return dispatch
+
+
+class _Dispatch(object):
+    '''Index of the regexes of one parser class'''
+
+    def __init__(self, regexes):
+        self.names = [name for name, regex in regexes]
+        # Lines starting with text, lines starting with a number, and
+        # regexes indexed by the second token of the line
+        self._text = _Table()
+        self._number = _Table()
+        self._second = _Table()
+        for order, (name, regex) in enumerate(regexes):
+            self._add((order, name, regex))
+        self._text.merge()
+        self._number.merge()
+        self._second.merge()
+        self._has_second = bool(self._second.words or self._second.chars)
+
+    def _add(self, entry):
+        regex = entry[2]
+        elements = _parse(regex.pattern)[0]
+        if regex.flags & (re.IGNORECASE | re.VERBOSE) or \
+           len(_branches(regex.pattern)) > 1 or not elements:
+            kind = _OTHER
+        else:
+            kind, value, minimum = elements[0]
+
+        if kind == _LITERAL and _literal(elements)[0]:
+            prefix, complete = _literal(elements)
+            if prefix[0].isdecimal():
+                self._number.add(entry)
+            else:
+                self._text.add(entry, prefix, complete)
+            return
+
+        if kind != _SET or not minimum:
+            self._text.add(entry)
+            self._number.add(entry)
+            return
+
+        prefix, complete, mandatory = _token(elements[1:])
+        if value is not _WORD and all(c.isdecimal() for c in value):
+            # Counter followed by a token, the token is looked up after the
+            # leading number of the line
+            if prefix and not prefix[0].isdecimal():
+                self._number.add(entry, prefix, complete)
+            else:
+                self._number.add(entry)
+        elif prefix and mandatory and \
+                (value is _WORD or not any(c.isspace() for c in value)):
+            # Name followed by a token, the token is looked up in the second
+            # token of the line
+            self._second.add(entry, prefix, complete)
+        elif value is _WORD:
+            self._text.add(entry)
+            self._number.add(entry)
+        else:
+            self._text.add(entry, chars=set(c for c in value
+                                            if not c.isdecimal()))
+            if any(c.isdecimal() for c in value):
+                self._number.add(entry)
+
+    def _select(self, line):
+        '''Regexes to try on a line, as (entries, text) tuples, the prefix of
+        the entries is checked against their text'''
+        if not line:
+            return ((self._text.generic, line),)
+        first = line[0]
+        if first.isspace():
+            return ((self._text.chars.get(first, self._text.generic), line),)
+        tokens = line.split(None, 2)
+        if first.isdecimal():
+            table = self._number
+            text = line[_NUMBER.match(line).end():]
+            token = text.split(None, 1)[0] if text else None
+        else:
+            table = self._text
+            text = line
+            token = tokens[0]
+        entries = table.words.get(token)
+        if entries is None:
+            entries = table.chars.get(text[:1], table.generic)
+        if not self._has_second or len(tokens) < 2:
+            return ((entries, text),)
+        token = tokens[1]
+        second = self._second.words.get(token)
+        if second is None:
+            second = self._second.chars.get(token[0], ())
+        return ((entries, text), (second, token))
+
+    def candidates(self, line):
+        '''Names of the regexes which can match a line, in declaration
+        order'''
+        names = set()
+        for entries, text in self._select(line):
+            names.update(name for name, regex, prefix in entries
+                         if not prefix or text.startswith(prefix))
+        return [name for name in self.names if name in names]
+
+    def match(self, line):
+        '''Match a line against the regexes which can match it
+
+            Args:
+                line (`str`): Line of the output
+
+            Returns:
+                dict of regex name to match object, for the regexes which
+                matched
+        '''
+        matches = {}
+        for entries, text in self._select(line):
+            for name, regex, prefix in entries:
+                if prefix and not text.startswith(prefix):
+                    continue
+                m = regex.match(line)
+                if m:
+                    matches[name] = m
+        return matches
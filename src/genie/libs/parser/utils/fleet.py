@@ -0,0 +1,314 @@
+'''Concurrent collection and parsing of show commands over many devices
+
+A parser executes its command with the blocking device.execute, then parses
+the output in the same thread: collecting 20 commands from 5000 devices one
+parser after the other takes the sum of all the round trips. FleetCollector
+runs the commands of all the devices from an asyncio event loop:
+
+    * each command is resolved to its parser with get_parser before it is
+      sent, commands without a parser are never executed
+    * outputs are fetched through an awaitable execute, by default the
+      blocking device.execute run in a pool of threads; an asyncio
+      connection gives its own coroutine instead
+    * at most device_concurrency commands run at a time on a device, at
+      most concurrency in all, and no more than rate are started per
+      second
+    * the outputs are parsed in an executor, a ProcessPoolExecutor to
+      parse on all the cores, the event loop only waits
+
+    collector = FleetCollector(concurrency=200, rate=100)
+    for result in collector.run(devices, ['show version', 'show ip route']):
+        if result.error:
+            print(result.device, result.command, result.stage, result.error)
+
+ReplayDevice stands for a device in tests, replaying recorded outputs, the
+golden outputs of the parser tests, with a latency.
+'''
+
+# python
+import time
+import asyncio
+import functools
+import threading
+import collections
+import concurrent.futures
+
+# Parser utils
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.batch import error_text, parse_output
+
+FleetResult = collections.namedtuple(
+    'FleetResult', ['device', 'command', 'parsed', 'error', 'stage'])
+FleetResult.__doc__ = '''Outcome of one command on one device, by device
+name. error is None, or 'ExceptionType: message' and parsed is None, stage
+being where it failed: 'lookup' of the parser, 'execute' or 'parse' '''
+
+
+class ReplayDevice(object):
+    '''Device replaying recorded outputs
+
+    Args:
+        name (`str`): name of the device
+        os (`str`): os the parsers are looked up for
+        outputs (`dict`): command -> output, or the golden output dicts of
+                          the parser tests: {'execute.return_value': output}
+        latency (`float`): seconds execute takes, as a round trip
+        platform (`str`): platform the parsers are looked up for
+
+    execute raises for a command it has no output of. executed counts the
+    commands executed, max_active the most executed at the same time.
+
+    example:
+        >>> device = ReplayDevice('R1', 'iosxe', {
+        ...     'show version': test_show_version.golden_output_asr1k},
+        ...     latency=0.05)
+        >>> device.execute('show version')
+        'Cisco IOS XE Software, Version 16.09.01...'
+    '''
+
+    def __init__(self, name, os, outputs, latency=0, platform=None):
+        self.name = name
+        self.os = os
+        self.platform = platform
+        self.model = None
+        self.latency = latency
+        self.outputs = {}
+        for command, output in outputs.items():
+            if isinstance(output, dict):
+                output = output['execute.return_value']
+            self.outputs[' '.join(command.split())] = output
+        self.executed = 0
+        self.max_active = 0
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def _output(self, command):
+        try:
+            return self.outputs[' '.join(command.split())]
+        except KeyError:
+            raise Exception("No output of '{c}' on {d}".format(
+                c=command, d=self.name)) from None
+
+    def _start(self):
+        with self._lock:
+            self.executed += 1
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+
+    def _end(self):
+        with self._lock:
+            self._active -= 1
+
+    def execute(self, command, *args, **kwargs):
+        self._start()
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            return self._output(command)
+        finally:
+            self._end()
+
+    async def async_execute(self, command):
+        '''execute as a coroutine, waiting without a thread'''
+        self._start()
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return self._output(command)
+        finally:
+            self._end()
+
+
+class RateLimiter(object):
+    '''Token bucket: acquire() waits until an operation may start
+
+    Args:
+        rate (`float`): operations per second
+        burst (`int`): operations started at once before waiting
+    '''
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._last = None
+        self._lock = None
+
+    async def acquire(self):
+        loop = asyncio.get_event_loop()
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            now = loop.time()
+            if self._last is not None:
+                self._tokens = min(self.burst, self._tokens +
+                                   (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._last = loop.time()
+                self._tokens = 1
+            self._tokens -= 1
+
+
+class FleetCollector(object):
+    '''Executes and parses show commands on many devices from asyncio
+
+    Args:
+        concurrency (`int`): commands executing at a time, over all devices
+        device_concurrency (`int`): commands executing at a time on one
+                                    device
+        rate (`float`): commands started per second over all devices, no
+                        limit if None
+        burst (`int`): commands started at once before the rate applies
+        execute (`callable`): coroutine function (device, command) ->
+                              output; device.execute run in a thread pool
+                              of concurrency threads if None
+        parse_executor (`Executor`): executor the outputs are parsed in, a
+                                     thread of its own if None
+        timeout (`float`): seconds a command may take to execute, no limit
+                           if None. A device.execute which timed out still
+                           holds its device until it returns
+
+    example:
+        >>> collector = FleetCollector(concurrency=100, rate=50,
+        ...     parse_executor=ProcessPoolExecutor(8))
+        >>> results = collector.run(devices, ['show version'])
+        >>> results[0].parsed['version']['os']
+        'IOS-XE'
+    '''
+
+    def __init__(self, concurrency=64, device_concurrency=1, rate=None,
+                 burst=1, execute=None, parse_executor=None, timeout=None):
+        self.concurrency = concurrency
+        self.device_concurrency = device_concurrency
+        self.rate = rate
+        self.burst = burst
+        self.execute = execute
+        self.parse_executor = parse_executor
+        self.timeout = timeout
+
+    async def _execute(self, executor, device, command):
+        if self.execute is not None:
+            execute = self.execute(device, command)
+            if self.timeout is not None:
+                # The coroutine is cancelled on timeout, nothing keeps
+                # running on the device
+                execute = asyncio.wait_for(execute, self.timeout)
+            return await execute
+        loop = asyncio.get_event_loop()
+        future = loop.run_in_executor(
+            executor, functools.partial(device.execute, command))
+        if self.timeout is None:
+            return await future
+        try:
+            return await asyncio.wait_for(asyncio.shield(future),
+                                          self.timeout)
+        except asyncio.TimeoutError:
+            # A thread cannot be cancelled: device.execute goes on, its slot
+            # of the device is kept until it returns so that no other
+            # command runs on the connection meanwhile
+            try:
+                await future
+            except Exception:
+                pass
+            raise
+
+    async def _collect(self, device, command, limits, executors):
+        name = getattr(device, 'name', str(device))
+        try:
+            parser_cls, kwargs = common.get_parser(command, device)
+        except Exception as e:
+            return FleetResult(name, command, None, error_text(e), 'lookup')
+
+        limit, device_limits, rate_limiter = limits
+        execute_executor, parse_executor = executors
+        # The device first: commands waiting for their device hold no slot
+        # other devices could use
+        async with device_limits[id(device)]:
+            async with limit:
+                if rate_limiter is not None:
+                    await rate_limiter.acquire()
+                try:
+                    output = await self._execute(execute_executor, device,
+                                                 command)
+                except Exception as e:
+                    return FleetResult(name, command, None, error_text(e),
+                                       'execute')
+
+        loop = asyncio.get_event_loop()
+        parse = functools.partial(
+            parse_output, parser_cls, kwargs, output, device.os,
+            getattr(device, 'platform', None), getattr(device, 'model', None))
+        try:
+            parsed = await loop.run_in_executor(parse_executor, parse)
+        except Exception as e:
+            return FleetResult(name, command, None, error_text(e), 'parse')
+        return FleetResult(name, command, parsed, None, None)
+
+    async def collect(self, devices, commands, callback=None):
+        '''Execute and parse the commands on the devices
+
+        Args:
+            devices (`list`): devices, with name, os and execute
+            commands (`list`): commands executed on every device
+            callback (`callable`): called with each FleetResult as soon as
+                                   it is done
+
+        Returns:
+            list of FleetResult, by device then command
+        '''
+        devices = list(devices)
+        commands = list(commands)
+        limits = (asyncio.Semaphore(self.concurrency),
+                  {id(device): asyncio.Semaphore(self.device_concurrency)
+                   for device in devices},
+                  RateLimiter(self.rate, self.burst) if self.rate else None)
+        execute_executor = None
+        if self.execute is None:
+            execute_executor = concurrent.futures.ThreadPoolExecutor(
+                self.concurrency)
+        parse_executor = self.parse_executor or \
+            concurrent.futures.ThreadPoolExecutor(1)
+
+        async def collect(device, command):
+            result = await self._collect(
+                device, command, limits,
+                (execute_executor, parse_executor))
+            if callback is not None:
+                callback(result)
+            return result
+
+        try:
+            return await asyncio.gather(*[collect(device, command)
+                                          for device in devices
+                                          for command in commands])
+        finally:
+            if execute_executor is not None:
+                execute_executor.shutdown(wait=False)
+            if parse_executor is not self.parse_executor:
+                parse_executor.shutdown(wait=False)
+
+    def run(self, devices, commands, callback=None):
+        '''collect() in an event loop of its own, for callers not running
+        one'''
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(
+                self.collect(devices, commands, callback=callback))
+        finally:
+            loop.close()
+
+
+def collect_fleet(devices, commands, **kwargs):
+    '''Execute and parse the commands on the devices, see FleetCollector
+
+    Args:
+        devices (`list`): devices, with name, os and execute
+        commands (`list`): commands executed on every device
+        kwargs: arguments of FleetCollector
+
+    Returns:
+        list of FleetResult, by device then command
+    '''
+    return FleetCollector(**kwargs).run(devices, commands)
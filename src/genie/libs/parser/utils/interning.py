@@ -0,0 +1,208 @@
+'''Shared strings of parsed outputs
+
+Each value a parser captures is a new str: in a full BGP table, route table
+or MAC address table the same next hops, interfaces, AS paths, communities,
+'ARPA', 'dynamic' or 'up' are held hundreds of thousands of times, one
+object per occurrence.
+
+An InternTable keeps one copy of each string it is given. Parsers whose
+cli() is decorated with interned have the strings of their parsed output,
+keys and values, replaced by the copies of a table when cli() returns:
+
+    class ShowIpRoute(ShowIpRouteSchema):
+
+        @interned
+        def cli(self, vrf='', output=None):
+            ...
+
+Interning walks the whole parsed output, it is worth its time only for
+outputs which are kept: it is off by default. Parsers given True have a
+table per parse, the strings are shared within one parsed output. Parsers
+given a table share the strings across their parsed outputs, for the life
+of the table:
+
+    parser.intern_table = True     # a new table for each parse
+    ShowIpRoute.intern_table = PROCESS_TABLE
+    parser.intern_table = InternTable(maxsize=100000)
+
+Tables are bounded: once maxsize strings are held, the strings not looked up
+since are dropped, new ones are still interned. stats counts the lookups and
+the bytes of the duplicates replaced.
+'''
+
+# python
+import sys
+import functools
+
+
+class InternTable(object):
+    '''One copy of each string looked up
+
+    Strings are kept in two generations of at most maxsize / 2 strings:
+    when the new one is full it becomes the old one, and the strings of
+    the old one are moved back to the new one when looked up. The strings
+    of the old generation not looked up before the next turn are dropped.
+
+    Args:
+        maxsize (`int`): bound of the number of strings held, None for no
+                         bound
+
+    example:
+        >>> table = InternTable()
+        >>> parsed = table.intern(ShowIpRoute(device=device).cli())
+        >>> table.stats
+        {'hits': 10240, 'misses': 310, 'saved': 552960, 'size': 310}
+    '''
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self._half = (maxsize // 2 or 1) if maxsize else None
+        self._new = {}
+        self._old = {}
+        self.hits = self.misses = self.saved = 0
+
+    def __call__(self, value):
+        '''The copy of the table of value, a str'''
+        found = self._new.get(value)
+        if found is not None:
+            self.hits += 1
+            self.saved += sys.getsizeof(value) if found is not value else 0
+            return found
+        return self._lookup(value)
+
+    def _lookup(self, value):
+        # Miss of the new generation
+        found = self._old.pop(value, None)
+        if found is None:
+            self.misses += 1
+            found = value
+        else:
+            self.hits += 1
+            if found is not value:
+                self.saved += sys.getsizeof(value)
+        new = self._new
+        new[found] = found
+        if self._half is not None and len(new) >= self._half:
+            self._old = new
+            self._new = {}
+        return found
+
+    def _rekey(self, container):
+        # Same order, the keys replaced by their copies, all of them in
+        # the table
+        items = [(self._new.get(key) or self._old.get(key, key)
+                  if type(key) is str else key, value)
+                 for key, value in container.items()]
+        container.clear()
+        container.update(items)
+
+    def __len__(self):
+        return len(self._new) + len(self._old)
+
+    def __contains__(self, value):
+        return value in self._new or value in self._old
+
+    @property
+    def stats(self):
+        '''Lookups which found their string ('hits') or added it ('misses'),
+        bytes of the duplicates replaced ('saved') and strings held
+        ('size')'''
+        return {'hits': self.hits, 'misses': self.misses,
+                'saved': self.saved, 'size': len(self)}
+
+    def clear(self):
+        '''Drop the strings and reset the stats'''
+        self._new = {}
+        self._old = {}
+        self.hits = self.misses = self.saved = 0
+
+    def intern(self, parsed):
+        '''Replace the strings of parsed by their copies in the table
+
+        The keys and values of the dicts, and the items of the lists, are
+        replaced in place, nested ones included.
+
+        Args:
+            parsed (`dict`): parsed output
+
+        Returns:
+            parsed
+        '''
+        lookup = self._lookup
+        sizeof = sys.getsizeof
+        hits = saved = 0
+        stack = [parsed]
+        pop = stack.pop
+        push = stack.append
+        while stack:
+            container = pop()
+            new = self._new
+            if type(container) is dict:
+                rekey = False
+                for key in container:
+                    if type(key) is str:
+                        found = new.get(key)
+                        if found is None:
+                            # Counts its hit and saving itself
+                            found = lookup(key)
+                            new = self._new
+                        else:
+                            hits += 1
+                            if found is not key:
+                                saved += sizeof(key)
+                        if found is not key:
+                            rekey = True
+                if rekey:
+                    self._rekey(container)
+                    new = self._new
+                items = container.items()
+            else:
+                items = enumerate(container)
+            replaced = None
+            for key, value in items:
+                if type(value) is str:
+                    found = new.get(value)
+                    if found is None:
+                        found = lookup(value)
+                        new = self._new
+                    else:
+                        hits += 1
+                        if found is not value:
+                            saved += sizeof(value)
+                    if found is not value:
+                        if replaced is None:
+                            replaced = []
+                        replaced.append((key, found))
+                elif type(value) is dict or type(value) is list:
+                    push(value)
+            if replaced:
+                for key, value in replaced:
+                    container[key] = value
+        self.hits += hits
+        self.saved += saved
+        return parsed
+
+
+# Table shared by the parsers given it, across parses
+PROCESS_TABLE = InternTable(maxsize=1 << 20)
+
+
+def interned(cli):
+    '''Decorator of cli(), interning the strings of its parsed output
+
+    The table is the intern_table attribute of the parser: an InternTable,
+    True for a new table per parse, None or False for no interning, the
+    default.
+    '''
+
+    @functools.wraps(cli)
+    def wrapper(self, *args, **kwargs):
+        parsed = cli(self, *args, **kwargs)
+        table = getattr(self, 'intern_table', None)
+        if table is None or table is False or not isinstance(parsed, dict):
+            return parsed
+        if table is True:
+            table = InternTable()
+        return table.intern(parsed)
+
+    return wrapper
@@ -0,0 +1,221 @@
+'''Parsing of NX-OS "| json" replies
+
+NX-OS gives the output of its show commands as JSON with "| json": the
+values come as fields, there is no text to match, where cli() runs its
+regexes on every line of the output. The tables of the reply are the
+TABLE_x / ROW_x of the "| xml" replies, ROW_x being a dict, or a list of
+dicts when the table has more than one row:
+
+    {"TABLE_vrf": {"ROW_vrf": [{"vrf-name-out": "default",
+                                "TABLE_neighbor": {"ROW_neighbor": ...}},
+                               ...]}}
+
+iter_json_rows() yields the rows of a decoded reply as iter_xml_rows()
+does, with the same field maps. JsonParser parsers have a json() building
+their parsed output from the rows; parse_json() runs it on the "| json"
+reply, and falls back to parse() when the device gives no JSON:
+
+    parsed = ShowInterface(device=device).parse_json(interface='Eth1/1')
+
+The reply is decoded with orjson when it is installed, json otherwise.
+'''
+
+# python
+import json as _json
+import logging
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# Parser utils
+from genie.libs.parser.utils.xml_rows import XmlRow
+from genie.libs.parser.utils.schema_compiler import compile_schema
+
+log = logging.getLogger(__name__)
+
+# Values of a reply which are tables, or rows of a table
+_TABLES = (dict, list)
+
+
+class JsonOutputError(ValueError):
+    '''Output which is not an NX-OS JSON reply'''
+
+
+def loads(output):
+    '''Decode an NX-OS JSON reply
+
+    Args:
+        output (`str`): JSON reply, lines before and after the JSON object,
+                        as the prompt, are ignored
+
+    Returns:
+        `dict`
+
+    Raises:
+        JsonOutputError: output has no JSON object
+    '''
+    start = output.find('{') if output else -1
+    end = output.rfind('}') + 1 if start >= 0 else 0
+    if start < 0 or end <= start:
+        raise JsonOutputError('No JSON object in the output: {!r}'.format(
+            (output or '')[:80]))
+    try:
+        return orjson.loads(output[start:end]) if orjson else \
+            _json.loads(output[start:end])
+    except ValueError as e:
+        raise JsonOutputError('Invalid JSON output: {}'.format(e))
+
+
+def _text(value):
+    # Value of a JSON leaf as the text of the XML leaf
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+def iter_json_rows(fields, data, tag=None, parents=()):
+    '''Yield the rows of a decoded NX-OS JSON reply
+
+    As iter_xml_rows(): the rows of the field map, nested rows first. The
+    leaves of a row are all read before its nested rows, its parents are
+    complete.
+
+    Args:
+        fields (`dict`): row tag -> {leaf key: key, or (key, convert)},
+                         convert being called on the text of the leaf. A
+                         key may be a tuple, the path of the value, see
+                         nested()
+        data (`dict`): decoded reply
+
+    Returns:
+        generator of `XmlRow`
+
+    example:
+        >>> data = loads(device.execute('show bgp sessions | json'))
+        >>> for row in iter_json_rows(ShowBgpSessions.xml_fields, data):
+        ...     row.tag, row.values
+        ('ROW_neighbor', {'neighbor': '10.51.1.101', 'remote_as': 300})
+    '''
+    # Walked with a stack, not recursively: a reply is a few levels of
+    # tables deep, each a generator to resume per row otherwise. A row is
+    # pushed below its children, yielded once they are done
+    stack = [(tag, data, parents)]
+    while stack:
+        item = stack.pop()
+        if item.__class__ is XmlRow:
+            yield item
+            continue
+        tag, data, parents = item
+        row_fields = fields.get(tag)
+        children = []
+        if row_fields is not None:
+            row = XmlRow(tag, {}, parents)
+            values = row.values
+            for key, value in data.items():
+                if value.__class__ in _TABLES:
+                    children.append((key, value))
+                    continue
+                field = row_fields.get(key)
+                if field is None or value is None:
+                    continue
+                if value.__class__ is not str:
+                    value = _text(value)
+                if field.__class__ is tuple:
+                    try:
+                        values[field[0]] = field[1](value)
+                    except (ValueError, TypeError, AttributeError):
+                        pass
+                else:
+                    values[field] = value
+            stack.append(row)
+            parents = parents + (row,)
+        else:
+            children = [(key, value) for key, value in data.items()
+                        if value.__class__ in _TABLES]
+        for key, value in reversed(children):
+            if value.__class__ is dict:
+                stack.append((key, value, parents))
+            else:
+                stack.extend((key, item, parents) for item in reversed(value)
+                             if item.__class__ is dict)
+
+
+def nested(values):
+    '''Values of a row with tuple keys set as nested dicts
+
+    Args:
+        values (`dict`): values of a row, a tuple key being the path of the
+                         value in the parsed output
+
+    Returns:
+        `dict`
+
+    example:
+        >>> nested({'mtu': 1500, ('counters', 'in_pkts'): 10})
+        {'mtu': 1500, 'counters': {'in_pkts': 10}}
+    '''
+    ret_dict = {}
+    for key, value in values.items():
+        if isinstance(key, tuple):
+            sub_dict = ret_dict
+            for part in key[:-1]:
+                sub_dict = sub_dict.setdefault(part, {})
+            sub_dict[key[-1]] = value
+        else:
+            ret_dict[key] = value
+    return ret_dict
+
+
+class JsonParser(object):
+    '''Parser mixin parsing the "| json" reply of NX-OS
+
+    For parsers with a json() method, taking the arguments of cli() and
+    output, the JSON reply, which it executes on the device if None. The
+    parser falls back to cli() when the reply is not JSON: the command has
+    no "| json" on the device, or an error is given. The error is kept in
+    json_error. An output given which is not JSON is parsed by cli().
+
+    example:
+        >>> parser = ShowRoutingVrfAll(device=device)
+        >>> parsed = parser.parse_json(vrf='all')
+        >>> parser.json_error
+        None
+    '''
+
+    json_error = None
+
+    def parse_json(self, output=None, **kwargs):
+        '''Parse the "| json" reply
+
+        Args:
+            output (`str`): JSON reply, executed on the device if None
+            kwargs: arguments of json() and cli()
+
+        Returns:
+            parsed output, validated against the schema of the parser
+
+        Raises:
+            SchemaEmptyParserError: the reply has no entries
+        '''
+        self.json_error = None
+        try:
+            parsed = self.json(output=output, **kwargs)
+        except JsonOutputError as e:
+            log.info('{p}: no JSON output, parsed from cli: {e}'.format(
+                p=type(self).__name__, e=e))
+            self.json_error = e
+            if output is not None:
+                kwargs['output'] = output
+            return self.parse(**kwargs)
+        if not parsed:
+            raise SchemaEmptyParserError(parsed)
+        schema = getattr(self, 'schema', None)
+        if schema:
+            compile_schema(schema).validate(parsed)
+        return parsed
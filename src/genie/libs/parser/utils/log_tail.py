@@ -0,0 +1,256 @@
+'''New lines of a device's log buffer since the previous poll
+
+show logging prints the whole log buffer, 100k lines and more on a busy
+router, and parsing it again at each poll costs the whole buffer every time
+even when only a few lines were logged since. A cursor keeps the timestamp,
+sequence number and hash of the last line seen; tail() reads the output
+back from its end up to that line, and parses only the lines after it:
+
+    result = ShowLogging(device=device).tail()
+    ...
+    result = ShowLogging(device=device).tail(cursor=result.cursor)
+    for log in result.logs:
+        log['timestamp'], log['facility'], log['severity'], log['mnemonic']
+
+LogFollower keeps the cursor of each device from poll to poll:
+
+    follower = LogFollower()
+    for device in devices:
+        for log in follower.poll(device).logs:
+            ...
+
+When the line of the cursor is no longer in the buffer, all its lines are
+new, and reset tells why:
+
+    * 'wrap': the lines of the buffer all came after the cursor, the line
+      of the cursor was pushed out of the buffer by newer lines, some lines
+      may have been missed
+    * 'clear': the buffer was cleared, or the device restarted
+
+The buffer printed by the device still has to be received whole, what is
+saved is the parsing: the lines before the cursor are never split, matched
+or hashed.
+'''
+
+# python
+import re
+import hashlib
+import collections
+
+# Parser utils
+from genie.libs.parser.utils import common
+
+LogCursor = collections.namedtuple('LogCursor',
+                                   ['timestamp', 'sequence', 'digest'])
+LogCursor.__doc__ = '''Last line seen of a log buffer: its timestamp text,
+its sequence number, None for the lines without, and the hash of the line'''
+
+TailResult = collections.namedtuple('TailResult', ['logs', 'cursor', 'reset'])
+TailResult.__doc__ = '''Lines logged since the cursor, oldest first, as
+dicts; cursor of the last line, to give to the next poll, None if the buffer
+is empty; reset is None, 'wrap' or 'clear' when the line of the cursor was
+not found'''
+
+# Timestamps of the log lines:
+#   Jun  5 05:09:30.838 EST
+#   *Mar  1 00:00:53.215 UTC
+#   2019 May 22 16:20:45
+_TIMESTAMP = re.compile(r'^(?:(?P<year>\d{4}) +)?(?P<month>[A-Z][a-z]{2}) +'
+                        r'(?P<day>\d+)(?: +(?P<year2>\d{4}))? +(?P<hour>\d+):'
+                        r'(?P<minute>\d+):(?P<second>\d+(?:\.\d+)?)')
+
+_MONTHS = {month: number for number, month in enumerate(
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct',
+     'Nov', 'Dec'), 1)}
+
+# os -> command of the whole log buffer, as polled by LogFollower
+TAIL_COMMANDS = {'iosxe': 'show logging',
+                 'nxos': 'show logging logfile'}
+
+
+def _digest(line):
+    return hashlib.sha1(line.encode('utf-8', 'replace')).hexdigest()
+
+
+def timestamp_key(timestamp):
+    '''Timestamp of a log line as a tuple, to compare with another
+
+    Args:
+        timestamp (`str`): timestamp of the line
+
+    Returns:
+        (year, month, day, hour, minute, second), year 0 if the timestamp
+        has none, None if it is not a timestamp
+    '''
+    m = _TIMESTAMP.match(timestamp.lstrip('*.'))
+    if not m or m.group('month') not in _MONTHS:
+        return None
+    year = m.group('year') or m.group('year2')
+    return (int(year) if year else 0, _MONTHS[m.group('month')],
+            int(m.group('day')), int(m.group('hour')),
+            int(m.group('minute')), float(m.group('second')))
+
+
+def _after(first, cursor):
+    # Whether the first line of the buffer came after the cursor: by their
+    # sequence numbers if both have one, else by their timestamps
+    if first.get('sequence') is not None and cursor.sequence is not None:
+        return first['sequence'] > cursor.sequence + 1
+    first_key = timestamp_key(first.get('timestamp') or '')
+    cursor_key = timestamp_key(cursor.timestamp or '')
+    if first_key is None or cursor_key is None:
+        return False
+    return first_key > cursor_key
+
+
+class TailParser(object):
+    '''Parser mixin giving the lines logged since a cursor
+
+    tail_entry is the regex of a log line, its named groups the fields of
+    the logs: timestamp, sequence, host, facility, severity, mnemonic and
+    message, those that matched. A line it does not match is given as its
+    message. tail_start is the regex of the line the log lines follow in
+    the output, if any: the lines before it are not logs.
+
+    example:
+        >>> result = ShowLogging(device=device).tail(cursor=cursor)
+        >>> result.logs[0]
+        {'line': 'Jun  5 05:10:59.519 EST: %SYS-5-CONFIG_I: Configured ...',
+         'timestamp': 'Jun  5 05:10:59.519 EST', 'facility': 'SYS',
+         'severity': 5, 'mnemonic': 'CONFIG_I',
+         'message': 'Configured from console by cisco on console'}
+    '''
+
+    tail_entry = None
+    tail_start = None
+
+    def tail_lines(self, output, cursor=None):
+        '''Lines of the output after the line of the cursor
+
+        Args:
+            output (`str`): output of the command
+            cursor (`LogCursor`): last line seen
+
+        Returns:
+            (lines, found): the lines after the cursor, stripped, oldest
+            first, and whether the line of the cursor was found. All the log
+            lines if it was not.
+        '''
+        tail_start = self.tail_start
+        digest = timestamp = None
+        if cursor is not None:
+            digest, timestamp = cursor.digest, cursor.timestamp or ''
+        lines = []
+        # From the end, a line at a time, up to the cursor
+        end = len(output)
+        while end > 0:
+            start = output.rfind('\n', 0, end) + 1
+            line = output[start:end].strip()
+            end = start - 1
+            if not line:
+                continue
+            # Only the lines of the timestamp of the cursor are hashed
+            if digest is not None and timestamp in line and \
+                    _digest(line) == digest:
+                lines.reverse()
+                return lines, True
+            if tail_start is not None and tail_start.match(line):
+                break
+            lines.append(line)
+        lines.reverse()
+        return lines, False
+
+    def tail_log(self, line):
+        '''Fields of a log line'''
+        log = {'line': line}
+        m = self.tail_entry.match(line)
+        if not m:
+            log['message'] = line
+            return log
+        log.update((key, value) for key, value in m.groupdict().items()
+                   if value is not None)
+        if 'severity' in log:
+            log['severity'] = int(log['severity'])
+        if 'sequence' in log:
+            log['sequence'] = int(log['sequence'])
+        return log
+
+    def tail(self, cursor=None, include='', output=None):
+        '''Lines logged since the cursor
+
+        Args:
+            cursor (`LogCursor`): last line seen at the previous poll, all
+                                  the lines are new if None
+            include (`str`): only the lines including it, as the command
+            output (`str`): output of the command, executed if None
+
+        Returns:
+            `TailResult`
+        '''
+        if output is None:
+            if include:
+                cmd = self.cli_command[0].format(include=include)
+            else:
+                cmd = self.cli_command[1]
+            output = self.device.execute(cmd)
+
+        lines, found = self.tail_lines(output or '', cursor)
+        logs = [self.tail_log(line) for line in lines]
+
+        reset = None
+        if cursor is not None and not found:
+            reset = 'wrap' if logs and _after(logs[0], cursor) else 'clear'
+        if logs:
+            last = logs[-1]
+            cursor = LogCursor(last.get('timestamp'), last.get('sequence'),
+                               _digest(last['line']))
+        elif reset is not None:
+            cursor = None
+        return TailResult(logs, cursor, reset)
+
+
+class LogFollower(object):
+    '''Cursor of each device, the new log lines of a device at each poll
+
+    Args:
+        commands (`dict`): os -> command of the log buffer, parsed by the
+                           parser get_parser finds for it, a TailParser.
+                           TAIL_COMMANDS if None
+
+    cursors is the cursor of each device, by device name.
+
+    example:
+        >>> follower = LogFollower()
+        >>> follower.poll(device).logs
+        [{'line': ..., 'timestamp': 'Jun  5 05:09:30.838 EST', ...}, ...]
+        >>> follower.poll(device).logs
+        []
+    '''
+
+    def __init__(self, commands=None):
+        self.commands = TAIL_COMMANDS if commands is None else commands
+        self.cursors = {}
+
+    def poll(self, device, include='', output=None):
+        '''New lines of the log buffer of a device since its last poll
+
+        Args:
+            device (`Device`): device polled
+            include (`str`): only the lines including it
+            output (`str`): output of the command, executed if None
+
+        Returns:
+            `TailResult`
+
+        Raises:
+            KeyError: no command for the os of the device
+        '''
+        parser_cls, _ = common.get_parser(self.commands[device.os], device)
+        name = getattr(device, 'name', str(device))
+        result = parser_cls(device=device).tail(
+            cursor=self.cursors.get(name), include=include, output=output)
+        if result.cursor is None:
+            self.cursors.pop(name, None)
+        else:
+            self.cursors[name] = result.cursor
+        return result
@@ -0,0 +1,338 @@
+'''Many show commands sent to a device in one write, then parsed
+
+Each parser executes its command with device.execute, which writes the
+command and waits for the prompt to come back: a snapshot of 30 commands is
+30 round trips, one after the other. MultiCommand writes all the commands
+at once, each after a marker line, then reads until the end marker comes
+back:
+
+    R1#! genie-batch 5f0c2a91d4e7 0
+    R1#show version
+    Cisco IOS XE Software, Version 16.09.01
+    ...
+    R1#! genie-batch 5f0c2a91d4e7 1
+    R1#show ip route
+    ...
+    R1#! genie-batch 5f0c2a91d4e7 end
+
+The markers are comments to the device, their token is drawn for each
+batch so that no output contains it. The output of a command is what the
+terminal echoes between the echo of the command and the next marker, and
+is handed to the parser of the command, resolved with get_parser:
+
+    results = MultiCommand(device).run(['show version', 'show inventory',
+                                        'show interfaces', 'show ip route'])
+    for result in results:
+        if result.error:
+            print(result.command, result.stage, result.error)
+
+A failure is the command's own: a command without parser is not sent, a
+command rejected by the device or whose output did not come back before
+the session ended fails at 'execute', an output its parser cannot read
+fails at 'parse'. The other commands are parsed all the same.
+
+The terminal is written to and read as telnetlib does, write(text) then
+read_until(expected, timeout), and is expected not to page the outputs
+(terminal length 0). A connected pyATS device, without these, is written to
+and read through its unicon transmit, receive and receive_buffer services
+by ConnectionTerminal.
+'''
+
+# python
+import re
+import time
+import uuid
+import collections
+
+# Parser utils
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.batch import error_text, parse_output
+
+CommandResult = collections.namedtuple(
+    'CommandResult', ['command', 'output', 'parsed', 'error', 'stage'])
+CommandResult.__doc__ = '''Outcome of one command of a batch. output is the
+slice of the batch output of the command, None if it did not come back.
+error is None, or 'ExceptionType: message' and parsed is None, stage being
+where it failed: 'lookup' of the parser, 'execute' or 'parse' '''
+
+# First lines of the output of a command the device rejected
+_REJECTED = re.compile(r'^\s*% ?(Invalid input|Invalid command|'
+                       r'Incomplete command|Ambiguous command|'
+                       r'Unknown command)', re.IGNORECASE)
+
+
+def _normalize(command):
+    return ' '.join(command.split())
+
+
+def split_output(output, commands, marker):
+    '''Outputs of the commands of a batch, out of the output of the batch
+
+    Args:
+        output (`str`): output of the batch, as echoed by the terminal
+        commands (`list`): commands of the batch, in order
+        marker (`str`): text of the markers, before their index
+
+    Returns:
+        list of the output of each command, None for a command whose output
+        did not come back whole
+    '''
+    # Start and end of the echo of each marker, by index
+    echoes = {}
+    pattern = re.compile(r'^.*{} (\d+|end)[ \t\r]*$'.format(
+        re.escape(marker)), re.MULTILINE)
+    for match in pattern.finditer(output):
+        echoes[match.group(1)] = match.span()
+
+    outputs = []
+    for index, command in enumerate(commands):
+        start = echoes.get(str(index))
+        end = echoes.get(str(index + 1) if index + 1 < len(commands)
+                         else 'end')
+        if start is None or end is None:
+            outputs.append(None)
+            continue
+        lines = output[start[1]:end[0]].splitlines()
+        # Skip what the device answered to the marker, up to the echo of the
+        # command
+        command = _normalize(command)
+        for number, line in enumerate(lines):
+            if _normalize(line).endswith(command):
+                lines = lines[number + 1:]
+                break
+        outputs.append('\n'.join(lines))
+    return outputs
+
+
+def _rejected(output):
+    # The device answers a rejected command within its first lines, the
+    # ^ under the echo then the error
+    lines = [line for line in output.splitlines()[:3] if line.strip()]
+    return any(_REJECTED.match(line) for line in lines[:2])
+
+
+class ConnectionTerminal(object):
+    '''Terminal over the raw services of a unicon connection
+
+    Args:
+        device (`Device`): connected device, with transmit, receive and
+                           receive_buffer
+        timeout (`float`): seconds read_until waits given no timeout
+    '''
+
+    def __init__(self, device, timeout=60):
+        self.device = device
+        self.timeout = timeout
+
+    def write(self, text):
+        self.device.transmit(text)
+
+    def read_until(self, expected, timeout=None):
+        # receive() returns False when it times out, what was received is
+        # in the buffer all the same
+        self.device.receive(re.escape(expected), timeout=self.timeout
+                            if timeout is None else timeout)
+        return self.device.receive_buffer()
+
+
+class MultiCommand(object):
+    '''Executes show commands on a device in one write, then parses them
+
+    Args:
+        device (`Device`): device the parsers are looked up for
+        terminal: written to and read from: write(text), and
+                  read_until(expected, timeout) returning what was read up
+                  to expected, or until timeout when it does not come. If
+                  None, the device itself if it has these, else a
+                  ConnectionTerminal over its connection
+        timeout (`float`): seconds to wait for the outputs of a batch
+
+    example:
+        >>> batch = MultiCommand(device)
+        >>> results = batch.run(['show version', 'show inventory'])
+        >>> results[0].parsed['version']['os']
+        'IOS-XE'
+    '''
+
+    def __init__(self, device, terminal=None, timeout=None):
+        self.device = device
+        if terminal is None:
+            if hasattr(device, 'read_until'):
+                terminal = device
+            elif hasattr(device, 'transmit'):
+                terminal = ConnectionTerminal(device)
+            else:
+                raise TypeError('{} has no terminal to write to, give '
+                                'one'.format(getattr(device, 'name',
+                                                     device)))
+        self.terminal = terminal
+        self.timeout = timeout
+
+    def execute(self, commands):
+        '''Outputs of the commands, in one write
+
+        Args:
+            commands (`list`): commands to execute
+
+        Returns:
+            list of the output of each command, None for a command whose
+            output did not come back whole
+        '''
+        marker = '! genie-batch {}'.format(uuid.uuid4().hex[:12])
+        lines = []
+        for index, command in enumerate(commands):
+            lines.append('{} {}'.format(marker, index))
+            lines.append(command)
+        lines.append('{} end'.format(marker))
+        self.terminal.write('\n'.join(lines) + '\n')
+        output = self.terminal.read_until('{} end'.format(marker),
+                                          self.timeout)
+        return split_output(output, commands, marker)
+
+    def run(self, commands):
+        '''Execute the commands in one write and parse their outputs
+
+        Args:
+            commands (`list`): show commands to execute and parse
+
+        Returns:
+            list of CommandResult, in the order of the commands
+        '''
+        results = [None] * len(commands)
+        parsers = []
+        for index, command in enumerate(commands):
+            try:
+                parsers.append((index, command) +
+                               common.get_parser(command, self.device))
+            except Exception as e:
+                results[index] = CommandResult(command, None, None,
+                                               error_text(e), 'lookup')
+
+        if not parsers:
+            return results
+        try:
+            outputs = self.execute([command for _, command, _, _ in parsers])
+        except Exception as e:
+            # Nothing came back, every command sent fails with the session
+            for index, command, _, _ in parsers:
+                results[index] = CommandResult(command, None, None,
+                                               error_text(e), 'execute')
+            return results
+
+        device = self.device
+        for (index, command, parser_cls, kwargs), output in zip(parsers,
+                                                                outputs):
+            if output is None:
+                results[index] = CommandResult(
+                    command, None, None,
+                    "Exception: No output of '{}', the session ended "
+                    "before it".format(command), 'execute')
+                continue
+            if _rejected(output):
+                error = next(line.strip() for line in output.splitlines()
+                             if _REJECTED.match(line))
+                results[index] = CommandResult(
+                    command, output, None,
+                    'Exception: Rejected by the device: {}'.format(error),
+                    'execute')
+                continue
+            try:
+                parsed = parse_output(
+                    parser_cls, kwargs, output, device.os,
+                    getattr(device, 'platform', None),
+                    getattr(device, 'model', None))
+            except Exception as e:
+                results[index] = CommandResult(command, output, None,
+                                               error_text(e), 'parse')
+                continue
+            results[index] = CommandResult(command, output, parsed, None,
+                                           None)
+        return results
+
+
+def execute_commands(device, commands, terminal=None, timeout=None):
+    '''Execute show commands in one write and parse them, see MultiCommand
+
+    Args:
+        device (`Device`): device the parsers are looked up for
+        commands (`list`): show commands to execute and parse
+        terminal: written to and read from, the device or its connection
+                  if None
+        timeout (`float`): seconds to wait for the outputs
+
+    Returns:
+        list of CommandResult, in the order of the commands
+    '''
+    return MultiCommand(device, terminal=terminal,
+                        timeout=timeout).run(commands)
+
+
+class ReplayTerminal(object):
+    '''Terminal of a device replaying recorded outputs, with its echo
+
+    Each line written is echoed after the prompt, then answered: lines
+    starting with ! are comments, a command without output is rejected as
+    IOS does. read_until takes latency seconds, a round trip; so does
+    execute, which answers a single command as device.execute does.
+
+    Args:
+        name (`str`): name of the device
+        os (`str`): os the parsers are looked up for
+        outputs (`dict`): command -> output, or the golden output dicts of
+                          the parser tests: {'execute.return_value': output}
+        latency (`float`): seconds a round trip takes
+        prompt (`str`): prompt echoed before each line, name# if None
+
+    writes and round_trips count the writes and the round trips.
+    '''
+
+    def __init__(self, name, os, outputs, latency=0, prompt=None):
+        self.name = name
+        self.os = os
+        self.platform = None
+        self.model = None
+        self.latency = latency
+        self.prompt = '{}#'.format(name) if prompt is None else prompt
+        self.outputs = {}
+        for command, output in outputs.items():
+            if isinstance(output, dict):
+                output = output['execute.return_value']
+            self.outputs[_normalize(command)] = output
+        self.writes = 0
+        self.round_trips = 0
+        self._buffer = ''
+
+    def _answer(self, line):
+        if line.lstrip().startswith('!'):
+            return ''
+        try:
+            output = self.outputs[_normalize(line)]
+        except KeyError:
+            return "{}^\n% Invalid input detected at '^' marker.\n\n".format(
+                ' ' * len(self.prompt))
+        return output if output.endswith('\n') else output + '\n'
+
+    def write(self, text):
+        self.writes += 1
+        for line in text.splitlines():
+            self._buffer += '{}{}\r\n'.format(self.prompt, line)
+            self._buffer += self._answer(line)
+
+    def read_until(self, expected, timeout=None):
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+        end = self._buffer.find(expected)
+        end = len(self._buffer) if end < 0 else end + len(expected)
+        output, self._buffer = self._buffer[:end], self._buffer[end:]
+        return output
+
+    def execute(self, command, *args, **kwargs):
+        self.round_trips += 1
+        if self.latency:
+            time.sleep(self.latency)
+        try:
+            return self.outputs[_normalize(command)]
+        except KeyError:
+            raise Exception("Invalid input '{c}' on {d}".format(
+                c=command, d=self.name)) from None
@@ -0,0 +1,250 @@
+'''Cache of parsed outputs, keyed on the output itself
+
+Outputs such as show version, show inventory or show vrf seldom change
+between two polls, yet are parsed again every time. ParseCache keeps the
+parsed output of each (parser class, arguments, output) and returns it
+without running the parser again when the same output comes back:
+
+    cache = ParseCache(maxsize=1024, directory='/var/cache/genie')
+    parsed = cache.parse(ShowVersion(device=device))
+
+or, for every parser of genie.libs.parser:
+
+    with cache.install():
+        parsed = device.parse('show version')
+
+The output given to parse() is hashed. When no output is given, the
+command the parser executes is run once and its output hashed; on a miss
+the parser is given that same output. Parsers executing more than one
+command are not cached, their other outputs are not part of the key.
+
+Parsed outputs are kept serialized: every hit returns a new copy, which
+the caller can modify without altering the cache.
+
+The files of the disk cache are marshal data only, read back with
+marshal.loads which builds values and never runs code: parsed outputs with
+values marshal cannot serialize are cached in memory only. The directory is
+still to be writable by the processes sharing it only, a file replaced there
+is returned as the parsed output of its key. It is not bounded either,
+files are never deleted: clean it up from outside, by age, as a tmp
+directory.
+'''
+
+# python
+import os
+import pickle
+import marshal
+import hashlib
+import tempfile
+import threading
+import contextlib
+import collections
+
+from genie.metaparser import MetaParser
+
+# Parser utils
+from genie.libs.parser.utils.capture import CaptureDevice, Captured
+
+# blake2b is not available before python 3.6
+_hash = getattr(hashlib, 'blake2b', hashlib.sha1)
+
+
+def _digest(*texts):
+    digest = _hash()
+    for text in texts:
+        digest.update(text.encode('utf-8', 'surrogateescape'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _dumps(parsed):
+    # marshal is several times faster than pickle for the dict, list, str
+    # and int of parsed outputs, other types need pickle
+    try:
+        return b'm' + marshal.dumps(parsed)
+    except ValueError:
+        return b'p' + pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+
+
+def _loads(data):
+    if data[:1] == b'm':
+        return marshal.loads(data[1:])
+    return pickle.loads(data[1:])
+
+
+def _load_file(data):
+    # Disk entries are not trusted with pickle: marshal only, anything else
+    # is a miss
+    if data[:1] != b'm':
+        return None
+    try:
+        return marshal.loads(data[1:])
+    except (ValueError, EOFError, TypeError):
+        return None
+
+
+class ParseCache(object):
+    '''LRU cache of parsed outputs
+
+    Args:
+        maxsize (`int`): maximum number of parsed outputs kept in memory
+        maxbytes (`int`): maximum size of the serialized parsed outputs
+                          kept in memory
+        directory (`str`): directory keeping the parsed outputs on disk
+                           too, shared by processes and kept across runs,
+                           see the module for its cleanup
+
+    example:
+        >>> cache = ParseCache(maxsize=2)
+        >>> cache.parse(ShowVersion(device=device), output=output)
+        {'version': {...}}
+        >>> cache.parse(ShowVersion(device=device), output=output)
+        {'version': {...}}
+        >>> cache.stats
+        {'hits': 1, 'misses': 1, 'disk_hits': 0, 'evictions': 0,
+         'uncacheable': 0}
+    '''
+
+    def __init__(self, maxsize=1024, maxbytes=64 * 1024 * 1024,
+                 directory=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.directory = directory
+        self.nbytes = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = dict.fromkeys(['hits', 'misses', 'disk_hits',
+                                    'evictions', 'uncacheable'], 0)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def key(self, parser_cls, kwargs, output, command=None):
+        '''Key of a parsed output'''
+        arguments = sorted((name, repr(value)) for name, value in
+                           kwargs.items() if name != 'output')
+        return _digest(repr(('{}.{}'.format(parser_cls.__module__,
+                                            parser_cls.__qualname__),
+                             arguments, command)), output)
+
+    def get(self, key):
+        '''Return a copy of the parsed output of key, or None'''
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return _loads(data)
+        if self.directory:
+            try:
+                with open(self._path(key), 'rb') as f:
+                    data = f.read()
+            except OSError:
+                pass
+            else:
+                parsed = _load_file(data)
+                if parsed is not None:
+                    self.stats['disk_hits'] += 1
+                    self._store(key, data)
+                    return parsed
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, key, parsed):
+        '''Keep the parsed output of key'''
+        data = _dumps(parsed)
+        self._store(key, data)
+        # Only marshal data goes to disk, see _load_file
+        if self.directory and data[:1] == b'm':
+            # Written then renamed, readers never see a partial file
+            fd, tmp = tempfile.mkstemp(dir=self.directory)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self._path(key))
+
+    def _store(self, key, data):
+        if len(data) > self.maxbytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.nbytes -= len(old)
+            self._entries[key] = data
+            self.nbytes += len(data)
+            while len(self._entries) > self.maxsize or \
+                  self.nbytes > self.maxbytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= len(evicted)
+                self.stats['evictions'] += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, key)
+
+    def clear(self):
+        '''Empty the memory cache, the disk cache is kept'''
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def parse(self, parser, **kwargs):
+        '''parser.parse(**kwargs), returning the cached parsed output if
+        the output was parsed before'''
+        parse = type(parser).parse
+        # Already cached when installed
+        parse = getattr(parse, 'uncached', parse)
+        return self._parse(parser, parse, kwargs)
+
+    def _parse(self, parser, parse, kwargs):
+        device = parser.device
+        output = kwargs.get('output')
+        capture = parser.device = CaptureDevice(device,
+                                                 replay=output is not None)
+        try:
+            if output is None:
+                try:
+                    # Only runs cli() up to its first execute()
+                    parsed = parse(parser, **kwargs)
+                except Captured as e:
+                    if e.capture is not capture:
+                        # Captured by the parse this one is nested in
+                        raise
+                    output = capture.output
+                    capture.replay = True
+                else:
+                    # No command executed, nothing to key on
+                    self.stats['uncacheable'] += 1
+                    return parsed
+
+            key = self.key(type(parser), kwargs, output, capture.command)
+            parsed = self.get(key)
+            if parsed is None:
+                parsed = parse(parser, **kwargs)
+                if capture.cacheable:
+                    self.put(key, parsed)
+                else:
+                    self.stats['uncacheable'] += 1
+            return parsed
+        finally:
+            parser.device = device
+
+    @contextlib.contextmanager
+    def install(self, package='genie.libs.parser'):
+        '''Cache MetaParser.parse of the parsers of package, until the
+        context exits'''
+        original = MetaParser.parse
+        prefix = package + '.'
+        cache = self
+
+        def parse(parser, *args, **kwargs):
+            if args or not type(parser).__module__.startswith(prefix):
+                return original(parser, *args, **kwargs)
+            return cache._parse(parser, original, kwargs)
+
+        parse.uncached = original
+        MetaParser.parse = parse
+        try:
+            yield self
+        finally:
+            MetaParser.parse = original
@@ -0,0 +1,318 @@
+'''Compact binary index of parsers.json
+
+parsers.json holds, for every show command, the doc, schema and url of its
+parsers. Only the package, module_name and class are needed to find the
+parser of a command; this module writes those in a small binary file which
+is memory-mapped and decoded on demand, instead of loading the whole json in
+every process.
+
+File layout, all integers are little-endian unsigned 32 bits:
+
+    header      magic, version, size, modification time (ns, 64 bits) and
+                sha1 digest (20 bytes) of parsers.json, number of strings,
+                number of commands, number of tokens
+    strings     offsets of every string in the blob (number of strings + 1)
+    commands    offset of every command record, in parsers.json order
+    sorted      command indexes sorted by command, for the binary search
+    tokens      string id of every token of parsers.json 'tokens'
+    blob        utf-8 strings
+    records     per command: command string id, number of entries, then
+                per entry: depth, depth token string ids, package, module
+                name and class string ids
+
+The index is up to date when parsers.json has the size and modification time
+of the header. When only the modification time differs, as after parsers.json
+is installed or checked out again, parsers.json is hashed and the index is
+up to date if the digest is the same.
+'''
+
+# python
+import os
+import json
+import mmap
+import struct
+import hashlib
+import logging
+from collections.abc import Mapping
+
+log = logging.getLogger(__name__)
+
+MAGIC = b'GPIX'
+VERSION = 2
+
+_HEADER = struct.Struct('<4sIIQ20sIII')
+_U32 = struct.Struct('<I')
+
+# Keys kept in the index, everything else only lives in parsers.json
+INDEX_KEYS = ('package', 'module_name', 'class')
+
+
+def _entries(value, path=()):
+    '''Flatten one parsers.json command into (token path, parser) tuples'''
+    for key, item in value.items():
+        if not isinstance(item, dict):
+            continue
+        tokens = path + (key,)
+        if 'class' in item:
+            yield tokens, tuple(item[k] for k in INDEX_KEYS)
+        yield from _entries(item, tokens)
+
+
+def _digest(json_path):
+    with open(json_path, 'rb') as f:
+        return hashlib.sha1(f.read()).digest()
+
+
+def _stamp(json_path):
+    '''Size, modification time and digest of parsers.json, as in the header
+
+        Args:
+            json_path (`str`): Location of parsers.json
+
+        Returns:
+            (size, modification time in ns, sha1 digest) (`tuple`)
+    '''
+    stat = os.stat(json_path)
+    return stat.st_size, max(stat.st_mtime_ns, 0), _digest(json_path)
+
+
+def build_index(data, stamp=(0, 0, b'')):
+    '''Build the compact index of parsers.json data
+
+        Args:
+            data (`dict`): Content of parsers.json
+            stamp (`tuple`): Size, modification time and digest of
+                             parsers.json, used to detect an index which
+                             is out of date
+
+        Returns:
+            Index content (`bytes`)
+    '''
+    # string -> string id, and the strings in id order
+    ids = {}
+    strings = []
+
+    def sid(string):
+        if string not in ids:
+            ids[string] = len(strings)
+            strings.append(string)
+        return ids[string]
+
+    commands = [command for command in data if command != 'tokens']
+    tokens = [sid(token) for token in data.get('tokens', [])]
+
+    records = []
+    for command in commands:
+        entries = list(_entries(data[command]))
+        record = [sid(command), len(entries)]
+        for token_path, values in entries:
+            record.append(len(token_path))
+            record.extend(sid(token) for token in token_path)
+            record.extend(sid(value) for value in values)
+        records.append(struct.pack('<%dI' % len(record), *record))
+
+    encoded = [string.encode() for string in strings]
+    string_offsets = [0]
+    for string in encoded:
+        string_offsets.append(string_offsets[-1] + len(string))
+
+    record_offsets = []
+    offset = 0
+    for record in records:
+        record_offsets.append(offset)
+        offset += len(record)
+
+    order = sorted(range(len(commands)), key=lambda i: commands[i].encode())
+
+    content = [_HEADER.pack(MAGIC, VERSION, *stamp, len(encoded),
+                            len(commands), len(tokens))]
+    for table in (string_offsets, record_offsets, order, tokens):
+        content.append(struct.pack('<%dI' % len(table), *table))
+    content.extend(encoded)
+    content.extend(records)
+    return b''.join(content)
+
+
+def write_index(json_path, path):
+    '''Write the compact index of a parsers.json file
+
+        Args:
+            json_path (`str`): Location of parsers.json
+            path (`str`): Location of the index file
+
+        Returns:
+            None
+    '''
+    with open(json_path) as f:
+        data = json.load(f)
+    with open(path, 'wb') as f:
+        f.write(build_index(data, _stamp(json_path)))
+
+
+class ParserIndex(Mapping):
+    '''Read only mapping over the compact index of parsers.json
+
+    Behaves like the content of parsers.json without the doc, schema, uid
+    and url of the parsers. The file is only opened on first access, and
+    commands are decoded one at a time when they are looked up.
+
+        Args:
+            path (`str`): Location of the index file
+            json_path (`str`): Location of parsers.json, used when the
+                               index is missing or out of date
+
+        example:
+
+            >>> data = ParserIndex('parsers.idx', 'parsers.json')
+            >>> data['show version']['iosxe']['class']
+            'ShowVersion'
+    '''
+
+    def __init__(self, path, json_path=None):
+        self.path = path
+        self.json_path = json_path
+        self._buf = None
+        # Decoded commands, commands are looked up over and over
+        self._cache = {}
+
+    def _open(self):
+        if self._buf is not None:
+            return self._buf
+
+        stat = os.stat(self.json_path) \
+            if self.json_path and os.path.isfile(self.json_path) else None
+        buf = None
+        if os.path.isfile(self.path):
+            with open(self.path, 'rb') as f:
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version = _HEADER.unpack_from(buf)[:2]
+            if magic != MAGIC or version != VERSION or \
+               (stat is not None and not self._current(buf, stat)):
+                log.warning("'{p}' is out of date, regenerate it with the "
+                            "sdk_generator".format(p=self.path))
+                buf = None
+
+        if buf is None:
+            # Build the index in memory from parsers.json
+            data = {}
+            if stat is not None:
+                with open(self.json_path) as f:
+                    data = json.load(f)
+            else:
+                log.warning('parsers.json does not exist, make sure you '
+                            'are running with latest version of '
+                            'genie.libs.parsers')
+            buf = build_index(data)
+
+        (self._n_strings, self._n_commands,
+         self._n_tokens) = _HEADER.unpack_from(buf)[5:]
+        offset = _HEADER.size
+        self._strings_at = offset
+        offset += (self._n_strings + 1) * 4
+        self._commands_at = offset
+        offset += self._n_commands * 4
+        self._sorted_at = offset
+        offset += self._n_commands * 4
+        self._tokens_at = offset
+        offset += self._n_tokens * 4
+        self._blob_at = offset
+        self._records_at = offset + _U32.unpack_from(
+            buf, self._strings_at + self._n_strings * 4)[0]
+        self._buf = buf
+        return buf
+
+    def _current(self, buf, stat):
+        '''Whether the index of buf is that of parsers.json'''
+        size, mtime, digest = _HEADER.unpack_from(buf)[2:5]
+        if size != stat.st_size:
+            return False
+        if mtime == max(stat.st_mtime_ns, 0):
+            return True
+        # Same size, touched since: same content if same digest
+        return digest == _digest(self.json_path)
+
+    def _u32(self, offset):
+        return _U32.unpack_from(self._buf, offset)[0]
+
+    def _bytes(self, sid):
+        start, end = struct.unpack_from('<II', self._buf,
+                                        self._strings_at + sid * 4)
+        return self._buf[self._blob_at + start:self._blob_at + end]
+
+    def _string(self, sid):
+        return self._bytes(sid).decode()
+
+    def _record(self, index):
+        '''Offset of the record of the index-th command'''
+        return self._records_at + self._u32(self._commands_at + index * 4)
+
+    def _command(self, index):
+        return self._string(self._u32(self._record(index)))
+
+    def _find(self, command):
+        '''Binary search of a command, returns its index or None'''
+        self._open()
+        key = command.encode()
+        low, high = 0, self._n_commands
+        while low < high:
+            mid = (low + high) // 2
+            index = self._u32(self._sorted_at + mid * 4)
+            current = self._bytes(self._u32(self._record(index)))
+            if current < key:
+                low = mid + 1
+            elif current > key:
+                high = mid
+            else:
+                return index
+        return None
+
+    def _decode(self, index):
+        offset = self._record(index) + 4
+        n_entries = self._u32(offset)
+        offset += 4
+        value = {}
+        for _ in range(n_entries):
+            depth = self._u32(offset)
+            ids = struct.unpack_from('<%dI' % (depth + 3), self._buf,
+                                     offset + 4)
+            offset += (depth + 4) * 4
+            node = value
+            for sid in ids[:depth]:
+                node = node.setdefault(self._string(sid), {})
+            node.update(zip(INDEX_KEYS, map(self._string, ids[depth:])))
+        return value
+
+    @property
+    def tokens(self):
+        '''Tokens of parsers.json, ex: ['ios', 'iosxe', 'asr1k', ...]'''
+        self._open()
+        return [self._string(self._u32(self._tokens_at + i * 4))
+                for i in range(self._n_tokens)]
+
+    def __getitem__(self, command):
+        if command == 'tokens':
+            return self.tokens
+        try:
+            return self._cache[command]
+        except KeyError:
+            pass
+        index = self._find(command)
+        if index is None:
+            raise KeyError(command)
+        value = self._cache[command] = self._decode(index)
+        return value
+
+    def __contains__(self, command):
+        if command == 'tokens' or command in self._cache:
+            return True
+        return self._find(command) is not None
+
+    def __iter__(self):
+        self._open()
+        yield 'tokens'
+        for index in range(self._n_commands):
+            yield self._command(index)
+
+    def __len__(self):
+        self._open()
+        return self._n_commands + 1
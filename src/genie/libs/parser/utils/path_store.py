@@ -0,0 +1,264 @@
+'''Shared path attributes of parsed BGP tables
+
+Each path of a parsed BGP table is a dict of its own, holding its own copies
+of the next hop, AS path, communities, origin and local preference: a full
+table of 900k prefixes is millions of dicts and strings, while a few tens of
+thousands of different attribute sets make all its paths. A PathStore keeps
+one read-only dict of each set of attributes, the paths of the parsed output
+are those of the store:
+
+    store = PathStore()
+    parsed = ShowBgpVrfAllAll(device=device).parse_shared(store=store)
+    path = parsed['vrf']['default']['address_family']['ipv4 unicast'][
+        'prefixes']['10.1.0.0/24']['index'][1]
+    path['next_hop'], path['path']
+    dict(path)    # to change it
+
+parse_shared() shares the paths while they are parsed. The parsers get the
+dict of each path they fill from open_path(): when the parser opens the next
+path, the one it filled before is replaced by the dict of the store and
+released, the table holds one dict per set of attributes during the parse as
+after it. The output is validated in place against the compiled schema of
+the parser, parse() would validate it through the schema engine, which
+copies every dict of the output and the paths with them.
+
+The prefixes of the tables, keyed by data, stay dicts, their index of paths
+is shared with the prefixes with the same paths. share_paths() shares the
+paths of an output parsed already. A store given to several parses shares
+the attributes across their outputs.
+'''
+
+# Parser utils
+from genie.libs.parser.utils.records import gc_paused
+from genie.libs.parser.utils.schema_compiler import compile_schema
+
+# Keys of the prefix tables in the parsed outputs
+_TABLES = ('prefixes', 'prefix')
+
+
+class SharedDict(dict):
+    '''Read-only dict of a PathStore, shared by the paths equal to it
+
+    A dict for the schemas and the callers, which cannot change it: dict()
+    of it gives a copy to change.
+    '''
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("'{}' is shared, it cannot be changed"
+                        .format(type(self).__name__))
+
+    __setitem__ = __delitem__ = setdefault = update = pop = popitem = \
+        clear = _read_only
+
+    def __reduce__(self):
+        # Copied and pickled whole, not item by item
+        return type(self), (dict(self),)
+
+
+class PathStore(object):
+    '''One read-only dict of each set of path attributes
+
+    example:
+        >>> store = PathStore()
+        >>> first = store.share({'next_hop': '10.1.1.1', 'localpref': 100})
+        >>> first is store.share({'next_hop': '10.1.1.1', 'localpref': 100})
+        True
+        >>> store.stats
+        {'hits': 1, 'misses': 1, 'size': 1}
+    '''
+
+    def __init__(self):
+        # (keys, values) -> shared dict
+        self._dicts = {}
+        self.hits = self.misses = 0
+
+    @property
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses,
+                'size': len(self._dicts)}
+
+    def __len__(self):
+        return len(self._dicts)
+
+    def clear(self):
+        '''Forget the dicts, the parsed outputs keep theirs'''
+        self._dicts.clear()
+
+    def share(self, value):
+        '''The dict of the store equal to a dict, its dicts shared too
+
+        Args:
+            value (`dict`): path, or any dict of attributes
+
+        Returns:
+            `SharedDict` equal to value, the same one for equal dicts. Dicts
+            with values that are not hashable are not shared.
+        '''
+        if type(value) is SharedDict:
+            return value
+        # One flat tuple of names, types and values: True and 1 are equal,
+        # their types are not. The dicts of the values are those of the
+        # store, the same one for equal values
+        key = []
+        shared = None
+        for name, item in value.items():
+            if isinstance(item, dict):
+                if shared is None:
+                    shared = dict(value)
+                item = shared[name] = self.share(item)
+                key += (name, SharedDict, id(item))
+            else:
+                key += (name, item.__class__, item)
+        items = value if shared is None else shared
+        key = tuple(key)
+        try:
+            shared = self._dicts.get(key)
+        except TypeError:
+            return SharedDict(items)
+        if shared is not None:
+            self.hits += 1
+            return shared
+        self.misses += 1
+        shared = self._dicts[key] = SharedDict(items)
+        return shared
+
+    def prefixes(self, prefixes):
+        '''Share the paths of the prefixes of a prefix table, in place
+
+        Args:
+            prefixes (`dict`): prefix -> dict of the prefix, its paths under
+                               index
+
+        Returns:
+            prefixes
+        '''
+        share = self.share
+        for entry in prefixes.values():
+            if type(entry) is not dict:
+                continue
+            # The prefix has values of its own, table version, paths
+            # available: it is not shared, its dicts are
+            shared = [(key, share(item)) for key, item in entry.items()
+                      if type(item) is dict]
+            for key, item in shared:
+                entry[key] = item
+        return prefixes
+
+
+class _PathSharing(object):
+    # Path a parse_shared() fills, shared once the next one is opened
+
+    __slots__ = ('store', 'paths', 'index')
+
+    def __init__(self, store):
+        self.store = store
+        self.paths = self.index = None
+
+    def open(self, paths, index, path):
+        last = self.paths
+        if last is not None and (last is not paths or self.index != index):
+            previous = last.get(self.index)
+            if type(previous) is dict:
+                last[self.index] = self.store.share(previous)
+        if type(path) is not dict:
+            # Shared already, filled again
+            path = paths[index] = dict(path)
+        self.paths = paths
+        self.index = index
+        return path
+
+
+def open_path(parser, paths, index):
+    '''Dict of a path of a prefix, to fill while parsing
+
+    While parse_shared() runs, the path opened before is shared in the
+    store of the parse: the parser only fills the path it opened last.
+
+    Args:
+        parser (`MetaParser`): parser filling the path
+        paths (`dict`): index -> path of the prefix
+        index (`int`): index of the path
+
+    Returns:
+        `dict`, paths[index], a new one if there is none
+    '''
+    path = paths.get(index)
+    if path is None:
+        path = paths[index] = {}
+    sharing = getattr(parser, '_path_sharing', None)
+    if sharing is not None:
+        path = sharing.open(paths, index, path)
+    return path
+
+
+def share_paths(parsed, store=None):
+    '''Share the paths of the prefixes of a parsed BGP table, in place
+
+    Args:
+        parsed (`dict`): parsed output, its prefix tables under 'prefixes'
+                         or 'prefix' keys
+        store (`PathStore`): store of the paths, a new one if None
+
+    Returns:
+        parsed
+    '''
+    if store is None:
+        store = PathStore()
+    with gc_paused():
+        stack = [parsed]
+        while stack:
+            value = stack.pop()
+            for key, item in value.items():
+                if type(item) is not dict:
+                    continue
+                if key in _TABLES:
+                    store.prefixes(item)
+                else:
+                    stack.append(item)
+    return parsed
+
+
+class SharedPathParser(object):
+    '''Parser mixin giving its parsed output with shared paths
+
+    path_store is the store of the parses given none, a new one for each
+    parse if None.
+
+    example:
+        >>> ShowBgpVrfAllAll.path_store = PathStore()
+        >>> parsed = ShowBgpVrfAllAll(device=device).parse_shared()
+        >>> parsed == ShowBgpVrfAllAll(device=device).parse()
+        True
+    '''
+
+    path_store = None
+    _path_sharing = None
+
+    def parse_shared(self, store=None, **kwargs):
+        '''cli(), the paths shared in a PathStore while they are parsed
+
+        Args:
+            store (`PathStore`): store of the paths, path_store if None
+            kwargs: arguments of cli()
+
+        Returns:
+            parsed output, equal to that of parse()
+
+        Raises:
+            SchemaEmptyParserError: nothing parsed
+            SchemaError: the output does not match the schema
+        '''
+        if store is None:
+            store = self.path_store if self.path_store is not None \
+                else PathStore()
+        self._path_sharing = _PathSharing(store)
+        try:
+            with gc_paused():
+                parsed = self.cli(**kwargs)
+        finally:
+            self._path_sharing = None
+        compile_schema(self.schema).validate(parsed)
+        # The last path, and the indexes of the prefixes
+        return share_paths(parsed, store)
@@ -0,0 +1,240 @@
+'''Compact parsed outputs of large tables
+
+A full route, BGP or MAC address table is parsed into millions of small
+dicts, one per route, path or next hop, each holding its own hash table of
+keys. compact() converts the dicts whose keys are fixed by the schema of the
+parser into records: __slots__ objects whose keys are held once by their
+class, all the entries with the same keys sharing one class. The dicts
+keyed by data, the routes of a VRF or the next hops of a route, are kept:
+
+    parsed = compact(ShowIpRoute(device=device).parse(),
+                     ShowIpRoute.schema)
+    route = parsed['vrf']['default']['address_family']['ipv4']['routes'][
+        '10.1.0.0/24']
+    route['metric'], route.metric
+    route.to_dict()
+
+Records are read-only mappings: they are indexed, iterated and compared like
+the dicts they replace, compact(parsed) == parsed, but they are not dicts.
+expand() gives back the parsed output as returned by parse().
+'''
+
+# python
+import gc
+import keyword
+import collections.abc
+
+from genie.metaparser.util.schemaengine import Optional
+
+# keys -> record class
+_record_classes = {}
+
+
+class Record(collections.abc.Mapping):
+    '''Read-only mapping of the keys of its class to the values of its slots
+
+    Built by record_class(), the keys are class attributes and the values
+    the slots of the instances.
+    '''
+
+    __slots__ = ()
+
+    # keys, in order, key -> slot descriptor, and the __set__ of the slots
+    _keys = ()
+    _slots = {}
+    _setters = ()
+
+    def __getitem__(self, key):
+        try:
+            return self._slots[key].__get__(self)
+        except (KeyError, TypeError):
+            raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        try:
+            return key in self._slots
+        except TypeError:
+            return False
+
+    def values(self):
+        return [slot.__get__(self) for slot in self._slots.values()]
+
+    def items(self):
+        return list(zip(self._keys, self.values()))
+
+    def __setattr__(self, name, value):
+        raise AttributeError('records are read-only, to_dict() them')
+
+    def __delattr__(self, name):
+        raise AttributeError('records are read-only, to_dict() them')
+
+    def to_dict(self):
+        '''The dict of the record, nested records included'''
+        return expand(self)
+
+    def __reduce__(self):
+        return make_record, (self._keys, tuple(self.values()))
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__, ', '.join(
+            '{!r}: {!r}'.format(key, value) for key, value in self.items()))
+
+
+def _slot_name(key, index):
+    # Keys which are identifiers are attributes of the record too
+    if isinstance(key, str) and key.isidentifier() and \
+            not keyword.iskeyword(key) and not key.startswith('_') and \
+            not hasattr(Record, key):
+        return key
+    return '_{}'.format(index)
+
+
+def record_class(keys):
+    '''Record class of keys, one class per tuple of keys
+
+    Args:
+        keys (`tuple`): keys of the records, in order
+
+    Returns:
+        subclass of `Record`
+    '''
+    keys = tuple(keys)
+    try:
+        return _record_classes[keys]
+    except KeyError:
+        pass
+    names = tuple(_slot_name(key, index) for index, key in enumerate(keys))
+    cls = type('Record', (Record,), {'__slots__': names,
+                                     '__module__': __name__})
+    cls._keys = keys
+    cls._slots = collections.OrderedDict(
+        (key, getattr(cls, name)) for key, name in zip(keys, names))
+    cls._setters = tuple(slot.__set__ for slot in cls._slots.values())
+    return _record_classes.setdefault(keys, cls)
+
+
+def make_record(keys, values):
+    '''Record of keys and values
+
+    Args:
+        keys (`tuple`): keys of the record, in order
+        values (`tuple`): values of the keys
+
+    Returns:
+        `Record`
+    '''
+    cls = record_class(keys)
+    record = cls.__new__(cls)
+    for set_value, value in zip(cls._setters, values):
+        set_value(record, value)
+    return record
+
+
+def _plan(schema, plans):
+    # (fixed key -> plan of its value, plan of the values of the other keys,
+    # record or not) of a schema dict, None for the other schemas. Fixed
+    # keys whose values are not dicts have no plan. Plans are kept in plans
+    # by schema, parsers share sub-schemas
+    if type(schema) is not dict:
+        schema = getattr(schema, 'schema', schema)
+        if not isinstance(schema, dict):
+            return None
+    plan = plans.get(id(schema))
+    if plan is None:
+        fixed = {}
+        table = None
+        for key, value in schema.items():
+            if type(key) is Optional:
+                key = key.schema
+            if not isinstance(key, str):
+                # Any(), types and Or(), keys which are data
+                table = value
+                continue
+            value = _plan(value, plans)
+            if value is not None:
+                fixed[key] = value
+        plan = plans[id(schema)] = (fixed, _plan(table, plans),
+                                    table is None)
+    return plan
+
+
+def _compact(value, plan):
+    fixed, table, record = plan
+    if not record:
+        return {key: _compact(item, fixed.get(key, table))
+                if type(item) is dict and (key in fixed or table) else item
+                for key, item in value.items()}
+    keys = tuple(value)
+    cls = _record_classes.get(keys) or record_class(keys)
+    compacted = cls.__new__(cls)
+    for set_value, key, item in zip(cls._setters, keys, value.values()):
+        if type(item) is dict and key in fixed:
+            item = _compact(item, fixed[key])
+        set_value(compacted, item)
+    return compacted
+
+
+def compact(parsed, schema):
+    '''Parsed output with the dicts of fixed keys converted to records
+
+    Args:
+        parsed (`dict`): parsed output
+        schema (`dict`): schema of the parsed output, the schema attribute
+                         of the parser
+
+    Returns:
+        `dict`, equal to parsed
+    '''
+    plan = _plan(schema, {})
+    if plan is None or type(parsed) is not dict:
+        return parsed
+    # The parsed output itself stays a dict
+    with gc_paused():
+        return _compact(parsed, plan[:2] + (False,))
+
+
+def expand(value):
+    '''Parsed output with the records converted back to dicts'''
+    with gc_paused():
+        return _expand(value)
+
+
+def _expand(value):
+    if type(value) is dict or isinstance(value, Record):
+        return {key: _expand(item) for key, item in value.items()}
+    return value
+
+
+class gc_paused(object):
+    '''Context with the garbage collector disabled
+
+    Millions of containers are created and none is collectable: the
+    collections they trigger would walk the whole table over and over.
+    '''
+    def __enter__(self):
+        self.enabled = gc.isenabled()
+        gc.disable()
+
+    def __exit__(self, *exc):
+        if self.enabled:
+            gc.enable()
+
+
+class CompactParser(object):
+    '''Parser mixin giving its parsed output in records
+
+    example:
+        >>> parsed = ShowIpRoute(device=device).parse_compact(vrf='VRF1')
+        >>> parsed == ShowIpRoute(device=device).parse(vrf='VRF1')
+        True
+    '''
+
+    def parse_compact(self, **kwargs):
+        '''parse(), the dicts of fixed keys of the output in records'''
+        return compact(self.parse(**kwargs), self.schema)
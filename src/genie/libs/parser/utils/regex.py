@@ -0,0 +1,95 @@
+'''Regexes declared once per parser class
+
+Parsers used to call re.compile for each of their patterns on every cli()
+call, relying on the cache of the re module. That cache only holds 512
+patterns, less than the patterns of a handful of big parsers, so with
+hundreds of parsers used in the same process every call compiles its
+patterns again.
+
+Patterns are instead declared in the class body and compiled the first time
+they are used:
+
+    class ShowInterfaces(ShowInterfacesSchema):
+
+        # GigabitEthernet1 is up, line protocol is up
+        p1 = LazyRegex(r'^(?P<interface>\\S+) +is +(?P<enabled>.+)$')
+
+        def cli(self, output=None):
+            ...
+            m = self.p1.match(line)
+'''
+
+# python
+import re
+import itertools
+
+# LazyRegex are numbered as they are created, to keep the declaration order
+# of a class without relying on the order of its __dict__
+_counter = itertools.count()
+
+# (class, attribute name) -> declaration number, kept once the LazyRegex
+# has been replaced by its compiled regex
+_declared = {}
+
+
+class LazyRegex(object):
+    '''Class attribute holding a regex compiled on first use
+
+    On first access the compiled regex replaces the LazyRegex on the class
+    which declared it, following accesses are plain attribute lookups.
+
+        Args:
+            pattern (`str`): Regex, as given to re.compile
+            flags (`int`): Regex flags, as given to re.compile
+
+        example:
+
+            >>> class Parser(object):
+            ...     p1 = LazyRegex(r'^Hostname: +(?P<hostname>\\S+)$')
+            >>> Parser().p1.match('Hostname: R1').groupdict()
+            {'hostname': 'R1'}
+    '''
+
+    __slots__ = ('pattern', 'flags', 'order')
+
+    def __init__(self, pattern, flags=0):
+        self.pattern = pattern
+        self.flags = flags
+        self.order = next(_counter)
+
+    def __get__(self, instance, owner):
+        compiled = self.compile()
+        # Replace the descriptor where it is declared, subclasses inherit
+        # the compiled regex
+        for cls in owner.__mro__:
+            for name, value in list(vars(cls).items()):
+                if value is self:
+                    _declared[(cls, name)] = self.order
+                    setattr(cls, name, compiled)
+        return compiled
+
+    def compile(self):
+        return re.compile(self.pattern, self.flags)
+
+    def __repr__(self):
+        return '{c}({p!r})'.format(c=self.__class__.__name__, p=self.pattern)
+
+
+def compile_regexes(cls):
+    '''Compile all the LazyRegex of a parser class and its parents
+
+        Args:
+            cls (`class`): Parser class
+
+        Returns:
+            list of (attribute name, compiled regex), in declaration order
+    '''
+    regexes = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in list(vars(klass).items()):
+            if isinstance(value, LazyRegex):
+                regexes[name] = value.order
+            elif (klass, name) in _declared:
+                regexes[name] = _declared[(klass, name)]
+    return [(name, getattr(cls, name))
+            for name in sorted(regexes, key=regexes.get)]
@@ -0,0 +1,370 @@
+'''Differential re-parse of polled outputs
+
+Polling show interfaces every 30 seconds, the output hardly changes between
+two polls: counters, rates and the last input and output times. Parsing it
+again re-derives the same type, MTU, duplex and members of every interface.
+
+DifferentialParser.reparse() compares the output with the output of the
+previous poll, line by line. The lines which changed are re-parsed with the
+lines of the block they depend on only, and their values are written over
+the previous parsed output:
+
+    snapshot = parser.reparse(device.execute('show interfaces'))
+    ...
+    snapshot = parser.reparse(device.execute('show interfaces'),
+                              previous=snapshot)
+    snapshot.parsed
+    snapshot.changed
+    {('GigabitEthernet1', 'counters', 'in_pkts'), ...}
+
+Parsers declare in reparse_lines the regexes of the lines expected to change
+between polls, with the regexes of the lines they depend on. Any other
+change, an interface added or a line protocol going down, parses the whole
+output again.
+
+The parsed outputs of the snapshots share the dicts which did not change:
+they are not to be modified in place.
+'''
+
+# python
+import re
+import logging
+import operator
+import itertools
+
+# Parser utils
+from genie.libs.parser.utils.blocks import BlockParser, parser_regexes, \
+                                          unnamed_pattern
+from genie.libs.parser.utils.schema_compiler import compile_schema
+
+log = logging.getLogger(__name__)
+
+_missing = object()
+
+# Category of the header lines, context lines are categorized by their level
+# and the lines of reparse_lines by their regex
+_HEADER = object()
+
+
+class ParseSnapshot(object):
+    '''Output of a command and its parsed output
+
+    Args:
+        output (`str`): output of the command
+        parsed (`dict`): parsed output
+        changed (`set`): paths of the values which changed since the
+                         previous snapshot, tuples of keys
+
+    stats gives how the snapshot was parsed: 'full' parse of the output or
+    not, number of 'lines' which changed and of 'blocks' re-parsed.
+    '''
+
+    def __init__(self, output, parsed, changed=None):
+        self.output = output
+        self.parsed = parsed
+        self.changed = changed
+        self.stats = {}
+        self._lines = None
+        # Categories and parsed heads of the blocks, kept from snapshot to
+        # snapshot and checked against the lines before use
+        self._cache = {'categories': {}, 'heads': {}}
+
+    @property
+    def lines(self):
+        if self._lines is None:
+            self._lines = self.output.splitlines()
+        return self._lines
+
+    def __repr__(self):
+        return '<{c} {n} changed, {s}>'.format(
+            c=type(self).__name__,
+            n=len(self.changed) if self.changed is not None else '?',
+            s=self.stats)
+
+
+def changed_paths(old, new, path=(), changed=None):
+    '''Paths of the values which differ between two parsed outputs
+
+    Values added, removed or modified are reported, with the path of the
+    outermost dict added or removed.
+
+    Returns:
+        `set` of tuples of keys
+    '''
+    if changed is None:
+        changed = set()
+    for key in old.keys() | new.keys():
+        old_value = old.get(key, _missing)
+        new_value = new.get(key, _missing)
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            if old_value is not new_value:
+                changed_paths(old_value, new_value, path + (key,), changed)
+        elif old_value != new_value:
+            changed.add(path + (key,))
+    return changed
+
+
+def _classifier(categories):
+    # line -> category of the first regex of categories matching it, one
+    # regex for all of them when they can be combined
+    names = [name for name, regex in categories]
+    regexes = [regex for name, regex in categories]
+    if not regexes:
+        return lambda line: None
+    flags = set(regex.flags for regex in regexes)
+    if len(flags) == 1 and not any('(?P=' in regex.pattern
+                                   for regex in regexes):
+        try:
+            combined = re.compile('|'.join(
+                '(?P<_{i}>{p})'.format(i=index, p=unnamed_pattern(regex))
+                for index, regex in enumerate(regexes)), flags.pop())
+        except re.error:
+            pass
+        else:
+            match = combined.match
+
+            def classify(line):
+                m = match(line)
+                return names[int(m.lastgroup[1:])] if m else None
+
+            return classify
+
+    def classify(line):
+        for name, regex in categories:
+            if regex.match(line):
+                return name
+
+    return classify
+
+
+def _name(regex):
+    return regex if isinstance(regex, str) else regex.pattern
+
+
+class DifferentialParser(BlockParser):
+    '''Block parser re-parsing only the lines which changed since the
+    previous output
+
+    reparse_lines lists the regexes of the lines expected to change between
+    two outputs, each with the regexes of the lines it is to be re-parsed
+    with: the lines setting the dicts it writes into or the values it reads.
+    Regexes are given as for block_header. A line which changed is
+    re-parsed, under the context and header lines of its block, with the
+    lines of its block matching its regex or the regexes it depends on,
+    transitively.
+
+    example:
+        >>> parser = ShowInterfaces(device=device)
+        >>> snapshot = parser.reparse(output)
+        >>> snapshot = parser.reparse(next_output, previous=snapshot)
+        >>> snapshot.changed
+        {('GigabitEthernet1', 'counters', 'in_pkts'), ...}
+        >>> snapshot.stats
+        {'full': False, 'lines': 12, 'blocks': 4}
+    '''
+
+    # (regex, regexes) pairs: regex of a line changing between two outputs,
+    # regexes of the lines it is re-parsed with
+    reparse_lines = ()
+
+    def reparse(self, output, previous=None, **kwargs):
+        '''Parse output, re-parsing only what changed since previous
+
+        Args:
+            output (`str`): output to parse
+            previous (`ParseSnapshot`): snapshot of the previous output, as
+                                        returned by reparse(), or built
+                                        from a stored output and its parsed
+                                        output. None to parse output fully
+            kwargs: arguments of cli()
+
+        Returns:
+            `ParseSnapshot` of output, changed being the paths which
+            changed since previous
+        '''
+        snapshot = ParseSnapshot(output, None)
+        if previous is not None:
+            snapshot._cache = previous._cache
+            if output == previous.output:
+                snapshot.parsed = previous.parsed
+                snapshot.changed = set()
+                snapshot.stats = {'full': False, 'lines': 0, 'blocks': 0}
+                return snapshot
+            if self._reparse_changed(snapshot, previous, kwargs):
+                return snapshot
+
+        parsed = self.cli(output=output, **kwargs)
+        schema = getattr(self, 'schema', None)
+        if schema:
+            compile_schema(schema).validate(parsed)
+        snapshot.parsed = parsed
+        snapshot.changed = changed_paths(
+            previous.parsed if previous is not None else {}, parsed)
+        snapshot.stats = {'full': True}
+        return snapshot
+
+    def _reparse_plan(self):
+        # Classifier of the stripped lines, and the categories each
+        # changing category is re-parsed with, per parser class
+        cls = type(self)
+        plan = cls.__dict__.get('_reparse')
+        if plan is None:
+            categories = [(level, regex)
+                          for level, regexes in enumerate(self.block_context)
+                          for regex in parser_regexes(self, regexes)]
+            categories.extend(
+                (_HEADER, regex)
+                for regex in parser_regexes(self, self.block_header))
+            depends = {}
+            for regex, regexes in self.reparse_lines:
+                depends[_name(regex)] = set(_name(other)
+                                            for other in regexes)
+                for other in (regex,) + tuple(regexes):
+                    if all(_name(other) != name for name, _ in categories):
+                        categories.extend(
+                            (_name(other), compiled)
+                            for compiled in parser_regexes(self, other))
+            # Transitive dependencies
+            for name, names in depends.items():
+                pending = list(names)
+                names.add(name)
+                while pending:
+                    for other in depends.get(pending.pop(), ()):
+                        if other not in names:
+                            names.add(other)
+                            pending.append(other)
+            plan = cls._reparse = (_classifier(categories), depends)
+        return plan
+
+    def _reparse_changed(self, snapshot, previous, kwargs):
+        # Re-parse the blocks of the lines which changed, into
+        # snapshot.parsed. False when the output needs a full parse
+        old_lines = previous.lines
+        lines = snapshot.lines
+        if len(old_lines) != len(lines):
+            return False
+        changed_lines = list(itertools.compress(
+            itertools.count(), map(operator.ne, old_lines, lines)))
+
+        classify, depends = self._reparse_plan()
+        cache = snapshot._cache['categories']
+
+        def category(index):
+            line = lines[index]
+            cached = cache.get(index)
+            if cached is not None and cached[0] == line:
+                return cached[1]
+            found = classify(line.strip())
+            cache[index] = (line, found)
+            return found
+
+        blocks = []
+        for index in changed_lines:
+            name = category(index)
+            if name not in depends or \
+                    classify(old_lines[index].strip()) != name:
+                # Not a line expected to change
+                return False
+            if blocks and index < blocks[-1][1]:
+                blocks[-1][2].update(depends[name])
+                continue
+            start = self._block_start(index, category, lines)
+            if start is None:
+                return False
+            end = index + 1
+            while end < len(lines):
+                found = category(end)
+                if found is _HEADER or isinstance(found, int):
+                    break
+                end += 1
+            blocks.append((start, end, set(depends[name])))
+
+        heads = snapshot._cache['heads']
+        parsed = dict(previous.parsed)
+        copied = {id(parsed)}
+        changed = set()
+        for start, end, names in blocks:
+            categories = [category(index) for index in range(start, end)]
+            head = '\n'.join(self._block_context(start, category, lines) +
+                             [line for line, found in
+                              zip(lines[start:end], categories)
+                              if found is _HEADER])
+            reparsed = '\n'.join(
+                [head] + [line for line, found in
+                          zip(lines[start:end], categories)
+                          if found is not _HEADER and found in names])
+            try:
+                cached = heads.get(start)
+                if cached is not None and cached[0] == head:
+                    head_parsed = cached[1]
+                else:
+                    head_parsed = self.cli(output=head, **kwargs)
+                    heads[start] = (head, head_parsed)
+                reparsed = self.cli(output=reparsed, **kwargs)
+            except Exception as e:
+                log.debug('{p}: lines {s}-{e} re-parsed with the whole '
+                          'output: {r!r}'.format(p=type(self).__name__,
+                                                 s=start, e=end, r=e))
+                return False
+            _overlay(parsed, reparsed, head_parsed, (), changed, copied)
+
+        snapshot.parsed = parsed
+        snapshot.changed = changed
+        snapshot.stats = {'full': False, 'lines': len(changed_lines),
+                          'blocks': len(blocks)}
+        return True
+
+    def _block_start(self, index, category, lines):
+        # First line of the block of the line at index, its first header
+        while index >= 0:
+            found = category(index)
+            if found is _HEADER:
+                break
+            if isinstance(found, int):
+                # Not in a block
+                return None
+            index -= 1
+        else:
+            return None
+        # Consecutive headers belong to the same block
+        start = index
+        index -= 1
+        while index >= 0:
+            if category(index) is _HEADER:
+                start = index
+            elif lines[index].strip():
+                break
+            index -= 1
+        return start
+
+    def _block_context(self, start, category, lines):
+        # Context lines in effect at start, outermost first
+        context = {}
+        index = start - 1
+        while index >= 0 and 0 not in context and self.block_context:
+            level = category(index)
+            # Deeper levels are reset by the lines of this level
+            if isinstance(level, int) and level not in context and \
+                    not any(other < level for other in context):
+                context[level] = lines[index]
+            index -= 1
+        return [context[level] for level in sorted(context)]
+
+
+def _overlay(parsed, reparsed, head, path, changed, copied):
+    # Write the values of reparsed which are not values of the header lines
+    # over parsed, copying the dicts of the previous output before changing
+    # them
+    for key, value in reparsed.items():
+        head_value = head.get(key, _missing)
+        old = parsed.get(key, _missing)
+        if isinstance(value, dict) and isinstance(old, dict):
+            if id(old) not in copied:
+                old = parsed[key] = dict(old)
+                copied.add(id(old))
+            _overlay(old, value,
+                     head_value if isinstance(head_value, dict) else {},
+                     path + (key,), changed, copied)
+        elif head_value is _missing and old != value:
+            parsed[key] = value
+            changed.add(path + (key,))
@@ -0,0 +1,366 @@
+'''Longest prefix match index of parsed route tables
+
+Checking the reachability of an address against a parsed route table scans
+every route of the routes dict, converting each prefix with netaddr. A
+RouteIndex keeps the routes of each vrf and address family in a binary
+radix trie, path compressed: a lookup walks at most one node per bit of the
+address, whatever the size of the table.
+
+    index = RouteIndex.from_parsed(ShowIpRoute(device=device).parse())
+    index.lookup('10.4.1.7')
+    ('10.4.1.0/24', {'route': '10.4.1.0/24', 'active': True, ...})
+    index.covering('10.4.1.0/24')    # the routes of the supernets
+    index.covered('10.0.0.0/8')      # the routes of the subnets
+    index.via('10.186.2.2')          # the prefixes routed through a next hop
+
+from_parsed reads the two shapes of the route parsers:
+
+    * vrf/address_family/routes/<prefix>/next_hop, the iosxe and iosxr
+      ShowIpRoute, ShowIpv6Route, ShowRouteIpv4 and ShowRouteIpv6, nxos
+      ShowIpRoute
+    * vrf/address_family/ip/<prefix>/best_route, nxos ShowRoutingVrfAll
+      and ShowRoutingIpv6VrfAll
+
+The trie holds the prefixes as ints and references the route dicts of the
+parsed output, which are not copied. The address family of a route is
+that of its prefix, ipv4 or ipv6, whatever the key of the address family
+in the parsed output.
+'''
+
+# python
+import socket
+
+_FAMILIES = {'ipv4': (socket.AF_INET, 32), 'ipv6': (socket.AF_INET6, 128)}
+
+# Value of the nodes of the trie that are only branches
+_EMPTY = object()
+
+
+def parse_prefix(prefix):
+    '''Address family, network and length of a prefix
+
+    Args:
+        prefix (`str`): address/length, or an address for a host route
+
+    Returns:
+        ('ipv4' or 'ipv6', network as an int, length), the host bits of the
+        network cleared
+
+    Raises:
+        ValueError: not a prefix
+    '''
+    address, _, length = prefix.partition('/')
+    af = 'ipv6' if ':' in address else 'ipv4'
+    family, bits = _FAMILIES[af]
+    try:
+        key = int.from_bytes(socket.inet_pton(family, address), 'big')
+    except OSError:
+        raise ValueError('{!r} is not a prefix'.format(prefix)) from None
+    length = int(length) if length else bits
+    if not 0 <= length <= bits:
+        raise ValueError('{!r} is not a prefix'.format(prefix))
+    return af, key >> (bits - length) << (bits - length), length
+
+
+class _Node(object):
+    # Prefix of the node, the prefix as given when it holds a route
+    __slots__ = ('key', 'length', 'prefix', 'value', 'left', 'right')
+
+    def __init__(self, key, length, prefix=None, value=_EMPTY):
+        self.key = key
+        self.length = length
+        self.prefix = prefix
+        self.value = value
+        self.left = None
+        self.right = None
+
+
+class RouteTrie(object):
+    '''Binary radix trie of the prefixes of one address family
+
+    Branches without prefix exist only where two prefixes diverge, the trie
+    has less than two nodes per prefix. Lookups visit at most bits + 1
+    nodes.
+
+    Args:
+        bits (`int`): length of the addresses, 32 or 128
+
+    example:
+        >>> trie = RouteTrie(32)
+        >>> trie.insert(0x0a000000, 8, '10.0.0.0/8', 'eight')
+        >>> trie.lookup(0x0a010101)
+        ('10.0.0.0/8', 'eight')
+    '''
+
+    def __init__(self, bits):
+        self.bits = bits
+        self.root = _Node(0, 0)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def _child(self, node, key):
+        # Child of node on the side of the bit of key after node's prefix
+        if key >> (self.bits - 1 - node.length) & 1:
+            return node.right
+        return node.left
+
+    def _set_child(self, node, child):
+        if child.key >> (self.bits - 1 - node.length) & 1:
+            node.right = child
+        else:
+            node.left = child
+
+    def _matches(self, node, key, length):
+        # Whether the first length bits of node and key are the same
+        return not (node.key ^ key) >> (self.bits - length)
+
+    def insert(self, key, length, prefix, value):
+        '''Set the value of a prefix, replacing its value if it has one
+
+        Args:
+            key (`int`): network of the prefix, host bits cleared
+            length (`int`): length of the prefix
+            prefix (`str`): prefix as returned by the queries
+            value: value of the prefix
+        '''
+        bits = self.bits
+        node = self.root
+        while node.length != length:
+            # Inlined _child: most of the time goes into the descent
+            right = key >> (bits - 1 - node.length) & 1
+            child = node.right if right else node.left
+            if child is None:
+                child = _Node(key, length, prefix, value)
+                if right:
+                    node.right = child
+                else:
+                    node.left = child
+                self.size += 1
+                return
+            child_length = child.length
+            if child_length <= length and \
+                    not (child.key ^ key) >> (bits - child_length):
+                node = child
+                continue
+            # Length of the prefix child and key have in common
+            common = min(bits - (child.key ^ key).bit_length(),
+                         child_length, length)
+            if common == length:
+                # Prefix of child, between node and child
+                new = _Node(key, length, prefix, value)
+                self._set_child(node, new)
+                self._set_child(new, child)
+            else:
+                # Diverging from child after common bits
+                branch = _Node(key >> (bits - common) << (bits - common),
+                               common)
+                self._set_child(node, branch)
+                self._set_child(branch, child)
+                self._set_child(branch, _Node(key, length, prefix, value))
+            self.size += 1
+            return
+        if node.value is _EMPTY:
+            self.size += 1
+        node.prefix = prefix
+        node.value = value
+
+    def get(self, key, length):
+        '''(prefix, value) of the prefix, None if it has no value'''
+        node = self.root
+        while node.length < length:
+            node = self._child(node, key)
+            if node is None or node.length > length or \
+                    not self._matches(node, key, node.length):
+                return None
+        if node.length != length or node.value is _EMPTY:
+            return None
+        return node.prefix, node.value
+
+    def covering(self, key, length):
+        '''(prefix, value) of the prefixes containing a prefix, itself
+        included, shortest first'''
+        found = []
+        node = self.root
+        while node is not None and node.length <= length and \
+                self._matches(node, key, node.length):
+            if node.value is not _EMPTY:
+                found.append((node.prefix, node.value))
+            if node.length == length:
+                break
+            node = self._child(node, key)
+        return found
+
+    def lookup(self, key):
+        '''(prefix, value) of the longest prefix containing an address,
+        None if no prefix does'''
+        bits = self.bits
+        found = None
+        node = self.root
+        while node is not None:
+            length = node.length
+            if (node.key ^ key) >> (bits - length):
+                break
+            if node.value is not _EMPTY:
+                found = node
+            if length == bits:
+                break
+            node = node.right if key >> (bits - 1 - length) & 1 \
+                else node.left
+        return (found.prefix, found.value) if found is not None else None
+
+    def covered(self, key, length):
+        '''(prefix, value) of the prefixes contained in a prefix, itself
+        included, in address order'''
+        node = self.root
+        while node.length < length:
+            node = self._child(node, key)
+            if node is None:
+                return []
+        if not self._matches(node, key, length):
+            return []
+        return list(self._walk(node))
+
+    def _walk(self, node):
+        # Prefixes under node, in order, without recursion
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.value is not _EMPTY:
+                yield node.prefix, node.value
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def __iter__(self):
+        return self._walk(self.root)
+
+
+def _next_hops(route):
+    # Next hop addresses and outgoing interfaces of a parsed route
+    hops = []
+    next_hop = route.get('next_hop')
+    if next_hop:
+        for path in next_hop.get('next_hop_list', {}).values():
+            for key in ('next_hop', 'outgoing_interface'):
+                if path.get(key):
+                    hops.append(path[key])
+        hops.extend(next_hop.get('outgoing_interface', ()))
+    for best in route.get('best_route', {}).values():
+        for hop, hop_values in best.get('nexthop', {}).items():
+            hops.append(hop)
+            for protocol in hop_values.get('protocol', {}).values():
+                if protocol.get('interface'):
+                    hops.append(protocol['interface'])
+    # A hop of several paths, protocols or best routes counted once
+    return list(dict.fromkeys(hops)) if len(hops) > 1 else hops
+
+
+class RouteIndex(object):
+    '''Routes of parsed route tables, by vrf and address family
+
+    The queries take the vrf of the routes, default if not given. Prefixes
+    and addresses that are not are rejected with ValueError.
+
+    example:
+        >>> index = RouteIndex.from_parsed(parsed)
+        >>> index.lookup('10.4.1.7', vrf='VRF1')
+        ('10.4.1.0/24', {'route': '10.4.1.0/24', ...})
+    '''
+
+    def __init__(self):
+        # (vrf, address family) -> RouteTrie
+        self.tries = {}
+        # vrf -> next hop address or interface -> prefixes
+        self.next_hops = {}
+
+    def __len__(self):
+        return sum(len(trie) for trie in self.tries.values())
+
+    def trie(self, af, vrf='default'):
+        '''RouteTrie of a vrf and address family, created empty if none'''
+        try:
+            return self.tries[vrf, af]
+        except KeyError:
+            trie = self.tries[vrf, af] = RouteTrie(_FAMILIES[af][1])
+            return trie
+
+    def add(self, prefix, route, vrf='default', next_hops=()):
+        '''Index a route
+
+        Args:
+            prefix (`str`): prefix of the route
+            route: value returned for the prefix, the parsed route
+            vrf (`str`): vrf of the route
+            next_hops (`list`): next hop addresses and interfaces of the
+                                route
+
+        Raises:
+            ValueError: prefix is not a prefix
+        '''
+        af, key, length = parse_prefix(prefix)
+        self.trie(af, vrf).insert(key, length, prefix, route)
+        if next_hops:
+            hops = self.next_hops.setdefault(vrf, {})
+            for hop in next_hops:
+                hops.setdefault(hop, []).append(prefix)
+
+    @classmethod
+    def from_parsed(cls, parsed, index=None):
+        '''Index the routes of a parsed route table
+
+        Args:
+            parsed (`dict`): output of a route parser, see the module
+            index (`RouteIndex`): index the routes are added to, a new one
+                                  if None
+
+        Returns:
+            `RouteIndex`, the keys of the parsed output that are not
+            prefixes left out
+        '''
+        if index is None:
+            index = cls()
+        for vrf, vrf_values in parsed.get('vrf', {}).items():
+            for af_values in vrf_values.get('address_family', {}).values():
+                routes = af_values.get('routes') or af_values.get('ip') or {}
+                for prefix, route in routes.items():
+                    try:
+                        index.add(prefix, route, vrf=vrf,
+                                  next_hops=_next_hops(route))
+                    except ValueError:
+                        continue
+        return index
+
+    def _query(self, prefix, vrf):
+        af, key, length = parse_prefix(prefix)
+        return self.tries.get((vrf, af)), key, length
+
+    def get(self, prefix, vrf='default'):
+        '''(prefix, route) of a prefix, None if it is not indexed'''
+        trie, key, length = self._query(prefix, vrf)
+        return trie.get(key, length) if trie is not None else None
+
+    def lookup(self, address, vrf='default'):
+        '''(prefix, route) of the longest prefix containing an address,
+        None if no route does'''
+        trie, key, _ = self._query(address, vrf)
+        return trie.lookup(key) if trie is not None else None
+
+    def covering(self, prefix, vrf='default'):
+        '''(prefix, route) of the routes containing a prefix, the prefix
+        included, shortest first'''
+        trie, key, length = self._query(prefix, vrf)
+        return trie.covering(key, length) if trie is not None else []
+
+    def covered(self, prefix, vrf='default'):
+        '''(prefix, route) of the routes contained in a prefix, the prefix
+        included, in address order'''
+        trie, key, length = self._query(prefix, vrf)
+        return trie.covered(key, length) if trie is not None else []
+
+    def via(self, next_hop, vrf='default'):
+        '''Prefixes of the routes through a next hop address or outgoing
+        interface'''
+        return list(self.next_hops.get(vrf, {}).get(next_hop, ()))
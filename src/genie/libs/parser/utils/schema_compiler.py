@@ -0,0 +1,411 @@
+'''Schemas compiled into validator functions
+
+MetaParser.parse checks every parsed output against the schema of its
+parser, walking the schema objects again for each key of the output. On a
+full BGP table this costs as much as parsing the output.
+
+compile_schema() walks a schema once and returns a CompiledSchema made of
+one function per dict of the schema: the mandatory keys of each dict are a
+frozenset, keys are looked up in a dict, and values whose schema is a type,
+Any() or an Or() of types are checked inline with isinstance:
+
+    compiled = compile_schema(ShowBgpAllDetailSchema.schema)
+    compiled.validate(parsed)
+
+The schemas of this package are made of dicts, Any(), Optional(), Or(),
+types and values. Other schema objects (Use(), And(), Default(), ListOf(),
+lists, Or() keys) are checked by the schema engine itself. The data is
+checked only, it is neither copied nor converted.
+
+SampledValidation checks the outputs of MetaParser.parse with compiled
+schemas, and can check only a fraction of them when polling the same
+parsers again and again:
+
+    with SampledValidation(fraction=0.01).install():
+        device.parse('show bgp all detail')
+'''
+
+# python
+import sys
+import logging
+import contextlib
+import collections
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or
+from genie.metaparser.util.exceptions import SchemaError, \
+    SchemaTypeError, SchemaValueError, SchemaMissingKeyError, \
+    SchemaUnsupportedKeyError, SchemaEmptyParserError
+
+log = logging.getLogger(__name__)
+
+_missing = object()
+
+
+class _Invalid(Exception):
+    '''Error found by a validator, raised as the error of the schema
+    engine once its path is known'''
+
+    def __init__(self, error, schema, data, keys=None):
+        self.error = error
+        self.schema = schema
+        self.data = data
+        self.keys = keys
+        # Keys from the data in error up to the root, appended while the
+        # error goes up the validators
+        self.path = []
+
+    def convert(self):
+        path = self.path[::-1]
+        if self.error is SchemaUnsupportedKeyError:
+            return SchemaUnsupportedKeyError(path, set(self.keys))
+        if self.error is SchemaError:
+            return SchemaError('{p}: {d!r} does not match {s!r}'.format(
+                p='.'.join(str(key) for key in path), d=self.data,
+                s=self.schema))
+        return self.error(path, self.schema, self.data)
+
+
+def _mismatch(schema, data):
+    # data is not an instance of the types of schema
+    if isinstance(schema, Or):
+        return _Invalid(SchemaError, schema, data)
+    return _Invalid(SchemaTypeError, schema, data)
+
+
+def _compile(schema):
+    '''Compile schema into (types, check, schema)
+
+    Data matching schema is an instance of types when check is None,
+    otherwise check(data) returns the paths of the missing keys, if any,
+    and raises _Invalid for other errors.
+    '''
+    if isinstance(schema, Any):
+        return (object, None, schema)
+    if isinstance(schema, type):
+        return (schema, None, schema)
+    if isinstance(schema, dict):
+        return (None, _compile_dict(schema), schema)
+    if isinstance(schema, Or):
+        return _compile_or(schema)
+    if isinstance(schema, Schema) or isinstance(schema, (list, tuple,
+                                                         set)) \
+            or callable(schema):
+        return (None, _fallback(schema), schema)
+    return (None, _compile_value(schema), schema)
+
+
+def _compile_value(value):
+
+    def check(data):
+        if data != value:
+            raise _Invalid(SchemaValueError, value, data)
+
+    return check
+
+
+def _compile_or(schema):
+    return _alternatives([_compile(alternative)
+                          for alternative in schema.schemas], schema)
+
+
+def _alternatives(alternatives, schema):
+    # Data matching any of the compiled alternatives
+    if all(alternative_check is None
+           for _, alternative_check, _ in alternatives):
+        # Or(int, str)
+        return (tuple(types for types, _, _ in alternatives), None, schema)
+
+    def check(data):
+        for types, alternative_check, _ in alternatives:
+            if alternative_check is None:
+                if isinstance(data, types):
+                    return None
+                continue
+            try:
+                if not alternative_check(data):
+                    return None
+            except (_Invalid, SchemaError):
+                pass
+        raise _Invalid(SchemaError, schema, data)
+
+    return (None, check, schema)
+
+
+def _fallback(schema):
+    # Checked by the schema engine, its errors have the path from here
+    engine = Schema(schema)
+
+    def check(data):
+        engine.validate(data)
+
+    return check
+
+
+def _compile_dict(schema):
+    # key -> (types, check, schema) of its value
+    keyed = {}
+    # mandatory keys
+    required = []
+    # (key type, entry), keys of a type, in the order of the schema
+    typed = []
+    required_types = []
+    # Entries of the Any() keys, some schemas have several of them
+    wildcards = []
+
+    for key, value in schema.items():
+        entry = _compile(value)
+        mandatory = True
+        if type(key) is Optional:
+            key = key.schema
+            mandatory = False
+        if isinstance(key, Any):
+            wildcards.append(entry)
+        elif isinstance(key, type):
+            typed.append((key, entry))
+            if mandatory:
+                required_types.append(key)
+        elif isinstance(key, Schema):
+            # Or() keys
+            return _fallback(schema)
+        else:
+            keyed[key] = entry
+            if mandatory:
+                required.append(key)
+    schema_order = tuple(required)
+    required = frozenset(required)
+    wildcard = None
+    if wildcards:
+        wildcard = wildcards[0] if len(wildcards) == 1 else \
+            _alternatives(wildcards, schema)
+
+    if not typed and wildcard is not None and not keyed:
+        # {Any(): ...}, the tables of the parsed outputs
+        types, value_check, value_schema = wildcard
+
+        def check_table(data):
+            if not isinstance(data, dict):
+                raise _Invalid(SchemaTypeError, schema, data)
+            missing = []
+            key = None
+            try:
+                if value_check is None:
+                    for key, value in data.items():
+                        if not isinstance(value, types):
+                            raise _mismatch(value_schema, value)
+                else:
+                    for key, value in data.items():
+                        found = value_check(value)
+                        if found:
+                            missing.extend([key] + path for path in found)
+            except _Invalid as e:
+                e.path.append(key)
+                raise
+            return missing
+
+        return check_table
+
+    def match(key):
+        for key_type, entry in typed:
+            if isinstance(key, key_type):
+                return entry
+        return wildcard
+
+    def check(data):
+        if not isinstance(data, dict):
+            raise _Invalid(SchemaTypeError, schema, data)
+        missing = []
+        unsupported = []
+        key = None
+        try:
+            for key, value in data.items():
+                entry = keyed.get(key)
+                if entry is None:
+                    entry = match(key)
+                    if entry is None:
+                        unsupported.append(key)
+                        continue
+                types, value_check, value_schema = entry
+                if value_check is None:
+                    if not isinstance(value, types):
+                        raise _mismatch(value_schema, value)
+                else:
+                    found = value_check(value)
+                    if found:
+                        missing.extend([key] + path for path in found)
+        except _Invalid as e:
+            e.path.append(key)
+            raise
+        absent = required.difference(data)
+        if absent:
+            missing.extend([key] for key in schema_order if key in absent)
+        for key_type in required_types:
+            if not any(isinstance(key, key_type) for key in data):
+                missing.append([str(key_type)])
+        # As the schema engine, missing keys are reported before the keys
+        # not in the schema
+        if unsupported and not missing:
+            raise _Invalid(SchemaUnsupportedKeyError, schema, data,
+                           keys=unsupported)
+        return missing
+
+    return check
+
+
+class CompiledSchema(object):
+    '''Schema compiled into validator functions
+
+    Raises the errors of the schema engine: SchemaMissingKeyError with all
+    the missing keys, SchemaUnsupportedKeyError, SchemaTypeError,
+    SchemaValueError.
+
+    Args:
+        schema (`dict`): schema of a parser
+
+    example:
+        >>> compiled = CompiledSchema({'vrf': {Any(): {'id': int}}})
+        >>> compiled.validate({'vrf': {'default': {'id': 1}}})
+        {'vrf': {'default': {'id': 1}}}
+        >>> compiled.validate({'vrf': {'default': {'id': '1'}}})
+        SchemaTypeError: vrf.default.id: Expected type '<class 'int'>' ...
+    '''
+
+    def __init__(self, schema):
+        self.schema = schema
+        types, check, _ = _compile(schema)
+        if check is None:
+            def check(data):
+                if not isinstance(data, types):
+                    raise _mismatch(schema, data)
+        self._check = check
+
+    def validate(self, data, command=None, warn_unsupported_keys=False):
+        '''Check data against the schema, returns data
+
+        Args:
+            data: parsed output
+            command (`str`): command of the parsed output, not used
+            warn_unsupported_keys (`bool`): log the keys not in the schema
+                                            and remove them from data,
+                                            instead of raising
+        '''
+        if isinstance(data, dict) and not data:
+            raise SchemaEmptyParserError(data)
+        while True:
+            try:
+                missing = self._check(data)
+            except _Invalid as e:
+                if e.error is not SchemaUnsupportedKeyError or \
+                        not warn_unsupported_keys:
+                    raise e.convert() from None
+                log.warning('Unknown keys {k} in path {p}. Please verify '
+                            'the parser schema.'.format(k=set(e.keys),
+                                                        p=e.path[::-1]))
+                for key in e.keys:
+                    del e.data[key]
+                continue
+            break
+        if missing:
+            raise SchemaMissingKeyError([path[:-1] for path in missing],
+                                        [path[-1] for path in missing])
+        return data
+
+
+# id of schema -> (schema, CompiledSchema)
+_compiled = {}
+
+
+def compile_schema(schema):
+    '''Return the CompiledSchema of schema, compiled on first use
+
+    Args:
+        schema (`dict`): schema of a parser, usually its class attribute
+
+    Returns:
+        `CompiledSchema`
+    '''
+    kept, compiled = _compiled.get(id(schema), (None, None))
+    if kept is not schema:
+        compiled = CompiledSchema(schema)
+        _compiled[id(schema)] = (schema, compiled)
+    return compiled
+
+
+class SampledValidation(object):
+    '''Validation of parsed outputs with compiled schemas, on a fraction of
+    the parses
+
+    The first output of each schema is always validated, then one output in
+    1/fraction. With fraction=0, only the structure of the first output of
+    each parser is validated and the parsers are trusted afterwards.
+
+    Args:
+        fraction (`float`): fraction of the outputs validated, 1 for all of
+                            them
+
+    example:
+        >>> validation = SampledValidation(fraction=0.25)
+        >>> with validation.install():
+        ...     for _ in range(8):
+        ...         ShowBgpAllDetail(device=device).parse()
+        >>> validation.stats
+        {'validated': 3, 'skipped': 5}
+    '''
+
+    def __init__(self, fraction=1.0):
+        self.fraction = fraction
+        # id of schema -> outputs of the schema so far
+        self._calls = collections.Counter()
+        self.stats = dict.fromkeys(['validated', 'skipped'], 0)
+
+    def validate(self, schema, data, command=None,
+                 warn_unsupported_keys=False):
+        '''Validate data against schema if its turn has come, returns data'''
+        calls = self._calls[id(schema)]
+        self._calls[id(schema)] = calls + 1
+        if calls and int((calls + 1) * self.fraction) == \
+                int(calls * self.fraction):
+            self.stats['skipped'] += 1
+            return data
+        self.stats['validated'] += 1
+        return compile_schema(schema).validate(
+            data, command=command,
+            warn_unsupported_keys=warn_unsupported_keys)
+
+    @contextlib.contextmanager
+    def install(self):
+        '''Validate the outputs of MetaParser.parse, until the context
+        exits'''
+        module = sys.modules[MetaParser.__module__]
+        original = getattr(module, 'Schema', _missing)
+        validation = self
+
+        class SampledSchema(object):
+            '''Schema as used by MetaParser.parse'''
+
+            def __init__(self, schema, *args, **kwargs):
+                self.schema = schema
+                self._engine = None
+                self._args = (args, kwargs)
+
+            def validate(self, data, command=None,
+                         warn_unsupported_keys=False, **kwargs):
+                return validation.validate(
+                    self.schema, data, command=command,
+                    warn_unsupported_keys=warn_unsupported_keys)
+
+            def __getattr__(self, name):
+                # Anything else is left to the schema engine
+                if self._engine is None:
+                    args, kwargs = self._args
+                    self._engine = Schema(self.schema, *args, **kwargs)
+                return getattr(self._engine, name)
+
+        module.Schema = SampledSchema
+        try:
+            yield self
+        finally:
+            if original is _missing:
+                del module.Schema
+            else:
+                module.Schema = original
@@ -0,0 +1,122 @@
+'''Outputs of the commands executed on devices, kept for a session
+
+Some parsers run other parsers or extra commands: nxos ShowRunningConfigVrf
+and ShowForwardingDistributionMulticastRoute both parse show vrf, iosxe bgp
+summaries parse show vrf and run show run sections. Collecting a snapshot
+of a device therefore sends the same commands several times.
+
+Within an ExecuteSession, device.execute of the devices returns the output
+already received for a command instead of sending it again. Parsers do not
+need to know about it, the parsers they call use the same device:
+
+    with ExecuteSession(device) as session:
+        ShowRunningConfigVrf(device=device).parse()
+        ShowForwardingDistributionMulticastRoute(device=device).parse(
+            vrf='all')
+    session.stats
+    {'executed': 7, 'saved': 1}
+
+Only show commands are kept by default, as the output of other commands is
+not expected to be the same twice.
+'''
+
+# python
+import logging
+import functools
+import collections
+
+log = logging.getLogger(__name__)
+
+_missing = object()
+
+
+def is_show_command(command):
+    '''Default cacheable of ExecuteSession: show commands only'''
+    return command.lstrip().lower().startswith('show ')
+
+
+class ExecuteSession(object):
+    '''Memoize the commands executed on devices until the session exits
+
+    Args:
+        devices (`Device`): devices whose execute is memoized
+        cacheable (`callable`): command -> whether its output can be
+                                re-used, show commands by default
+
+    example:
+        >>> with ExecuteSession(device) as session:
+        ...     ShowRunningConfigVrf(device=device).parse()
+        ...     ShowForwardingDistributionMulticastRoute(
+        ...         device=device).parse(vrf='all')
+        >>> session.stats
+        {'executed': 7, 'saved': 1}
+        >>> session.saved_by_command
+        Counter({'show vrf': 1})
+    '''
+
+    def __init__(self, *devices, cacheable=is_show_command):
+        self.devices = list(devices)
+        self.cacheable = cacheable
+        # (device id, command, kwargs) -> output
+        self.outputs = {}
+        self.stats = dict.fromkeys(['executed', 'saved'], 0)
+        self.saved_by_command = collections.Counter()
+        # device -> execute in its __dict__ before the session, if any
+        self._saved = []
+
+    def _key(self, device, command, kwargs):
+        # Same command whatever its spacing
+        return (id(device), ' '.join(command.split()),
+                tuple(sorted((name, repr(value))
+                             for name, value in kwargs.items())))
+
+    def _execute(self, device, execute, command, *args, **kwargs):
+        if args or not self.cacheable(command):
+            self.stats['executed'] += 1
+            return execute(command, *args, **kwargs)
+
+        key = self._key(device, command, kwargs)
+        try:
+            output = self.outputs[key]
+        except KeyError:
+            self.stats['executed'] += 1
+            output = self.outputs[key] = execute(command, **kwargs)
+        else:
+            self.stats['saved'] += 1
+            self.saved_by_command[key[1]] += 1
+        return output
+
+    def __enter__(self):
+        for device in self.devices:
+            execute = device.execute
+            self._saved.append((device, vars(device).get('execute',
+                                                         _missing)))
+            device.execute = functools.partial(self._execute, device,
+                                               execute)
+        return self
+
+    def __exit__(self, *exc):
+        while self._saved:
+            device, saved = self._saved.pop()
+            partial = device.execute
+            if saved is not _missing:
+                device.execute = saved
+                continue
+            try:
+                del device.execute
+            except AttributeError:
+                pass
+            try:
+                restored = device.execute
+            except Exception:
+                restored = None
+            if restored is None or restored is partial:
+                # Devices whose execute cannot be deleted, such as Mock
+                device.execute = partial.args[1]
+        log.info('ExecuteSession saved {s} of {t} commands'.format(
+            s=self.stats['saved'],
+            t=self.stats['saved'] + self.stats['executed']))
+
+    def clear(self):
+        '''Forget the outputs received, to execute the commands again'''
+        self.outputs.clear()
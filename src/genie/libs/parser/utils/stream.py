@@ -0,0 +1,242 @@
+'''Parser output read line by line
+
+Parsers receive the output of a command as one string, either from
+device.execute or from the output argument, and loop over its splitlines().
+For large tables (BGP, routes, MAC addresses) the output, and the list of its
+lines, are held in memory at once next to the structure being built.
+
+Parsers supporting streaming also accept an output_stream argument, any
+iterable of lines: a file object, a socket reader, a generator. The lines are
+consumed one at a time and never joined:
+
+    with open('show_ip_route.txt') as f:
+        parsed = ShowIpRoute(device=device).parse(output_stream=f)
+
+Inside cli(), iter_lines() is used in place of out.splitlines():
+
+    def cli(self, output=None, output_stream=None):
+        if output is None and output_stream is None:
+            output = self.device.execute(self.cli_command)
+
+        for line in iter_lines(output, output_stream):
+            ...
+
+Such parsers can also inherit IncrementalParser, to be given the output in
+chunks as it is printed by the device, and parse it while it arrives:
+
+    parser = ShowIpRoute(device=device)
+    parser.start(vrf='VRF1')
+    for chunk in reader:
+        parser.feed(chunk)
+    parsed = parser.close()
+'''
+
+# python
+import codecs
+import threading
+import collections
+
+
+def iter_lines(output=None, output_stream=None, encoding='utf-8'):
+    '''Yield the lines of a command output
+
+    Args:
+        output (`str`): whole output of the command
+        output_stream (`iterable`): lines of the output, as str or bytes,
+                                    with or without their line ending.
+                                    Used instead of output when given.
+        encoding (`str`): encoding of bytes lines
+
+    Returns:
+        generator of lines, without line endings
+
+    example:
+        >>> list(iter_lines(output_stream=io.StringIO('a\\r\\nb\\n')))
+        ['a', 'b']
+    '''
+    if output_stream is None:
+        if output:
+            yield from output.splitlines()
+        return
+
+    for line in output_stream:
+        if isinstance(line, bytes):
+            line = line.decode(encoding, errors='replace')
+        yield line.rstrip('\r\n')
+
+
+class ChunkLines(object):
+    '''Lines of an output received in chunks
+
+    Chunks are cut anywhere, a line split across two chunks is put back
+    together. put() and close() are called by the thread receiving the
+    output, the lines are iterated by another thread, blocking until they
+    arrive.
+
+    At most max_size characters of lines wait to be read: put() blocks
+    until the reader catches up, the output is not held whole in memory
+    when the device prints it faster than it is parsed. Once the reader
+    stops, by reaching the end of the lines or by stop(), put() drops the
+    chunks instead.
+
+    Args:
+        encoding (`str`): encoding of bytes chunks
+        max_size (`int`): characters of lines waiting to be read before
+                          put() blocks, no limit if None
+
+    example:
+        >>> lines = ChunkLines()
+        >>> lines.put('Vlan  Mac Add')
+        >>> lines.put('ress\\r\\n 10  aaaa.bbbb.cccc')
+        >>> lines.close()
+        >>> list(lines)
+        ['Vlan  Mac Address', ' 10  aaaa.bbbb.cccc']
+    '''
+
+    def __init__(self, encoding='utf-8', max_size=1 << 20):
+        self.encoding = encoding
+        self.max_size = max_size
+        self._decoder = None
+        # Pieces of the line not terminated yet
+        self._partial = []
+        # (lines, their size) waiting to be read
+        self._ready = collections.deque()
+        self._size = 0
+        self._closed = False
+        self._stopped = False
+        self._condition = threading.Condition()
+
+    def put(self, chunk):
+        if isinstance(chunk, bytes):
+            # A multibyte character can be split across two chunks
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder(
+                    self.encoding)(errors='replace')
+            chunk = self._decoder.decode(chunk)
+        if '\n' not in chunk:
+            if chunk:
+                self._partial.append(chunk)
+            return
+
+        self._partial.append(chunk)
+        text = ''.join(self._partial)
+        lines = text.split('\n')
+        rest = lines.pop()
+        self._partial = [rest] if rest else []
+        with self._condition:
+            # Waits only while the buffer is full, a chunk larger than
+            # max_size is still taken when the buffer is empty
+            while self.max_size is not None and \
+                    self._size >= self.max_size and not self._stopped:
+                self._condition.wait()
+            if self._stopped:
+                return
+            size = len(text) - len(rest)
+            self._ready.append((lines, size))
+            self._size += size
+            self._condition.notify_all()
+
+    def close(self):
+        if self._decoder is not None:
+            self._partial.append(self._decoder.decode(b'', final=True))
+        with self._condition:
+            if self._partial and not self._stopped:
+                text = ''.join(self._partial)
+                self._ready.append(([text], len(text)))
+                self._size += len(text)
+            self._partial = []
+            self._closed = True
+            self._condition.notify_all()
+
+    def stop(self):
+        '''Stop reading: the lines waiting are dropped, put() no longer
+        blocks'''
+        with self._condition:
+            self._stopped = True
+            self._ready.clear()
+            self._size = 0
+            self._condition.notify_all()
+
+    def __iter__(self):
+        try:
+            while True:
+                with self._condition:
+                    while not self._ready and not self._closed and \
+                            not self._stopped:
+                        self._condition.wait()
+                    if not self._ready:
+                        return
+                    lines, size = self._ready.popleft()
+                    self._size -= size
+                    # Room for the writer
+                    self._condition.notify_all()
+                for line in lines:
+                    yield line.rstrip('\r')
+        finally:
+            # Iterated to the end, or left by the reader
+            self.stop()
+
+
+class IncrementalParser(object):
+    '''Parser mixin parsing the output while it is received
+
+    For parsers whose cli() accepts output_stream. start() runs parse() in
+    a thread reading the chunks given to feed() as they come, close()
+    waits for it to parse the last lines and returns the parsed output,
+    or raises the exception of parse(). Receiving and parsing the output
+    overlap, instead of parsing only once device.execute() returned.
+
+    Calling start() is only needed to give arguments to parse().
+
+    example:
+        >>> parser = ShowIpRoute(device=device)
+        >>> parser.start(vrf='VRF1')
+        >>> for chunk in chunks:
+        ...     parser.feed(chunk)
+        >>> parsed = parser.close()
+    '''
+
+    def start(self, **kwargs):
+        '''Start parsing, with the arguments of parse()'''
+        if getattr(self, '_incremental', None):
+            raise RuntimeError('{} is already parsing, close() it first'
+                               .format(type(self).__name__))
+        lines = ChunkLines()
+        result = {}
+        thread = threading.Thread(target=self._parse_incremental,
+                                  args=(lines, result, kwargs),
+                                  daemon=True)
+        self._incremental = (lines, result, thread)
+        thread.start()
+
+    def feed(self, chunk):
+        '''Give the next chunk of output, str or bytes'''
+        if not getattr(self, '_incremental', None):
+            self.start()
+        lines, result, thread = self._incremental
+        if 'error' in result:
+            # parse() failed already, no need to wait for close()
+            self._incremental = None
+            raise result['error']
+        lines.put(chunk)
+
+    def close(self):
+        '''Wait for the end of parsing and return the parsed output'''
+        if not getattr(self, '_incremental', None):
+            self.start()
+        lines, result, thread = self._incremental
+        self._incremental = None
+        lines.close()
+        thread.join()
+        if 'error' in result:
+            raise result['error']
+        return result['parsed']
+
+    def _parse_incremental(self, lines, result, kwargs):
+        try:
+            result['parsed'] = self.parse(output_stream=lines, **kwargs)
+        except Exception as e:
+            result['error'] = e
+        finally:
+            # feed() must not wait on lines parse() no longer reads
+            lines.stop()
@@ -0,0 +1,87 @@
+# Python
+import unittest
+
+# Parser utils
+from genie.libs.parser.utils.batch import BatchParser, OfflineDevice, \
+                                          parse_batch, parse_record
+
+
+output = '''\
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+ All    0100.0ccc.cccc    STATIC      CPU
+  20    0000.0000.0001    DYNAMIC     Gi1/0/1
+Total Mac Addresses for this criterion: 2
+'''
+
+parsed_output = {
+    'mac_table': {
+        'vlans': {
+            'all': {
+                'vlan': 'all',
+                'mac_addresses': {
+                    '0100.0ccc.cccc': {
+                        'mac_address': '0100.0ccc.cccc',
+                        'interfaces': {
+                            'CPU': {
+                                'interface': 'CPU',
+                                'entry_type': 'static'}}}}},
+            '20': {
+                'vlan': 20,
+                'mac_addresses': {
+                    '0000.0000.0001': {
+                        'mac_address': '0000.0000.0001',
+                        'interfaces': {
+                            'GigabitEthernet1/0/1': {
+                                'interface': 'GigabitEthernet1/0/1',
+                                'entry_type': 'dynamic'}}}}}}},
+    'total_mac_addresses': 2}
+
+records = [('iosxe', 'show mac address-table', output),
+           ('iosxe', 'show mac address-table', ''),
+           ('iosxe', 'show unknown command', output)] * 7
+
+
+# ===========================
+# Unit test for batch parsing
+# ===========================
+class test_batch(unittest.TestCase):
+
+    def check(self, results):
+        self.assertEqual([result.index for result in results],
+                         list(range(len(records))))
+        for result, (os, command, output) in zip(results, records):
+            self.assertEqual((result.os, result.command), (os, command))
+        self.assertEqual(results[0].parsed, parsed_output)
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[1].parsed)
+        self.assertTrue(results[1].error.startswith(
+            'SchemaEmptyParserError'))
+        self.assertIn("Could not find parser for 'show unknown command'",
+                      results[2].error)
+
+    def test_parse_record(self):
+        self.assertEqual(parse_record('iosxe', 'show mac address-table',
+                                      output), parsed_output)
+
+    def test_offline_device(self):
+        with self.assertRaises(Exception):
+            OfflineDevice('iosxe').execute('show version')
+
+    def test_in_process(self):
+        self.check(parse_batch(records, processes=0, chunksize=4))
+
+    def test_ordered(self):
+        self.check(parse_batch(records, processes=2, chunksize=4))
+
+    def test_unordered(self):
+        with BatchParser(processes=2, chunksize=2, backlog=1,
+                         warm=[('iosxe', 'show mac address-table')]) as batch:
+            results = list(batch.parse(iter(records), ordered=False))
+            self.check(sorted(results))
+            # the pool is kept for the next batch
+            self.assertEqual(len(list(batch.parse(records[:3]))), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
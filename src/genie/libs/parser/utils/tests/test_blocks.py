@@ -0,0 +1,133 @@
+# Python
+import unittest
+from unittest.mock import Mock
+
+# Parser utils
+from genie.libs.parser.utils.blocks import merge_parsed
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.show_ospf import ShowIpOspfDatabaseRouter
+from genie.libs.parser.nxos.show_interface import ShowInterface
+from genie.libs.parser.iosxr.show_isis import ShowIsisDatabaseDetail
+from genie.libs.parser.iosxe.tests import test_show_interface as \
+    iosxe_interface, test_show_ospf
+from genie.libs.parser.nxos.tests import test_show_interface as \
+    nxos_interface
+from genie.libs.parser.iosxr.tests import test_show_isis
+
+
+def golden_outputs(test_class):
+    for name in sorted(vars(test_class)):
+        value = getattr(test_class, name)
+        if isinstance(value, dict):
+            value = value.get('execute.return_value')
+        if name.startswith('golden') and isinstance(value, str):
+            yield name, value
+
+
+# =========================
+# Unit test for BlockParser
+# =========================
+class test_block_parser(unittest.TestCase):
+
+    parsers = [(ShowInterfaces, iosxe_interface.TestShowInterfaces),
+               (ShowInterface, nxos_interface.TestShowInterface),
+               (ShowIsisDatabaseDetail,
+                test_show_isis.TestShowIsisDatabaseDetail),
+               (ShowIpOspfDatabaseRouter,
+                test_show_ospf.test_show_ip_ospf_database_router)]
+
+    def test_golden(self):
+        for parser_class, test_class in self.parsers:
+            for name, output in golden_outputs(test_class):
+                expected = parser_class(device=Mock()).cli(output=output)
+                for executor in ['serial', 'thread', 'process']:
+                    with self.subTest(parser=parser_class.__name__,
+                                      output=name, executor=executor):
+                        parser = parser_class(device=Mock())
+                        self.assertEqual(parser.parse_blocks(
+                            output=output, executor=executor), expected)
+                        self.assertEqual(parser.block_errors, [])
+
+    def test_split(self):
+        parser = ShowIsisDatabaseDetail(device=Mock())
+        blocks = parser.split_blocks(
+            test_show_isis.TestShowIsisDatabaseDetail.golden_output_2[
+                'execute.return_value'])
+        # The prompt, then one block per LSP
+        self.assertEqual(len(blocks), 7)
+        self.assertEqual(blocks[0].strip(),
+                         'router# show isis database detail')
+        for block in blocks[1:]:
+            self.assertRegex(block, r'^\s*IS-IS \S+ \(Level-\d\) Link')
+
+        # Consecutive headers belong to the same block
+        parser = ShowIpOspfDatabaseRouter(device=Mock())
+        blocks = parser.split_blocks(
+            'OSPF Router with ID (10.4.1.1) (Process ID 1)\n'
+            '\n'
+            '    Router Link States (Area 0)\n'
+            '\n'
+            '  Routing Bit Set on this LSA\n'
+            '  LS age: 742\n'
+            '  Options: (No TOS-capability, DC)\n'
+            '  LS age: 1802\n'
+            '  Options: (No TOS-capability, DC)\n')
+        self.assertEqual(len(blocks), 2)
+        self.assertIn('Routing Bit Set on this LSA\n  LS age: 742',
+                      blocks[0])
+        self.assertTrue(blocks[1].startswith(
+            'OSPF Router with ID (10.4.1.1) (Process ID 1)\n'
+            '    Router Link States (Area 0)\n'
+            '  LS age: 1802'))
+
+    def test_malformed_block(self):
+        output = iosxe_interface.TestShowInterfaces.golden_output_1[
+            'execute.return_value']
+        expected = ShowInterfaces(device=Mock()).cli(output=output)
+        # The rate line of the tunnel is parsed before its counters exist
+        tunnel = ('Tunnel5 is up, line protocol is up\n'
+                  '  5 minute output rate 0 bits/sec, 0 packets/sec\n')
+        malformed = output + tunnel
+        with self.assertRaises(KeyError):
+            ShowInterfaces(device=Mock()).cli(output=malformed)
+
+        for executor in ['serial', 'process']:
+            parser = ShowInterfaces(device=Mock())
+            with self.assertLogs('genie.libs.parser.utils.blocks'):
+                parsed = parser.parse_blocks(output=malformed,
+                                             executor=executor)
+            self.assertEqual(parsed, expected)
+            self.assertEqual(len(parser.block_errors), 1)
+            error = parser.block_errors[0]
+            self.assertEqual(error.header,
+                             'Tunnel5 is up, line protocol is up')
+            self.assertEqual(error.index,
+                             len(parser.split_blocks(output)))
+
+        # No block parsed, the error of the first block is raised
+        with self.assertRaises(KeyError):
+            ShowInterfaces(device=Mock()).parse_blocks(output=tunnel)
+
+    def test_execute(self):
+        output = nxos_interface.TestShowInterface.golden_output1[
+            'execute.return_value']
+        device = Mock(**{'execute.return_value': output})
+        parsed = ShowInterface(device=device).parse_blocks(
+            interface='Ethernet2/1', executor='thread', workers=2)
+        device.execute.assert_called_once_with('show interface Ethernet2/1')
+        self.assertEqual(parsed,
+                         ShowInterface(device=device).cli(output=output))
+
+    def test_merge_parsed(self):
+        self.assertEqual(merge_parsed({'a': {'b': 1, 'c': 2}, 'd': [1]},
+                                      {'a': {'c': 3}, 'd': [2]}),
+                         {'a': {'b': 1, 'c': 3}, 'd': [2]})
+
+    def test_executor(self):
+        with self.assertRaises(ValueError):
+            ShowInterface(device=Mock()).parse_blocks(
+                output='Ethernet2/2 is up', executor='gpu')
+
+
+if __name__ == '__main__':
+    unittest.main()
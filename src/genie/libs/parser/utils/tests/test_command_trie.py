@@ -0,0 +1,75 @@
+# Python
+import unittest
+from unittest.mock import Mock
+
+# Parser utils
+from genie.libs.parser.utils.common import parser_data, _find_command
+from genie.libs.parser.utils.command_trie import CommandTrie, command_regex
+
+
+# ============================
+# Unit test for CommandTrie
+# ============================
+class test_command_trie(unittest.TestCase):
+
+    commands = ['show bgp vrf {vrf}',
+                'show bgp {address_family} vrf {vrf}',
+                'show bgp {address_family} vrf {vrf} {route}',
+                'show bgp {address_family} all neighbors {neighbor} advertised-routes',
+                'show ip route',
+                '/dna/intent/api/v1/interface/{interface}']
+
+    def test_single_word_argument(self):
+        trie = CommandTrie(self.commands)
+        self.assertEqual(trie.search('show bgp vrf VRF1'),
+                         [('show bgp vrf {vrf}', {'vrf': 'VRF1'})])
+        self.assertEqual(trie.search('show bgp vrf VRF1 VRF2'), [])
+
+    def test_multi_words_argument(self):
+        trie = CommandTrie(self.commands)
+        self.assertEqual(
+            trie.search('show bgp ipv4 unicast all neighbors 10.1.1.1 advertised-routes'),
+            [('show bgp {address_family} all neighbors {neighbor} advertised-routes',
+              {'address_family': 'ipv4 unicast', 'neighbor': '10.1.1.1'})])
+
+    def test_most_literal_words_first(self):
+        trie = CommandTrie(self.commands)
+        found = trie.search('show bgp vpnv4 unicast vrf VRF1 10.4.1.0/24')
+        self.assertEqual(found, [
+            ('show bgp {address_family} vrf {vrf} {route}',
+             {'address_family': 'vpnv4 unicast', 'vrf': 'VRF1',
+              'route': '10.4.1.0/24'})])
+
+    def test_non_templated_commands_ignored(self):
+        trie = CommandTrie(self.commands)
+        self.assertNotIn('show ip route', trie)
+        self.assertEqual(trie.search('show ip route'), [])
+
+    def test_regex_fallback(self):
+        trie = CommandTrie(self.commands)
+        self.assertEqual(trie.search('/dna/intent/api/v1/interface/Gi1'),
+                         [('/dna/intent/api/v1/interface/{interface}',
+                           {'interface': 'Gi1'})])
+
+    def test_same_as_regex(self):
+        data = {k: v for k, v in parser_data.items() if k != 'tokens'}
+        trie = CommandTrie(data)
+        regexes = {k: command_regex(k) for k in data if '{' in k}
+        for key in trie._rank:
+            command = key.replace('{', '').replace('}', '')
+            matches = {k: reg.match(command) for k, reg in regexes.items()}
+            expected = {k: m.groupdict() for k, m in matches.items() if m}
+            self.assertEqual(dict(trie.search(command)), expected)
+
+    def test_find_command(self):
+        device = Mock(os='nxos')
+        data = {'show bgp vrf {vrf}': {'nxos': {'class': 'A'}},
+                'show bgp {address_family} vrf {vrf}': {'iosxe': {'class': 'B'}}}
+        ret_data, kwargs = _find_command('show bgp vrf VRF1', data, device)
+        self.assertEqual(kwargs, {'vrf': 'VRF1'})
+        with self.assertRaises(SyntaxError):
+            _find_command('show bgp ipv4 vrf VRF1', data, device)
+
+
+if __name__ == '__main__':
+    unittest.main()
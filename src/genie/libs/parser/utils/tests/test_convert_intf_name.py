@@ -0,0 +1,110 @@
+# Python
+import os
+import re
+import glob
+import unittest
+
+# Parser utils
+from genie.libs import parser
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import Common
+
+
+def legacy_convert_intf_name(intf):
+    # Common.convert_intf_name before it was memoized
+    convert = {'Eth': 'Ethernet',
+               'Lo': 'Loopback',
+               'Fa': 'FastEthernet',
+               'Fas': 'FastEthernet',
+               'Po': 'Port-channel',
+               'PO': 'Port-channel',
+               'Null': 'Null',
+               'Gi': 'GigabitEthernet',
+               'Gig': 'GigabitEthernet',
+               'GE': 'GigabitEthernet',
+               'Te': 'TenGigabitEthernet',
+               'mgmt': 'mgmt',
+               'Vl': 'Vlan',
+               'Tu': 'Tunnel',
+               'Fe': '',
+               'Hs': 'HSSI',
+               'AT': 'ATM',
+               'Et': 'Ethernet',
+               'BD': 'BDI',
+               'Se': 'Serial',
+               'Fo': 'FortyGigabitEthernet',
+               'Hu': 'HundredGigE',
+               'vl': 'vasileft',
+               'vr': 'vasiright',
+               'BE': 'Bundle-Ether'
+               }
+    m = re.search('([a-zA-Z]+)', intf)
+    m1 = re.search(r'([\d\/\.]+)', intf)
+    if hasattr(m, 'group') and hasattr(m1, 'group'):
+        int_type = m.group(0)
+        int_port = m1.group(0)
+        if int_type in convert.keys():
+            return(convert[int_type] + int_port)
+        else:
+            converted_intf = intf[0].capitalize()+intf[1:].replace(
+                ' ','').replace('ethernet', 'Ethernet')
+            return(converted_intf)
+    else:
+        return(intf)
+
+
+def golden_names():
+    # Words with a digit in the golden outputs of the interface, neighbor
+    # and port-channel parsers
+    names = set()
+    root = os.path.dirname(parser.__file__)
+    for os_name in ('iosxe', 'nxos', 'iosxr'):
+        for name in ('interface', 'cdp', 'lldp', 'lag', 'arp'):
+            pattern = os.path.join(root, os_name, 'tests',
+                                   'test_show_{}*.py'.format(name))
+            for path in glob.glob(pattern):
+                with open(path) as f:
+                    names.update(re.findall(
+                        r'[A-Za-z][\w\-]*(?: ?[\d\/\.:]+)+', f.read()))
+    return names
+
+
+# =================================
+# Unit test for convert_intf_name
+# =================================
+class test_convert_intf_name(unittest.TestCase):
+
+    def test_equivalence(self):
+        names = golden_names()
+        self.assertGreater(len(names), 1000)
+        names.update(abbreviation + port
+                     for abbreviation in common.intf_types
+                     for port in ('1', '0/1', '1/0/1.100', ' 2/3', ':1'))
+        names.update(['', 'Gi', '1/0', 'gigabitethernet1', 'ethernet1/1',
+                      'Port-channel 10', 'Eth1/1.10', 'mgmt0', 'Fe0/1',
+                      'unknown', '10Gi1', 'Gi1/0/1:1', 'Null0', 'vlan 10'])
+        for name in sorted(names):
+            with self.subTest(name=name):
+                self.assertEqual(Common.convert_intf_name(name),
+                                 legacy_convert_intf_name(name))
+        self.assertEqual(Common.convert_intf_names(sorted(names)),
+                         [legacy_convert_intf_name(name)
+                          for name in sorted(names)])
+
+    def test_memo(self):
+        common._convert_intf_name.cache_clear()
+        for _ in range(3):
+            self.assertEqual(Common.convert_intf_name('Gi1/0/1'),
+                             'GigabitEthernet1/0/1')
+        info = common._convert_intf_name.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 1))
+        # The batch form does not go through the memo
+        self.assertEqual(Common.convert_intf_names(iter(['Te1', 'Po2',
+                                                         'Te1'])),
+                         ['TenGigabitEthernet1', 'Port-channel2',
+                          'TenGigabitEthernet1'])
+        self.assertEqual(common._convert_intf_name.cache_info().currsize, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+# Python
+import math
+import unittest
+from unittest.mock import Mock
+
+# Parser utils
+from genie.libs.parser.utils.counters import CounterTracker, CounterEvent, \
+                                            last_clear_seconds
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.tests import test_show_interface as \
+    iosxe_interface
+
+
+def interfaces(**counters):
+    # Parsed output of one interface per keyword, name=(in_octets,
+    # in_crc_errors, last_clear)
+    return {name: {'counters': {'in_octets': octets, 'in_crc_errors': crc,
+                                'last_clear': last_clear,
+                                'rate': {'load_interval': 300}}}
+            for name, (octets, crc, last_clear) in counters.items()}
+
+
+# ============================
+# Unit test for CounterTracker
+# ============================
+class test_counter_tracker(unittest.TestCase):
+
+    def test_delta_rate(self):
+        tracker = CounterTracker()
+        self.assertEqual(tracker.update('R1', interfaces(
+            Gi1=(1000, 0, 'never'), Gi2=(500, 3, 'never')), timestamp=0), [])
+        # No previous poll, no delta
+        self.assertEqual(tracker.delta('R1', 'Gi1'), {})
+        self.assertEqual(tracker.value('R1', 'Gi1'),
+                         {'in_octets': 1000, 'in_crc_errors': 0})
+
+        tracker.update('R1', interfaces(Gi1=(4000, 0, 'never'),
+                                        Gi2=(800, 9, 'never')), timestamp=30)
+        self.assertEqual(tracker.delta('R1', 'Gi1'),
+                         {'in_octets': 3000, 'in_crc_errors': 0})
+        self.assertEqual(tracker.rate('R1', 'Gi2'),
+                         {'in_octets': 10, 'in_crc_errors': 0.2})
+        self.assertEqual(sorted(tracker.counters),
+                         ['in_crc_errors', 'in_octets'])
+        self.assertEqual(len(tracker), 2)
+
+    def test_wrap_reset_clear(self):
+        tracker = CounterTracker(['in_octets', 'in_crc_errors'])
+        tracker.update('R1', interfaces(Gi1=(2 ** 32 - 100, 10, '1d02h'),
+                                        Gi2=(2 ** 40, 10, '00:10:00'),
+                                        Gi3=(5000, 10, 'never')),
+                       timestamp=0)
+        events = tracker.update('R1', interfaces(
+            Gi1=(50, 10, '1d02h'), Gi2=(100, 2, '00:00:05'),
+            Gi3=(2000, 12, 'never')), timestamp=10)
+        self.assertEqual(sorted(events), [
+            CounterEvent('R1', 'Gi1', 'in_octets', 'wrap'),
+            CounterEvent('R1', 'Gi2', None, 'clear'),
+            CounterEvent('R1', 'Gi3', 'in_octets', 'reset')])
+        # 32 bits wrap
+        self.assertEqual(tracker.delta('R1', 'Gi1')['in_octets'], 150)
+        # Cleared, counted from 0
+        self.assertEqual(tracker.delta('R1', 'Gi2'),
+                         {'in_octets': 100, 'in_crc_errors': 2})
+        # Not a plausible wrap
+        self.assertEqual(tracker.delta('R1', 'Gi3'),
+                         {'in_octets': 2000, 'in_crc_errors': 2})
+
+        self.assertEqual(last_clear_seconds('1d02h'), 93600)
+        self.assertEqual(last_clear_seconds('20:01:24'), 72084)
+        self.assertEqual(last_clear_seconds('never'), math.inf)
+        self.assertIsNone(last_clear_seconds('Unknown'))
+
+    def test_clear_between_polls(self):
+        tracker = CounterTracker(['in_octets', 'in_crc_errors'])
+        tracker.update('R1', interfaces(Gi1=(5000, 10, '00:00:20'),
+                                        Gi2=(5000, 10, '00:00:20'),
+                                        Gi3=(5000, 10, '1d02h')),
+                       timestamp=0)
+        # Gi1 cleared 25s ago, within the 60s between the polls: last_clear
+        # went up, by less than the time elapsed
+        events = tracker.update('R1', interfaces(
+            Gi1=(6000, 12, '00:00:25'), Gi2=(9000, 12, '00:01:19'),
+            Gi3=(9000, 12, '1d02h')), timestamp=60)
+        self.assertEqual(events, [CounterEvent('R1', 'Gi1', None, 'clear')])
+        self.assertEqual(tracker.delta('R1', 'Gi1'),
+                         {'in_octets': 6000, 'in_crc_errors': 12})
+        # One second late, within the slack of the polls
+        self.assertEqual(tracker.delta('R1', 'Gi2'),
+                         {'in_octets': 4000, 'in_crc_errors': 2})
+        # last_clear is to the hour, the same hour is not a clear
+        self.assertEqual(tracker.delta('R1', 'Gi3'),
+                         {'in_octets': 4000, 'in_crc_errors': 2})
+
+    def test_fleet(self):
+        tracker = CounterTracker()
+        for device, crc in [('R1', 0), ('R2', 100), ('R3', 10)]:
+            tracker.update(device, interfaces(Gi1=(0, 0, 'never'),
+                                              Gi2=(0, 0, 'never')),
+                           timestamp=0)
+            tracker.update(device, interfaces(Gi1=(1000, crc, 'never'),
+                                              Gi2=(0, 1, 'never')),
+                           timestamp=10)
+        self.assertEqual(tracker.top('in_crc_errors', n=2),
+                         [('R2', 'Gi1', 10), ('R3', 'Gi1', 1)])
+        self.assertEqual(tracker.top('in_crc_errors', n=1, kind='delta',
+                                     devices=['R1', 'R3']),
+                         [('R3', 'Gi1', 10)])
+        self.assertEqual(tracker.top(('in_octets', 'in_crc_errors'), n=1,
+                                     kind='value'),
+                         [('R2', 'Gi1', 1100)])
+        self.assertEqual(tracker.total('in_octets'), 300)
+        self.assertEqual(tracker.total('in_crc_errors', kind='delta',
+                                       devices=['R2']), 101)
+        self.assertEqual(len(tracker.column('in_octets')), 6)
+
+        # An interface gone from the output has no rate
+        tracker.update('R2', interfaces(Gi2=(0, 1, 'never')), timestamp=20)
+        self.assertEqual(tracker.rate('R2', 'Gi1'), {})
+        self.assertEqual(tracker.top('in_crc_errors', n=1),
+                         [('R3', 'Gi1', 1)])
+        with self.assertRaises(ValueError):
+            tracker.column('in_octets', kind='max')
+
+    def test_snapshot(self):
+        output = iosxe_interface.TestShowInterfaces.golden_output[
+            'execute.return_value']
+        polled = output.replace('5 minute input rate 3000 bits/sec',
+                                '5 minute input rate 4000 bits/sec', 1)
+        polled = polled.replace('545526 packets input, 41210298 bytes',
+                                '545626 packets input, 41290298 bytes', 1)
+        self.assertTrue(polled != output)
+        parser = ShowInterfaces(device=Mock())
+        tracker = CounterTracker()
+        snapshot = parser.reparse(output)
+        tracker.update('R1', snapshot, timestamp=0)
+        snapshot = parser.reparse(polled, previous=snapshot)
+        self.assertFalse(snapshot.stats['full'])
+        tracker.update('R1', snapshot, timestamp=100)
+
+        # Same deltas as from the dicts
+        expected = CounterTracker()
+        expected.update('R1', parser.cli(output=output), timestamp=0)
+        expected.update('R1', parser.cli(output=polled), timestamp=100)
+        for device, interface in expected.interfaces:
+            self.assertEqual(tracker.delta(device, interface),
+                             expected.delta(device, interface))
+        self.assertEqual(tracker.top('in_pkts', n=1),
+                         expected.top('in_pkts', n=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
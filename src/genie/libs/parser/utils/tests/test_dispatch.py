@@ -0,0 +1,113 @@
+# Python
+import re
+import unittest
+
+# Parser utils
+from genie.libs.parser.utils.regex import LazyRegex, compile_regexes
+from genie.libs.parser.utils.dispatch import LineDispatcher
+
+
+class Parser(object):
+
+    # GigabitEthernet1 is up, line protocol is up
+    p1 = LazyRegex(r'^(?P<interface>[\w\/\.\-]+) +is +(?P<enabled>[\w\s]+), '
+                   r'+line +protocol +is +(?P<line_protocol>\w+)$')
+
+    # Hardware is Loopback
+    p2 = LazyRegex(r'^Hardware +is +(?P<type>[\w\s]+)$')
+
+    # Description: desc
+    p3 = LazyRegex(r'^Description: *(?P<description>.*)$')
+
+    # 0 packets input, 0 bytes
+    p4 = LazyRegex(r'^(?P<in_pkts>[0-9]+) +packets +input, '
+                   r'+(?P<in_octets>[0-9]+) +bytes$')
+
+    # 0 runts  0 giants
+    p5 = LazyRegex(r'^(?P<in_runts>[0-9]+) *runts *(?P<in_giants>[0-9]+) '
+                   r'*giants$')
+
+    # input flow-control is off, output flow-control is off
+    p6 = LazyRegex(r'^(input|output) +flow-control +is +(?P<receive>\w+), +'
+                   r'(output|input) +flow-control +is +(?P<send>\w+)$')
+
+    # full-duplex, 1000 Mb/s
+    p7 = LazyRegex(r'^(?P<duplex_mode>\w+)-duplex, +(?P<speed>.+)$')
+
+    # Multicast groups joined: 224.0.0.1 224.0.0.2
+    p8 = LazyRegex(r'(?P<group>\d+\.\d+\.\d+\.\d+)')
+
+    dispatcher = LineDispatcher(exclude=['p8'])
+
+
+# ============================
+# Unit test for LineDispatcher
+# ============================
+class test_line_dispatcher(unittest.TestCase):
+
+    lines = ['GigabitEthernet1 is up, line protocol is up',
+             'Hardware is Loopback',
+             'Description: Pim Register Tunnel (Encap) for RP 10.186.1.1',
+             '0 packets input, 0 bytes',
+             '13350 packets input, 2513375 bytes',
+             '0 runts  0 giants',
+             '0runts 0giants',
+             'input flow-control is off, output flow-control is off',
+             'output flow-control is off, input flow-control is off',
+             'full-duplex, 1000 Mb/s',
+             'Multicast groups joined: 224.0.0.1 224.0.0.2',
+             '',
+             '  Hardware is Loopback']
+
+    def test_same_as_sequential(self):
+        regexes = compile_regexes(Parser)
+        for line in self.lines:
+            expected = {name: m.group(0) for name, m in
+                        ((name, regex.match(line)) for name, regex in regexes)
+                        if m and name != 'p8'}
+            found = {name: m.group(0) for name, m in
+                     Parser().dispatcher.match(line).items()}
+            self.assertEqual(found, expected, line)
+
+    def test_candidates(self):
+        dispatcher = Parser().dispatcher
+        self.assertEqual(dispatcher.candidates('Hardware is Loopback'),
+                         ['p1', 'p2', 'p7'])
+        self.assertEqual(dispatcher.candidates('Description: desc'),
+                         ['p3', 'p7'])
+        # p7 does not start with a literal token, it is tried on every line
+        self.assertEqual(dispatcher.candidates('0 packets input, 0 bytes'),
+                         ['p4', 'p7'])
+        self.assertEqual(dispatcher.candidates('0 runts  0 giants'),
+                         ['p5', 'p7'])
+        self.assertEqual(
+            dispatcher.candidates('GigabitEthernet1 is up, line protocol '
+                                  'is up'), ['p1', 'p7'])
+        self.assertEqual(
+            dispatcher.candidates('input flow-control is off, output '
+                                  'flow-control is off'), ['p6', 'p7'])
+
+    def test_exclude(self):
+        dispatcher = Parser().dispatcher
+        self.assertNotIn('p8', dispatcher.names)
+        self.assertEqual(dispatcher.match('224.0.0.1'), {})
+
+    def test_per_class(self):
+        class SubParser(Parser):
+            # Hardware: Ethernet
+            p2 = LazyRegex(r'^Hardware: +(?P<type>\w+)$')
+
+        self.assertIn('p2', SubParser().dispatcher.match('Hardware: Ethernet'))
+        self.assertNotIn('p2', Parser().dispatcher.match('Hardware: Ethernet'))
+        self.assertIn('p2', Parser().dispatcher.match('Hardware is Loopback'))
+
+    def test_ignore_case(self):
+        class CaseParser(object):
+            p1 = LazyRegex(r'^hardware +is +(?P<type>\w+)$', re.IGNORECASE)
+            dispatcher = LineDispatcher()
+
+        self.assertIn('p1', CaseParser().dispatcher.match('HARDWARE is Eth'))
+
+
+if __name__ == '__main__':
+    unittest.main()
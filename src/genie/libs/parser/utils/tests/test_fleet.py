@@ -0,0 +1,186 @@
+# Python
+import time
+import asyncio
+import unittest
+import concurrent.futures
+
+# Parser utils
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.fleet import FleetCollector, ReplayDevice, \
+    RateLimiter, collect_fleet
+from genie.libs.parser.iosxe.tests import test_show_platform as iosxe_platform
+from genie.libs.parser.nxos.tests import test_show_fdb as nxos_fdb
+
+COMMANDS = ['show inventory', 'show mac address-table']
+
+
+def fleet(count, latency=0):
+    # iosxe and nxos devices replaying the golden outputs of their tests
+    devices = []
+    for n in range(count):
+        if n % 2:
+            devices.append(ReplayDevice('nxos-{}'.format(n), 'nxos', {
+                'show mac address-table':
+                    nxos_fdb.test_show_mac_address_table.golden_output},
+                latency=latency))
+        else:
+            devices.append(ReplayDevice('iosxe-{}'.format(n), 'iosxe', {
+                'show inventory':
+                    iosxe_platform.test_show_inventory.golden_output},
+                latency=latency))
+    return devices
+
+
+# ===========================
+# Unit test for fleet collect
+# ===========================
+class test_fleet(unittest.TestCase):
+
+    def check(self, devices, results):
+        self.assertEqual([(result.device, result.command)
+                          for result in results],
+                         [(device.name, command) for device in devices
+                          for command in COMMANDS])
+        for result in results:
+            if result.device.startswith('iosxe') and \
+                    result.command == 'show inventory':
+                self.assertEqual(
+                    result.parsed,
+                    iosxe_platform.test_show_inventory.golden_parsed_output)
+                self.assertIsNone(result.error)
+            elif result.device.startswith('nxos') and \
+                    result.command == 'show mac address-table':
+                self.assertEqual(
+                    result.parsed,
+                    nxos_fdb.test_show_mac_address_table.golden_parsed_output)
+                self.assertIsNone(result.error)
+            else:
+                # No output replayed
+                self.assertIsNone(result.parsed)
+                self.assertEqual(result.stage, 'execute')
+                self.assertIn('No output of', result.error)
+
+    def test_collect(self):
+        devices = fleet(4)
+        done = []
+        results = FleetCollector().run(devices, COMMANDS,
+                                       callback=done.append)
+        self.check(devices, results)
+        self.assertEqual(sorted(done), sorted(results))
+
+    def test_concurrency(self):
+        # 40 round trips of 0.1 s, 2 per device at most one at a time
+        devices = fleet(20, latency=0.1)
+        start = time.perf_counter()
+        results = collect_fleet(devices, COMMANDS, concurrency=20)
+        elapsed = time.perf_counter() - start
+        self.check(devices, results)
+        self.assertLess(elapsed, 2)
+        self.assertEqual({device.max_active for device in devices}, {1})
+
+        # At most 5 in all, 8 rounds of 5 round trips
+        devices = fleet(20, latency=0.05)
+        start = time.perf_counter()
+        collect_fleet(devices, COMMANDS, concurrency=5,
+                      device_concurrency=2)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.35)
+
+    def test_async_execute(self):
+        # Waiting without threads, 500 devices
+        devices = fleet(500, latency=0.2)
+
+        async def execute(device, command):
+            return await device.async_execute(command)
+
+        start = time.perf_counter()
+        results = FleetCollector(concurrency=1000, execute=execute).run(
+            devices, COMMANDS)
+        self.assertLess(time.perf_counter() - start, 10)
+        self.check(devices, results)
+        self.assertEqual({device.max_active for device in devices}, {1})
+
+    def test_rate(self):
+        # 20 commands at 100 per second
+        devices = fleet(10)
+        start = time.perf_counter()
+        results = collect_fleet(devices, COMMANDS, rate=100)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.18)
+        self.check(devices, results)
+
+    def test_rate_limiter(self):
+        limiter = RateLimiter(rate=50, burst=5)
+
+        async def acquire(count):
+            loop = asyncio.get_event_loop()
+            start = loop.time()
+            for _ in range(count):
+                await limiter.acquire()
+            return loop.time() - start
+
+        loop = asyncio.new_event_loop()
+        try:
+            # The burst at once, then 50 per second
+            self.assertLess(loop.run_until_complete(acquire(5)), 0.05)
+            self.assertGreaterEqual(loop.run_until_complete(acquire(10)),
+                                    0.17)
+        finally:
+            loop.close()
+
+    def test_errors(self):
+        device = ReplayDevice('R1', 'iosxe', {
+            'show inventory': iosxe_platform.test_show_inventory.empty_output,
+            'show mac address-table':
+                iosxe_platform.test_show_inventory.golden_output},
+            latency=0.2)
+        # Parser modules are imported by the lookups, in the event loop:
+        # imported first, they would hold it past the timeouts
+        for command in ('show inventory', 'show mac address-table',
+                        'show ip route'):
+            common.get_parser(command, device)
+        results = collect_fleet([device], ['show unknown command',
+                                           'show inventory',
+                                           'show mac address-table',
+                                           'show ip route'], timeout=0.02)
+        self.assertEqual([result.stage for result in results],
+                         ['lookup', 'execute', 'execute', 'execute'])
+        self.assertIn("Could not find parser for 'show unknown command'",
+                      results[0].error)
+        self.assertTrue(results[1].error.startswith('TimeoutError'))
+        # The command without parser never sent
+        time.sleep(0.1)
+        self.assertEqual(device.executed, 3)
+
+        device.latency = 0
+        results = collect_fleet([device], ['show inventory',
+                                           'show mac address-table'])
+        self.assertEqual([result.stage for result in results],
+                         ['parse', 'parse'])
+        self.assertTrue(results[0].error.startswith('SchemaEmptyParserError'))
+
+    def test_timeout_holds_device(self):
+        # The executes which timed out go on in their threads, the next
+        # command of the device waits for them
+        device = ReplayDevice('R1', 'iosxe', {
+            'show inventory':
+                iosxe_platform.test_show_inventory.golden_output},
+            latency=0.3)
+        start = time.perf_counter()
+        results = collect_fleet([device], ['show inventory'] * 4,
+                                device_concurrency=1, timeout=0.1)
+        self.assertEqual([result.stage for result in results],
+                         ['execute'] * 4)
+        self.assertTrue(all(result.error.startswith('TimeoutError')
+                            for result in results))
+        self.assertEqual(device.max_active, 1)
+        self.assertGreaterEqual(time.perf_counter() - start, 1.2)
+
+    def test_process_pool(self):
+        devices = fleet(4)
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            results = collect_fleet(devices, COMMANDS,
+                                    parse_executor=executor)
+        self.check(devices, results)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+# Python
+import sys
+import unittest
+from unittest.mock import Mock
+
+# Parser utils
+from genie.libs.parser.utils.interning import InternTable
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.iosxe.tests import test_show_routing as \
+    iosxe_routing, test_show_bgp as iosxe_bgp, test_show_fdb as iosxe_fdb, \
+    test_show_interface as iosxe_interface
+
+
+def golden_outputs(test_class):
+    for name in sorted(vars(test_class)):
+        value = getattr(test_class, name)
+        if isinstance(value, dict):
+            value = value.get('execute.return_value')
+        if name.startswith('golden') and isinstance(value, str):
+            yield name, value
+
+
+def strings(parsed, found=None):
+    # str -> ids of the objects equal to it, keys and values
+    if found is None:
+        found = {}
+    items = parsed.items() if isinstance(parsed, dict) else \
+        ((None, value) for value in parsed)
+    for key, value in items:
+        for item in (key, value):
+            if isinstance(item, str):
+                found.setdefault(item, set()).add(id(item))
+        if isinstance(value, (dict, list)):
+            strings(value, found)
+    return found
+
+
+# =========================
+# Unit test for InternTable
+# =========================
+class test_interning(unittest.TestCase):
+
+    parsers = [(ShowIpRoute, iosxe_routing.TestShowIpRoute),
+               (ShowBgpAllDetail, iosxe_bgp.test_show_bgp_all_detail),
+               (ShowMacAddressTable, iosxe_fdb.test_show_mac_address_table),
+               (ShowInterfaces, iosxe_interface.TestShowInterfaces)]
+
+    def test_golden(self):
+        for parser_class, test_class in self.parsers:
+            for name, output in golden_outputs(test_class):
+                with self.subTest(parser=parser_class.__name__,
+                                  output=name):
+                    device = Mock(**{'execute.return_value': output})
+                    try:
+                        # Not interned by default
+                        expected = parser_class(device=device).parse()
+                    except Exception:
+                        # Outputs the parser fails on
+                        continue
+                    parser = parser_class(device=device)
+                    parser.intern_table = True
+                    parsed = parser.parse()
+                    # Same dicts, in the same order
+                    self.assertEqual(repr(parsed), repr(expected))
+                    # One object per string
+                    for value, ids in strings(parsed).items():
+                        self.assertEqual(len(ids), 1, value)
+
+    def test_default(self):
+        output = iosxe_fdb.test_show_mac_address_table.golden_output[
+            'execute.return_value']
+        device = Mock(**{'execute.return_value': output})
+        parsed = ShowMacAddressTable(device=device).parse()
+        self.assertTrue(any(len(ids) > 1
+                            for ids in strings(parsed).values()))
+
+    def test_shared_table(self):
+        output = iosxe_fdb.test_show_mac_address_table.golden_output[
+            'execute.return_value']
+        device = Mock(**{'execute.return_value': output})
+        table = InternTable()
+        parser = ShowMacAddressTable(device=device)
+        parser.intern_table = table
+        first = parser.parse()
+        second = parser.parse()
+        self.assertEqual(first, second)
+        self.assertGreater(table.stats['saved'], 0)
+        # Strings shared across the parsed outputs
+        both = strings(first)
+        for value, ids in strings(second).items():
+            self.assertEqual(ids, both[value])
+
+    def test_table(self):
+        table = InternTable(maxsize=4)
+        a = ''.join(['u', 'p'])
+        self.assertIs(table(a), a)
+        self.assertIs(table(''.join(['u', 'p'])), a)
+        stats = table.stats
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']),
+                         (1, 1, 1))
+        self.assertEqual(stats['saved'], sys.getsizeof(a))
+        # Bounded: strings not looked up are dropped
+        for value in ('b', 'c', 'd', 'e', 'f', 'g'):
+            table(value)
+        self.assertLessEqual(len(table), 4)
+        self.assertNotIn('up', table)
+        self.assertIsNot(table(''.join(['u', 'p'])), a)
+
+        parsed = {''.join(['k', 'e', 'y']): [''.join(['v', 'a', 'l']), 1,
+                                          {'x': 'val'}]}
+        table = InternTable()
+        table.intern(parsed)
+        self.assertIs(parsed['key'][0], parsed['key'][2]['x'])
+        self.assertEqual(parsed, {'key': ['val', 1, {'x': 'val'}]})
+
+    def test_saved_old_generation(self):
+        table = InternTable(maxsize=4)
+        up = ''.join(['u', 'p'])
+        table(up)
+        table('down')
+        # The generations flipped, 'up' is in the old one
+        self.assertNotIn(up, table._new)
+        copy = ''.join(['u', 'p'])
+        parsed = {'state': [copy]}
+        table.intern(parsed)
+        self.assertIs(parsed['state'][0], up)
+        # Counted once, for the copy replaced
+        self.assertEqual(table.saved, sys.getsizeof(copy))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# Python
+import json
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+# Parser utils
+from genie.libs.parser.utils import json_rows
+from genie.libs.parser.utils.json_rows import JsonOutputError, \
+    iter_json_rows, loads, nested
+from genie.libs.parser.nxos.show_fdb import ShowMacAddressTable
+from genie.libs.parser.nxos.tests import test_show_fdb as nxos_fdb
+
+FIELDS = {'ROW_vrf': {'vrf-name-out': 'vrf', 'router-id': 'router_id'},
+          'ROW_neighbor': {'neighbor-id': 'neighbor',
+                           'remoteas': ('remote_as', int),
+                           'shutdown': 'shutdown',
+                           'up': ('up', lambda value: value == 'true')}}
+
+REPLY = {'TABLE_vrf': {'ROW_vrf': [
+    {'vrf-name-out': 'default',
+     'TABLE_neighbor': {'ROW_neighbor': [
+         {'neighbor-id': '10.0.0.1', 'remoteas': 65000, 'up': True},
+         {'neighbor-id': '10.0.0.2', 'remoteas': 'n/a', 'shutdown': None}]},
+     'router-id': '10.1.1.1'},
+    {'vrf-name-out': 'VRF1',
+     'TABLE_neighbor': {'ROW_neighbor': {'neighbor-id': '10.0.1.1'}}}]}}
+
+
+# ============================
+# Unit test for iter_json_rows
+# ============================
+class test_json_rows(unittest.TestCase):
+
+    def test_loads(self):
+        output = 'switch# show bgp sessions | json\n{}\nswitch# '.format(
+            json.dumps(REPLY))
+        self.assertEqual(loads(output), REPLY)
+        for output in ('', None, 'switch# show bgp sessions',
+                       '{"TABLE_vrf": ', '% Invalid command at marker {x}'):
+            with self.subTest(output=output):
+                with self.assertRaises(JsonOutputError):
+                    loads(output)
+
+    def test_rows(self):
+        rows = list(iter_json_rows(FIELDS, REPLY))
+        self.assertEqual([row.tag for row in rows],
+                         ['ROW_neighbor', 'ROW_neighbor', 'ROW_vrf',
+                          'ROW_neighbor', 'ROW_vrf'])
+        # Leaves after the tables read before the nested rows
+        self.assertEqual(rows[0].parents[-1].values,
+                         {'vrf': 'default', 'router_id': '10.1.1.1'})
+        self.assertIs(rows[0].parents[-1], rows[2])
+        # Values as text to the converts, failing and null ones left out
+        self.assertEqual(rows[0].values, {'neighbor': '10.0.0.1',
+                                          'remote_as': 65000, 'up': True})
+        self.assertEqual(rows[1].values, {'neighbor': '10.0.0.2'})
+        # A table of one row
+        self.assertEqual(rows[3].values, {'neighbor': '10.0.1.1'})
+        self.assertEqual(rows[3].parents[-1].values, {'vrf': 'VRF1'})
+
+    def test_nested(self):
+        self.assertEqual(
+            nested({'mtu': 1500, ('counters', 'in_pkts'): 10,
+                    ('counters', 'rate', 'in_rate'): 0}),
+            {'mtu': 1500, 'counters': {'in_pkts': 10, 'rate': {'in_rate': 0}}})
+
+    def test_parse_json(self):
+        cli_output = nxos_fdb.test_show_mac_address_table_json.cli_output
+        json_output = nxos_fdb.test_show_mac_address_table_json.json_output
+        parsed_output = ShowMacAddressTable(device=Mock()).parse(
+            output=cli_output['execute.return_value'])
+
+        # Given output, JSON or not
+        device = Mock()
+        obj = ShowMacAddressTable(device=device)
+        self.assertEqual(obj.parse_json(
+            output=json_output['execute.return_value']), parsed_output)
+        self.assertIsNone(obj.json_error)
+        self.assertEqual(obj.parse_json(
+            output=cli_output['execute.return_value']), parsed_output)
+        self.assertIsInstance(obj.json_error, JsonOutputError)
+        self.assertFalse(device.execute.called)
+
+        # Decoded by json when orjson is not installed
+        orjson = json_rows.orjson
+        json_rows.orjson = None
+        try:
+            self.assertEqual(obj.parse_json(
+                output=json_output['execute.return_value']), parsed_output)
+        finally:
+            json_rows.orjson = orjson
+
+        with self.assertRaises(SchemaEmptyParserError):
+            obj.parse_json(output='{"TABLE_mac_address": {}}')
+
+
+if __name__ == '__main__':
+    unittest.main()
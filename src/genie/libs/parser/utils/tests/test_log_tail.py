@@ -0,0 +1,147 @@
+# Python
+import unittest
+from unittest.mock import Mock
+
+# Parser utils
+from genie.libs.parser.utils.log_tail import LogCursor, LogFollower, \
+    timestamp_key
+from genie.libs.parser.utils.fleet import ReplayDevice
+from genie.libs.parser.iosxe.show_logging import ShowLogging
+from genie.libs.parser.nxos.show_logging import ShowLoggingLogfile
+from genie.libs.parser.iosxe.tests import test_show_logging as iosxe_logging
+from genie.libs.parser.nxos.tests import test_show_logging as nxos_logging
+
+IOSXE = iosxe_logging.test_show_logging.golden_output_1[
+    'execute.return_value']
+NXOS = nxos_logging.test_show_logging.golden_output_1['execute.return_value']
+
+NEW = '''\
+Jun  5 05:12:01.001 EST: %LINEPROTO-5-UPDOWN: Line protocol on Interface GigabitEthernet2, changed state to down
+Jun  5 05:12:02.417 EST: %LINK-3-UPDOWN: Interface GigabitEthernet2, changed state to down
+'''
+
+SEQUENCED = '''\
+Log Buffer (4096 bytes):
+000041: *Mar  1 00:00:53.215 UTC: %SYS-5-RESTART: System restarted --
+000042: *Mar  1 00:01:02.117 UTC: %LINK-3-UPDOWN: Interface GigabitEthernet1, changed state to up
+'''
+
+
+# ================================
+# Unit test for log buffer tailing
+# ================================
+class test_log_tail(unittest.TestCase):
+
+    def test_tail(self):
+        parser = ShowLogging(device=Mock())
+        result = parser.tail(output=IOSXE)
+        self.assertIsNone(result.reset)
+        # The log lines only, not the settings before the buffer
+        self.assertEqual(
+            [log['line'] for log in result.logs],
+            iosxe_logging.test_show_logging.golden_parsed_output_1[
+                'logs'][-7:])
+        self.assertEqual(result.logs[2], {
+            'line': 'Jun  5 05:10:59.519 EST: %SYS-5-CONFIG_I: Configured '
+                    'from console by cisco on console',
+            'timestamp': 'Jun  5 05:10:59.519 EST', 'facility': 'SYS',
+            'severity': 5, 'mnemonic': 'CONFIG_I',
+            'message': 'Configured from console by cisco on console'})
+        self.assertEqual(result.logs[3], {
+            'line': 'Jun  5 05:11:04.626 EST: Rollback:Acquired '
+                    'Configuration lock.',
+            'timestamp': 'Jun  5 05:11:04.626 EST',
+            'message': 'Rollback:Acquired Configuration lock.'})
+        self.assertEqual(result.cursor.timestamp, 'Jun  5 05:11:14.115 EST')
+        cursor = result.cursor
+
+        # Nothing new
+        result = parser.tail(cursor=cursor, output=IOSXE)
+        self.assertEqual((result.logs, result.cursor, result.reset),
+                         ([], cursor, None))
+
+        # Two new lines
+        result = parser.tail(cursor=cursor, output=IOSXE + NEW)
+        self.assertIsNone(result.reset)
+        self.assertEqual([(log['facility'], log['severity'],
+                           log['mnemonic']) for log in result.logs],
+                         [('LINEPROTO', 5, 'UPDOWN'), ('LINK', 3, 'UPDOWN')])
+        self.assertEqual(result.cursor.timestamp, 'Jun  5 05:12:02.417 EST')
+
+    def test_reset(self):
+        parser = ShowLogging(device=Mock())
+        cursor = parser.tail(output=IOSXE).cursor
+
+        # The line of the cursor pushed out by newer lines
+        result = parser.tail(cursor=cursor, output=NEW)
+        self.assertEqual(result.reset, 'wrap')
+        self.assertEqual(len(result.logs), 2)
+
+        # Older lines than the cursor, the device restarted
+        result = parser.tail(cursor=cursor, output=SEQUENCED)
+        self.assertEqual(result.reset, 'clear')
+        self.assertEqual([log['sequence'] for log in result.logs], [41, 42])
+        self.assertEqual(result.logs[0]['timestamp'],
+                         'Mar  1 00:00:53.215 UTC')
+
+        # Cleared
+        result = parser.tail(cursor=cursor, output='Log Buffer (4096 bytes):')
+        self.assertEqual((result.logs, result.cursor, result.reset),
+                         ([], None, 'clear'))
+
+        # By sequence numbers when the lines have some
+        cursor = LogCursor('Mar  1 00:00:01.000 UTC', 40, 'unknown')
+        self.assertEqual(parser.tail(cursor=cursor,
+                                     output=SEQUENCED).reset, 'clear')
+        cursor = LogCursor('Mar  1 00:00:01.000 UTC', 30, 'unknown')
+        self.assertEqual(parser.tail(cursor=cursor,
+                                     output=SEQUENCED).reset, 'wrap')
+
+    def test_include(self):
+        device = Mock(**iosxe_logging.test_show_logging.golden_output_2)
+        result = ShowLogging(device=device).tail(include='Rollback')
+        device.execute.assert_called_with('show logging | include Rollback')
+        expected = iosxe_logging.test_show_logging.golden_parsed_output_2
+        self.assertEqual([log['line'] for log in result.logs],
+                         expected['logs'])
+
+    def test_nxos(self):
+        result = ShowLoggingLogfile(device=Mock()).tail(output=NXOS)
+        self.assertEqual([log['line'] for log in result.logs],
+                         nxos_logging.test_show_logging.golden_parsed_output_1[
+                             'logs'])
+        log = result.logs[0]
+        self.assertEqual((log['timestamp'], log['host'], log['facility'],
+                          log['severity'], log['mnemonic']),
+                         ('2019 May 22 16:20:45', 'ha01-n7010-01', 'ACLLOG',
+                          5, 'ACLLOG_FLOW_INTERVAL'))
+        self.assertTrue(log['message'].startswith('Src IP: 172.30.10.100'))
+
+    def test_follower(self):
+        iosxe = ReplayDevice('R1', 'iosxe', {'show logging': IOSXE})
+        nxos = ReplayDevice('N1', 'nxos', {'show logging logfile': NXOS})
+        follower = LogFollower()
+        self.assertEqual(len(follower.poll(iosxe).logs), 7)
+        self.assertEqual(len(follower.poll(nxos).logs), 2)
+        self.assertEqual(follower.poll(iosxe).logs, [])
+        self.assertEqual(sorted(follower.cursors), ['N1', 'R1'])
+
+        iosxe.outputs['show logging'] = IOSXE + NEW
+        self.assertEqual(len(follower.poll(iosxe).logs), 2)
+        self.assertEqual(follower.poll(nxos).logs, [])
+
+        with self.assertRaises(KeyError):
+            follower.poll(ReplayDevice('X1', 'iosxr', {}))
+
+    def test_timestamp_key(self):
+        self.assertEqual(timestamp_key('Jun  5 05:09:30.838 EST'),
+                         (0, 6, 5, 5, 9, 30.838))
+        self.assertEqual(timestamp_key('*Mar  1 00:00:53 UTC'),
+                         (0, 3, 1, 0, 0, 53.0))
+        self.assertEqual(timestamp_key('2019 May 22 16:20:45'),
+                         (2019, 5, 22, 16, 20, 45.0))
+        self.assertIsNone(timestamp_key('Rollback'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# Python
+import unittest
+from unittest.mock import Mock, patch
+
+# Parser utils
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import LookupCache, get_parser
+
+
+# ============================
+# Unit test for LookupCache
+# ============================
+class test_lookup_cache(unittest.TestCase):
+
+    def setUp(self):
+        self.lookup = Mock()
+        self.lookup.from_device.return_value._tokens = ['iosxe']
+        patcher = patch.object(common, 'Lookup', self.lookup)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        cache = patch.object(common, 'lookup_cache', LookupCache())
+        self.cache = cache.start()
+        self.addCleanup(cache.stop)
+
+    def test_repeat_command_no_lookup(self):
+        device = Mock(os='iosxe', platform='asr1k', model=None)
+        get_parser('show version', device)
+        calls = self.lookup.from_device.call_count
+        self.assertEqual(self.cache.stats, {'token_hits': 0,
+                                            'token_misses': 1,
+                                            'class_hits': 0,
+                                            'class_misses': 1})
+        # Another device of the same type
+        device = Mock(os='iosxe', platform='asr1k', model=None)
+        get_parser('show version', device)
+        get_parser('show bgp all neighbors 10.1.1.1 policy', device)
+        self.assertEqual(self.lookup.from_device.call_count, calls + 1)
+        self.assertEqual(self.cache.stats['token_misses'], 1)
+        self.assertEqual(self.cache.stats['token_hits'], 2)
+        self.assertEqual(self.cache.stats['class_hits'], 1)
+
+    def test_clear(self):
+        iosxe = Mock(os='iosxe', platform=None, model=None)
+        nxos = Mock(os='nxos', platform=None, model=None)
+        self.cache.tokens(iosxe)
+        self.cache.tokens(nxos)
+        self.cache.clear(os='iosxe')
+        self.cache.tokens(iosxe)
+        self.cache.tokens(nxos)
+        self.assertEqual(self.cache.stats['token_misses'], 3)
+        self.assertEqual(self.cache.stats['token_hits'], 1)
+        self.cache.clear()
+        self.cache.reset_stats()
+        self.cache.tokens(nxos)
+        self.assertEqual(self.cache.stats['token_misses'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+# Python
+import unittest
+
+# Parser utils
+from genie.libs.parser.utils.multi_command import ConnectionTerminal, \
+    MultiCommand, ReplayTerminal, execute_commands, split_output
+from genie.libs.parser.iosxe.tests import test_show_platform as platform
+from genie.libs.parser.iosxe.tests import test_show_interface as interface
+from genie.libs.parser.iosxe.tests import test_show_routing as routing
+
+OUTPUTS = {
+    'show version': platform.test_show_version.golden_output_asr1k,
+    'show inventory': platform.test_show_inventory.golden_output,
+    'show interfaces': interface.TestShowInterfaces.golden_output,
+    'show ip route': routing.TestShowIpRoute.golden_output_1,
+}
+
+PARSED = {
+    'show inventory': platform.test_show_inventory.golden_parsed_output,
+    'show interfaces': interface.TestShowInterfaces.golden_parsed_output,
+    'show ip route': routing.TestShowIpRoute.golden_parsed_output_1,
+}
+
+
+def terminal(**kwargs):
+    return ReplayTerminal('R1', 'iosxe', OUTPUTS, **kwargs)
+
+
+class TruncatedTerminal(ReplayTerminal):
+    '''Session ending after limit characters of output'''
+
+    limit = None
+
+    def read_until(self, expected, timeout=None):
+        output = super().read_until(expected, timeout)
+        return output[:self.limit]
+
+
+class UniconDevice(object):
+    '''Connected device with the raw services of unicon only'''
+
+    def __init__(self, terminal):
+        self.name = terminal.name
+        self.os = terminal.os
+        self._terminal = terminal
+        self._buffer = ''
+        self.patterns = []
+
+    def transmit(self, text):
+        self._terminal.write(text)
+
+    def receive(self, pattern, timeout=None):
+        self.patterns.append(pattern)
+        self._buffer = self._terminal.read_until(
+            pattern.replace('\\', ''), timeout)
+        return True
+
+    def receive_buffer(self):
+        return self._buffer
+
+
+# ===============================
+# Unit test for multi command run
+# ===============================
+class test_multi_command(unittest.TestCase):
+
+    def test_run(self):
+        device = terminal()
+        commands = ['show version', 'show inventory', 'show interfaces',
+                    'show ip route']
+        results = MultiCommand(device).run(commands)
+        self.assertEqual((device.writes, device.round_trips), (1, 1))
+        self.assertEqual([result.command for result in results], commands)
+        # Each output as executed alone
+        for result in results:
+            self.assertEqual(result.output.split(),
+                             device.execute(result.command).split())
+        for result in results[1:]:
+            self.assertIsNone(result.error)
+            self.assertEqual(result.parsed, PARSED[result.command])
+
+    def test_connection(self):
+        # A pyATS device, written to through its connection
+        device = UniconDevice(terminal())
+        batch = MultiCommand(device)
+        self.assertIsInstance(batch.terminal, ConnectionTerminal)
+        results = batch.run(['show inventory', 'show ip route'])
+        self.assertEqual([result.parsed for result in results],
+                         [PARSED['show inventory'], PARSED['show ip route']])
+        self.assertEqual(len(device.patterns), 1)
+
+        with self.assertRaises(TypeError):
+            MultiCommand(object())
+
+    def test_errors(self):
+        device = terminal()
+        device.outputs['show ip route vrf VRF1'] = ''
+        results = execute_commands(device, ['show inventory',
+                                            'show unknown command',
+                                            'show ip route vrf VRF1',
+                                            'show mac address-table',
+                                            'show ip route'])
+        self.assertEqual([(result.stage, result.error is None)
+                          for result in results],
+                         [(None, True), ('lookup', False), ('parse', False),
+                          ('execute', False), (None, True)])
+        self.assertTrue(results[2].error.startswith('SchemaEmptyParserError'))
+        self.assertIn("Invalid input detected", results[3].error)
+        self.assertEqual(results[0].parsed, PARSED['show inventory'])
+        self.assertEqual(results[4].parsed, PARSED['show ip route'])
+
+    def test_truncated(self):
+        device = TruncatedTerminal('R1', 'iosxe', OUTPUTS)
+        commands = ['show inventory', 'show ip route', 'show interfaces']
+        full = ReplayTerminal('R1', 'iosxe', OUTPUTS)
+        full.write('\n'.join(commands) + '\n')
+        # Cut in the output of show ip route
+        device.limit = len(full.read_until('show interfaces')) - 100
+        results = MultiCommand(device).run(commands)
+        self.assertEqual(results[0].parsed, PARSED['show inventory'])
+        self.assertEqual([result.stage for result in results],
+                         [None, 'execute', 'execute'])
+        self.assertIn("No output of 'show ip route'", results[1].error)
+
+        # Nothing back
+        device.write = None
+        results = MultiCommand(device).run(commands)
+        self.assertEqual({result.stage for result in results}, {'execute'})
+        self.assertTrue(results[0].error.startswith('TypeError'))
+
+    def test_split_output(self):
+        marker = '! genie-batch 0123'
+        output = ('R1>! genie-batch 0123 0\r\n'
+                  '% Unknown command\r\n'
+                  'R1>show clock\r\n'
+                  '10:00:00 UTC\r\n'
+                  'R1>! genie-batch 0123 1\r\n'
+                  'R1>show clock detail\r\n'
+                  'show clock\r\n'
+                  'R1>! genie-batch 0123 end')
+        self.assertEqual(split_output(output, ['show clock',
+                                               'show clock detail'], marker),
+                         ['10:00:00 UTC', 'show clock'])
+        self.assertEqual(split_output(output[:60], ['show clock'], marker),
+                         [None])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+# Python
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+# Parser utils
+from genie.libs.parser.utils.parse_cache import ParseCache
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+
+
+output = '''\
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+  20    0000.0000.0001    DYNAMIC     Gi1/0/1
+Total Mac Addresses for this criterion: 1
+'''
+
+output_2 = output.replace('Gi1/0/1', 'Gi1/0/2')
+
+
+class ShowVrfs(MetaParser):
+    '''Parser executing a command per vrf'''
+
+    calls = 0
+
+    def cli(self, output=None):
+        ShowVrfs.calls += 1
+        if output is None:
+            output = self.device.execute('show vrf')
+        return {vrf: self.device.execute('show vrf detail ' + vrf)
+                for vrf in output.split()}
+
+
+class Unpickled(object):
+    '''Runs code when unpickled'''
+
+    loaded = 0
+
+    def __reduce__(self):
+        return Unpickled._load, ()
+
+    @staticmethod
+    def _load():
+        Unpickled.loaded += 1
+        return {'total_mac_addresses': 99}
+
+
+class ShowVrfsTotal(MetaParser):
+    '''Parser calling another parser'''
+
+    def cli(self):
+        return {'total': len(ShowVrfs(device=self.device).parse())}
+
+
+# ========================
+# Unit test for ParseCache
+# ========================
+class test_parse_cache(unittest.TestCase):
+
+    def test_output(self):
+        cache = ParseCache()
+        device = Mock()
+        parsed = cache.parse(ShowMacAddressTable(device=device),
+                             output=output)
+        self.assertEqual(parsed['total_mac_addresses'], 1)
+        # the copy returned can be modified
+        parsed['total_mac_addresses'] = 2
+        self.assertEqual(cache.parse(ShowMacAddressTable(device=device),
+                                     output=output)['total_mac_addresses'], 1)
+        self.assertEqual(cache.stats['hits'], 1)
+        self.assertEqual(cache.stats['misses'], 1)
+        cache.parse(ShowMacAddressTable(device=device), output=output_2)
+        self.assertEqual(cache.stats['misses'], 2)
+        self.assertFalse(device.execute.called)
+
+    def test_execute_once(self):
+        cache = ParseCache()
+        device = Mock(**{'execute.return_value': output})
+        expected = ShowMacAddressTable(device=device).parse()
+        device.reset_mock()
+        for _ in range(3):
+            parser = ShowMacAddressTable(device=device)
+            self.assertEqual(cache.parse(parser), expected)
+            self.assertIs(parser.device, device)
+        self.assertEqual(device.execute.call_count, 3)
+        self.assertEqual(cache.stats['misses'], 1)
+        self.assertEqual(cache.stats['hits'], 2)
+
+    def test_kwargs(self):
+        cache = ParseCache()
+        self.assertNotEqual(cache.key(ShowMacAddressTable, {}, output),
+                            cache.key(ShowMacAddressTable, {'vlan': '20'},
+                                      output))
+        self.assertEqual(cache.key(ShowMacAddressTable, {'vlan': '20'},
+                                   output),
+                         cache.key(ShowMacAddressTable,
+                                   {'vlan': '20', 'output': output}, output))
+
+    def test_eviction(self):
+        cache = ParseCache(maxsize=2)
+        outputs = [output.replace('0001', '000{}'.format(i))
+                   for i in range(3)]
+        for out in outputs:
+            cache.parse(ShowMacAddressTable(device=Mock()), output=out)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats['evictions'], 1)
+        # the oldest one was evicted
+        cache.parse(ShowMacAddressTable(device=Mock()), output=outputs[0])
+        self.assertEqual(cache.stats['hits'], 0)
+
+        cache = ParseCache(maxbytes=1)
+        cache.parse(ShowMacAddressTable(device=Mock()), output=output)
+        self.assertEqual(len(cache), 0)
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ParseCache(directory=directory).parse(
+                ShowMacAddressTable(device=Mock()), output=output)
+            cache = ParseCache(directory=directory)
+            parsed = cache.parse(ShowMacAddressTable(device=Mock()),
+                                 output=output)
+            self.assertEqual(parsed['total_mac_addresses'], 1)
+            self.assertEqual(cache.stats['disk_hits'], 1)
+
+    def test_directory_untrusted(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ParseCache(directory=directory)
+            key = cache.key(ShowMacAddressTable, {}, output)
+            # A pickle written in the directory is not loaded
+            with open(os.path.join(directory, key), 'wb') as f:
+                f.write(b'p' + pickle.dumps(Unpickled()))
+            parsed = cache.parse(ShowMacAddressTable(device=Mock()),
+                                 output=output)
+            self.assertEqual(parsed['total_mac_addresses'], 1)
+            self.assertEqual(Unpickled.loaded, 0)
+            self.assertEqual(cache.stats['disk_hits'], 0)
+
+            # Outputs marshal cannot serialize stay in memory
+            cache.put('unmarshalable', {'value': Unpickled})
+            self.assertFalse(os.path.exists(os.path.join(directory,
+                                                         'unmarshalable')))
+            self.assertEqual(cache.get('unmarshalable'),
+                             {'value': Unpickled})
+
+    def test_more_commands(self):
+        cache = ParseCache()
+        device = Mock(**{'execute.side_effect': lambda command: command})
+        ShowVrfs.calls = 0
+        for _ in range(2):
+            parsed = cache.parse(ShowVrfs(device=device), output='red blue')
+            self.assertEqual(parsed, {'red': 'show vrf detail red',
+                                      'blue': 'show vrf detail blue'})
+        self.assertEqual(ShowVrfs.calls, 2)
+        self.assertEqual(cache.stats['uncacheable'], 2)
+
+    def test_install(self):
+        cache = ParseCache()
+        original = MetaParser.parse
+        device = Mock(**{'execute.return_value': output})
+        with cache.install():
+            ShowMacAddressTable(device=device).parse()
+            ShowMacAddressTable(device=device).parse()
+            # parse() while installed does not cache twice
+            cache.parse(ShowMacAddressTable(device=device))
+        self.assertIs(MetaParser.parse, original)
+        self.assertEqual(cache.stats['misses'], 1)
+        self.assertEqual(cache.stats['hits'], 2)
+
+    def test_install_nested(self):
+        cache = ParseCache()
+        device = Mock(**{'execute.side_effect': lambda command: command})
+        with cache.install():
+            for _ in range(2):
+                self.assertEqual(ShowVrfsTotal(device=device).parse(),
+                                 {'total': 2})
+        self.assertEqual(device.execute.call_count, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# Python
+import os
+import json
+import mmap
+import shutil
+import tempfile
+import unittest
+
+# Parser utils
+from genie.libs.parser.utils.parser_index import ParserIndex, write_index
+
+
+# ============================
+# Unit test for ParserIndex
+# ============================
+class test_parser_index(unittest.TestCase):
+
+    data = {
+        'tokens': ['iosxe', 'asr1k', 'nxos'],
+        'show version': {
+            'iosxe': {'module_name': 'show_platform',
+                      'package': 'genie.libs.parser',
+                      'class': 'ShowVersion',
+                      'doc': 'Parser for show version',
+                      'schema': '{}',
+                      'uid': 'show_version',
+                      'url': 'https://github.com',
+                      'asr1k': {'module_name': 'show_platform',
+                                'package': 'genie.libs.parser',
+                                'class': 'ShowVersionAsr1k',
+                                'doc': 'Parser for show version',
+                                'schema': '{}',
+                                'uid': 'show_version',
+                                'url': 'https://github.com'}},
+            'nxos': {'module_name': 'show_platform',
+                     'package': 'genie.libs.parser',
+                     'class': 'ShowVersion',
+                     'doc': 'Parser for show version',
+                     'schema': '{}',
+                     'uid': 'show_version',
+                     'url': 'https://github.com'}},
+        'show bgp vrf {vrf}': {
+            'nxos': {'module_name': 'show_bgp',
+                     'package': 'genie.libs.parser',
+                     'class': 'ShowBgpVrf',
+                     'doc': '', 'schema': '', 'uid': '', 'url': ''}},
+    }
+
+    golden_parsed_output = {
+        'show version': {
+            'iosxe': {'module_name': 'show_platform',
+                      'package': 'genie.libs.parser',
+                      'class': 'ShowVersion',
+                      'asr1k': {'module_name': 'show_platform',
+                                'package': 'genie.libs.parser',
+                                'class': 'ShowVersionAsr1k'}},
+            'nxos': {'module_name': 'show_platform',
+                     'package': 'genie.libs.parser',
+                     'class': 'ShowVersion'}},
+        'show bgp vrf {vrf}': {
+            'nxos': {'module_name': 'show_bgp',
+                     'package': 'genie.libs.parser',
+                     'class': 'ShowBgpVrf'}},
+    }
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.tmp, 'parsers.json')
+        self.path = os.path.join(self.tmp, 'parsers.idx')
+        with open(self.json_path, 'w') as f:
+            json.dump(self.data, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_golden(self):
+        write_index(self.json_path, self.path)
+        index = ParserIndex(self.path, self.json_path)
+        self.assertEqual(list(index), list(self.data))
+        self.assertEqual(index['tokens'], self.data['tokens'])
+        for command, value in self.golden_parsed_output.items():
+            self.assertIn(command, index)
+            self.assertEqual(index[command], value)
+        self.assertNotIn('show bgp', index)
+        with self.assertRaises(KeyError):
+            index['show bgp']
+
+    def test_lazy(self):
+        write_index(self.json_path, self.path)
+        index = ParserIndex(self.path, self.json_path)
+        self.assertIsNone(index._buf)
+        index['show version']
+        self.assertIsNotNone(index._buf)
+
+    def test_missing_index(self):
+        index = ParserIndex(self.path, self.json_path)
+        self.assertEqual(dict(index)['show bgp vrf {vrf}'],
+                         self.golden_parsed_output['show bgp vrf {vrf}'])
+
+    def test_out_of_date_index(self):
+        write_index(self.json_path, self.path)
+        self.data['show ip route'] = self.data['show version']
+        with open(self.json_path, 'w') as f:
+            json.dump(self.data, f)
+        index = ParserIndex(self.path, self.json_path)
+        self.assertIn('show ip route', index)
+
+    def test_out_of_date_same_size(self):
+        write_index(self.json_path, self.path)
+        # Another class of the same length, parsers.json keeps its size
+        text = json.dumps(self.data).replace('ShowBgpVrf', 'ShowBgpVrX')
+        stat = os.stat(self.json_path)
+        with open(self.json_path, 'w') as f:
+            f.write(text)
+        os.utime(self.json_path, ns=(stat.st_atime_ns,
+                                     stat.st_mtime_ns + 10 ** 9))
+        self.assertEqual(os.path.getsize(self.json_path), stat.st_size)
+        index = ParserIndex(self.path, self.json_path)
+        self.assertEqual(index['show bgp vrf {vrf}']['nxos']['class'],
+                         'ShowBgpVrX')
+
+    def test_touched_json(self):
+        write_index(self.json_path, self.path)
+        # Same content, as installed again: the index is still used
+        stat = os.stat(self.json_path)
+        os.utime(self.json_path, ns=(stat.st_atime_ns,
+                                     stat.st_mtime_ns + 10 ** 9))
+        index = ParserIndex(self.path, self.json_path)
+        index['show version']
+        self.assertIsInstance(index._buf, mmap.mmap)
+
+    def test_missing_json(self):
+        index = ParserIndex(self.path, os.path.join(self.tmp, 'missing.json'))
+        self.assertEqual(list(index), ['tokens'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+# Python
+import copy
+import pickle
+import unittest
+from unittest.mock import Mock
+
+# Parser utils
+from genie.libs.parser.utils.path_store import PathStore, SharedDict, \
+    SharedPathParser, open_path, share_paths, _PathSharing
+
+# BGP table parsers
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+from genie.libs.parser.iosxr.show_bgp import ShowBgpInstanceAllAll
+from genie.libs.parser.iosxe.tests import test_show_bgp as iosxe_bgp
+from genie.libs.parser.nxos.tests import test_show_bgp as nxos_bgp
+from genie.libs.parser.iosxr.tests import test_show_bgp as iosxr_bgp
+
+PARSERS = (
+    (ShowBgpAllDetail, iosxe_bgp.test_show_bgp_all_detail),
+    (ShowBgpVrfAllAll, nxos_bgp.test_show_bgp_vrf_all_all),
+    (ShowBgpInstanceAllAll, iosxr_bgp.TestShowBgpInstanceAllAll),
+)
+
+
+def paths(parsed):
+    # Paths of the prefix tables of a parsed output
+    stack = [parsed]
+    while stack:
+        value = stack.pop()
+        for key, item in value.items():
+            if key in ('prefixes', 'prefix'):
+                for entry in item.values():
+                    yield from entry['index'].values()
+            elif isinstance(item, dict):
+                stack.append(item)
+
+
+# ==========================
+# Unit test for PathStore
+# ==========================
+class test_path_store(unittest.TestCase):
+
+    def test_share(self):
+        store = PathStore()
+        path = {'next_hop': '10.1.1.1', 'localpref': 100,
+                'evpn': {'label': 1}}
+        shared = store.share(path)
+        self.assertIs(type(shared), SharedDict)
+        self.assertEqual(shared, path)
+        self.assertIs(store.share(shared), shared)
+        self.assertIs(store.share(dict(path)), shared)
+        self.assertIs(store.share({'label': 1}), shared['evpn'])
+        self.assertEqual(store.stats, {'hits': 3, 'misses': 2, 'size': 2})
+        # Equal values of other types are not the same
+        self.assertIsNot(store.share({'label': True}), shared['evpn'])
+        self.assertIsNot(store.share({'localpref': 100, 'next_hop':
+                                      '10.1.1.1', 'evpn': {'label': 1}}),
+                         shared)
+        # Not hashable, not shared
+        listed = {'update_group': [1, 2]}
+        self.assertIsNot(store.share(listed), store.share(listed))
+        self.assertEqual(store.share(listed), listed)
+        store.clear()
+        self.assertEqual(len(store), 0)
+
+    def test_read_only(self):
+        shared = PathStore().share({'next_hop': '10.1.1.1'})
+        for change in (lambda: shared.__setitem__('metric', 0),
+                       lambda: shared.__delitem__('next_hop'),
+                       lambda: shared.setdefault('metric', 0),
+                       lambda: shared.update(metric=0),
+                       lambda: shared.pop('next_hop'),
+                       shared.popitem, shared.clear):
+            with self.assertRaises(TypeError):
+                change()
+        self.assertEqual(shared, {'next_hop': '10.1.1.1'})
+        changed = dict(shared)
+        changed['metric'] = 0
+        self.assertEqual(changed, {'next_hop': '10.1.1.1', 'metric': 0})
+        self.assertEqual(copy.deepcopy(shared), shared)
+        self.assertEqual(pickle.loads(pickle.dumps(shared)), shared)
+
+    def test_parsers(self):
+        for parser_cls, test_class in PARSERS:
+            with self.subTest(parser=parser_cls.__name__):
+                store = PathStore()
+                device = Mock(**test_class.golden_output1)
+                parsed = parser_cls(device=device).parse_shared(store=store)
+                self.assertEqual(parsed, test_class.golden_parsed_output1)
+                self.assertTrue(all(type(path) is SharedDict
+                                    for path in paths(parsed)))
+                self.assertLess(len({id(path) for path in paths(parsed)}),
+                                len(list(paths(parsed))))
+
+                # Shared with the paths of a second parse
+                again = parser_cls(device=device).parse_shared(store=store)
+                self.assertEqual([id(path) for path in paths(again)],
+                                 [id(path) for path in paths(parsed)])
+
+    def test_open_path(self):
+        parser = SharedPathParser()
+        store = PathStore()
+        first, second = {}, {}
+        # Not parsing: a dict to fill
+        path = open_path(parser, first, 1)
+        self.assertIs(path, first[1])
+        self.assertIs(open_path(parser, first, 1), path)
+
+        parser._path_sharing = _PathSharing(store)
+        path['next_hop'] = '10.1.1.1'
+        # Opened again, filled still
+        self.assertIs(open_path(parser, first, 1), path)
+        self.assertIs(type(first[1]), dict)
+        # The next path shares it
+        open_path(parser, first, 2)['next_hop'] = '10.1.1.1'
+        self.assertIs(type(first[1]), SharedDict)
+        open_path(parser, second, 1)['next_hop'] = '10.1.1.1'
+        self.assertIs(first[2], first[1])
+        self.assertIs(type(second[1]), dict)
+        # A shared path opened again is a dict to fill
+        path = open_path(parser, first, 1)
+        self.assertIs(type(path), dict)
+        self.assertIs(first[1], path)
+        self.assertIs(second[1], first[2])
+        self.assertEqual(store.stats, {'hits': 2, 'misses': 1, 'size': 1})
+
+    def test_share_paths(self):
+        parsed = {'vrf': {'default': {'prefixes': {
+            '10.1.0.0/24': {'table_version': '2', 'index': {
+                1: {'next_hop': '10.2.2.2', 'origin_codes': 'i'}}},
+            '10.2.0.0/24': {'table_version': '3', 'index': {
+                1: {'next_hop': '10.2.2.2', 'origin_codes': 'i'}}}},
+            'router_id': '10.4.1.1'}}}
+        expected = copy.deepcopy(parsed)
+        self.assertIs(share_paths(parsed), parsed)
+        self.assertEqual(parsed, expected)
+        prefixes = parsed['vrf']['default']['prefixes']
+        self.assertIs(type(prefixes['10.1.0.0/24']), dict)
+        self.assertIs(prefixes['10.1.0.0/24']['index'],
+                      prefixes['10.2.0.0/24']['index'])
+        self.assertIs(type(prefixes['10.1.0.0/24']['index'][1]), SharedDict)
+
+
+if __name__ == '__main__':
+    unittest.main()
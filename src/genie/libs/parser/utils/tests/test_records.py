@@ -0,0 +1,107 @@
+# Python
+import pickle
+import unittest
+from unittest.mock import Mock
+
+# Parser utils
+from genie.libs.parser.utils.records import Record, compact, expand, \
+                                           record_class
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+from genie.libs.parser.iosxe.show_fdb import ShowMacAddressTable
+from genie.libs.parser.nxos.show_routing import ShowRoutingVrfAll
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+from genie.libs.parser.nxos.show_fdb import ShowMacAddressTable as \
+    NxosShowMacAddressTable
+from genie.libs.parser.iosxr.show_routing import ShowRouteIpv4
+from genie.libs.parser.iosxe.tests import test_show_routing as \
+    iosxe_routing, test_show_bgp as iosxe_bgp, test_show_fdb as iosxe_fdb
+from genie.libs.parser.nxos.tests import test_show_routing as \
+    nxos_routing, test_show_bgp as nxos_bgp, test_show_fdb as nxos_fdb
+from genie.libs.parser.iosxr.tests import test_show_routing as \
+    iosxr_routing
+
+
+def golden_outputs(test_class):
+    for name in sorted(vars(test_class)):
+        value = getattr(test_class, name)
+        if isinstance(value, dict):
+            value = value.get('execute.return_value')
+        if name.startswith('golden') and isinstance(value, str):
+            yield name, value
+
+
+# ====================
+# Unit test for Record
+# ====================
+class test_records(unittest.TestCase):
+
+    parsers = [(ShowIpRoute, iosxe_routing.TestShowIpRoute),
+               (ShowRoutingVrfAll, nxos_routing.test_show_routing_vrf_all),
+               (ShowRouteIpv4, iosxr_routing.test_show_route_ipv4),
+               (ShowBgpAllDetail, iosxe_bgp.test_show_bgp_all_detail),
+               (ShowBgpVrfAllAll, nxos_bgp.test_show_bgp_vrf_all_all),
+               (ShowMacAddressTable, iosxe_fdb.test_show_mac_address_table),
+               (NxosShowMacAddressTable,
+                nxos_fdb.test_show_mac_address_table)]
+
+    def test_golden(self):
+        for parser_class, test_class in self.parsers:
+            for name, output in golden_outputs(test_class):
+                with self.subTest(parser=parser_class.__name__,
+                                  output=name):
+                    device = Mock(**{'execute.return_value': output})
+                    try:
+                        parsed = parser_class(device=device).parse()
+                    except Exception:
+                        # Outputs the parser fails on
+                        continue
+                    compacted = parser_class(device=device).parse_compact()
+                    self.assertEqual(compacted, parsed)
+                    self.assertEqual(parsed, compacted)
+                    self.assertIs(type(compacted), dict)
+                    # Same dicts, in the same order
+                    self.assertEqual(repr(expand(compacted)), repr(parsed))
+                    self.assertEqual(pickle.loads(pickle.dumps(compacted)),
+                                     parsed)
+
+    def test_record(self):
+        parsed = compact({'vrf': {'default': {'address_family': {'ipv4': {
+            'routes': {'10.1.0.0/24': {'route': '10.1.0.0/24',
+                                       'active': True,
+                                       'metric': 2}}}}}}},
+            ShowIpRoute.schema)
+        route = parsed['vrf']['default']['address_family']['ipv4'][
+            'routes']['10.1.0.0/24']
+        self.assertIsInstance(route, Record)
+        self.assertEqual(route['metric'], 2)
+        self.assertEqual(route.metric, 2)
+        self.assertEqual(list(route), ['route', 'active', 'metric'])
+        self.assertEqual(len(route), 3)
+        self.assertIn('active', route)
+        self.assertNotIn('next_hop', route)
+        self.assertIsNone(route.get('next_hop'))
+        with self.assertRaises(KeyError):
+            route['next_hop']
+        with self.assertRaises(AttributeError):
+            route.metric = 3
+        self.assertEqual(route.to_dict(), {'route': '10.1.0.0/24',
+                                           'active': True, 'metric': 2})
+        # One class per keys
+        self.assertIs(type(route), record_class(('route', 'active',
+                                                 'metric')))
+        self.assertIsNot(type(route), record_class(('route', 'metric')))
+
+    def test_keys(self):
+        # Keys which are not attribute names
+        cls = record_class(('from', 'values', 'in-label'))
+        record = compact({'a': {'from': 1, 'values': 2, 'in-label': 3}},
+                         {'a': {'from': int, 'values': int,
+                                'in-label': int}})
+        self.assertIsInstance(record['a'], cls)
+        self.assertEqual(record['a']['in-label'], 3)
+        self.assertEqual(list(record['a'].values()), [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
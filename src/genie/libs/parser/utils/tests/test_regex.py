@@ -0,0 +1,61 @@
+# Python
+import re
+import unittest
+
+# Parser utils
+from genie.libs.parser.utils.regex import LazyRegex, compile_regexes
+
+
+# ============================
+# Unit test for LazyRegex
+# ============================
+class test_lazy_regex(unittest.TestCase):
+
+    def test_compiled_on_first_use(self):
+        class Parser(object):
+            p1 = LazyRegex(r'^Hostname: +(?P<hostname>\S+)$')
+
+        self.assertIsInstance(Parser.__dict__['p1'], LazyRegex)
+        m = Parser().p1.match('Hostname: R1')
+        self.assertEqual(m.groupdict(), {'hostname': 'R1'})
+        # The compiled regex replaced the LazyRegex
+        self.assertIs(Parser.__dict__['p1'], Parser().p1)
+
+    def test_flags(self):
+        class Parser(object):
+            p1 = LazyRegex(r'^hostname$', re.IGNORECASE)
+
+        self.assertTrue(Parser().p1.match('HOSTNAME'))
+
+    def test_subclass(self):
+        class Parser(object):
+            p1 = LazyRegex(r'^a$')
+
+        class SubParser(Parser):
+            p2 = LazyRegex(r'^b$')
+
+        # Compiled on the class declaring it, shared with the parent
+        compiled = SubParser().p1
+        self.assertIs(Parser.__dict__['p1'], compiled)
+        self.assertNotIn('p1', SubParser.__dict__)
+        self.assertIs(Parser().p1, compiled)
+
+    def test_compile_regexes_order(self):
+        class Parser(object):
+            p2 = LazyRegex(r'^b$')
+            p10 = LazyRegex(r'^c$')
+            p1 = LazyRegex(r'^a$')
+
+        class SubParser(Parser):
+            p3 = LazyRegex(r'^d$')
+
+        # Already compiled regexes keep their place
+        SubParser().p10
+        names = [name for name, regex in compile_regexes(SubParser)]
+        self.assertEqual(names, ['p2', 'p10', 'p1', 'p3'])
+        for name, regex in compile_regexes(SubParser):
+            self.assertIs(regex, getattr(SubParser, name))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+# Python
+import re
+import copy
+import unittest
+from unittest.mock import Mock
+
+# Parser utils
+from genie.libs.parser.utils.reparse import ParseSnapshot, changed_paths
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+from genie.libs.parser.nxos.show_interface import ShowInterface
+from genie.libs.parser.iosxe.tests import test_show_interface as \
+    iosxe_interface
+from genie.libs.parser.nxos.tests import test_show_interface as \
+    nxos_interface
+
+
+def golden_outputs(test_class):
+    for name in sorted(vars(test_class)):
+        value = getattr(test_class, name)
+        if isinstance(value, dict):
+            value = value.get('execute.return_value')
+        if name.startswith('golden') and isinstance(value, str):
+            yield name, value
+
+
+def bump(output, pattern):
+    # Counters of the lines matching pattern incremented
+    return '\n'.join(re.sub(r'\d+', lambda m: str(int(m.group()) + 7), line)
+                     if re.search(pattern, line) else line
+                     for line in output.splitlines())
+
+
+# =================================
+# Unit test for DifferentialParser
+# =================================
+class test_differential_parser(unittest.TestCase):
+
+    parsers = [(ShowInterfaces, iosxe_interface.TestShowInterfaces),
+               (ShowInterface, nxos_interface.TestShowInterface)]
+
+    # Lines parsed by both parsers, the lines they do not parse changing
+    # parse the output fully
+    counters = r'packets (input|output)|rate \d+ bits|runts|' \
+               r'^\s*\d+ unicast packets|^\s*\d+ jumbo packets$'
+
+    def test_golden(self):
+        for parser_class, test_class in self.parsers:
+            for name, output in golden_outputs(test_class):
+                with self.subTest(parser=parser_class.__name__,
+                                  output=name):
+                    parser = parser_class(device=Mock())
+                    expected = parser.cli(output=output)
+                    snapshot = parser.reparse(output)
+                    self.assertEqual(snapshot.parsed, expected)
+                    self.assertTrue(snapshot.stats['full'])
+                    previous = copy.deepcopy(snapshot.parsed)
+
+                    polled = bump(output, self.counters)
+                    next_snapshot = parser.reparse(polled,
+                                                   previous=snapshot)
+                    next_expected = parser_class(device=Mock()).cli(
+                        output=polled)
+                    self.assertEqual(next_snapshot.parsed, next_expected)
+                    self.assertEqual(next_snapshot.changed,
+                                     changed_paths(expected, next_expected))
+                    if polled != output:
+                        self.assertFalse(next_snapshot.stats['full'])
+                    # The previous snapshot is left as it was
+                    self.assertEqual(snapshot.parsed, previous)
+
+    def test_full_parse(self):
+        output = iosxe_interface.TestShowInterfaces.golden_output[
+            'execute.return_value']
+        parser = ShowInterfaces(device=Mock())
+        snapshot = parser.reparse(output)
+
+        # Same output, same parsed output
+        same = parser.reparse(output, previous=snapshot)
+        self.assertIs(same.parsed, snapshot.parsed)
+        self.assertEqual(same.changed, set())
+
+        # A line other than counters changed
+        mtu = output.replace('MTU 1500 bytes', 'MTU 9000 bytes', 1)
+        self.assertNotEqual(mtu, output)
+        changed = parser.reparse(mtu, previous=snapshot)
+        self.assertTrue(changed.stats['full'])
+        self.assertEqual(changed.parsed,
+                         ShowInterfaces(device=Mock()).cli(output=mtu))
+        self.assertIn('mtu', {path[-1] for path in changed.changed})
+
+        # An interface less
+        fewer = output.split('\n', 1)[1]
+        changed = parser.reparse(fewer, previous=snapshot)
+        self.assertTrue(changed.stats['full'])
+
+    def test_stored_snapshot(self):
+        output = nxos_interface.TestShowInterface.golden_output1[
+            'execute.return_value']
+        parsed = ShowInterface(device=Mock()).cli(output=output)
+        polled = bump(output, self.counters)
+        snapshot = ShowInterface(device=Mock()).reparse(
+            polled, previous=ParseSnapshot(output, parsed))
+        self.assertFalse(snapshot.stats['full'])
+        self.assertEqual(snapshot.parsed,
+                         ShowInterface(device=Mock()).cli(output=polled))
+
+    def test_changed_paths(self):
+        shared = {'x': 1}
+        self.assertEqual(
+            changed_paths({'a': {'b': 1, 'c': 2}, 'd': shared, 'e': 1},
+                          {'a': {'b': 1, 'c': 3}, 'd': shared, 'f': {}}),
+            {('a', 'c'), ('e',), ('f',)})
+
+
+if __name__ == '__main__':
+    unittest.main()
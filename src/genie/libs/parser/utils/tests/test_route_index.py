@@ -0,0 +1,152 @@
+# Python
+import random
+import unittest
+import ipaddress
+
+# Parser utils
+from genie.libs.parser.utils.route_index import RouteIndex, RouteTrie, \
+    parse_prefix
+from genie.libs.parser.iosxe.tests import test_show_routing as iosxe_routing
+from genie.libs.parser.nxos.tests import test_show_routing as nxos_routing
+
+
+def random_networks(count, version, rng):
+    bits, network_class = (32, ipaddress.IPv4Network) if version == 4 \
+        else (128, ipaddress.IPv6Network)
+    lengths = [0, 8, 12, 16, 20, 24, 24, 28, bits] if version == 4 \
+        else [0, 32, 48, 56, 64, 64, bits]
+    networks = []
+    for _ in range(count):
+        length = rng.choice(lengths)
+        key = rng.getrandbits(length) << (bits - length) if length else 0
+        networks.append(network_class((key, length)))
+    return networks
+
+
+# ======================
+# Unit test for RouteTrie
+# ======================
+class test_route_trie(unittest.TestCase):
+
+    def test_queries(self):
+        # Against a scan of all the networks with ipaddress
+        rng = random.Random(0)
+        for version in (4, 6):
+            with self.subTest(version=version):
+                networks = random_networks(1000, version, rng)
+                index = RouteIndex()
+                for n, network in enumerate(networks):
+                    index.add(str(network), n)
+                self.assertEqual(len(index),
+                                 len({str(network) for network in networks}))
+
+                for network in rng.sample(networks, 200):
+                    prefix = str(network)
+                    self.assertEqual(index.get(prefix)[0], prefix)
+                    self.assertEqual(
+                        [found for found, _ in index.covering(prefix)],
+                        sorted({str(other) for other in networks
+                                if network.subnet_of(other)},
+                               key=lambda found: int(found.split('/')[1])))
+                    covered = [found for found, _ in index.covered(prefix)]
+                    self.assertEqual(sorted(covered),
+                                     sorted({str(other) for other in networks
+                                             if other.subnet_of(network)}))
+
+                bits, address_class = (32, ipaddress.IPv4Address) \
+                    if version == 4 else (128, ipaddress.IPv6Address)
+                for _ in range(300):
+                    address = address_class(rng.getrandbits(bits))
+                    longest = max((network for network in networks
+                                   if address in network),
+                                  key=lambda network: network.prefixlen,
+                                  default=None)
+                    found = index.lookup(str(address))
+                    self.assertEqual(found and found[0],
+                                     longest and str(longest))
+
+    def test_trie(self):
+        trie = RouteTrie(32)
+        self.assertIsNone(trie.lookup(0x0a010101))
+        trie.insert(0x0a000000, 8, '10.0.0.0/8', 'eight')
+        trie.insert(0x0a010000, 16, '10.1.0.0/16', 'sixteen')
+        trie.insert(0x0a000000, 8, '10.0.0.0/8', 'replaced')
+        self.assertEqual(len(trie), 2)
+        self.assertEqual(trie.lookup(0x0a010101), ('10.1.0.0/16', 'sixteen'))
+        self.assertEqual(trie.lookup(0x0a020101), ('10.0.0.0/8', 'replaced'))
+        self.assertIsNone(trie.lookup(0x0b000000))
+        self.assertIsNone(trie.get(0x0a000000, 9))
+        self.assertEqual(list(trie), [('10.0.0.0/8', 'replaced'),
+                                      ('10.1.0.0/16', 'sixteen')])
+        self.assertEqual(trie.covered(0x0a010000, 15),
+                         [('10.1.0.0/16', 'sixteen')])
+        self.assertEqual(trie.covered(0x0b000000, 8), [])
+
+    def test_parse_prefix(self):
+        self.assertEqual(parse_prefix('10.1.2.3/24'),
+                         ('ipv4', 0x0a010200, 24))
+        self.assertEqual(parse_prefix('10.1.2.3'), ('ipv4', 0x0a010203, 32))
+        self.assertEqual(parse_prefix('2001:DB8::1/32'),
+                         ('ipv6', 0x20010db8 << 96, 32))
+        for prefix in ('10.1.2/24', '10.1.2.3/33', 'Null0', '2001::/129',
+                       '10.1.2.3/'):
+            with self.subTest(prefix=prefix):
+                if prefix.endswith('/'):
+                    self.assertEqual(parse_prefix(prefix)[2], 32)
+                    continue
+                with self.assertRaises(ValueError):
+                    parse_prefix(prefix)
+
+
+# ===========================
+# Unit test for RouteIndex
+# ===========================
+class test_route_index(unittest.TestCase):
+
+    def test_iosxe(self):
+        parsed = iosxe_routing.TestShowIpRoute.golden_parsed_output_1
+        routes = parsed['vrf']['default']['address_family']['ipv4']['routes']
+        index = RouteIndex.from_parsed(parsed)
+        self.assertEqual(len(index), len(routes))
+        # The parsed route itself
+        self.assertIs(index.lookup('10.1.2.7')[1], routes['10.1.2.0/24'])
+        self.assertEqual(index.lookup('10.1.2.1')[0], '10.1.2.1/32')
+        self.assertIsNone(index.lookup('10.1.4.1'))
+        self.assertIsNone(index.lookup('10.1.2.7', vrf='VRF1'))
+        self.assertEqual([prefix for prefix, _ in
+                          index.covered('10.1.0.0/16')],
+                         ['10.1.2.0/24', '10.1.2.1/32', '10.1.3.0/24',
+                          '10.1.3.1/32'])
+        self.assertEqual([prefix for prefix, _ in
+                          index.covering('10.1.3.1/32')],
+                         ['10.1.3.0/24', '10.1.3.1/32'])
+        self.assertEqual(index.via('10.1.2.2'),
+                         ['10.16.2.2/32', '10.2.3.0/24', '10.151.22.22/32'])
+        self.assertEqual(index.via('GigabitEthernet0/2'),
+                         ['10.36.3.3/32', '10.1.3.0/24', '10.1.3.1/32'])
+        self.assertEqual(index.via('10.9.9.9'), [])
+
+    def test_nxos(self):
+        parsed = nxos_routing.test_show_routing_vrf_all.golden_parsed_output
+        index = RouteIndex.from_parsed(parsed)
+        self.assertEqual(index.lookup('10.189.1.77', vrf='VRF1')[0],
+                         '10.189.1.0/24')
+        self.assertEqual(index.via('10.55.130.3', vrf='VRF1'),
+                         ['10.189.1.0/24'])
+        self.assertEqual(index.via('10.36.3.3', vrf='VRF1'),
+                         ['10.21.33.33/32'])
+
+        parsed = nxos_routing.test_show_routing_ipv6_vrf_all.\
+            golden_parsed_output_1
+        index = RouteIndex.from_parsed(parsed, index=index)
+        self.assertEqual(index.lookup('2001:db8:1:1::7')[0],
+                         '2001:db8:1:1::/64')
+        self.assertEqual(index.lookup('615:11:11:1::1', vrf='VRF1')[0],
+                         '615:11:11:1::/64')
+        # Both address families of VRF1
+        self.assertEqual(sorted(af for vrf, af in index.tries
+                                if vrf == 'VRF1'), ['ipv4', 'ipv6'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+# Python
+import sys
+import unittest
+from unittest.mock import Mock
+
+# Metaparser
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any, Optional, Or
+from genie.metaparser.util.exceptions import SchemaError, \
+    SchemaTypeError, SchemaValueError, SchemaMissingKeyError, \
+    SchemaUnsupportedKeyError
+
+# Parser utils
+from genie.libs.parser.utils.schema_compiler import CompiledSchema, \
+    SampledValidation, compile_schema
+from genie.libs.parser.iosxe.show_bgp import ShowBgpAllDetail
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+from genie.libs.parser.nxos.show_vrf import ShowVrf
+from genie.libs.parser.iosxe.tests import test_show_bgp as iosxe_bgp
+from genie.libs.parser.nxos.tests import test_show_bgp as nxos_bgp
+from genie.libs.parser.nxos.tests import test_show_vrf as nxos_vrf
+
+
+schema = {
+    'vrf': {
+        Any(): {
+            'id': int,
+            Optional('state'): Or(str, None),
+            Optional('type'): 'static',
+            Optional('counters'): {
+                Any(): Or(int, str),
+            },
+        },
+    },
+    Optional('total'): int,
+}
+
+
+# ============================
+# Unit test for CompiledSchema
+# ============================
+class test_compiled_schema(unittest.TestCase):
+
+    def test_golden(self):
+        for parser, golden in [
+                (ShowBgpAllDetail,
+                 iosxe_bgp.test_show_bgp_all_detail.golden_parsed_output1),
+                (ShowBgpVrfAllAll,
+                 nxos_bgp.test_show_bgp_vrf_all_all.golden_parsed_output3)]:
+            self.assertIs(compile_schema(parser.schema).validate(golden),
+                          golden)
+
+    def test_valid(self):
+        compiled = CompiledSchema(schema)
+        data = {'vrf': {'red': {'id': 1, 'state': None, 'type': 'static',
+                                'counters': {'in': 1, 'out': 'n/a'}},
+                        'blue': {'id': 2}}}
+        self.assertIs(compiled.validate(data), data)
+
+    def test_errors(self):
+        compiled = CompiledSchema(schema)
+        for data, error in [
+                ({'vrf': {'red': {'id': '1'}}}, SchemaTypeError),
+                ({'vrf': {'red': {'id': 1, 'type': 'dynamic'}}},
+                 SchemaValueError),
+                ({'vrf': {'red': {'id': 1, 'state': 1}}}, SchemaError),
+                ({'vrf': {'red': {'id': 1, 'counters': {'in': 1.5}}}},
+                 SchemaError),
+                ({'vrf': {'red': {}, 'blue': {}}}, SchemaMissingKeyError),
+                ({'vrf': {'red': {'id': 1, 'name': 'red'}}},
+                 SchemaUnsupportedKeyError),
+                ({'vrf': 'red'}, SchemaTypeError)]:
+            with self.assertRaises(error):
+                compiled.validate(data)
+
+    def test_missing_keys(self):
+        compiled = CompiledSchema({'a': str, 'b': {'c': str, 'd': str}})
+        with self.assertRaises(SchemaMissingKeyError) as cm:
+            # missing keys are reported before unsupported ones
+            compiled.validate({'b': {'e': ''}})
+        self.assertIn("'d'", str(cm.exception))
+        self.assertIn("'a'", str(cm.exception))
+
+    def test_warn_unsupported_keys(self):
+        compiled = CompiledSchema(schema)
+        data = {'vrf': {'red': {'id': 1, 'name': 'red'}}, 'extra': 1}
+        with self.assertLogs('genie.libs.parser.utils.schema_compiler'):
+            compiled.validate(data, warn_unsupported_keys=True)
+        self.assertEqual(data, {'vrf': {'red': {'id': 1}}})
+
+
+# ===============================
+# Unit test for SampledValidation
+# ===============================
+class test_sampled_validation(unittest.TestCase):
+
+    def test_fraction(self):
+        validation = SampledValidation(fraction=0.25)
+        for _ in range(9):
+            validation.validate(schema, {'vrf': {}, 'total': 1})
+        self.assertEqual(validation.stats, {'validated': 3, 'skipped': 6})
+
+    def test_trusted(self):
+        validation = SampledValidation(fraction=0)
+        with self.assertRaises(SchemaTypeError):
+            validation.validate(schema, {'vrf': {}, 'total': '1'})
+        validation.validate(schema, {'vrf': {}, 'total': '1'})
+        self.assertEqual(validation.stats, {'validated': 1, 'skipped': 1})
+
+    def test_install(self):
+        module = sys.modules[MetaParser.__module__]
+        original = getattr(module, 'Schema', None)
+        validation = SampledValidation()
+        with validation.install():
+            with self.assertRaises(SchemaTypeError):
+                module.Schema(schema).validate({'vrf': {}, 'total': '1'},
+                                               command='show vrf')
+        self.assertIs(getattr(module, 'Schema', None), original)
+        self.assertEqual(validation.stats['validated'], 1)
+
+    def test_install_parse(self):
+        # parse() validates its output with the Schema of the MetaParser
+        # module, the sampled one while installed
+        golden = nxos_vrf.test_show_vrf
+        output = golden.golden_output['execute.return_value']
+        validation = SampledValidation(fraction=0)
+        with validation.install():
+            for _ in range(3):
+                parsed = ShowVrf(device=Mock()).parse(output=output)
+        self.assertEqual(parsed, golden.golden_parsed_output)
+        self.assertEqual(validation.stats, {'validated': 1, 'skipped': 2})
+        # Uninstalled, the parses are no longer counted
+        ShowVrf(device=Mock()).parse(output=output)
+        self.assertEqual(validation.stats, {'validated': 1, 'skipped': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
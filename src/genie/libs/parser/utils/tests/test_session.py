@@ -0,0 +1,106 @@
+# Python
+import unittest
+from unittest.mock import Mock
+
+# Parser utils
+from genie.libs.parser.utils.session import ExecuteSession
+
+# nxos parsers calling ShowVrf
+from genie.libs.parser.nxos.show_vrf import ShowRunningConfigVrf
+from genie.libs.parser.nxos.show_mcast import \
+    ShowForwardingDistributionMulticastRoute
+from genie.libs.parser.nxos.tests import test_show_vrf, test_show_mcast
+
+
+class Device(object):
+    '''Device returning the golden output of each command'''
+
+    outputs = {
+        'show vrf':
+            test_show_vrf.test_show_vrf.golden_output[
+                'execute.return_value'],
+        'show running-config vrf':
+            test_show_vrf.test_show_running_config_vrf.golden_output[
+                'execute.return_value'],
+        'show forwarding distribution multicast route':
+            test_show_mcast.test_show_forwarding_distribution_multicast_route
+            .golden_output['execute.return_value'],
+        'clear ip mroute': '',
+    }
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, command, **kwargs):
+        self.commands.append(command)
+        command = ' '.join(command.split())
+        for prefix, output in self.outputs.items():
+            if command == prefix or command.startswith(prefix + ' '):
+                return output
+        raise Exception('Invalid command ' + command)
+
+
+# ============================
+# Unit test for ExecuteSession
+# ============================
+class test_execute_session(unittest.TestCase):
+
+    def snapshot(self, device):
+        return (ShowRunningConfigVrf(device=device).parse(),
+                ShowForwardingDistributionMulticastRoute(device=device)
+                .parse(vrf='all'))
+
+    def test_nested_parsers(self):
+        device = Device()
+        expected = self.snapshot(device)
+        executed = len(device.commands)
+        self.assertEqual(device.commands.count('show vrf'), 2)
+
+        device = Device()
+        with ExecuteSession(device) as session:
+            self.assertEqual(self.snapshot(device), expected)
+        self.assertEqual(device.commands.count('show vrf'), 1)
+        self.assertEqual(session.stats, {'executed': executed - 1,
+                                         'saved': 1})
+        self.assertEqual(session.saved_by_command, {'show vrf': 1})
+
+    def test_restored(self):
+        device = Device()
+        with ExecuteSession(device):
+            device.execute('show vrf')
+        self.assertNotIn('execute', vars(device))
+        device.execute('show vrf')
+        self.assertEqual(device.commands, ['show vrf', 'show vrf'])
+
+        device = Mock(**{'execute.return_value': 'output'})
+        execute = device.execute
+        with ExecuteSession(device):
+            device.execute('show vrf')
+            device.execute('show vrf')
+        self.assertIs(device.execute, execute)
+        self.assertEqual(device.execute.call_count, 1)
+
+    def test_not_cached(self):
+        device = Device()
+        with ExecuteSession(device) as session:
+            device.execute('clear ip mroute')
+            device.execute('clear ip mroute')
+            device.execute('show  vrf')
+            device.execute('show vrf')
+        self.assertEqual(device.commands,
+                         ['clear ip mroute', 'clear ip mroute', 'show  vrf'])
+        self.assertEqual(session.stats, {'executed': 3, 'saved': 1})
+
+    def test_devices(self):
+        devices = [Device(), Device()]
+        with ExecuteSession(*devices) as session:
+            for device in devices * 2:
+                device.execute('show vrf')
+        self.assertEqual([device.commands for device in devices],
+                         [['show vrf'], ['show vrf']])
+        session.clear()
+        self.assertEqual(session.outputs, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
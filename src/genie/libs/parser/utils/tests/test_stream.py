@@ -0,0 +1,188 @@
+# Python
+import io
+import unittest
+import threading
+
+# Parser utils
+from genie.libs.parser.utils.stream import iter_lines, ChunkLines, \
+                                           IncrementalParser
+
+
+# ========================
+# Unit test for iter_lines
+# ========================
+class test_iter_lines(unittest.TestCase):
+
+    output = 'Vlan    Mac Address\n' \
+             '----    -----------\n' \
+             '\n' \
+             ' 10    aaaa.bbbb.cccc'
+
+    lines = ['Vlan    Mac Address', '----    -----------', '',
+             ' 10    aaaa.bbbb.cccc']
+
+    def test_output(self):
+        self.assertEqual(list(iter_lines(self.output)), self.lines)
+        self.assertEqual(list(iter_lines('')), [])
+        self.assertEqual(list(iter_lines(None)), [])
+
+    def test_file_object(self):
+        self.assertEqual(
+            list(iter_lines(output_stream=io.StringIO(self.output))),
+            self.lines)
+
+    def test_line_endings(self):
+        stream = (line + '\r\n' for line in self.lines)
+        self.assertEqual(list(iter_lines(output_stream=stream)), self.lines)
+        # Leading and trailing spaces are kept
+        self.assertEqual(list(iter_lines(output_stream=['  a  \n'])),
+                         ['  a  '])
+
+    def test_bytes(self):
+        stream = io.BytesIO(self.output.encode() + b'\n\xe2\x80\x94\n')
+        self.assertEqual(list(iter_lines(output_stream=stream)),
+                         self.lines + ['—'])
+
+    def test_lazy(self):
+        consumed = []
+
+        def reader():
+            for line in self.lines:
+                consumed.append(line)
+                yield line
+
+        lines = iter_lines(output_stream=reader())
+        self.assertEqual(next(lines), self.lines[0])
+        self.assertEqual(consumed, self.lines[:1])
+
+    def test_stream_preferred(self):
+        self.assertEqual(list(iter_lines('ignored', ['used'])), ['used'])
+
+
+# ========================
+# Unit test for ChunkLines
+# ========================
+class test_chunk_lines(unittest.TestCase):
+
+    output = 'Vlan    Mac Address\r\n' \
+             '----    -----------\r\n' \
+             '\r\n' \
+             ' 10    aaaa.bbbb.cccc \u2014'
+
+    lines = ['Vlan    Mac Address', '----    -----------', '',
+             ' 10    aaaa.bbbb.cccc \u2014']
+
+    def chunked(self, output, size):
+        return [output[i:i + size] for i in range(0, len(output), size)]
+
+    def test_chunk_sizes(self):
+        for size in range(1, len(self.output) + 1):
+            lines = ChunkLines()
+            for chunk in self.chunked(self.output, size):
+                lines.put(chunk)
+            lines.close()
+            self.assertEqual(list(lines), self.lines, size)
+
+    def test_bytes(self):
+        # the multibyte character is split across chunks
+        for size in (1, 2, 5):
+            lines = ChunkLines()
+            for chunk in self.chunked(self.output.encode(), size):
+                lines.put(chunk)
+            lines.close()
+            self.assertEqual(list(lines), self.lines, size)
+
+    def test_trailing_newline(self):
+        lines = ChunkLines()
+        lines.put('a\n')
+        lines.put('b\n')
+        lines.close()
+        self.assertEqual(list(lines), ['a', 'b'])
+
+    def test_backpressure(self):
+        lines = ChunkLines(max_size=10)
+        # taken while the buffer is empty, even larger than max_size
+        lines.put('aaaaaaaaaaaa\n')
+        writer = threading.Thread(target=lines.put, args=('b\nc\n',))
+        writer.start()
+        writer.join(0.2)
+        # the buffer is full, put() waits for the reader
+        self.assertTrue(writer.is_alive())
+        reader = iter(lines)
+        self.assertEqual(next(reader), 'aaaaaaaaaaaa')
+        writer.join(5)
+        self.assertFalse(writer.is_alive())
+        lines.close()
+        self.assertEqual(list(reader), ['b', 'c'])
+
+    def test_stop(self):
+        lines = ChunkLines(max_size=1)
+        lines.put('a\n')
+        writer = threading.Thread(target=lines.put, args=('b\n',))
+        writer.start()
+        # the reader is gone, put() drops the chunk instead of waiting
+        lines.stop()
+        writer.join(5)
+        self.assertFalse(writer.is_alive())
+        lines.put('c\n')
+        lines.close()
+        self.assertEqual(list(lines), [])
+
+    def test_reader_left(self):
+        lines = ChunkLines(max_size=1)
+        lines.put('a\nb\n')
+        for line in lines:
+            break
+        # the reader left the loop, put() no longer blocks
+        lines.put('c\n')
+        lines.put('d\n')
+
+
+class Parser(IncrementalParser):
+
+    def parse(self, output_stream, vlan=None):
+        parsed = {}
+        for line in output_stream:
+            if line.startswith('Error'):
+                raise ValueError(line)
+            parsed.setdefault(vlan, []).append(line)
+        return parsed
+
+
+# ===============================
+# Unit test for IncrementalParser
+# ===============================
+class test_incremental_parser(unittest.TestCase):
+
+    def test_feed_close(self):
+        parser = Parser()
+        parser.feed('Vlan  Mac')
+        parser.feed(' Address\n 10  aaaa.bbbb.cccc')
+        self.assertEqual(parser.close(),
+                         {None: ['Vlan  Mac Address', ' 10  aaaa.bbbb.cccc']})
+
+    def test_start(self):
+        parser = Parser()
+        parser.start(vlan='10')
+        parser.feed('aaaa.bbbb.cccc\n')
+        self.assertEqual(parser.close(), {'10': ['aaaa.bbbb.cccc']})
+        # the parser object can be used again
+        parser.feed('dddd.eeee.ffff\n')
+        self.assertEqual(parser.close(), {None: ['dddd.eeee.ffff']})
+
+    def test_already_started(self):
+        parser = Parser()
+        parser.start()
+        with self.assertRaises(RuntimeError):
+            parser.start()
+        parser.close()
+
+    def test_error(self):
+        parser = Parser()
+        parser.feed('Error: invalid input\n')
+        with self.assertRaises(ValueError):
+            parser.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+# Python
+import unittest
+import tracemalloc
+
+# Parser utils
+from genie.libs.parser.utils.xml_rows import iter_xml_rows
+from genie.libs.parser.nxos.show_bgp import ShowBgpProcessVrfAll, \
+    ShowBgpVrfAllAllSummary, ShowBgpAllNexthopDatabase, ShowBgpSessions
+from genie.libs.parser.nxos.tests import test_show_bgp as nxos_bgp
+
+HEADER = '''<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns="http://www.cisco.com/nxos:1.0:bgp" \
+xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0">
+ <nf:data>
+  <show>
+   <bgp>
+    <sessions>
+     <__XML__OPT_Cmd_show_bgp_sessions_cmd_vrf>
+      <__XML__OPT_Cmd_show_bgp_sessions_cmd___readonly__>
+       <__readonly__>
+        <totalpeers>{peers}</totalpeers>
+        <TABLE_vrf>
+         <ROW_vrf>
+          <vrf-name-out>default</vrf-name-out>
+          <TABLE_neighbor>
+'''
+
+NEIGHBOR = '''\
+           <ROW_neighbor>
+            <neighbor-id>10.{}.{}.1</neighbor-id>
+            <remoteas>{}</remoteas>
+           </ROW_neighbor>
+'''
+
+TRAILER = '''\
+          </TABLE_neighbor>
+          <router-id>10.1.1.1</router-id>
+         </ROW_vrf>
+        </TABLE_vrf>
+       </__readonly__>
+      </__XML__OPT_Cmd_show_bgp_sessions_cmd___readonly__>
+     </__XML__OPT_Cmd_show_bgp_sessions_cmd_vrf>
+    </sessions>
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>
+'''
+
+FIELDS = {'__readonly__': {'totalpeers': ('total_peers', int)},
+          'ROW_vrf': {'vrf-name-out': 'vrf', 'router-id': 'router_id'},
+          'ROW_neighbor': {'neighbor-id': 'neighbor',
+                           'remoteas': ('remote_as', int)}}
+
+
+def sessions_lines(peers):
+    yield HEADER.format(peers=peers)
+    for n in range(peers):
+        yield NEIGHBOR.format(n >> 8 & 255, n & 255, 65000 + n % 1000)
+    yield TRAILER
+
+
+# ===========================
+# Unit test for iter_xml_rows
+# ===========================
+class test_xml_rows(unittest.TestCase):
+
+    parsers = [
+        (ShowBgpProcessVrfAll, nxos_bgp.test_show_bgp_process_vrf_all_xml),
+        (ShowBgpVrfAllAllSummary,
+         nxos_bgp.test_show_bgp_vrf_all_all_summary_xml),
+        (ShowBgpAllNexthopDatabase,
+         nxos_bgp.test_show_bgp_all_nexthop_database_xml),
+        (ShowBgpSessions, nxos_bgp.test_show_bgp_sessions_xml)]
+
+    def test_rows(self):
+        output = ''.join(sessions_lines(2))
+        rows = list(iter_xml_rows(FIELDS, output=output,
+                                  command='show bgp sessions'))
+        self.assertEqual([row.tag for row in rows],
+                         ['ROW_neighbor', 'ROW_neighbor', 'ROW_vrf',
+                          '__readonly__'])
+        self.assertEqual(rows[0].values, {'neighbor': '10.0.0.1',
+                                          'remote_as': 65000})
+        self.assertEqual([row.tag for row in rows[1].parents],
+                         ['__readonly__', 'ROW_vrf'])
+        # Complete once yielded, leaves after the tables included
+        self.assertEqual(rows[2].values, {'vrf': 'default',
+                                          'router_id': '10.1.1.1'})
+        self.assertIs(rows[1].parents[-1], rows[2])
+        self.assertEqual(rows[3].values, {'total_peers': 2})
+
+        # Same rows out of a stream, in any chunks
+        stream = [line.encode() for line in output.splitlines(True)]
+        self.assertEqual(list(iter_xml_rows(FIELDS, output_stream=stream)),
+                         rows)
+        stream = [output[n:n + 7] for n in range(0, len(output), 7)]
+        self.assertEqual(list(iter_xml_rows(FIELDS, output_stream=stream)),
+                         rows)
+
+    def test_command(self):
+        output = ''.join(sessions_lines(1))
+        with self.assertRaises(AssertionError):
+            list(iter_xml_rows(FIELDS, output=output,
+                               command='show bgp sessions vrf all'))
+
+    def test_golden(self):
+        for parser_class, test_class in self.parsers:
+            for name in sorted(vars(test_class)):
+                if not name.startswith('golden_output'):
+                    continue
+                output = getattr(test_class, name)['execute.return_value']
+                with self.subTest(parser=parser_class.__name__,
+                                  output=name):
+                    rows = list(iter_xml_rows(parser_class.xml_fields,
+                                              output=output))
+                    self.assertTrue(rows)
+                    stream = (output[n:n + 1000]
+                              for n in range(0, len(output), 1000))
+                    self.assertEqual(
+                        list(iter_xml_rows(parser_class.xml_fields,
+                                           output_stream=stream)), rows)
+
+    def test_memory(self):
+        # Bounded by one row, not by the reply
+        peers = 50000
+        tracemalloc.start()
+        try:
+            count = 0
+            for row in iter_xml_rows(FIELDS,
+                                     output_stream=sessions_lines(peers)):
+                count += 1
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(count, peers + 2)
+        self.assertLess(peak, 1 << 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+# Python
+import unittest
+import xml.etree.ElementTree as ET
+
+# Parser utils
+from genie.libs.parser.utils.yang_paths import YangExtractor, YangList
+from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+from genie.libs.parser.yang.tests import test_bgp_openconfig_yang as yang_bgp
+
+REPLY = '''
+<data>
+ <bgp xmlns="http://openconfig.net/yang/bgp">
+  <global>
+   <state>
+    <as>100</as>
+    <router-id>10.4.1.1</router-id>
+   </state>
+   <config><as>200</as></config>
+  </global>
+  <neighbors>
+   <neighbor>
+    <state>
+     <peer-as>300</peer-as>
+     <description/>
+     <queues><input>0</input></queues>
+    </state>
+    <afi-safis>
+     <afi-safi xmlns="http://openconfig.net/yang/bgp-multiprotocol">
+      <afi-safi-name>IPV4_UNICAST</afi-safi-name>
+      <state><active>true</active></state>
+     </afi-safi>
+     <afi-safi xmlns="http://openconfig.net/yang/bgp-multiprotocol">
+      <afi-safi-name>NONE</afi-safi-name>
+      <state><active>true</active></state>
+     </afi-safi>
+    </afi-safis>
+    <neighbor-address>10.16.2.2</neighbor-address>
+   </neighbor>
+   <neighbor>
+    <state><peer-as>400</peer-as></state>
+   </neighbor>
+   <neighbor>
+    <neighbor-address>10.16.2.2</neighbor-address>
+    <state><peer-as>n/a</peer-as></state>
+    <timers><state><hold-time>180</hold-time></state></timers>
+   </neighbor>
+  </neighbors>
+ </bgp>
+ <bgp xmlns="http://example.com/other"><global><state><as>1</as></state>
+ </global></bgp>
+</data>
+'''
+
+
+def address_family(text):
+    if text == 'NONE':
+        raise ValueError(text)
+    return text.lower()
+
+
+FIELDS = {
+    'oc:bgp/global/state/as': ('bgp_pid', int),
+    'oc:bgp/global/state/router-id': (('vrf', 'default', 'router_id'), None),
+    'oc:bgp/neighbors/neighbor/state/peer-as': ('remote_as', int),
+    'oc:bgp/neighbors/neighbor/state/description': ('description', str),
+    'oc:bgp/neighbors/neighbor/state/queues/input': ('input_queue', int),
+    'oc:bgp/neighbors/neighbor/timers/state/hold-time': ('holdtime', int),
+    'oc:bgp/neighbors/neighbor/afi-safis/mp:afi-safi/state/active':
+        ('active', lambda text: text == 'true'),
+}
+
+LISTS = {
+    'oc:bgp/neighbors/neighbor': YangList('neighbor-address',
+                                          ('vrf', 'default', 'neighbor')),
+    'oc:bgp/neighbors/neighbor/afi-safis/mp:afi-safi': YangList(
+        'afi-safi-name', 'address_family', convert=address_family),
+}
+
+NAMESPACES = {'oc': 'http://openconfig.net/yang/bgp',
+              'mp': 'http://openconfig.net/yang/bgp-multiprotocol'}
+
+PARSED = {
+    'bgp_pid': 100,
+    'vrf': {'default': {
+        'router_id': '10.4.1.1',
+        'neighbor': {'10.16.2.2': {
+            'remote_as': 300, 'description': 'None', 'input_queue': 0,
+            'holdtime': 180,
+            'address_family': {'ipv4_unicast': {'active': True}}}}}}}
+
+
+# ===========================
+# Unit test for YangExtractor
+# ===========================
+class test_yang_paths(unittest.TestCase):
+
+    def test_extract(self):
+        extractor = YangExtractor(FIELDS, LISTS, namespaces=NAMESPACES)
+        # Entries keyed once read, dropped without key, merged by key; the
+        # leaves failing to convert and the bgp of another namespace left out
+        self.assertEqual(extractor.extract(element=ET.fromstring(REPLY)),
+                         PARSED)
+        self.assertEqual(extractor.extract(output=REPLY), PARSED)
+
+    def test_stream(self):
+        extractor = YangExtractor(FIELDS, LISTS, namespaces=NAMESPACES)
+        for size in (1, 7, 1000):
+            with self.subTest(size=size):
+                stream = (REPLY[n:n + size].encode()
+                          for n in range(0, len(REPLY), size))
+                self.assertEqual(extractor.extract(output_stream=stream),
+                                 PARSED)
+
+    def test_namespaces(self):
+        uri = 'http://openconfig.net/yang/bgp'
+        for fields, kwargs, expected in (
+                # Any namespace
+                ({'bgp/global/state/as': ('as', int)}, {}, {'as': 1}),
+                ({'{%s}bgp/global/state/as' % uri: ('as', int)}, {},
+                 {'as': 100}),
+                ({'bgp/global/state/as': ('as', int)}, {'namespace': uri},
+                 {'as': 100}),
+                ({'other:bgp/global/state/as': ('as', int)},
+                 {'namespaces': {'other': 'http://example.com/other'}},
+                 {'as': 1}),
+                ({'oc:bgp/config/as': ('as', int)}, {'namespaces': NAMESPACES},
+                 {})):
+            with self.subTest(fields=fields, kwargs=kwargs):
+                self.assertEqual(YangExtractor(fields, **kwargs).extract(
+                    output=REPLY), expected)
+
+    def test_bgp_openconfig(self):
+        # Same output out of the tree and the text of the golden replies
+        for test_class in (yang_bgp.test_yang_bgp_iosxr,
+                           yang_bgp.test_yang_bgp_nxos):
+            with self.subTest(test=test_class.__name__):
+                element = test_class.yang_output.data_ele
+                output = ET.tostring(element, encoding='unicode')
+                parsed = BgpOpenconfigYang.extractor.extract(element=element)
+                self.assertEqual(BgpOpenconfigYang.extractor.extract(
+                    output=output), parsed)
+                parser = BgpOpenconfigYang(device=None)
+                self.assertEqual(parser.yang(output=output),
+                                 test_class.golden_parsed_output)
+
+
+if __name__ == '__main__':
+    unittest.main()
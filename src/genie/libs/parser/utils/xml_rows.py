@@ -0,0 +1,200 @@
+'''Rows of NX-OS "| xml" replies, streamed
+
+The xml() of NX-OS parsers read the whole reply with ET.fromstring, then walk
+the TABLE_x / ROW_x elements of the tree. For a full table the reply is
+hundreds of MB of XML, all held as elements until the parse is done.
+
+iter_xml_rows() feeds the reply to an XMLPullParser in chunks and yields the
+ROW_x elements as they are read, the elements read being dropped: the
+memory held is that of the rows open, not of the reply. The values of a row
+are its leaf elements, mapped to the keys of the schema by a declarative
+field map:
+
+    fields = {
+        'ROW_vrf': {'vrf-name-out': 'vrf',
+                    'vrf-local-as': ('local_as', int)},
+        'ROW_neighbor': {'neighbor-id': 'neighbor',
+                         'remoteas': ('remote_as', int)},
+    }
+
+    for row in iter_xml_rows(fields, output=output):
+        if row.tag == 'ROW_neighbor':
+            vrf = row.parents[-1].values['vrf']
+            ...
+
+Only the rows of the field map are yielded, complete, when they end: the
+rows nested in a row are yielded before it. The rows a row is nested in,
+its parents, have the values of the leaves read so far, NX-OS giving the
+keys of a row (vrf-name-out, af-name...) before its tables. Tags are
+compared without their namespace.
+'''
+
+# python
+import collections
+import xml.etree.ElementTree as ET
+
+# Trailer of the NETCONF replies returned by the devices
+_JUNK = ']]>]]>'
+
+# Bytes of output fed to the XML parser at a time
+_CHUNK = 1 << 16
+
+XmlRow = collections.namedtuple('XmlRow', ['tag', 'values', 'parents'])
+XmlRow.__doc__ = '''Row of an XML reply: tag without namespace, values of the
+mapped leaves by key, and rows of the field map it is nested in, outermost
+first'''
+
+
+def _local(tag):
+    # Tag without its {namespace}
+    return tag[tag.find('}') + 1:]
+
+
+def xml_chunks(output=None, output_stream=None):
+    '''Yield an XML reply in chunks to feed to an XMLPullParser
+
+    The leading blanks and the NETCONF trailer of the reply are dropped.
+
+    Args:
+        output (`str`): XML reply, sliced in chunks of 64k characters
+        output_stream (`iterable`): chunks or lines of the XML reply, str
+                                    or bytes, used instead of output
+
+    Returns:
+        generator of `str`
+    '''
+    if output_stream is None:
+        # Sliced, not copied whole: the trailer is at the end of the reply
+        output = output or ''
+        start, end = 0, len(output)
+        while start < end and output[start].isspace():
+            start += 1
+        while end > start and output[end - 1].isspace():
+            end -= 1
+        if output.endswith(_JUNK, start, end):
+            end -= len(_JUNK)
+        for start in range(start, end, _CHUNK):
+            yield output[start:min(start + _CHUNK, end)]
+        return
+    first = True
+    for chunk in output_stream:
+        if isinstance(chunk, bytes):
+            chunk = chunk.decode('utf-8', errors='replace')
+        if first:
+            chunk = chunk.lstrip()
+            first = not chunk
+        yield chunk.replace(_JUNK, '')
+
+
+class _Frame(object):
+    # Row of the field map being read, its values filled as its leaves end
+    __slots__ = ('element', 'fields', 'row')
+
+    def __init__(self, element, tag, fields, parents):
+        self.element = element
+        self.fields = fields
+        self.row = XmlRow(tag, {}, parents)
+
+
+def _convert(fields, tag, text, values):
+    # Store the value of the leaf tag of a row under its key
+    field = fields.get(tag)
+    if field is None or text is None:
+        return
+    if isinstance(field, tuple):
+        key, convert = field
+        try:
+            values[key] = convert(text)
+        except (ValueError, TypeError, AttributeError):
+            pass
+    else:
+        values[field] = text
+
+
+def iter_xml_rows(fields, output=None, output_stream=None, command=None):
+    '''Yield the rows of an NX-OS XML reply
+
+    Args:
+        fields (`dict`): row tag -> {leaf tag: key, or (key, convert)},
+                         convert being called on the text of the leaf. The
+                         leaves whose text fails to convert are left out
+        output (`str`): XML reply
+        output_stream (`iterable`): chunks or lines of the XML reply, str
+                                    or bytes, used instead of output
+        command (`str`): command the reply is expected to be the output of,
+                         checked against the command elements of the reply
+
+    Returns:
+        generator of `XmlRow`
+
+    Raises:
+        AssertionError: the reply is the output of another command
+        xml.etree.ElementTree.ParseError: the reply is not XML
+
+    example:
+        >>> for row in iter_xml_rows({'ROW_vrf': {'vrf-name-out': 'vrf'}},
+        ...                          output=output):
+        ...     row.values
+        {'vrf': 'default'}
+    '''
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    # Open elements, whether they have no child so far, and the open rows
+    # of the field map
+    stack = []
+    leaves = []
+    frames = []
+    # Words of the command, composed until __readonly__
+    words = [] if command is not None else None
+    done = False
+
+    for chunk in xml_chunks(output, output_stream):
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            tag = _local(element.tag)
+            if event == 'start':
+                if words is not None and len(stack) >= 2:
+                    if tag == '__readonly__' or 'TABLE' in tag:
+                        _check_command(words, command)
+                        words = None
+                    elif '__XML__' not in tag:
+                        words.append(tag)
+                row_fields = fields.get(tag)
+                if row_fields is not None:
+                    parents = frames[-1].row.parents + (frames[-1].row,) \
+                        if frames else ()
+                    frames.append(_Frame(element, tag, row_fields, parents))
+                if leaves:
+                    leaves[-1] = False
+                stack.append(element)
+                leaves.append(True)
+                continue
+
+            # end
+            stack.pop()
+            leaf = leaves.pop()
+            if frames and frames[-1].element is element:
+                yield frames.pop().row
+            elif leaf and frames and stack and \
+                    frames[-1].element is stack[-1]:
+                # Leaf of the current row
+                _convert(frames[-1].fields, tag, element.text,
+                         frames[-1].row.values)
+            elif words is not None and tag == '__XML__value' and \
+                    element.text:
+                words.append(element.text)
+            if not stack:
+                done = True
+                break
+            # Read, its parent needs it no more
+            del stack[-1][:]
+        if done:
+            break
+    if not done:
+        parser.close()
+
+
+def _check_command(words, command):
+    cli = ' '.join(words)
+    assert cli == command, \
+        'Cli created from XML tags does not match the actual cli:\n'\
+        'XML Tags cli: {c}\nCli command: {e}'.format(c=cli, e=command)
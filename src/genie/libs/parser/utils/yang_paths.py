@@ -0,0 +1,323 @@
+'''Declarative extraction of YANG / NETCONF replies
+
+The yang() of the YANG parsers walk the reply with a for loop per level of
+the model, slicing the namespace off the tag of every element and comparing
+it to the names of the model one if at a time. YangExtractor is given the
+paths of the leaves instead, with the key of the parsed output each goes
+to, and compiles them into a tree of the elements to visit: an element is
+dispatched to its node by its tag in a single dict lookup, the subtrees of
+no path are skipped, and the reply is read in one pass, as an element tree
+or as a stream of text.
+
+    extractor = YangExtractor(
+        fields={
+            'bgp/global/state/as': ('bgp_pid', int),
+            'bgp/global/state/router-id': (('vrf', 'default', 'router_id'),
+                                           str),
+            'bgp/neighbors/neighbor/state/peer-as': ('remote_as', int),
+        },
+        lists={
+            'bgp/neighbors/neighbor': YangList(
+                'neighbor-address', ('vrf', 'default', 'neighbor')),
+        },
+        namespaces={'bgp': 'http://openconfig.net/yang/bgp'})
+
+    parsed = extractor.extract(element=reply.data_ele)
+
+The steps of a path are matched against the tags of the elements:
+
+    * prefix:name, the name in the namespace of the prefix
+    * {uri}name, the name in the namespace uri
+    * name, the name in any namespace, or in the default namespace of the
+      extractor when it is given one
+
+A leaf under a list entry is set in the entry, which is set once complete
+under the path of its list, by the text of its key leaf: the key of a
+neighbor may come after its leaves. Entries whose key is missing, or fails
+to convert, are dropped.
+'''
+
+# python
+import re
+import xml.etree.ElementTree as ET
+
+# Parser utils
+from genie.libs.parser.utils.xml_rows import xml_chunks
+
+
+# Step of a path, the / of a {uri} included
+_STEP = re.compile(r'(?:\{[^}]*\})?[^/{]+')
+
+
+class YangList(object):
+    '''List of a YANG model, its entries set in the parsed output by key
+
+    Args:
+        key (`str`): path of the key leaf, from the list entry
+        path (`tuple`): keys of the dict of the entries in the parsed output,
+                        from the enclosing entry, or from the top
+        convert (`callable`): called on the text of the key leaf, the entry
+                              is dropped when it raises ValueError
+    '''
+
+    def __init__(self, key, path, convert=None):
+        self.key = key
+        self.path = tuple(path) if isinstance(path, (list, tuple)) \
+            else (path,)
+        self.convert = convert
+
+    def __repr__(self):
+        return 'YangList({!r}, {!r})'.format(self.key, self.path)
+
+
+class _Node(object):
+    # Element of the model: its children by step, their resolved tags, and
+    # what the element is: a leaf of the output, a list entry, a list key
+    __slots__ = ('tags', 'qualified', 'names', 'field', 'list', 'key')
+
+    def __init__(self):
+        self.tags = {}
+        self.qualified = {}
+        self.names = {}
+        self.field = None
+        self.list = None
+        self.key = False
+
+    def child(self, tag):
+        # Node of a child element, None if it is on no path; resolved once
+        # per tag
+        node = None
+        if isinstance(tag, str):
+            node = self.qualified.get(tag)
+            if node is None:
+                node = self.names.get(tag[tag.find('}') + 1:])
+        self.tags[tag] = node
+        return node
+
+
+class _Entry(object):
+    # List entry being read
+    __slots__ = ('list', 'values', 'key')
+
+    def __init__(self, yang_list):
+        self.list = yang_list
+        self.values = {}
+        self.key = None
+
+
+def _merge(values, other):
+    # Merge the nested dicts of other into values
+    for key, value in other.items():
+        current = values.get(key)
+        if isinstance(current, dict) and isinstance(value, dict):
+            _merge(current, value)
+        else:
+            values[key] = value
+
+
+class YangExtractor(object):
+    '''Leaves of YANG replies, set in the parsed output by path
+
+    Args:
+        fields (`dict`): path of a leaf -> key, or (key, convert), the key
+                         being a tuple for nested dicts. The leaves whose
+                         text fails to convert are left out. Empty leaves
+                         are set only by a convert, called on None
+        lists (`dict`): path of a list entry -> `YangList`
+        namespaces (`dict`): prefix -> namespace uri of the prefixed steps
+        namespace (`str`): namespace uri of the steps without prefix, any
+                           namespace if None
+
+    example:
+        >>> extractor = YangExtractor(
+        ...     {'bgp/global/state/as': ('bgp_pid', int)})
+        >>> extractor.extract(output='<data><bgp><global><state><as>100'
+        ...                          '</as></state></global></bgp></data>')
+        {'bgp_pid': 100}
+    '''
+
+    def __init__(self, fields, lists=None, namespaces=None, namespace=None):
+        self.namespaces = dict(namespaces or {})
+        self.namespace = namespace
+        self.root = _Node()
+        for path, yang_list in (lists or {}).items():
+            node = self._node(path)
+            node.list = yang_list
+            self._node(path + '/' + yang_list.key).key = True
+        for path, field in fields.items():
+            key, convert = field if isinstance(field, tuple) \
+                else (field, None)
+            # Dicts of the key and key in the last one
+            key = key if isinstance(key, tuple) else (key,)
+            self._node(path).field = (key[:-1], key[-1], convert)
+
+    def _tag(self, step):
+        # Clark tag of a step, None for a step of any namespace
+        if step.startswith('{'):
+            return step
+        prefix, _, name = step.rpartition(':')
+        if prefix:
+            return '{{{}}}{}'.format(self.namespaces[prefix], name)
+        if self.namespace:
+            return '{{{}}}{}'.format(self.namespace, name)
+        return None
+
+    def _node(self, path):
+        node = self.root
+        for step in _STEP.findall(path):
+            tag = self._tag(step)
+            if tag is None:
+                node = node.names.setdefault(step, _Node())
+            else:
+                node = node.qualified.setdefault(tag, _Node())
+        return node
+
+    def extract(self, element=None, output=None, output_stream=None):
+        '''Parsed output of a reply
+
+        The paths are those of the children of the root element of the
+        reply, the data element of a NETCONF reply.
+
+        Args:
+            element (`Element`): reply as an element tree
+            output (`str`): reply as text
+            output_stream (`iterable`): chunks or lines of the reply, str or
+                                        bytes, used instead of output
+
+        Returns:
+            `dict`
+
+        Raises:
+            xml.etree.ElementTree.ParseError: the reply is not XML
+        '''
+        entries = [_Entry(None)]
+        if element is not None:
+            self._walk(element, self.root, entries)
+        else:
+            self._stream(xml_chunks(output, output_stream), entries)
+        return entries[0].values
+
+    def _leaf(self, node, text, entries):
+        entry = entries[-1]
+        if node.key:
+            entry.key = text
+        if node.field is None:
+            return
+        parents, key, convert = node.field
+        if convert is not None:
+            try:
+                text = convert(text)
+            except (ValueError, TypeError, AttributeError):
+                return
+        elif text is None:
+            return
+        values = entry.values
+        for part in parents:
+            values = values.setdefault(part, {})
+        values[key] = text
+
+    def _close(self, entries):
+        # Set the entry read in the enclosing one
+        entry = entries.pop()
+        key = entry.key
+        if key is None:
+            return
+        convert = entry.list.convert
+        if convert is not None:
+            try:
+                key = convert(key)
+            except ValueError:
+                return
+        values = entries[-1].values
+        for part in entry.list.path:
+            values = values.setdefault(part, {})
+        if key in values:
+            _merge(values[key], entry.values)
+        else:
+            values[key] = entry.values
+
+    def _walk(self, element, node, entries):
+        tags = node.tags
+        for child in element:
+            tag = child.tag
+            try:
+                child_node = tags[tag]
+            except KeyError:
+                child_node = node.child(tag)
+            if child_node is None:
+                continue
+            if child_node.list is not None:
+                entries.append(_Entry(child_node.list))
+                self._walk(child, child_node, entries)
+                self._close(entries)
+                continue
+            if child_node.qualified or child_node.names:
+                self._walk(child, child_node, entries)
+                continue
+            # Leaf, set inline: most of the elements of a reply
+            text = child.text
+            if child_node.key:
+                entries[-1].key = text
+            field = child_node.field
+            if field is None:
+                continue
+            parents, key, convert = field
+            if convert is not None:
+                try:
+                    text = convert(text)
+                except (ValueError, TypeError, AttributeError):
+                    continue
+            elif text is None:
+                continue
+            values = entries[-1].values
+            for part in parents:
+                values = values.setdefault(part, {})
+            values[key] = text
+
+    def _stream(self, chunks, entries):
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        # Open elements and their nodes; under an element of no path the
+        # elements are counted only, skipped
+        elements = []
+        nodes = []
+        skipped = 0
+        for chunk in chunks:
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == 'start':
+                    if skipped:
+                        skipped += 1
+                        continue
+                    if not nodes:
+                        node = self.root
+                    else:
+                        node = nodes[-1]
+                        try:
+                            node = node.tags[element.tag]
+                        except KeyError:
+                            node = node.child(element.tag)
+                        if node is None:
+                            skipped = 1
+                            continue
+                        if node.list is not None:
+                            entries.append(_Entry(node.list))
+                    elements.append(element)
+                    nodes.append(node)
+                    continue
+
+                # end
+                if skipped:
+                    skipped -= 1
+                    if skipped:
+                        continue
+                else:
+                    elements.pop()
+                    node = nodes.pop()
+                    if node.list is not None:
+                        self._close(entries)
+                    elif node.field is not None or node.key:
+                        self._leaf(node, element.text, entries)
+                # Read, its parent needs it no more
+                if elements:
+                    del elements[-1][:]
+        parser.close()